@@ -0,0 +1,46 @@
+"""Compare the attribute-read throughput of the generated classes against a single schema module.
+
+The single module is generated in a temporary folder, so the classes in ``compas_ifc.entities.generated`` are left as they are.
+"""
+
+import importlib.util
+import os
+import tempfile
+import timeit
+
+from compas_ifc.entities.generator import Generator
+from compas_ifc.model import Model
+
+REPEAT = 20
+
+model = Model("data/Duplex_A_20110907.ifc", load_geometries=False, verbose=False)
+
+folder = tempfile.mkdtemp()
+Generator(schema=model.schema_name, backend="module").generate(folder)
+spec = importlib.util.spec_from_file_location("compact_schema", os.path.join(folder, f"{model.schema_name}.py"))
+compact = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(compact)
+
+
+def wrap(cls, entity):
+    # Bypass Base.__new__, which resolves the class from compas_ifc.entities.generated.
+    wrapper = object.__new__(cls)
+    wrapper.__init__(entity, model.file)
+    return wrapper
+
+
+entities = [entity for entity in model.file._file if entity.is_a() in compact.ATTRIBUTE_INDEX]
+packaged = [(model.file.from_entity(entity), list(compact.ATTRIBUTE_INDEX[entity.is_a()])) for entity in entities]
+single = [(wrap(getattr(compact, entity.is_a()), entity), list(compact.ATTRIBUTE_INDEX[entity.is_a()])) for entity in entities]
+reads = sum(len(names) for _, names in packaged)
+
+
+def read_all(wrappers):
+    for wrapper, names in wrappers:
+        for name in names:
+            getattr(wrapper, name)
+
+
+for label, wrappers in [("generated classes", packaged), ("single schema module", single)]:
+    seconds = min(timeit.repeat(lambda: read_all(wrappers), number=1, repeat=REPEAT))
+    print(f"{label:<24}{reads / seconds:>14,.0f} attribute reads/s ({reads} reads in {seconds:.3f}s)")
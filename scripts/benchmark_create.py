@@ -0,0 +1,49 @@
+"""Compare the throughput of ``Model.create`` in a loop with ``Model.create_many``.
+
+Each run creates the same walls, with a name, a placement, a shared box geometry and a property set, in a new model.
+"""
+
+import time
+
+from compas.geometry import Box
+from compas.geometry import Frame
+
+from compas_ifc.model import Model
+
+COUNT = 2000
+
+
+def records(box):
+    for i in range(COUNT):
+        yield {
+            "name": f"Wall {i}",
+            "geometry": box,
+            "frame": Frame([i * 1000.0, 0, 0]),
+            "properties": {"Pset_Custom": {"Index": i % 10, "Material": "Concrete"}},
+        }
+
+
+def loop():
+    model = Model.template(storey_count=1)
+    storey = model.building_storeys[0]
+    box = Box(200, 5000, 3000)
+    start = time.perf_counter()
+    for record in records(box):
+        model.create("IfcWall", parent=storey, **record)
+    return time.perf_counter() - start
+
+
+def bulk():
+    model = Model.template(storey_count=1)
+    storey = model.building_storeys[0]
+    box = Box(200, 5000, 3000)
+    start = time.perf_counter()
+    model.create_many("IfcWall", records(box), parent=storey)
+    return time.perf_counter() - start
+
+
+looped = loop()
+bulked = bulk()
+print(f"Model.create x {COUNT}:      {looped:.3f}s ({COUNT / looped:.0f} entities/s)")
+print(f"Model.create_many({COUNT}): {bulked:.3f}s ({COUNT / bulked:.0f} entities/s)")
+print(f"speedup: {looped / bulked:.1f}x")
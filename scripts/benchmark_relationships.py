@@ -0,0 +1,48 @@
+"""Compare one containment relationship per element with coalesced relationships.
+
+Each run creates the same elements in one storey of a new model, then saves it.
+The baseline writes one ``IfcRelContainedInSpatialStructure`` per element, as ``create_relationship`` used to.
+"""
+
+import os
+import tempfile
+import time
+
+import ifcopenshell
+
+from compas_ifc.model import Model
+
+COUNT = 20000
+
+
+def baseline(model, storey):
+    for i in range(COUNT):
+        wall = model.file._create_entity("IfcWall", GlobalId=ifcopenshell.guid.new(), Name=f"Wall {i}")
+        model.file._create_entity("IfcRelContainedInSpatialStructure", GlobalId=ifcopenshell.guid.new(), RelatingStructure=storey, RelatedElements=[wall])
+
+
+def coalesced(model, storey):
+    with model.deferred_relationships():
+        for i in range(COUNT):
+            model.create("IfcWall", parent=storey, Name=f"Wall {i}")
+
+
+for name, author in [("one relationship per element", baseline), ("coalesced", coalesced)]:
+    model = Model.template(storey_count=1)
+    storey = model.building_storeys[0]
+
+    start = time.perf_counter()
+    author(model, storey)
+    authored = time.perf_counter() - start
+
+    path = os.path.join(tempfile.mkdtemp(), "relationships.ifc")
+    start = time.perf_counter()
+    model.save(path)
+    saved = time.perf_counter() - start
+
+    relations = len(model.file._file.by_type("IfcRelContainedInSpatialStructure"))
+    print(name)
+    print(f"    relationships: {relations}")
+    print(f"    authoring:     {authored:.3f}s")
+    print(f"    save:          {saved:.3f}s")
+    print(f"    file size:     {os.path.getsize(path) / 1e6:.2f} MB")
@@ -0,0 +1,39 @@
+"""Measure the cold startup time of compas_ifc: ``import compas_ifc`` plus ``Model()``.
+
+Every run is done in a fresh interpreter, so that nothing is cached in ``sys.modules``.
+"""
+
+import statistics
+import subprocess
+import sys
+
+RUNS = 5
+
+SNIPPET = """
+import time
+start = time.perf_counter()
+import compas_ifc
+from compas_ifc.model import Model
+imported = time.perf_counter()
+model = Model(FILEPATH, load_geometries=False, verbose=False)
+loaded = time.perf_counter()
+print(imported - start, loaded - imported)
+"""
+
+
+def run(filepath=None):
+    output = subprocess.check_output([sys.executable, "-c", SNIPPET.replace("FILEPATH", repr(filepath))], text=True)
+    return [float(value) for value in output.split()]
+
+
+for filepath in [None, "data/wall-with-opening-and-window.ifc"]:
+    # The first run may generate the IFC classes, it is not counted.
+    run(filepath)
+    timings = [run(filepath) for _ in range(RUNS)]
+    imports = [timing[0] for timing in timings]
+    models = [timing[1] for timing in timings]
+
+    print(f"Model({filepath!r})")
+    print(f"    import compas_ifc: {statistics.median(imports):.3f}s (median of {RUNS})")
+    print(f"    Model():           {statistics.median(models):.3f}s (median of {RUNS})")
+    print(f"    total:             {statistics.median(i + m for i, m in timings):.3f}s")
@@ -1,4 +1,6 @@
 from .tessellatedbrep import TessellatedBrep
+from .tessellatedbrepinstance import TessellatedBrepInstance
+from .geometrybuffer import GeometryBuffer
 
 try:
     from .tessellatedbrepobject import TessellatedBrepObject
@@ -12,6 +14,7 @@ from compas.scene import register
 @plugin(category="factories", requires=["compas_viewer"], trylast=True)
 def register_scene_objects():
     register(TessellatedBrep, TessellatedBrepObject, context="Viewer")
+    register(TessellatedBrepInstance, TessellatedBrepObject, context="Viewer")
 
     try:
         from compas_occ.brep import OCCBrep
@@ -23,4 +26,4 @@ def register_scene_objects():
         pass
 
 
-__all__ = ["TessellatedBrep", "TessellatedBrepObject"]
+__all__ = ["TessellatedBrep", "TessellatedBrepInstance", "TessellatedBrepObject", "GeometryBuffer"]
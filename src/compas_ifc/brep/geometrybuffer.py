@@ -0,0 +1,160 @@
+import os
+
+import numpy as np
+
+from .tessellatedbrep import TessellatedBrep
+
+
+class GeometryBuffer(object):
+    """Packed storage for the tessellated geometries of many entities.
+
+    All the vertices are stored in one contiguous vertex buffer and all the edges and faces in one index buffer each,
+    with offsets per entity. The geometry of a single entity is a zero-copy slice of these buffers.
+    Face and edge indices are local to each entity, so the slices can be used as they are.
+
+    Attributes
+    ----------
+    ids : :class:`numpy.ndarray`
+        The ids of the entities stored in the buffer.
+    vertices : :class:`numpy.ndarray`
+        The ``(n, 3)`` vertex buffer.
+    edges : :class:`numpy.ndarray`
+        The ``(n, 2)`` edge index buffer.
+    faces : :class:`numpy.ndarray`
+        The ``(n, 3)`` face index buffer.
+    facecolors : :class:`numpy.ndarray`
+        The ``(n, 4)`` buffer of face colours, aligned with the face buffer.
+    placements : :class:`numpy.ndarray`
+        The ``(n_entities, 4, 4)`` placement matrices, from the local coordinates of each geometry to world coordinates.
+    nbytes : int
+        The total size of the buffers in bytes.
+
+    """
+
+    ARRAYS = ["ids", "vertices", "vertex_offsets", "edges", "edge_offsets", "faces", "face_offsets", "facecolors", "placements"]
+
+    def __init__(self, ids, vertices, vertex_offsets, edges, edge_offsets, faces, face_offsets, facecolors, placements):
+        self.ids = ids
+        self.vertices = vertices
+        self.vertex_offsets = vertex_offsets
+        self.edges = edges
+        self.edge_offsets = edge_offsets
+        self.faces = faces
+        self.face_offsets = face_offsets
+        self.facecolors = facecolors
+        self.placements = placements
+        self._index = {_id: i for i, _id in enumerate(ids.tolist())}
+
+    def __repr__(self):
+        return "<GeometryBuffer {} entities, {:.2f} MB>".format(len(self), self.nbytes / (1024 * 1024))
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, _id):
+        return _id in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    @property
+    def nbytes(self):
+        return sum(getattr(self, name).nbytes for name in self.ARRAYS)
+
+    @classmethod
+    def from_breps(cls, breps: dict, facecolors: dict = None, dtype=np.float32, placements: dict = None) -> "GeometryBuffer":
+        """
+        Pack a collection of tessellated breps into a geometry buffer.
+
+        Parameters
+        ----------
+        breps : dict[int, :class:`compas_ifc.brep.TessellatedBrep`]
+            The breps to pack, by entity id.
+        facecolors : dict[int, :class:`numpy.ndarray`], optional
+            The ``(n_faces, 4)`` face colours of the breps, by entity id.
+        dtype : :class:`numpy.dtype`, optional
+            The data type of the vertex buffer. Default is float32.
+        placements : dict[int, :class:`numpy.ndarray`], optional
+            The 4x4 placement matrices of the breps, by entity id. Breps without placement are stored with the identity.
+
+        Returns
+        -------
+        :class:`GeometryBuffer`
+
+        """
+        ids = list(breps.keys())
+        facecolors = facecolors or {}
+        placements = placements or {}
+
+        def pack(chunks, columns, chunk_dtype):
+            offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+            offsets[1:] = np.cumsum([len(chunk) for chunk in chunks])
+            data = np.empty((offsets[-1], columns), dtype=chunk_dtype)
+            for chunk, start, end in zip(chunks, offsets[:-1], offsets[1:]):
+                data[start:end] = chunk
+            return data, offsets
+
+        vertices, vertex_offsets = pack([breps[_id].vertices for _id in ids], 3, dtype)
+        edges, edge_offsets = pack([breps[_id].edges for _id in ids], 2, np.uint32)
+        faces, face_offsets = pack([breps[_id].faces for _id in ids], 3, np.uint32)
+
+        colors = np.empty((face_offsets[-1], 4), dtype=np.float32)
+        for _id, start, end in zip(ids, face_offsets[:-1], face_offsets[1:]):
+            colors[start:end] = facecolors.get(_id, (0.5, 0.5, 0.5, 1.0))
+
+        matrices = np.empty((len(ids), 4, 4), dtype=np.float64)
+        for i, _id in enumerate(ids):
+            matrices[i] = placements.get(_id, np.eye(4))
+
+        return cls(np.array(ids), vertices, vertex_offsets, edges, edge_offsets, faces, face_offsets, colors, matrices)
+
+    def get_vertices(self, _id) -> np.ndarray:
+        i = self._index[_id]
+        return self.vertices[self.vertex_offsets[i] : self.vertex_offsets[i + 1]]
+
+    def get_edges(self, _id) -> np.ndarray:
+        i = self._index[_id]
+        return self.edges[self.edge_offsets[i] : self.edge_offsets[i + 1]]
+
+    def get_faces(self, _id) -> np.ndarray:
+        i = self._index[_id]
+        return self.faces[self.face_offsets[i] : self.face_offsets[i + 1]]
+
+    def get_facecolors(self, _id) -> np.ndarray:
+        i = self._index[_id]
+        return self.facecolors[self.face_offsets[i] : self.face_offsets[i + 1]]
+
+    def get_placement(self, _id) -> np.ndarray:
+        return self.placements[self._index[_id]]
+
+    def get_brep(self, _id) -> TessellatedBrep:
+        """Get the local geometry of an entity as a brep whose arrays are views into the buffers."""
+        return TessellatedBrep(vertices=self.get_vertices(_id), edges=self.get_edges(_id), faces=self.get_faces(_id))
+
+    def save(self, folder: str):
+        """Save the buffers as ``.npy`` files in a folder."""
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+        for name in self.ARRAYS:
+            np.save(os.path.join(folder, f"{name}.npy"), getattr(self, name))
+
+    @classmethod
+    def load(cls, folder: str, mmap: bool = False) -> "GeometryBuffer":
+        """
+        Load buffers saved with :meth:`save`.
+
+        Parameters
+        ----------
+        folder : str
+            The folder containing the ``.npy`` files.
+        mmap : bool, optional
+            Whether to memory-map the buffers from disk instead of reading them into memory. Default is False.
+
+        Returns
+        -------
+        :class:`GeometryBuffer`
+
+        """
+        mmap_mode = "r" if mmap else None
+        arrays = [np.load(os.path.join(folder, f"{name}.npy"), mmap_mode=mmap_mode) for name in cls.ARRAYS]
+        return cls(*arrays)
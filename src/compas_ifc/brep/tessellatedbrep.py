@@ -14,9 +14,10 @@ class TessellatedBrep(Geometry):
             edges = []
         if faces is None:
             faces = []
-        self.vertices = np.array(vertices).reshape(-1, 3)
-        self.edges = np.array(edges).reshape(-1, 2)
-        self.faces = np.array(faces).reshape(-1, 3)
+        # NOTE: existing arrays are not copied, so that breps can be views into a shared GeometryBuffer.
+        self.vertices = np.asarray(vertices).reshape(-1, 3)
+        self.edges = np.asarray(edges).reshape(-1, 2)
+        self.faces = np.asarray(faces).reshape(-1, 3)
 
     def transform(self, transformation):
         self.vertices = transform_points_numpy(self.vertices, transformation)
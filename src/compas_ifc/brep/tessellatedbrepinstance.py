@@ -0,0 +1,52 @@
+from compas.geometry import Transformation
+from compas.geometry import transform_points_numpy
+
+from .tessellatedbrep import TessellatedBrep
+
+
+class TessellatedBrepInstance(TessellatedBrep):
+    """A lightweight view of a shared :class:`TessellatedBrep`, placed with its own transformation.
+
+    The faces and edges are those of the shared brep and the vertices are only transformed when they are first accessed,
+    so many instances of the same representation cost one tessellation plus one transformation each.
+    Transforming an instance only updates its transformation and never modifies the shared brep.
+
+    Attributes
+    ----------
+    brep : :class:`TessellatedBrep`
+        The shared brep, in the local coordinates of the representation.
+    transformation : :class:`compas.geometry.Transformation`
+        The transformation from the local coordinates of the shared brep to the coordinates of this instance.
+
+    """
+
+    def __init__(self, brep=None, transformation=None, **kwargs):
+        super(TessellatedBrep, self).__init__(**kwargs)
+        self.brep = brep
+        self.transformation = transformation or Transformation()
+
+    @property
+    def transformation(self):
+        return self._transformation
+
+    @transformation.setter
+    def transformation(self, transformation):
+        self._transformation = transformation
+        self._vertices = None
+
+    @property
+    def vertices(self):
+        if self._vertices is None:
+            self._vertices = transform_points_numpy(self.brep.vertices, self.transformation)
+        return self._vertices
+
+    @property
+    def edges(self):
+        return self.brep.edges
+
+    @property
+    def faces(self):
+        return self.brep.faces
+
+    def transform(self, transformation):
+        self.transformation = transformation * self.transformation
@@ -11,10 +11,13 @@ class TessellatedBrepObject(ViewerSceneObject):
         super().__init__(**kwargs)
 
         # NOTE: it is not facecolors, it is verexcolor
-        if not facecolors:
+        if facecolors is None or len(facecolors) == 0:
             self.facecolors = [Color(0.9, 0.9, 0.9) for _ in range(len(self.tessellatedbrep.faces) * 3)]
         else:
-            facecolors = np.array(facecolors)
+            facecolors = np.asarray(facecolors)
+            if len(facecolors) == len(self.tessellatedbrep.faces):
+                # Colours are given per face, expand them to the three vertices of each face.
+                facecolors = np.repeat(facecolors, 3, axis=0)
             self.facecolors = facecolors
             if np.mean(facecolors[:, 3]) < 1:
                 # If mean alpha is less than 1, means the object has transparency
@@ -0,0 +1,393 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from compas_ifc.brep import GeometryBuffer
+
+if TYPE_CHECKING:
+    from compas_ifc.entities.base import Base
+    from compas_ifc.file import IFCFile
+
+CACHE_FORMAT_VERSION = 4
+
+
+class GeometryCache(object):
+    """A content-addressed on-disk cache for tessellated geometries.
+
+    Each cache entry is a :class:`compas_ifc.brep.GeometryBuffer` saved as a folder of NumPy arrays, holding the
+    packed vertices, edges, faces and facecolors of all the shapes of one IFC file.
+    Entries are keyed on the hash of the file content and the geometry settings, so a modified file or
+    different settings will never hit a stale entry.
+    When the total size of the cache exceeds ``max_size``, the least recently used entries are evicted.
+
+    Attributes
+    ----------
+    path : str
+        The folder in which the cache entries are stored.
+    max_size : int
+        The maximum total size of the cache in bytes.
+
+    """
+
+    def __init__(self, path: str, max_size: int = 2 * 1024**3):
+        """
+        Construct the GeometryCache object.
+
+        Parameters
+        ----------
+        path : str
+            The folder in which the cache entries are stored. Will be created if it does not exist.
+        max_size : int, optional
+            The maximum total size of the cache in bytes. Default is 2 GB.
+
+        """
+        self.path = os.path.abspath(path)
+        self.max_size = max_size
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+
+    def __repr__(self):
+        return "<GeometryCache {} ({} entries, {:.2f} MB)>".format(self.path, len(self.entries()), self.size() / (1024 * 1024))
+
+    @staticmethod
+    def file_hash(filepath: str, chunk_size: int = 1024 * 1024) -> str:
+        """Compute the SHA-256 hash of the content of a file."""
+        sha = hashlib.sha256()
+        with open(filepath, "rb") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                sha.update(chunk)
+        return sha.hexdigest()
+
+    def key(self, filepath: str, settings: dict) -> str:
+        """
+        Compute the cache key of a file for the given geometry settings.
+
+        Parameters
+        ----------
+        filepath : str
+            The path to the IFC file.
+        settings : dict
+            The geometry settings used for the tessellation. Must be JSON serializable.
+
+        Returns
+        -------
+        str
+            The cache key.
+
+        """
+        sha = hashlib.sha256()
+        sha.update(self.file_hash(filepath).encode())
+        sha.update(json.dumps(settings, sort_keys=True).encode())
+        sha.update(str(CACHE_FORMAT_VERSION).encode())
+        return sha.hexdigest()
+
+    def entries(self) -> list[str]:
+        """Get the keys of all the entries in the cache."""
+        return [name for name in os.listdir(self.path) if not name.startswith(".") and os.path.isdir(os.path.join(self.path, name))]
+
+    def entry_size(self, key: str) -> int:
+        """Get the size of a cache entry in bytes."""
+        folder = os.path.join(self.path, key)
+        return sum(os.path.getsize(os.path.join(folder, name)) for name in os.listdir(folder))
+
+    def size(self) -> int:
+        """Get the total size of the cache in bytes."""
+        return sum(self.entry_size(key) for key in self.entries())
+
+    def load(self, key: str, mmap: bool = False) -> GeometryBuffer:
+        """
+        Load the geometries stored under a key.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        mmap : bool, optional
+            Whether to memory-map the geometry buffers instead of reading them into memory. Default is False.
+
+        Returns
+        -------
+        :class:`compas_ifc.brep.GeometryBuffer`
+            The packed geometries, or None if the key is not in the cache.
+
+        """
+        folder = os.path.join(self.path, key)
+        if not os.path.isdir(folder):
+            return None
+
+        try:
+            buffer = GeometryBuffer.load(folder, mmap=mmap)
+        except (OSError, ValueError):
+            # A corrupted or partially evicted entry is treated as a miss.
+            self.invalidate(key)
+            return None
+
+        # Mark the entry as recently used for the LRU eviction.
+        self.touch(key)
+        return buffer
+
+    def save(self, key: str, buffer: GeometryBuffer):
+        """
+        Store geometries under a key, evicting the least recently used entries if the cache grows too large.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+        buffer : :class:`compas_ifc.brep.GeometryBuffer`
+            The packed geometries.
+
+        """
+        # Write to a temporary folder first so that readers never see a half written entry.
+        folder = os.path.join(self.path, key)
+        tmp = os.path.join(self.path, f".tmp-{key}-{os.getpid()}")
+        buffer.save(tmp)
+
+        try:
+            os.replace(tmp, folder)
+        except OSError:
+            # Another process has stored the same entry in the meantime.
+            shutil.rmtree(tmp, ignore_errors=True)
+
+        self.evict(keep=key)
+
+    def invalidate(self, key: str):
+        """Remove a single entry from the cache."""
+        shutil.rmtree(os.path.join(self.path, key), ignore_errors=True)
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        for key in self.entries():
+            self.invalidate(key)
+
+    def evict(self, keep: str = None):
+        """
+        Evict the least recently used entries until the cache fits within ``max_size``.
+
+        Parameters
+        ----------
+        keep : str, optional
+            A key that should not be evicted, typically the entry that was just written.
+
+        """
+        entries = []
+        for key in self.entries():
+            mtime = os.path.getmtime(os.path.join(self.path, key))
+            entries.append((mtime, key, self.entry_size(key)))
+
+        total = sum(size for _, _, size in entries)
+        for _, key, size in sorted(entries):
+            if total <= self.max_size:
+                break
+            if key == keep:
+                continue
+            self.invalidate(key)
+            total -= size
+
+    def touch(self, key: str):
+        """Mark an entry as recently used."""
+        folder = os.path.join(self.path, key)
+        if os.path.isdir(folder):
+            now = time.time()
+            os.utime(folder, (now, now))
+
+
+class LRUDict(OrderedDict):
+    """A dict holding at most ``max_size`` items, evicting the least recently used item when it is full.
+
+    Used as a memory-bounded entity map, so that scanning all the entities of a large file does not keep all their wrappers alive.
+
+    Attributes
+    ----------
+    max_size : int
+        The maximum number of items.
+
+    """
+
+    def __init__(self, max_size: int = 100000):
+        super().__init__()
+        self.max_size = max_size
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.max_size:
+            self.popitem(last=False)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+class RepresentationCache(object):
+    """The representations written in one IFC file, keyed by geometry fingerprint, with LRU eviction and hit/miss counters.
+
+    A geometry used once is cached as the ``IfcProductDefinitionShape`` of its product, and replaced by an ``IfcRepresentationMap`` when it is used again.
+    An evicted representation stays in the file, identical geometries written after its eviction are written again.
+
+    Attributes
+    ----------
+    max_size : int
+        The maximum number of representations kept. If None, all of them are kept.
+    hits : int
+        The number of lookups that found a representation.
+    misses : int
+        The number of lookups that did not.
+
+    """
+
+    def __init__(self, max_size: int = None):
+        self.max_size = max_size
+        self._representations = LRUDict(max_size=max_size) if max_size else {}
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return "<RepresentationCache {} representations, {} hits, {} misses>".format(len(self._representations), self.hits, self.misses)
+
+    def __len__(self):
+        return len(self._representations)
+
+    def __contains__(self, key):
+        return key in self._representations
+
+    def get(self, key: str):
+        """Get the representation of a fingerprint, or None. A None fingerprint is always a miss."""
+        value = self._representations.get(key) if key is not None else None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def add(self, key: str, value):
+        """Add the representation of a fingerprint. A None fingerprint is not cached."""
+        if key is not None:
+            self._representations[key] = value
+
+    def clear(self):
+        """Remove all the representations and reset the counters."""
+        self._representations.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class PrimitivePool(object):
+    """The interned ``IfcCartesianPoint``, ``IfcDirection`` and ``IfcAxis2Placement3D`` entities written in one IFC file.
+
+    Entities are keyed on their coordinates quantized to ``precision``, so that writing the same point,
+    direction or placement again returns the existing entity instead of creating a new one.
+    Each kind of entity is kept in an :class:`LRUDict` of ``max_size`` items, an evicted entity stays in the file.
+    Pooled entities are shared, they should not be modified in place.
+
+    Attributes
+    ----------
+    file : :class:`compas_ifc.file.IFCFile`
+        The IFC file.
+    precision : float
+        The precision to which coordinates are compared.
+    max_size : int
+        The maximum number of pooled points, directions and placements, each.
+
+    """
+
+    def __init__(self, file: "IFCFile", precision: float = 1e-6, max_size: int = 10000):
+        self.file = file
+        self.precision = precision
+        self.max_size = max_size
+        self.clear()
+
+    def __repr__(self):
+        return "<PrimitivePool {} points, {} directions, {} placements>".format(len(self._points), len(self._directions), len(self._placements))
+
+    def clear(self):
+        """Forget all the pooled entities. They stay in the file."""
+        self._points = LRUDict(max_size=self.max_size)
+        self._directions = LRUDict(max_size=self.max_size)
+        self._placements = LRUDict(max_size=self.max_size)
+
+    def _key(self, values) -> tuple[int]:
+        return tuple(int(round(value / self.precision)) for value in values)
+
+    def point(self, coordinates) -> "Base":
+        """
+        Get the ``IfcCartesianPoint`` with the given coordinates, creating it if needed.
+
+        Parameters
+        ----------
+        coordinates : list[float]
+            The 2D or 3D coordinates.
+
+        Returns
+        -------
+        :class:`compas_ifc.entities.base.Base`
+
+        """
+        coordinates = [float(x) for x in coordinates]
+        key = self._key(coordinates)
+        point = self._points.get(key)
+        if point is None:
+            point = self._points[key] = self.file._create_entity("IfcCartesianPoint", Coordinates=coordinates)
+        return point
+
+    def direction(self, ratios) -> "Base":
+        """
+        Get the ``IfcDirection`` with the given direction ratios, creating it if needed.
+
+        Parameters
+        ----------
+        ratios : list[float]
+            The 2D or 3D direction ratios.
+
+        Returns
+        -------
+        :class:`compas_ifc.entities.base.Base`
+
+        """
+        ratios = [float(x) for x in ratios]
+        key = self._key(ratios)
+        direction = self._directions.get(key)
+        if direction is None:
+            direction = self._directions[key] = self.file._create_entity("IfcDirection", DirectionRatios=ratios)
+        return direction
+
+    def axis2placement3d(self, location, axis=None, ref_direction=None) -> "Base":
+        """
+        Get the ``IfcAxis2Placement3D`` with the given location and axes, creating it and its points and directions if needed.
+
+        Parameters
+        ----------
+        location : list[float]
+            The coordinates of the location.
+        axis : list[float], optional
+            The direction of the Z axis.
+        ref_direction : list[float], optional
+            The direction of the X axis.
+
+        Returns
+        -------
+        :class:`compas_ifc.entities.base.Base`
+
+        """
+        location = self.point(location)
+        axis = self.direction(axis) if axis is not None else None
+        ref_direction = self.direction(ref_direction) if ref_direction is not None else None
+        key = (location.id(), axis.id() if axis else None, ref_direction.id() if ref_direction else None)
+        placement = self._placements.get(key)
+        if placement is None:
+            placement = self._placements[key] = self.file._create_entity("IfcAxis2Placement3D", Location=location, Axis=axis, RefDirection=ref_direction)
+        return placement
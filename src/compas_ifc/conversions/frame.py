@@ -15,12 +15,10 @@ from compas_ifc.model import Model
 def create_IfcAxis2Placement3D(model: Model, point: Point = None, dir1: Vector = None, dir2: Vector = None) -> Base:
     """
     Create an IFC Axis2Placement3D from a point, a direction and a second direction.
+    The placement, its point and its directions are shared with identical ones through the primitive pool of the file.
     """
-    point = model.create("IfcCartesianPoint", Coordinates=point or [0.0, 0.0, 0.0])
-    dir1 = model.create("IfcDirection", DirectionRatios=dir1 or [0.0, 0.0, 1.0])
-    dir2 = model.create("IfcDirection", DirectionRatios=dir2 or [1.0, 0.0, 0.0])
-    axis2placement = model.create("IfcAxis2Placement3D", Location=point, Axis=dir1, RefDirection=dir2)
-    return axis2placement
+    pool = model.file.primitive_pool
+    return pool.axis2placement3d(point or [0.0, 0.0, 0.0], dir1 or [0.0, 0.0, 1.0], dir2 or [1.0, 0.0, 0.0])
 
 
 def frame_to_ifc_axis2_placement_3d(model: Model, frame: Frame) -> Base:
@@ -1,29 +1,103 @@
+import numpy as np
 from compas.datastructures import Mesh
+from compas.geometry import Polygon
+from compas.geometry import earclip_polygon
 
 from compas_ifc.entities.base import Base
 from compas_ifc.model import Model
 
 
+def mesh_to_arrays(mesh: Mesh) -> tuple[np.ndarray, list[list[int]]]:
+    """
+    Get the vertex coordinates of a COMPAS mesh as a ``(n, 3)`` float64 array, and its faces as lists of indices into it.
+    """
+    vertices, faces = mesh.to_vertices_and_faces()
+    return np.asarray(vertices, dtype=np.float64).reshape((-1, 3)), faces
+
+
+def quads_to_triangles(vertices: np.ndarray, quads: np.ndarray) -> np.ndarray:
+    """
+    Split ``(n, 4)`` quads into ``(2n, 3)`` triangles, the two triangles of each quad being consecutive.
+    Quads are split along the diagonal from their first vertex, or from their reflex corner if they are concave,
+    so that concave quads do not give overlapping triangles.
+    """
+    points = vertices[quads]
+    # The cross product of the diagonals is the normal of the quad, the turn of each corner is positive if it is convex.
+    normals = np.cross(points[:, 2] - points[:, 0], points[:, 3] - points[:, 1])
+    edges = np.roll(points, -1, axis=1) - points
+    turns = np.einsum("ijk,ik->ij", np.cross(np.roll(edges, 1, axis=1), edges), normals)
+    first = np.where(np.any(turns < 0, axis=1), np.argmin(turns, axis=1), 0)
+    quads = np.take_along_axis(quads, (first[:, None] + np.arange(4)) % 4, axis=1)
+    return np.stack([quads[:, [0, 1, 2]], quads[:, [0, 2, 3]]], axis=1).reshape((-1, 3))
+
+
+def triangulate_faces(vertices: np.ndarray, faces: list[list[int]]) -> np.ndarray:
+    """
+    Triangulate faces given as lists of vertex indices, into a ``(n, 3)`` array of indices.
+    The triangles follow the order of the faces, the triangles of each face being consecutive. Faces with less than three vertices are skipped.
+    Triangles and quads are processed as arrays, larger faces are ear-clipped one by one.
+    """
+    groups = {}
+    for index, face in enumerate(faces):
+        groups.setdefault(len(face), []).append(index)
+
+    triangles = []
+    owners = []  # index of the face of every triangle, by block of triangles
+    for size, indices in groups.items():
+        if size < 3:
+            continue
+        if size == 3:
+            triangles.append(np.asarray([faces[index] for index in indices], dtype=np.int64))
+            owners.append(indices)
+        elif size == 4:
+            triangles.append(quads_to_triangles(vertices, np.asarray([faces[index] for index in indices], dtype=np.int64)))
+            owners.append(np.repeat(indices, 2))
+        else:
+            for index in indices:
+                face = faces[index]
+                ears = earclip_polygon(Polygon(vertices[face].tolist()))
+                triangles.append(np.asarray([[face[a], face[b], face[c]] for a, b, c in ears], dtype=np.int64).reshape((-1, 3)))
+                owners.append(np.full(len(ears), index))
+
+    if not triangles:
+        return np.zeros((0, 3), dtype=np.int64)
+    # NOTE: a stable sort keeps the triangles of every face in order.
+    order = np.argsort(np.concatenate(owners), kind="stable")
+    return np.vstack(triangles)[order]
+
+
+def mesh_to_IfcTriangulatedFaceSet(model: Model, mesh: Mesh) -> Base:
+    """
+    Convert a COMPAS mesh to an IFC TriangulatedFaceSet.
+    All the coordinates and indices are written in one IfcCartesianPointList3D and one IfcTriangulatedFaceSet,
+    whatever the size of the mesh. Faces that are not triangles are triangulated.
+    """
+    vertices, faces = mesh_to_arrays(mesh)
+    triangles = triangulate_faces(vertices, faces)
+
+    return model.create(
+        "IfcTriangulatedFaceSet",
+        Closed=mesh.is_closed(),
+        Coordinates=model.create("IfcCartesianPointList3D", CoordList=vertices.tolist()),
+        CoordIndex=(triangles + 1).tolist(),
+    )
+
+
 def mesh_to_IfcPolygonalFaceSet(model: Model, mesh: Mesh) -> Base:
     """
     Convert a COMPAS mesh to an IFC PolygonalFaceSet.
     """
-    keys = sorted(mesh.vertices())
-    vertices = []
-    for key in keys:
-        coords = mesh.vertex_coordinates(key)
-        vertices.append((float(coords[0]), float(coords[1]), float(coords[2])))
+    vertices, faces = mesh_to_arrays(mesh)
 
-    faces = []
-    for fkey in mesh.faces():
-        indexes = [keys.index(i) + 1 for i in mesh.face_vertices(fkey)]
-        faces.append(model.create("IfcIndexedPolygonalFace", CoordIndex=indexes))
+    # The faces are created as raw instances, there is one per face.
+    create_entity = model.file._file.create_entity
+    ifc_faces = [create_entity("IfcIndexedPolygonalFace", CoordIndex=[i + 1 for i in face]) for face in faces]
 
     return model.create(
         "IfcPolygonalFaceSet",
         Closed=mesh.is_closed(),
-        Coordinates=model.create("IfcCartesianPointList3D", CoordList=vertices),
-        Faces=faces,
+        Coordinates=model.create("IfcCartesianPointList3D", CoordList=vertices.tolist()),
+        Faces=ifc_faces,
     )
 
 
@@ -31,6 +105,7 @@ def mesh_to_IfcFaceBasedSurfaceModel(model: Model, mesh: Mesh) -> Base:
     """
     Convert a COMPAS mesh to an IFC FaceBasedSurfaceModel.
     """
+    # NOTE: vertices are not pooled, they are rarely shared between meshes and would flood the pool.
     vertices = {}
     for key in mesh.vertices():
         coords = mesh.vertex_coordinates(key)
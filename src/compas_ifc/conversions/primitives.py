@@ -56,28 +56,23 @@ def IfcPlane_to_plane(plane: Base) -> Plane:
 
 def point_to_IfcCartesianPoint(model: Model, point: Point) -> Base:
     """
-    Convert a COMPAS point to an IFC CartesianPoint.
+    Convert a COMPAS point to an IFC CartesianPoint, shared with identical points through the primitive pool of the file.
     """
-    return model.create("IfcCartesianPoint", Coordinates=(float(point.x), float(point.y), float(point.z)))
+    return model.file.primitive_pool.point(point)
 
 
 def vector_to_IfcDirection(model: Model, vector: Vector) -> Base:
     """
-    Convert a COMPAS vector to an IFC Direction.
+    Convert a COMPAS vector to an IFC Direction, shared with identical directions through the primitive pool of the file.
     """
-    return model.create("IfcDirection", DirectionRatios=(float(vector.x), float(vector.y), float(vector.z)))
+    return model.file.primitive_pool.direction(vector)
 
 
 def frame_to_IfcAxis2Placement3D(model: Model, frame: Frame) -> Base:
     """
-    Convert a COMPAS frame to an IFC Axis2Placement3D.
+    Convert a COMPAS frame to an IFC Axis2Placement3D, shared with identical placements through the primitive pool of the file.
     """
-    return model.create(
-        "IfcAxis2Placement3D",
-        Location=point_to_IfcCartesianPoint(model, frame.point),
-        Axis=vector_to_IfcDirection(model, frame.zaxis),
-        RefDirection=vector_to_IfcDirection(model, frame.xaxis),
-    )
+    return model.file.primitive_pool.axis2placement3d(frame.point, frame.zaxis, frame.xaxis)
 
 
 def frame_to_IfcPlane(model: Model, frame: Frame) -> Base:
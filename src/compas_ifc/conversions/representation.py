@@ -2,39 +2,84 @@
 This module contains functions for converting geometry representations between COMPAS and IFC.
 """
 
+import hashlib
 from typing import Union
 
+import numpy as np
 from compas.datastructures import Mesh
 from compas.geometry import Box
 from compas.geometry import Brep
 from compas.geometry import Cone
 from compas.geometry import Cylinder
+from compas.geometry import Frame
 from compas.geometry import Shape
 from compas.geometry import Sphere
 
 from compas_ifc.conversions.brep import brep_to_IfcAdvancedBrep
+from compas_ifc.conversions.frame import create_IfcAxis2Placement3D
+from compas_ifc.conversions.mesh import mesh_to_arrays
 from compas_ifc.conversions.mesh import mesh_to_IfcFaceBasedSurfaceModel
+from compas_ifc.conversions.mesh import mesh_to_IfcTriangulatedFaceSet
 from compas_ifc.conversions.shapes import box_to_IfcBlock
 from compas_ifc.conversions.shapes import cone_to_IfcRightCircularCone
 from compas_ifc.conversions.shapes import cylinder_to_IfcRightCircularCylinder
 from compas_ifc.conversions.shapes import sphere_to_IfcSphere
+from compas_ifc.entities.base import Base
 from compas_ifc.entities.extensions import IfcProduct
 from compas_ifc.model import Model
 
-REPRESENTATION_CACHE = {}
 
-
-def assign_body_representation(entity: IfcProduct, representation: Union[Shape, Mesh, Brep]):
+def mesh_to_body_items(model: Model, mesh: Mesh) -> tuple[list, str]:
     """
-    Assign a representation to an entity.
+    Convert a mesh to the items of a body representation, and the representation type.
+    Tessellated face sets are used when the schema has them (IFC4 and later), face based surface models otherwise.
     """
+    if model.schema_name == "IFC2X3":
+        return [mesh_to_IfcFaceBasedSurfaceModel(model, mesh)], "SurfaceModel"
+    return [mesh_to_IfcTriangulatedFaceSet(model, mesh)], "Tessellation"
 
-    model: Model = entity.model
 
-    if id(representation) in REPRESENTATION_CACHE:
-        entity.Representation = REPRESENTATION_CACHE[id(representation)]
-        return
+def _quantize(values, precision: float) -> bytes:
+    return np.round(np.asarray(values, dtype=np.float64) / precision).astype(np.int64).tobytes()
+
+
+def geometry_fingerprint(geometry: Union[Shape, Mesh, Brep], precision: float = 1e-6) -> Union[str, None]:
+    """
+    Get a stable fingerprint of the content of a geometry, so that identical geometries can be written once.
+
+    Meshes are fingerprinted from their vertex coordinates, quantized to ``precision``, and their faces.
+    Shapes are fingerprinted from their frame and parameters, quantized the same way,
+    and other geometries from their serialised data.
+    Returns None for geometries that cannot be fingerprinted, which are then never shared.
+    """
+    sha = hashlib.sha256(type(geometry).__name__.encode())
+    if isinstance(geometry, Mesh):
+        vertices, faces = mesh_to_arrays(geometry)
+        sha.update(_quantize(vertices, precision))
+        sha.update(np.asarray([len(face) for face in faces], dtype=np.int64).tobytes())
+        sha.update(np.asarray([i for face in faces for i in face], dtype=np.int64).tobytes())
+    elif isinstance(geometry, (Box, Sphere, Cone, Cylinder)):
+        frame = geometry.frame
+        parameters = [*frame.point, *frame.xaxis, *frame.yaxis]
+        if isinstance(geometry, Box):
+            parameters += [geometry.xsize, geometry.ysize, geometry.zsize]
+        elif isinstance(geometry, Sphere):
+            parameters += [geometry.radius]
+        else:
+            parameters += [geometry.radius, geometry.height]
+        sha.update(_quantize(parameters, precision))
+    else:
+        try:
+            sha.update(geometry.sha256())
+        except Exception:
+            return None
+    return sha.hexdigest()
+
 
+def body_representation_items(model: Model, representation: Union[Shape, Mesh, Brep]) -> tuple[list, str]:
+    """
+    Convert a COMPAS geometry to the items of a body representation, and the representation type.
+    """
     # Convert COMPAS geometries to IFC corresponding representation
     if isinstance(representation, Shape):
         if isinstance(representation, Box):
@@ -49,37 +94,34 @@ def assign_body_representation(entity: IfcProduct, representation: Union[Shape,
             raise NotImplementedError(f"Conversion of {type(representation)} to IFC not implemented.")
 
         ifc_csg_solid = model.create("IfcCsgSolid", TreeRootExpression=ifc_csg_primitive3d)
-
-        items = [ifc_csg_solid]
-        representation_type = "CSG"
+        return [ifc_csg_solid], "CSG"
 
     elif isinstance(representation, Mesh):
-        ifc_representation = mesh_to_IfcFaceBasedSurfaceModel(model, representation)
-        representation_type = "SurfaceModel"
-        items = [ifc_representation]
+        return mesh_to_body_items(model, representation)
 
     elif isinstance(representation, Brep):
         if model.file.use_occ:
             try:
-                items = brep_to_IfcAdvancedBrep(model, representation)
-                representation_type = "SolidModel"
+                return brep_to_IfcAdvancedBrep(model, representation), "SolidModel"
             except Exception as e:
                 print(f"WARNING BREP conversion failed: {e}")
-                items = []
-                representation_type = "SurfaceModel"
+                return [], "SurfaceModel"
 
-        else:
-            mesh, _ = representation.to_tesselation()
-            ifc_representation = mesh_to_IfcFaceBasedSurfaceModel(model, mesh)
-            representation_type = "SurfaceModel"
-            items = [ifc_representation]
+        mesh, _ = representation.to_tesselation()
+        return mesh_to_body_items(model, mesh)
+
+    raise NotImplementedError(f"Conversion of {type(representation)} to IFC not implemented.")
 
-    else:
-        raise NotImplementedError(f"Conversion of {type(representation)} to IFC not implemented.")
+
+def create_shape_representation(model: Model, representation: Union[Shape, Mesh, Brep]) -> Base:
+    """
+    Write a COMPAS geometry as an IFC ShapeRepresentation, in the coordinates of the product or map using it.
+    """
+    items, representation_type = body_representation_items(model, representation)
 
     # QUESTION: When using OCCBrep from Extrusion, can we still keep the extrusion data?
 
-    ifc_shape_representation = model.create(
+    return model.create(
         "IfcShapeRepresentation",
         ContextOfItems=model.file.default_body_context,
         RepresentationIdentifier="Body",
@@ -87,13 +129,126 @@ def assign_body_representation(entity: IfcProduct, representation: Union[Shape,
         Items=items,
     )
 
-    ifc_product_definition_shape = model.create(
+
+def create_representation_map(model: Model, representation: Union[Shape, Mesh, Brep, Base]) -> Base:
+    """
+    Write a COMPAS geometry once as an IFC RepresentationMap, to be placed by any number of products with :func:`assign_mapped_representation`.
+    An existing IFC ShapeRepresentation can also be given, it then becomes the mapped representation.
+    """
+    if isinstance(representation, Base) and representation.is_a("IfcShapeRepresentation"):
+        ifc_shape_representation = representation
+    else:
+        ifc_shape_representation = create_shape_representation(model, representation)
+
+    return model.create(
+        "IfcRepresentationMap",
+        MappingOrigin=create_IfcAxis2Placement3D(model),
+        MappedRepresentation=ifc_shape_representation,
+    )
+
+
+def _as_representation_map(model: Model, key: str, cached: Base) -> Base:
+    """Get a cached representation as a map. A product definition shape, written for the first product, is moved onto a new map."""
+    if cached.is_a("IfcRepresentationMap"):
+        return cached
+    representation_map = create_representation_map(model, cached.Representations[0])
+    cached.Representations = [create_mapped_shape_representation(model, representation_map)]
+    model.file.representation_cache.add(key, representation_map)
+    return representation_map
+
+
+def shared_representation_map(model: Model, representation: Union[Shape, Mesh, Brep]) -> Base:
+    """
+    Get the representation map of a geometry from the representation cache of the file, writing it if needed.
+    If the geometry has only been written plainly for one product so far, its shape representation becomes the mapped one,
+    and that product is placed on the map as well.
+    """
+    cache = model.file.representation_cache
+    key = geometry_fingerprint(representation)
+    cached = cache.get(key)
+    if cached is None:
+        representation_map = create_representation_map(model, representation)
+        cache.add(key, representation_map)
+        return representation_map
+    return _as_representation_map(model, key, cached)
+
+
+def frame_to_IfcCartesianTransformationOperator3D(model: Model, frame: Frame) -> Base:
+    """
+    Convert a COMPAS frame to an IFC CartesianTransformationOperator3D.
+    """
+    pool = model.file.primitive_pool
+    return model.create(
+        "IfcCartesianTransformationOperator3D",
+        Axis1=pool.direction(frame.xaxis),
+        Axis2=pool.direction(frame.yaxis),
+        LocalOrigin=pool.point(frame.point),
+        Axis3=pool.direction(frame.zaxis),
+    )
+
+
+def create_mapped_shape_representation(model: Model, representation_map: Base, frame: Frame = None) -> Base:
+    """
+    Place a representation map with an IFC MappedItem, in an IFC ShapeRepresentation.
+    The mapped geometry is transformed by ``frame`` if given.
+    """
+    if frame is None:
+        target = model.file.default_mapping_target
+    else:
+        target = frame_to_IfcCartesianTransformationOperator3D(model, frame)
+
+    ifc_mapped_item = model.create("IfcMappedItem", MappingSource=representation_map, MappingTarget=target)
+    return model.create(
+        "IfcShapeRepresentation",
+        ContextOfItems=model.file.default_body_context,
+        RepresentationIdentifier="Body",
+        RepresentationType="MappedRepresentation",
+        Items=[ifc_mapped_item],
+    )
+
+
+def assign_mapped_representation(entity: IfcProduct, representation_map: Base, frame: Frame = None):
+    """
+    Assign a representation map to an entity, through an IFC MappedItem.
+    The mapped geometry is placed in the coordinates of the entity, transformed by ``frame`` if given.
+    """
+    model: Model = entity.model
+
+    entity.Representation = model.create(
         "IfcProductDefinitionShape",
-        Representations=[ifc_shape_representation],
+        Representations=[create_mapped_shape_representation(model, representation_map, frame)],
     )
 
+
+def assign_body_representation(entity: IfcProduct, representation: Union[Shape, Mesh, Brep, Base]):
+    """
+    Assign a representation to an entity.
+
+    A geometry is written plainly the first time it is assigned. When an identical geometry, detected by :func:`geometry_fingerprint`,
+    is assigned again, the first representation is turned into an IFC RepresentationMap, which all the products using it place with an IFC MappedItem.
+    The written geometries are kept in the :class:`compas_ifc.cache.RepresentationCache` of the file.
+    A representation map created with :func:`create_representation_map` can also be given directly.
+    """
+
+    model: Model = entity.model
+
+    if isinstance(representation, Base) and representation.is_a("IfcRepresentationMap"):
+        assign_mapped_representation(entity, representation)
+        return
+
+    cache = model.file.representation_cache
+    key = geometry_fingerprint(representation)
+    cached = cache.get(key)
+    if cached is not None:
+        assign_mapped_representation(entity, _as_representation_map(model, key, cached))
+        return
+
+    ifc_product_definition_shape = model.create(
+        "IfcProductDefinitionShape",
+        Representations=[create_shape_representation(model, representation)],
+    )
     entity.Representation = ifc_product_definition_shape
-    REPRESENTATION_CACHE[id(representation)] = ifc_product_definition_shape
+    cache.add(key, ifc_product_definition_shape)
 
     # TODO: should not overwrite all property sets here
     # TODO: alternative 1: restructure the metadata, remove duplicated info like vertices
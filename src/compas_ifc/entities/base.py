@@ -1,4 +1,5 @@
 import importlib
+from functools import partial
 from typing import TYPE_CHECKING
 from typing import Union
 
@@ -47,6 +48,70 @@ class TypeDefinition:
         return "<{} {}>".format(self.entity.is_a(), self.value)
 
 
+class Attribute(object):
+    """
+    Descriptor of an IFC attribute, used by classes generated as a single schema module.
+    The value is read by its positional index in the entity, instead of by name.
+
+    Attributes
+    ----------
+    name : str
+        The name of the attribute.
+    index : int
+        The positional index of the attribute in the entity.
+    derived : bool
+        Whether the attribute is derived, in which case it is read by name and can not be set.
+    """
+
+    def __init__(self, name: str, index: int, derived: bool = False, doc: str = None):
+        self.name = name
+        self.index = index
+        self.derived = derived
+        self.__doc__ = doc
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if self.derived:
+            return obj._get_attribute(self.name)
+        return obj._get_attribute(entity=obj.entity[self.index])
+
+    def __set__(self, obj, value):
+        if not self.derived:
+            obj._set_attribute(self.name, value)
+
+
+class InverseAttribute(object):
+    """
+    Descriptor of an IFC inverse attribute, used by classes generated as a single schema module.
+    Accessing it gives a method returning the related entities, like the inverse attributes of the other generated classes.
+
+    Attributes
+    ----------
+    name : str
+        The name of the inverse attribute.
+    entity_reference : str
+        The name of the IFC class referencing the entity.
+    attribute_reference : str
+        The name of the attribute of the referencing class.
+    """
+
+    def __init__(self, name: str, entity_reference: str, attribute_reference: str, doc: str = None):
+        self.name = name
+        self.entity_reference = entity_reference
+        self.attribute_reference = attribute_reference
+        self.__doc__ = doc
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return partial(obj._get_inverse_attribute, self.name)
+
+
+# Wrapper classes by (schema, IFC class name, extensions), so that every class is only resolved once.
+WRAPPER_CLASSES = {}
+
+
 class Base(Data):
     """
     Root class for all IFC classes.
@@ -59,12 +124,37 @@ class Base(Data):
         The IFC file containing this instance of the class.
     """
 
+    # NOTE: wrappers are created for every entity that is accessed, so they are kept as small as possible.
+    # :class:`compas.data.Data` is not initialized per wrapper, its guid and name fall back to these class defaults until they are set.
+    # There are no slots, as the instance dict of Data would remain anyway.
+    _guid = None
+    _name = None
+
     def __new__(cls, entity: entity_instance, file: "IFCFile" = None, extensions: dict = None):
         if file is None:
             schema = "IFC4"
         else:
             schema = file._schema.name()
 
+        cls_name = entity.is_a()
+        key = (schema, cls_name, tuple(extensions.items()) if extensions else None)
+        try:
+            ifc_cls = WRAPPER_CLASSES[key]
+        except KeyError:
+            ifc_cls = WRAPPER_CLASSES[key] = Base.resolve_class(entity, schema, extensions)
+
+        if ifc_cls:
+            return super(Base, ifc_cls).__new__(ifc_cls)
+        elif hasattr(entity, "wrappedValue"):
+            return TypeDefinition(entity, file)
+
+    @staticmethod
+    def resolve_class(entity: entity_instance, schema: str = "IFC4", extensions: dict = None) -> type:
+        """Resolve the wrapper class of an entity, combining its generated IFC class with the matching extensions.
+
+        The result only depends on the schema, the IFC class of the entity and the extensions,
+        and is cached in ``WRAPPER_CLASSES`` by :meth:`__new__`.
+        """
         try:
             classes = importlib.import_module(f"compas_ifc.entities.generated.{schema}")
         except ImportError:
@@ -72,26 +162,23 @@ class Base(Data):
 
         cls_name = entity.is_a()
         ifc_cls = getattr(classes, cls_name, None)
-        if ifc_cls:
-            matched_extensions = []
-            if extensions:
-                for name, extension_class in extensions.items():
-                    if entity.is_a(name):
-                        matched_extensions.append(extension_class)
-            if matched_extensions:
-                # Create a new class that inherits from the original IFC class and all matched extensions
-                extension_name = f"Extended{cls_name}"
-                bases = tuple([ifc_cls] + matched_extensions)
-                extended_cls = type(extension_name, bases, {})
-                return super(Base, extended_cls).__new__(extended_cls)
-            else:
-                # If no extensions matched, use the original IFC class
-                return super(Base, ifc_cls).__new__(ifc_cls)
-        elif hasattr(entity, "wrappedValue"):
-            return TypeDefinition(entity, file)
+        if not ifc_cls:
+            return None
+
+        matched_extensions = []
+        if extensions:
+            for name, extension_class in extensions.items():
+                if entity.is_a(name):
+                    matched_extensions.append(extension_class)
+        if matched_extensions:
+            # Create a new class that inherits from the original IFC class and all matched extensions
+            extension_name = f"Extended{cls_name}"
+            bases = tuple([ifc_cls] + matched_extensions)
+            return type(extension_name, bases, {})
+        # If no extensions matched, use the original IFC class
+        return ifc_cls
 
     def __init__(self, entity: entity_instance = None, file=None, **kwargs):
-        super().__init__()
         self.file = file
         self.entity = entity
 
@@ -153,12 +240,17 @@ class Base(Data):
         else:
             value = prepare_value(value)
 
-        if getattr(self.entity, name) != value:
+        old_value = getattr(self.entity, name)
+        if old_value != value:
             try:
                 setattr(self.entity, name, value)
             except Exception as e:
                 print(f"Error setting {name} of {self} to {value}")
                 raise e
+            if name == "Name" and self.file is not None and self.entity.is_a("IfcRoot"):
+                self.file._update_name_index(self.entity, old_value, value)
+            elif self.file is not None and (self.entity.is_a("IfcRelAggregates") or self.entity.is_a("IfcRelContainedInSpatialStructure")):
+                self.file._invalidate_spatial_hierarchy()
 
     def _get_inverse_attribute(self, name):
         return [self.file.from_entity(attr) for attr in getattr(self.entity, name)]
@@ -24,7 +24,8 @@ class IfcContext(IfcContext):
 
     @property
     def properties(self):
-        psets = get_psets(self.entity, psets_only=True)
+        with self.file.profiler.stage("psets", trace=False):
+            psets = get_psets(self.entity, psets_only=True)
         for pset in psets.values():
             del pset["id"]
         return psets
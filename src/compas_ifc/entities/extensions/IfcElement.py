@@ -12,13 +12,6 @@ class IfcElement(IfcElement):
     Attributes
     ----------
     parent : :class:`IfcElement`
-        The parent element of the element.
+        The parent element of the element. The containing spatial structure takes precedence over the decomposed element.
+        Resolved by :class:`compas_ifc.hierarchy.SpatialHierarchy`.
     """
-
-    @property
-    def parent(self):
-        relations = self.ContainedInStructure()
-        if relations:
-            return relations[0].RelatingStructure
-        else:
-            return super().parent
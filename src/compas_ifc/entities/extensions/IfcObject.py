@@ -32,7 +32,8 @@ class IfcObject(IfcObject):
 
     @property
     def property_sets(self):
-        return from_psets_to_dict(self)
+        with self.file.profiler.stage("psets", trace=False):
+            return from_psets_to_dict(self)
 
     @property_sets.setter
     def property_sets(self, psets):
@@ -53,7 +54,8 @@ class IfcObject(IfcObject):
 
     @property
     def quantity_sets(self):
-        qtos = get_psets(self.entity, qtos_only=True)
+        with self.file.profiler.stage("psets", trace=False):
+            qtos = get_psets(self.entity, qtos_only=True)
         for qto in qtos.values():
             del qto["id"]
         return qtos
@@ -26,23 +26,15 @@ class IfcObjectDefinition(IfcObjectDefinition):
 
     @property
     def parent(self):
-        relations = self.Decomposes()
-        if relations:
-            return relations[0].RelatingObject
-        else:
-            return None
+        return self.file.spatial_hierarchy.get_parent(self)
 
     @property
     def children(self):
-        return sum([relation.RelatedObjects for relation in self.IsDecomposedBy()], [])
+        return self.file.spatial_hierarchy.get_children(self)
 
     @property
     def descendants(self):
-        descendants = []
-        for child in self.children:
-            descendants.append(child)
-            descendants.extend(child.descendants)
-        return descendants
+        return self.file.spatial_hierarchy.get_descendants(self)
 
     @property
     def material(self):
@@ -56,4 +48,4 @@ class IfcObjectDefinition(IfcObjectDefinition):
         if not recursive:
             return [child for child in self.children if child.is_a(type_name)]
         else:
-            return [child for child in self.descendants if child.is_a(type_name)]
+            return self.file.spatial_hierarchy.get_descendants(self, type_name)
@@ -1,8 +1,14 @@
 from typing import TYPE_CHECKING
 
+import numpy as np
+from compas.geometry import Transformation
+
+from compas_ifc.brep import TessellatedBrep
+from compas_ifc.brep import TessellatedBrepInstance
 from compas_ifc.conversions.frame import IfcLocalPlacement_to_frame
 from compas_ifc.conversions.frame import assign_entity_frame
 from compas_ifc.conversions.representation import assign_body_representation
+from compas_ifc.entities.base import Base
 
 if TYPE_CHECKING:
     from compas_ifc.entities.generated.IFC4 import IfcProduct
@@ -10,6 +16,20 @@ else:
     IfcProduct = object
 
 
+def placed(geometry, transformation):
+    """Get a transformed view of a geometry, without transforming the vertices of tessellated breps."""
+    if isinstance(geometry, TessellatedBrepInstance):
+        transformation = transformation * geometry.transformation
+        if np.allclose(transformation.matrix, np.eye(4), atol=1e-6):
+            # The transformation cancels out the placement. The instance is still a new view,
+            # so that naming or transforming it never modifies the shared brep.
+            transformation = Transformation()
+        return TessellatedBrepInstance(geometry.brep, transformation)
+    if isinstance(geometry, TessellatedBrep):
+        return TessellatedBrepInstance(geometry, transformation)
+    return geometry.transformed(transformation)
+
+
 class IfcProduct(IfcProduct):
     """Extension class for :class:`IfcProduct`.
 
@@ -18,7 +38,11 @@ class IfcProduct(IfcProduct):
     style : :class:`IfcStyle`
         The style of the product.
     geometry : :class:`compas_ifc.brep.TessellatedBrep`
-        The geometry of the product. (OCCBrep is using COMPAS OCC)
+        The geometry of the product, in the coordinates of its frame. Same as ``geometry_local``. (OCCBrep is using COMPAS OCC)
+    geometry_local : :class:`compas_ifc.brep.TessellatedBrep`
+        The geometry of the product, in the coordinates of its frame.
+    geometry_world : :class:`compas_ifc.brep.TessellatedBrep`
+        The geometry of the product, in world coordinates.
     frame : :class:`compas.geometry.Frame`
         The frame of the product.
     """
@@ -29,21 +53,40 @@ class IfcProduct(IfcProduct):
 
     @property
     def geometry(self):
-        if not getattr(self, "_geometry", None):
-            self._geometry = self.file.get_preloaded_geometry(self)
-            if self._geometry:
-                self._geometry.name = self.Name
-            if self.frame and self._geometry:
-                # NOTE: preloaded geometry is pre-transformed because of boolean.
-                # The pre-transformation is not necessarily the same as the frame of entity.
-                # Therefore, we need to re-transform the geometry back to its original location.
-                T = self.frame.to_transformation()
-                self._geometry.transform(T.inverse())
-        return self._geometry
+        return self.geometry_local
+
+    @property
+    def geometry_world(self):
+        if not getattr(self, "_geometry_world", None):
+            geometry = self.file.get_preloaded_geometry(self)
+            if not geometry and getattr(self, "_geometry_local", None):
+                geometry = self._geometry_local
+                if self.frame:
+                    geometry = placed(geometry, self.frame.to_transformation())
+            if geometry:
+                geometry.name = self.Name
+            self._geometry_world = geometry
+        return self._geometry_world
+
+    @property
+    def geometry_local(self):
+        if not getattr(self, "_geometry_local", None):
+            geometry = self.geometry_world
+            if geometry and self.frame:
+                # NOTE: preloaded geometry is placed in world coordinates because of boolean.
+                # The placement is not necessarily the same as the frame of entity.
+                # Therefore, we need to place the geometry relative to the frame instead.
+                geometry = placed(geometry, self.frame.to_transformation().inverse())
+                geometry.name = self.Name
+            self._geometry_local = geometry
+        return self._geometry_local
 
     @geometry.setter
     def geometry(self, geometry):
-        self._geometry = geometry
+        # NOTE: a representation map is not a COMPAS geometry, the geometry is read back from the file instead.
+        self._geometry_local = None if isinstance(geometry, Base) else geometry
+        self._geometry_world = None
+        self._geometry_assigned = self._geometry_local is not None
         assign_body_representation(self, geometry)
         # TODO: delete existing representation
 
@@ -61,5 +104,9 @@ class IfcProduct(IfcProduct):
     @frame.setter
     def frame(self, frame):
         self._frame = frame
+        # The cached geometries are derived from the previous frame, except an assigned geometry which stays local.
+        self._geometry_world = None
+        if not getattr(self, "_geometry_assigned", False):
+            self._geometry_local = None
         # TODO: consider parent frame
         assign_entity_frame(self, frame)
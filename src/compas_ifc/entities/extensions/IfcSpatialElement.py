@@ -12,12 +12,6 @@ class IfcSpatialElement(IfcSpatialElement):
     Attributes
     ----------
     children : list[:class:`IfcSpatialElement`]
-        The children spatial elements of the spatial element.
+        The children spatial elements of the spatial element, including the contained elements.
+        Resolved by :class:`compas_ifc.hierarchy.SpatialHierarchy`.
     """
-
-    @property
-    def children(self):
-        children = super().children
-        children += sum([relation.RelatedElements for relation in self.ContainsElements()], [])
-        # NOTE: in IFC2X3 this is in IfcSpatialStructureElement
-        return list(set(children))
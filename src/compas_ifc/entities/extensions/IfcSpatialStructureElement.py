@@ -12,12 +12,6 @@ class IfcSpatialStructureElement(IfcSpatialStructureElement):
     Attributes
     ----------
     children : list[:class:`IfcSpatialElement`]
-        The children spatial elements of the spatial structure element.
+        The children spatial elements of the spatial structure element, including the contained elements.
+        Resolved by :class:`compas_ifc.hierarchy.SpatialHierarchy`.
     """
-
-    @property
-    def children(self):
-        children = super().children
-        children += sum([relation.RelatedElements for relation in self.ContainsElements()], [])
-        # NOTE: in IFC4 this is in IfcSpatialElement
-        return list(set(children))
@@ -0,0 +1,1660 @@
+"""
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+    :template: class.rst
+
+    Ifc2DCompositeCurve
+    IfcActionRequest
+    IfcActionSourceTypeEnum
+    IfcActionTypeEnum
+    IfcActor
+    IfcActorRole
+    IfcActuatorType
+    IfcActuatorTypeEnum
+    IfcAddress
+    IfcAddressTypeEnum
+    IfcAheadOrBehind
+    IfcAirTerminalBoxType
+    IfcAirTerminalBoxTypeEnum
+    IfcAirTerminalType
+    IfcAirTerminalTypeEnum
+    IfcAirToAirHeatRecoveryType
+    IfcAirToAirHeatRecoveryTypeEnum
+    IfcAlarmType
+    IfcAlarmTypeEnum
+    IfcAnalysisModelTypeEnum
+    IfcAnalysisTheoryTypeEnum
+    IfcAngularDimension
+    IfcAnnotation
+    IfcAnnotationCurveOccurrence
+    IfcAnnotationFillArea
+    IfcAnnotationFillAreaOccurrence
+    IfcAnnotationOccurrence
+    IfcAnnotationSurface
+    IfcAnnotationSurfaceOccurrence
+    IfcAnnotationSymbolOccurrence
+    IfcAnnotationTextOccurrence
+    IfcApplication
+    IfcAppliedValue
+    IfcAppliedValueRelationship
+    IfcApproval
+    IfcApprovalActorRelationship
+    IfcApprovalPropertyRelationship
+    IfcApprovalRelationship
+    IfcArbitraryClosedProfileDef
+    IfcArbitraryOpenProfileDef
+    IfcArbitraryProfileDefWithVoids
+    IfcArithmeticOperatorEnum
+    IfcAssemblyPlaceEnum
+    IfcAsset
+    IfcAsymmetricIShapeProfileDef
+    IfcAxis1Placement
+    IfcAxis2Placement2D
+    IfcAxis2Placement3D
+    IfcBeam
+    IfcBeamType
+    IfcBeamTypeEnum
+    IfcBenchmarkEnum
+    IfcBezierCurve
+    IfcBlobTexture
+    IfcBlock
+    IfcBoilerType
+    IfcBoilerTypeEnum
+    IfcBooleanClippingResult
+    IfcBooleanOperator
+    IfcBooleanResult
+    IfcBoundaryCondition
+    IfcBoundaryEdgeCondition
+    IfcBoundaryFaceCondition
+    IfcBoundaryNodeCondition
+    IfcBoundaryNodeConditionWarping
+    IfcBoundedCurve
+    IfcBoundedSurface
+    IfcBoundingBox
+    IfcBoxedHalfSpace
+    IfcBSplineCurve
+    IfcBSplineCurveForm
+    IfcBuilding
+    IfcBuildingElement
+    IfcBuildingElementComponent
+    IfcBuildingElementPart
+    IfcBuildingElementProxy
+    IfcBuildingElementProxyType
+    IfcBuildingElementProxyTypeEnum
+    IfcBuildingElementType
+    IfcBuildingStorey
+    IfcCableCarrierFittingType
+    IfcCableCarrierFittingTypeEnum
+    IfcCableCarrierSegmentType
+    IfcCableCarrierSegmentTypeEnum
+    IfcCableSegmentType
+    IfcCableSegmentTypeEnum
+    IfcCalendarDate
+    IfcCartesianPoint
+    IfcCartesianTransformationOperator
+    IfcCartesianTransformationOperator2D
+    IfcCartesianTransformationOperator2DnonUniform
+    IfcCartesianTransformationOperator3D
+    IfcCartesianTransformationOperator3DnonUniform
+    IfcCenterLineProfileDef
+    IfcChamferEdgeFeature
+    IfcChangeActionEnum
+    IfcChillerType
+    IfcChillerTypeEnum
+    IfcCircle
+    IfcCircleHollowProfileDef
+    IfcCircleProfileDef
+    IfcClassification
+    IfcClassificationItem
+    IfcClassificationItemRelationship
+    IfcClassificationNotation
+    IfcClassificationNotationFacet
+    IfcClassificationReference
+    IfcClosedShell
+    IfcCoilType
+    IfcCoilTypeEnum
+    IfcColourRgb
+    IfcColourSpecification
+    IfcColumn
+    IfcColumnType
+    IfcColumnTypeEnum
+    IfcComplexProperty
+    IfcCompositeCurve
+    IfcCompositeCurveSegment
+    IfcCompositeProfileDef
+    IfcCompressorType
+    IfcCompressorTypeEnum
+    IfcCondenserType
+    IfcCondenserTypeEnum
+    IfcCondition
+    IfcConditionCriterion
+    IfcConic
+    IfcConnectedFaceSet
+    IfcConnectionCurveGeometry
+    IfcConnectionGeometry
+    IfcConnectionPointEccentricity
+    IfcConnectionPointGeometry
+    IfcConnectionPortGeometry
+    IfcConnectionSurfaceGeometry
+    IfcConnectionTypeEnum
+    IfcConstraint
+    IfcConstraintAggregationRelationship
+    IfcConstraintClassificationRelationship
+    IfcConstraintEnum
+    IfcConstraintRelationship
+    IfcConstructionEquipmentResource
+    IfcConstructionMaterialResource
+    IfcConstructionProductResource
+    IfcConstructionResource
+    IfcContextDependentUnit
+    IfcControl
+    IfcControllerType
+    IfcControllerTypeEnum
+    IfcConversionBasedUnit
+    IfcCooledBeamType
+    IfcCooledBeamTypeEnum
+    IfcCoolingTowerType
+    IfcCoolingTowerTypeEnum
+    IfcCoordinatedUniversalTimeOffset
+    IfcCostItem
+    IfcCostSchedule
+    IfcCostScheduleTypeEnum
+    IfcCostValue
+    IfcCovering
+    IfcCoveringType
+    IfcCoveringTypeEnum
+    IfcCraneRailAShapeProfileDef
+    IfcCraneRailFShapeProfileDef
+    IfcCrewResource
+    IfcCsgPrimitive3D
+    IfcCsgSolid
+    IfcCShapeProfileDef
+    IfcCurrencyEnum
+    IfcCurrencyRelationship
+    IfcCurtainWall
+    IfcCurtainWallType
+    IfcCurtainWallTypeEnum
+    IfcCurve
+    IfcCurveBoundedPlane
+    IfcCurveStyle
+    IfcCurveStyleFont
+    IfcCurveStyleFontAndScaling
+    IfcCurveStyleFontPattern
+    IfcDamperType
+    IfcDamperTypeEnum
+    IfcDataOriginEnum
+    IfcDateAndTime
+    IfcDefinedSymbol
+    IfcDerivedProfileDef
+    IfcDerivedUnit
+    IfcDerivedUnitElement
+    IfcDerivedUnitEnum
+    IfcDiameterDimension
+    IfcDimensionalExponents
+    IfcDimensionCalloutRelationship
+    IfcDimensionCurve
+    IfcDimensionCurveDirectedCallout
+    IfcDimensionCurveTerminator
+    IfcDimensionExtentUsage
+    IfcDimensionPair
+    IfcDirection
+    IfcDirectionSenseEnum
+    IfcDiscreteAccessory
+    IfcDiscreteAccessoryType
+    IfcDistributionChamberElement
+    IfcDistributionChamberElementType
+    IfcDistributionChamberElementTypeEnum
+    IfcDistributionControlElement
+    IfcDistributionControlElementType
+    IfcDistributionElement
+    IfcDistributionElementType
+    IfcDistributionFlowElement
+    IfcDistributionFlowElementType
+    IfcDistributionPort
+    IfcDocumentConfidentialityEnum
+    IfcDocumentElectronicFormat
+    IfcDocumentInformation
+    IfcDocumentInformationRelationship
+    IfcDocumentReference
+    IfcDocumentStatusEnum
+    IfcDoor
+    IfcDoorLiningProperties
+    IfcDoorPanelOperationEnum
+    IfcDoorPanelPositionEnum
+    IfcDoorPanelProperties
+    IfcDoorStyle
+    IfcDoorStyleConstructionEnum
+    IfcDoorStyleOperationEnum
+    IfcDraughtingCallout
+    IfcDraughtingCalloutRelationship
+    IfcDraughtingPreDefinedColour
+    IfcDraughtingPreDefinedCurveFont
+    IfcDraughtingPreDefinedTextFont
+    IfcDuctFittingType
+    IfcDuctFittingTypeEnum
+    IfcDuctSegmentType
+    IfcDuctSegmentTypeEnum
+    IfcDuctSilencerType
+    IfcDuctSilencerTypeEnum
+    IfcEdge
+    IfcEdgeCurve
+    IfcEdgeFeature
+    IfcEdgeLoop
+    IfcElectricalBaseProperties
+    IfcElectricalCircuit
+    IfcElectricalElement
+    IfcElectricApplianceType
+    IfcElectricApplianceTypeEnum
+    IfcElectricCurrentEnum
+    IfcElectricDistributionPoint
+    IfcElectricDistributionPointFunctionEnum
+    IfcElectricFlowStorageDeviceType
+    IfcElectricFlowStorageDeviceTypeEnum
+    IfcElectricGeneratorType
+    IfcElectricGeneratorTypeEnum
+    IfcElectricHeaterType
+    IfcElectricHeaterTypeEnum
+    IfcElectricMotorType
+    IfcElectricMotorTypeEnum
+    IfcElectricTimeControlType
+    IfcElectricTimeControlTypeEnum
+    IfcElement
+    IfcElementarySurface
+    IfcElementAssembly
+    IfcElementAssemblyTypeEnum
+    IfcElementComponent
+    IfcElementComponentType
+    IfcElementCompositionEnum
+    IfcElementQuantity
+    IfcElementType
+    IfcEllipse
+    IfcEllipseProfileDef
+    IfcEnergyConversionDevice
+    IfcEnergyConversionDeviceType
+    IfcEnergyProperties
+    IfcEnergySequenceEnum
+    IfcEnvironmentalImpactCategoryEnum
+    IfcEnvironmentalImpactValue
+    IfcEquipmentElement
+    IfcEquipmentStandard
+    IfcEvaporativeCoolerType
+    IfcEvaporativeCoolerTypeEnum
+    IfcEvaporatorType
+    IfcEvaporatorTypeEnum
+    IfcExtendedMaterialProperties
+    IfcExternallyDefinedHatchStyle
+    IfcExternallyDefinedSurfaceStyle
+    IfcExternallyDefinedSymbol
+    IfcExternallyDefinedTextFont
+    IfcExternalReference
+    IfcExtrudedAreaSolid
+    IfcFace
+    IfcFaceBasedSurfaceModel
+    IfcFaceBound
+    IfcFaceOuterBound
+    IfcFaceSurface
+    IfcFacetedBrep
+    IfcFacetedBrepWithVoids
+    IfcFailureConnectionCondition
+    IfcFanType
+    IfcFanTypeEnum
+    IfcFastener
+    IfcFastenerType
+    IfcFeatureElement
+    IfcFeatureElementAddition
+    IfcFeatureElementSubtraction
+    IfcFillAreaStyle
+    IfcFillAreaStyleHatching
+    IfcFillAreaStyleTiles
+    IfcFillAreaStyleTileSymbolWithStyle
+    IfcFilterType
+    IfcFilterTypeEnum
+    IfcFireSuppressionTerminalType
+    IfcFireSuppressionTerminalTypeEnum
+    IfcFlowController
+    IfcFlowControllerType
+    IfcFlowDirectionEnum
+    IfcFlowFitting
+    IfcFlowFittingType
+    IfcFlowInstrumentType
+    IfcFlowInstrumentTypeEnum
+    IfcFlowMeterType
+    IfcFlowMeterTypeEnum
+    IfcFlowMovingDevice
+    IfcFlowMovingDeviceType
+    IfcFlowSegment
+    IfcFlowSegmentType
+    IfcFlowStorageDevice
+    IfcFlowStorageDeviceType
+    IfcFlowTerminal
+    IfcFlowTerminalType
+    IfcFlowTreatmentDevice
+    IfcFlowTreatmentDeviceType
+    IfcFluidFlowProperties
+    IfcFooting
+    IfcFootingTypeEnum
+    IfcFuelProperties
+    IfcFurnishingElement
+    IfcFurnishingElementType
+    IfcFurnitureStandard
+    IfcFurnitureType
+    IfcGasTerminalType
+    IfcGasTerminalTypeEnum
+    IfcGeneralMaterialProperties
+    IfcGeneralProfileProperties
+    IfcGeometricCurveSet
+    IfcGeometricProjectionEnum
+    IfcGeometricRepresentationContext
+    IfcGeometricRepresentationItem
+    IfcGeometricRepresentationSubContext
+    IfcGeometricSet
+    IfcGlobalOrLocalEnum
+    IfcGrid
+    IfcGridAxis
+    IfcGridPlacement
+    IfcGroup
+    IfcHalfSpaceSolid
+    IfcHeatExchangerType
+    IfcHeatExchangerTypeEnum
+    IfcHumidifierType
+    IfcHumidifierTypeEnum
+    IfcHygroscopicMaterialProperties
+    IfcImageTexture
+    IfcInternalOrExternalEnum
+    IfcInventory
+    IfcInventoryTypeEnum
+    IfcIrregularTimeSeries
+    IfcIrregularTimeSeriesValue
+    IfcIShapeProfileDef
+    IfcJunctionBoxType
+    IfcJunctionBoxTypeEnum
+    IfcLaborResource
+    IfcLampType
+    IfcLampTypeEnum
+    IfcLayerSetDirectionEnum
+    IfcLibraryInformation
+    IfcLibraryReference
+    IfcLightDistributionCurveEnum
+    IfcLightDistributionData
+    IfcLightEmissionSourceEnum
+    IfcLightFixtureType
+    IfcLightFixtureTypeEnum
+    IfcLightIntensityDistribution
+    IfcLightSource
+    IfcLightSourceAmbient
+    IfcLightSourceDirectional
+    IfcLightSourceGoniometric
+    IfcLightSourcePositional
+    IfcLightSourceSpot
+    IfcLine
+    IfcLinearDimension
+    IfcLoadGroupTypeEnum
+    IfcLocalPlacement
+    IfcLocalTime
+    IfcLogicalOperatorEnum
+    IfcLoop
+    IfcLShapeProfileDef
+    IfcManifoldSolidBrep
+    IfcMappedItem
+    IfcMaterial
+    IfcMaterialClassificationRelationship
+    IfcMaterialDefinitionRepresentation
+    IfcMaterialLayer
+    IfcMaterialLayerSet
+    IfcMaterialLayerSetUsage
+    IfcMaterialList
+    IfcMaterialProperties
+    IfcMeasureWithUnit
+    IfcMechanicalConcreteMaterialProperties
+    IfcMechanicalFastener
+    IfcMechanicalFastenerType
+    IfcMechanicalMaterialProperties
+    IfcMechanicalSteelMaterialProperties
+    IfcMember
+    IfcMemberType
+    IfcMemberTypeEnum
+    IfcMetric
+    IfcMonetaryUnit
+    IfcMotorConnectionType
+    IfcMotorConnectionTypeEnum
+    IfcMove
+    IfcNamedUnit
+    IfcNullStyle
+    IfcObject
+    IfcObjectDefinition
+    IfcObjective
+    IfcObjectiveEnum
+    IfcObjectPlacement
+    IfcObjectTypeEnum
+    IfcOccupant
+    IfcOccupantTypeEnum
+    IfcOffsetCurve2D
+    IfcOffsetCurve3D
+    IfcOneDirectionRepeatFactor
+    IfcOpeningElement
+    IfcOpenShell
+    IfcOpticalMaterialProperties
+    IfcOrderAction
+    IfcOrganization
+    IfcOrganizationRelationship
+    IfcOrientedEdge
+    IfcOutletType
+    IfcOutletTypeEnum
+    IfcOwnerHistory
+    IfcParameterizedProfileDef
+    IfcPath
+    IfcPerformanceHistory
+    IfcPermeableCoveringOperationEnum
+    IfcPermeableCoveringProperties
+    IfcPermit
+    IfcPerson
+    IfcPersonAndOrganization
+    IfcPhysicalComplexQuantity
+    IfcPhysicalOrVirtualEnum
+    IfcPhysicalQuantity
+    IfcPhysicalSimpleQuantity
+    IfcPile
+    IfcPileConstructionEnum
+    IfcPileTypeEnum
+    IfcPipeFittingType
+    IfcPipeFittingTypeEnum
+    IfcPipeSegmentType
+    IfcPipeSegmentTypeEnum
+    IfcPixelTexture
+    IfcPlacement
+    IfcPlanarBox
+    IfcPlanarExtent
+    IfcPlane
+    IfcPlate
+    IfcPlateType
+    IfcPlateTypeEnum
+    IfcPoint
+    IfcPointOnCurve
+    IfcPointOnSurface
+    IfcPolygonalBoundedHalfSpace
+    IfcPolyline
+    IfcPolyLoop
+    IfcPort
+    IfcPostalAddress
+    IfcPreDefinedColour
+    IfcPreDefinedCurveFont
+    IfcPreDefinedDimensionSymbol
+    IfcPreDefinedItem
+    IfcPreDefinedPointMarkerSymbol
+    IfcPreDefinedSymbol
+    IfcPreDefinedTerminatorSymbol
+    IfcPreDefinedTextFont
+    IfcPresentationLayerAssignment
+    IfcPresentationLayerWithStyle
+    IfcPresentationStyle
+    IfcPresentationStyleAssignment
+    IfcProcedure
+    IfcProcedureTypeEnum
+    IfcProcess
+    IfcProduct
+    IfcProductDefinitionShape
+    IfcProductRepresentation
+    IfcProductsOfCombustionProperties
+    IfcProfileDef
+    IfcProfileProperties
+    IfcProfileTypeEnum
+    IfcProject
+    IfcProjectedOrTrueLengthEnum
+    IfcProjectionCurve
+    IfcProjectionElement
+    IfcProjectOrder
+    IfcProjectOrderRecord
+    IfcProjectOrderRecordTypeEnum
+    IfcProjectOrderTypeEnum
+    IfcProperty
+    IfcPropertyBoundedValue
+    IfcPropertyConstraintRelationship
+    IfcPropertyDefinition
+    IfcPropertyDependencyRelationship
+    IfcPropertyEnumeratedValue
+    IfcPropertyEnumeration
+    IfcPropertyListValue
+    IfcPropertyReferenceValue
+    IfcPropertySet
+    IfcPropertySetDefinition
+    IfcPropertySingleValue
+    IfcPropertySourceEnum
+    IfcPropertyTableValue
+    IfcProtectiveDeviceType
+    IfcProtectiveDeviceTypeEnum
+    IfcProxy
+    IfcPumpType
+    IfcPumpTypeEnum
+    IfcQuantityArea
+    IfcQuantityCount
+    IfcQuantityLength
+    IfcQuantityTime
+    IfcQuantityVolume
+    IfcQuantityWeight
+    IfcRadiusDimension
+    IfcRailing
+    IfcRailingType
+    IfcRailingTypeEnum
+    IfcRamp
+    IfcRampFlight
+    IfcRampFlightType
+    IfcRampFlightTypeEnum
+    IfcRampTypeEnum
+    IfcRationalBezierCurve
+    IfcRectangleHollowProfileDef
+    IfcRectangleProfileDef
+    IfcRectangularPyramid
+    IfcRectangularTrimmedSurface
+    IfcReferencesValueDocument
+    IfcReflectanceMethodEnum
+    IfcRegularTimeSeries
+    IfcReinforcementBarProperties
+    IfcReinforcementDefinitionProperties
+    IfcReinforcingBar
+    IfcReinforcingBarRoleEnum
+    IfcReinforcingBarSurfaceEnum
+    IfcReinforcingElement
+    IfcReinforcingMesh
+    IfcRelAggregates
+    IfcRelAssigns
+    IfcRelAssignsTasks
+    IfcRelAssignsToActor
+    IfcRelAssignsToControl
+    IfcRelAssignsToGroup
+    IfcRelAssignsToProcess
+    IfcRelAssignsToProduct
+    IfcRelAssignsToProjectOrder
+    IfcRelAssignsToResource
+    IfcRelAssociates
+    IfcRelAssociatesAppliedValue
+    IfcRelAssociatesApproval
+    IfcRelAssociatesClassification
+    IfcRelAssociatesConstraint
+    IfcRelAssociatesDocument
+    IfcRelAssociatesLibrary
+    IfcRelAssociatesMaterial
+    IfcRelAssociatesProfileProperties
+    IfcRelationship
+    IfcRelaxation
+    IfcRelConnects
+    IfcRelConnectsElements
+    IfcRelConnectsPathElements
+    IfcRelConnectsPorts
+    IfcRelConnectsPortToElement
+    IfcRelConnectsStructuralActivity
+    IfcRelConnectsStructuralElement
+    IfcRelConnectsStructuralMember
+    IfcRelConnectsWithEccentricity
+    IfcRelConnectsWithRealizingElements
+    IfcRelContainedInSpatialStructure
+    IfcRelCoversBldgElements
+    IfcRelCoversSpaces
+    IfcRelDecomposes
+    IfcRelDefines
+    IfcRelDefinesByProperties
+    IfcRelDefinesByType
+    IfcRelFillsElement
+    IfcRelFlowControlElements
+    IfcRelInteractionRequirements
+    IfcRelNests
+    IfcRelOccupiesSpaces
+    IfcRelOverridesProperties
+    IfcRelProjectsElement
+    IfcRelReferencedInSpatialStructure
+    IfcRelSchedulesCostItems
+    IfcRelSequence
+    IfcRelServicesBuildings
+    IfcRelSpaceBoundary
+    IfcRelVoidsElement
+    IfcRepresentation
+    IfcRepresentationContext
+    IfcRepresentationItem
+    IfcRepresentationMap
+    IfcResource
+    IfcResourceConsumptionEnum
+    IfcRevolvedAreaSolid
+    IfcRibPlateDirectionEnum
+    IfcRibPlateProfileProperties
+    IfcRightCircularCone
+    IfcRightCircularCylinder
+    IfcRoleEnum
+    IfcRoof
+    IfcRoofTypeEnum
+    IfcRoot
+    IfcRoundedEdgeFeature
+    IfcRoundedRectangleProfileDef
+    IfcSanitaryTerminalType
+    IfcSanitaryTerminalTypeEnum
+    IfcScheduleTimeControl
+    IfcSectionedSpine
+    IfcSectionProperties
+    IfcSectionReinforcementProperties
+    IfcSectionTypeEnum
+    IfcSensorType
+    IfcSensorTypeEnum
+    IfcSequenceEnum
+    IfcServiceLife
+    IfcServiceLifeFactor
+    IfcServiceLifeFactorTypeEnum
+    IfcServiceLifeTypeEnum
+    IfcShapeAspect
+    IfcShapeModel
+    IfcShapeRepresentation
+    IfcShellBasedSurfaceModel
+    IfcSimpleProperty
+    IfcSIPrefix
+    IfcSite
+    IfcSIUnit
+    IfcSIUnitName
+    IfcSlab
+    IfcSlabType
+    IfcSlabTypeEnum
+    IfcSlippageConnectionCondition
+    IfcSolidModel
+    IfcSoundProperties
+    IfcSoundScaleEnum
+    IfcSoundValue
+    IfcSpace
+    IfcSpaceHeaterType
+    IfcSpaceHeaterTypeEnum
+    IfcSpaceProgram
+    IfcSpaceThermalLoadProperties
+    IfcSpaceType
+    IfcSpaceTypeEnum
+    IfcSpatialStructureElement
+    IfcSpatialStructureElementType
+    IfcSphere
+    IfcStackTerminalType
+    IfcStackTerminalTypeEnum
+    IfcStair
+    IfcStairFlight
+    IfcStairFlightType
+    IfcStairFlightTypeEnum
+    IfcStairTypeEnum
+    IfcStateEnum
+    IfcStructuralAction
+    IfcStructuralActivity
+    IfcStructuralAnalysisModel
+    IfcStructuralConnection
+    IfcStructuralConnectionCondition
+    IfcStructuralCurveConnection
+    IfcStructuralCurveMember
+    IfcStructuralCurveMemberVarying
+    IfcStructuralCurveTypeEnum
+    IfcStructuralItem
+    IfcStructuralLinearAction
+    IfcStructuralLinearActionVarying
+    IfcStructuralLoad
+    IfcStructuralLoadGroup
+    IfcStructuralLoadLinearForce
+    IfcStructuralLoadPlanarForce
+    IfcStructuralLoadSingleDisplacement
+    IfcStructuralLoadSingleDisplacementDistortion
+    IfcStructuralLoadSingleForce
+    IfcStructuralLoadSingleForceWarping
+    IfcStructuralLoadStatic
+    IfcStructuralLoadTemperature
+    IfcStructuralMember
+    IfcStructuralPlanarAction
+    IfcStructuralPlanarActionVarying
+    IfcStructuralPointAction
+    IfcStructuralPointConnection
+    IfcStructuralPointReaction
+    IfcStructuralProfileProperties
+    IfcStructuralReaction
+    IfcStructuralResultGroup
+    IfcStructuralSteelProfileProperties
+    IfcStructuralSurfaceConnection
+    IfcStructuralSurfaceMember
+    IfcStructuralSurfaceMemberVarying
+    IfcStructuralSurfaceTypeEnum
+    IfcStructuredDimensionCallout
+    IfcStyledItem
+    IfcStyledRepresentation
+    IfcStyleModel
+    IfcSubContractResource
+    IfcSubedge
+    IfcSurface
+    IfcSurfaceCurveSweptAreaSolid
+    IfcSurfaceOfLinearExtrusion
+    IfcSurfaceOfRevolution
+    IfcSurfaceSide
+    IfcSurfaceStyle
+    IfcSurfaceStyleLighting
+    IfcSurfaceStyleRefraction
+    IfcSurfaceStyleRendering
+    IfcSurfaceStyleShading
+    IfcSurfaceStyleWithTextures
+    IfcSurfaceTexture
+    IfcSurfaceTextureEnum
+    IfcSweptAreaSolid
+    IfcSweptDiskSolid
+    IfcSweptSurface
+    IfcSwitchingDeviceType
+    IfcSwitchingDeviceTypeEnum
+    IfcSymbolStyle
+    IfcSystem
+    IfcSystemFurnitureElementType
+    IfcTable
+    IfcTableRow
+    IfcTankType
+    IfcTankTypeEnum
+    IfcTask
+    IfcTelecomAddress
+    IfcTendon
+    IfcTendonAnchor
+    IfcTendonTypeEnum
+    IfcTerminatorSymbol
+    IfcTextLiteral
+    IfcTextLiteralWithExtent
+    IfcTextPath
+    IfcTextStyle
+    IfcTextStyleFontModel
+    IfcTextStyleForDefinedFont
+    IfcTextStyleTextModel
+    IfcTextStyleWithBoxCharacteristics
+    IfcTextureCoordinate
+    IfcTextureCoordinateGenerator
+    IfcTextureMap
+    IfcTextureVertex
+    IfcThermalLoadSourceEnum
+    IfcThermalLoadTypeEnum
+    IfcThermalMaterialProperties
+    IfcTimeSeries
+    IfcTimeSeriesDataTypeEnum
+    IfcTimeSeriesReferenceRelationship
+    IfcTimeSeriesSchedule
+    IfcTimeSeriesScheduleTypeEnum
+    IfcTimeSeriesValue
+    IfcTopologicalRepresentationItem
+    IfcTopologyRepresentation
+    IfcTransformerType
+    IfcTransformerTypeEnum
+    IfcTransitionCode
+    IfcTransportElement
+    IfcTransportElementType
+    IfcTransportElementTypeEnum
+    IfcTrapeziumProfileDef
+    IfcTrimmedCurve
+    IfcTrimmingPreference
+    IfcTShapeProfileDef
+    IfcTubeBundleType
+    IfcTubeBundleTypeEnum
+    IfcTwoDirectionRepeatFactor
+    IfcTypeObject
+    IfcTypeProduct
+    IfcUnitaryEquipmentType
+    IfcUnitaryEquipmentTypeEnum
+    IfcUnitAssignment
+    IfcUnitEnum
+    IfcUShapeProfileDef
+    IfcValveType
+    IfcValveTypeEnum
+    IfcVector
+    IfcVertex
+    IfcVertexBasedTextureMap
+    IfcVertexLoop
+    IfcVertexPoint
+    IfcVibrationIsolatorType
+    IfcVibrationIsolatorTypeEnum
+    IfcVirtualElement
+    IfcVirtualGridIntersection
+    IfcWall
+    IfcWallStandardCase
+    IfcWallType
+    IfcWallTypeEnum
+    IfcWasteTerminalType
+    IfcWasteTerminalTypeEnum
+    IfcWaterProperties
+    IfcWindow
+    IfcWindowLiningProperties
+    IfcWindowPanelOperationEnum
+    IfcWindowPanelPositionEnum
+    IfcWindowPanelProperties
+    IfcWindowStyle
+    IfcWindowStyleConstructionEnum
+    IfcWindowStyleOperationEnum
+    IfcWorkControl
+    IfcWorkControlTypeEnum
+    IfcWorkPlan
+    IfcWorkSchedule
+    IfcZone
+    IfcZShapeProfileDef
+"""
+
+import importlib
+
+__all__ = [
+    "Ifc2DCompositeCurve",
+    "IfcActionRequest",
+    "IfcActionSourceTypeEnum",
+    "IfcActionTypeEnum",
+    "IfcActor",
+    "IfcActorRole",
+    "IfcActuatorType",
+    "IfcActuatorTypeEnum",
+    "IfcAddress",
+    "IfcAddressTypeEnum",
+    "IfcAheadOrBehind",
+    "IfcAirTerminalBoxType",
+    "IfcAirTerminalBoxTypeEnum",
+    "IfcAirTerminalType",
+    "IfcAirTerminalTypeEnum",
+    "IfcAirToAirHeatRecoveryType",
+    "IfcAirToAirHeatRecoveryTypeEnum",
+    "IfcAlarmType",
+    "IfcAlarmTypeEnum",
+    "IfcAnalysisModelTypeEnum",
+    "IfcAnalysisTheoryTypeEnum",
+    "IfcAngularDimension",
+    "IfcAnnotation",
+    "IfcAnnotationCurveOccurrence",
+    "IfcAnnotationFillArea",
+    "IfcAnnotationFillAreaOccurrence",
+    "IfcAnnotationOccurrence",
+    "IfcAnnotationSurface",
+    "IfcAnnotationSurfaceOccurrence",
+    "IfcAnnotationSymbolOccurrence",
+    "IfcAnnotationTextOccurrence",
+    "IfcApplication",
+    "IfcAppliedValue",
+    "IfcAppliedValueRelationship",
+    "IfcApproval",
+    "IfcApprovalActorRelationship",
+    "IfcApprovalPropertyRelationship",
+    "IfcApprovalRelationship",
+    "IfcArbitraryClosedProfileDef",
+    "IfcArbitraryOpenProfileDef",
+    "IfcArbitraryProfileDefWithVoids",
+    "IfcArithmeticOperatorEnum",
+    "IfcAssemblyPlaceEnum",
+    "IfcAsset",
+    "IfcAsymmetricIShapeProfileDef",
+    "IfcAxis1Placement",
+    "IfcAxis2Placement2D",
+    "IfcAxis2Placement3D",
+    "IfcBeam",
+    "IfcBeamType",
+    "IfcBeamTypeEnum",
+    "IfcBenchmarkEnum",
+    "IfcBezierCurve",
+    "IfcBlobTexture",
+    "IfcBlock",
+    "IfcBoilerType",
+    "IfcBoilerTypeEnum",
+    "IfcBooleanClippingResult",
+    "IfcBooleanOperator",
+    "IfcBooleanResult",
+    "IfcBoundaryCondition",
+    "IfcBoundaryEdgeCondition",
+    "IfcBoundaryFaceCondition",
+    "IfcBoundaryNodeCondition",
+    "IfcBoundaryNodeConditionWarping",
+    "IfcBoundedCurve",
+    "IfcBoundedSurface",
+    "IfcBoundingBox",
+    "IfcBoxedHalfSpace",
+    "IfcBSplineCurve",
+    "IfcBSplineCurveForm",
+    "IfcBuilding",
+    "IfcBuildingElement",
+    "IfcBuildingElementComponent",
+    "IfcBuildingElementPart",
+    "IfcBuildingElementProxy",
+    "IfcBuildingElementProxyType",
+    "IfcBuildingElementProxyTypeEnum",
+    "IfcBuildingElementType",
+    "IfcBuildingStorey",
+    "IfcCableCarrierFittingType",
+    "IfcCableCarrierFittingTypeEnum",
+    "IfcCableCarrierSegmentType",
+    "IfcCableCarrierSegmentTypeEnum",
+    "IfcCableSegmentType",
+    "IfcCableSegmentTypeEnum",
+    "IfcCalendarDate",
+    "IfcCartesianPoint",
+    "IfcCartesianTransformationOperator",
+    "IfcCartesianTransformationOperator2D",
+    "IfcCartesianTransformationOperator2DnonUniform",
+    "IfcCartesianTransformationOperator3D",
+    "IfcCartesianTransformationOperator3DnonUniform",
+    "IfcCenterLineProfileDef",
+    "IfcChamferEdgeFeature",
+    "IfcChangeActionEnum",
+    "IfcChillerType",
+    "IfcChillerTypeEnum",
+    "IfcCircle",
+    "IfcCircleHollowProfileDef",
+    "IfcCircleProfileDef",
+    "IfcClassification",
+    "IfcClassificationItem",
+    "IfcClassificationItemRelationship",
+    "IfcClassificationNotation",
+    "IfcClassificationNotationFacet",
+    "IfcClassificationReference",
+    "IfcClosedShell",
+    "IfcCoilType",
+    "IfcCoilTypeEnum",
+    "IfcColourRgb",
+    "IfcColourSpecification",
+    "IfcColumn",
+    "IfcColumnType",
+    "IfcColumnTypeEnum",
+    "IfcComplexProperty",
+    "IfcCompositeCurve",
+    "IfcCompositeCurveSegment",
+    "IfcCompositeProfileDef",
+    "IfcCompressorType",
+    "IfcCompressorTypeEnum",
+    "IfcCondenserType",
+    "IfcCondenserTypeEnum",
+    "IfcCondition",
+    "IfcConditionCriterion",
+    "IfcConic",
+    "IfcConnectedFaceSet",
+    "IfcConnectionCurveGeometry",
+    "IfcConnectionGeometry",
+    "IfcConnectionPointEccentricity",
+    "IfcConnectionPointGeometry",
+    "IfcConnectionPortGeometry",
+    "IfcConnectionSurfaceGeometry",
+    "IfcConnectionTypeEnum",
+    "IfcConstraint",
+    "IfcConstraintAggregationRelationship",
+    "IfcConstraintClassificationRelationship",
+    "IfcConstraintEnum",
+    "IfcConstraintRelationship",
+    "IfcConstructionEquipmentResource",
+    "IfcConstructionMaterialResource",
+    "IfcConstructionProductResource",
+    "IfcConstructionResource",
+    "IfcContextDependentUnit",
+    "IfcControl",
+    "IfcControllerType",
+    "IfcControllerTypeEnum",
+    "IfcConversionBasedUnit",
+    "IfcCooledBeamType",
+    "IfcCooledBeamTypeEnum",
+    "IfcCoolingTowerType",
+    "IfcCoolingTowerTypeEnum",
+    "IfcCoordinatedUniversalTimeOffset",
+    "IfcCostItem",
+    "IfcCostSchedule",
+    "IfcCostScheduleTypeEnum",
+    "IfcCostValue",
+    "IfcCovering",
+    "IfcCoveringType",
+    "IfcCoveringTypeEnum",
+    "IfcCraneRailAShapeProfileDef",
+    "IfcCraneRailFShapeProfileDef",
+    "IfcCrewResource",
+    "IfcCsgPrimitive3D",
+    "IfcCsgSolid",
+    "IfcCShapeProfileDef",
+    "IfcCurrencyEnum",
+    "IfcCurrencyRelationship",
+    "IfcCurtainWall",
+    "IfcCurtainWallType",
+    "IfcCurtainWallTypeEnum",
+    "IfcCurve",
+    "IfcCurveBoundedPlane",
+    "IfcCurveStyle",
+    "IfcCurveStyleFont",
+    "IfcCurveStyleFontAndScaling",
+    "IfcCurveStyleFontPattern",
+    "IfcDamperType",
+    "IfcDamperTypeEnum",
+    "IfcDataOriginEnum",
+    "IfcDateAndTime",
+    "IfcDefinedSymbol",
+    "IfcDerivedProfileDef",
+    "IfcDerivedUnit",
+    "IfcDerivedUnitElement",
+    "IfcDerivedUnitEnum",
+    "IfcDiameterDimension",
+    "IfcDimensionalExponents",
+    "IfcDimensionCalloutRelationship",
+    "IfcDimensionCurve",
+    "IfcDimensionCurveDirectedCallout",
+    "IfcDimensionCurveTerminator",
+    "IfcDimensionExtentUsage",
+    "IfcDimensionPair",
+    "IfcDirection",
+    "IfcDirectionSenseEnum",
+    "IfcDiscreteAccessory",
+    "IfcDiscreteAccessoryType",
+    "IfcDistributionChamberElement",
+    "IfcDistributionChamberElementType",
+    "IfcDistributionChamberElementTypeEnum",
+    "IfcDistributionControlElement",
+    "IfcDistributionControlElementType",
+    "IfcDistributionElement",
+    "IfcDistributionElementType",
+    "IfcDistributionFlowElement",
+    "IfcDistributionFlowElementType",
+    "IfcDistributionPort",
+    "IfcDocumentConfidentialityEnum",
+    "IfcDocumentElectronicFormat",
+    "IfcDocumentInformation",
+    "IfcDocumentInformationRelationship",
+    "IfcDocumentReference",
+    "IfcDocumentStatusEnum",
+    "IfcDoor",
+    "IfcDoorLiningProperties",
+    "IfcDoorPanelOperationEnum",
+    "IfcDoorPanelPositionEnum",
+    "IfcDoorPanelProperties",
+    "IfcDoorStyle",
+    "IfcDoorStyleConstructionEnum",
+    "IfcDoorStyleOperationEnum",
+    "IfcDraughtingCallout",
+    "IfcDraughtingCalloutRelationship",
+    "IfcDraughtingPreDefinedColour",
+    "IfcDraughtingPreDefinedCurveFont",
+    "IfcDraughtingPreDefinedTextFont",
+    "IfcDuctFittingType",
+    "IfcDuctFittingTypeEnum",
+    "IfcDuctSegmentType",
+    "IfcDuctSegmentTypeEnum",
+    "IfcDuctSilencerType",
+    "IfcDuctSilencerTypeEnum",
+    "IfcEdge",
+    "IfcEdgeCurve",
+    "IfcEdgeFeature",
+    "IfcEdgeLoop",
+    "IfcElectricalBaseProperties",
+    "IfcElectricalCircuit",
+    "IfcElectricalElement",
+    "IfcElectricApplianceType",
+    "IfcElectricApplianceTypeEnum",
+    "IfcElectricCurrentEnum",
+    "IfcElectricDistributionPoint",
+    "IfcElectricDistributionPointFunctionEnum",
+    "IfcElectricFlowStorageDeviceType",
+    "IfcElectricFlowStorageDeviceTypeEnum",
+    "IfcElectricGeneratorType",
+    "IfcElectricGeneratorTypeEnum",
+    "IfcElectricHeaterType",
+    "IfcElectricHeaterTypeEnum",
+    "IfcElectricMotorType",
+    "IfcElectricMotorTypeEnum",
+    "IfcElectricTimeControlType",
+    "IfcElectricTimeControlTypeEnum",
+    "IfcElement",
+    "IfcElementarySurface",
+    "IfcElementAssembly",
+    "IfcElementAssemblyTypeEnum",
+    "IfcElementComponent",
+    "IfcElementComponentType",
+    "IfcElementCompositionEnum",
+    "IfcElementQuantity",
+    "IfcElementType",
+    "IfcEllipse",
+    "IfcEllipseProfileDef",
+    "IfcEnergyConversionDevice",
+    "IfcEnergyConversionDeviceType",
+    "IfcEnergyProperties",
+    "IfcEnergySequenceEnum",
+    "IfcEnvironmentalImpactCategoryEnum",
+    "IfcEnvironmentalImpactValue",
+    "IfcEquipmentElement",
+    "IfcEquipmentStandard",
+    "IfcEvaporativeCoolerType",
+    "IfcEvaporativeCoolerTypeEnum",
+    "IfcEvaporatorType",
+    "IfcEvaporatorTypeEnum",
+    "IfcExtendedMaterialProperties",
+    "IfcExternallyDefinedHatchStyle",
+    "IfcExternallyDefinedSurfaceStyle",
+    "IfcExternallyDefinedSymbol",
+    "IfcExternallyDefinedTextFont",
+    "IfcExternalReference",
+    "IfcExtrudedAreaSolid",
+    "IfcFace",
+    "IfcFaceBasedSurfaceModel",
+    "IfcFaceBound",
+    "IfcFaceOuterBound",
+    "IfcFaceSurface",
+    "IfcFacetedBrep",
+    "IfcFacetedBrepWithVoids",
+    "IfcFailureConnectionCondition",
+    "IfcFanType",
+    "IfcFanTypeEnum",
+    "IfcFastener",
+    "IfcFastenerType",
+    "IfcFeatureElement",
+    "IfcFeatureElementAddition",
+    "IfcFeatureElementSubtraction",
+    "IfcFillAreaStyle",
+    "IfcFillAreaStyleHatching",
+    "IfcFillAreaStyleTiles",
+    "IfcFillAreaStyleTileSymbolWithStyle",
+    "IfcFilterType",
+    "IfcFilterTypeEnum",
+    "IfcFireSuppressionTerminalType",
+    "IfcFireSuppressionTerminalTypeEnum",
+    "IfcFlowController",
+    "IfcFlowControllerType",
+    "IfcFlowDirectionEnum",
+    "IfcFlowFitting",
+    "IfcFlowFittingType",
+    "IfcFlowInstrumentType",
+    "IfcFlowInstrumentTypeEnum",
+    "IfcFlowMeterType",
+    "IfcFlowMeterTypeEnum",
+    "IfcFlowMovingDevice",
+    "IfcFlowMovingDeviceType",
+    "IfcFlowSegment",
+    "IfcFlowSegmentType",
+    "IfcFlowStorageDevice",
+    "IfcFlowStorageDeviceType",
+    "IfcFlowTerminal",
+    "IfcFlowTerminalType",
+    "IfcFlowTreatmentDevice",
+    "IfcFlowTreatmentDeviceType",
+    "IfcFluidFlowProperties",
+    "IfcFooting",
+    "IfcFootingTypeEnum",
+    "IfcFuelProperties",
+    "IfcFurnishingElement",
+    "IfcFurnishingElementType",
+    "IfcFurnitureStandard",
+    "IfcFurnitureType",
+    "IfcGasTerminalType",
+    "IfcGasTerminalTypeEnum",
+    "IfcGeneralMaterialProperties",
+    "IfcGeneralProfileProperties",
+    "IfcGeometricCurveSet",
+    "IfcGeometricProjectionEnum",
+    "IfcGeometricRepresentationContext",
+    "IfcGeometricRepresentationItem",
+    "IfcGeometricRepresentationSubContext",
+    "IfcGeometricSet",
+    "IfcGlobalOrLocalEnum",
+    "IfcGrid",
+    "IfcGridAxis",
+    "IfcGridPlacement",
+    "IfcGroup",
+    "IfcHalfSpaceSolid",
+    "IfcHeatExchangerType",
+    "IfcHeatExchangerTypeEnum",
+    "IfcHumidifierType",
+    "IfcHumidifierTypeEnum",
+    "IfcHygroscopicMaterialProperties",
+    "IfcImageTexture",
+    "IfcInternalOrExternalEnum",
+    "IfcInventory",
+    "IfcInventoryTypeEnum",
+    "IfcIrregularTimeSeries",
+    "IfcIrregularTimeSeriesValue",
+    "IfcIShapeProfileDef",
+    "IfcJunctionBoxType",
+    "IfcJunctionBoxTypeEnum",
+    "IfcLaborResource",
+    "IfcLampType",
+    "IfcLampTypeEnum",
+    "IfcLayerSetDirectionEnum",
+    "IfcLibraryInformation",
+    "IfcLibraryReference",
+    "IfcLightDistributionCurveEnum",
+    "IfcLightDistributionData",
+    "IfcLightEmissionSourceEnum",
+    "IfcLightFixtureType",
+    "IfcLightFixtureTypeEnum",
+    "IfcLightIntensityDistribution",
+    "IfcLightSource",
+    "IfcLightSourceAmbient",
+    "IfcLightSourceDirectional",
+    "IfcLightSourceGoniometric",
+    "IfcLightSourcePositional",
+    "IfcLightSourceSpot",
+    "IfcLine",
+    "IfcLinearDimension",
+    "IfcLoadGroupTypeEnum",
+    "IfcLocalPlacement",
+    "IfcLocalTime",
+    "IfcLogicalOperatorEnum",
+    "IfcLoop",
+    "IfcLShapeProfileDef",
+    "IfcManifoldSolidBrep",
+    "IfcMappedItem",
+    "IfcMaterial",
+    "IfcMaterialClassificationRelationship",
+    "IfcMaterialDefinitionRepresentation",
+    "IfcMaterialLayer",
+    "IfcMaterialLayerSet",
+    "IfcMaterialLayerSetUsage",
+    "IfcMaterialList",
+    "IfcMaterialProperties",
+    "IfcMeasureWithUnit",
+    "IfcMechanicalConcreteMaterialProperties",
+    "IfcMechanicalFastener",
+    "IfcMechanicalFastenerType",
+    "IfcMechanicalMaterialProperties",
+    "IfcMechanicalSteelMaterialProperties",
+    "IfcMember",
+    "IfcMemberType",
+    "IfcMemberTypeEnum",
+    "IfcMetric",
+    "IfcMonetaryUnit",
+    "IfcMotorConnectionType",
+    "IfcMotorConnectionTypeEnum",
+    "IfcMove",
+    "IfcNamedUnit",
+    "IfcNullStyle",
+    "IfcObject",
+    "IfcObjectDefinition",
+    "IfcObjective",
+    "IfcObjectiveEnum",
+    "IfcObjectPlacement",
+    "IfcObjectTypeEnum",
+    "IfcOccupant",
+    "IfcOccupantTypeEnum",
+    "IfcOffsetCurve2D",
+    "IfcOffsetCurve3D",
+    "IfcOneDirectionRepeatFactor",
+    "IfcOpeningElement",
+    "IfcOpenShell",
+    "IfcOpticalMaterialProperties",
+    "IfcOrderAction",
+    "IfcOrganization",
+    "IfcOrganizationRelationship",
+    "IfcOrientedEdge",
+    "IfcOutletType",
+    "IfcOutletTypeEnum",
+    "IfcOwnerHistory",
+    "IfcParameterizedProfileDef",
+    "IfcPath",
+    "IfcPerformanceHistory",
+    "IfcPermeableCoveringOperationEnum",
+    "IfcPermeableCoveringProperties",
+    "IfcPermit",
+    "IfcPerson",
+    "IfcPersonAndOrganization",
+    "IfcPhysicalComplexQuantity",
+    "IfcPhysicalOrVirtualEnum",
+    "IfcPhysicalQuantity",
+    "IfcPhysicalSimpleQuantity",
+    "IfcPile",
+    "IfcPileConstructionEnum",
+    "IfcPileTypeEnum",
+    "IfcPipeFittingType",
+    "IfcPipeFittingTypeEnum",
+    "IfcPipeSegmentType",
+    "IfcPipeSegmentTypeEnum",
+    "IfcPixelTexture",
+    "IfcPlacement",
+    "IfcPlanarBox",
+    "IfcPlanarExtent",
+    "IfcPlane",
+    "IfcPlate",
+    "IfcPlateType",
+    "IfcPlateTypeEnum",
+    "IfcPoint",
+    "IfcPointOnCurve",
+    "IfcPointOnSurface",
+    "IfcPolygonalBoundedHalfSpace",
+    "IfcPolyline",
+    "IfcPolyLoop",
+    "IfcPort",
+    "IfcPostalAddress",
+    "IfcPreDefinedColour",
+    "IfcPreDefinedCurveFont",
+    "IfcPreDefinedDimensionSymbol",
+    "IfcPreDefinedItem",
+    "IfcPreDefinedPointMarkerSymbol",
+    "IfcPreDefinedSymbol",
+    "IfcPreDefinedTerminatorSymbol",
+    "IfcPreDefinedTextFont",
+    "IfcPresentationLayerAssignment",
+    "IfcPresentationLayerWithStyle",
+    "IfcPresentationStyle",
+    "IfcPresentationStyleAssignment",
+    "IfcProcedure",
+    "IfcProcedureTypeEnum",
+    "IfcProcess",
+    "IfcProduct",
+    "IfcProductDefinitionShape",
+    "IfcProductRepresentation",
+    "IfcProductsOfCombustionProperties",
+    "IfcProfileDef",
+    "IfcProfileProperties",
+    "IfcProfileTypeEnum",
+    "IfcProject",
+    "IfcProjectedOrTrueLengthEnum",
+    "IfcProjectionCurve",
+    "IfcProjectionElement",
+    "IfcProjectOrder",
+    "IfcProjectOrderRecord",
+    "IfcProjectOrderRecordTypeEnum",
+    "IfcProjectOrderTypeEnum",
+    "IfcProperty",
+    "IfcPropertyBoundedValue",
+    "IfcPropertyConstraintRelationship",
+    "IfcPropertyDefinition",
+    "IfcPropertyDependencyRelationship",
+    "IfcPropertyEnumeratedValue",
+    "IfcPropertyEnumeration",
+    "IfcPropertyListValue",
+    "IfcPropertyReferenceValue",
+    "IfcPropertySet",
+    "IfcPropertySetDefinition",
+    "IfcPropertySingleValue",
+    "IfcPropertySourceEnum",
+    "IfcPropertyTableValue",
+    "IfcProtectiveDeviceType",
+    "IfcProtectiveDeviceTypeEnum",
+    "IfcProxy",
+    "IfcPumpType",
+    "IfcPumpTypeEnum",
+    "IfcQuantityArea",
+    "IfcQuantityCount",
+    "IfcQuantityLength",
+    "IfcQuantityTime",
+    "IfcQuantityVolume",
+    "IfcQuantityWeight",
+    "IfcRadiusDimension",
+    "IfcRailing",
+    "IfcRailingType",
+    "IfcRailingTypeEnum",
+    "IfcRamp",
+    "IfcRampFlight",
+    "IfcRampFlightType",
+    "IfcRampFlightTypeEnum",
+    "IfcRampTypeEnum",
+    "IfcRationalBezierCurve",
+    "IfcRectangleHollowProfileDef",
+    "IfcRectangleProfileDef",
+    "IfcRectangularPyramid",
+    "IfcRectangularTrimmedSurface",
+    "IfcReferencesValueDocument",
+    "IfcReflectanceMethodEnum",
+    "IfcRegularTimeSeries",
+    "IfcReinforcementBarProperties",
+    "IfcReinforcementDefinitionProperties",
+    "IfcReinforcingBar",
+    "IfcReinforcingBarRoleEnum",
+    "IfcReinforcingBarSurfaceEnum",
+    "IfcReinforcingElement",
+    "IfcReinforcingMesh",
+    "IfcRelAggregates",
+    "IfcRelAssigns",
+    "IfcRelAssignsTasks",
+    "IfcRelAssignsToActor",
+    "IfcRelAssignsToControl",
+    "IfcRelAssignsToGroup",
+    "IfcRelAssignsToProcess",
+    "IfcRelAssignsToProduct",
+    "IfcRelAssignsToProjectOrder",
+    "IfcRelAssignsToResource",
+    "IfcRelAssociates",
+    "IfcRelAssociatesAppliedValue",
+    "IfcRelAssociatesApproval",
+    "IfcRelAssociatesClassification",
+    "IfcRelAssociatesConstraint",
+    "IfcRelAssociatesDocument",
+    "IfcRelAssociatesLibrary",
+    "IfcRelAssociatesMaterial",
+    "IfcRelAssociatesProfileProperties",
+    "IfcRelationship",
+    "IfcRelaxation",
+    "IfcRelConnects",
+    "IfcRelConnectsElements",
+    "IfcRelConnectsPathElements",
+    "IfcRelConnectsPorts",
+    "IfcRelConnectsPortToElement",
+    "IfcRelConnectsStructuralActivity",
+    "IfcRelConnectsStructuralElement",
+    "IfcRelConnectsStructuralMember",
+    "IfcRelConnectsWithEccentricity",
+    "IfcRelConnectsWithRealizingElements",
+    "IfcRelContainedInSpatialStructure",
+    "IfcRelCoversBldgElements",
+    "IfcRelCoversSpaces",
+    "IfcRelDecomposes",
+    "IfcRelDefines",
+    "IfcRelDefinesByProperties",
+    "IfcRelDefinesByType",
+    "IfcRelFillsElement",
+    "IfcRelFlowControlElements",
+    "IfcRelInteractionRequirements",
+    "IfcRelNests",
+    "IfcRelOccupiesSpaces",
+    "IfcRelOverridesProperties",
+    "IfcRelProjectsElement",
+    "IfcRelReferencedInSpatialStructure",
+    "IfcRelSchedulesCostItems",
+    "IfcRelSequence",
+    "IfcRelServicesBuildings",
+    "IfcRelSpaceBoundary",
+    "IfcRelVoidsElement",
+    "IfcRepresentation",
+    "IfcRepresentationContext",
+    "IfcRepresentationItem",
+    "IfcRepresentationMap",
+    "IfcResource",
+    "IfcResourceConsumptionEnum",
+    "IfcRevolvedAreaSolid",
+    "IfcRibPlateDirectionEnum",
+    "IfcRibPlateProfileProperties",
+    "IfcRightCircularCone",
+    "IfcRightCircularCylinder",
+    "IfcRoleEnum",
+    "IfcRoof",
+    "IfcRoofTypeEnum",
+    "IfcRoot",
+    "IfcRoundedEdgeFeature",
+    "IfcRoundedRectangleProfileDef",
+    "IfcSanitaryTerminalType",
+    "IfcSanitaryTerminalTypeEnum",
+    "IfcScheduleTimeControl",
+    "IfcSectionedSpine",
+    "IfcSectionProperties",
+    "IfcSectionReinforcementProperties",
+    "IfcSectionTypeEnum",
+    "IfcSensorType",
+    "IfcSensorTypeEnum",
+    "IfcSequenceEnum",
+    "IfcServiceLife",
+    "IfcServiceLifeFactor",
+    "IfcServiceLifeFactorTypeEnum",
+    "IfcServiceLifeTypeEnum",
+    "IfcShapeAspect",
+    "IfcShapeModel",
+    "IfcShapeRepresentation",
+    "IfcShellBasedSurfaceModel",
+    "IfcSimpleProperty",
+    "IfcSIPrefix",
+    "IfcSite",
+    "IfcSIUnit",
+    "IfcSIUnitName",
+    "IfcSlab",
+    "IfcSlabType",
+    "IfcSlabTypeEnum",
+    "IfcSlippageConnectionCondition",
+    "IfcSolidModel",
+    "IfcSoundProperties",
+    "IfcSoundScaleEnum",
+    "IfcSoundValue",
+    "IfcSpace",
+    "IfcSpaceHeaterType",
+    "IfcSpaceHeaterTypeEnum",
+    "IfcSpaceProgram",
+    "IfcSpaceThermalLoadProperties",
+    "IfcSpaceType",
+    "IfcSpaceTypeEnum",
+    "IfcSpatialStructureElement",
+    "IfcSpatialStructureElementType",
+    "IfcSphere",
+    "IfcStackTerminalType",
+    "IfcStackTerminalTypeEnum",
+    "IfcStair",
+    "IfcStairFlight",
+    "IfcStairFlightType",
+    "IfcStairFlightTypeEnum",
+    "IfcStairTypeEnum",
+    "IfcStateEnum",
+    "IfcStructuralAction",
+    "IfcStructuralActivity",
+    "IfcStructuralAnalysisModel",
+    "IfcStructuralConnection",
+    "IfcStructuralConnectionCondition",
+    "IfcStructuralCurveConnection",
+    "IfcStructuralCurveMember",
+    "IfcStructuralCurveMemberVarying",
+    "IfcStructuralCurveTypeEnum",
+    "IfcStructuralItem",
+    "IfcStructuralLinearAction",
+    "IfcStructuralLinearActionVarying",
+    "IfcStructuralLoad",
+    "IfcStructuralLoadGroup",
+    "IfcStructuralLoadLinearForce",
+    "IfcStructuralLoadPlanarForce",
+    "IfcStructuralLoadSingleDisplacement",
+    "IfcStructuralLoadSingleDisplacementDistortion",
+    "IfcStructuralLoadSingleForce",
+    "IfcStructuralLoadSingleForceWarping",
+    "IfcStructuralLoadStatic",
+    "IfcStructuralLoadTemperature",
+    "IfcStructuralMember",
+    "IfcStructuralPlanarAction",
+    "IfcStructuralPlanarActionVarying",
+    "IfcStructuralPointAction",
+    "IfcStructuralPointConnection",
+    "IfcStructuralPointReaction",
+    "IfcStructuralProfileProperties",
+    "IfcStructuralReaction",
+    "IfcStructuralResultGroup",
+    "IfcStructuralSteelProfileProperties",
+    "IfcStructuralSurfaceConnection",
+    "IfcStructuralSurfaceMember",
+    "IfcStructuralSurfaceMemberVarying",
+    "IfcStructuralSurfaceTypeEnum",
+    "IfcStructuredDimensionCallout",
+    "IfcStyledItem",
+    "IfcStyledRepresentation",
+    "IfcStyleModel",
+    "IfcSubContractResource",
+    "IfcSubedge",
+    "IfcSurface",
+    "IfcSurfaceCurveSweptAreaSolid",
+    "IfcSurfaceOfLinearExtrusion",
+    "IfcSurfaceOfRevolution",
+    "IfcSurfaceSide",
+    "IfcSurfaceStyle",
+    "IfcSurfaceStyleLighting",
+    "IfcSurfaceStyleRefraction",
+    "IfcSurfaceStyleRendering",
+    "IfcSurfaceStyleShading",
+    "IfcSurfaceStyleWithTextures",
+    "IfcSurfaceTexture",
+    "IfcSurfaceTextureEnum",
+    "IfcSweptAreaSolid",
+    "IfcSweptDiskSolid",
+    "IfcSweptSurface",
+    "IfcSwitchingDeviceType",
+    "IfcSwitchingDeviceTypeEnum",
+    "IfcSymbolStyle",
+    "IfcSystem",
+    "IfcSystemFurnitureElementType",
+    "IfcTable",
+    "IfcTableRow",
+    "IfcTankType",
+    "IfcTankTypeEnum",
+    "IfcTask",
+    "IfcTelecomAddress",
+    "IfcTendon",
+    "IfcTendonAnchor",
+    "IfcTendonTypeEnum",
+    "IfcTerminatorSymbol",
+    "IfcTextLiteral",
+    "IfcTextLiteralWithExtent",
+    "IfcTextPath",
+    "IfcTextStyle",
+    "IfcTextStyleFontModel",
+    "IfcTextStyleForDefinedFont",
+    "IfcTextStyleTextModel",
+    "IfcTextStyleWithBoxCharacteristics",
+    "IfcTextureCoordinate",
+    "IfcTextureCoordinateGenerator",
+    "IfcTextureMap",
+    "IfcTextureVertex",
+    "IfcThermalLoadSourceEnum",
+    "IfcThermalLoadTypeEnum",
+    "IfcThermalMaterialProperties",
+    "IfcTimeSeries",
+    "IfcTimeSeriesDataTypeEnum",
+    "IfcTimeSeriesReferenceRelationship",
+    "IfcTimeSeriesSchedule",
+    "IfcTimeSeriesScheduleTypeEnum",
+    "IfcTimeSeriesValue",
+    "IfcTopologicalRepresentationItem",
+    "IfcTopologyRepresentation",
+    "IfcTransformerType",
+    "IfcTransformerTypeEnum",
+    "IfcTransitionCode",
+    "IfcTransportElement",
+    "IfcTransportElementType",
+    "IfcTransportElementTypeEnum",
+    "IfcTrapeziumProfileDef",
+    "IfcTrimmedCurve",
+    "IfcTrimmingPreference",
+    "IfcTShapeProfileDef",
+    "IfcTubeBundleType",
+    "IfcTubeBundleTypeEnum",
+    "IfcTwoDirectionRepeatFactor",
+    "IfcTypeObject",
+    "IfcTypeProduct",
+    "IfcUnitaryEquipmentType",
+    "IfcUnitaryEquipmentTypeEnum",
+    "IfcUnitAssignment",
+    "IfcUnitEnum",
+    "IfcUShapeProfileDef",
+    "IfcValveType",
+    "IfcValveTypeEnum",
+    "IfcVector",
+    "IfcVertex",
+    "IfcVertexBasedTextureMap",
+    "IfcVertexLoop",
+    "IfcVertexPoint",
+    "IfcVibrationIsolatorType",
+    "IfcVibrationIsolatorTypeEnum",
+    "IfcVirtualElement",
+    "IfcVirtualGridIntersection",
+    "IfcWall",
+    "IfcWallStandardCase",
+    "IfcWallType",
+    "IfcWallTypeEnum",
+    "IfcWasteTerminalType",
+    "IfcWasteTerminalTypeEnum",
+    "IfcWaterProperties",
+    "IfcWindow",
+    "IfcWindowLiningProperties",
+    "IfcWindowPanelOperationEnum",
+    "IfcWindowPanelPositionEnum",
+    "IfcWindowPanelProperties",
+    "IfcWindowStyle",
+    "IfcWindowStyleConstructionEnum",
+    "IfcWindowStyleOperationEnum",
+    "IfcWorkControl",
+    "IfcWorkControlTypeEnum",
+    "IfcWorkPlan",
+    "IfcWorkSchedule",
+    "IfcZone",
+    "IfcZShapeProfileDef",
+]
+
+_NAMES = set(__all__)
+
+
+def __getattr__(name):
+    if name not in _NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cls = getattr(importlib.import_module(f".{name.lower()}", __name__), name)
+    globals()[name] = cls
+    return cls
+
+
+def __dir__():
+    return list(__all__)
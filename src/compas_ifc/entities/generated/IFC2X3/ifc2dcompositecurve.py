@@ -0,0 +1,5 @@
+from .ifccompositecurve import IfcCompositeCurve
+
+
+class Ifc2DCompositeCurve(IfcCompositeCurve):
+    """Wrapper class for Ifc2DCompositeCurve."""
@@ -0,0 +1,14 @@
+from .ifccontrol import IfcControl
+
+
+class IfcActionRequest(IfcControl):
+    """Wrapper class for IfcActionRequest."""
+
+    @property
+    def RequestID(self)-> str:
+        """<attribute RequestID: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("RequestID")
+
+    @RequestID.setter
+    def RequestID(self, value: str):
+        return self._set_attribute("RequestID", value)
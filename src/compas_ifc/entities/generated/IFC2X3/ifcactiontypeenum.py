@@ -0,0 +1,2 @@
+class IfcActionTypeEnum(str):
+    items = ['PERMANENT_G', 'VARIABLE_Q', 'EXTRAORDINARY_A', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,25 @@
+from .ifcobject import IfcObject
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcorganization import IfcOrganization
+    from .ifcperson import IfcPerson
+    from .ifcpersonandorganization import IfcPersonAndOrganization
+    from .ifcrelassignstoactor import IfcRelAssignsToActor
+
+class IfcActor(IfcObject):
+    """Wrapper class for IfcActor."""
+
+    @property
+    def TheActor(self)-> Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]:
+        """<attribute TheActor: <select IfcActorSelect: (<entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization>)>>"""
+        return self._get_attribute("TheActor")
+
+    @TheActor.setter
+    def TheActor(self, value: Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]):
+        return self._set_attribute("TheActor", value)
+
+    def IsActingUpon(self)-> list["IfcRelAssignsToActor"]:
+        """<inverse IsActingUpon: set [0:?] of <entity IfcRelAssignsToActor> for <attribute RelatingActor: <entity IfcActor>>>"""
+        return self._get_inverse_attribute("IsActingUpon")
@@ -0,0 +1,17 @@
+from .ifcdistributioncontrolelementtype import IfcDistributionControlElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcactuatortypeenum import IfcActuatorTypeEnum
+
+class IfcActuatorType(IfcDistributionControlElementType):
+    """Wrapper class for IfcActuatorType."""
+
+    @property
+    def PredefinedType(self)-> "IfcActuatorTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcActuatorTypeEnum: (ELECTRICACTUATOR, HANDOPERATEDACTUATOR, HYDRAULICACTUATOR, PNEUMATICACTUATOR, THERMOSTATICACTUATOR, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcActuatorTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
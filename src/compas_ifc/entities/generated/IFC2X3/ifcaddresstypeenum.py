@@ -0,0 +1,2 @@
+class IfcAddressTypeEnum(str):
+    items = ['OFFICE', 'SITE', 'HOME', 'DISTRIBUTIONPOINT', 'USERDEFINED']
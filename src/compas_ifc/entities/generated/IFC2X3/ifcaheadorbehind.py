@@ -0,0 +1,2 @@
+class IfcAheadOrBehind(str):
+    items = ['AHEAD', 'BEHIND']
@@ -0,0 +1,2 @@
+class IfcAirTerminalTypeEnum(str):
+    items = ['GRILLE', 'REGISTER', 'DIFFUSER', 'EYEBALL', 'IRIS', 'LINEARGRILLE', 'LINEARDIFFUSER', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevicetype import IfcEnergyConversionDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcairtoairheatrecoverytypeenum import IfcAirToAirHeatRecoveryTypeEnum
+
+class IfcAirToAirHeatRecoveryType(IfcEnergyConversionDeviceType):
+    """Wrapper class for IfcAirToAirHeatRecoveryType."""
+
+    @property
+    def PredefinedType(self)-> "IfcAirToAirHeatRecoveryTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcAirToAirHeatRecoveryTypeEnum: (FIXEDPLATECOUNTERFLOWEXCHANGER, FIXEDPLATECROSSFLOWEXCHANGER, FIXEDPLATEPARALLELFLOWEXCHANGER, ROTARYWHEEL, RUNAROUNDCOILLOOP, HEATPIPE, TWINTOWERENTHALPYRECOVERYLOOPS, THERMOSIPHONSEALEDTUBEHEATEXCHANGERS, THERMOSIPHONCOILTYPEHEATEXCHANGERS, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcAirToAirHeatRecoveryTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcAlarmTypeEnum(str):
+    items = ['BELL', 'BREAKGLASSBUTTON', 'LIGHT', 'MANUALPULLBOX', 'SIREN', 'WHISTLE', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,2 @@
+class IfcAnalysisTheoryTypeEnum(str):
+    items = ['FIRST_ORDER_THEORY', 'SECOND_ORDER_THEORY', 'THIRD_ORDER_THEORY', 'FULL_NONLINEAR_THEORY', 'USERDEFINED', 'NOTDEFINED']
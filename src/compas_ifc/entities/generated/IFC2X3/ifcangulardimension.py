@@ -0,0 +1,5 @@
+from .ifcdimensioncurvedirectedcallout import IfcDimensionCurveDirectedCallout
+
+
+class IfcAngularDimension(IfcDimensionCurveDirectedCallout):
+    """Wrapper class for IfcAngularDimension."""
@@ -0,0 +1,5 @@
+from .ifcannotationoccurrence import IfcAnnotationOccurrence
+
+
+class IfcAnnotationCurveOccurrence(IfcAnnotationOccurrence):
+    """Wrapper class for IfcAnnotationCurveOccurrence."""
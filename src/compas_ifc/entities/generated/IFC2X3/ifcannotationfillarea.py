@@ -0,0 +1,26 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccurve import IfcCurve
+
+class IfcAnnotationFillArea(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcAnnotationFillArea."""
+
+    @property
+    def OuterBoundary(self)-> "IfcCurve":
+        """<attribute OuterBoundary: <entity IfcCurve>>"""
+        return self._get_attribute("OuterBoundary")
+
+    @OuterBoundary.setter
+    def OuterBoundary(self, value: "IfcCurve"):
+        return self._set_attribute("OuterBoundary", value)
+
+    @property
+    def InnerBoundaries(self)-> list["IfcCurve"]:
+        """<attribute InnerBoundaries?: <set [1:?] of <entity IfcCurve>>>"""
+        return self._get_attribute("InnerBoundaries")
+
+    @InnerBoundaries.setter
+    def InnerBoundaries(self, value: list["IfcCurve"]):
+        return self._set_attribute("InnerBoundaries", value)
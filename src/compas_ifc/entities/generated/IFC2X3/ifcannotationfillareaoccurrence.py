@@ -0,0 +1,27 @@
+from .ifcannotationoccurrence import IfcAnnotationOccurrence
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcglobalorlocalenum import IfcGlobalOrLocalEnum
+    from .ifcpoint import IfcPoint
+
+class IfcAnnotationFillAreaOccurrence(IfcAnnotationOccurrence):
+    """Wrapper class for IfcAnnotationFillAreaOccurrence."""
+
+    @property
+    def FillStyleTarget(self)-> "IfcPoint":
+        """<attribute FillStyleTarget?: <entity IfcPoint>>"""
+        return self._get_attribute("FillStyleTarget")
+
+    @FillStyleTarget.setter
+    def FillStyleTarget(self, value: "IfcPoint"):
+        return self._set_attribute("FillStyleTarget", value)
+
+    @property
+    def GlobalOrLocal(self)-> "IfcGlobalOrLocalEnum":
+        """<attribute GlobalOrLocal?: <enumeration IfcGlobalOrLocalEnum: (GLOBAL_COORDS, LOCAL_COORDS)>>"""
+        return self._get_attribute("GlobalOrLocal")
+
+    @GlobalOrLocal.setter
+    def GlobalOrLocal(self, value: "IfcGlobalOrLocalEnum"):
+        return self._set_attribute("GlobalOrLocal", value)
@@ -0,0 +1,5 @@
+from .ifcstyleditem import IfcStyledItem
+
+
+class IfcAnnotationOccurrence(IfcStyledItem):
+    """Wrapper class for IfcAnnotationOccurrence."""
@@ -0,0 +1,27 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+    from .ifctexturecoordinate import IfcTextureCoordinate
+
+class IfcAnnotationSurface(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcAnnotationSurface."""
+
+    @property
+    def Item(self)-> "IfcGeometricRepresentationItem":
+        """<attribute Item: <entity IfcGeometricRepresentationItem>>"""
+        return self._get_attribute("Item")
+
+    @Item.setter
+    def Item(self, value: "IfcGeometricRepresentationItem"):
+        return self._set_attribute("Item", value)
+
+    @property
+    def TextureCoordinates(self)-> "IfcTextureCoordinate":
+        """<attribute TextureCoordinates?: <entity IfcTextureCoordinate>>"""
+        return self._get_attribute("TextureCoordinates")
+
+    @TextureCoordinates.setter
+    def TextureCoordinates(self, value: "IfcTextureCoordinate"):
+        return self._set_attribute("TextureCoordinates", value)
@@ -0,0 +1,5 @@
+from .ifcannotationoccurrence import IfcAnnotationOccurrence
+
+
+class IfcAnnotationSurfaceOccurrence(IfcAnnotationOccurrence):
+    """Wrapper class for IfcAnnotationSurfaceOccurrence."""
@@ -0,0 +1,5 @@
+from .ifcannotationoccurrence import IfcAnnotationOccurrence
+
+
+class IfcAnnotationSymbolOccurrence(IfcAnnotationOccurrence):
+    """Wrapper class for IfcAnnotationSymbolOccurrence."""
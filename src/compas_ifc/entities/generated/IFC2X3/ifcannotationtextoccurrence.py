@@ -0,0 +1,5 @@
+from .ifcannotationoccurrence import IfcAnnotationOccurrence
+
+
+class IfcAnnotationTextOccurrence(IfcAnnotationOccurrence):
+    """Wrapper class for IfcAnnotationTextOccurrence."""
@@ -0,0 +1,80 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcappliedvaluerelationship import IfcAppliedValueRelationship
+    from .ifccalendardate import IfcCalendarDate
+    from .ifcdateandtime import IfcDateAndTime
+    from .ifclocaltime import IfcLocalTime
+    from .ifcmeasurewithunit import IfcMeasureWithUnit
+    from .ifcreferencesvaluedocument import IfcReferencesValueDocument
+
+class IfcAppliedValue(Base):
+    """Wrapper class for IfcAppliedValue."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def AppliedValue(self)-> Union[float, "IfcMeasureWithUnit"]:
+        """<attribute AppliedValue?: <select IfcAppliedValueSelect: (<entity IfcMeasureWithUnit> | <type IfcMonetaryMeasure: <real>> | <type IfcRatioMeasure: <real>>)>>"""
+        return self._get_attribute("AppliedValue")
+
+    @AppliedValue.setter
+    def AppliedValue(self, value: Union[float, "IfcMeasureWithUnit"]):
+        return self._set_attribute("AppliedValue", value)
+
+    @property
+    def UnitBasis(self)-> "IfcMeasureWithUnit":
+        """<attribute UnitBasis?: <entity IfcMeasureWithUnit>>"""
+        return self._get_attribute("UnitBasis")
+
+    @UnitBasis.setter
+    def UnitBasis(self, value: "IfcMeasureWithUnit"):
+        return self._set_attribute("UnitBasis", value)
+
+    @property
+    def ApplicableDate(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute ApplicableDate?: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("ApplicableDate")
+
+    @ApplicableDate.setter
+    def ApplicableDate(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("ApplicableDate", value)
+
+    @property
+    def FixedUntilDate(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute FixedUntilDate?: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("FixedUntilDate")
+
+    @FixedUntilDate.setter
+    def FixedUntilDate(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("FixedUntilDate", value)
+
+    def ValuesReferenced(self)-> list["IfcReferencesValueDocument"]:
+        """<inverse ValuesReferenced: set [0:?] of <entity IfcReferencesValueDocument> for <attribute ReferencingValues: <set [1:?] of <entity IfcAppliedValue>>>>"""
+        return self._get_inverse_attribute("ValuesReferenced")
+
+    def ValueOfComponents(self)-> list["IfcAppliedValueRelationship"]:
+        """<inverse ValueOfComponents: set [0:?] of <entity IfcAppliedValueRelationship> for <attribute ComponentOfTotal: <entity IfcAppliedValue>>>"""
+        return self._get_inverse_attribute("ValueOfComponents")
+
+    def IsComponentIn(self)-> list["IfcAppliedValueRelationship"]:
+        """<inverse IsComponentIn: set [0:?] of <entity IfcAppliedValueRelationship> for <attribute Components: <set [1:?] of <entity IfcAppliedValue>>>>"""
+        return self._get_inverse_attribute("IsComponentIn")
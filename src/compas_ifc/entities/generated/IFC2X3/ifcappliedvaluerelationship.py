@@ -0,0 +1,54 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcappliedvalue import IfcAppliedValue
+    from .ifcarithmeticoperatorenum import IfcArithmeticOperatorEnum
+
+class IfcAppliedValueRelationship(Base):
+    """Wrapper class for IfcAppliedValueRelationship."""
+
+    @property
+    def ComponentOfTotal(self)-> "IfcAppliedValue":
+        """<attribute ComponentOfTotal: <entity IfcAppliedValue>>"""
+        return self._get_attribute("ComponentOfTotal")
+
+    @ComponentOfTotal.setter
+    def ComponentOfTotal(self, value: "IfcAppliedValue"):
+        return self._set_attribute("ComponentOfTotal", value)
+
+    @property
+    def Components(self)-> list["IfcAppliedValue"]:
+        """<attribute Components: <set [1:?] of <entity IfcAppliedValue>>>"""
+        return self._get_attribute("Components")
+
+    @Components.setter
+    def Components(self, value: list["IfcAppliedValue"]):
+        return self._set_attribute("Components", value)
+
+    @property
+    def ArithmeticOperator(self)-> "IfcArithmeticOperatorEnum":
+        """<attribute ArithmeticOperator: <enumeration IfcArithmeticOperatorEnum: (ADD, DIVIDE, MULTIPLY, SUBTRACT)>>"""
+        return self._get_attribute("ArithmeticOperator")
+
+    @ArithmeticOperator.setter
+    def ArithmeticOperator(self, value: "IfcArithmeticOperatorEnum"):
+        return self._set_attribute("ArithmeticOperator", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
@@ -0,0 +1,88 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcapprovalactorrelationship import IfcApprovalActorRelationship
+    from .ifcapprovalrelationship import IfcApprovalRelationship
+    from .ifccalendardate import IfcCalendarDate
+    from .ifcdateandtime import IfcDateAndTime
+    from .ifclocaltime import IfcLocalTime
+
+class IfcApproval(Base):
+    """Wrapper class for IfcApproval."""
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def ApprovalDateTime(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute ApprovalDateTime: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("ApprovalDateTime")
+
+    @ApprovalDateTime.setter
+    def ApprovalDateTime(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("ApprovalDateTime", value)
+
+    @property
+    def ApprovalStatus(self)-> str:
+        """<attribute ApprovalStatus?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ApprovalStatus")
+
+    @ApprovalStatus.setter
+    def ApprovalStatus(self, value: str):
+        return self._set_attribute("ApprovalStatus", value)
+
+    @property
+    def ApprovalLevel(self)-> str:
+        """<attribute ApprovalLevel?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ApprovalLevel")
+
+    @ApprovalLevel.setter
+    def ApprovalLevel(self, value: str):
+        return self._set_attribute("ApprovalLevel", value)
+
+    @property
+    def ApprovalQualifier(self)-> str:
+        """<attribute ApprovalQualifier?: <type IfcText: <string>>>"""
+        return self._get_attribute("ApprovalQualifier")
+
+    @ApprovalQualifier.setter
+    def ApprovalQualifier(self, value: str):
+        return self._set_attribute("ApprovalQualifier", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Identifier(self)-> str:
+        """<attribute Identifier: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Identifier")
+
+    @Identifier.setter
+    def Identifier(self, value: str):
+        return self._set_attribute("Identifier", value)
+
+    def Actors(self)-> list["IfcApprovalActorRelationship"]:
+        """<inverse Actors: set [0:?] of <entity IfcApprovalActorRelationship> for <attribute Approval: <entity IfcApproval>>>"""
+        return self._get_inverse_attribute("Actors")
+
+    def IsRelatedWith(self)-> list["IfcApprovalRelationship"]:
+        """<inverse IsRelatedWith: set [0:?] of <entity IfcApprovalRelationship> for <attribute RelatedApproval: <entity IfcApproval>>>"""
+        return self._get_inverse_attribute("IsRelatedWith")
+
+    def Relates(self)-> list["IfcApprovalRelationship"]:
+        """<inverse Relates: set [0:?] of <entity IfcApprovalRelationship> for <attribute RelatingApproval: <entity IfcApproval>>>"""
+        return self._get_inverse_attribute("Relates")
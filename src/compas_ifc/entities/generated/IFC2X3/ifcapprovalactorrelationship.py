@@ -0,0 +1,40 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcactorrole import IfcActorRole
+    from .ifcapproval import IfcApproval
+    from .ifcorganization import IfcOrganization
+    from .ifcperson import IfcPerson
+    from .ifcpersonandorganization import IfcPersonAndOrganization
+
+class IfcApprovalActorRelationship(Base):
+    """Wrapper class for IfcApprovalActorRelationship."""
+
+    @property
+    def Actor(self)-> Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]:
+        """<attribute Actor: <select IfcActorSelect: (<entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization>)>>"""
+        return self._get_attribute("Actor")
+
+    @Actor.setter
+    def Actor(self, value: Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]):
+        return self._set_attribute("Actor", value)
+
+    @property
+    def Approval(self)-> "IfcApproval":
+        """<attribute Approval: <entity IfcApproval>>"""
+        return self._get_attribute("Approval")
+
+    @Approval.setter
+    def Approval(self, value: "IfcApproval"):
+        return self._set_attribute("Approval", value)
+
+    @property
+    def Role(self)-> "IfcActorRole":
+        """<attribute Role: <entity IfcActorRole>>"""
+        return self._get_attribute("Role")
+
+    @Role.setter
+    def Role(self, value: "IfcActorRole"):
+        return self._set_attribute("Role", value)
@@ -0,0 +1,27 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcapproval import IfcApproval
+    from .ifcproperty import IfcProperty
+
+class IfcApprovalPropertyRelationship(Base):
+    """Wrapper class for IfcApprovalPropertyRelationship."""
+
+    @property
+    def ApprovedProperties(self)-> list["IfcProperty"]:
+        """<attribute ApprovedProperties: <set [1:?] of <entity IfcProperty>>>"""
+        return self._get_attribute("ApprovedProperties")
+
+    @ApprovedProperties.setter
+    def ApprovedProperties(self, value: list["IfcProperty"]):
+        return self._set_attribute("ApprovedProperties", value)
+
+    @property
+    def Approval(self)-> "IfcApproval":
+        """<attribute Approval: <entity IfcApproval>>"""
+        return self._get_attribute("Approval")
+
+    @Approval.setter
+    def Approval(self, value: "IfcApproval"):
+        return self._set_attribute("Approval", value)
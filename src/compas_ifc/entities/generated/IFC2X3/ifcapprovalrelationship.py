@@ -0,0 +1,44 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcapproval import IfcApproval
+
+class IfcApprovalRelationship(Base):
+    """Wrapper class for IfcApprovalRelationship."""
+
+    @property
+    def RelatedApproval(self)-> "IfcApproval":
+        """<attribute RelatedApproval: <entity IfcApproval>>"""
+        return self._get_attribute("RelatedApproval")
+
+    @RelatedApproval.setter
+    def RelatedApproval(self, value: "IfcApproval"):
+        return self._set_attribute("RelatedApproval", value)
+
+    @property
+    def RelatingApproval(self)-> "IfcApproval":
+        """<attribute RelatingApproval: <entity IfcApproval>>"""
+        return self._get_attribute("RelatingApproval")
+
+    @RelatingApproval.setter
+    def RelatingApproval(self, value: "IfcApproval"):
+        return self._set_attribute("RelatingApproval", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
@@ -0,0 +1,17 @@
+from .ifcprofiledef import IfcProfileDef
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccurve import IfcCurve
+
+class IfcArbitraryClosedProfileDef(IfcProfileDef):
+    """Wrapper class for IfcArbitraryClosedProfileDef."""
+
+    @property
+    def OuterCurve(self)-> "IfcCurve":
+        """<attribute OuterCurve: <entity IfcCurve>>"""
+        return self._get_attribute("OuterCurve")
+
+    @OuterCurve.setter
+    def OuterCurve(self, value: "IfcCurve"):
+        return self._set_attribute("OuterCurve", value)
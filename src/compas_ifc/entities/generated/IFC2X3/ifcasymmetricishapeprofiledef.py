@@ -0,0 +1,41 @@
+from .ifcishapeprofiledef import IfcIShapeProfileDef
+
+
+class IfcAsymmetricIShapeProfileDef(IfcIShapeProfileDef):
+    """Wrapper class for IfcAsymmetricIShapeProfileDef."""
+
+    @property
+    def TopFlangeWidth(self)-> float:
+        """<attribute TopFlangeWidth: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("TopFlangeWidth")
+
+    @TopFlangeWidth.setter
+    def TopFlangeWidth(self, value: float):
+        return self._set_attribute("TopFlangeWidth", value)
+
+    @property
+    def TopFlangeThickness(self)-> float:
+        """<attribute TopFlangeThickness?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("TopFlangeThickness")
+
+    @TopFlangeThickness.setter
+    def TopFlangeThickness(self, value: float):
+        return self._set_attribute("TopFlangeThickness", value)
+
+    @property
+    def TopFlangeFilletRadius(self)-> float:
+        """<attribute TopFlangeFilletRadius?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("TopFlangeFilletRadius")
+
+    @TopFlangeFilletRadius.setter
+    def TopFlangeFilletRadius(self, value: float):
+        return self._set_attribute("TopFlangeFilletRadius", value)
+
+    @property
+    def CentreOfGravityInY(self)-> float:
+        """<attribute CentreOfGravityInY?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("CentreOfGravityInY")
+
+    @CentreOfGravityInY.setter
+    def CentreOfGravityInY(self, value: float):
+        return self._set_attribute("CentreOfGravityInY", value)
@@ -0,0 +1,17 @@
+from .ifcplacement import IfcPlacement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdirection import IfcDirection
+
+class IfcAxis2Placement2D(IfcPlacement):
+    """Wrapper class for IfcAxis2Placement2D."""
+
+    @property
+    def RefDirection(self)-> "IfcDirection":
+        """<attribute RefDirection?: <entity IfcDirection>>"""
+        return self._get_attribute("RefDirection")
+
+    @RefDirection.setter
+    def RefDirection(self, value: "IfcDirection"):
+        return self._set_attribute("RefDirection", value)
@@ -0,0 +1,5 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+
+class IfcBeam(IfcBuildingElement):
+    """Wrapper class for IfcBeam."""
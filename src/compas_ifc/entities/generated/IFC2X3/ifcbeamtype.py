@@ -0,0 +1,17 @@
+from .ifcbuildingelementtype import IfcBuildingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcbeamtypeenum import IfcBeamTypeEnum
+
+class IfcBeamType(IfcBuildingElementType):
+    """Wrapper class for IfcBeamType."""
+
+    @property
+    def PredefinedType(self)-> "IfcBeamTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcBeamTypeEnum: (BEAM, JOIST, LINTEL, T_BEAM, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcBeamTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcBeamTypeEnum(str):
+    items = ['BEAM', 'JOIST', 'LINTEL', 'T_BEAM', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,5 @@
+from .ifcbsplinecurve import IfcBSplineCurve
+
+
+class IfcBezierCurve(IfcBSplineCurve):
+    """Wrapper class for IfcBezierCurve."""
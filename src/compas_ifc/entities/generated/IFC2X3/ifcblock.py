@@ -0,0 +1,32 @@
+from .ifccsgprimitive3d import IfcCsgPrimitive3D
+
+
+class IfcBlock(IfcCsgPrimitive3D):
+    """Wrapper class for IfcBlock."""
+
+    @property
+    def XLength(self)-> float:
+        """<attribute XLength: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("XLength")
+
+    @XLength.setter
+    def XLength(self, value: float):
+        return self._set_attribute("XLength", value)
+
+    @property
+    def YLength(self)-> float:
+        """<attribute YLength: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("YLength")
+
+    @YLength.setter
+    def YLength(self, value: float):
+        return self._set_attribute("YLength", value)
+
+    @property
+    def ZLength(self)-> float:
+        """<attribute ZLength: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("ZLength")
+
+    @ZLength.setter
+    def ZLength(self, value: float):
+        return self._set_attribute("ZLength", value)
@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevicetype import IfcEnergyConversionDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcboilertypeenum import IfcBoilerTypeEnum
+
+class IfcBoilerType(IfcEnergyConversionDeviceType):
+    """Wrapper class for IfcBoilerType."""
+
+    @property
+    def PredefinedType(self)-> "IfcBoilerTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcBoilerTypeEnum: (WATER, STEAM, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcBoilerTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
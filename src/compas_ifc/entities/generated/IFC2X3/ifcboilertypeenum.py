@@ -0,0 +1,2 @@
+class IfcBoilerTypeEnum(str):
+    items = ['WATER', 'STEAM', 'USERDEFINED', 'NOTDEFINED']
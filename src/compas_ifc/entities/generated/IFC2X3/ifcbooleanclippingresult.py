@@ -0,0 +1,5 @@
+from .ifcbooleanresult import IfcBooleanResult
+
+
+class IfcBooleanClippingResult(IfcBooleanResult):
+    """Wrapper class for IfcBooleanClippingResult."""
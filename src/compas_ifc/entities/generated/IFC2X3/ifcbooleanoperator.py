@@ -0,0 +1,2 @@
+class IfcBooleanOperator(str):
+    items = ['UNION', 'INTERSECTION', 'DIFFERENCE']
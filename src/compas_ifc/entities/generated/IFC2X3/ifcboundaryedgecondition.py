@@ -0,0 +1,59 @@
+from .ifcboundarycondition import IfcBoundaryCondition
+
+
+class IfcBoundaryEdgeCondition(IfcBoundaryCondition):
+    """Wrapper class for IfcBoundaryEdgeCondition."""
+
+    @property
+    def LinearStiffnessByLengthX(self)-> float:
+        """<attribute LinearStiffnessByLengthX?: <type IfcModulusOfLinearSubgradeReactionMeasure: <real>>>"""
+        return self._get_attribute("LinearStiffnessByLengthX")
+
+    @LinearStiffnessByLengthX.setter
+    def LinearStiffnessByLengthX(self, value: float):
+        return self._set_attribute("LinearStiffnessByLengthX", value)
+
+    @property
+    def LinearStiffnessByLengthY(self)-> float:
+        """<attribute LinearStiffnessByLengthY?: <type IfcModulusOfLinearSubgradeReactionMeasure: <real>>>"""
+        return self._get_attribute("LinearStiffnessByLengthY")
+
+    @LinearStiffnessByLengthY.setter
+    def LinearStiffnessByLengthY(self, value: float):
+        return self._set_attribute("LinearStiffnessByLengthY", value)
+
+    @property
+    def LinearStiffnessByLengthZ(self)-> float:
+        """<attribute LinearStiffnessByLengthZ?: <type IfcModulusOfLinearSubgradeReactionMeasure: <real>>>"""
+        return self._get_attribute("LinearStiffnessByLengthZ")
+
+    @LinearStiffnessByLengthZ.setter
+    def LinearStiffnessByLengthZ(self, value: float):
+        return self._set_attribute("LinearStiffnessByLengthZ", value)
+
+    @property
+    def RotationalStiffnessByLengthX(self)-> float:
+        """<attribute RotationalStiffnessByLengthX?: <type IfcModulusOfRotationalSubgradeReactionMeasure: <real>>>"""
+        return self._get_attribute("RotationalStiffnessByLengthX")
+
+    @RotationalStiffnessByLengthX.setter
+    def RotationalStiffnessByLengthX(self, value: float):
+        return self._set_attribute("RotationalStiffnessByLengthX", value)
+
+    @property
+    def RotationalStiffnessByLengthY(self)-> float:
+        """<attribute RotationalStiffnessByLengthY?: <type IfcModulusOfRotationalSubgradeReactionMeasure: <real>>>"""
+        return self._get_attribute("RotationalStiffnessByLengthY")
+
+    @RotationalStiffnessByLengthY.setter
+    def RotationalStiffnessByLengthY(self, value: float):
+        return self._set_attribute("RotationalStiffnessByLengthY", value)
+
+    @property
+    def RotationalStiffnessByLengthZ(self)-> float:
+        """<attribute RotationalStiffnessByLengthZ?: <type IfcModulusOfRotationalSubgradeReactionMeasure: <real>>>"""
+        return self._get_attribute("RotationalStiffnessByLengthZ")
+
+    @RotationalStiffnessByLengthZ.setter
+    def RotationalStiffnessByLengthZ(self, value: float):
+        return self._set_attribute("RotationalStiffnessByLengthZ", value)
@@ -0,0 +1,32 @@
+from .ifcboundarycondition import IfcBoundaryCondition
+
+
+class IfcBoundaryFaceCondition(IfcBoundaryCondition):
+    """Wrapper class for IfcBoundaryFaceCondition."""
+
+    @property
+    def LinearStiffnessByAreaX(self)-> float:
+        """<attribute LinearStiffnessByAreaX?: <type IfcModulusOfSubgradeReactionMeasure: <real>>>"""
+        return self._get_attribute("LinearStiffnessByAreaX")
+
+    @LinearStiffnessByAreaX.setter
+    def LinearStiffnessByAreaX(self, value: float):
+        return self._set_attribute("LinearStiffnessByAreaX", value)
+
+    @property
+    def LinearStiffnessByAreaY(self)-> float:
+        """<attribute LinearStiffnessByAreaY?: <type IfcModulusOfSubgradeReactionMeasure: <real>>>"""
+        return self._get_attribute("LinearStiffnessByAreaY")
+
+    @LinearStiffnessByAreaY.setter
+    def LinearStiffnessByAreaY(self, value: float):
+        return self._set_attribute("LinearStiffnessByAreaY", value)
+
+    @property
+    def LinearStiffnessByAreaZ(self)-> float:
+        """<attribute LinearStiffnessByAreaZ?: <type IfcModulusOfSubgradeReactionMeasure: <real>>>"""
+        return self._get_attribute("LinearStiffnessByAreaZ")
+
+    @LinearStiffnessByAreaZ.setter
+    def LinearStiffnessByAreaZ(self, value: float):
+        return self._set_attribute("LinearStiffnessByAreaZ", value)
@@ -0,0 +1,59 @@
+from .ifcboundarycondition import IfcBoundaryCondition
+
+
+class IfcBoundaryNodeCondition(IfcBoundaryCondition):
+    """Wrapper class for IfcBoundaryNodeCondition."""
+
+    @property
+    def LinearStiffnessX(self)-> float:
+        """<attribute LinearStiffnessX?: <type IfcLinearStiffnessMeasure: <real>>>"""
+        return self._get_attribute("LinearStiffnessX")
+
+    @LinearStiffnessX.setter
+    def LinearStiffnessX(self, value: float):
+        return self._set_attribute("LinearStiffnessX", value)
+
+    @property
+    def LinearStiffnessY(self)-> float:
+        """<attribute LinearStiffnessY?: <type IfcLinearStiffnessMeasure: <real>>>"""
+        return self._get_attribute("LinearStiffnessY")
+
+    @LinearStiffnessY.setter
+    def LinearStiffnessY(self, value: float):
+        return self._set_attribute("LinearStiffnessY", value)
+
+    @property
+    def LinearStiffnessZ(self)-> float:
+        """<attribute LinearStiffnessZ?: <type IfcLinearStiffnessMeasure: <real>>>"""
+        return self._get_attribute("LinearStiffnessZ")
+
+    @LinearStiffnessZ.setter
+    def LinearStiffnessZ(self, value: float):
+        return self._set_attribute("LinearStiffnessZ", value)
+
+    @property
+    def RotationalStiffnessX(self)-> float:
+        """<attribute RotationalStiffnessX?: <type IfcRotationalStiffnessMeasure: <real>>>"""
+        return self._get_attribute("RotationalStiffnessX")
+
+    @RotationalStiffnessX.setter
+    def RotationalStiffnessX(self, value: float):
+        return self._set_attribute("RotationalStiffnessX", value)
+
+    @property
+    def RotationalStiffnessY(self)-> float:
+        """<attribute RotationalStiffnessY?: <type IfcRotationalStiffnessMeasure: <real>>>"""
+        return self._get_attribute("RotationalStiffnessY")
+
+    @RotationalStiffnessY.setter
+    def RotationalStiffnessY(self, value: float):
+        return self._set_attribute("RotationalStiffnessY", value)
+
+    @property
+    def RotationalStiffnessZ(self)-> float:
+        """<attribute RotationalStiffnessZ?: <type IfcRotationalStiffnessMeasure: <real>>>"""
+        return self._get_attribute("RotationalStiffnessZ")
+
+    @RotationalStiffnessZ.setter
+    def RotationalStiffnessZ(self, value: float):
+        return self._set_attribute("RotationalStiffnessZ", value)
@@ -0,0 +1,14 @@
+from .ifcboundarynodecondition import IfcBoundaryNodeCondition
+
+
+class IfcBoundaryNodeConditionWarping(IfcBoundaryNodeCondition):
+    """Wrapper class for IfcBoundaryNodeConditionWarping."""
+
+    @property
+    def WarpingStiffness(self)-> float:
+        """<attribute WarpingStiffness?: <type IfcWarpingMomentMeasure: <real>>>"""
+        return self._get_attribute("WarpingStiffness")
+
+    @WarpingStiffness.setter
+    def WarpingStiffness(self, value: float):
+        return self._set_attribute("WarpingStiffness", value)
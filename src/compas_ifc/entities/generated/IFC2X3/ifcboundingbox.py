@@ -0,0 +1,44 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccartesianpoint import IfcCartesianPoint
+
+class IfcBoundingBox(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcBoundingBox."""
+
+    @property
+    def Corner(self)-> "IfcCartesianPoint":
+        """<attribute Corner: <entity IfcCartesianPoint>>"""
+        return self._get_attribute("Corner")
+
+    @Corner.setter
+    def Corner(self, value: "IfcCartesianPoint"):
+        return self._set_attribute("Corner", value)
+
+    @property
+    def XDim(self)-> float:
+        """<attribute XDim: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("XDim")
+
+    @XDim.setter
+    def XDim(self, value: float):
+        return self._set_attribute("XDim", value)
+
+    @property
+    def YDim(self)-> float:
+        """<attribute YDim: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("YDim")
+
+    @YDim.setter
+    def YDim(self, value: float):
+        return self._set_attribute("YDim", value)
+
+    @property
+    def ZDim(self)-> float:
+        """<attribute ZDim: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("ZDim")
+
+    @ZDim.setter
+    def ZDim(self, value: float):
+        return self._set_attribute("ZDim", value)
@@ -0,0 +1,54 @@
+from .ifcboundedcurve import IfcBoundedCurve
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcbsplinecurveform import IfcBSplineCurveForm
+    from .ifccartesianpoint import IfcCartesianPoint
+
+class IfcBSplineCurve(IfcBoundedCurve):
+    """Wrapper class for IfcBSplineCurve."""
+
+    @property
+    def Degree(self)-> int:
+        """<attribute Degree: <integer>>"""
+        return self._get_attribute("Degree")
+
+    @Degree.setter
+    def Degree(self, value: int):
+        return self._set_attribute("Degree", value)
+
+    @property
+    def ControlPointsList(self)-> list["IfcCartesianPoint"]:
+        """<attribute ControlPointsList: <list [2:?] of <entity IfcCartesianPoint>>>"""
+        return self._get_attribute("ControlPointsList")
+
+    @ControlPointsList.setter
+    def ControlPointsList(self, value: list["IfcCartesianPoint"]):
+        return self._set_attribute("ControlPointsList", value)
+
+    @property
+    def CurveForm(self)-> "IfcBSplineCurveForm":
+        """<attribute CurveForm: <enumeration IfcBSplineCurveForm: (POLYLINE_FORM, CIRCULAR_ARC, ELLIPTIC_ARC, PARABOLIC_ARC, HYPERBOLIC_ARC, UNSPECIFIED)>>"""
+        return self._get_attribute("CurveForm")
+
+    @CurveForm.setter
+    def CurveForm(self, value: "IfcBSplineCurveForm"):
+        return self._set_attribute("CurveForm", value)
+
+    @property
+    def ClosedCurve(self)-> bool:
+        """<attribute ClosedCurve: <logical>>"""
+        return self._get_attribute("ClosedCurve")
+
+    @ClosedCurve.setter
+    def ClosedCurve(self, value: bool):
+        return self._set_attribute("ClosedCurve", value)
+
+    @property
+    def SelfIntersect(self)-> bool:
+        """<attribute SelfIntersect: <logical>>"""
+        return self._get_attribute("SelfIntersect")
+
+    @SelfIntersect.setter
+    def SelfIntersect(self, value: bool):
+        return self._set_attribute("SelfIntersect", value)
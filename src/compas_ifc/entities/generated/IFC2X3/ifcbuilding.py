@@ -0,0 +1,36 @@
+from .ifcspatialstructureelement import IfcSpatialStructureElement
+from compas_ifc.entities.extensions import IfcBuilding as IfcBuilding_Ext   # type: ignore
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpostaladdress import IfcPostalAddress
+
+class IfcBuilding(IfcBuilding_Ext, IfcSpatialStructureElement):
+    """Wrapper class for IfcBuilding."""
+
+    @property
+    def ElevationOfRefHeight(self)-> float:
+        """<attribute ElevationOfRefHeight?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("ElevationOfRefHeight")
+
+    @ElevationOfRefHeight.setter
+    def ElevationOfRefHeight(self, value: float):
+        return self._set_attribute("ElevationOfRefHeight", value)
+
+    @property
+    def ElevationOfTerrain(self)-> float:
+        """<attribute ElevationOfTerrain?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("ElevationOfTerrain")
+
+    @ElevationOfTerrain.setter
+    def ElevationOfTerrain(self, value: float):
+        return self._set_attribute("ElevationOfTerrain", value)
+
+    @property
+    def BuildingAddress(self)-> "IfcPostalAddress":
+        """<attribute BuildingAddress?: <entity IfcPostalAddress>>"""
+        return self._get_attribute("BuildingAddress")
+
+    @BuildingAddress.setter
+    def BuildingAddress(self, value: "IfcPostalAddress"):
+        return self._set_attribute("BuildingAddress", value)
@@ -0,0 +1,5 @@
+from .ifcelement import IfcElement
+
+
+class IfcBuildingElement(IfcElement):
+    """Wrapper class for IfcBuildingElement."""
@@ -0,0 +1,5 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+
+class IfcBuildingElementComponent(IfcBuildingElement):
+    """Wrapper class for IfcBuildingElementComponent."""
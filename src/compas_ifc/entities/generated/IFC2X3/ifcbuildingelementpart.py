@@ -0,0 +1,5 @@
+from .ifcbuildingelementcomponent import IfcBuildingElementComponent
+
+
+class IfcBuildingElementPart(IfcBuildingElementComponent):
+    """Wrapper class for IfcBuildingElementPart."""
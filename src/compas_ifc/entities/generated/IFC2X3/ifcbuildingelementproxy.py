@@ -0,0 +1,17 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelementcompositionenum import IfcElementCompositionEnum
+
+class IfcBuildingElementProxy(IfcBuildingElement):
+    """Wrapper class for IfcBuildingElementProxy."""
+
+    @property
+    def CompositionType(self)-> "IfcElementCompositionEnum":
+        """<attribute CompositionType?: <enumeration IfcElementCompositionEnum: (COMPLEX, ELEMENT, PARTIAL)>>"""
+        return self._get_attribute("CompositionType")
+
+    @CompositionType.setter
+    def CompositionType(self, value: "IfcElementCompositionEnum"):
+        return self._set_attribute("CompositionType", value)
@@ -0,0 +1,2 @@
+class IfcBuildingElementProxyTypeEnum(str):
+    items = ['USERDEFINED', 'NOTDEFINED']
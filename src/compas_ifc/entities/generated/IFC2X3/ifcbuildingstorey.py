@@ -0,0 +1,14 @@
+from .ifcspatialstructureelement import IfcSpatialStructureElement
+
+
+class IfcBuildingStorey(IfcSpatialStructureElement):
+    """Wrapper class for IfcBuildingStorey."""
+
+    @property
+    def Elevation(self)-> float:
+        """<attribute Elevation?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("Elevation")
+
+    @Elevation.setter
+    def Elevation(self, value: float):
+        return self._set_attribute("Elevation", value)
@@ -0,0 +1,2 @@
+class IfcCableSegmentTypeEnum(str):
+    items = ['CABLESEGMENT', 'CONDUCTORSEGMENT', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,32 @@
+from compas_ifc.entities.base import Base
+
+
+class IfcCalendarDate(Base):
+    """Wrapper class for IfcCalendarDate."""
+
+    @property
+    def DayComponent(self)-> int:
+        """<attribute DayComponent: <type IfcDayInMonthNumber: <integer>>>"""
+        return self._get_attribute("DayComponent")
+
+    @DayComponent.setter
+    def DayComponent(self, value: int):
+        return self._set_attribute("DayComponent", value)
+
+    @property
+    def MonthComponent(self)-> int:
+        """<attribute MonthComponent: <type IfcMonthInYearNumber: <integer>>>"""
+        return self._get_attribute("MonthComponent")
+
+    @MonthComponent.setter
+    def MonthComponent(self, value: int):
+        return self._set_attribute("MonthComponent", value)
+
+    @property
+    def YearComponent(self)-> int:
+        """<attribute YearComponent: <type IfcYearNumber: <integer>>>"""
+        return self._get_attribute("YearComponent")
+
+    @YearComponent.setter
+    def YearComponent(self, value: int):
+        return self._set_attribute("YearComponent", value)
@@ -0,0 +1,14 @@
+from .ifcpoint import IfcPoint
+
+
+class IfcCartesianPoint(IfcPoint):
+    """Wrapper class for IfcCartesianPoint."""
+
+    @property
+    def Coordinates(self)-> list[float]:
+        """<attribute Coordinates: <list [1:3] of <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Coordinates")
+
+    @Coordinates.setter
+    def Coordinates(self, value: list[float]):
+        return self._set_attribute("Coordinates", value)
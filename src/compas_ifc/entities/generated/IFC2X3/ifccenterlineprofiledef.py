@@ -0,0 +1,14 @@
+from .ifcarbitraryopenprofiledef import IfcArbitraryOpenProfileDef
+
+
+class IfcCenterLineProfileDef(IfcArbitraryOpenProfileDef):
+    """Wrapper class for IfcCenterLineProfileDef."""
+
+    @property
+    def Thickness(self)-> float:
+        """<attribute Thickness: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Thickness")
+
+    @Thickness.setter
+    def Thickness(self, value: float):
+        return self._set_attribute("Thickness", value)
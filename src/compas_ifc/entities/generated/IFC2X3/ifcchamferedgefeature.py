@@ -0,0 +1,23 @@
+from .ifcedgefeature import IfcEdgeFeature
+
+
+class IfcChamferEdgeFeature(IfcEdgeFeature):
+    """Wrapper class for IfcChamferEdgeFeature."""
+
+    @property
+    def Width(self)-> float:
+        """<attribute Width?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Width")
+
+    @Width.setter
+    def Width(self, value: float):
+        return self._set_attribute("Width", value)
+
+    @property
+    def Height(self)-> float:
+        """<attribute Height?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Height")
+
+    @Height.setter
+    def Height(self, value: float):
+        return self._set_attribute("Height", value)
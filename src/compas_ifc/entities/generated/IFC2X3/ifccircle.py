@@ -0,0 +1,14 @@
+from .ifcconic import IfcConic
+
+
+class IfcCircle(IfcConic):
+    """Wrapper class for IfcCircle."""
+
+    @property
+    def Radius(self)-> float:
+        """<attribute Radius: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Radius")
+
+    @Radius.setter
+    def Radius(self, value: float):
+        return self._set_attribute("Radius", value)
@@ -0,0 +1,14 @@
+from .ifcparameterizedprofiledef import IfcParameterizedProfileDef
+
+
+class IfcCircleProfileDef(IfcParameterizedProfileDef):
+    """Wrapper class for IfcCircleProfileDef."""
+
+    @property
+    def Radius(self)-> float:
+        """<attribute Radius: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Radius")
+
+    @Radius.setter
+    def Radius(self, value: float):
+        return self._set_attribute("Radius", value)
@@ -0,0 +1,49 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccalendardate import IfcCalendarDate
+    from .ifcclassificationitem import IfcClassificationItem
+
+class IfcClassification(Base):
+    """Wrapper class for IfcClassification."""
+
+    @property
+    def Source(self)-> str:
+        """<attribute Source: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Source")
+
+    @Source.setter
+    def Source(self, value: str):
+        return self._set_attribute("Source", value)
+
+    @property
+    def Edition(self)-> str:
+        """<attribute Edition: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Edition")
+
+    @Edition.setter
+    def Edition(self, value: str):
+        return self._set_attribute("Edition", value)
+
+    @property
+    def EditionDate(self)-> "IfcCalendarDate":
+        """<attribute EditionDate?: <entity IfcCalendarDate>>"""
+        return self._get_attribute("EditionDate")
+
+    @EditionDate.setter
+    def EditionDate(self, value: "IfcCalendarDate"):
+        return self._set_attribute("EditionDate", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    def Contains(self)-> list["IfcClassificationItem"]:
+        """<inverse Contains: set [0:?] of <entity IfcClassificationItem> for <attribute ItemOf?: <entity IfcClassification>>>"""
+        return self._get_inverse_attribute("Contains")
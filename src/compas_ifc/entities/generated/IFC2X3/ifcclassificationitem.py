@@ -0,0 +1,45 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcclassification import IfcClassification
+    from .ifcclassificationitemrelationship import IfcClassificationItemRelationship
+    from .ifcclassificationnotationfacet import IfcClassificationNotationFacet
+
+class IfcClassificationItem(Base):
+    """Wrapper class for IfcClassificationItem."""
+
+    @property
+    def Notation(self)-> "IfcClassificationNotationFacet":
+        """<attribute Notation: <entity IfcClassificationNotationFacet>>"""
+        return self._get_attribute("Notation")
+
+    @Notation.setter
+    def Notation(self, value: "IfcClassificationNotationFacet"):
+        return self._set_attribute("Notation", value)
+
+    @property
+    def ItemOf(self)-> "IfcClassification":
+        """<attribute ItemOf?: <entity IfcClassification>>"""
+        return self._get_attribute("ItemOf")
+
+    @ItemOf.setter
+    def ItemOf(self, value: "IfcClassification"):
+        return self._set_attribute("ItemOf", value)
+
+    @property
+    def Title(self)-> str:
+        """<attribute Title: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Title")
+
+    @Title.setter
+    def Title(self, value: str):
+        return self._set_attribute("Title", value)
+
+    def IsClassifiedItemIn(self)-> list["IfcClassificationItemRelationship"]:
+        """<inverse IsClassifiedItemIn: set [0:1] of <entity IfcClassificationItemRelationship> for <attribute RelatedItems: <set [1:?] of <entity IfcClassificationItem>>>>"""
+        return self._get_inverse_attribute("IsClassifiedItemIn")
+
+    def IsClassifyingItemIn(self)-> list["IfcClassificationItemRelationship"]:
+        """<inverse IsClassifyingItemIn: set [0:1] of <entity IfcClassificationItemRelationship> for <attribute RelatingItem: <entity IfcClassificationItem>>>"""
+        return self._get_inverse_attribute("IsClassifyingItemIn")
@@ -0,0 +1,26 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcclassificationitem import IfcClassificationItem
+
+class IfcClassificationItemRelationship(Base):
+    """Wrapper class for IfcClassificationItemRelationship."""
+
+    @property
+    def RelatingItem(self)-> "IfcClassificationItem":
+        """<attribute RelatingItem: <entity IfcClassificationItem>>"""
+        return self._get_attribute("RelatingItem")
+
+    @RelatingItem.setter
+    def RelatingItem(self, value: "IfcClassificationItem"):
+        return self._set_attribute("RelatingItem", value)
+
+    @property
+    def RelatedItems(self)-> list["IfcClassificationItem"]:
+        """<attribute RelatedItems: <set [1:?] of <entity IfcClassificationItem>>>"""
+        return self._get_attribute("RelatedItems")
+
+    @RelatedItems.setter
+    def RelatedItems(self, value: list["IfcClassificationItem"]):
+        return self._set_attribute("RelatedItems", value)
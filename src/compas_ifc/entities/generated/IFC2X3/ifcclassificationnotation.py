@@ -0,0 +1,17 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcclassificationnotationfacet import IfcClassificationNotationFacet
+
+class IfcClassificationNotation(Base):
+    """Wrapper class for IfcClassificationNotation."""
+
+    @property
+    def NotationFacets(self)-> list["IfcClassificationNotationFacet"]:
+        """<attribute NotationFacets: <set [1:?] of <entity IfcClassificationNotationFacet>>>"""
+        return self._get_attribute("NotationFacets")
+
+    @NotationFacets.setter
+    def NotationFacets(self, value: list["IfcClassificationNotationFacet"]):
+        return self._set_attribute("NotationFacets", value)
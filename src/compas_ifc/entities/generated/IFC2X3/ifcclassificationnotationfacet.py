@@ -0,0 +1,14 @@
+from compas_ifc.entities.base import Base
+
+
+class IfcClassificationNotationFacet(Base):
+    """Wrapper class for IfcClassificationNotationFacet."""
+
+    @property
+    def NotationValue(self)-> str:
+        """<attribute NotationValue: <type IfcLabel: <string>>>"""
+        return self._get_attribute("NotationValue")
+
+    @NotationValue.setter
+    def NotationValue(self, value: str):
+        return self._set_attribute("NotationValue", value)
@@ -0,0 +1,17 @@
+from .ifcexternalreference import IfcExternalReference
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcclassification import IfcClassification
+
+class IfcClassificationReference(IfcExternalReference):
+    """Wrapper class for IfcClassificationReference."""
+
+    @property
+    def ReferencedSource(self)-> "IfcClassification":
+        """<attribute ReferencedSource?: <entity IfcClassification>>"""
+        return self._get_attribute("ReferencedSource")
+
+    @ReferencedSource.setter
+    def ReferencedSource(self, value: "IfcClassification"):
+        return self._set_attribute("ReferencedSource", value)
@@ -0,0 +1,5 @@
+from .ifcconnectedfaceset import IfcConnectedFaceSet
+
+
+class IfcClosedShell(IfcConnectedFaceSet):
+    """Wrapper class for IfcClosedShell."""
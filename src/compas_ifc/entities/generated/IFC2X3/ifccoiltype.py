@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevicetype import IfcEnergyConversionDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccoiltypeenum import IfcCoilTypeEnum
+
+class IfcCoilType(IfcEnergyConversionDeviceType):
+    """Wrapper class for IfcCoilType."""
+
+    @property
+    def PredefinedType(self)-> "IfcCoilTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcCoilTypeEnum: (DXCOOLINGCOIL, WATERCOOLINGCOIL, STEAMHEATINGCOIL, WATERHEATINGCOIL, ELECTRICHEATINGCOIL, GASHEATINGCOIL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcCoilTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
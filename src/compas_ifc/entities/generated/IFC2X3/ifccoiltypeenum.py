@@ -0,0 +1,2 @@
+class IfcCoilTypeEnum(str):
+    items = ['DXCOOLINGCOIL', 'WATERCOOLINGCOIL', 'STEAMHEATINGCOIL', 'WATERHEATINGCOIL', 'ELECTRICHEATINGCOIL', 'GASHEATINGCOIL', 'USERDEFINED', 'NOTDEFINED']
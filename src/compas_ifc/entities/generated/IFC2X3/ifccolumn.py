@@ -0,0 +1,5 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+
+class IfcColumn(IfcBuildingElement):
+    """Wrapper class for IfcColumn."""
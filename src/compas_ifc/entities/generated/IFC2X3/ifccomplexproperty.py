@@ -0,0 +1,26 @@
+from .ifcproperty import IfcProperty
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcproperty import IfcProperty
+
+class IfcComplexProperty(IfcProperty):
+    """Wrapper class for IfcComplexProperty."""
+
+    @property
+    def UsageName(self)-> str:
+        """<attribute UsageName: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("UsageName")
+
+    @UsageName.setter
+    def UsageName(self, value: str):
+        return self._set_attribute("UsageName", value)
+
+    @property
+    def HasProperties(self)-> list["IfcProperty"]:
+        """<attribute HasProperties: <set [1:?] of <entity IfcProperty>>>"""
+        return self._get_attribute("HasProperties")
+
+    @HasProperties.setter
+    def HasProperties(self, value: list["IfcProperty"]):
+        return self._set_attribute("HasProperties", value)
@@ -0,0 +1,26 @@
+from .ifcboundedcurve import IfcBoundedCurve
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccompositecurvesegment import IfcCompositeCurveSegment
+
+class IfcCompositeCurve(IfcBoundedCurve):
+    """Wrapper class for IfcCompositeCurve."""
+
+    @property
+    def Segments(self)-> list["IfcCompositeCurveSegment"]:
+        """<attribute Segments: <list [1:?] of <entity IfcCompositeCurveSegment>>>"""
+        return self._get_attribute("Segments")
+
+    @Segments.setter
+    def Segments(self, value: list["IfcCompositeCurveSegment"]):
+        return self._set_attribute("Segments", value)
+
+    @property
+    def SelfIntersect(self)-> bool:
+        """<attribute SelfIntersect: <logical>>"""
+        return self._get_attribute("SelfIntersect")
+
+    @SelfIntersect.setter
+    def SelfIntersect(self, value: bool):
+        return self._set_attribute("SelfIntersect", value)
@@ -0,0 +1,41 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccompositecurve import IfcCompositeCurve
+    from .ifccurve import IfcCurve
+    from .ifctransitioncode import IfcTransitionCode
+
+class IfcCompositeCurveSegment(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcCompositeCurveSegment."""
+
+    @property
+    def Transition(self)-> "IfcTransitionCode":
+        """<attribute Transition: <enumeration IfcTransitionCode: (DISCONTINUOUS, CONTINUOUS, CONTSAMEGRADIENT, CONTSAMEGRADIENTSAMECURVATURE)>>"""
+        return self._get_attribute("Transition")
+
+    @Transition.setter
+    def Transition(self, value: "IfcTransitionCode"):
+        return self._set_attribute("Transition", value)
+
+    @property
+    def SameSense(self)-> bool:
+        """<attribute SameSense: <boolean>>"""
+        return self._get_attribute("SameSense")
+
+    @SameSense.setter
+    def SameSense(self, value: bool):
+        return self._set_attribute("SameSense", value)
+
+    @property
+    def ParentCurve(self)-> "IfcCurve":
+        """<attribute ParentCurve: <entity IfcCurve>>"""
+        return self._get_attribute("ParentCurve")
+
+    @ParentCurve.setter
+    def ParentCurve(self, value: "IfcCurve"):
+        return self._set_attribute("ParentCurve", value)
+
+    def UsingCurves(self)-> list["IfcCompositeCurve"]:
+        """<inverse UsingCurves: set [1:?] of <entity IfcCompositeCurve> for <attribute Segments: <list [1:?] of <entity IfcCompositeCurveSegment>>>>"""
+        return self._get_inverse_attribute("UsingCurves")
@@ -0,0 +1,26 @@
+from .ifcprofiledef import IfcProfileDef
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcprofiledef import IfcProfileDef
+
+class IfcCompositeProfileDef(IfcProfileDef):
+    """Wrapper class for IfcCompositeProfileDef."""
+
+    @property
+    def Profiles(self)-> list["IfcProfileDef"]:
+        """<attribute Profiles: <set [2:?] of <entity IfcProfileDef>>>"""
+        return self._get_attribute("Profiles")
+
+    @Profiles.setter
+    def Profiles(self, value: list["IfcProfileDef"]):
+        return self._set_attribute("Profiles", value)
+
+    @property
+    def Label(self)-> str:
+        """<attribute Label?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Label")
+
+    @Label.setter
+    def Label(self, value: str):
+        return self._set_attribute("Label", value)
@@ -0,0 +1,17 @@
+from .ifcflowmovingdevicetype import IfcFlowMovingDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccompressortypeenum import IfcCompressorTypeEnum
+
+class IfcCompressorType(IfcFlowMovingDeviceType):
+    """Wrapper class for IfcCompressorType."""
+
+    @property
+    def PredefinedType(self)-> "IfcCompressorTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcCompressorTypeEnum: (DYNAMIC, RECIPROCATING, ROTARY, SCROLL, TROCHOIDAL, SINGLESTAGE, BOOSTER, OPENTYPE, HERMETIC, SEMIHERMETIC, WELDEDSHELLHERMETIC, ROLLINGPISTON, ROTARYVANE, SINGLESCREW, TWINSCREW, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcCompressorTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcCondenserTypeEnum(str):
+    items = ['WATERCOOLEDSHELLTUBE', 'WATERCOOLEDSHELLCOIL', 'WATERCOOLEDTUBEINTUBE', 'WATERCOOLEDBRAZEDPLATE', 'AIRCOOLED', 'EVAPORATIVECOOLED', 'USERDEFINED', 'NOTDEFINED']
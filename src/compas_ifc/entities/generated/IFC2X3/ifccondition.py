@@ -0,0 +1,5 @@
+from .ifcgroup import IfcGroup
+
+
+class IfcCondition(IfcGroup):
+    """Wrapper class for IfcCondition."""
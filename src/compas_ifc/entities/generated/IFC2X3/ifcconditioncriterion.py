@@ -0,0 +1,30 @@
+from .ifccontrol import IfcControl
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccalendardate import IfcCalendarDate
+    from .ifcdateandtime import IfcDateAndTime
+    from .ifclocaltime import IfcLocalTime
+    from .ifcmeasurewithunit import IfcMeasureWithUnit
+
+class IfcConditionCriterion(IfcControl):
+    """Wrapper class for IfcConditionCriterion."""
+
+    @property
+    def Criterion(self)-> Union["IfcMeasureWithUnit", str]:
+        """<attribute Criterion: <select IfcConditionCriterionSelect: (<type IfcLabel: <string>> | <entity IfcMeasureWithUnit>)>>"""
+        return self._get_attribute("Criterion")
+
+    @Criterion.setter
+    def Criterion(self, value: Union["IfcMeasureWithUnit", str]):
+        return self._set_attribute("Criterion", value)
+
+    @property
+    def CriterionDateTime(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute CriterionDateTime: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("CriterionDateTime")
+
+    @CriterionDateTime.setter
+    def CriterionDateTime(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("CriterionDateTime", value)
@@ -0,0 +1,19 @@
+from .ifccurve import IfcCurve
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaxis2placement2d import IfcAxis2Placement2D
+    from .ifcaxis2placement3d import IfcAxis2Placement3D
+
+class IfcConic(IfcCurve):
+    """Wrapper class for IfcConic."""
+
+    @property
+    def Position(self)-> Union["IfcAxis2Placement3D", "IfcAxis2Placement2D"]:
+        """<attribute Position: <select IfcAxis2Placement: (<entity IfcAxis2Placement2D> | <entity IfcAxis2Placement3D>)>>"""
+        return self._get_attribute("Position")
+
+    @Position.setter
+    def Position(self, value: Union["IfcAxis2Placement3D", "IfcAxis2Placement2D"]):
+        return self._set_attribute("Position", value)
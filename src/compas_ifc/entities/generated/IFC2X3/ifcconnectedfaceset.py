@@ -0,0 +1,17 @@
+from .ifctopologicalrepresentationitem import IfcTopologicalRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcface import IfcFace
+
+class IfcConnectedFaceSet(IfcTopologicalRepresentationItem):
+    """Wrapper class for IfcConnectedFaceSet."""
+
+    @property
+    def CfsFaces(self)-> list["IfcFace"]:
+        """<attribute CfsFaces: <set [1:?] of <entity IfcFace>>>"""
+        return self._get_attribute("CfsFaces")
+
+    @CfsFaces.setter
+    def CfsFaces(self, value: list["IfcFace"]):
+        return self._set_attribute("CfsFaces", value)
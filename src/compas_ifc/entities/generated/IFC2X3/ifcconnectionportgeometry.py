@@ -0,0 +1,38 @@
+from .ifcconnectiongeometry import IfcConnectionGeometry
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaxis2placement2d import IfcAxis2Placement2D
+    from .ifcaxis2placement3d import IfcAxis2Placement3D
+    from .ifcprofiledef import IfcProfileDef
+
+class IfcConnectionPortGeometry(IfcConnectionGeometry):
+    """Wrapper class for IfcConnectionPortGeometry."""
+
+    @property
+    def LocationAtRelatingElement(self)-> Union["IfcAxis2Placement3D", "IfcAxis2Placement2D"]:
+        """<attribute LocationAtRelatingElement: <select IfcAxis2Placement: (<entity IfcAxis2Placement2D> | <entity IfcAxis2Placement3D>)>>"""
+        return self._get_attribute("LocationAtRelatingElement")
+
+    @LocationAtRelatingElement.setter
+    def LocationAtRelatingElement(self, value: Union["IfcAxis2Placement3D", "IfcAxis2Placement2D"]):
+        return self._set_attribute("LocationAtRelatingElement", value)
+
+    @property
+    def LocationAtRelatedElement(self)-> Union["IfcAxis2Placement3D", "IfcAxis2Placement2D"]:
+        """<attribute LocationAtRelatedElement?: <select IfcAxis2Placement: (<entity IfcAxis2Placement2D> | <entity IfcAxis2Placement3D>)>>"""
+        return self._get_attribute("LocationAtRelatedElement")
+
+    @LocationAtRelatedElement.setter
+    def LocationAtRelatedElement(self, value: Union["IfcAxis2Placement3D", "IfcAxis2Placement2D"]):
+        return self._set_attribute("LocationAtRelatedElement", value)
+
+    @property
+    def ProfileOfPort(self)-> "IfcProfileDef":
+        """<attribute ProfileOfPort: <entity IfcProfileDef>>"""
+        return self._get_attribute("ProfileOfPort")
+
+    @ProfileOfPort.setter
+    def ProfileOfPort(self, value: "IfcProfileDef"):
+        return self._set_attribute("ProfileOfPort", value)
@@ -0,0 +1,106 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccalendardate import IfcCalendarDate
+    from .ifcconstraintaggregationrelationship import IfcConstraintAggregationRelationship
+    from .ifcconstraintclassificationrelationship import IfcConstraintClassificationRelationship
+    from .ifcconstraintenum import IfcConstraintEnum
+    from .ifcconstraintrelationship import IfcConstraintRelationship
+    from .ifcdateandtime import IfcDateAndTime
+    from .ifclocaltime import IfcLocalTime
+    from .ifcorganization import IfcOrganization
+    from .ifcperson import IfcPerson
+    from .ifcpersonandorganization import IfcPersonAndOrganization
+    from .ifcpropertyconstraintrelationship import IfcPropertyConstraintRelationship
+
+class IfcConstraint(Base):
+    """Wrapper class for IfcConstraint."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def ConstraintGrade(self)-> "IfcConstraintEnum":
+        """<attribute ConstraintGrade: <enumeration IfcConstraintEnum: (HARD, SOFT, ADVISORY, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("ConstraintGrade")
+
+    @ConstraintGrade.setter
+    def ConstraintGrade(self, value: "IfcConstraintEnum"):
+        return self._set_attribute("ConstraintGrade", value)
+
+    @property
+    def ConstraintSource(self)-> str:
+        """<attribute ConstraintSource?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ConstraintSource")
+
+    @ConstraintSource.setter
+    def ConstraintSource(self, value: str):
+        return self._set_attribute("ConstraintSource", value)
+
+    @property
+    def CreatingActor(self)-> Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]:
+        """<attribute CreatingActor?: <select IfcActorSelect: (<entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization>)>>"""
+        return self._get_attribute("CreatingActor")
+
+    @CreatingActor.setter
+    def CreatingActor(self, value: Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]):
+        return self._set_attribute("CreatingActor", value)
+
+    @property
+    def CreationTime(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute CreationTime?: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("CreationTime")
+
+    @CreationTime.setter
+    def CreationTime(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("CreationTime", value)
+
+    @property
+    def UserDefinedGrade(self)-> str:
+        """<attribute UserDefinedGrade?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedGrade")
+
+    @UserDefinedGrade.setter
+    def UserDefinedGrade(self, value: str):
+        return self._set_attribute("UserDefinedGrade", value)
+
+    def ClassifiedAs(self)-> list["IfcConstraintClassificationRelationship"]:
+        """<inverse ClassifiedAs: set [0:?] of <entity IfcConstraintClassificationRelationship> for <attribute ClassifiedConstraint: <entity IfcConstraint>>>"""
+        return self._get_inverse_attribute("ClassifiedAs")
+
+    def RelatesConstraints(self)-> list["IfcConstraintRelationship"]:
+        """<inverse RelatesConstraints: set [0:?] of <entity IfcConstraintRelationship> for <attribute RelatingConstraint: <entity IfcConstraint>>>"""
+        return self._get_inverse_attribute("RelatesConstraints")
+
+    def IsRelatedWith(self)-> list["IfcConstraintRelationship"]:
+        """<inverse IsRelatedWith: set [0:?] of <entity IfcConstraintRelationship> for <attribute RelatedConstraints: <set [1:?] of <entity IfcConstraint>>>>"""
+        return self._get_inverse_attribute("IsRelatedWith")
+
+    def PropertiesForConstraint(self)-> list["IfcPropertyConstraintRelationship"]:
+        """<inverse PropertiesForConstraint: set [0:?] of <entity IfcPropertyConstraintRelationship> for <attribute RelatingConstraint: <entity IfcConstraint>>>"""
+        return self._get_inverse_attribute("PropertiesForConstraint")
+
+    def Aggregates(self)-> list["IfcConstraintAggregationRelationship"]:
+        """<inverse Aggregates: set [0:?] of <entity IfcConstraintAggregationRelationship> for <attribute RelatingConstraint: <entity IfcConstraint>>>"""
+        return self._get_inverse_attribute("Aggregates")
+
+    def IsAggregatedIn(self)-> list["IfcConstraintAggregationRelationship"]:
+        """<inverse IsAggregatedIn: set [0:?] of <entity IfcConstraintAggregationRelationship> for <attribute RelatedConstraints: <list [1:?] of <entity IfcConstraint>>>>"""
+        return self._get_inverse_attribute("IsAggregatedIn")
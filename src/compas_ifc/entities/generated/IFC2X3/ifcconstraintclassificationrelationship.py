@@ -0,0 +1,29 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcclassificationnotation import IfcClassificationNotation
+    from .ifcclassificationreference import IfcClassificationReference
+    from .ifcconstraint import IfcConstraint
+
+class IfcConstraintClassificationRelationship(Base):
+    """Wrapper class for IfcConstraintClassificationRelationship."""
+
+    @property
+    def ClassifiedConstraint(self)-> "IfcConstraint":
+        """<attribute ClassifiedConstraint: <entity IfcConstraint>>"""
+        return self._get_attribute("ClassifiedConstraint")
+
+    @ClassifiedConstraint.setter
+    def ClassifiedConstraint(self, value: "IfcConstraint"):
+        return self._set_attribute("ClassifiedConstraint", value)
+
+    @property
+    def RelatedClassifications(self)-> list[Union["IfcClassificationReference", "IfcClassificationNotation"]]:
+        """<attribute RelatedClassifications: <set [1:?] of <select IfcClassificationNotationSelect: (<entity IfcClassificationNotation> | <entity IfcClassificationReference>)>>>"""
+        return self._get_attribute("RelatedClassifications")
+
+    @RelatedClassifications.setter
+    def RelatedClassifications(self, value: list[Union["IfcClassificationReference", "IfcClassificationNotation"]]):
+        return self._set_attribute("RelatedClassifications", value)
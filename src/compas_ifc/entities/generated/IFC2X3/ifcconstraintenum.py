@@ -0,0 +1,2 @@
+class IfcConstraintEnum(str):
+    items = ['HARD', 'SOFT', 'ADVISORY', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,44 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcconstraint import IfcConstraint
+
+class IfcConstraintRelationship(Base):
+    """Wrapper class for IfcConstraintRelationship."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def RelatingConstraint(self)-> "IfcConstraint":
+        """<attribute RelatingConstraint: <entity IfcConstraint>>"""
+        return self._get_attribute("RelatingConstraint")
+
+    @RelatingConstraint.setter
+    def RelatingConstraint(self, value: "IfcConstraint"):
+        return self._set_attribute("RelatingConstraint", value)
+
+    @property
+    def RelatedConstraints(self)-> list["IfcConstraint"]:
+        """<attribute RelatedConstraints: <set [1:?] of <entity IfcConstraint>>>"""
+        return self._get_attribute("RelatedConstraints")
+
+    @RelatedConstraints.setter
+    def RelatedConstraints(self, value: list["IfcConstraint"]):
+        return self._set_attribute("RelatedConstraints", value)
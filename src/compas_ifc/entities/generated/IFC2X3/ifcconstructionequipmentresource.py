@@ -0,0 +1,5 @@
+from .ifcconstructionresource import IfcConstructionResource
+
+
+class IfcConstructionEquipmentResource(IfcConstructionResource):
+    """Wrapper class for IfcConstructionEquipmentResource."""
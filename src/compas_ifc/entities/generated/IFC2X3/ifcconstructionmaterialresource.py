@@ -0,0 +1,29 @@
+from .ifcconstructionresource import IfcConstructionResource
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcorganization import IfcOrganization
+    from .ifcperson import IfcPerson
+    from .ifcpersonandorganization import IfcPersonAndOrganization
+
+class IfcConstructionMaterialResource(IfcConstructionResource):
+    """Wrapper class for IfcConstructionMaterialResource."""
+
+    @property
+    def Suppliers(self)-> list[Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]]:
+        """<attribute Suppliers?: <set [1:?] of <select IfcActorSelect: (<entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization>)>>>"""
+        return self._get_attribute("Suppliers")
+
+    @Suppliers.setter
+    def Suppliers(self, value: list[Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]]):
+        return self._set_attribute("Suppliers", value)
+
+    @property
+    def UsageRatio(self)-> float:
+        """<attribute UsageRatio?: <type IfcRatioMeasure: <real>>>"""
+        return self._get_attribute("UsageRatio")
+
+    @UsageRatio.setter
+    def UsageRatio(self, value: float):
+        return self._set_attribute("UsageRatio", value)
@@ -0,0 +1,5 @@
+from .ifcconstructionresource import IfcConstructionResource
+
+
+class IfcConstructionProductResource(IfcConstructionResource):
+    """Wrapper class for IfcConstructionProductResource."""
@@ -0,0 +1,45 @@
+from .ifcresource import IfcResource
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmeasurewithunit import IfcMeasureWithUnit
+    from .ifcresourceconsumptionenum import IfcResourceConsumptionEnum
+
+class IfcConstructionResource(IfcResource):
+    """Wrapper class for IfcConstructionResource."""
+
+    @property
+    def ResourceIdentifier(self)-> str:
+        """<attribute ResourceIdentifier?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("ResourceIdentifier")
+
+    @ResourceIdentifier.setter
+    def ResourceIdentifier(self, value: str):
+        return self._set_attribute("ResourceIdentifier", value)
+
+    @property
+    def ResourceGroup(self)-> str:
+        """<attribute ResourceGroup?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ResourceGroup")
+
+    @ResourceGroup.setter
+    def ResourceGroup(self, value: str):
+        return self._set_attribute("ResourceGroup", value)
+
+    @property
+    def ResourceConsumption(self)-> "IfcResourceConsumptionEnum":
+        """<attribute ResourceConsumption?: <enumeration IfcResourceConsumptionEnum: (CONSUMED, PARTIALLYCONSUMED, NOTCONSUMED, OCCUPIED, PARTIALLYOCCUPIED, NOTOCCUPIED, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("ResourceConsumption")
+
+    @ResourceConsumption.setter
+    def ResourceConsumption(self, value: "IfcResourceConsumptionEnum"):
+        return self._set_attribute("ResourceConsumption", value)
+
+    @property
+    def BaseQuantity(self)-> "IfcMeasureWithUnit":
+        """<attribute BaseQuantity?: <entity IfcMeasureWithUnit>>"""
+        return self._get_attribute("BaseQuantity")
+
+    @BaseQuantity.setter
+    def BaseQuantity(self, value: "IfcMeasureWithUnit"):
+        return self._set_attribute("BaseQuantity", value)
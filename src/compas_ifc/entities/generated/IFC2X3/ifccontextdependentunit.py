@@ -0,0 +1,14 @@
+from .ifcnamedunit import IfcNamedUnit
+
+
+class IfcContextDependentUnit(IfcNamedUnit):
+    """Wrapper class for IfcContextDependentUnit."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
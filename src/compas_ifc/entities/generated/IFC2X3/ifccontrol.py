@@ -0,0 +1,12 @@
+from .ifcobject import IfcObject
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelassignstocontrol import IfcRelAssignsToControl
+
+class IfcControl(IfcObject):
+    """Wrapper class for IfcControl."""
+
+    def Controls(self)-> list["IfcRelAssignsToControl"]:
+        """<inverse Controls: set [0:?] of <entity IfcRelAssignsToControl> for <attribute RelatingControl: <entity IfcControl>>>"""
+        return self._get_inverse_attribute("Controls")
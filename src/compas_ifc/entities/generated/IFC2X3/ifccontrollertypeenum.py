@@ -0,0 +1,2 @@
+class IfcControllerTypeEnum(str):
+    items = ['FLOATING', 'PROPORTIONAL', 'PROPORTIONALINTEGRAL', 'PROPORTIONALINTEGRALDERIVATIVE', 'TIMEDTWOPOSITION', 'TWOPOSITION', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,26 @@
+from .ifcnamedunit import IfcNamedUnit
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmeasurewithunit import IfcMeasureWithUnit
+
+class IfcConversionBasedUnit(IfcNamedUnit):
+    """Wrapper class for IfcConversionBasedUnit."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def ConversionFactor(self)-> "IfcMeasureWithUnit":
+        """<attribute ConversionFactor: <entity IfcMeasureWithUnit>>"""
+        return self._get_attribute("ConversionFactor")
+
+    @ConversionFactor.setter
+    def ConversionFactor(self, value: "IfcMeasureWithUnit"):
+        return self._set_attribute("ConversionFactor", value)
@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevicetype import IfcEnergyConversionDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccoolingtowertypeenum import IfcCoolingTowerTypeEnum
+
+class IfcCoolingTowerType(IfcEnergyConversionDeviceType):
+    """Wrapper class for IfcCoolingTowerType."""
+
+    @property
+    def PredefinedType(self)-> "IfcCoolingTowerTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcCoolingTowerTypeEnum: (NATURALDRAFT, MECHANICALINDUCEDDRAFT, MECHANICALFORCEDDRAFT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcCoolingTowerTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
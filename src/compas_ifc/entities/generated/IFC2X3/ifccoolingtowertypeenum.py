@@ -0,0 +1,2 @@
+class IfcCoolingTowerTypeEnum(str):
+    items = ['NATURALDRAFT', 'MECHANICALINDUCEDDRAFT', 'MECHANICALFORCEDDRAFT', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,35 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaheadorbehind import IfcAheadOrBehind
+
+class IfcCoordinatedUniversalTimeOffset(Base):
+    """Wrapper class for IfcCoordinatedUniversalTimeOffset."""
+
+    @property
+    def HourOffset(self)-> int:
+        """<attribute HourOffset: <type IfcHourInDay: <integer>>>"""
+        return self._get_attribute("HourOffset")
+
+    @HourOffset.setter
+    def HourOffset(self, value: int):
+        return self._set_attribute("HourOffset", value)
+
+    @property
+    def MinuteOffset(self)-> int:
+        """<attribute MinuteOffset?: <type IfcMinuteInHour: <integer>>>"""
+        return self._get_attribute("MinuteOffset")
+
+    @MinuteOffset.setter
+    def MinuteOffset(self, value: int):
+        return self._set_attribute("MinuteOffset", value)
+
+    @property
+    def Sense(self)-> "IfcAheadOrBehind":
+        """<attribute Sense: <enumeration IfcAheadOrBehind: (AHEAD, BEHIND)>>"""
+        return self._get_attribute("Sense")
+
+    @Sense.setter
+    def Sense(self, value: "IfcAheadOrBehind"):
+        return self._set_attribute("Sense", value)
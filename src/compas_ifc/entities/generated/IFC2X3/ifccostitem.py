@@ -0,0 +1,5 @@
+from .ifccontrol import IfcControl
+
+
+class IfcCostItem(IfcControl):
+    """Wrapper class for IfcCostItem."""
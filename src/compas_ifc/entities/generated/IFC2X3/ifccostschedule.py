@@ -0,0 +1,87 @@
+from .ifccontrol import IfcControl
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccalendardate import IfcCalendarDate
+    from .ifccostscheduletypeenum import IfcCostScheduleTypeEnum
+    from .ifcdateandtime import IfcDateAndTime
+    from .ifclocaltime import IfcLocalTime
+    from .ifcorganization import IfcOrganization
+    from .ifcperson import IfcPerson
+    from .ifcpersonandorganization import IfcPersonAndOrganization
+
+class IfcCostSchedule(IfcControl):
+    """Wrapper class for IfcCostSchedule."""
+
+    @property
+    def SubmittedBy(self)-> Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]:
+        """<attribute SubmittedBy?: <select IfcActorSelect: (<entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization>)>>"""
+        return self._get_attribute("SubmittedBy")
+
+    @SubmittedBy.setter
+    def SubmittedBy(self, value: Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]):
+        return self._set_attribute("SubmittedBy", value)
+
+    @property
+    def PreparedBy(self)-> Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]:
+        """<attribute PreparedBy?: <select IfcActorSelect: (<entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization>)>>"""
+        return self._get_attribute("PreparedBy")
+
+    @PreparedBy.setter
+    def PreparedBy(self, value: Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]):
+        return self._set_attribute("PreparedBy", value)
+
+    @property
+    def SubmittedOn(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute SubmittedOn?: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("SubmittedOn")
+
+    @SubmittedOn.setter
+    def SubmittedOn(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("SubmittedOn", value)
+
+    @property
+    def Status(self)-> str:
+        """<attribute Status?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Status")
+
+    @Status.setter
+    def Status(self, value: str):
+        return self._set_attribute("Status", value)
+
+    @property
+    def TargetUsers(self)-> list[Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]]:
+        """<attribute TargetUsers?: <set [1:?] of <select IfcActorSelect: (<entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization>)>>>"""
+        return self._get_attribute("TargetUsers")
+
+    @TargetUsers.setter
+    def TargetUsers(self, value: list[Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]]):
+        return self._set_attribute("TargetUsers", value)
+
+    @property
+    def UpdateDate(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute UpdateDate?: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("UpdateDate")
+
+    @UpdateDate.setter
+    def UpdateDate(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("UpdateDate", value)
+
+    @property
+    def ID(self)-> str:
+        """<attribute ID: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("ID")
+
+    @ID.setter
+    def ID(self, value: str):
+        return self._set_attribute("ID", value)
+
+    @property
+    def PredefinedType(self)-> "IfcCostScheduleTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcCostScheduleTypeEnum: (BUDGET, COSTPLAN, ESTIMATE, TENDER, PRICEDBILLOFQUANTITIES, UNPRICEDBILLOFQUANTITIES, SCHEDULEOFRATES, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcCostScheduleTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcCostScheduleTypeEnum(str):
+    items = ['BUDGET', 'COSTPLAN', 'ESTIMATE', 'TENDER', 'PRICEDBILLOFQUANTITIES', 'UNPRICEDBILLOFQUANTITIES', 'SCHEDULEOFRATES', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,23 @@
+from .ifcappliedvalue import IfcAppliedValue
+
+
+class IfcCostValue(IfcAppliedValue):
+    """Wrapper class for IfcCostValue."""
+
+    @property
+    def CostType(self)-> str:
+        """<attribute CostType: <type IfcLabel: <string>>>"""
+        return self._get_attribute("CostType")
+
+    @CostType.setter
+    def CostType(self, value: str):
+        return self._set_attribute("CostType", value)
+
+    @property
+    def Condition(self)-> str:
+        """<attribute Condition?: <type IfcText: <string>>>"""
+        return self._get_attribute("Condition")
+
+    @Condition.setter
+    def Condition(self, value: str):
+        return self._set_attribute("Condition", value)
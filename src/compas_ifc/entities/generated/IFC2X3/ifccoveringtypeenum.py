@@ -0,0 +1,2 @@
+class IfcCoveringTypeEnum(str):
+    items = ['CEILING', 'FLOORING', 'CLADDING', 'ROOFING', 'INSULATION', 'MEMBRANE', 'SLEEVING', 'WRAPPING', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,113 @@
+from .ifcparameterizedprofiledef import IfcParameterizedProfileDef
+
+
+class IfcCraneRailAShapeProfileDef(IfcParameterizedProfileDef):
+    """Wrapper class for IfcCraneRailAShapeProfileDef."""
+
+    @property
+    def OverallHeight(self)-> float:
+        """<attribute OverallHeight: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("OverallHeight")
+
+    @OverallHeight.setter
+    def OverallHeight(self, value: float):
+        return self._set_attribute("OverallHeight", value)
+
+    @property
+    def BaseWidth2(self)-> float:
+        """<attribute BaseWidth2: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("BaseWidth2")
+
+    @BaseWidth2.setter
+    def BaseWidth2(self, value: float):
+        return self._set_attribute("BaseWidth2", value)
+
+    @property
+    def Radius(self)-> float:
+        """<attribute Radius?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Radius")
+
+    @Radius.setter
+    def Radius(self, value: float):
+        return self._set_attribute("Radius", value)
+
+    @property
+    def HeadWidth(self)-> float:
+        """<attribute HeadWidth: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("HeadWidth")
+
+    @HeadWidth.setter
+    def HeadWidth(self, value: float):
+        return self._set_attribute("HeadWidth", value)
+
+    @property
+    def HeadDepth2(self)-> float:
+        """<attribute HeadDepth2: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("HeadDepth2")
+
+    @HeadDepth2.setter
+    def HeadDepth2(self, value: float):
+        return self._set_attribute("HeadDepth2", value)
+
+    @property
+    def HeadDepth3(self)-> float:
+        """<attribute HeadDepth3: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("HeadDepth3")
+
+    @HeadDepth3.setter
+    def HeadDepth3(self, value: float):
+        return self._set_attribute("HeadDepth3", value)
+
+    @property
+    def WebThickness(self)-> float:
+        """<attribute WebThickness: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("WebThickness")
+
+    @WebThickness.setter
+    def WebThickness(self, value: float):
+        return self._set_attribute("WebThickness", value)
+
+    @property
+    def BaseWidth4(self)-> float:
+        """<attribute BaseWidth4: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("BaseWidth4")
+
+    @BaseWidth4.setter
+    def BaseWidth4(self, value: float):
+        return self._set_attribute("BaseWidth4", value)
+
+    @property
+    def BaseDepth1(self)-> float:
+        """<attribute BaseDepth1: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("BaseDepth1")
+
+    @BaseDepth1.setter
+    def BaseDepth1(self, value: float):
+        return self._set_attribute("BaseDepth1", value)
+
+    @property
+    def BaseDepth2(self)-> float:
+        """<attribute BaseDepth2: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("BaseDepth2")
+
+    @BaseDepth2.setter
+    def BaseDepth2(self, value: float):
+        return self._set_attribute("BaseDepth2", value)
+
+    @property
+    def BaseDepth3(self)-> float:
+        """<attribute BaseDepth3: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("BaseDepth3")
+
+    @BaseDepth3.setter
+    def BaseDepth3(self, value: float):
+        return self._set_attribute("BaseDepth3", value)
+
+    @property
+    def CentreOfGravityInY(self)-> float:
+        """<attribute CentreOfGravityInY?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("CentreOfGravityInY")
+
+    @CentreOfGravityInY.setter
+    def CentreOfGravityInY(self, value: float):
+        return self._set_attribute("CentreOfGravityInY", value)
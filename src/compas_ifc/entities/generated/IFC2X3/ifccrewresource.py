@@ -0,0 +1,5 @@
+from .ifcconstructionresource import IfcConstructionResource
+
+
+class IfcCrewResource(IfcConstructionResource):
+    """Wrapper class for IfcCrewResource."""
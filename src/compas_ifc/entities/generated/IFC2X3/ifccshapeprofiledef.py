@@ -0,0 +1,59 @@
+from .ifcparameterizedprofiledef import IfcParameterizedProfileDef
+
+
+class IfcCShapeProfileDef(IfcParameterizedProfileDef):
+    """Wrapper class for IfcCShapeProfileDef."""
+
+    @property
+    def Depth(self)-> float:
+        """<attribute Depth: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Depth")
+
+    @Depth.setter
+    def Depth(self, value: float):
+        return self._set_attribute("Depth", value)
+
+    @property
+    def Width(self)-> float:
+        """<attribute Width: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Width")
+
+    @Width.setter
+    def Width(self, value: float):
+        return self._set_attribute("Width", value)
+
+    @property
+    def WallThickness(self)-> float:
+        """<attribute WallThickness: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("WallThickness")
+
+    @WallThickness.setter
+    def WallThickness(self, value: float):
+        return self._set_attribute("WallThickness", value)
+
+    @property
+    def Girth(self)-> float:
+        """<attribute Girth: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Girth")
+
+    @Girth.setter
+    def Girth(self, value: float):
+        return self._set_attribute("Girth", value)
+
+    @property
+    def InternalFilletRadius(self)-> float:
+        """<attribute InternalFilletRadius?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("InternalFilletRadius")
+
+    @InternalFilletRadius.setter
+    def InternalFilletRadius(self, value: float):
+        return self._set_attribute("InternalFilletRadius", value)
+
+    @property
+    def CentreOfGravityInX(self)-> float:
+        """<attribute CentreOfGravityInX?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("CentreOfGravityInX")
+
+    @CentreOfGravityInX.setter
+    def CentreOfGravityInX(self, value: float):
+        return self._set_attribute("CentreOfGravityInX", value)
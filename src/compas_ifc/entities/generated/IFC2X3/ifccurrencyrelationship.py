@@ -0,0 +1,55 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdateandtime import IfcDateAndTime
+    from .ifclibraryinformation import IfcLibraryInformation
+    from .ifcmonetaryunit import IfcMonetaryUnit
+
+class IfcCurrencyRelationship(Base):
+    """Wrapper class for IfcCurrencyRelationship."""
+
+    @property
+    def RelatingMonetaryUnit(self)-> "IfcMonetaryUnit":
+        """<attribute RelatingMonetaryUnit: <entity IfcMonetaryUnit>>"""
+        return self._get_attribute("RelatingMonetaryUnit")
+
+    @RelatingMonetaryUnit.setter
+    def RelatingMonetaryUnit(self, value: "IfcMonetaryUnit"):
+        return self._set_attribute("RelatingMonetaryUnit", value)
+
+    @property
+    def RelatedMonetaryUnit(self)-> "IfcMonetaryUnit":
+        """<attribute RelatedMonetaryUnit: <entity IfcMonetaryUnit>>"""
+        return self._get_attribute("RelatedMonetaryUnit")
+
+    @RelatedMonetaryUnit.setter
+    def RelatedMonetaryUnit(self, value: "IfcMonetaryUnit"):
+        return self._set_attribute("RelatedMonetaryUnit", value)
+
+    @property
+    def ExchangeRate(self)-> float:
+        """<attribute ExchangeRate: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("ExchangeRate")
+
+    @ExchangeRate.setter
+    def ExchangeRate(self, value: float):
+        return self._set_attribute("ExchangeRate", value)
+
+    @property
+    def RateDateTime(self)-> "IfcDateAndTime":
+        """<attribute RateDateTime: <entity IfcDateAndTime>>"""
+        return self._get_attribute("RateDateTime")
+
+    @RateDateTime.setter
+    def RateDateTime(self, value: "IfcDateAndTime"):
+        return self._set_attribute("RateDateTime", value)
+
+    @property
+    def RateSource(self)-> "IfcLibraryInformation":
+        """<attribute RateSource?: <entity IfcLibraryInformation>>"""
+        return self._get_attribute("RateSource")
+
+    @RateSource.setter
+    def RateSource(self, value: "IfcLibraryInformation"):
+        return self._set_attribute("RateSource", value)
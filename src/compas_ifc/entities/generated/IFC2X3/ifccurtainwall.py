@@ -0,0 +1,5 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+
+class IfcCurtainWall(IfcBuildingElement):
+    """Wrapper class for IfcCurtainWall."""
@@ -0,0 +1,2 @@
+class IfcCurtainWallTypeEnum(str):
+    items = ['USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,5 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+
+class IfcCurve(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcCurve."""
@@ -0,0 +1,37 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccurvestylefont import IfcCurveStyleFont
+    from .ifcpredefinedcurvefont import IfcPreDefinedCurveFont
+
+class IfcCurveStyleFontAndScaling(Base):
+    """Wrapper class for IfcCurveStyleFontAndScaling."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def CurveFont(self)-> Union["IfcPreDefinedCurveFont", "IfcCurveStyleFont"]:
+        """<attribute CurveFont: <select IfcCurveStyleFontSelect: (<entity IfcCurveStyleFont> | <entity IfcPreDefinedCurveFont>)>>"""
+        return self._get_attribute("CurveFont")
+
+    @CurveFont.setter
+    def CurveFont(self, value: Union["IfcPreDefinedCurveFont", "IfcCurveStyleFont"]):
+        return self._set_attribute("CurveFont", value)
+
+    @property
+    def CurveFontScaling(self)-> float:
+        """<attribute CurveFontScaling: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("CurveFontScaling")
+
+    @CurveFontScaling.setter
+    def CurveFontScaling(self, value: float):
+        return self._set_attribute("CurveFontScaling", value)
@@ -0,0 +1,17 @@
+from .ifcflowcontrollertype import IfcFlowControllerType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdampertypeenum import IfcDamperTypeEnum
+
+class IfcDamperType(IfcFlowControllerType):
+    """Wrapper class for IfcDamperType."""
+
+    @property
+    def PredefinedType(self)-> "IfcDamperTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcDamperTypeEnum: (CONTROLDAMPER, FIREDAMPER, SMOKEDAMPER, FIRESMOKEDAMPER, BACKDRAFTDAMPER, RELIEFDAMPER, BLASTDAMPER, GRAVITYDAMPER, GRAVITYRELIEFDAMPER, BALANCINGDAMPER, FUMEHOODEXHAUST, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcDamperTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
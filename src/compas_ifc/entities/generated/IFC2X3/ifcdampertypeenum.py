@@ -0,0 +1,2 @@
+class IfcDamperTypeEnum(str):
+    items = ['CONTROLDAMPER', 'FIREDAMPER', 'SMOKEDAMPER', 'FIRESMOKEDAMPER', 'BACKDRAFTDAMPER', 'RELIEFDAMPER', 'BLASTDAMPER', 'GRAVITYDAMPER', 'GRAVITYRELIEFDAMPER', 'BALANCINGDAMPER', 'FUMEHOODEXHAUST', 'USERDEFINED', 'NOTDEFINED']
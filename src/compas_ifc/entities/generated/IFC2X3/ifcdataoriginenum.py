@@ -0,0 +1,2 @@
+class IfcDataOriginEnum(str):
+    items = ['MEASURED', 'PREDICTED', 'SIMULATED', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,27 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccalendardate import IfcCalendarDate
+    from .ifclocaltime import IfcLocalTime
+
+class IfcDateAndTime(Base):
+    """Wrapper class for IfcDateAndTime."""
+
+    @property
+    def DateComponent(self)-> "IfcCalendarDate":
+        """<attribute DateComponent: <entity IfcCalendarDate>>"""
+        return self._get_attribute("DateComponent")
+
+    @DateComponent.setter
+    def DateComponent(self, value: "IfcCalendarDate"):
+        return self._set_attribute("DateComponent", value)
+
+    @property
+    def TimeComponent(self)-> "IfcLocalTime":
+        """<attribute TimeComponent: <entity IfcLocalTime>>"""
+        return self._get_attribute("TimeComponent")
+
+    @TimeComponent.setter
+    def TimeComponent(self, value: "IfcLocalTime"):
+        return self._set_attribute("TimeComponent", value)
@@ -0,0 +1,29 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccartesiantransformationoperator2d import IfcCartesianTransformationOperator2D
+    from .ifcexternallydefinedsymbol import IfcExternallyDefinedSymbol
+    from .ifcpredefinedsymbol import IfcPreDefinedSymbol
+
+class IfcDefinedSymbol(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcDefinedSymbol."""
+
+    @property
+    def Definition(self)-> Union["IfcExternallyDefinedSymbol", "IfcPreDefinedSymbol"]:
+        """<attribute Definition: <select IfcDefinedSymbolSelect: (<entity IfcExternallyDefinedSymbol> | <entity IfcPreDefinedSymbol>)>>"""
+        return self._get_attribute("Definition")
+
+    @Definition.setter
+    def Definition(self, value: Union["IfcExternallyDefinedSymbol", "IfcPreDefinedSymbol"]):
+        return self._set_attribute("Definition", value)
+
+    @property
+    def Target(self)-> "IfcCartesianTransformationOperator2D":
+        """<attribute Target: <entity IfcCartesianTransformationOperator2D>>"""
+        return self._get_attribute("Target")
+
+    @Target.setter
+    def Target(self, value: "IfcCartesianTransformationOperator2D"):
+        return self._set_attribute("Target", value)
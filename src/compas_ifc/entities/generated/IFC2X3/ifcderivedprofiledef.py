@@ -0,0 +1,36 @@
+from .ifcprofiledef import IfcProfileDef
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccartesiantransformationoperator2d import IfcCartesianTransformationOperator2D
+    from .ifcprofiledef import IfcProfileDef
+
+class IfcDerivedProfileDef(IfcProfileDef):
+    """Wrapper class for IfcDerivedProfileDef."""
+
+    @property
+    def ParentProfile(self)-> "IfcProfileDef":
+        """<attribute ParentProfile: <entity IfcProfileDef>>"""
+        return self._get_attribute("ParentProfile")
+
+    @ParentProfile.setter
+    def ParentProfile(self, value: "IfcProfileDef"):
+        return self._set_attribute("ParentProfile", value)
+
+    @property
+    def Operator(self)-> "IfcCartesianTransformationOperator2D":
+        """<attribute Operator: <entity IfcCartesianTransformationOperator2D>>"""
+        return self._get_attribute("Operator")
+
+    @Operator.setter
+    def Operator(self, value: "IfcCartesianTransformationOperator2D"):
+        return self._set_attribute("Operator", value)
+
+    @property
+    def Label(self)-> str:
+        """<attribute Label?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Label")
+
+    @Label.setter
+    def Label(self, value: str):
+        return self._set_attribute("Label", value)
@@ -0,0 +1,5 @@
+from .ifcdimensioncurvedirectedcallout import IfcDimensionCurveDirectedCallout
+
+
+class IfcDiameterDimension(IfcDimensionCurveDirectedCallout):
+    """Wrapper class for IfcDiameterDimension."""
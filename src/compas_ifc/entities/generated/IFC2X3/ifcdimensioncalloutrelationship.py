@@ -0,0 +1,5 @@
+from .ifcdraughtingcalloutrelationship import IfcDraughtingCalloutRelationship
+
+
+class IfcDimensionCalloutRelationship(IfcDraughtingCalloutRelationship):
+    """Wrapper class for IfcDimensionCalloutRelationship."""
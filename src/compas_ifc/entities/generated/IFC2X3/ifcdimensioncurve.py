@@ -0,0 +1,12 @@
+from .ifcannotationcurveoccurrence import IfcAnnotationCurveOccurrence
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcterminatorsymbol import IfcTerminatorSymbol
+
+class IfcDimensionCurve(IfcAnnotationCurveOccurrence):
+    """Wrapper class for IfcDimensionCurve."""
+
+    def AnnotatedBySymbols(self)-> list["IfcTerminatorSymbol"]:
+        """<inverse AnnotatedBySymbols: set [0:2] of <entity IfcTerminatorSymbol> for <attribute AnnotatedCurve: <entity IfcAnnotationCurveOccurrence>>>"""
+        return self._get_inverse_attribute("AnnotatedBySymbols")
@@ -0,0 +1,5 @@
+from .ifcdraughtingcallout import IfcDraughtingCallout
+
+
+class IfcDimensionCurveDirectedCallout(IfcDraughtingCallout):
+    """Wrapper class for IfcDimensionCurveDirectedCallout."""
@@ -0,0 +1,17 @@
+from .ifcterminatorsymbol import IfcTerminatorSymbol
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdimensionextentusage import IfcDimensionExtentUsage
+
+class IfcDimensionCurveTerminator(IfcTerminatorSymbol):
+    """Wrapper class for IfcDimensionCurveTerminator."""
+
+    @property
+    def Role(self)-> "IfcDimensionExtentUsage":
+        """<attribute Role: <enumeration IfcDimensionExtentUsage: (ORIGIN, TARGET)>>"""
+        return self._get_attribute("Role")
+
+    @Role.setter
+    def Role(self, value: "IfcDimensionExtentUsage"):
+        return self._set_attribute("Role", value)
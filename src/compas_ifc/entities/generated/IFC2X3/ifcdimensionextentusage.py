@@ -0,0 +1,2 @@
+class IfcDimensionExtentUsage(str):
+    items = ['ORIGIN', 'TARGET']
@@ -0,0 +1,5 @@
+from .ifcdraughtingcalloutrelationship import IfcDraughtingCalloutRelationship
+
+
+class IfcDimensionPair(IfcDraughtingCalloutRelationship):
+    """Wrapper class for IfcDimensionPair."""
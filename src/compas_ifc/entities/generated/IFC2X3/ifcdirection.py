@@ -0,0 +1,14 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+
+class IfcDirection(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcDirection."""
+
+    @property
+    def DirectionRatios(self)-> list[float]:
+        """<attribute DirectionRatios: <list [2:3] of <real>>>"""
+        return self._get_attribute("DirectionRatios")
+
+    @DirectionRatios.setter
+    def DirectionRatios(self, value: list[float]):
+        return self._set_attribute("DirectionRatios", value)
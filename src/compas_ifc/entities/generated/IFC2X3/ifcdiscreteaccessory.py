@@ -0,0 +1,5 @@
+from .ifcelementcomponent import IfcElementComponent
+
+
+class IfcDiscreteAccessory(IfcElementComponent):
+    """Wrapper class for IfcDiscreteAccessory."""
@@ -0,0 +1,5 @@
+from .ifcelementcomponenttype import IfcElementComponentType
+
+
+class IfcDiscreteAccessoryType(IfcElementComponentType):
+    """Wrapper class for IfcDiscreteAccessoryType."""
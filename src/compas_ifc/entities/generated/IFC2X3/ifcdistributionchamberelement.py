@@ -0,0 +1,5 @@
+from .ifcdistributionflowelement import IfcDistributionFlowElement
+
+
+class IfcDistributionChamberElement(IfcDistributionFlowElement):
+    """Wrapper class for IfcDistributionChamberElement."""
@@ -0,0 +1,21 @@
+from .ifcdistributionelement import IfcDistributionElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelflowcontrolelements import IfcRelFlowControlElements
+
+class IfcDistributionControlElement(IfcDistributionElement):
+    """Wrapper class for IfcDistributionControlElement."""
+
+    @property
+    def ControlElementId(self)-> str:
+        """<attribute ControlElementId?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("ControlElementId")
+
+    @ControlElementId.setter
+    def ControlElementId(self, value: str):
+        return self._set_attribute("ControlElementId", value)
+
+    def AssignedToFlowElement(self)-> list["IfcRelFlowControlElements"]:
+        """<inverse AssignedToFlowElement: set [0:1] of <entity IfcRelFlowControlElements> for <attribute RelatedControlElements: <set [1:?] of <entity IfcDistributionControlElement>>>>"""
+        return self._get_inverse_attribute("AssignedToFlowElement")
@@ -0,0 +1,5 @@
+from .ifcelement import IfcElement
+
+
+class IfcDistributionElement(IfcElement):
+    """Wrapper class for IfcDistributionElement."""
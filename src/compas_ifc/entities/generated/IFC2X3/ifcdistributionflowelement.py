@@ -0,0 +1,12 @@
+from .ifcdistributionelement import IfcDistributionElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelflowcontrolelements import IfcRelFlowControlElements
+
+class IfcDistributionFlowElement(IfcDistributionElement):
+    """Wrapper class for IfcDistributionFlowElement."""
+
+    def HasControlElements(self)-> list["IfcRelFlowControlElements"]:
+        """<inverse HasControlElements: set [0:1] of <entity IfcRelFlowControlElements> for <attribute RelatingFlowElement: <entity IfcDistributionFlowElement>>>"""
+        return self._get_inverse_attribute("HasControlElements")
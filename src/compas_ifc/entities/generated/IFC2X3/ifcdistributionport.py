@@ -0,0 +1,17 @@
+from .ifcport import IfcPort
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcflowdirectionenum import IfcFlowDirectionEnum
+
+class IfcDistributionPort(IfcPort):
+    """Wrapper class for IfcDistributionPort."""
+
+    @property
+    def FlowDirection(self)-> "IfcFlowDirectionEnum":
+        """<attribute FlowDirection?: <enumeration IfcFlowDirectionEnum: (SOURCE, SINK, SOURCEANDSINK, NOTDEFINED)>>"""
+        return self._get_attribute("FlowDirection")
+
+    @FlowDirection.setter
+    def FlowDirection(self, value: "IfcFlowDirectionEnum"):
+        return self._set_attribute("FlowDirection", value)
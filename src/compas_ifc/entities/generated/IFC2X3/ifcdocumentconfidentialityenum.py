@@ -0,0 +1,2 @@
+class IfcDocumentConfidentialityEnum(str):
+    items = ['PUBLIC', 'RESTRICTED', 'CONFIDENTIAL', 'PERSONAL', 'USERDEFINED', 'NOTDEFINED']
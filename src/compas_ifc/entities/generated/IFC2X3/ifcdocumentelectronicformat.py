@@ -0,0 +1,32 @@
+from compas_ifc.entities.base import Base
+
+
+class IfcDocumentElectronicFormat(Base):
+    """Wrapper class for IfcDocumentElectronicFormat."""
+
+    @property
+    def FileExtension(self)-> str:
+        """<attribute FileExtension?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("FileExtension")
+
+    @FileExtension.setter
+    def FileExtension(self, value: str):
+        return self._set_attribute("FileExtension", value)
+
+    @property
+    def MimeContentType(self)-> str:
+        """<attribute MimeContentType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("MimeContentType")
+
+    @MimeContentType.setter
+    def MimeContentType(self, value: str):
+        return self._set_attribute("MimeContentType", value)
+
+    @property
+    def MimeSubtype(self)-> str:
+        """<attribute MimeSubtype?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("MimeSubtype")
+
+    @MimeSubtype.setter
+    def MimeSubtype(self, value: str):
+        return self._set_attribute("MimeSubtype", value)
@@ -0,0 +1,179 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccalendardate import IfcCalendarDate
+    from .ifcdateandtime import IfcDateAndTime
+    from .ifcdocumentconfidentialityenum import IfcDocumentConfidentialityEnum
+    from .ifcdocumentelectronicformat import IfcDocumentElectronicFormat
+    from .ifcdocumentinformationrelationship import IfcDocumentInformationRelationship
+    from .ifcdocumentreference import IfcDocumentReference
+    from .ifcdocumentstatusenum import IfcDocumentStatusEnum
+    from .ifcorganization import IfcOrganization
+    from .ifcperson import IfcPerson
+    from .ifcpersonandorganization import IfcPersonAndOrganization
+
+class IfcDocumentInformation(Base):
+    """Wrapper class for IfcDocumentInformation."""
+
+    @property
+    def DocumentId(self)-> str:
+        """<attribute DocumentId: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("DocumentId")
+
+    @DocumentId.setter
+    def DocumentId(self, value: str):
+        return self._set_attribute("DocumentId", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def DocumentReferences(self)-> list["IfcDocumentReference"]:
+        """<attribute DocumentReferences?: <set [1:?] of <entity IfcDocumentReference>>>"""
+        return self._get_attribute("DocumentReferences")
+
+    @DocumentReferences.setter
+    def DocumentReferences(self, value: list["IfcDocumentReference"]):
+        return self._set_attribute("DocumentReferences", value)
+
+    @property
+    def Purpose(self)-> str:
+        """<attribute Purpose?: <type IfcText: <string>>>"""
+        return self._get_attribute("Purpose")
+
+    @Purpose.setter
+    def Purpose(self, value: str):
+        return self._set_attribute("Purpose", value)
+
+    @property
+    def IntendedUse(self)-> str:
+        """<attribute IntendedUse?: <type IfcText: <string>>>"""
+        return self._get_attribute("IntendedUse")
+
+    @IntendedUse.setter
+    def IntendedUse(self, value: str):
+        return self._set_attribute("IntendedUse", value)
+
+    @property
+    def Scope(self)-> str:
+        """<attribute Scope?: <type IfcText: <string>>>"""
+        return self._get_attribute("Scope")
+
+    @Scope.setter
+    def Scope(self, value: str):
+        return self._set_attribute("Scope", value)
+
+    @property
+    def Revision(self)-> str:
+        """<attribute Revision?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Revision")
+
+    @Revision.setter
+    def Revision(self, value: str):
+        return self._set_attribute("Revision", value)
+
+    @property
+    def DocumentOwner(self)-> Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]:
+        """<attribute DocumentOwner?: <select IfcActorSelect: (<entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization>)>>"""
+        return self._get_attribute("DocumentOwner")
+
+    @DocumentOwner.setter
+    def DocumentOwner(self, value: Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]):
+        return self._set_attribute("DocumentOwner", value)
+
+    @property
+    def Editors(self)-> list[Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]]:
+        """<attribute Editors?: <set [1:?] of <select IfcActorSelect: (<entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization>)>>>"""
+        return self._get_attribute("Editors")
+
+    @Editors.setter
+    def Editors(self, value: list[Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]]):
+        return self._set_attribute("Editors", value)
+
+    @property
+    def CreationTime(self)-> "IfcDateAndTime":
+        """<attribute CreationTime?: <entity IfcDateAndTime>>"""
+        return self._get_attribute("CreationTime")
+
+    @CreationTime.setter
+    def CreationTime(self, value: "IfcDateAndTime"):
+        return self._set_attribute("CreationTime", value)
+
+    @property
+    def LastRevisionTime(self)-> "IfcDateAndTime":
+        """<attribute LastRevisionTime?: <entity IfcDateAndTime>>"""
+        return self._get_attribute("LastRevisionTime")
+
+    @LastRevisionTime.setter
+    def LastRevisionTime(self, value: "IfcDateAndTime"):
+        return self._set_attribute("LastRevisionTime", value)
+
+    @property
+    def ElectronicFormat(self)-> "IfcDocumentElectronicFormat":
+        """<attribute ElectronicFormat?: <entity IfcDocumentElectronicFormat>>"""
+        return self._get_attribute("ElectronicFormat")
+
+    @ElectronicFormat.setter
+    def ElectronicFormat(self, value: "IfcDocumentElectronicFormat"):
+        return self._set_attribute("ElectronicFormat", value)
+
+    @property
+    def ValidFrom(self)-> "IfcCalendarDate":
+        """<attribute ValidFrom?: <entity IfcCalendarDate>>"""
+        return self._get_attribute("ValidFrom")
+
+    @ValidFrom.setter
+    def ValidFrom(self, value: "IfcCalendarDate"):
+        return self._set_attribute("ValidFrom", value)
+
+    @property
+    def ValidUntil(self)-> "IfcCalendarDate":
+        """<attribute ValidUntil?: <entity IfcCalendarDate>>"""
+        return self._get_attribute("ValidUntil")
+
+    @ValidUntil.setter
+    def ValidUntil(self, value: "IfcCalendarDate"):
+        return self._set_attribute("ValidUntil", value)
+
+    @property
+    def Confidentiality(self)-> "IfcDocumentConfidentialityEnum":
+        """<attribute Confidentiality?: <enumeration IfcDocumentConfidentialityEnum: (PUBLIC, RESTRICTED, CONFIDENTIAL, PERSONAL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("Confidentiality")
+
+    @Confidentiality.setter
+    def Confidentiality(self, value: "IfcDocumentConfidentialityEnum"):
+        return self._set_attribute("Confidentiality", value)
+
+    @property
+    def Status(self)-> "IfcDocumentStatusEnum":
+        """<attribute Status?: <enumeration IfcDocumentStatusEnum: (DRAFT, FINALDRAFT, FINAL, REVISION, NOTDEFINED)>>"""
+        return self._get_attribute("Status")
+
+    @Status.setter
+    def Status(self, value: "IfcDocumentStatusEnum"):
+        return self._set_attribute("Status", value)
+
+    def IsPointedTo(self)-> list["IfcDocumentInformationRelationship"]:
+        """<inverse IsPointedTo: set [0:?] of <entity IfcDocumentInformationRelationship> for <attribute RelatedDocuments: <set [1:?] of <entity IfcDocumentInformation>>>>"""
+        return self._get_inverse_attribute("IsPointedTo")
+
+    def IsPointer(self)-> list["IfcDocumentInformationRelationship"]:
+        """<inverse IsPointer: set [0:1] of <entity IfcDocumentInformationRelationship> for <attribute RelatingDocument: <entity IfcDocumentInformation>>>"""
+        return self._get_inverse_attribute("IsPointer")
@@ -0,0 +1,12 @@
+from .ifcexternalreference import IfcExternalReference
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdocumentinformation import IfcDocumentInformation
+
+class IfcDocumentReference(IfcExternalReference):
+    """Wrapper class for IfcDocumentReference."""
+
+    def ReferenceToDocument(self)-> list["IfcDocumentInformation"]:
+        """<inverse ReferenceToDocument: set [0:1] of <entity IfcDocumentInformation> for <attribute DocumentReferences?: <set [1:?] of <entity IfcDocumentReference>>>>"""
+        return self._get_inverse_attribute("ReferenceToDocument")
@@ -0,0 +1,2 @@
+class IfcDoorPanelOperationEnum(str):
+    items = ['SWINGING', 'DOUBLE_ACTING', 'SLIDING', 'FOLDING', 'REVOLVING', 'ROLLINGUP', 'USERDEFINED', 'NOTDEFINED']
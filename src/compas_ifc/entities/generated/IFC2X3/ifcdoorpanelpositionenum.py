@@ -0,0 +1,2 @@
+class IfcDoorPanelPositionEnum(str):
+    items = ['LEFT', 'MIDDLE', 'RIGHT', 'NOTDEFINED']
@@ -0,0 +1,55 @@
+from .ifcpropertysetdefinition import IfcPropertySetDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdoorpaneloperationenum import IfcDoorPanelOperationEnum
+    from .ifcdoorpanelpositionenum import IfcDoorPanelPositionEnum
+    from .ifcshapeaspect import IfcShapeAspect
+
+class IfcDoorPanelProperties(IfcPropertySetDefinition):
+    """Wrapper class for IfcDoorPanelProperties."""
+
+    @property
+    def PanelDepth(self)-> float:
+        """<attribute PanelDepth?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("PanelDepth")
+
+    @PanelDepth.setter
+    def PanelDepth(self, value: float):
+        return self._set_attribute("PanelDepth", value)
+
+    @property
+    def PanelOperation(self)-> "IfcDoorPanelOperationEnum":
+        """<attribute PanelOperation: <enumeration IfcDoorPanelOperationEnum: (SWINGING, DOUBLE_ACTING, SLIDING, FOLDING, REVOLVING, ROLLINGUP, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PanelOperation")
+
+    @PanelOperation.setter
+    def PanelOperation(self, value: "IfcDoorPanelOperationEnum"):
+        return self._set_attribute("PanelOperation", value)
+
+    @property
+    def PanelWidth(self)-> float:
+        """<attribute PanelWidth?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("PanelWidth")
+
+    @PanelWidth.setter
+    def PanelWidth(self, value: float):
+        return self._set_attribute("PanelWidth", value)
+
+    @property
+    def PanelPosition(self)-> "IfcDoorPanelPositionEnum":
+        """<attribute PanelPosition: <enumeration IfcDoorPanelPositionEnum: (LEFT, MIDDLE, RIGHT, NOTDEFINED)>>"""
+        return self._get_attribute("PanelPosition")
+
+    @PanelPosition.setter
+    def PanelPosition(self, value: "IfcDoorPanelPositionEnum"):
+        return self._set_attribute("PanelPosition", value)
+
+    @property
+    def ShapeAspectStyle(self)-> "IfcShapeAspect":
+        """<attribute ShapeAspectStyle?: <entity IfcShapeAspect>>"""
+        return self._get_attribute("ShapeAspectStyle")
+
+    @ShapeAspectStyle.setter
+    def ShapeAspectStyle(self, value: "IfcShapeAspect"):
+        return self._set_attribute("ShapeAspectStyle", value)
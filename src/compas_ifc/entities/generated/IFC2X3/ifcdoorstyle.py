@@ -0,0 +1,45 @@
+from .ifctypeproduct import IfcTypeProduct
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdoorstyleconstructionenum import IfcDoorStyleConstructionEnum
+    from .ifcdoorstyleoperationenum import IfcDoorStyleOperationEnum
+
+class IfcDoorStyle(IfcTypeProduct):
+    """Wrapper class for IfcDoorStyle."""
+
+    @property
+    def OperationType(self)-> "IfcDoorStyleOperationEnum":
+        """<attribute OperationType: <enumeration IfcDoorStyleOperationEnum: (SINGLE_SWING_LEFT, SINGLE_SWING_RIGHT, DOUBLE_DOOR_SINGLE_SWING, DOUBLE_DOOR_SINGLE_SWING_OPPOSITE_LEFT, DOUBLE_DOOR_SINGLE_SWING_OPPOSITE_RIGHT, DOUBLE_SWING_LEFT, DOUBLE_SWING_RIGHT, DOUBLE_DOOR_DOUBLE_SWING, SLIDING_TO_LEFT, SLIDING_TO_RIGHT, DOUBLE_DOOR_SLIDING, FOLDING_TO_LEFT, FOLDING_TO_RIGHT, DOUBLE_DOOR_FOLDING, REVOLVING, ROLLINGUP, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("OperationType")
+
+    @OperationType.setter
+    def OperationType(self, value: "IfcDoorStyleOperationEnum"):
+        return self._set_attribute("OperationType", value)
+
+    @property
+    def ConstructionType(self)-> "IfcDoorStyleConstructionEnum":
+        """<attribute ConstructionType: <enumeration IfcDoorStyleConstructionEnum: (ALUMINIUM, HIGH_GRADE_STEEL, STEEL, WOOD, ALUMINIUM_WOOD, ALUMINIUM_PLASTIC, PLASTIC, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("ConstructionType")
+
+    @ConstructionType.setter
+    def ConstructionType(self, value: "IfcDoorStyleConstructionEnum"):
+        return self._set_attribute("ConstructionType", value)
+
+    @property
+    def ParameterTakesPrecedence(self)-> bool:
+        """<attribute ParameterTakesPrecedence: <boolean>>"""
+        return self._get_attribute("ParameterTakesPrecedence")
+
+    @ParameterTakesPrecedence.setter
+    def ParameterTakesPrecedence(self, value: bool):
+        return self._set_attribute("ParameterTakesPrecedence", value)
+
+    @property
+    def Sizeable(self)-> bool:
+        """<attribute Sizeable: <boolean>>"""
+        return self._get_attribute("Sizeable")
+
+    @Sizeable.setter
+    def Sizeable(self, value: bool):
+        return self._set_attribute("Sizeable", value)
@@ -0,0 +1,2 @@
+class IfcDoorStyleConstructionEnum(str):
+    items = ['ALUMINIUM', 'HIGH_GRADE_STEEL', 'STEEL', 'WOOD', 'ALUMINIUM_WOOD', 'ALUMINIUM_PLASTIC', 'PLASTIC', 'USERDEFINED', 'NOTDEFINED']
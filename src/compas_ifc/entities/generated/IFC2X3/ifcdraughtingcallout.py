@@ -0,0 +1,29 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcannotationcurveoccurrence import IfcAnnotationCurveOccurrence
+    from .ifcannotationsymboloccurrence import IfcAnnotationSymbolOccurrence
+    from .ifcannotationtextoccurrence import IfcAnnotationTextOccurrence
+    from .ifcdraughtingcalloutrelationship import IfcDraughtingCalloutRelationship
+
+class IfcDraughtingCallout(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcDraughtingCallout."""
+
+    @property
+    def Contents(self)-> list[Union["IfcAnnotationCurveOccurrence", "IfcAnnotationSymbolOccurrence", "IfcAnnotationTextOccurrence"]]:
+        """<attribute Contents: <set [1:?] of <select IfcDraughtingCalloutElement: (<entity IfcAnnotationCurveOccurrence> | <entity IfcAnnotationSymbolOccurrence> | <entity IfcAnnotationTextOccurrence>)>>>"""
+        return self._get_attribute("Contents")
+
+    @Contents.setter
+    def Contents(self, value: list[Union["IfcAnnotationCurveOccurrence", "IfcAnnotationSymbolOccurrence", "IfcAnnotationTextOccurrence"]]):
+        return self._set_attribute("Contents", value)
+
+    def IsRelatedFromCallout(self)-> list["IfcDraughtingCalloutRelationship"]:
+        """<inverse IsRelatedFromCallout: set [0:?] of <entity IfcDraughtingCalloutRelationship> for <attribute RelatedDraughtingCallout: <entity IfcDraughtingCallout>>>"""
+        return self._get_inverse_attribute("IsRelatedFromCallout")
+
+    def IsRelatedToCallout(self)-> list["IfcDraughtingCalloutRelationship"]:
+        """<inverse IsRelatedToCallout: set [0:?] of <entity IfcDraughtingCalloutRelationship> for <attribute RelatingDraughtingCallout: <entity IfcDraughtingCallout>>>"""
+        return self._get_inverse_attribute("IsRelatedToCallout")
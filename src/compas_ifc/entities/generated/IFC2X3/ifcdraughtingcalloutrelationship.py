@@ -0,0 +1,44 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdraughtingcallout import IfcDraughtingCallout
+
+class IfcDraughtingCalloutRelationship(Base):
+    """Wrapper class for IfcDraughtingCalloutRelationship."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def RelatingDraughtingCallout(self)-> "IfcDraughtingCallout":
+        """<attribute RelatingDraughtingCallout: <entity IfcDraughtingCallout>>"""
+        return self._get_attribute("RelatingDraughtingCallout")
+
+    @RelatingDraughtingCallout.setter
+    def RelatingDraughtingCallout(self, value: "IfcDraughtingCallout"):
+        return self._set_attribute("RelatingDraughtingCallout", value)
+
+    @property
+    def RelatedDraughtingCallout(self)-> "IfcDraughtingCallout":
+        """<attribute RelatedDraughtingCallout: <entity IfcDraughtingCallout>>"""
+        return self._get_attribute("RelatedDraughtingCallout")
+
+    @RelatedDraughtingCallout.setter
+    def RelatedDraughtingCallout(self, value: "IfcDraughtingCallout"):
+        return self._set_attribute("RelatedDraughtingCallout", value)
@@ -0,0 +1,5 @@
+from .ifcpredefinedcolour import IfcPreDefinedColour
+
+
+class IfcDraughtingPreDefinedColour(IfcPreDefinedColour):
+    """Wrapper class for IfcDraughtingPreDefinedColour."""
@@ -0,0 +1,5 @@
+from .ifcpredefinedcurvefont import IfcPreDefinedCurveFont
+
+
+class IfcDraughtingPreDefinedCurveFont(IfcPreDefinedCurveFont):
+    """Wrapper class for IfcDraughtingPreDefinedCurveFont."""
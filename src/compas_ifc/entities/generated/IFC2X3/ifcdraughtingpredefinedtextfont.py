@@ -0,0 +1,5 @@
+from .ifcpredefinedtextfont import IfcPreDefinedTextFont
+
+
+class IfcDraughtingPreDefinedTextFont(IfcPreDefinedTextFont):
+    """Wrapper class for IfcDraughtingPreDefinedTextFont."""
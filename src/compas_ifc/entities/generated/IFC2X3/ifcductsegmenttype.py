@@ -0,0 +1,17 @@
+from .ifcflowsegmenttype import IfcFlowSegmentType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcductsegmenttypeenum import IfcDuctSegmentTypeEnum
+
+class IfcDuctSegmentType(IfcFlowSegmentType):
+    """Wrapper class for IfcDuctSegmentType."""
+
+    @property
+    def PredefinedType(self)-> "IfcDuctSegmentTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcDuctSegmentTypeEnum: (RIGIDSEGMENT, FLEXIBLESEGMENT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcDuctSegmentTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcDuctSegmentTypeEnum(str):
+    items = ['RIGIDSEGMENT', 'FLEXIBLESEGMENT', 'USERDEFINED', 'NOTDEFINED']
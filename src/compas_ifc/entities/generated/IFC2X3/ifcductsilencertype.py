@@ -0,0 +1,17 @@
+from .ifcflowtreatmentdevicetype import IfcFlowTreatmentDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcductsilencertypeenum import IfcDuctSilencerTypeEnum
+
+class IfcDuctSilencerType(IfcFlowTreatmentDeviceType):
+    """Wrapper class for IfcDuctSilencerType."""
+
+    @property
+    def PredefinedType(self)-> "IfcDuctSilencerTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcDuctSilencerTypeEnum: (FLATOVAL, RECTANGULAR, ROUND, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcDuctSilencerTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
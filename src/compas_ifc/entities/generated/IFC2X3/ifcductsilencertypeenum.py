@@ -0,0 +1,2 @@
+class IfcDuctSilencerTypeEnum(str):
+    items = ['FLATOVAL', 'RECTANGULAR', 'ROUND', 'USERDEFINED', 'NOTDEFINED']
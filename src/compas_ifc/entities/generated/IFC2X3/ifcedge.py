@@ -0,0 +1,26 @@
+from .ifctopologicalrepresentationitem import IfcTopologicalRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcvertex import IfcVertex
+
+class IfcEdge(IfcTopologicalRepresentationItem):
+    """Wrapper class for IfcEdge."""
+
+    @property
+    def EdgeStart(self)-> "IfcVertex":
+        """<attribute EdgeStart: <entity IfcVertex>>"""
+        return self._get_attribute("EdgeStart")
+
+    @EdgeStart.setter
+    def EdgeStart(self, value: "IfcVertex"):
+        return self._set_attribute("EdgeStart", value)
+
+    @property
+    def EdgeEnd(self)-> "IfcVertex":
+        """<attribute EdgeEnd: <entity IfcVertex>>"""
+        return self._get_attribute("EdgeEnd")
+
+    @EdgeEnd.setter
+    def EdgeEnd(self, value: "IfcVertex"):
+        return self._set_attribute("EdgeEnd", value)
@@ -0,0 +1,26 @@
+from .ifcedge import IfcEdge
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccurve import IfcCurve
+
+class IfcEdgeCurve(IfcEdge):
+    """Wrapper class for IfcEdgeCurve."""
+
+    @property
+    def EdgeGeometry(self)-> "IfcCurve":
+        """<attribute EdgeGeometry: <entity IfcCurve>>"""
+        return self._get_attribute("EdgeGeometry")
+
+    @EdgeGeometry.setter
+    def EdgeGeometry(self, value: "IfcCurve"):
+        return self._set_attribute("EdgeGeometry", value)
+
+    @property
+    def SameSense(self)-> bool:
+        """<attribute SameSense: <boolean>>"""
+        return self._get_attribute("SameSense")
+
+    @SameSense.setter
+    def SameSense(self, value: bool):
+        return self._set_attribute("SameSense", value)
@@ -0,0 +1,14 @@
+from .ifcfeatureelementsubtraction import IfcFeatureElementSubtraction
+
+
+class IfcEdgeFeature(IfcFeatureElementSubtraction):
+    """Wrapper class for IfcEdgeFeature."""
+
+    @property
+    def FeatureLength(self)-> float:
+        """<attribute FeatureLength?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("FeatureLength")
+
+    @FeatureLength.setter
+    def FeatureLength(self, value: float):
+        return self._set_attribute("FeatureLength", value)
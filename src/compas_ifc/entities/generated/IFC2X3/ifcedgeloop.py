@@ -0,0 +1,17 @@
+from .ifcloop import IfcLoop
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcorientededge import IfcOrientedEdge
+
+class IfcEdgeLoop(IfcLoop):
+    """Wrapper class for IfcEdgeLoop."""
+
+    @property
+    def EdgeList(self)-> list["IfcOrientedEdge"]:
+        """<attribute EdgeList: <list [1:?] of <entity IfcOrientedEdge>>>"""
+        return self._get_attribute("EdgeList")
+
+    @EdgeList.setter
+    def EdgeList(self, value: list["IfcOrientedEdge"]):
+        return self._set_attribute("EdgeList", value)
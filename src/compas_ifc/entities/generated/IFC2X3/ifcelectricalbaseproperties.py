@@ -0,0 +1,80 @@
+from .ifcenergyproperties import IfcEnergyProperties
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelectriccurrentenum import IfcElectricCurrentEnum
+
+class IfcElectricalBaseProperties(IfcEnergyProperties):
+    """Wrapper class for IfcElectricalBaseProperties."""
+
+    @property
+    def ElectricCurrentType(self)-> "IfcElectricCurrentEnum":
+        """<attribute ElectricCurrentType?: <enumeration IfcElectricCurrentEnum: (ALTERNATING, DIRECT, NOTDEFINED)>>"""
+        return self._get_attribute("ElectricCurrentType")
+
+    @ElectricCurrentType.setter
+    def ElectricCurrentType(self, value: "IfcElectricCurrentEnum"):
+        return self._set_attribute("ElectricCurrentType", value)
+
+    @property
+    def InputVoltage(self)-> float:
+        """<attribute InputVoltage: <type IfcElectricVoltageMeasure: <real>>>"""
+        return self._get_attribute("InputVoltage")
+
+    @InputVoltage.setter
+    def InputVoltage(self, value: float):
+        return self._set_attribute("InputVoltage", value)
+
+    @property
+    def InputFrequency(self)-> float:
+        """<attribute InputFrequency: <type IfcFrequencyMeasure: <real>>>"""
+        return self._get_attribute("InputFrequency")
+
+    @InputFrequency.setter
+    def InputFrequency(self, value: float):
+        return self._set_attribute("InputFrequency", value)
+
+    @property
+    def FullLoadCurrent(self)-> float:
+        """<attribute FullLoadCurrent?: <type IfcElectricCurrentMeasure: <real>>>"""
+        return self._get_attribute("FullLoadCurrent")
+
+    @FullLoadCurrent.setter
+    def FullLoadCurrent(self, value: float):
+        return self._set_attribute("FullLoadCurrent", value)
+
+    @property
+    def MinimumCircuitCurrent(self)-> float:
+        """<attribute MinimumCircuitCurrent?: <type IfcElectricCurrentMeasure: <real>>>"""
+        return self._get_attribute("MinimumCircuitCurrent")
+
+    @MinimumCircuitCurrent.setter
+    def MinimumCircuitCurrent(self, value: float):
+        return self._set_attribute("MinimumCircuitCurrent", value)
+
+    @property
+    def MaximumPowerInput(self)-> float:
+        """<attribute MaximumPowerInput?: <type IfcPowerMeasure: <real>>>"""
+        return self._get_attribute("MaximumPowerInput")
+
+    @MaximumPowerInput.setter
+    def MaximumPowerInput(self, value: float):
+        return self._set_attribute("MaximumPowerInput", value)
+
+    @property
+    def RatedPowerInput(self)-> float:
+        """<attribute RatedPowerInput?: <type IfcPowerMeasure: <real>>>"""
+        return self._get_attribute("RatedPowerInput")
+
+    @RatedPowerInput.setter
+    def RatedPowerInput(self, value: float):
+        return self._set_attribute("RatedPowerInput", value)
+
+    @property
+    def InputPhase(self)-> int:
+        """<attribute InputPhase: <integer>>"""
+        return self._get_attribute("InputPhase")
+
+    @InputPhase.setter
+    def InputPhase(self, value: int):
+        return self._set_attribute("InputPhase", value)
@@ -0,0 +1,5 @@
+from .ifcsystem import IfcSystem
+
+
+class IfcElectricalCircuit(IfcSystem):
+    """Wrapper class for IfcElectricalCircuit."""
@@ -0,0 +1,5 @@
+from .ifcelement import IfcElement
+
+
+class IfcElectricalElement(IfcElement):
+    """Wrapper class for IfcElectricalElement."""
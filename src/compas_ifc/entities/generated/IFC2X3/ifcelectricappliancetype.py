@@ -0,0 +1,17 @@
+from .ifcflowterminaltype import IfcFlowTerminalType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelectricappliancetypeenum import IfcElectricApplianceTypeEnum
+
+class IfcElectricApplianceType(IfcFlowTerminalType):
+    """Wrapper class for IfcElectricApplianceType."""
+
+    @property
+    def PredefinedType(self)-> "IfcElectricApplianceTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcElectricApplianceTypeEnum: (COMPUTER, DIRECTWATERHEATER, DISHWASHER, ELECTRICCOOKER, ELECTRICHEATER, FACSIMILE, FREESTANDINGFAN, FREEZER, FRIDGE_FREEZER, HANDDRYER, INDIRECTWATERHEATER, MICROWAVE, PHOTOCOPIER, PRINTER, REFRIGERATOR, RADIANTHEATER, SCANNER, TELEPHONE, TUMBLEDRYER, TV, VENDINGMACHINE, WASHINGMACHINE, WATERHEATER, WATERCOOLER, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcElectricApplianceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcElectricApplianceTypeEnum(str):
+    items = ['COMPUTER', 'DIRECTWATERHEATER', 'DISHWASHER', 'ELECTRICCOOKER', 'ELECTRICHEATER', 'FACSIMILE', 'FREESTANDINGFAN', 'FREEZER', 'FRIDGE_FREEZER', 'HANDDRYER', 'INDIRECTWATERHEATER', 'MICROWAVE', 'PHOTOCOPIER', 'PRINTER', 'REFRIGERATOR', 'RADIANTHEATER', 'SCANNER', 'TELEPHONE', 'TUMBLEDRYER', 'TV', 'VENDINGMACHINE', 'WASHINGMACHINE', 'WATERHEATER', 'WATERCOOLER', 'USERDEFINED', 'NOTDEFINED']
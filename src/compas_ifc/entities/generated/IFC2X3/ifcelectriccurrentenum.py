@@ -0,0 +1,2 @@
+class IfcElectricCurrentEnum(str):
+    items = ['ALTERNATING', 'DIRECT', 'NOTDEFINED']
@@ -0,0 +1,26 @@
+from .ifcflowcontroller import IfcFlowController
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelectricdistributionpointfunctionenum import IfcElectricDistributionPointFunctionEnum
+
+class IfcElectricDistributionPoint(IfcFlowController):
+    """Wrapper class for IfcElectricDistributionPoint."""
+
+    @property
+    def DistributionPointFunction(self)-> "IfcElectricDistributionPointFunctionEnum":
+        """<attribute DistributionPointFunction: <enumeration IfcElectricDistributionPointFunctionEnum: (ALARMPANEL, CONSUMERUNIT, CONTROLPANEL, DISTRIBUTIONBOARD, GASDETECTORPANEL, INDICATORPANEL, MIMICPANEL, MOTORCONTROLCENTRE, SWITCHBOARD, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("DistributionPointFunction")
+
+    @DistributionPointFunction.setter
+    def DistributionPointFunction(self, value: "IfcElectricDistributionPointFunctionEnum"):
+        return self._set_attribute("DistributionPointFunction", value)
+
+    @property
+    def UserDefinedFunction(self)-> str:
+        """<attribute UserDefinedFunction?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedFunction")
+
+    @UserDefinedFunction.setter
+    def UserDefinedFunction(self, value: str):
+        return self._set_attribute("UserDefinedFunction", value)
@@ -0,0 +1,2 @@
+class IfcElectricDistributionPointFunctionEnum(str):
+    items = ['ALARMPANEL', 'CONSUMERUNIT', 'CONTROLPANEL', 'DISTRIBUTIONBOARD', 'GASDETECTORPANEL', 'INDICATORPANEL', 'MIMICPANEL', 'MOTORCONTROLCENTRE', 'SWITCHBOARD', 'USERDEFINED', 'NOTDEFINED']
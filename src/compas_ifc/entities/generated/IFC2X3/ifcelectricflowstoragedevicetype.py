@@ -0,0 +1,17 @@
+from .ifcflowstoragedevicetype import IfcFlowStorageDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelectricflowstoragedevicetypeenum import IfcElectricFlowStorageDeviceTypeEnum
+
+class IfcElectricFlowStorageDeviceType(IfcFlowStorageDeviceType):
+    """Wrapper class for IfcElectricFlowStorageDeviceType."""
+
+    @property
+    def PredefinedType(self)-> "IfcElectricFlowStorageDeviceTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcElectricFlowStorageDeviceTypeEnum: (BATTERY, CAPACITORBANK, HARMONICFILTER, INDUCTORBANK, UPS, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcElectricFlowStorageDeviceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevicetype import IfcEnergyConversionDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelectricgeneratortypeenum import IfcElectricGeneratorTypeEnum
+
+class IfcElectricGeneratorType(IfcEnergyConversionDeviceType):
+    """Wrapper class for IfcElectricGeneratorType."""
+
+    @property
+    def PredefinedType(self)-> "IfcElectricGeneratorTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcElectricGeneratorTypeEnum: (USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcElectricGeneratorTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
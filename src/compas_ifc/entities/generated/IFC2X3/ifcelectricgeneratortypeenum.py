@@ -0,0 +1,2 @@
+class IfcElectricGeneratorTypeEnum(str):
+    items = ['USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcflowterminaltype import IfcFlowTerminalType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelectricheatertypeenum import IfcElectricHeaterTypeEnum
+
+class IfcElectricHeaterType(IfcFlowTerminalType):
+    """Wrapper class for IfcElectricHeaterType."""
+
+    @property
+    def PredefinedType(self)-> "IfcElectricHeaterTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcElectricHeaterTypeEnum: (ELECTRICPOINTHEATER, ELECTRICCABLEHEATER, ELECTRICMATHEATER, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcElectricHeaterTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcElectricHeaterTypeEnum(str):
+    items = ['ELECTRICPOINTHEATER', 'ELECTRICCABLEHEATER', 'ELECTRICMATHEATER', 'USERDEFINED', 'NOTDEFINED']
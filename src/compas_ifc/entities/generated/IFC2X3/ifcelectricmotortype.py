@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevicetype import IfcEnergyConversionDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelectricmotortypeenum import IfcElectricMotorTypeEnum
+
+class IfcElectricMotorType(IfcEnergyConversionDeviceType):
+    """Wrapper class for IfcElectricMotorType."""
+
+    @property
+    def PredefinedType(self)-> "IfcElectricMotorTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcElectricMotorTypeEnum: (DC, INDUCTION, POLYPHASE, RELUCTANCESYNCHRONOUS, SYNCHRONOUS, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcElectricMotorTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
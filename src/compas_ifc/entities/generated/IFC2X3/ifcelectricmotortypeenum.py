@@ -0,0 +1,2 @@
+class IfcElectricMotorTypeEnum(str):
+    items = ['DC', 'INDUCTION', 'POLYPHASE', 'RELUCTANCESYNCHRONOUS', 'SYNCHRONOUS', 'USERDEFINED', 'NOTDEFINED']
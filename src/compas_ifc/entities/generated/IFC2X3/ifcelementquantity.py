@@ -0,0 +1,26 @@
+from .ifcpropertysetdefinition import IfcPropertySetDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcphysicalquantity import IfcPhysicalQuantity
+
+class IfcElementQuantity(IfcPropertySetDefinition):
+    """Wrapper class for IfcElementQuantity."""
+
+    @property
+    def MethodOfMeasurement(self)-> str:
+        """<attribute MethodOfMeasurement?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("MethodOfMeasurement")
+
+    @MethodOfMeasurement.setter
+    def MethodOfMeasurement(self, value: str):
+        return self._set_attribute("MethodOfMeasurement", value)
+
+    @property
+    def Quantities(self)-> list["IfcPhysicalQuantity"]:
+        """<attribute Quantities: <set [1:?] of <entity IfcPhysicalQuantity>>>"""
+        return self._get_attribute("Quantities")
+
+    @Quantities.setter
+    def Quantities(self, value: list["IfcPhysicalQuantity"]):
+        return self._set_attribute("Quantities", value)
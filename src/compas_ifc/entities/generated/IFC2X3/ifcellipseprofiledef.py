@@ -0,0 +1,23 @@
+from .ifcparameterizedprofiledef import IfcParameterizedProfileDef
+
+
+class IfcEllipseProfileDef(IfcParameterizedProfileDef):
+    """Wrapper class for IfcEllipseProfileDef."""
+
+    @property
+    def SemiAxis1(self)-> float:
+        """<attribute SemiAxis1: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("SemiAxis1")
+
+    @SemiAxis1.setter
+    def SemiAxis1(self, value: float):
+        return self._set_attribute("SemiAxis1", value)
+
+    @property
+    def SemiAxis2(self)-> float:
+        """<attribute SemiAxis2: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("SemiAxis2")
+
+    @SemiAxis2.setter
+    def SemiAxis2(self, value: float):
+        return self._set_attribute("SemiAxis2", value)
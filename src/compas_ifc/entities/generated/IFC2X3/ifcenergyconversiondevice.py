@@ -0,0 +1,5 @@
+from .ifcdistributionflowelement import IfcDistributionFlowElement
+
+
+class IfcEnergyConversionDevice(IfcDistributionFlowElement):
+    """Wrapper class for IfcEnergyConversionDevice."""
@@ -0,0 +1,5 @@
+from .ifcdistributionflowelementtype import IfcDistributionFlowElementType
+
+
+class IfcEnergyConversionDeviceType(IfcDistributionFlowElementType):
+    """Wrapper class for IfcEnergyConversionDeviceType."""
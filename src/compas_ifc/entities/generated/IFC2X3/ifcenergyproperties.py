@@ -0,0 +1,26 @@
+from .ifcpropertysetdefinition import IfcPropertySetDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcenergysequenceenum import IfcEnergySequenceEnum
+
+class IfcEnergyProperties(IfcPropertySetDefinition):
+    """Wrapper class for IfcEnergyProperties."""
+
+    @property
+    def EnergySequence(self)-> "IfcEnergySequenceEnum":
+        """<attribute EnergySequence?: <enumeration IfcEnergySequenceEnum: (PRIMARY, SECONDARY, TERTIARY, AUXILIARY, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("EnergySequence")
+
+    @EnergySequence.setter
+    def EnergySequence(self, value: "IfcEnergySequenceEnum"):
+        return self._set_attribute("EnergySequence", value)
+
+    @property
+    def UserDefinedEnergySequence(self)-> str:
+        """<attribute UserDefinedEnergySequence?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedEnergySequence")
+
+    @UserDefinedEnergySequence.setter
+    def UserDefinedEnergySequence(self, value: str):
+        return self._set_attribute("UserDefinedEnergySequence", value)
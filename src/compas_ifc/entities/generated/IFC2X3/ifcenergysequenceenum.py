@@ -0,0 +1,2 @@
+class IfcEnergySequenceEnum(str):
+    items = ['PRIMARY', 'SECONDARY', 'TERTIARY', 'AUXILIARY', 'USERDEFINED', 'NOTDEFINED']
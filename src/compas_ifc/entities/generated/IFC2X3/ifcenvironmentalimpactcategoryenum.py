@@ -0,0 +1,2 @@
+class IfcEnvironmentalImpactCategoryEnum(str):
+    items = ['COMBINEDVALUE', 'DISPOSAL', 'EXTRACTION', 'INSTALLATION', 'MANUFACTURE', 'TRANSPORTATION', 'USERDEFINED', 'NOTDEFINED']
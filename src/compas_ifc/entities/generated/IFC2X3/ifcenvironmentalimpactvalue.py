@@ -0,0 +1,35 @@
+from .ifcappliedvalue import IfcAppliedValue
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcenvironmentalimpactcategoryenum import IfcEnvironmentalImpactCategoryEnum
+
+class IfcEnvironmentalImpactValue(IfcAppliedValue):
+    """Wrapper class for IfcEnvironmentalImpactValue."""
+
+    @property
+    def ImpactType(self)-> str:
+        """<attribute ImpactType: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ImpactType")
+
+    @ImpactType.setter
+    def ImpactType(self, value: str):
+        return self._set_attribute("ImpactType", value)
+
+    @property
+    def Category(self)-> "IfcEnvironmentalImpactCategoryEnum":
+        """<attribute Category: <enumeration IfcEnvironmentalImpactCategoryEnum: (COMBINEDVALUE, DISPOSAL, EXTRACTION, INSTALLATION, MANUFACTURE, TRANSPORTATION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("Category")
+
+    @Category.setter
+    def Category(self, value: "IfcEnvironmentalImpactCategoryEnum"):
+        return self._set_attribute("Category", value)
+
+    @property
+    def UserDefinedCategory(self)-> str:
+        """<attribute UserDefinedCategory?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedCategory")
+
+    @UserDefinedCategory.setter
+    def UserDefinedCategory(self, value: str):
+        return self._set_attribute("UserDefinedCategory", value)
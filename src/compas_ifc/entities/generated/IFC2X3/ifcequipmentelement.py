@@ -0,0 +1,5 @@
+from .ifcelement import IfcElement
+
+
+class IfcEquipmentElement(IfcElement):
+    """Wrapper class for IfcEquipmentElement."""
@@ -0,0 +1,5 @@
+from .ifccontrol import IfcControl
+
+
+class IfcEquipmentStandard(IfcControl):
+    """Wrapper class for IfcEquipmentStandard."""
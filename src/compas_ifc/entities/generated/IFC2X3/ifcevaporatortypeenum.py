@@ -0,0 +1,2 @@
+class IfcEvaporatorTypeEnum(str):
+    items = ['DIRECTEXPANSIONSHELLANDTUBE', 'DIRECTEXPANSIONTUBEINTUBE', 'DIRECTEXPANSIONBRAZEDPLATE', 'FLOODEDSHELLANDTUBE', 'SHELLANDCOIL', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,35 @@
+from .ifcmaterialproperties import IfcMaterialProperties
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcproperty import IfcProperty
+
+class IfcExtendedMaterialProperties(IfcMaterialProperties):
+    """Wrapper class for IfcExtendedMaterialProperties."""
+
+    @property
+    def ExtendedProperties(self)-> list["IfcProperty"]:
+        """<attribute ExtendedProperties: <set [1:?] of <entity IfcProperty>>>"""
+        return self._get_attribute("ExtendedProperties")
+
+    @ExtendedProperties.setter
+    def ExtendedProperties(self, value: list["IfcProperty"]):
+        return self._set_attribute("ExtendedProperties", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
@@ -0,0 +1,5 @@
+from .ifcexternalreference import IfcExternalReference
+
+
+class IfcExternallyDefinedHatchStyle(IfcExternalReference):
+    """Wrapper class for IfcExternallyDefinedHatchStyle."""
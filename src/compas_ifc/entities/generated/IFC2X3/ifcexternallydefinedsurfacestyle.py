@@ -0,0 +1,5 @@
+from .ifcexternalreference import IfcExternalReference
+
+
+class IfcExternallyDefinedSurfaceStyle(IfcExternalReference):
+    """Wrapper class for IfcExternallyDefinedSurfaceStyle."""
@@ -0,0 +1,5 @@
+from .ifcexternalreference import IfcExternalReference
+
+
+class IfcExternallyDefinedSymbol(IfcExternalReference):
+    """Wrapper class for IfcExternallyDefinedSymbol."""
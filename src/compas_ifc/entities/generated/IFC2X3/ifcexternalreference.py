@@ -0,0 +1,32 @@
+from compas_ifc.entities.base import Base
+
+
+class IfcExternalReference(Base):
+    """Wrapper class for IfcExternalReference."""
+
+    @property
+    def Location(self)-> str:
+        """<attribute Location?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Location")
+
+    @Location.setter
+    def Location(self, value: str):
+        return self._set_attribute("Location", value)
+
+    @property
+    def ItemReference(self)-> str:
+        """<attribute ItemReference?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("ItemReference")
+
+    @ItemReference.setter
+    def ItemReference(self, value: str):
+        return self._set_attribute("ItemReference", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
@@ -0,0 +1,26 @@
+from .ifcsweptareasolid import IfcSweptAreaSolid
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdirection import IfcDirection
+
+class IfcExtrudedAreaSolid(IfcSweptAreaSolid):
+    """Wrapper class for IfcExtrudedAreaSolid."""
+
+    @property
+    def ExtrudedDirection(self)-> "IfcDirection":
+        """<attribute ExtrudedDirection: <entity IfcDirection>>"""
+        return self._get_attribute("ExtrudedDirection")
+
+    @ExtrudedDirection.setter
+    def ExtrudedDirection(self, value: "IfcDirection"):
+        return self._set_attribute("ExtrudedDirection", value)
+
+    @property
+    def Depth(self)-> float:
+        """<attribute Depth: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Depth")
+
+    @Depth.setter
+    def Depth(self, value: float):
+        return self._set_attribute("Depth", value)
@@ -0,0 +1,17 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcconnectedfaceset import IfcConnectedFaceSet
+
+class IfcFaceBasedSurfaceModel(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcFaceBasedSurfaceModel."""
+
+    @property
+    def FbsmFaces(self)-> list["IfcConnectedFaceSet"]:
+        """<attribute FbsmFaces: <set [1:?] of <entity IfcConnectedFaceSet>>>"""
+        return self._get_attribute("FbsmFaces")
+
+    @FbsmFaces.setter
+    def FbsmFaces(self, value: list["IfcConnectedFaceSet"]):
+        return self._set_attribute("FbsmFaces", value)
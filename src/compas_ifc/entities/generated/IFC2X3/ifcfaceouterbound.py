@@ -0,0 +1,5 @@
+from .ifcfacebound import IfcFaceBound
+
+
+class IfcFaceOuterBound(IfcFaceBound):
+    """Wrapper class for IfcFaceOuterBound."""
@@ -0,0 +1,5 @@
+from .ifcmanifoldsolidbrep import IfcManifoldSolidBrep
+
+
+class IfcFacetedBrep(IfcManifoldSolidBrep):
+    """Wrapper class for IfcFacetedBrep."""
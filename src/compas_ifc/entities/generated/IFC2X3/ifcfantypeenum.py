@@ -0,0 +1,2 @@
+class IfcFanTypeEnum(str):
+    items = ['CENTRIFUGALFORWARDCURVED', 'CENTRIFUGALRADIAL', 'CENTRIFUGALBACKWARDINCLINEDCURVED', 'CENTRIFUGALAIRFOIL', 'TUBEAXIAL', 'VANEAXIAL', 'PROPELLORAXIAL', 'USERDEFINED', 'NOTDEFINED']
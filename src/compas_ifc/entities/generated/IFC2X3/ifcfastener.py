@@ -0,0 +1,5 @@
+from .ifcelementcomponent import IfcElementComponent
+
+
+class IfcFastener(IfcElementComponent):
+    """Wrapper class for IfcFastener."""
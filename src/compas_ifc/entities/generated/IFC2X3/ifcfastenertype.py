@@ -0,0 +1,5 @@
+from .ifcelementcomponenttype import IfcElementComponentType
+
+
+class IfcFastenerType(IfcElementComponentType):
+    """Wrapper class for IfcFastenerType."""
@@ -0,0 +1,12 @@
+from .ifcfeatureelement import IfcFeatureElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelprojectselement import IfcRelProjectsElement
+
+class IfcFeatureElementAddition(IfcFeatureElement):
+    """Wrapper class for IfcFeatureElementAddition."""
+
+    def ProjectsElements(self)-> list["IfcRelProjectsElement"]:
+        """<inverse ProjectsElements:  [?:?] of <entity IfcRelProjectsElement> for <attribute RelatedFeatureElement: <entity IfcFeatureElementAddition>>>"""
+        return self._get_inverse_attribute("ProjectsElements")
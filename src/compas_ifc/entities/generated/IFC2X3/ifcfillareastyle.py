@@ -0,0 +1,22 @@
+from .ifcpresentationstyle import IfcPresentationStyle
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccolourspecification import IfcColourSpecification
+    from .ifcexternallydefinedhatchstyle import IfcExternallyDefinedHatchStyle
+    from .ifcfillareastylehatching import IfcFillAreaStyleHatching
+    from .ifcfillareastyletiles import IfcFillAreaStyleTiles
+    from .ifcpredefinedcolour import IfcPreDefinedColour
+
+class IfcFillAreaStyle(IfcPresentationStyle):
+    """Wrapper class for IfcFillAreaStyle."""
+
+    @property
+    def FillStyles(self)-> list[Union["IfcExternallyDefinedHatchStyle", "IfcFillAreaStyleTiles", "IfcFillAreaStyleHatching", "IfcPreDefinedColour", "IfcColourSpecification"]]:
+        """<attribute FillStyles: <set [1:?] of <select IfcFillStyleSelect: (<select IfcColour: (<entity IfcColourSpecification> | <entity IfcPreDefinedColour>)> | <entity IfcExternallyDefinedHatchStyle> | <entity IfcFillAreaStyleHatching> | <entity IfcFillAreaStyleTiles>)>>>"""
+        return self._get_attribute("FillStyles")
+
+    @FillStyles.setter
+    def FillStyles(self, value: list[Union["IfcExternallyDefinedHatchStyle", "IfcFillAreaStyleTiles", "IfcFillAreaStyleHatching", "IfcPreDefinedColour", "IfcColourSpecification"]]):
+        return self._set_attribute("FillStyles", value)
@@ -0,0 +1,37 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcfillareastyletilesymbolwithstyle import IfcFillAreaStyleTileSymbolWithStyle
+    from .ifconedirectionrepeatfactor import IfcOneDirectionRepeatFactor
+
+class IfcFillAreaStyleTiles(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcFillAreaStyleTiles."""
+
+    @property
+    def TilingPattern(self)-> "IfcOneDirectionRepeatFactor":
+        """<attribute TilingPattern: <entity IfcOneDirectionRepeatFactor>>"""
+        return self._get_attribute("TilingPattern")
+
+    @TilingPattern.setter
+    def TilingPattern(self, value: "IfcOneDirectionRepeatFactor"):
+        return self._set_attribute("TilingPattern", value)
+
+    @property
+    def Tiles(self)-> list[Union["IfcFillAreaStyleTileSymbolWithStyle"]]:
+        """<attribute Tiles: <set [1:?] of <select IfcFillAreaStyleTileShapeSelect: (<entity IfcFillAreaStyleTileSymbolWithStyle>)>>>"""
+        return self._get_attribute("Tiles")
+
+    @Tiles.setter
+    def Tiles(self, value: list[Union["IfcFillAreaStyleTileSymbolWithStyle"]]):
+        return self._set_attribute("Tiles", value)
+
+    @property
+    def TilingScale(self)-> float:
+        """<attribute TilingScale: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("TilingScale")
+
+    @TilingScale.setter
+    def TilingScale(self, value: float):
+        return self._set_attribute("TilingScale", value)
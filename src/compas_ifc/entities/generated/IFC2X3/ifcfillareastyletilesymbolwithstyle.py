@@ -0,0 +1,17 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcannotationsymboloccurrence import IfcAnnotationSymbolOccurrence
+
+class IfcFillAreaStyleTileSymbolWithStyle(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcFillAreaStyleTileSymbolWithStyle."""
+
+    @property
+    def Symbol(self)-> "IfcAnnotationSymbolOccurrence":
+        """<attribute Symbol: <entity IfcAnnotationSymbolOccurrence>>"""
+        return self._get_attribute("Symbol")
+
+    @Symbol.setter
+    def Symbol(self, value: "IfcAnnotationSymbolOccurrence"):
+        return self._set_attribute("Symbol", value)
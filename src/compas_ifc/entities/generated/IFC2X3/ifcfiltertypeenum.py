@@ -0,0 +1,2 @@
+class IfcFilterTypeEnum(str):
+    items = ['AIRPARTICLEFILTER', 'ODORFILTER', 'OILFILTER', 'STRAINER', 'WATERFILTER', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcflowterminaltype import IfcFlowTerminalType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcfiresuppressionterminaltypeenum import IfcFireSuppressionTerminalTypeEnum
+
+class IfcFireSuppressionTerminalType(IfcFlowTerminalType):
+    """Wrapper class for IfcFireSuppressionTerminalType."""
+
+    @property
+    def PredefinedType(self)-> "IfcFireSuppressionTerminalTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcFireSuppressionTerminalTypeEnum: (BREECHINGINLET, FIREHYDRANT, HOSEREEL, SPRINKLER, SPRINKLERDEFLECTOR, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcFireSuppressionTerminalTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
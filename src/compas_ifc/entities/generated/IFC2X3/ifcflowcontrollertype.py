@@ -0,0 +1,5 @@
+from .ifcdistributionflowelementtype import IfcDistributionFlowElementType
+
+
+class IfcFlowControllerType(IfcDistributionFlowElementType):
+    """Wrapper class for IfcFlowControllerType."""
@@ -0,0 +1,5 @@
+from .ifcdistributionflowelement import IfcDistributionFlowElement
+
+
+class IfcFlowFitting(IfcDistributionFlowElement):
+    """Wrapper class for IfcFlowFitting."""
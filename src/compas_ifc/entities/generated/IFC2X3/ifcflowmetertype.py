@@ -0,0 +1,17 @@
+from .ifcflowcontrollertype import IfcFlowControllerType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcflowmetertypeenum import IfcFlowMeterTypeEnum
+
+class IfcFlowMeterType(IfcFlowControllerType):
+    """Wrapper class for IfcFlowMeterType."""
+
+    @property
+    def PredefinedType(self)-> "IfcFlowMeterTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcFlowMeterTypeEnum: (ELECTRICMETER, ENERGYMETER, FLOWMETER, GASMETER, OILMETER, WATERMETER, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcFlowMeterTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcFlowMeterTypeEnum(str):
+    items = ['ELECTRICMETER', 'ENERGYMETER', 'FLOWMETER', 'GASMETER', 'OILMETER', 'WATERMETER', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,5 @@
+from .ifcdistributionflowelement import IfcDistributionFlowElement
+
+
+class IfcFlowSegment(IfcDistributionFlowElement):
+    """Wrapper class for IfcFlowSegment."""
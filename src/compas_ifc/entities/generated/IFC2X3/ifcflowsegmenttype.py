@@ -0,0 +1,5 @@
+from .ifcdistributionflowelementtype import IfcDistributionFlowElementType
+
+
+class IfcFlowSegmentType(IfcDistributionFlowElementType):
+    """Wrapper class for IfcFlowSegmentType."""
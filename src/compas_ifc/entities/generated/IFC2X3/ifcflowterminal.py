@@ -0,0 +1,5 @@
+from .ifcdistributionflowelement import IfcDistributionFlowElement
+
+
+class IfcFlowTerminal(IfcDistributionFlowElement):
+    """Wrapper class for IfcFlowTerminal."""
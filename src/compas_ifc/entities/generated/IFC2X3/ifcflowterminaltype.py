@@ -0,0 +1,5 @@
+from .ifcdistributionflowelementtype import IfcDistributionFlowElementType
+
+
+class IfcFlowTerminalType(IfcDistributionFlowElementType):
+    """Wrapper class for IfcFlowTerminalType."""
@@ -0,0 +1,5 @@
+from .ifcdistributionflowelement import IfcDistributionFlowElement
+
+
+class IfcFlowTreatmentDevice(IfcDistributionFlowElement):
+    """Wrapper class for IfcFlowTreatmentDevice."""
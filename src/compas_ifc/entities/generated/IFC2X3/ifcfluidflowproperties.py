@@ -0,0 +1,146 @@
+from .ifcpropertysetdefinition import IfcPropertySetDefinition
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmaterial import IfcMaterial
+    from .ifcpropertysourceenum import IfcPropertySourceEnum
+    from .ifctimeseries import IfcTimeSeries
+
+class IfcFluidFlowProperties(IfcPropertySetDefinition):
+    """Wrapper class for IfcFluidFlowProperties."""
+
+    @property
+    def PropertySource(self)-> "IfcPropertySourceEnum":
+        """<attribute PropertySource: <enumeration IfcPropertySourceEnum: (DESIGN, DESIGNMAXIMUM, DESIGNMINIMUM, SIMULATED, ASBUILT, COMMISSIONING, MEASURED, USERDEFINED, NOTKNOWN)>>"""
+        return self._get_attribute("PropertySource")
+
+    @PropertySource.setter
+    def PropertySource(self, value: "IfcPropertySourceEnum"):
+        return self._set_attribute("PropertySource", value)
+
+    @property
+    def FlowConditionTimeSeries(self)-> "IfcTimeSeries":
+        """<attribute FlowConditionTimeSeries?: <entity IfcTimeSeries>>"""
+        return self._get_attribute("FlowConditionTimeSeries")
+
+    @FlowConditionTimeSeries.setter
+    def FlowConditionTimeSeries(self, value: "IfcTimeSeries"):
+        return self._set_attribute("FlowConditionTimeSeries", value)
+
+    @property
+    def VelocityTimeSeries(self)-> "IfcTimeSeries":
+        """<attribute VelocityTimeSeries?: <entity IfcTimeSeries>>"""
+        return self._get_attribute("VelocityTimeSeries")
+
+    @VelocityTimeSeries.setter
+    def VelocityTimeSeries(self, value: "IfcTimeSeries"):
+        return self._set_attribute("VelocityTimeSeries", value)
+
+    @property
+    def FlowrateTimeSeries(self)-> "IfcTimeSeries":
+        """<attribute FlowrateTimeSeries?: <entity IfcTimeSeries>>"""
+        return self._get_attribute("FlowrateTimeSeries")
+
+    @FlowrateTimeSeries.setter
+    def FlowrateTimeSeries(self, value: "IfcTimeSeries"):
+        return self._set_attribute("FlowrateTimeSeries", value)
+
+    @property
+    def Fluid(self)-> "IfcMaterial":
+        """<attribute Fluid: <entity IfcMaterial>>"""
+        return self._get_attribute("Fluid")
+
+    @Fluid.setter
+    def Fluid(self, value: "IfcMaterial"):
+        return self._set_attribute("Fluid", value)
+
+    @property
+    def PressureTimeSeries(self)-> "IfcTimeSeries":
+        """<attribute PressureTimeSeries?: <entity IfcTimeSeries>>"""
+        return self._get_attribute("PressureTimeSeries")
+
+    @PressureTimeSeries.setter
+    def PressureTimeSeries(self, value: "IfcTimeSeries"):
+        return self._set_attribute("PressureTimeSeries", value)
+
+    @property
+    def UserDefinedPropertySource(self)-> str:
+        """<attribute UserDefinedPropertySource?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedPropertySource")
+
+    @UserDefinedPropertySource.setter
+    def UserDefinedPropertySource(self, value: str):
+        return self._set_attribute("UserDefinedPropertySource", value)
+
+    @property
+    def TemperatureSingleValue(self)-> float:
+        """<attribute TemperatureSingleValue?: <type IfcThermodynamicTemperatureMeasure: <real>>>"""
+        return self._get_attribute("TemperatureSingleValue")
+
+    @TemperatureSingleValue.setter
+    def TemperatureSingleValue(self, value: float):
+        return self._set_attribute("TemperatureSingleValue", value)
+
+    @property
+    def WetBulbTemperatureSingleValue(self)-> float:
+        """<attribute WetBulbTemperatureSingleValue?: <type IfcThermodynamicTemperatureMeasure: <real>>>"""
+        return self._get_attribute("WetBulbTemperatureSingleValue")
+
+    @WetBulbTemperatureSingleValue.setter
+    def WetBulbTemperatureSingleValue(self, value: float):
+        return self._set_attribute("WetBulbTemperatureSingleValue", value)
+
+    @property
+    def WetBulbTemperatureTimeSeries(self)-> "IfcTimeSeries":
+        """<attribute WetBulbTemperatureTimeSeries?: <entity IfcTimeSeries>>"""
+        return self._get_attribute("WetBulbTemperatureTimeSeries")
+
+    @WetBulbTemperatureTimeSeries.setter
+    def WetBulbTemperatureTimeSeries(self, value: "IfcTimeSeries"):
+        return self._set_attribute("WetBulbTemperatureTimeSeries", value)
+
+    @property
+    def TemperatureTimeSeries(self)-> "IfcTimeSeries":
+        """<attribute TemperatureTimeSeries?: <entity IfcTimeSeries>>"""
+        return self._get_attribute("TemperatureTimeSeries")
+
+    @TemperatureTimeSeries.setter
+    def TemperatureTimeSeries(self, value: "IfcTimeSeries"):
+        return self._set_attribute("TemperatureTimeSeries", value)
+
+    @property
+    def FlowrateSingleValue(self)-> Union[float, int, list[int]]:
+        """<attribute FlowrateSingleValue?: <select IfcDerivedMeasureValue: (<type IfcAbsorbedDoseMeasure: <real>> | <type IfcAccelerationMeasure: <real>> | <type IfcAngularVelocityMeasure: <real>> | <type IfcCompoundPlaneAngleMeasure: <list [3:4] of <integer>>> | <type IfcCurvatureMeasure: <real>> | <type IfcDoseEquivalentMeasure: <real>> | <type IfcDynamicViscosityMeasure: <real>> | <type IfcElectricCapacitanceMeasure: <real>> | <type IfcElectricChargeMeasure: <real>> | <type IfcElectricConductanceMeasure: <real>> | <type IfcElectricResistanceMeasure: <real>> | <type IfcElectricVoltageMeasure: <real>> | <type IfcEnergyMeasure: <real>> | <type IfcForceMeasure: <real>> | <type IfcFrequencyMeasure: <real>> | <type IfcHeatFluxDensityMeasure: <real>> | <type IfcHeatingValueMeasure: <real>> | <type IfcIlluminanceMeasure: <real>> | <type IfcInductanceMeasure: <real>> | <type IfcIntegerCountRateMeasure: <integer>> | <type IfcIonConcentrationMeasure: <real>> | <type IfcIsothermalMoistureCapacityMeasure: <real>> | <type IfcKinematicViscosityMeasure: <real>> | <type IfcLinearForceMeasure: <real>> | <type IfcLinearMomentMeasure: <real>> | <type IfcLinearStiffnessMeasure: <real>> | <type IfcLinearVelocityMeasure: <real>> | <type IfcLuminousFluxMeasure: <real>> | <type IfcLuminousIntensityDistributionMeasure: <real>> | <type IfcMagneticFluxDensityMeasure: <real>> | <type IfcMagneticFluxMeasure: <real>> | <type IfcMassDensityMeasure: <real>> | <type IfcMassFlowRateMeasure: <real>> | <type IfcMassPerLengthMeasure: <real>> | <type IfcModulusOfElasticityMeasure: <real>> | <type IfcModulusOfLinearSubgradeReactionMeasure: <real>> | <type IfcModulusOfRotationalSubgradeReactionMeasure: <real>> | <type IfcModulusOfSubgradeReactionMeasure: <real>> | <type IfcMoistureDiffusivityMeasure: <real>> | <type IfcMolecularWeightMeasure: <real>> | <type IfcMomentOfInertiaMeasure: <real>> | <type IfcMonetaryMeasure: <real>> | <type IfcPHMeasure: <real>> | <type IfcPlanarForceMeasure: <real>> | <type IfcPowerMeasure: <real>> | <type IfcPressureMeasure: <real>> | <type IfcRadioActivityMeasure: <real>> | <type IfcRotationalFrequencyMeasure: <real>> | <type IfcRotationalMassMeasure: <real>> | <type IfcRotationalStiffnessMeasure: <real>> | <type IfcSectionModulusMeasure: <real>> | <type IfcSectionalAreaIntegralMeasure: <real>> | <type IfcShearModulusMeasure: <real>> | <type IfcSoundPowerMeasure: <real>> | <type IfcSoundPressureMeasure: <real>> | <type IfcSpecificHeatCapacityMeasure: <real>> | <type IfcTemperatureGradientMeasure: <real>> | <type IfcThermalAdmittanceMeasure: <real>> | <type IfcThermalConductivityMeasure: <real>> | <type IfcThermalExpansionCoefficientMeasure: <real>> | <type IfcThermalResistanceMeasure: <real>> | <type IfcThermalTransmittanceMeasure: <real>> | <type IfcTimeStamp: <integer>> | <type IfcTorqueMeasure: <real>> | <type IfcVaporPermeabilityMeasure: <real>> | <type IfcVolumetricFlowRateMeasure: <real>> | <type IfcWarpingConstantMeasure: <real>> | <type IfcWarpingMomentMeasure: <real>>)>>"""
+        return self._get_attribute("FlowrateSingleValue")
+
+    @FlowrateSingleValue.setter
+    def FlowrateSingleValue(self, value: Union[float, int, list[int]]):
+        return self._set_attribute("FlowrateSingleValue", value)
+
+    @property
+    def FlowConditionSingleValue(self)-> float:
+        """<attribute FlowConditionSingleValue?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("FlowConditionSingleValue")
+
+    @FlowConditionSingleValue.setter
+    def FlowConditionSingleValue(self, value: float):
+        return self._set_attribute("FlowConditionSingleValue", value)
+
+    @property
+    def VelocitySingleValue(self)-> float:
+        """<attribute VelocitySingleValue?: <type IfcLinearVelocityMeasure: <real>>>"""
+        return self._get_attribute("VelocitySingleValue")
+
+    @VelocitySingleValue.setter
+    def VelocitySingleValue(self, value: float):
+        return self._set_attribute("VelocitySingleValue", value)
+
+    @property
+    def PressureSingleValue(self)-> float:
+        """<attribute PressureSingleValue?: <type IfcPressureMeasure: <real>>>"""
+        return self._get_attribute("PressureSingleValue")
+
+    @PressureSingleValue.setter
+    def PressureSingleValue(self, value: float):
+        return self._set_attribute("PressureSingleValue", value)
@@ -0,0 +1,17 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcfootingtypeenum import IfcFootingTypeEnum
+
+class IfcFooting(IfcBuildingElement):
+    """Wrapper class for IfcFooting."""
+
+    @property
+    def PredefinedType(self)-> "IfcFootingTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcFootingTypeEnum: (FOOTING_BEAM, PAD_FOOTING, PILE_CAP, STRIP_FOOTING, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcFootingTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcFootingTypeEnum(str):
+    items = ['FOOTING_BEAM', 'PAD_FOOTING', 'PILE_CAP', 'STRIP_FOOTING', 'USERDEFINED', 'NOTDEFINED']
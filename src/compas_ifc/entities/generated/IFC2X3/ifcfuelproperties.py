@@ -0,0 +1,41 @@
+from .ifcmaterialproperties import IfcMaterialProperties
+
+
+class IfcFuelProperties(IfcMaterialProperties):
+    """Wrapper class for IfcFuelProperties."""
+
+    @property
+    def CombustionTemperature(self)-> float:
+        """<attribute CombustionTemperature?: <type IfcThermodynamicTemperatureMeasure: <real>>>"""
+        return self._get_attribute("CombustionTemperature")
+
+    @CombustionTemperature.setter
+    def CombustionTemperature(self, value: float):
+        return self._set_attribute("CombustionTemperature", value)
+
+    @property
+    def CarbonContent(self)-> float:
+        """<attribute CarbonContent?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("CarbonContent")
+
+    @CarbonContent.setter
+    def CarbonContent(self, value: float):
+        return self._set_attribute("CarbonContent", value)
+
+    @property
+    def LowerHeatingValue(self)-> float:
+        """<attribute LowerHeatingValue?: <type IfcHeatingValueMeasure: <real>>>"""
+        return self._get_attribute("LowerHeatingValue")
+
+    @LowerHeatingValue.setter
+    def LowerHeatingValue(self, value: float):
+        return self._set_attribute("LowerHeatingValue", value)
+
+    @property
+    def HigherHeatingValue(self)-> float:
+        """<attribute HigherHeatingValue?: <type IfcHeatingValueMeasure: <real>>>"""
+        return self._get_attribute("HigherHeatingValue")
+
+    @HigherHeatingValue.setter
+    def HigherHeatingValue(self, value: float):
+        return self._set_attribute("HigherHeatingValue", value)
@@ -0,0 +1,5 @@
+from .ifcelement import IfcElement
+
+
+class IfcFurnishingElement(IfcElement):
+    """Wrapper class for IfcFurnishingElement."""
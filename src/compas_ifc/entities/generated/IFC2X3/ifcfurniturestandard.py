@@ -0,0 +1,5 @@
+from .ifccontrol import IfcControl
+
+
+class IfcFurnitureStandard(IfcControl):
+    """Wrapper class for IfcFurnitureStandard."""
@@ -0,0 +1,17 @@
+from .ifcfurnishingelementtype import IfcFurnishingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcassemblyplaceenum import IfcAssemblyPlaceEnum
+
+class IfcFurnitureType(IfcFurnishingElementType):
+    """Wrapper class for IfcFurnitureType."""
+
+    @property
+    def AssemblyPlace(self)-> "IfcAssemblyPlaceEnum":
+        """<attribute AssemblyPlace: <enumeration IfcAssemblyPlaceEnum: (SITE, FACTORY, NOTDEFINED)>>"""
+        return self._get_attribute("AssemblyPlace")
+
+    @AssemblyPlace.setter
+    def AssemblyPlace(self, value: "IfcAssemblyPlaceEnum"):
+        return self._set_attribute("AssemblyPlace", value)
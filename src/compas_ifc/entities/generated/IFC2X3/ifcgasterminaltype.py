@@ -0,0 +1,17 @@
+from .ifcflowterminaltype import IfcFlowTerminalType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcgasterminaltypeenum import IfcGasTerminalTypeEnum
+
+class IfcGasTerminalType(IfcFlowTerminalType):
+    """Wrapper class for IfcGasTerminalType."""
+
+    @property
+    def PredefinedType(self)-> "IfcGasTerminalTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcGasTerminalTypeEnum: (GASAPPLIANCE, GASBOOSTER, GASBURNER, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcGasTerminalTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
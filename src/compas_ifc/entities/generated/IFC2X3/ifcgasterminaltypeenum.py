@@ -0,0 +1,2 @@
+class IfcGasTerminalTypeEnum(str):
+    items = ['GASAPPLIANCE', 'GASBOOSTER', 'GASBURNER', 'USERDEFINED', 'NOTDEFINED']
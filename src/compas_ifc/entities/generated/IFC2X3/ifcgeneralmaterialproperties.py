@@ -0,0 +1,32 @@
+from .ifcmaterialproperties import IfcMaterialProperties
+
+
+class IfcGeneralMaterialProperties(IfcMaterialProperties):
+    """Wrapper class for IfcGeneralMaterialProperties."""
+
+    @property
+    def MolecularWeight(self)-> float:
+        """<attribute MolecularWeight?: <type IfcMolecularWeightMeasure: <real>>>"""
+        return self._get_attribute("MolecularWeight")
+
+    @MolecularWeight.setter
+    def MolecularWeight(self, value: float):
+        return self._set_attribute("MolecularWeight", value)
+
+    @property
+    def Porosity(self)-> float:
+        """<attribute Porosity?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("Porosity")
+
+    @Porosity.setter
+    def Porosity(self, value: float):
+        return self._set_attribute("Porosity", value)
+
+    @property
+    def MassDensity(self)-> float:
+        """<attribute MassDensity?: <type IfcMassDensityMeasure: <real>>>"""
+        return self._get_attribute("MassDensity")
+
+    @MassDensity.setter
+    def MassDensity(self, value: float):
+        return self._set_attribute("MassDensity", value)
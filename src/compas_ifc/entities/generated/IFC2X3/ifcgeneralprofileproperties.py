@@ -0,0 +1,50 @@
+from .ifcprofileproperties import IfcProfileProperties
+
+
+class IfcGeneralProfileProperties(IfcProfileProperties):
+    """Wrapper class for IfcGeneralProfileProperties."""
+
+    @property
+    def PhysicalWeight(self)-> float:
+        """<attribute PhysicalWeight?: <type IfcMassPerLengthMeasure: <real>>>"""
+        return self._get_attribute("PhysicalWeight")
+
+    @PhysicalWeight.setter
+    def PhysicalWeight(self, value: float):
+        return self._set_attribute("PhysicalWeight", value)
+
+    @property
+    def Perimeter(self)-> float:
+        """<attribute Perimeter?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Perimeter")
+
+    @Perimeter.setter
+    def Perimeter(self, value: float):
+        return self._set_attribute("Perimeter", value)
+
+    @property
+    def MinimumPlateThickness(self)-> float:
+        """<attribute MinimumPlateThickness?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("MinimumPlateThickness")
+
+    @MinimumPlateThickness.setter
+    def MinimumPlateThickness(self, value: float):
+        return self._set_attribute("MinimumPlateThickness", value)
+
+    @property
+    def MaximumPlateThickness(self)-> float:
+        """<attribute MaximumPlateThickness?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("MaximumPlateThickness")
+
+    @MaximumPlateThickness.setter
+    def MaximumPlateThickness(self, value: float):
+        return self._set_attribute("MaximumPlateThickness", value)
+
+    @property
+    def CrossSectionArea(self)-> float:
+        """<attribute CrossSectionArea?: <type IfcAreaMeasure: <real>>>"""
+        return self._get_attribute("CrossSectionArea")
+
+    @CrossSectionArea.setter
+    def CrossSectionArea(self, value: float):
+        return self._set_attribute("CrossSectionArea", value)
@@ -0,0 +1,5 @@
+from .ifcgeometricset import IfcGeometricSet
+
+
+class IfcGeometricCurveSet(IfcGeometricSet):
+    """Wrapper class for IfcGeometricCurveSet."""
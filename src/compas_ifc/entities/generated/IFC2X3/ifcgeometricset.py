@@ -0,0 +1,20 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccurve import IfcCurve
+    from .ifcpoint import IfcPoint
+    from .ifcsurface import IfcSurface
+
+class IfcGeometricSet(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcGeometricSet."""
+
+    @property
+    def Elements(self)-> list[Union["IfcPoint", "IfcSurface", "IfcCurve"]]:
+        """<attribute Elements: <set [1:?] of <select IfcGeometricSetSelect: (<entity IfcCurve> | <entity IfcPoint> | <entity IfcSurface>)>>>"""
+        return self._get_attribute("Elements")
+
+    @Elements.setter
+    def Elements(self, value: list[Union["IfcPoint", "IfcSurface", "IfcCurve"]]):
+        return self._set_attribute("Elements", value)
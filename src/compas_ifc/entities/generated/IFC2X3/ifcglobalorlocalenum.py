@@ -0,0 +1,2 @@
+class IfcGlobalOrLocalEnum(str):
+    items = ['GLOBAL_COORDS', 'LOCAL_COORDS']
@@ -0,0 +1,40 @@
+from .ifcproduct import IfcProduct
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcgridaxis import IfcGridAxis
+    from .ifcrelcontainedinspatialstructure import IfcRelContainedInSpatialStructure
+
+class IfcGrid(IfcProduct):
+    """Wrapper class for IfcGrid."""
+
+    @property
+    def UAxes(self)-> list["IfcGridAxis"]:
+        """<attribute UAxes: <list [1:?] of <entity IfcGridAxis>>>"""
+        return self._get_attribute("UAxes")
+
+    @UAxes.setter
+    def UAxes(self, value: list["IfcGridAxis"]):
+        return self._set_attribute("UAxes", value)
+
+    @property
+    def VAxes(self)-> list["IfcGridAxis"]:
+        """<attribute VAxes: <list [1:?] of <entity IfcGridAxis>>>"""
+        return self._get_attribute("VAxes")
+
+    @VAxes.setter
+    def VAxes(self, value: list["IfcGridAxis"]):
+        return self._set_attribute("VAxes", value)
+
+    @property
+    def WAxes(self)-> list["IfcGridAxis"]:
+        """<attribute WAxes?: <list [1:?] of <entity IfcGridAxis>>>"""
+        return self._get_attribute("WAxes")
+
+    @WAxes.setter
+    def WAxes(self, value: list["IfcGridAxis"]):
+        return self._set_attribute("WAxes", value)
+
+    def ContainedInStructure(self)-> list["IfcRelContainedInSpatialStructure"]:
+        """<inverse ContainedInStructure: set [0:1] of <entity IfcRelContainedInSpatialStructure> for <attribute RelatedElements: <set [1:?] of <entity IfcProduct>>>>"""
+        return self._get_inverse_attribute("ContainedInStructure")
@@ -0,0 +1,53 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccurve import IfcCurve
+    from .ifcgrid import IfcGrid
+    from .ifcvirtualgridintersection import IfcVirtualGridIntersection
+
+class IfcGridAxis(Base):
+    """Wrapper class for IfcGridAxis."""
+
+    @property
+    def AxisTag(self)-> str:
+        """<attribute AxisTag?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("AxisTag")
+
+    @AxisTag.setter
+    def AxisTag(self, value: str):
+        return self._set_attribute("AxisTag", value)
+
+    @property
+    def AxisCurve(self)-> "IfcCurve":
+        """<attribute AxisCurve: <entity IfcCurve>>"""
+        return self._get_attribute("AxisCurve")
+
+    @AxisCurve.setter
+    def AxisCurve(self, value: "IfcCurve"):
+        return self._set_attribute("AxisCurve", value)
+
+    @property
+    def SameSense(self)-> bool:
+        """<attribute SameSense: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("SameSense")
+
+    @SameSense.setter
+    def SameSense(self, value: bool):
+        return self._set_attribute("SameSense", value)
+
+    def PartOfW(self)-> list["IfcGrid"]:
+        """<inverse PartOfW: set [0:1] of <entity IfcGrid> for <attribute WAxes?: <list [1:?] of <entity IfcGridAxis>>>>"""
+        return self._get_inverse_attribute("PartOfW")
+
+    def PartOfV(self)-> list["IfcGrid"]:
+        """<inverse PartOfV: set [0:1] of <entity IfcGrid> for <attribute VAxes: <list [1:?] of <entity IfcGridAxis>>>>"""
+        return self._get_inverse_attribute("PartOfV")
+
+    def PartOfU(self)-> list["IfcGrid"]:
+        """<inverse PartOfU: set [0:1] of <entity IfcGrid> for <attribute UAxes: <list [1:?] of <entity IfcGridAxis>>>>"""
+        return self._get_inverse_attribute("PartOfU")
+
+    def HasIntersections(self)-> list["IfcVirtualGridIntersection"]:
+        """<inverse HasIntersections: set [0:?] of <entity IfcVirtualGridIntersection> for <attribute IntersectingAxes: <list [2:2] of <entity IfcGridAxis>>>>"""
+        return self._get_inverse_attribute("HasIntersections")
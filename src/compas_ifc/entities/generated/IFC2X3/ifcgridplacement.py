@@ -0,0 +1,26 @@
+from .ifcobjectplacement import IfcObjectPlacement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcvirtualgridintersection import IfcVirtualGridIntersection
+
+class IfcGridPlacement(IfcObjectPlacement):
+    """Wrapper class for IfcGridPlacement."""
+
+    @property
+    def PlacementLocation(self)-> "IfcVirtualGridIntersection":
+        """<attribute PlacementLocation: <entity IfcVirtualGridIntersection>>"""
+        return self._get_attribute("PlacementLocation")
+
+    @PlacementLocation.setter
+    def PlacementLocation(self, value: "IfcVirtualGridIntersection"):
+        return self._set_attribute("PlacementLocation", value)
+
+    @property
+    def PlacementRefDirection(self)-> "IfcVirtualGridIntersection":
+        """<attribute PlacementRefDirection?: <entity IfcVirtualGridIntersection>>"""
+        return self._get_attribute("PlacementRefDirection")
+
+    @PlacementRefDirection.setter
+    def PlacementRefDirection(self, value: "IfcVirtualGridIntersection"):
+        return self._set_attribute("PlacementRefDirection", value)
@@ -0,0 +1,12 @@
+from .ifcobject import IfcObject
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelassignstogroup import IfcRelAssignsToGroup
+
+class IfcGroup(IfcObject):
+    """Wrapper class for IfcGroup."""
+
+    def IsGroupedBy(self)-> list["IfcRelAssignsToGroup"]:
+        """<inverse IsGroupedBy:  [?:?] of <entity IfcRelAssignsToGroup> for <attribute RelatingGroup: <entity IfcGroup>>>"""
+        return self._get_inverse_attribute("IsGroupedBy")
@@ -0,0 +1,26 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcsurface import IfcSurface
+
+class IfcHalfSpaceSolid(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcHalfSpaceSolid."""
+
+    @property
+    def BaseSurface(self)-> "IfcSurface":
+        """<attribute BaseSurface: <entity IfcSurface>>"""
+        return self._get_attribute("BaseSurface")
+
+    @BaseSurface.setter
+    def BaseSurface(self, value: "IfcSurface"):
+        return self._set_attribute("BaseSurface", value)
+
+    @property
+    def AgreementFlag(self)-> bool:
+        """<attribute AgreementFlag: <boolean>>"""
+        return self._get_attribute("AgreementFlag")
+
+    @AgreementFlag.setter
+    def AgreementFlag(self, value: bool):
+        return self._set_attribute("AgreementFlag", value)
@@ -0,0 +1,2 @@
+class IfcHeatExchangerTypeEnum(str):
+    items = ['PLATE', 'SHELLANDTUBE', 'USERDEFINED', 'NOTDEFINED']
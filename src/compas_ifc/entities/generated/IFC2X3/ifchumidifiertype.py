@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevicetype import IfcEnergyConversionDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifchumidifiertypeenum import IfcHumidifierTypeEnum
+
+class IfcHumidifierType(IfcEnergyConversionDeviceType):
+    """Wrapper class for IfcHumidifierType."""
+
+    @property
+    def PredefinedType(self)-> "IfcHumidifierTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcHumidifierTypeEnum: (STEAMINJECTION, ADIABATICAIRWASHER, ADIABATICPAN, ADIABATICWETTEDELEMENT, ADIABATICATOMIZING, ADIABATICULTRASONIC, ADIABATICRIGIDMEDIA, ADIABATICCOMPRESSEDAIRNOZZLE, ASSISTEDELECTRIC, ASSISTEDNATURALGAS, ASSISTEDPROPANE, ASSISTEDBUTANE, ASSISTEDSTEAM, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcHumidifierTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
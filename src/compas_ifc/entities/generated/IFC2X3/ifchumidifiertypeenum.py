@@ -0,0 +1,2 @@
+class IfcHumidifierTypeEnum(str):
+    items = ['STEAMINJECTION', 'ADIABATICAIRWASHER', 'ADIABATICPAN', 'ADIABATICWETTEDELEMENT', 'ADIABATICATOMIZING', 'ADIABATICULTRASONIC', 'ADIABATICRIGIDMEDIA', 'ADIABATICCOMPRESSEDAIRNOZZLE', 'ASSISTEDELECTRIC', 'ASSISTEDNATURALGAS', 'ASSISTEDPROPANE', 'ASSISTEDBUTANE', 'ASSISTEDSTEAM', 'USERDEFINED', 'NOTDEFINED']
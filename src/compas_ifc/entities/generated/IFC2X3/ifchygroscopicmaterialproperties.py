@@ -0,0 +1,50 @@
+from .ifcmaterialproperties import IfcMaterialProperties
+
+
+class IfcHygroscopicMaterialProperties(IfcMaterialProperties):
+    """Wrapper class for IfcHygroscopicMaterialProperties."""
+
+    @property
+    def UpperVaporResistanceFactor(self)-> float:
+        """<attribute UpperVaporResistanceFactor?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("UpperVaporResistanceFactor")
+
+    @UpperVaporResistanceFactor.setter
+    def UpperVaporResistanceFactor(self, value: float):
+        return self._set_attribute("UpperVaporResistanceFactor", value)
+
+    @property
+    def LowerVaporResistanceFactor(self)-> float:
+        """<attribute LowerVaporResistanceFactor?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("LowerVaporResistanceFactor")
+
+    @LowerVaporResistanceFactor.setter
+    def LowerVaporResistanceFactor(self, value: float):
+        return self._set_attribute("LowerVaporResistanceFactor", value)
+
+    @property
+    def IsothermalMoistureCapacity(self)-> float:
+        """<attribute IsothermalMoistureCapacity?: <type IfcIsothermalMoistureCapacityMeasure: <real>>>"""
+        return self._get_attribute("IsothermalMoistureCapacity")
+
+    @IsothermalMoistureCapacity.setter
+    def IsothermalMoistureCapacity(self, value: float):
+        return self._set_attribute("IsothermalMoistureCapacity", value)
+
+    @property
+    def VaporPermeability(self)-> float:
+        """<attribute VaporPermeability?: <type IfcVaporPermeabilityMeasure: <real>>>"""
+        return self._get_attribute("VaporPermeability")
+
+    @VaporPermeability.setter
+    def VaporPermeability(self, value: float):
+        return self._set_attribute("VaporPermeability", value)
+
+    @property
+    def MoistureDiffusivity(self)-> float:
+        """<attribute MoistureDiffusivity?: <type IfcMoistureDiffusivityMeasure: <real>>>"""
+        return self._get_attribute("MoistureDiffusivity")
+
+    @MoistureDiffusivity.setter
+    def MoistureDiffusivity(self, value: float):
+        return self._set_attribute("MoistureDiffusivity", value)
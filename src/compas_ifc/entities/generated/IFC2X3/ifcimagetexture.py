@@ -0,0 +1,14 @@
+from .ifcsurfacetexture import IfcSurfaceTexture
+
+
+class IfcImageTexture(IfcSurfaceTexture):
+    """Wrapper class for IfcImageTexture."""
+
+    @property
+    def UrlReference(self)-> str:
+        """<attribute UrlReference: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("UrlReference")
+
+    @UrlReference.setter
+    def UrlReference(self, value: str):
+        return self._set_attribute("UrlReference", value)
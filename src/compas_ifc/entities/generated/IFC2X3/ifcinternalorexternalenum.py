@@ -0,0 +1,2 @@
+class IfcInternalOrExternalEnum(str):
+    items = ['INTERNAL', 'EXTERNAL', 'NOTDEFINED']
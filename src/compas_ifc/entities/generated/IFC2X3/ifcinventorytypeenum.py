@@ -0,0 +1,2 @@
+class IfcInventoryTypeEnum(str):
+    items = ['ASSETINVENTORY', 'SPACEINVENTORY', 'FURNITUREINVENTORY', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifctimeseries import IfcTimeSeries
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcirregulartimeseriesvalue import IfcIrregularTimeSeriesValue
+
+class IfcIrregularTimeSeries(IfcTimeSeries):
+    """Wrapper class for IfcIrregularTimeSeries."""
+
+    @property
+    def Values(self)-> list["IfcIrregularTimeSeriesValue"]:
+        """<attribute Values: <list [1:?] of <entity IfcIrregularTimeSeriesValue>>>"""
+        return self._get_attribute("Values")
+
+    @Values.setter
+    def Values(self, value: list["IfcIrregularTimeSeriesValue"]):
+        return self._set_attribute("Values", value)
@@ -0,0 +1,29 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccalendardate import IfcCalendarDate
+    from .ifcdateandtime import IfcDateAndTime
+    from .ifclocaltime import IfcLocalTime
+
+class IfcIrregularTimeSeriesValue(Base):
+    """Wrapper class for IfcIrregularTimeSeriesValue."""
+
+    @property
+    def TimeStamp(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute TimeStamp: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("TimeStamp")
+
+    @TimeStamp.setter
+    def TimeStamp(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("TimeStamp", value)
+
+    @property
+    def ListValues(self)-> list[Union[list[float], list[int], str, float, int, bool]]:
+        """<attribute ListValues: <list [1:?] of <select IfcValue: (<select IfcDerivedMeasureValue: (<type IfcAbsorbedDoseMeasure: <real>> | <type IfcAccelerationMeasure: <real>> | <type IfcAngularVelocityMeasure: <real>> | <type IfcCompoundPlaneAngleMeasure: <list [3:4] of <integer>>> | <type IfcCurvatureMeasure: <real>> | <type IfcDoseEquivalentMeasure: <real>> | <type IfcDynamicViscosityMeasure: <real>> | <type IfcElectricCapacitanceMeasure: <real>> | <type IfcElectricChargeMeasure: <real>> | <type IfcElectricConductanceMeasure: <real>> | <type IfcElectricResistanceMeasure: <real>> | <type IfcElectricVoltageMeasure: <real>> | <type IfcEnergyMeasure: <real>> | <type IfcForceMeasure: <real>> | <type IfcFrequencyMeasure: <real>> | <type IfcHeatFluxDensityMeasure: <real>> | <type IfcHeatingValueMeasure: <real>> | <type IfcIlluminanceMeasure: <real>> | <type IfcInductanceMeasure: <real>> | <type IfcIntegerCountRateMeasure: <integer>> | <type IfcIonConcentrationMeasure: <real>> | <type IfcIsothermalMoistureCapacityMeasure: <real>> | <type IfcKinematicViscosityMeasure: <real>> | <type IfcLinearForceMeasure: <real>> | <type IfcLinearMomentMeasure: <real>> | <type IfcLinearStiffnessMeasure: <real>> | <type IfcLinearVelocityMeasure: <real>> | <type IfcLuminousFluxMeasure: <real>> | <type IfcLuminousIntensityDistributionMeasure: <real>> | <type IfcMagneticFluxDensityMeasure: <real>> | <type IfcMagneticFluxMeasure: <real>> | <type IfcMassDensityMeasure: <real>> | <type IfcMassFlowRateMeasure: <real>> | <type IfcMassPerLengthMeasure: <real>> | <type IfcModulusOfElasticityMeasure: <real>> | <type IfcModulusOfLinearSubgradeReactionMeasure: <real>> | <type IfcModulusOfRotationalSubgradeReactionMeasure: <real>> | <type IfcModulusOfSubgradeReactionMeasure: <real>> | <type IfcMoistureDiffusivityMeasure: <real>> | <type IfcMolecularWeightMeasure: <real>> | <type IfcMomentOfInertiaMeasure: <real>> | <type IfcMonetaryMeasure: <real>> | <type IfcPHMeasure: <real>> | <type IfcPlanarForceMeasure: <real>> | <type IfcPowerMeasure: <real>> | <type IfcPressureMeasure: <real>> | <type IfcRadioActivityMeasure: <real>> | <type IfcRotationalFrequencyMeasure: <real>> | <type IfcRotationalMassMeasure: <real>> | <type IfcRotationalStiffnessMeasure: <real>> | <type IfcSectionModulusMeasure: <real>> | <type IfcSectionalAreaIntegralMeasure: <real>> | <type IfcShearModulusMeasure: <real>> | <type IfcSoundPowerMeasure: <real>> | <type IfcSoundPressureMeasure: <real>> | <type IfcSpecificHeatCapacityMeasure: <real>> | <type IfcTemperatureGradientMeasure: <real>> | <type IfcThermalAdmittanceMeasure: <real>> | <type IfcThermalConductivityMeasure: <real>> | <type IfcThermalExpansionCoefficientMeasure: <real>> | <type IfcThermalResistanceMeasure: <real>> | <type IfcThermalTransmittanceMeasure: <real>> | <type IfcTimeStamp: <integer>> | <type IfcTorqueMeasure: <real>> | <type IfcVaporPermeabilityMeasure: <real>> | <type IfcVolumetricFlowRateMeasure: <real>> | <type IfcWarpingConstantMeasure: <real>> | <type IfcWarpingMomentMeasure: <real>>)> | <select IfcMeasureValue: (<type IfcAmountOfSubstanceMeasure: <real>> | <type IfcAreaMeasure: <real>> | <type IfcComplexNumber: <array [1:2] of <real>>> | <type IfcContextDependentMeasure: <real>> | <type IfcCountMeasure: <number>> | <type IfcDescriptiveMeasure: <string>> | <type IfcElectricCurrentMeasure: <real>> | <type IfcLengthMeasure: <real>> | <type IfcLuminousIntensityMeasure: <real>> | <type IfcMassMeasure: <real>> | <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>> | <type IfcNumericMeasure: <number>> | <type IfcParameterValue: <real>> | <type IfcPlaneAngleMeasure: <real>> | <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>> | <type IfcPositivePlaneAngleMeasure: <type IfcPlaneAngleMeasure: <real>>> | <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>> | <type IfcRatioMeasure: <real>> | <type IfcSolidAngleMeasure: <real>> | <type IfcThermodynamicTemperatureMeasure: <real>> | <type IfcTimeMeasure: <real>> | <type IfcVolumeMeasure: <real>>)> | <select IfcSimpleValue: (<type IfcBoolean: <boolean>> | <type IfcIdentifier: <string>> | <type IfcInteger: <integer>> | <type IfcLabel: <string>> | <type IfcLogical: <logical>> | <type IfcReal: <real>> | <type IfcText: <string>>)>)>>>"""
+        return self._get_attribute("ListValues")
+
+    @ListValues.setter
+    def ListValues(self, value: list[Union[list[float], list[int], str, float, int, bool]]):
+        return self._set_attribute("ListValues", value)
@@ -0,0 +1,50 @@
+from .ifcparameterizedprofiledef import IfcParameterizedProfileDef
+
+
+class IfcIShapeProfileDef(IfcParameterizedProfileDef):
+    """Wrapper class for IfcIShapeProfileDef."""
+
+    @property
+    def OverallWidth(self)-> float:
+        """<attribute OverallWidth: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("OverallWidth")
+
+    @OverallWidth.setter
+    def OverallWidth(self, value: float):
+        return self._set_attribute("OverallWidth", value)
+
+    @property
+    def OverallDepth(self)-> float:
+        """<attribute OverallDepth: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("OverallDepth")
+
+    @OverallDepth.setter
+    def OverallDepth(self, value: float):
+        return self._set_attribute("OverallDepth", value)
+
+    @property
+    def WebThickness(self)-> float:
+        """<attribute WebThickness: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("WebThickness")
+
+    @WebThickness.setter
+    def WebThickness(self, value: float):
+        return self._set_attribute("WebThickness", value)
+
+    @property
+    def FlangeThickness(self)-> float:
+        """<attribute FlangeThickness: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("FlangeThickness")
+
+    @FlangeThickness.setter
+    def FlangeThickness(self, value: float):
+        return self._set_attribute("FlangeThickness", value)
+
+    @property
+    def FilletRadius(self)-> float:
+        """<attribute FilletRadius?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("FilletRadius")
+
+    @FilletRadius.setter
+    def FilletRadius(self, value: float):
+        return self._set_attribute("FilletRadius", value)
@@ -0,0 +1,17 @@
+from .ifcflowfittingtype import IfcFlowFittingType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcjunctionboxtypeenum import IfcJunctionBoxTypeEnum
+
+class IfcJunctionBoxType(IfcFlowFittingType):
+    """Wrapper class for IfcJunctionBoxType."""
+
+    @property
+    def PredefinedType(self)-> "IfcJunctionBoxTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcJunctionBoxTypeEnum: (USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcJunctionBoxTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcJunctionBoxTypeEnum(str):
+    items = ['USERDEFINED', 'NOTDEFINED']
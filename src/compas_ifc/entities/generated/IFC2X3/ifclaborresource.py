@@ -0,0 +1,14 @@
+from .ifcconstructionresource import IfcConstructionResource
+
+
+class IfcLaborResource(IfcConstructionResource):
+    """Wrapper class for IfcLaborResource."""
+
+    @property
+    def SkillSet(self)-> str:
+        """<attribute SkillSet?: <type IfcText: <string>>>"""
+        return self._get_attribute("SkillSet")
+
+    @SkillSet.setter
+    def SkillSet(self, value: str):
+        return self._set_attribute("SkillSet", value)
@@ -0,0 +1,2 @@
+class IfcLampTypeEnum(str):
+    items = ['COMPACTFLUORESCENT', 'FLUORESCENT', 'HIGHPRESSUREMERCURY', 'HIGHPRESSURESODIUM', 'METALHALIDE', 'TUNGSTENFILAMENT', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,2 @@
+class IfcLayerSetDirectionEnum(str):
+    items = ['AXIS1', 'AXIS2', 'AXIS3']
@@ -0,0 +1,55 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccalendardate import IfcCalendarDate
+    from .ifclibraryreference import IfcLibraryReference
+    from .ifcorganization import IfcOrganization
+
+class IfcLibraryInformation(Base):
+    """Wrapper class for IfcLibraryInformation."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Version(self)-> str:
+        """<attribute Version?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Version")
+
+    @Version.setter
+    def Version(self, value: str):
+        return self._set_attribute("Version", value)
+
+    @property
+    def Publisher(self)-> "IfcOrganization":
+        """<attribute Publisher?: <entity IfcOrganization>>"""
+        return self._get_attribute("Publisher")
+
+    @Publisher.setter
+    def Publisher(self, value: "IfcOrganization"):
+        return self._set_attribute("Publisher", value)
+
+    @property
+    def VersionDate(self)-> "IfcCalendarDate":
+        """<attribute VersionDate?: <entity IfcCalendarDate>>"""
+        return self._get_attribute("VersionDate")
+
+    @VersionDate.setter
+    def VersionDate(self, value: "IfcCalendarDate"):
+        return self._set_attribute("VersionDate", value)
+
+    @property
+    def LibraryReference(self)-> list["IfcLibraryReference"]:
+        """<attribute LibraryReference?: <set [1:?] of <entity IfcLibraryReference>>>"""
+        return self._get_attribute("LibraryReference")
+
+    @LibraryReference.setter
+    def LibraryReference(self, value: list["IfcLibraryReference"]):
+        return self._set_attribute("LibraryReference", value)
@@ -0,0 +1,12 @@
+from .ifcexternalreference import IfcExternalReference
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifclibraryinformation import IfcLibraryInformation
+
+class IfcLibraryReference(IfcExternalReference):
+    """Wrapper class for IfcLibraryReference."""
+
+    def ReferenceIntoLibrary(self)-> list["IfcLibraryInformation"]:
+        """<inverse ReferenceIntoLibrary: set [0:1] of <entity IfcLibraryInformation> for <attribute LibraryReference?: <set [1:?] of <entity IfcLibraryReference>>>>"""
+        return self._get_inverse_attribute("ReferenceIntoLibrary")
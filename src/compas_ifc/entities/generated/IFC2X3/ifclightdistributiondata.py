@@ -0,0 +1,32 @@
+from compas_ifc.entities.base import Base
+
+
+class IfcLightDistributionData(Base):
+    """Wrapper class for IfcLightDistributionData."""
+
+    @property
+    def MainPlaneAngle(self)-> float:
+        """<attribute MainPlaneAngle: <type IfcPlaneAngleMeasure: <real>>>"""
+        return self._get_attribute("MainPlaneAngle")
+
+    @MainPlaneAngle.setter
+    def MainPlaneAngle(self, value: float):
+        return self._set_attribute("MainPlaneAngle", value)
+
+    @property
+    def SecondaryPlaneAngle(self)-> list[float]:
+        """<attribute SecondaryPlaneAngle: <list [1:?] of <type IfcPlaneAngleMeasure: <real>>>>"""
+        return self._get_attribute("SecondaryPlaneAngle")
+
+    @SecondaryPlaneAngle.setter
+    def SecondaryPlaneAngle(self, value: list[float]):
+        return self._set_attribute("SecondaryPlaneAngle", value)
+
+    @property
+    def LuminousIntensity(self)-> list[float]:
+        """<attribute LuminousIntensity: <list [1:?] of <type IfcLuminousIntensityDistributionMeasure: <real>>>>"""
+        return self._get_attribute("LuminousIntensity")
+
+    @LuminousIntensity.setter
+    def LuminousIntensity(self, value: list[float]):
+        return self._set_attribute("LuminousIntensity", value)
@@ -0,0 +1,44 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccolourrgb import IfcColourRgb
+
+class IfcLightSource(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcLightSource."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def LightColour(self)-> "IfcColourRgb":
+        """<attribute LightColour: <entity IfcColourRgb>>"""
+        return self._get_attribute("LightColour")
+
+    @LightColour.setter
+    def LightColour(self, value: "IfcColourRgb"):
+        return self._set_attribute("LightColour", value)
+
+    @property
+    def AmbientIntensity(self)-> float:
+        """<attribute AmbientIntensity?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("AmbientIntensity")
+
+    @AmbientIntensity.setter
+    def AmbientIntensity(self, value: float):
+        return self._set_attribute("AmbientIntensity", value)
+
+    @property
+    def Intensity(self)-> float:
+        """<attribute Intensity?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("Intensity")
+
+    @Intensity.setter
+    def Intensity(self, value: float):
+        return self._set_attribute("Intensity", value)
@@ -0,0 +1,67 @@
+from .ifclightsource import IfcLightSource
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaxis2placement3d import IfcAxis2Placement3D
+    from .ifccolourrgb import IfcColourRgb
+    from .ifcexternalreference import IfcExternalReference
+    from .ifclightemissionsourceenum import IfcLightEmissionSourceEnum
+    from .ifclightintensitydistribution import IfcLightIntensityDistribution
+
+class IfcLightSourceGoniometric(IfcLightSource):
+    """Wrapper class for IfcLightSourceGoniometric."""
+
+    @property
+    def Position(self)-> "IfcAxis2Placement3D":
+        """<attribute Position: <entity IfcAxis2Placement3D>>"""
+        return self._get_attribute("Position")
+
+    @Position.setter
+    def Position(self, value: "IfcAxis2Placement3D"):
+        return self._set_attribute("Position", value)
+
+    @property
+    def ColourAppearance(self)-> "IfcColourRgb":
+        """<attribute ColourAppearance?: <entity IfcColourRgb>>"""
+        return self._get_attribute("ColourAppearance")
+
+    @ColourAppearance.setter
+    def ColourAppearance(self, value: "IfcColourRgb"):
+        return self._set_attribute("ColourAppearance", value)
+
+    @property
+    def ColourTemperature(self)-> float:
+        """<attribute ColourTemperature: <type IfcThermodynamicTemperatureMeasure: <real>>>"""
+        return self._get_attribute("ColourTemperature")
+
+    @ColourTemperature.setter
+    def ColourTemperature(self, value: float):
+        return self._set_attribute("ColourTemperature", value)
+
+    @property
+    def LuminousFlux(self)-> float:
+        """<attribute LuminousFlux: <type IfcLuminousFluxMeasure: <real>>>"""
+        return self._get_attribute("LuminousFlux")
+
+    @LuminousFlux.setter
+    def LuminousFlux(self, value: float):
+        return self._set_attribute("LuminousFlux", value)
+
+    @property
+    def LightEmissionSource(self)-> "IfcLightEmissionSourceEnum":
+        """<attribute LightEmissionSource: <enumeration IfcLightEmissionSourceEnum: (COMPACTFLUORESCENT, FLUORESCENT, HIGHPRESSUREMERCURY, HIGHPRESSURESODIUM, LIGHTEMITTINGDIODE, LOWPRESSURESODIUM, LOWVOLTAGEHALOGEN, MAINVOLTAGEHALOGEN, METALHALIDE, TUNGSTENFILAMENT, NOTDEFINED)>>"""
+        return self._get_attribute("LightEmissionSource")
+
+    @LightEmissionSource.setter
+    def LightEmissionSource(self, value: "IfcLightEmissionSourceEnum"):
+        return self._set_attribute("LightEmissionSource", value)
+
+    @property
+    def LightDistributionDataSource(self)-> Union["IfcLightIntensityDistribution", "IfcExternalReference"]:
+        """<attribute LightDistributionDataSource: <select IfcLightDistributionDataSourceSelect: (<entity IfcExternalReference> | <entity IfcLightIntensityDistribution>)>>"""
+        return self._get_attribute("LightDistributionDataSource")
+
+    @LightDistributionDataSource.setter
+    def LightDistributionDataSource(self, value: Union["IfcLightIntensityDistribution", "IfcExternalReference"]):
+        return self._set_attribute("LightDistributionDataSource", value)
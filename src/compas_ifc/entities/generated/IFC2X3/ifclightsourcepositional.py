@@ -0,0 +1,53 @@
+from .ifclightsource import IfcLightSource
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccartesianpoint import IfcCartesianPoint
+
+class IfcLightSourcePositional(IfcLightSource):
+    """Wrapper class for IfcLightSourcePositional."""
+
+    @property
+    def Position(self)-> "IfcCartesianPoint":
+        """<attribute Position: <entity IfcCartesianPoint>>"""
+        return self._get_attribute("Position")
+
+    @Position.setter
+    def Position(self, value: "IfcCartesianPoint"):
+        return self._set_attribute("Position", value)
+
+    @property
+    def Radius(self)-> float:
+        """<attribute Radius: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Radius")
+
+    @Radius.setter
+    def Radius(self, value: float):
+        return self._set_attribute("Radius", value)
+
+    @property
+    def ConstantAttenuation(self)-> float:
+        """<attribute ConstantAttenuation: <type IfcReal: <real>>>"""
+        return self._get_attribute("ConstantAttenuation")
+
+    @ConstantAttenuation.setter
+    def ConstantAttenuation(self, value: float):
+        return self._set_attribute("ConstantAttenuation", value)
+
+    @property
+    def DistanceAttenuation(self)-> float:
+        """<attribute DistanceAttenuation: <type IfcReal: <real>>>"""
+        return self._get_attribute("DistanceAttenuation")
+
+    @DistanceAttenuation.setter
+    def DistanceAttenuation(self, value: float):
+        return self._set_attribute("DistanceAttenuation", value)
+
+    @property
+    def QuadricAttenuation(self)-> float:
+        """<attribute QuadricAttenuation: <type IfcReal: <real>>>"""
+        return self._get_attribute("QuadricAttenuation")
+
+    @QuadricAttenuation.setter
+    def QuadricAttenuation(self, value: float):
+        return self._set_attribute("QuadricAttenuation", value)
@@ -0,0 +1,44 @@
+from .ifclightsourcepositional import IfcLightSourcePositional
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdirection import IfcDirection
+
+class IfcLightSourceSpot(IfcLightSourcePositional):
+    """Wrapper class for IfcLightSourceSpot."""
+
+    @property
+    def Orientation(self)-> "IfcDirection":
+        """<attribute Orientation: <entity IfcDirection>>"""
+        return self._get_attribute("Orientation")
+
+    @Orientation.setter
+    def Orientation(self, value: "IfcDirection"):
+        return self._set_attribute("Orientation", value)
+
+    @property
+    def ConcentrationExponent(self)-> float:
+        """<attribute ConcentrationExponent?: <type IfcReal: <real>>>"""
+        return self._get_attribute("ConcentrationExponent")
+
+    @ConcentrationExponent.setter
+    def ConcentrationExponent(self, value: float):
+        return self._set_attribute("ConcentrationExponent", value)
+
+    @property
+    def SpreadAngle(self)-> float:
+        """<attribute SpreadAngle: <type IfcPositivePlaneAngleMeasure: <type IfcPlaneAngleMeasure: <real>>>>"""
+        return self._get_attribute("SpreadAngle")
+
+    @SpreadAngle.setter
+    def SpreadAngle(self, value: float):
+        return self._set_attribute("SpreadAngle", value)
+
+    @property
+    def BeamWidthAngle(self)-> float:
+        """<attribute BeamWidthAngle: <type IfcPositivePlaneAngleMeasure: <type IfcPlaneAngleMeasure: <real>>>>"""
+        return self._get_attribute("BeamWidthAngle")
+
+    @BeamWidthAngle.setter
+    def BeamWidthAngle(self, value: float):
+        return self._set_attribute("BeamWidthAngle", value)
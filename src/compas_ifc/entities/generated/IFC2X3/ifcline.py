@@ -0,0 +1,27 @@
+from .ifccurve import IfcCurve
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccartesianpoint import IfcCartesianPoint
+    from .ifcvector import IfcVector
+
+class IfcLine(IfcCurve):
+    """Wrapper class for IfcLine."""
+
+    @property
+    def Pnt(self)-> "IfcCartesianPoint":
+        """<attribute Pnt: <entity IfcCartesianPoint>>"""
+        return self._get_attribute("Pnt")
+
+    @Pnt.setter
+    def Pnt(self, value: "IfcCartesianPoint"):
+        return self._set_attribute("Pnt", value)
+
+    @property
+    def Dir(self)-> "IfcVector":
+        """<attribute Dir: <entity IfcVector>>"""
+        return self._get_attribute("Dir")
+
+    @Dir.setter
+    def Dir(self, value: "IfcVector"):
+        return self._set_attribute("Dir", value)
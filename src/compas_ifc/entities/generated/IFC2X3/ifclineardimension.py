@@ -0,0 +1,5 @@
+from .ifcdimensioncurvedirectedcallout import IfcDimensionCurveDirectedCallout
+
+
+class IfcLinearDimension(IfcDimensionCurveDirectedCallout):
+    """Wrapper class for IfcLinearDimension."""
@@ -0,0 +1,29 @@
+from .ifcobjectplacement import IfcObjectPlacement
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaxis2placement2d import IfcAxis2Placement2D
+    from .ifcaxis2placement3d import IfcAxis2Placement3D
+    from .ifcobjectplacement import IfcObjectPlacement
+
+class IfcLocalPlacement(IfcObjectPlacement):
+    """Wrapper class for IfcLocalPlacement."""
+
+    @property
+    def PlacementRelTo(self)-> "IfcObjectPlacement":
+        """<attribute PlacementRelTo?: <entity IfcObjectPlacement>>"""
+        return self._get_attribute("PlacementRelTo")
+
+    @PlacementRelTo.setter
+    def PlacementRelTo(self, value: "IfcObjectPlacement"):
+        return self._set_attribute("PlacementRelTo", value)
+
+    @property
+    def RelativePlacement(self)-> Union["IfcAxis2Placement3D", "IfcAxis2Placement2D"]:
+        """<attribute RelativePlacement: <select IfcAxis2Placement: (<entity IfcAxis2Placement2D> | <entity IfcAxis2Placement3D>)>>"""
+        return self._get_attribute("RelativePlacement")
+
+    @RelativePlacement.setter
+    def RelativePlacement(self, value: Union["IfcAxis2Placement3D", "IfcAxis2Placement2D"]):
+        return self._set_attribute("RelativePlacement", value)
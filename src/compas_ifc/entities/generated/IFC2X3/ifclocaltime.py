@@ -0,0 +1,53 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccoordinateduniversaltimeoffset import IfcCoordinatedUniversalTimeOffset
+
+class IfcLocalTime(Base):
+    """Wrapper class for IfcLocalTime."""
+
+    @property
+    def HourComponent(self)-> int:
+        """<attribute HourComponent: <type IfcHourInDay: <integer>>>"""
+        return self._get_attribute("HourComponent")
+
+    @HourComponent.setter
+    def HourComponent(self, value: int):
+        return self._set_attribute("HourComponent", value)
+
+    @property
+    def MinuteComponent(self)-> int:
+        """<attribute MinuteComponent?: <type IfcMinuteInHour: <integer>>>"""
+        return self._get_attribute("MinuteComponent")
+
+    @MinuteComponent.setter
+    def MinuteComponent(self, value: int):
+        return self._set_attribute("MinuteComponent", value)
+
+    @property
+    def SecondComponent(self)-> float:
+        """<attribute SecondComponent?: <type IfcSecondInMinute: <real>>>"""
+        return self._get_attribute("SecondComponent")
+
+    @SecondComponent.setter
+    def SecondComponent(self, value: float):
+        return self._set_attribute("SecondComponent", value)
+
+    @property
+    def Zone(self)-> "IfcCoordinatedUniversalTimeOffset":
+        """<attribute Zone?: <entity IfcCoordinatedUniversalTimeOffset>>"""
+        return self._get_attribute("Zone")
+
+    @Zone.setter
+    def Zone(self, value: "IfcCoordinatedUniversalTimeOffset"):
+        return self._set_attribute("Zone", value)
+
+    @property
+    def DaylightSavingOffset(self)-> int:
+        """<attribute DaylightSavingOffset?: <type IfcDaylightSavingHour: <integer>>>"""
+        return self._get_attribute("DaylightSavingOffset")
+
+    @DaylightSavingOffset.setter
+    def DaylightSavingOffset(self, value: int):
+        return self._set_attribute("DaylightSavingOffset", value)
@@ -0,0 +1,2 @@
+class IfcLogicalOperatorEnum(str):
+    items = ['LOGICALAND', 'LOGICALOR']
@@ -0,0 +1,5 @@
+from .ifctopologicalrepresentationitem import IfcTopologicalRepresentationItem
+
+
+class IfcLoop(IfcTopologicalRepresentationItem):
+    """Wrapper class for IfcLoop."""
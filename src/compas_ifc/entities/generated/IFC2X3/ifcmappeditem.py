@@ -0,0 +1,27 @@
+from .ifcrepresentationitem import IfcRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccartesiantransformationoperator import IfcCartesianTransformationOperator
+    from .ifcrepresentationmap import IfcRepresentationMap
+
+class IfcMappedItem(IfcRepresentationItem):
+    """Wrapper class for IfcMappedItem."""
+
+    @property
+    def MappingSource(self)-> "IfcRepresentationMap":
+        """<attribute MappingSource: <entity IfcRepresentationMap>>"""
+        return self._get_attribute("MappingSource")
+
+    @MappingSource.setter
+    def MappingSource(self, value: "IfcRepresentationMap"):
+        return self._set_attribute("MappingSource", value)
+
+    @property
+    def MappingTarget(self)-> "IfcCartesianTransformationOperator":
+        """<attribute MappingTarget: <entity IfcCartesianTransformationOperator>>"""
+        return self._get_attribute("MappingTarget")
+
+    @MappingTarget.setter
+    def MappingTarget(self, value: "IfcCartesianTransformationOperator"):
+        return self._set_attribute("MappingTarget", value)
@@ -0,0 +1,26 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmaterialclassificationrelationship import IfcMaterialClassificationRelationship
+    from .ifcmaterialdefinitionrepresentation import IfcMaterialDefinitionRepresentation
+
+class IfcMaterial(Base):
+    """Wrapper class for IfcMaterial."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    def HasRepresentation(self)-> list["IfcMaterialDefinitionRepresentation"]:
+        """<inverse HasRepresentation: set [0:1] of <entity IfcMaterialDefinitionRepresentation> for <attribute RepresentedMaterial: <entity IfcMaterial>>>"""
+        return self._get_inverse_attribute("HasRepresentation")
+
+    def ClassifiedAs(self)-> list["IfcMaterialClassificationRelationship"]:
+        """<inverse ClassifiedAs: set [0:1] of <entity IfcMaterialClassificationRelationship> for <attribute ClassifiedMaterial: <entity IfcMaterial>>>"""
+        return self._get_inverse_attribute("ClassifiedAs")
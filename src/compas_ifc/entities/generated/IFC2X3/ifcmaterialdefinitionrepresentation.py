@@ -0,0 +1,17 @@
+from .ifcproductrepresentation import IfcProductRepresentation
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmaterial import IfcMaterial
+
+class IfcMaterialDefinitionRepresentation(IfcProductRepresentation):
+    """Wrapper class for IfcMaterialDefinitionRepresentation."""
+
+    @property
+    def RepresentedMaterial(self)-> "IfcMaterial":
+        """<attribute RepresentedMaterial: <entity IfcMaterial>>"""
+        return self._get_attribute("RepresentedMaterial")
+
+    @RepresentedMaterial.setter
+    def RepresentedMaterial(self, value: "IfcMaterial"):
+        return self._set_attribute("RepresentedMaterial", value)
@@ -0,0 +1,40 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmaterial import IfcMaterial
+    from .ifcmateriallayerset import IfcMaterialLayerSet
+
+class IfcMaterialLayer(Base):
+    """Wrapper class for IfcMaterialLayer."""
+
+    @property
+    def Material(self)-> "IfcMaterial":
+        """<attribute Material?: <entity IfcMaterial>>"""
+        return self._get_attribute("Material")
+
+    @Material.setter
+    def Material(self, value: "IfcMaterial"):
+        return self._set_attribute("Material", value)
+
+    @property
+    def LayerThickness(self)-> float:
+        """<attribute LayerThickness: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("LayerThickness")
+
+    @LayerThickness.setter
+    def LayerThickness(self, value: float):
+        return self._set_attribute("LayerThickness", value)
+
+    @property
+    def IsVentilated(self)-> bool:
+        """<attribute IsVentilated?: <type IfcLogical: <logical>>>"""
+        return self._get_attribute("IsVentilated")
+
+    @IsVentilated.setter
+    def IsVentilated(self, value: bool):
+        return self._set_attribute("IsVentilated", value)
+
+    def ToMaterialLayerSet(self)-> list["IfcMaterialLayerSet"]:
+        """<inverse ToMaterialLayerSet:  [?:?] of <entity IfcMaterialLayerSet> for <attribute MaterialLayers: <list [1:?] of <entity IfcMaterialLayer>>>>"""
+        return self._get_inverse_attribute("ToMaterialLayerSet")
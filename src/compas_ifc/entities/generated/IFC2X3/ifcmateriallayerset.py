@@ -0,0 +1,26 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmateriallayer import IfcMaterialLayer
+
+class IfcMaterialLayerSet(Base):
+    """Wrapper class for IfcMaterialLayerSet."""
+
+    @property
+    def MaterialLayers(self)-> list["IfcMaterialLayer"]:
+        """<attribute MaterialLayers: <list [1:?] of <entity IfcMaterialLayer>>>"""
+        return self._get_attribute("MaterialLayers")
+
+    @MaterialLayers.setter
+    def MaterialLayers(self, value: list["IfcMaterialLayer"]):
+        return self._set_attribute("MaterialLayers", value)
+
+    @property
+    def LayerSetName(self)-> str:
+        """<attribute LayerSetName?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("LayerSetName")
+
+    @LayerSetName.setter
+    def LayerSetName(self, value: str):
+        return self._set_attribute("LayerSetName", value)
@@ -0,0 +1,17 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmaterial import IfcMaterial
+
+class IfcMaterialList(Base):
+    """Wrapper class for IfcMaterialList."""
+
+    @property
+    def Materials(self)-> list["IfcMaterial"]:
+        """<attribute Materials: <list [1:?] of <entity IfcMaterial>>>"""
+        return self._get_attribute("Materials")
+
+    @Materials.setter
+    def Materials(self, value: list["IfcMaterial"]):
+        return self._set_attribute("Materials", value)
@@ -0,0 +1,17 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmaterial import IfcMaterial
+
+class IfcMaterialProperties(Base):
+    """Wrapper class for IfcMaterialProperties."""
+
+    @property
+    def Material(self)-> "IfcMaterial":
+        """<attribute Material: <entity IfcMaterial>>"""
+        return self._get_attribute("Material")
+
+    @Material.setter
+    def Material(self, value: "IfcMaterial"):
+        return self._set_attribute("Material", value)
@@ -0,0 +1,59 @@
+from .ifcmechanicalmaterialproperties import IfcMechanicalMaterialProperties
+
+
+class IfcMechanicalConcreteMaterialProperties(IfcMechanicalMaterialProperties):
+    """Wrapper class for IfcMechanicalConcreteMaterialProperties."""
+
+    @property
+    def CompressiveStrength(self)-> float:
+        """<attribute CompressiveStrength?: <type IfcPressureMeasure: <real>>>"""
+        return self._get_attribute("CompressiveStrength")
+
+    @CompressiveStrength.setter
+    def CompressiveStrength(self, value: float):
+        return self._set_attribute("CompressiveStrength", value)
+
+    @property
+    def MaxAggregateSize(self)-> float:
+        """<attribute MaxAggregateSize?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("MaxAggregateSize")
+
+    @MaxAggregateSize.setter
+    def MaxAggregateSize(self, value: float):
+        return self._set_attribute("MaxAggregateSize", value)
+
+    @property
+    def AdmixturesDescription(self)-> str:
+        """<attribute AdmixturesDescription?: <type IfcText: <string>>>"""
+        return self._get_attribute("AdmixturesDescription")
+
+    @AdmixturesDescription.setter
+    def AdmixturesDescription(self, value: str):
+        return self._set_attribute("AdmixturesDescription", value)
+
+    @property
+    def Workability(self)-> str:
+        """<attribute Workability?: <type IfcText: <string>>>"""
+        return self._get_attribute("Workability")
+
+    @Workability.setter
+    def Workability(self, value: str):
+        return self._set_attribute("Workability", value)
+
+    @property
+    def ProtectivePoreRatio(self)-> float:
+        """<attribute ProtectivePoreRatio?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("ProtectivePoreRatio")
+
+    @ProtectivePoreRatio.setter
+    def ProtectivePoreRatio(self, value: float):
+        return self._set_attribute("ProtectivePoreRatio", value)
+
+    @property
+    def WaterImpermeability(self)-> str:
+        """<attribute WaterImpermeability?: <type IfcText: <string>>>"""
+        return self._get_attribute("WaterImpermeability")
+
+    @WaterImpermeability.setter
+    def WaterImpermeability(self, value: str):
+        return self._set_attribute("WaterImpermeability", value)
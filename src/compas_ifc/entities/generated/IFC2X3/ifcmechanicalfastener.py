@@ -0,0 +1,23 @@
+from .ifcfastener import IfcFastener
+
+
+class IfcMechanicalFastener(IfcFastener):
+    """Wrapper class for IfcMechanicalFastener."""
+
+    @property
+    def NominalDiameter(self)-> float:
+        """<attribute NominalDiameter?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("NominalDiameter")
+
+    @NominalDiameter.setter
+    def NominalDiameter(self, value: float):
+        return self._set_attribute("NominalDiameter", value)
+
+    @property
+    def NominalLength(self)-> float:
+        """<attribute NominalLength?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("NominalLength")
+
+    @NominalLength.setter
+    def NominalLength(self, value: float):
+        return self._set_attribute("NominalLength", value)
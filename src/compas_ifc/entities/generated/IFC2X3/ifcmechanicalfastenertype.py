@@ -0,0 +1,5 @@
+from .ifcfastenertype import IfcFastenerType
+
+
+class IfcMechanicalFastenerType(IfcFastenerType):
+    """Wrapper class for IfcMechanicalFastenerType."""
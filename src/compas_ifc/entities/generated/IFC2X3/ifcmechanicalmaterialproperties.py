@@ -0,0 +1,50 @@
+from .ifcmaterialproperties import IfcMaterialProperties
+
+
+class IfcMechanicalMaterialProperties(IfcMaterialProperties):
+    """Wrapper class for IfcMechanicalMaterialProperties."""
+
+    @property
+    def DynamicViscosity(self)-> float:
+        """<attribute DynamicViscosity?: <type IfcDynamicViscosityMeasure: <real>>>"""
+        return self._get_attribute("DynamicViscosity")
+
+    @DynamicViscosity.setter
+    def DynamicViscosity(self, value: float):
+        return self._set_attribute("DynamicViscosity", value)
+
+    @property
+    def YoungModulus(self)-> float:
+        """<attribute YoungModulus?: <type IfcModulusOfElasticityMeasure: <real>>>"""
+        return self._get_attribute("YoungModulus")
+
+    @YoungModulus.setter
+    def YoungModulus(self, value: float):
+        return self._set_attribute("YoungModulus", value)
+
+    @property
+    def ShearModulus(self)-> float:
+        """<attribute ShearModulus?: <type IfcModulusOfElasticityMeasure: <real>>>"""
+        return self._get_attribute("ShearModulus")
+
+    @ShearModulus.setter
+    def ShearModulus(self, value: float):
+        return self._set_attribute("ShearModulus", value)
+
+    @property
+    def PoissonRatio(self)-> float:
+        """<attribute PoissonRatio?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("PoissonRatio")
+
+    @PoissonRatio.setter
+    def PoissonRatio(self, value: float):
+        return self._set_attribute("PoissonRatio", value)
+
+    @property
+    def ThermalExpansionCoefficient(self)-> float:
+        """<attribute ThermalExpansionCoefficient?: <type IfcThermalExpansionCoefficientMeasure: <real>>>"""
+        return self._get_attribute("ThermalExpansionCoefficient")
+
+    @ThermalExpansionCoefficient.setter
+    def ThermalExpansionCoefficient(self, value: float):
+        return self._set_attribute("ThermalExpansionCoefficient", value)
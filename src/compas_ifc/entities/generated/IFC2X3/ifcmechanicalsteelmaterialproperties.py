@@ -0,0 +1,71 @@
+from .ifcmechanicalmaterialproperties import IfcMechanicalMaterialProperties
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelaxation import IfcRelaxation
+
+class IfcMechanicalSteelMaterialProperties(IfcMechanicalMaterialProperties):
+    """Wrapper class for IfcMechanicalSteelMaterialProperties."""
+
+    @property
+    def YieldStress(self)-> float:
+        """<attribute YieldStress?: <type IfcPressureMeasure: <real>>>"""
+        return self._get_attribute("YieldStress")
+
+    @YieldStress.setter
+    def YieldStress(self, value: float):
+        return self._set_attribute("YieldStress", value)
+
+    @property
+    def UltimateStress(self)-> float:
+        """<attribute UltimateStress?: <type IfcPressureMeasure: <real>>>"""
+        return self._get_attribute("UltimateStress")
+
+    @UltimateStress.setter
+    def UltimateStress(self, value: float):
+        return self._set_attribute("UltimateStress", value)
+
+    @property
+    def UltimateStrain(self)-> float:
+        """<attribute UltimateStrain?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("UltimateStrain")
+
+    @UltimateStrain.setter
+    def UltimateStrain(self, value: float):
+        return self._set_attribute("UltimateStrain", value)
+
+    @property
+    def HardeningModule(self)-> float:
+        """<attribute HardeningModule?: <type IfcModulusOfElasticityMeasure: <real>>>"""
+        return self._get_attribute("HardeningModule")
+
+    @HardeningModule.setter
+    def HardeningModule(self, value: float):
+        return self._set_attribute("HardeningModule", value)
+
+    @property
+    def ProportionalStress(self)-> float:
+        """<attribute ProportionalStress?: <type IfcPressureMeasure: <real>>>"""
+        return self._get_attribute("ProportionalStress")
+
+    @ProportionalStress.setter
+    def ProportionalStress(self, value: float):
+        return self._set_attribute("ProportionalStress", value)
+
+    @property
+    def PlasticStrain(self)-> float:
+        """<attribute PlasticStrain?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("PlasticStrain")
+
+    @PlasticStrain.setter
+    def PlasticStrain(self, value: float):
+        return self._set_attribute("PlasticStrain", value)
+
+    @property
+    def Relaxations(self)-> list["IfcRelaxation"]:
+        """<attribute Relaxations?: <set [1:?] of <entity IfcRelaxation>>>"""
+        return self._get_attribute("Relaxations")
+
+    @Relaxations.setter
+    def Relaxations(self, value: list["IfcRelaxation"]):
+        return self._set_attribute("Relaxations", value)
@@ -0,0 +1,5 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+
+class IfcMember(IfcBuildingElement):
+    """Wrapper class for IfcMember."""
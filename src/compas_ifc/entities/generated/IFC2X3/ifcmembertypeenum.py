@@ -0,0 +1,2 @@
+class IfcMemberTypeEnum(str):
+    items = ['BRACE', 'CHORD', 'COLLAR', 'MEMBER', 'MULLION', 'PLATE', 'POST', 'PURLIN', 'RAFTER', 'STRINGER', 'STRUT', 'STUD', 'USERDEFINED', 'NOTDEFINED']
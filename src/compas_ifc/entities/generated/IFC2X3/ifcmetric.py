@@ -0,0 +1,43 @@
+from .ifcconstraint import IfcConstraint
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcbenchmarkenum import IfcBenchmarkEnum
+    from .ifccalendardate import IfcCalendarDate
+    from .ifccostvalue import IfcCostValue
+    from .ifcdateandtime import IfcDateAndTime
+    from .ifclocaltime import IfcLocalTime
+    from .ifcmeasurewithunit import IfcMeasureWithUnit
+    from .ifctable import IfcTable
+    from .ifctimeseries import IfcTimeSeries
+
+class IfcMetric(IfcConstraint):
+    """Wrapper class for IfcMetric."""
+
+    @property
+    def Benchmark(self)-> "IfcBenchmarkEnum":
+        """<attribute Benchmark: <enumeration IfcBenchmarkEnum: (GREATERTHAN, GREATERTHANOREQUALTO, LESSTHAN, LESSTHANOREQUALTO, EQUALTO, NOTEQUALTO)>>"""
+        return self._get_attribute("Benchmark")
+
+    @Benchmark.setter
+    def Benchmark(self, value: "IfcBenchmarkEnum"):
+        return self._set_attribute("Benchmark", value)
+
+    @property
+    def ValueSource(self)-> str:
+        """<attribute ValueSource?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ValueSource")
+
+    @ValueSource.setter
+    def ValueSource(self, value: str):
+        return self._set_attribute("ValueSource", value)
+
+    @property
+    def DataValue(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate", "IfcTable", "IfcTimeSeries", str, "IfcCostValue", "IfcMeasureWithUnit"]:
+        """<attribute DataValue: <select IfcMetricValueSelect: (<entity IfcCostValue> | <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)> | <entity IfcMeasureWithUnit> | <entity IfcTable> | <type IfcText: <string>> | <entity IfcTimeSeries>)>>"""
+        return self._get_attribute("DataValue")
+
+    @DataValue.setter
+    def DataValue(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate", "IfcTable", "IfcTimeSeries", str, "IfcCostValue", "IfcMeasureWithUnit"]):
+        return self._set_attribute("DataValue", value)
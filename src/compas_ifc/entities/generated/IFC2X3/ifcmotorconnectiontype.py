@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevicetype import IfcEnergyConversionDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmotorconnectiontypeenum import IfcMotorConnectionTypeEnum
+
+class IfcMotorConnectionType(IfcEnergyConversionDeviceType):
+    """Wrapper class for IfcMotorConnectionType."""
+
+    @property
+    def PredefinedType(self)-> "IfcMotorConnectionTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcMotorConnectionTypeEnum: (BELTDRIVE, COUPLING, DIRECTDRIVE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcMotorConnectionTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
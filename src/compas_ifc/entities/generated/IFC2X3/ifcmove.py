@@ -0,0 +1,35 @@
+from .ifctask import IfcTask
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcspatialstructureelement import IfcSpatialStructureElement
+
+class IfcMove(IfcTask):
+    """Wrapper class for IfcMove."""
+
+    @property
+    def MoveFrom(self)-> "IfcSpatialStructureElement":
+        """<attribute MoveFrom: <entity IfcSpatialStructureElement>>"""
+        return self._get_attribute("MoveFrom")
+
+    @MoveFrom.setter
+    def MoveFrom(self, value: "IfcSpatialStructureElement"):
+        return self._set_attribute("MoveFrom", value)
+
+    @property
+    def MoveTo(self)-> "IfcSpatialStructureElement":
+        """<attribute MoveTo: <entity IfcSpatialStructureElement>>"""
+        return self._get_attribute("MoveTo")
+
+    @MoveTo.setter
+    def MoveTo(self, value: "IfcSpatialStructureElement"):
+        return self._set_attribute("MoveTo", value)
+
+    @property
+    def PunchList(self)-> list[str]:
+        """<attribute PunchList?: <list [1:?] of <type IfcText: <string>>>>"""
+        return self._get_attribute("PunchList")
+
+    @PunchList.setter
+    def PunchList(self, value: list[str]):
+        return self._set_attribute("PunchList", value)
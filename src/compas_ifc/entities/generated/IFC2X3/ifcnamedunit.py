@@ -0,0 +1,27 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdimensionalexponents import IfcDimensionalExponents
+    from .ifcunitenum import IfcUnitEnum
+
+class IfcNamedUnit(Base):
+    """Wrapper class for IfcNamedUnit."""
+
+    @property
+    def Dimensions(self)-> "IfcDimensionalExponents":
+        """<attribute Dimensions: <entity IfcDimensionalExponents>>"""
+        return self._get_attribute("Dimensions")
+
+    @Dimensions.setter
+    def Dimensions(self, value: "IfcDimensionalExponents"):
+        return self._set_attribute("Dimensions", value)
+
+    @property
+    def UnitType(self)-> "IfcUnitEnum":
+        """<attribute UnitType: <enumeration IfcUnitEnum: (ABSORBEDDOSEUNIT, AMOUNTOFSUBSTANCEUNIT, AREAUNIT, DOSEEQUIVALENTUNIT, ELECTRICCAPACITANCEUNIT, ELECTRICCHARGEUNIT, ELECTRICCONDUCTANCEUNIT, ELECTRICCURRENTUNIT, ELECTRICRESISTANCEUNIT, ELECTRICVOLTAGEUNIT, ENERGYUNIT, FORCEUNIT, FREQUENCYUNIT, ILLUMINANCEUNIT, INDUCTANCEUNIT, LENGTHUNIT, LUMINOUSFLUXUNIT, LUMINOUSINTENSITYUNIT, MAGNETICFLUXDENSITYUNIT, MAGNETICFLUXUNIT, MASSUNIT, PLANEANGLEUNIT, POWERUNIT, PRESSUREUNIT, RADIOACTIVITYUNIT, SOLIDANGLEUNIT, THERMODYNAMICTEMPERATUREUNIT, TIMEUNIT, VOLUMEUNIT, USERDEFINED)>>"""
+        return self._get_attribute("UnitType")
+
+    @UnitType.setter
+    def UnitType(self, value: "IfcUnitEnum"):
+        return self._set_attribute("UnitType", value)
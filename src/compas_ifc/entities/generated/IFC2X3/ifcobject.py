@@ -0,0 +1,22 @@
+from .ifcobjectdefinition import IfcObjectDefinition
+from compas_ifc.entities.extensions import IfcObject as IfcObject_Ext   # type: ignore
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcreldefines import IfcRelDefines
+
+class IfcObject(IfcObject_Ext, IfcObjectDefinition):
+    """Wrapper class for IfcObject."""
+
+    @property
+    def ObjectType(self)-> str:
+        """<attribute ObjectType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ObjectType")
+
+    @ObjectType.setter
+    def ObjectType(self, value: str):
+        return self._set_attribute("ObjectType", value)
+
+    def IsDefinedBy(self)-> list["IfcRelDefines"]:
+        """<inverse IsDefinedBy: set [0:?] of <entity IfcRelDefines> for <attribute RelatedObjects: <set [1:?] of <entity IfcObject>>>>"""
+        return self._get_inverse_attribute("IsDefinedBy")
@@ -0,0 +1,27 @@
+from .ifcroot import IfcRoot
+from compas_ifc.entities.extensions import IfcObjectDefinition as IfcObjectDefinition_Ext   # type: ignore
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelassigns import IfcRelAssigns
+    from .ifcrelassociates import IfcRelAssociates
+    from .ifcreldecomposes import IfcRelDecomposes
+
+class IfcObjectDefinition(IfcObjectDefinition_Ext, IfcRoot):
+    """Wrapper class for IfcObjectDefinition."""
+
+    def HasAssignments(self)-> list["IfcRelAssigns"]:
+        """<inverse HasAssignments: set [0:?] of <entity IfcRelAssigns> for <attribute RelatedObjects: <set [1:?] of <entity IfcObjectDefinition>>>>"""
+        return self._get_inverse_attribute("HasAssignments")
+
+    def IsDecomposedBy(self)-> list["IfcRelDecomposes"]:
+        """<inverse IsDecomposedBy: set [0:?] of <entity IfcRelDecomposes> for <attribute RelatingObject: <entity IfcObjectDefinition>>>"""
+        return self._get_inverse_attribute("IsDecomposedBy")
+
+    def Decomposes(self)-> list["IfcRelDecomposes"]:
+        """<inverse Decomposes: set [0:1] of <entity IfcRelDecomposes> for <attribute RelatedObjects: <set [1:?] of <entity IfcObjectDefinition>>>>"""
+        return self._get_inverse_attribute("Decomposes")
+
+    def HasAssociations(self)-> list["IfcRelAssociates"]:
+        """<inverse HasAssociations: set [0:?] of <entity IfcRelAssociates> for <attribute RelatedObjects: <set [1:?] of <entity IfcRoot>>>>"""
+        return self._get_inverse_attribute("HasAssociations")
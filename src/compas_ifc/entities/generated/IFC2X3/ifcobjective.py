@@ -0,0 +1,45 @@
+from .ifcconstraint import IfcConstraint
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmetric import IfcMetric
+    from .ifcobjectiveenum import IfcObjectiveEnum
+
+class IfcObjective(IfcConstraint):
+    """Wrapper class for IfcObjective."""
+
+    @property
+    def BenchmarkValues(self)-> "IfcMetric":
+        """<attribute BenchmarkValues?: <entity IfcMetric>>"""
+        return self._get_attribute("BenchmarkValues")
+
+    @BenchmarkValues.setter
+    def BenchmarkValues(self, value: "IfcMetric"):
+        return self._set_attribute("BenchmarkValues", value)
+
+    @property
+    def ResultValues(self)-> "IfcMetric":
+        """<attribute ResultValues?: <entity IfcMetric>>"""
+        return self._get_attribute("ResultValues")
+
+    @ResultValues.setter
+    def ResultValues(self, value: "IfcMetric"):
+        return self._set_attribute("ResultValues", value)
+
+    @property
+    def ObjectiveQualifier(self)-> "IfcObjectiveEnum":
+        """<attribute ObjectiveQualifier: <enumeration IfcObjectiveEnum: (CODECOMPLIANCE, DESIGNINTENT, HEALTHANDSAFETY, REQUIREMENT, SPECIFICATION, TRIGGERCONDITION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("ObjectiveQualifier")
+
+    @ObjectiveQualifier.setter
+    def ObjectiveQualifier(self, value: "IfcObjectiveEnum"):
+        return self._set_attribute("ObjectiveQualifier", value)
+
+    @property
+    def UserDefinedQualifier(self)-> str:
+        """<attribute UserDefinedQualifier?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedQualifier")
+
+    @UserDefinedQualifier.setter
+    def UserDefinedQualifier(self, value: str):
+        return self._set_attribute("UserDefinedQualifier", value)
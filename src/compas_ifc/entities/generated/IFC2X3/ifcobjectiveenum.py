@@ -0,0 +1,2 @@
+class IfcObjectiveEnum(str):
+    items = ['CODECOMPLIANCE', 'DESIGNINTENT', 'HEALTHANDSAFETY', 'REQUIREMENT', 'SPECIFICATION', 'TRIGGERCONDITION', 'USERDEFINED', 'NOTDEFINED']
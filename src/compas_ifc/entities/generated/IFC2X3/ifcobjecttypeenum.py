@@ -0,0 +1,2 @@
+class IfcObjectTypeEnum(str):
+    items = ['PRODUCT', 'PROCESS', 'CONTROL', 'RESOURCE', 'ACTOR', 'GROUP', 'PROJECT', 'NOTDEFINED']
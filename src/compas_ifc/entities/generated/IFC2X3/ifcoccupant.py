@@ -0,0 +1,17 @@
+from .ifcactor import IfcActor
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcoccupanttypeenum import IfcOccupantTypeEnum
+
+class IfcOccupant(IfcActor):
+    """Wrapper class for IfcOccupant."""
+
+    @property
+    def PredefinedType(self)-> "IfcOccupantTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcOccupantTypeEnum: (ASSIGNEE, ASSIGNOR, LESSEE, LESSOR, LETTINGAGENT, OWNER, TENANT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcOccupantTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
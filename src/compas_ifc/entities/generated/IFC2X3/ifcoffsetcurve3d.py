@@ -0,0 +1,45 @@
+from .ifccurve import IfcCurve
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccurve import IfcCurve
+    from .ifcdirection import IfcDirection
+
+class IfcOffsetCurve3D(IfcCurve):
+    """Wrapper class for IfcOffsetCurve3D."""
+
+    @property
+    def BasisCurve(self)-> "IfcCurve":
+        """<attribute BasisCurve: <entity IfcCurve>>"""
+        return self._get_attribute("BasisCurve")
+
+    @BasisCurve.setter
+    def BasisCurve(self, value: "IfcCurve"):
+        return self._set_attribute("BasisCurve", value)
+
+    @property
+    def Distance(self)-> float:
+        """<attribute Distance: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("Distance")
+
+    @Distance.setter
+    def Distance(self, value: float):
+        return self._set_attribute("Distance", value)
+
+    @property
+    def SelfIntersect(self)-> bool:
+        """<attribute SelfIntersect: <logical>>"""
+        return self._get_attribute("SelfIntersect")
+
+    @SelfIntersect.setter
+    def SelfIntersect(self, value: bool):
+        return self._set_attribute("SelfIntersect", value)
+
+    @property
+    def RefDirection(self)-> "IfcDirection":
+        """<attribute RefDirection: <entity IfcDirection>>"""
+        return self._get_attribute("RefDirection")
+
+    @RefDirection.setter
+    def RefDirection(self, value: "IfcDirection"):
+        return self._set_attribute("RefDirection", value)
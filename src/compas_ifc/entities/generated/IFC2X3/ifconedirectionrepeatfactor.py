@@ -0,0 +1,17 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcvector import IfcVector
+
+class IfcOneDirectionRepeatFactor(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcOneDirectionRepeatFactor."""
+
+    @property
+    def RepeatFactor(self)-> "IfcVector":
+        """<attribute RepeatFactor: <entity IfcVector>>"""
+        return self._get_attribute("RepeatFactor")
+
+    @RepeatFactor.setter
+    def RepeatFactor(self, value: "IfcVector"):
+        return self._set_attribute("RepeatFactor", value)
@@ -0,0 +1,12 @@
+from .ifcfeatureelementsubtraction import IfcFeatureElementSubtraction
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelfillselement import IfcRelFillsElement
+
+class IfcOpeningElement(IfcFeatureElementSubtraction):
+    """Wrapper class for IfcOpeningElement."""
+
+    def HasFillings(self)-> list["IfcRelFillsElement"]:
+        """<inverse HasFillings: set [0:?] of <entity IfcRelFillsElement> for <attribute RelatingOpeningElement: <entity IfcOpeningElement>>>"""
+        return self._get_inverse_attribute("HasFillings")
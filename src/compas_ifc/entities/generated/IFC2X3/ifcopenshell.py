@@ -0,0 +1,5 @@
+from .ifcconnectedfaceset import IfcConnectedFaceSet
+
+
+class IfcOpenShell(IfcConnectedFaceSet):
+    """Wrapper class for IfcOpenShell."""
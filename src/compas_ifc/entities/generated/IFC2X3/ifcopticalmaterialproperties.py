@@ -0,0 +1,86 @@
+from .ifcmaterialproperties import IfcMaterialProperties
+
+
+class IfcOpticalMaterialProperties(IfcMaterialProperties):
+    """Wrapper class for IfcOpticalMaterialProperties."""
+
+    @property
+    def VisibleTransmittance(self)-> float:
+        """<attribute VisibleTransmittance?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("VisibleTransmittance")
+
+    @VisibleTransmittance.setter
+    def VisibleTransmittance(self, value: float):
+        return self._set_attribute("VisibleTransmittance", value)
+
+    @property
+    def SolarTransmittance(self)-> float:
+        """<attribute SolarTransmittance?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("SolarTransmittance")
+
+    @SolarTransmittance.setter
+    def SolarTransmittance(self, value: float):
+        return self._set_attribute("SolarTransmittance", value)
+
+    @property
+    def ThermalIrTransmittance(self)-> float:
+        """<attribute ThermalIrTransmittance?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("ThermalIrTransmittance")
+
+    @ThermalIrTransmittance.setter
+    def ThermalIrTransmittance(self, value: float):
+        return self._set_attribute("ThermalIrTransmittance", value)
+
+    @property
+    def ThermalIrEmissivityBack(self)-> float:
+        """<attribute ThermalIrEmissivityBack?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("ThermalIrEmissivityBack")
+
+    @ThermalIrEmissivityBack.setter
+    def ThermalIrEmissivityBack(self, value: float):
+        return self._set_attribute("ThermalIrEmissivityBack", value)
+
+    @property
+    def ThermalIrEmissivityFront(self)-> float:
+        """<attribute ThermalIrEmissivityFront?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("ThermalIrEmissivityFront")
+
+    @ThermalIrEmissivityFront.setter
+    def ThermalIrEmissivityFront(self, value: float):
+        return self._set_attribute("ThermalIrEmissivityFront", value)
+
+    @property
+    def VisibleReflectanceBack(self)-> float:
+        """<attribute VisibleReflectanceBack?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("VisibleReflectanceBack")
+
+    @VisibleReflectanceBack.setter
+    def VisibleReflectanceBack(self, value: float):
+        return self._set_attribute("VisibleReflectanceBack", value)
+
+    @property
+    def VisibleReflectanceFront(self)-> float:
+        """<attribute VisibleReflectanceFront?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("VisibleReflectanceFront")
+
+    @VisibleReflectanceFront.setter
+    def VisibleReflectanceFront(self, value: float):
+        return self._set_attribute("VisibleReflectanceFront", value)
+
+    @property
+    def SolarReflectanceFront(self)-> float:
+        """<attribute SolarReflectanceFront?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("SolarReflectanceFront")
+
+    @SolarReflectanceFront.setter
+    def SolarReflectanceFront(self, value: float):
+        return self._set_attribute("SolarReflectanceFront", value)
+
+    @property
+    def SolarReflectanceBack(self)-> float:
+        """<attribute SolarReflectanceBack?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("SolarReflectanceBack")
+
+    @SolarReflectanceBack.setter
+    def SolarReflectanceBack(self, value: float):
+        return self._set_attribute("SolarReflectanceBack", value)
@@ -0,0 +1,14 @@
+from .ifctask import IfcTask
+
+
+class IfcOrderAction(IfcTask):
+    """Wrapper class for IfcOrderAction."""
+
+    @property
+    def ActionID(self)-> str:
+        """<attribute ActionID: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("ActionID")
+
+    @ActionID.setter
+    def ActionID(self, value: str):
+        return self._set_attribute("ActionID", value)
@@ -0,0 +1,44 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcorganization import IfcOrganization
+
+class IfcOrganizationRelationship(Base):
+    """Wrapper class for IfcOrganizationRelationship."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def RelatingOrganization(self)-> "IfcOrganization":
+        """<attribute RelatingOrganization: <entity IfcOrganization>>"""
+        return self._get_attribute("RelatingOrganization")
+
+    @RelatingOrganization.setter
+    def RelatingOrganization(self, value: "IfcOrganization"):
+        return self._set_attribute("RelatingOrganization", value)
+
+    @property
+    def RelatedOrganizations(self)-> list["IfcOrganization"]:
+        """<attribute RelatedOrganizations: <set [1:?] of <entity IfcOrganization>>>"""
+        return self._get_attribute("RelatedOrganizations")
+
+    @RelatedOrganizations.setter
+    def RelatedOrganizations(self, value: list["IfcOrganization"]):
+        return self._set_attribute("RelatedOrganizations", value)
@@ -0,0 +1,47 @@
+from .ifcedge import IfcEdge
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcedge import IfcEdge
+    from .ifcvertex import IfcVertex
+
+class IfcOrientedEdge(IfcEdge):
+    """Wrapper class for IfcOrientedEdge."""
+
+    @property
+    def EdgeStart(self)-> "IfcVertex":
+        """<attribute EdgeStart: <entity IfcVertex>>"""
+        return self._get_attribute("EdgeStart")
+
+    @EdgeStart.setter
+    def EdgeStart(self, value: "IfcVertex"):
+        # Derived attribute
+        pass
+
+    @property
+    def EdgeEnd(self)-> "IfcVertex":
+        """<attribute EdgeEnd: <entity IfcVertex>>"""
+        return self._get_attribute("EdgeEnd")
+
+    @EdgeEnd.setter
+    def EdgeEnd(self, value: "IfcVertex"):
+        # Derived attribute
+        pass
+
+    @property
+    def EdgeElement(self)-> "IfcEdge":
+        """<attribute EdgeElement: <entity IfcEdge>>"""
+        return self._get_attribute("EdgeElement")
+
+    @EdgeElement.setter
+    def EdgeElement(self, value: "IfcEdge"):
+        return self._set_attribute("EdgeElement", value)
+
+    @property
+    def Orientation(self)-> bool:
+        """<attribute Orientation: <boolean>>"""
+        return self._get_attribute("Orientation")
+
+    @Orientation.setter
+    def Orientation(self, value: bool):
+        return self._set_attribute("Orientation", value)
@@ -0,0 +1,17 @@
+from .ifcflowterminaltype import IfcFlowTerminalType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcoutlettypeenum import IfcOutletTypeEnum
+
+class IfcOutletType(IfcFlowTerminalType):
+    """Wrapper class for IfcOutletType."""
+
+    @property
+    def PredefinedType(self)-> "IfcOutletTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcOutletTypeEnum: (AUDIOVISUALOUTLET, COMMUNICATIONSOUTLET, POWEROUTLET, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcOutletTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
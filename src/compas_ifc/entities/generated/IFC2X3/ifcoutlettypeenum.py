@@ -0,0 +1,2 @@
+class IfcOutletTypeEnum(str):
+    items = ['AUDIOVISUALOUTLET', 'COMMUNICATIONSOUTLET', 'POWEROUTLET', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifctopologicalrepresentationitem import IfcTopologicalRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcorientededge import IfcOrientedEdge
+
+class IfcPath(IfcTopologicalRepresentationItem):
+    """Wrapper class for IfcPath."""
+
+    @property
+    def EdgeList(self)-> list["IfcOrientedEdge"]:
+        """<attribute EdgeList: <list [1:?] of <entity IfcOrientedEdge>>>"""
+        return self._get_attribute("EdgeList")
+
+    @EdgeList.setter
+    def EdgeList(self, value: list["IfcOrientedEdge"]):
+        return self._set_attribute("EdgeList", value)
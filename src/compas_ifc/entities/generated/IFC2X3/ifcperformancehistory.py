@@ -0,0 +1,14 @@
+from .ifccontrol import IfcControl
+
+
+class IfcPerformanceHistory(IfcControl):
+    """Wrapper class for IfcPerformanceHistory."""
+
+    @property
+    def LifeCyclePhase(self)-> str:
+        """<attribute LifeCyclePhase: <type IfcLabel: <string>>>"""
+        return self._get_attribute("LifeCyclePhase")
+
+    @LifeCyclePhase.setter
+    def LifeCyclePhase(self, value: str):
+        return self._set_attribute("LifeCyclePhase", value)
@@ -0,0 +1,14 @@
+from .ifccontrol import IfcControl
+
+
+class IfcPermit(IfcControl):
+    """Wrapper class for IfcPermit."""
+
+    @property
+    def PermitID(self)-> str:
+        """<attribute PermitID: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("PermitID")
+
+    @PermitID.setter
+    def PermitID(self, value: str):
+        return self._set_attribute("PermitID", value)
@@ -0,0 +1,37 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcactorrole import IfcActorRole
+    from .ifcorganization import IfcOrganization
+    from .ifcperson import IfcPerson
+
+class IfcPersonAndOrganization(Base):
+    """Wrapper class for IfcPersonAndOrganization."""
+
+    @property
+    def ThePerson(self)-> "IfcPerson":
+        """<attribute ThePerson: <entity IfcPerson>>"""
+        return self._get_attribute("ThePerson")
+
+    @ThePerson.setter
+    def ThePerson(self, value: "IfcPerson"):
+        return self._set_attribute("ThePerson", value)
+
+    @property
+    def TheOrganization(self)-> "IfcOrganization":
+        """<attribute TheOrganization: <entity IfcOrganization>>"""
+        return self._get_attribute("TheOrganization")
+
+    @TheOrganization.setter
+    def TheOrganization(self, value: "IfcOrganization"):
+        return self._set_attribute("TheOrganization", value)
+
+    @property
+    def Roles(self)-> list["IfcActorRole"]:
+        """<attribute Roles?: <list [1:?] of <entity IfcActorRole>>>"""
+        return self._get_attribute("Roles")
+
+    @Roles.setter
+    def Roles(self, value: list["IfcActorRole"]):
+        return self._set_attribute("Roles", value)
@@ -0,0 +1,44 @@
+from .ifcphysicalquantity import IfcPhysicalQuantity
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcphysicalquantity import IfcPhysicalQuantity
+
+class IfcPhysicalComplexQuantity(IfcPhysicalQuantity):
+    """Wrapper class for IfcPhysicalComplexQuantity."""
+
+    @property
+    def HasQuantities(self)-> list["IfcPhysicalQuantity"]:
+        """<attribute HasQuantities: <set [1:?] of <entity IfcPhysicalQuantity>>>"""
+        return self._get_attribute("HasQuantities")
+
+    @HasQuantities.setter
+    def HasQuantities(self, value: list["IfcPhysicalQuantity"]):
+        return self._set_attribute("HasQuantities", value)
+
+    @property
+    def Discrimination(self)-> str:
+        """<attribute Discrimination: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Discrimination")
+
+    @Discrimination.setter
+    def Discrimination(self, value: str):
+        return self._set_attribute("Discrimination", value)
+
+    @property
+    def Quality(self)-> str:
+        """<attribute Quality?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Quality")
+
+    @Quality.setter
+    def Quality(self, value: str):
+        return self._set_attribute("Quality", value)
+
+    @property
+    def Usage(self)-> str:
+        """<attribute Usage?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Usage")
+
+    @Usage.setter
+    def Usage(self, value: str):
+        return self._set_attribute("Usage", value)
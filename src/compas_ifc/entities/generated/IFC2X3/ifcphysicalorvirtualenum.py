@@ -0,0 +1,2 @@
+class IfcPhysicalOrVirtualEnum(str):
+    items = ['PHYSICAL', 'VIRTUAL', 'NOTDEFINED']
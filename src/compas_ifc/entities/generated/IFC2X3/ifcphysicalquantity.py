@@ -0,0 +1,30 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcphysicalcomplexquantity import IfcPhysicalComplexQuantity
+
+class IfcPhysicalQuantity(Base):
+    """Wrapper class for IfcPhysicalQuantity."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    def PartOfComplex(self)-> list["IfcPhysicalComplexQuantity"]:
+        """<inverse PartOfComplex: set [0:1] of <entity IfcPhysicalComplexQuantity> for <attribute HasQuantities: <set [1:?] of <entity IfcPhysicalQuantity>>>>"""
+        return self._get_inverse_attribute("PartOfComplex")
@@ -0,0 +1,2 @@
+class IfcPileTypeEnum(str):
+    items = ['COHESION', 'FRICTION', 'SUPPORT', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcflowfittingtype import IfcFlowFittingType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpipefittingtypeenum import IfcPipeFittingTypeEnum
+
+class IfcPipeFittingType(IfcFlowFittingType):
+    """Wrapper class for IfcPipeFittingType."""
+
+    @property
+    def PredefinedType(self)-> "IfcPipeFittingTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcPipeFittingTypeEnum: (BEND, CONNECTOR, ENTRY, EXIT, JUNCTION, OBSTRUCTION, TRANSITION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcPipeFittingTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcPipeFittingTypeEnum(str):
+    items = ['BEND', 'CONNECTOR', 'ENTRY', 'EXIT', 'JUNCTION', 'OBSTRUCTION', 'TRANSITION', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,2 @@
+class IfcPipeSegmentTypeEnum(str):
+    items = ['FLEXIBLESEGMENT', 'RIGIDSEGMENT', 'GUTTER', 'SPOOL', 'USERDEFINED', 'NOTDEFINED']
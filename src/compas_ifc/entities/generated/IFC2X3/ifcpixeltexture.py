@@ -0,0 +1,41 @@
+from .ifcsurfacetexture import IfcSurfaceTexture
+
+
+class IfcPixelTexture(IfcSurfaceTexture):
+    """Wrapper class for IfcPixelTexture."""
+
+    @property
+    def Width(self)-> int:
+        """<attribute Width: <type IfcInteger: <integer>>>"""
+        return self._get_attribute("Width")
+
+    @Width.setter
+    def Width(self, value: int):
+        return self._set_attribute("Width", value)
+
+    @property
+    def Height(self)-> int:
+        """<attribute Height: <type IfcInteger: <integer>>>"""
+        return self._get_attribute("Height")
+
+    @Height.setter
+    def Height(self, value: int):
+        return self._set_attribute("Height", value)
+
+    @property
+    def ColourComponents(self)-> int:
+        """<attribute ColourComponents: <type IfcInteger: <integer>>>"""
+        return self._get_attribute("ColourComponents")
+
+    @ColourComponents.setter
+    def ColourComponents(self, value: int):
+        return self._set_attribute("ColourComponents", value)
+
+    @property
+    def Pixel(self)-> list[bytes]:
+        """<attribute Pixel: <list [1:?] of <binary>>>"""
+        return self._get_attribute("Pixel")
+
+    @Pixel.setter
+    def Pixel(self, value: list[bytes]):
+        return self._set_attribute("Pixel", value)
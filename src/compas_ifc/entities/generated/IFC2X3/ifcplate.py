@@ -0,0 +1,5 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+
+class IfcPlate(IfcBuildingElement):
+    """Wrapper class for IfcPlate."""
@@ -0,0 +1,26 @@
+from .ifcpoint import IfcPoint
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccurve import IfcCurve
+
+class IfcPointOnCurve(IfcPoint):
+    """Wrapper class for IfcPointOnCurve."""
+
+    @property
+    def BasisCurve(self)-> "IfcCurve":
+        """<attribute BasisCurve: <entity IfcCurve>>"""
+        return self._get_attribute("BasisCurve")
+
+    @BasisCurve.setter
+    def BasisCurve(self, value: "IfcCurve"):
+        return self._set_attribute("BasisCurve", value)
+
+    @property
+    def PointParameter(self)-> float:
+        """<attribute PointParameter: <type IfcParameterValue: <real>>>"""
+        return self._get_attribute("PointParameter")
+
+    @PointParameter.setter
+    def PointParameter(self, value: float):
+        return self._set_attribute("PointParameter", value)
@@ -0,0 +1,35 @@
+from .ifcpoint import IfcPoint
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcsurface import IfcSurface
+
+class IfcPointOnSurface(IfcPoint):
+    """Wrapper class for IfcPointOnSurface."""
+
+    @property
+    def BasisSurface(self)-> "IfcSurface":
+        """<attribute BasisSurface: <entity IfcSurface>>"""
+        return self._get_attribute("BasisSurface")
+
+    @BasisSurface.setter
+    def BasisSurface(self, value: "IfcSurface"):
+        return self._set_attribute("BasisSurface", value)
+
+    @property
+    def PointParameterU(self)-> float:
+        """<attribute PointParameterU: <type IfcParameterValue: <real>>>"""
+        return self._get_attribute("PointParameterU")
+
+    @PointParameterU.setter
+    def PointParameterU(self, value: float):
+        return self._set_attribute("PointParameterU", value)
+
+    @property
+    def PointParameterV(self)-> float:
+        """<attribute PointParameterV: <type IfcParameterValue: <real>>>"""
+        return self._get_attribute("PointParameterV")
+
+    @PointParameterV.setter
+    def PointParameterV(self, value: float):
+        return self._set_attribute("PointParameterV", value)
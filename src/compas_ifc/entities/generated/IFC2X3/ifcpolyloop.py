@@ -0,0 +1,17 @@
+from .ifcloop import IfcLoop
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccartesianpoint import IfcCartesianPoint
+
+class IfcPolyLoop(IfcLoop):
+    """Wrapper class for IfcPolyLoop."""
+
+    @property
+    def Polygon(self)-> list["IfcCartesianPoint"]:
+        """<attribute Polygon: <list [3:?] of <entity IfcCartesianPoint>>>"""
+        return self._get_attribute("Polygon")
+
+    @Polygon.setter
+    def Polygon(self, value: list["IfcCartesianPoint"]):
+        return self._set_attribute("Polygon", value)
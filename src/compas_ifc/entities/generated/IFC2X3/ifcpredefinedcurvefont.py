@@ -0,0 +1,5 @@
+from .ifcpredefineditem import IfcPreDefinedItem
+
+
+class IfcPreDefinedCurveFont(IfcPreDefinedItem):
+    """Wrapper class for IfcPreDefinedCurveFont."""
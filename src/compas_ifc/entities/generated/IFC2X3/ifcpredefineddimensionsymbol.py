@@ -0,0 +1,5 @@
+from .ifcpredefinedsymbol import IfcPreDefinedSymbol
+
+
+class IfcPreDefinedDimensionSymbol(IfcPreDefinedSymbol):
+    """Wrapper class for IfcPreDefinedDimensionSymbol."""
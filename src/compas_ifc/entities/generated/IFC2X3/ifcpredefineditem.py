@@ -0,0 +1,14 @@
+from compas_ifc.entities.base import Base
+
+
+class IfcPreDefinedItem(Base):
+    """Wrapper class for IfcPreDefinedItem."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
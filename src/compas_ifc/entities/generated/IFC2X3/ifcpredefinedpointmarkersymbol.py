@@ -0,0 +1,5 @@
+from .ifcpredefinedsymbol import IfcPreDefinedSymbol
+
+
+class IfcPreDefinedPointMarkerSymbol(IfcPreDefinedSymbol):
+    """Wrapper class for IfcPreDefinedPointMarkerSymbol."""
@@ -0,0 +1,5 @@
+from .ifcpredefineditem import IfcPreDefinedItem
+
+
+class IfcPreDefinedSymbol(IfcPreDefinedItem):
+    """Wrapper class for IfcPreDefinedSymbol."""
@@ -0,0 +1,5 @@
+from .ifcpredefinedsymbol import IfcPreDefinedSymbol
+
+
+class IfcPreDefinedTerminatorSymbol(IfcPreDefinedSymbol):
+    """Wrapper class for IfcPreDefinedTerminatorSymbol."""
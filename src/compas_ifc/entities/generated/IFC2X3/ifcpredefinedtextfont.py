@@ -0,0 +1,5 @@
+from .ifcpredefineditem import IfcPreDefinedItem
+
+
+class IfcPreDefinedTextFont(IfcPreDefinedItem):
+    """Wrapper class for IfcPreDefinedTextFont."""
@@ -0,0 +1,50 @@
+from .ifcpresentationlayerassignment import IfcPresentationLayerAssignment
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccurvestyle import IfcCurveStyle
+    from .ifcfillareastyle import IfcFillAreaStyle
+    from .ifcnullstyle import IfcNullStyle
+    from .ifcsurfacestyle import IfcSurfaceStyle
+    from .ifcsymbolstyle import IfcSymbolStyle
+    from .ifctextstyle import IfcTextStyle
+
+class IfcPresentationLayerWithStyle(IfcPresentationLayerAssignment):
+    """Wrapper class for IfcPresentationLayerWithStyle."""
+
+    @property
+    def LayerOn(self)-> bool:
+        """<attribute LayerOn: <logical>>"""
+        return self._get_attribute("LayerOn")
+
+    @LayerOn.setter
+    def LayerOn(self, value: bool):
+        return self._set_attribute("LayerOn", value)
+
+    @property
+    def LayerFrozen(self)-> bool:
+        """<attribute LayerFrozen: <logical>>"""
+        return self._get_attribute("LayerFrozen")
+
+    @LayerFrozen.setter
+    def LayerFrozen(self, value: bool):
+        return self._set_attribute("LayerFrozen", value)
+
+    @property
+    def LayerBlocked(self)-> bool:
+        """<attribute LayerBlocked: <logical>>"""
+        return self._get_attribute("LayerBlocked")
+
+    @LayerBlocked.setter
+    def LayerBlocked(self, value: bool):
+        return self._set_attribute("LayerBlocked", value)
+
+    @property
+    def LayerStyles(self)-> list[Union["IfcSurfaceStyle", "IfcSymbolStyle", "IfcNullStyle", "IfcTextStyle", "IfcFillAreaStyle", "IfcCurveStyle"]]:
+        """<attribute LayerStyles: <set [0:?] of <select IfcPresentationStyleSelect: (<entity IfcCurveStyle> | <entity IfcFillAreaStyle> | <enumeration IfcNullStyle: (NULL)> | <entity IfcSurfaceStyle> | <entity IfcSymbolStyle> | <entity IfcTextStyle>)>>>"""
+        return self._get_attribute("LayerStyles")
+
+    @LayerStyles.setter
+    def LayerStyles(self, value: list[Union["IfcSurfaceStyle", "IfcSymbolStyle", "IfcNullStyle", "IfcTextStyle", "IfcFillAreaStyle", "IfcCurveStyle"]]):
+        return self._set_attribute("LayerStyles", value)
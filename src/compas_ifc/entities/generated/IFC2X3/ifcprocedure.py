@@ -0,0 +1,35 @@
+from .ifcprocess import IfcProcess
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcproceduretypeenum import IfcProcedureTypeEnum
+
+class IfcProcedure(IfcProcess):
+    """Wrapper class for IfcProcedure."""
+
+    @property
+    def ProcedureID(self)-> str:
+        """<attribute ProcedureID: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("ProcedureID")
+
+    @ProcedureID.setter
+    def ProcedureID(self, value: str):
+        return self._set_attribute("ProcedureID", value)
+
+    @property
+    def ProcedureType(self)-> "IfcProcedureTypeEnum":
+        """<attribute ProcedureType: <enumeration IfcProcedureTypeEnum: (ADVICE_CAUTION, ADVICE_NOTE, ADVICE_WARNING, CALIBRATION, DIAGNOSTIC, SHUTDOWN, STARTUP, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("ProcedureType")
+
+    @ProcedureType.setter
+    def ProcedureType(self, value: "IfcProcedureTypeEnum"):
+        return self._set_attribute("ProcedureType", value)
+
+    @property
+    def UserDefinedProcedureType(self)-> str:
+        """<attribute UserDefinedProcedureType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedProcedureType")
+
+    @UserDefinedProcedureType.setter
+    def UserDefinedProcedureType(self, value: str):
+        return self._set_attribute("UserDefinedProcedureType", value)
@@ -0,0 +1,21 @@
+from .ifcobject import IfcObject
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelassignstoprocess import IfcRelAssignsToProcess
+    from .ifcrelsequence import IfcRelSequence
+
+class IfcProcess(IfcObject):
+    """Wrapper class for IfcProcess."""
+
+    def OperatesOn(self)-> list["IfcRelAssignsToProcess"]:
+        """<inverse OperatesOn: set [0:?] of <entity IfcRelAssignsToProcess> for <attribute RelatingProcess: <entity IfcProcess>>>"""
+        return self._get_inverse_attribute("OperatesOn")
+
+    def IsSuccessorFrom(self)-> list["IfcRelSequence"]:
+        """<inverse IsSuccessorFrom: set [0:?] of <entity IfcRelSequence> for <attribute RelatedProcess: <entity IfcProcess>>>"""
+        return self._get_inverse_attribute("IsSuccessorFrom")
+
+    def IsPredecessorTo(self)-> list["IfcRelSequence"]:
+        """<inverse IsPredecessorTo: set [0:?] of <entity IfcRelSequence> for <attribute RelatingProcess: <entity IfcProcess>>>"""
+        return self._get_inverse_attribute("IsPredecessorTo")
@@ -0,0 +1,35 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrepresentation import IfcRepresentation
+
+class IfcProductRepresentation(Base):
+    """Wrapper class for IfcProductRepresentation."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def Representations(self)-> list["IfcRepresentation"]:
+        """<attribute Representations: <list [1:?] of <entity IfcRepresentation>>>"""
+        return self._get_attribute("Representations")
+
+    @Representations.setter
+    def Representations(self, value: list["IfcRepresentation"]):
+        return self._set_attribute("Representations", value)
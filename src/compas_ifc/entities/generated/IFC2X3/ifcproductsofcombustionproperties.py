@@ -0,0 +1,41 @@
+from .ifcmaterialproperties import IfcMaterialProperties
+
+
+class IfcProductsOfCombustionProperties(IfcMaterialProperties):
+    """Wrapper class for IfcProductsOfCombustionProperties."""
+
+    @property
+    def SpecificHeatCapacity(self)-> float:
+        """<attribute SpecificHeatCapacity?: <type IfcSpecificHeatCapacityMeasure: <real>>>"""
+        return self._get_attribute("SpecificHeatCapacity")
+
+    @SpecificHeatCapacity.setter
+    def SpecificHeatCapacity(self, value: float):
+        return self._set_attribute("SpecificHeatCapacity", value)
+
+    @property
+    def N20Content(self)-> float:
+        """<attribute N20Content?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("N20Content")
+
+    @N20Content.setter
+    def N20Content(self, value: float):
+        return self._set_attribute("N20Content", value)
+
+    @property
+    def COContent(self)-> float:
+        """<attribute COContent?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("COContent")
+
+    @COContent.setter
+    def COContent(self, value: float):
+        return self._set_attribute("COContent", value)
+
+    @property
+    def CO2Content(self)-> float:
+        """<attribute CO2Content?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("CO2Content")
+
+    @CO2Content.setter
+    def CO2Content(self, value: float):
+        return self._set_attribute("CO2Content", value)
@@ -0,0 +1,26 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcprofiletypeenum import IfcProfileTypeEnum
+
+class IfcProfileDef(Base):
+    """Wrapper class for IfcProfileDef."""
+
+    @property
+    def ProfileType(self)-> "IfcProfileTypeEnum":
+        """<attribute ProfileType: <enumeration IfcProfileTypeEnum: (CURVE, AREA)>>"""
+        return self._get_attribute("ProfileType")
+
+    @ProfileType.setter
+    def ProfileType(self, value: "IfcProfileTypeEnum"):
+        return self._set_attribute("ProfileType", value)
+
+    @property
+    def ProfileName(self)-> str:
+        """<attribute ProfileName?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ProfileName")
+
+    @ProfileName.setter
+    def ProfileName(self, value: str):
+        return self._set_attribute("ProfileName", value)
@@ -0,0 +1,26 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcprofiledef import IfcProfileDef
+
+class IfcProfileProperties(Base):
+    """Wrapper class for IfcProfileProperties."""
+
+    @property
+    def ProfileName(self)-> str:
+        """<attribute ProfileName?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ProfileName")
+
+    @ProfileName.setter
+    def ProfileName(self, value: str):
+        return self._set_attribute("ProfileName", value)
+
+    @property
+    def ProfileDefinition(self)-> "IfcProfileDef":
+        """<attribute ProfileDefinition?: <entity IfcProfileDef>>"""
+        return self._get_attribute("ProfileDefinition")
+
+    @ProfileDefinition.setter
+    def ProfileDefinition(self, value: "IfcProfileDef"):
+        return self._set_attribute("ProfileDefinition", value)
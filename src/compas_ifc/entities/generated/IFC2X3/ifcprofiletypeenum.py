@@ -0,0 +1,2 @@
+class IfcProfileTypeEnum(str):
+    items = ['CURVE', 'AREA']
@@ -0,0 +1,46 @@
+from .ifcobject import IfcObject
+from compas_ifc.entities.extensions import IfcProject as IfcProject_Ext   # type: ignore
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrepresentationcontext import IfcRepresentationContext
+    from .ifcunitassignment import IfcUnitAssignment
+
+class IfcProject(IfcProject_Ext, IfcObject):
+    """Wrapper class for IfcProject."""
+
+    @property
+    def LongName(self)-> str:
+        """<attribute LongName?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("LongName")
+
+    @LongName.setter
+    def LongName(self, value: str):
+        return self._set_attribute("LongName", value)
+
+    @property
+    def Phase(self)-> str:
+        """<attribute Phase?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Phase")
+
+    @Phase.setter
+    def Phase(self, value: str):
+        return self._set_attribute("Phase", value)
+
+    @property
+    def RepresentationContexts(self)-> list["IfcRepresentationContext"]:
+        """<attribute RepresentationContexts: <set [1:?] of <entity IfcRepresentationContext>>>"""
+        return self._get_attribute("RepresentationContexts")
+
+    @RepresentationContexts.setter
+    def RepresentationContexts(self, value: list["IfcRepresentationContext"]):
+        return self._set_attribute("RepresentationContexts", value)
+
+    @property
+    def UnitsInContext(self)-> "IfcUnitAssignment":
+        """<attribute UnitsInContext: <entity IfcUnitAssignment>>"""
+        return self._get_attribute("UnitsInContext")
+
+    @UnitsInContext.setter
+    def UnitsInContext(self, value: "IfcUnitAssignment"):
+        return self._set_attribute("UnitsInContext", value)
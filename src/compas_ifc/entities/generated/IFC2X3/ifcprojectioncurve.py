@@ -0,0 +1,5 @@
+from .ifcannotationcurveoccurrence import IfcAnnotationCurveOccurrence
+
+
+class IfcProjectionCurve(IfcAnnotationCurveOccurrence):
+    """Wrapper class for IfcProjectionCurve."""
@@ -0,0 +1,5 @@
+from .ifcfeatureelementaddition import IfcFeatureElementAddition
+
+
+class IfcProjectionElement(IfcFeatureElementAddition):
+    """Wrapper class for IfcProjectionElement."""
@@ -0,0 +1,35 @@
+from .ifccontrol import IfcControl
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcprojectordertypeenum import IfcProjectOrderTypeEnum
+
+class IfcProjectOrder(IfcControl):
+    """Wrapper class for IfcProjectOrder."""
+
+    @property
+    def ID(self)-> str:
+        """<attribute ID: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("ID")
+
+    @ID.setter
+    def ID(self, value: str):
+        return self._set_attribute("ID", value)
+
+    @property
+    def PredefinedType(self)-> "IfcProjectOrderTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcProjectOrderTypeEnum: (CHANGEORDER, MAINTENANCEWORKORDER, MOVEORDER, PURCHASEORDER, WORKORDER, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcProjectOrderTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def Status(self)-> str:
+        """<attribute Status?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Status")
+
+    @Status.setter
+    def Status(self, value: str):
+        return self._set_attribute("Status", value)
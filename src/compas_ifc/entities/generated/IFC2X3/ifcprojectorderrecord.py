@@ -0,0 +1,27 @@
+from .ifccontrol import IfcControl
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcprojectorderrecordtypeenum import IfcProjectOrderRecordTypeEnum
+    from .ifcrelassignstoprojectorder import IfcRelAssignsToProjectOrder
+
+class IfcProjectOrderRecord(IfcControl):
+    """Wrapper class for IfcProjectOrderRecord."""
+
+    @property
+    def Records(self)-> list["IfcRelAssignsToProjectOrder"]:
+        """<attribute Records: <list [1:?] of <entity IfcRelAssignsToProjectOrder>>>"""
+        return self._get_attribute("Records")
+
+    @Records.setter
+    def Records(self, value: list["IfcRelAssignsToProjectOrder"]):
+        return self._set_attribute("Records", value)
+
+    @property
+    def PredefinedType(self)-> "IfcProjectOrderRecordTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcProjectOrderRecordTypeEnum: (CHANGE, MAINTENANCE, MOVE, PURCHASE, WORK, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcProjectOrderRecordTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcProjectOrderRecordTypeEnum(str):
+    items = ['CHANGE', 'MAINTENANCE', 'MOVE', 'PURCHASE', 'WORK', 'USERDEFINED', 'NOTDEFINED']
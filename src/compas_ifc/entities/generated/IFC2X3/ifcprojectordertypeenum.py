@@ -0,0 +1,2 @@
+class IfcProjectOrderTypeEnum(str):
+    items = ['CHANGEORDER', 'MAINTENANCEWORKORDER', 'MOVEORDER', 'PURCHASEORDER', 'WORKORDER', 'USERDEFINED', 'NOTDEFINED']
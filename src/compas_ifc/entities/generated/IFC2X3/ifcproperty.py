@@ -0,0 +1,39 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccomplexproperty import IfcComplexProperty
+    from .ifcpropertydependencyrelationship import IfcPropertyDependencyRelationship
+
+class IfcProperty(Base):
+    """Wrapper class for IfcProperty."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    def PropertyForDependance(self)-> list["IfcPropertyDependencyRelationship"]:
+        """<inverse PropertyForDependance: set [0:?] of <entity IfcPropertyDependencyRelationship> for <attribute DependingProperty: <entity IfcProperty>>>"""
+        return self._get_inverse_attribute("PropertyForDependance")
+
+    def PropertyDependsOn(self)-> list["IfcPropertyDependencyRelationship"]:
+        """<inverse PropertyDependsOn: set [0:?] of <entity IfcPropertyDependencyRelationship> for <attribute DependantProperty: <entity IfcProperty>>>"""
+        return self._get_inverse_attribute("PropertyDependsOn")
+
+    def PartOfComplex(self)-> list["IfcComplexProperty"]:
+        """<inverse PartOfComplex: set [0:1] of <entity IfcComplexProperty> for <attribute HasProperties: <set [1:?] of <entity IfcProperty>>>>"""
+        return self._get_inverse_attribute("PartOfComplex")
@@ -0,0 +1,45 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcconstraint import IfcConstraint
+    from .ifcproperty import IfcProperty
+
+class IfcPropertyConstraintRelationship(Base):
+    """Wrapper class for IfcPropertyConstraintRelationship."""
+
+    @property
+    def RelatingConstraint(self)-> "IfcConstraint":
+        """<attribute RelatingConstraint: <entity IfcConstraint>>"""
+        return self._get_attribute("RelatingConstraint")
+
+    @RelatingConstraint.setter
+    def RelatingConstraint(self, value: "IfcConstraint"):
+        return self._set_attribute("RelatingConstraint", value)
+
+    @property
+    def RelatedProperties(self)-> list["IfcProperty"]:
+        """<attribute RelatedProperties: <set [1:?] of <entity IfcProperty>>>"""
+        return self._get_attribute("RelatedProperties")
+
+    @RelatedProperties.setter
+    def RelatedProperties(self, value: list["IfcProperty"]):
+        return self._set_attribute("RelatedProperties", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
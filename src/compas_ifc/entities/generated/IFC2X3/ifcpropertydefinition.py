@@ -0,0 +1,12 @@
+from .ifcroot import IfcRoot
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelassociates import IfcRelAssociates
+
+class IfcPropertyDefinition(IfcRoot):
+    """Wrapper class for IfcPropertyDefinition."""
+
+    def HasAssociations(self)-> list["IfcRelAssociates"]:
+        """<inverse HasAssociations: set [0:?] of <entity IfcRelAssociates> for <attribute RelatedObjects: <set [1:?] of <entity IfcRoot>>>>"""
+        return self._get_inverse_attribute("HasAssociations")
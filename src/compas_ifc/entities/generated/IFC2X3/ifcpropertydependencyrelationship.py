@@ -0,0 +1,53 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcproperty import IfcProperty
+
+class IfcPropertyDependencyRelationship(Base):
+    """Wrapper class for IfcPropertyDependencyRelationship."""
+
+    @property
+    def DependingProperty(self)-> "IfcProperty":
+        """<attribute DependingProperty: <entity IfcProperty>>"""
+        return self._get_attribute("DependingProperty")
+
+    @DependingProperty.setter
+    def DependingProperty(self, value: "IfcProperty"):
+        return self._set_attribute("DependingProperty", value)
+
+    @property
+    def DependantProperty(self)-> "IfcProperty":
+        """<attribute DependantProperty: <entity IfcProperty>>"""
+        return self._get_attribute("DependantProperty")
+
+    @DependantProperty.setter
+    def DependantProperty(self, value: "IfcProperty"):
+        return self._set_attribute("DependantProperty", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def Expression(self)-> str:
+        """<attribute Expression?: <type IfcText: <string>>>"""
+        return self._get_attribute("Expression")
+
+    @Expression.setter
+    def Expression(self, value: str):
+        return self._set_attribute("Expression", value)
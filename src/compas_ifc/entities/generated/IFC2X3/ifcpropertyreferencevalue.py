@@ -0,0 +1,39 @@
+from .ifcsimpleproperty import IfcSimpleProperty
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaddress import IfcAddress
+    from .ifcappliedvalue import IfcAppliedValue
+    from .ifccalendardate import IfcCalendarDate
+    from .ifcdateandtime import IfcDateAndTime
+    from .ifcexternalreference import IfcExternalReference
+    from .ifclocaltime import IfcLocalTime
+    from .ifcmaterial import IfcMaterial
+    from .ifcmateriallayer import IfcMaterialLayer
+    from .ifcmateriallist import IfcMaterialList
+    from .ifcorganization import IfcOrganization
+    from .ifcperson import IfcPerson
+    from .ifcpersonandorganization import IfcPersonAndOrganization
+    from .ifctimeseries import IfcTimeSeries
+
+class IfcPropertyReferenceValue(IfcSimpleProperty):
+    """Wrapper class for IfcPropertyReferenceValue."""
+
+    @property
+    def UsageName(self)-> str:
+        """<attribute UsageName?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UsageName")
+
+    @UsageName.setter
+    def UsageName(self, value: str):
+        return self._set_attribute("UsageName", value)
+
+    @property
+    def PropertyReference(self)-> Union["IfcAddress", "IfcDateAndTime", "IfcCalendarDate", "IfcLocalTime", "IfcMaterial", "IfcTimeSeries", "IfcMaterialList", "IfcExternalReference", "IfcMaterialLayer", "IfcAppliedValue", "IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]:
+        """<attribute PropertyReference: <select IfcObjectReferenceSelect: (<entity IfcAddress> | <entity IfcAppliedValue> | <entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcExternalReference> | <entity IfcLocalTime> | <entity IfcMaterial> | <entity IfcMaterialLayer> | <entity IfcMaterialList> | <entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization> | <entity IfcTimeSeries>)>>"""
+        return self._get_attribute("PropertyReference")
+
+    @PropertyReference.setter
+    def PropertyReference(self, value: Union["IfcAddress", "IfcDateAndTime", "IfcCalendarDate", "IfcLocalTime", "IfcMaterial", "IfcTimeSeries", "IfcMaterialList", "IfcExternalReference", "IfcMaterialLayer", "IfcAppliedValue", "IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]):
+        return self._set_attribute("PropertyReference", value)
@@ -0,0 +1,17 @@
+from .ifcpropertysetdefinition import IfcPropertySetDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcproperty import IfcProperty
+
+class IfcPropertySet(IfcPropertySetDefinition):
+    """Wrapper class for IfcPropertySet."""
+
+    @property
+    def HasProperties(self)-> list["IfcProperty"]:
+        """<attribute HasProperties: <set [1:?] of <entity IfcProperty>>>"""
+        return self._get_attribute("HasProperties")
+
+    @HasProperties.setter
+    def HasProperties(self, value: list["IfcProperty"]):
+        return self._set_attribute("HasProperties", value)
@@ -0,0 +1,17 @@
+from .ifcpropertydefinition import IfcPropertyDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcreldefinesbyproperties import IfcRelDefinesByProperties
+    from .ifctypeobject import IfcTypeObject
+
+class IfcPropertySetDefinition(IfcPropertyDefinition):
+    """Wrapper class for IfcPropertySetDefinition."""
+
+    def PropertyDefinitionOf(self)-> list["IfcRelDefinesByProperties"]:
+        """<inverse PropertyDefinitionOf: set [0:1] of <entity IfcRelDefinesByProperties> for <attribute RelatingPropertyDefinition: <entity IfcPropertySetDefinition>>>"""
+        return self._get_inverse_attribute("PropertyDefinitionOf")
+
+    def DefinesType(self)-> list["IfcTypeObject"]:
+        """<inverse DefinesType: set [0:1] of <entity IfcTypeObject> for <attribute HasPropertySets?: <set [1:?] of <entity IfcPropertySetDefinition>>>>"""
+        return self._get_inverse_attribute("DefinesType")
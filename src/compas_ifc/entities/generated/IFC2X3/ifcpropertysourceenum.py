@@ -0,0 +1,2 @@
+class IfcPropertySourceEnum(str):
+    items = ['DESIGN', 'DESIGNMAXIMUM', 'DESIGNMINIMUM', 'SIMULATED', 'ASBUILT', 'COMMISSIONING', 'MEASURED', 'USERDEFINED', 'NOTKNOWN']
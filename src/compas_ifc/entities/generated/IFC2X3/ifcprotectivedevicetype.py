@@ -0,0 +1,17 @@
+from .ifcflowcontrollertype import IfcFlowControllerType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcprotectivedevicetypeenum import IfcProtectiveDeviceTypeEnum
+
+class IfcProtectiveDeviceType(IfcFlowControllerType):
+    """Wrapper class for IfcProtectiveDeviceType."""
+
+    @property
+    def PredefinedType(self)-> "IfcProtectiveDeviceTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcProtectiveDeviceTypeEnum: (FUSEDISCONNECTOR, CIRCUITBREAKER, EARTHFAILUREDEVICE, RESIDUALCURRENTCIRCUITBREAKER, RESIDUALCURRENTSWITCH, VARISTOR, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcProtectiveDeviceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcProtectiveDeviceTypeEnum(str):
+    items = ['FUSEDISCONNECTOR', 'CIRCUITBREAKER', 'EARTHFAILUREDEVICE', 'RESIDUALCURRENTCIRCUITBREAKER', 'RESIDUALCURRENTSWITCH', 'VARISTOR', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,26 @@
+from .ifcproduct import IfcProduct
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcobjecttypeenum import IfcObjectTypeEnum
+
+class IfcProxy(IfcProduct):
+    """Wrapper class for IfcProxy."""
+
+    @property
+    def ProxyType(self)-> "IfcObjectTypeEnum":
+        """<attribute ProxyType: <enumeration IfcObjectTypeEnum: (PRODUCT, PROCESS, CONTROL, RESOURCE, ACTOR, GROUP, PROJECT, NOTDEFINED)>>"""
+        return self._get_attribute("ProxyType")
+
+    @ProxyType.setter
+    def ProxyType(self, value: "IfcObjectTypeEnum"):
+        return self._set_attribute("ProxyType", value)
+
+    @property
+    def Tag(self)-> str:
+        """<attribute Tag?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Tag")
+
+    @Tag.setter
+    def Tag(self, value: str):
+        return self._set_attribute("Tag", value)
@@ -0,0 +1,2 @@
+class IfcPumpTypeEnum(str):
+    items = ['CIRCULATOR', 'ENDSUCTION', 'SPLITCASE', 'VERTICALINLINE', 'VERTICALTURBINE', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,14 @@
+from .ifcphysicalsimplequantity import IfcPhysicalSimpleQuantity
+
+
+class IfcQuantityCount(IfcPhysicalSimpleQuantity):
+    """Wrapper class for IfcQuantityCount."""
+
+    @property
+    def CountValue(self)-> float:
+        """<attribute CountValue: <type IfcCountMeasure: <number>>>"""
+        return self._get_attribute("CountValue")
+
+    @CountValue.setter
+    def CountValue(self, value: float):
+        return self._set_attribute("CountValue", value)
@@ -0,0 +1,14 @@
+from .ifcphysicalsimplequantity import IfcPhysicalSimpleQuantity
+
+
+class IfcQuantityLength(IfcPhysicalSimpleQuantity):
+    """Wrapper class for IfcQuantityLength."""
+
+    @property
+    def LengthValue(self)-> float:
+        """<attribute LengthValue: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("LengthValue")
+
+    @LengthValue.setter
+    def LengthValue(self, value: float):
+        return self._set_attribute("LengthValue", value)
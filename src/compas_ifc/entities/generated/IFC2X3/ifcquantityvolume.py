@@ -0,0 +1,14 @@
+from .ifcphysicalsimplequantity import IfcPhysicalSimpleQuantity
+
+
+class IfcQuantityVolume(IfcPhysicalSimpleQuantity):
+    """Wrapper class for IfcQuantityVolume."""
+
+    @property
+    def VolumeValue(self)-> float:
+        """<attribute VolumeValue: <type IfcVolumeMeasure: <real>>>"""
+        return self._get_attribute("VolumeValue")
+
+    @VolumeValue.setter
+    def VolumeValue(self, value: float):
+        return self._set_attribute("VolumeValue", value)
@@ -0,0 +1,14 @@
+from .ifcphysicalsimplequantity import IfcPhysicalSimpleQuantity
+
+
+class IfcQuantityWeight(IfcPhysicalSimpleQuantity):
+    """Wrapper class for IfcQuantityWeight."""
+
+    @property
+    def WeightValue(self)-> float:
+        """<attribute WeightValue: <type IfcMassMeasure: <real>>>"""
+        return self._get_attribute("WeightValue")
+
+    @WeightValue.setter
+    def WeightValue(self, value: float):
+        return self._set_attribute("WeightValue", value)
@@ -0,0 +1,5 @@
+from .ifcdimensioncurvedirectedcallout import IfcDimensionCurveDirectedCallout
+
+
+class IfcRadiusDimension(IfcDimensionCurveDirectedCallout):
+    """Wrapper class for IfcRadiusDimension."""
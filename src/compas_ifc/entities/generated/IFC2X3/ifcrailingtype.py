@@ -0,0 +1,17 @@
+from .ifcbuildingelementtype import IfcBuildingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrailingtypeenum import IfcRailingTypeEnum
+
+class IfcRailingType(IfcBuildingElementType):
+    """Wrapper class for IfcRailingType."""
+
+    @property
+    def PredefinedType(self)-> "IfcRailingTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcRailingTypeEnum: (HANDRAIL, GUARDRAIL, BALUSTRADE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcRailingTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,5 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+
+class IfcRampFlight(IfcBuildingElement):
+    """Wrapper class for IfcRampFlight."""
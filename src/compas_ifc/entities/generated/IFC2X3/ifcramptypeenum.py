@@ -0,0 +1,2 @@
+class IfcRampTypeEnum(str):
+    items = ['STRAIGHT_RUN_RAMP', 'TWO_STRAIGHT_RUN_RAMP', 'QUARTER_TURN_RAMP', 'TWO_QUARTER_TURN_RAMP', 'HALF_TURN_RAMP', 'SPIRAL_RAMP', 'USERDEFINED', 'NOTDEFINED']
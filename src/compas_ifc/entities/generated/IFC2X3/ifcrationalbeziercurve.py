@@ -0,0 +1,14 @@
+from .ifcbeziercurve import IfcBezierCurve
+
+
+class IfcRationalBezierCurve(IfcBezierCurve):
+    """Wrapper class for IfcRationalBezierCurve."""
+
+    @property
+    def WeightsData(self)-> list[float]:
+        """<attribute WeightsData: <list [2:?] of <real>>>"""
+        return self._get_attribute("WeightsData")
+
+    @WeightsData.setter
+    def WeightsData(self, value: list[float]):
+        return self._set_attribute("WeightsData", value)
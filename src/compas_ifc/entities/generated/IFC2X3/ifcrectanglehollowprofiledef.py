@@ -0,0 +1,32 @@
+from .ifcrectangleprofiledef import IfcRectangleProfileDef
+
+
+class IfcRectangleHollowProfileDef(IfcRectangleProfileDef):
+    """Wrapper class for IfcRectangleHollowProfileDef."""
+
+    @property
+    def WallThickness(self)-> float:
+        """<attribute WallThickness: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("WallThickness")
+
+    @WallThickness.setter
+    def WallThickness(self, value: float):
+        return self._set_attribute("WallThickness", value)
+
+    @property
+    def InnerFilletRadius(self)-> float:
+        """<attribute InnerFilletRadius?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("InnerFilletRadius")
+
+    @InnerFilletRadius.setter
+    def InnerFilletRadius(self, value: float):
+        return self._set_attribute("InnerFilletRadius", value)
+
+    @property
+    def OuterFilletRadius(self)-> float:
+        """<attribute OuterFilletRadius?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("OuterFilletRadius")
+
+    @OuterFilletRadius.setter
+    def OuterFilletRadius(self, value: float):
+        return self._set_attribute("OuterFilletRadius", value)
@@ -0,0 +1,32 @@
+from .ifccsgprimitive3d import IfcCsgPrimitive3D
+
+
+class IfcRectangularPyramid(IfcCsgPrimitive3D):
+    """Wrapper class for IfcRectangularPyramid."""
+
+    @property
+    def XLength(self)-> float:
+        """<attribute XLength: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("XLength")
+
+    @XLength.setter
+    def XLength(self, value: float):
+        return self._set_attribute("XLength", value)
+
+    @property
+    def YLength(self)-> float:
+        """<attribute YLength: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("YLength")
+
+    @YLength.setter
+    def YLength(self, value: float):
+        return self._set_attribute("YLength", value)
+
+    @property
+    def Height(self)-> float:
+        """<attribute Height: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Height")
+
+    @Height.setter
+    def Height(self, value: float):
+        return self._set_attribute("Height", value)
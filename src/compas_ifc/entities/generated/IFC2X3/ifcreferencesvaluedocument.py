@@ -0,0 +1,47 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcappliedvalue import IfcAppliedValue
+    from .ifcdocumentinformation import IfcDocumentInformation
+    from .ifcdocumentreference import IfcDocumentReference
+
+class IfcReferencesValueDocument(Base):
+    """Wrapper class for IfcReferencesValueDocument."""
+
+    @property
+    def ReferencedDocument(self)-> Union["IfcDocumentInformation", "IfcDocumentReference"]:
+        """<attribute ReferencedDocument: <select IfcDocumentSelect: (<entity IfcDocumentInformation> | <entity IfcDocumentReference>)>>"""
+        return self._get_attribute("ReferencedDocument")
+
+    @ReferencedDocument.setter
+    def ReferencedDocument(self, value: Union["IfcDocumentInformation", "IfcDocumentReference"]):
+        return self._set_attribute("ReferencedDocument", value)
+
+    @property
+    def ReferencingValues(self)-> list["IfcAppliedValue"]:
+        """<attribute ReferencingValues: <set [1:?] of <entity IfcAppliedValue>>>"""
+        return self._get_attribute("ReferencingValues")
+
+    @ReferencingValues.setter
+    def ReferencingValues(self, value: list["IfcAppliedValue"]):
+        return self._set_attribute("ReferencingValues", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
@@ -0,0 +1,77 @@
+from .ifcreinforcingelement import IfcReinforcingElement
+
+
+class IfcReinforcingMesh(IfcReinforcingElement):
+    """Wrapper class for IfcReinforcingMesh."""
+
+    @property
+    def MeshLength(self)-> float:
+        """<attribute MeshLength?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("MeshLength")
+
+    @MeshLength.setter
+    def MeshLength(self, value: float):
+        return self._set_attribute("MeshLength", value)
+
+    @property
+    def MeshWidth(self)-> float:
+        """<attribute MeshWidth?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("MeshWidth")
+
+    @MeshWidth.setter
+    def MeshWidth(self, value: float):
+        return self._set_attribute("MeshWidth", value)
+
+    @property
+    def LongitudinalBarNominalDiameter(self)-> float:
+        """<attribute LongitudinalBarNominalDiameter: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("LongitudinalBarNominalDiameter")
+
+    @LongitudinalBarNominalDiameter.setter
+    def LongitudinalBarNominalDiameter(self, value: float):
+        return self._set_attribute("LongitudinalBarNominalDiameter", value)
+
+    @property
+    def TransverseBarNominalDiameter(self)-> float:
+        """<attribute TransverseBarNominalDiameter: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("TransverseBarNominalDiameter")
+
+    @TransverseBarNominalDiameter.setter
+    def TransverseBarNominalDiameter(self, value: float):
+        return self._set_attribute("TransverseBarNominalDiameter", value)
+
+    @property
+    def LongitudinalBarCrossSectionArea(self)-> float:
+        """<attribute LongitudinalBarCrossSectionArea: <type IfcAreaMeasure: <real>>>"""
+        return self._get_attribute("LongitudinalBarCrossSectionArea")
+
+    @LongitudinalBarCrossSectionArea.setter
+    def LongitudinalBarCrossSectionArea(self, value: float):
+        return self._set_attribute("LongitudinalBarCrossSectionArea", value)
+
+    @property
+    def TransverseBarCrossSectionArea(self)-> float:
+        """<attribute TransverseBarCrossSectionArea: <type IfcAreaMeasure: <real>>>"""
+        return self._get_attribute("TransverseBarCrossSectionArea")
+
+    @TransverseBarCrossSectionArea.setter
+    def TransverseBarCrossSectionArea(self, value: float):
+        return self._set_attribute("TransverseBarCrossSectionArea", value)
+
+    @property
+    def LongitudinalBarSpacing(self)-> float:
+        """<attribute LongitudinalBarSpacing: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("LongitudinalBarSpacing")
+
+    @LongitudinalBarSpacing.setter
+    def LongitudinalBarSpacing(self, value: float):
+        return self._set_attribute("LongitudinalBarSpacing", value)
+
+    @property
+    def TransverseBarSpacing(self)-> float:
+        """<attribute TransverseBarSpacing: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("TransverseBarSpacing")
+
+    @TransverseBarSpacing.setter
+    def TransverseBarSpacing(self, value: float):
+        return self._set_attribute("TransverseBarSpacing", value)
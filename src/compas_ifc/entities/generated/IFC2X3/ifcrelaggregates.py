@@ -0,0 +1,5 @@
+from .ifcreldecomposes import IfcRelDecomposes
+
+
+class IfcRelAggregates(IfcRelDecomposes):
+    """Wrapper class for IfcRelAggregates."""
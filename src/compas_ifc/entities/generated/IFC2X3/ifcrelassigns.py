@@ -0,0 +1,27 @@
+from .ifcrelationship import IfcRelationship
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcobjectdefinition import IfcObjectDefinition
+    from .ifcobjecttypeenum import IfcObjectTypeEnum
+
+class IfcRelAssigns(IfcRelationship):
+    """Wrapper class for IfcRelAssigns."""
+
+    @property
+    def RelatedObjects(self)-> list["IfcObjectDefinition"]:
+        """<attribute RelatedObjects: <set [1:?] of <entity IfcObjectDefinition>>>"""
+        return self._get_attribute("RelatedObjects")
+
+    @RelatedObjects.setter
+    def RelatedObjects(self, value: list["IfcObjectDefinition"]):
+        return self._set_attribute("RelatedObjects", value)
+
+    @property
+    def RelatedObjectsType(self)-> "IfcObjectTypeEnum":
+        """<attribute RelatedObjectsType?: <enumeration IfcObjectTypeEnum: (PRODUCT, PROCESS, CONTROL, RESOURCE, ACTOR, GROUP, PROJECT, NOTDEFINED)>>"""
+        return self._get_attribute("RelatedObjectsType")
+
+    @RelatedObjectsType.setter
+    def RelatedObjectsType(self, value: "IfcObjectTypeEnum"):
+        return self._set_attribute("RelatedObjectsType", value)
@@ -0,0 +1,17 @@
+from .ifcrelassignstocontrol import IfcRelAssignsToControl
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcscheduletimecontrol import IfcScheduleTimeControl
+
+class IfcRelAssignsTasks(IfcRelAssignsToControl):
+    """Wrapper class for IfcRelAssignsTasks."""
+
+    @property
+    def TimeForTask(self)-> "IfcScheduleTimeControl":
+        """<attribute TimeForTask?: <entity IfcScheduleTimeControl>>"""
+        return self._get_attribute("TimeForTask")
+
+    @TimeForTask.setter
+    def TimeForTask(self, value: "IfcScheduleTimeControl"):
+        return self._set_attribute("TimeForTask", value)
@@ -0,0 +1,27 @@
+from .ifcrelassigns import IfcRelAssigns
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcactor import IfcActor
+    from .ifcactorrole import IfcActorRole
+
+class IfcRelAssignsToActor(IfcRelAssigns):
+    """Wrapper class for IfcRelAssignsToActor."""
+
+    @property
+    def RelatingActor(self)-> "IfcActor":
+        """<attribute RelatingActor: <entity IfcActor>>"""
+        return self._get_attribute("RelatingActor")
+
+    @RelatingActor.setter
+    def RelatingActor(self, value: "IfcActor"):
+        return self._set_attribute("RelatingActor", value)
+
+    @property
+    def ActingRole(self)-> "IfcActorRole":
+        """<attribute ActingRole?: <entity IfcActorRole>>"""
+        return self._get_attribute("ActingRole")
+
+    @ActingRole.setter
+    def ActingRole(self, value: "IfcActorRole"):
+        return self._set_attribute("ActingRole", value)
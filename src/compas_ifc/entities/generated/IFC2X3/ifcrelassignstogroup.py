@@ -0,0 +1,17 @@
+from .ifcrelassigns import IfcRelAssigns
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcgroup import IfcGroup
+
+class IfcRelAssignsToGroup(IfcRelAssigns):
+    """Wrapper class for IfcRelAssignsToGroup."""
+
+    @property
+    def RelatingGroup(self)-> "IfcGroup":
+        """<attribute RelatingGroup: <entity IfcGroup>>"""
+        return self._get_attribute("RelatingGroup")
+
+    @RelatingGroup.setter
+    def RelatingGroup(self, value: "IfcGroup"):
+        return self._set_attribute("RelatingGroup", value)
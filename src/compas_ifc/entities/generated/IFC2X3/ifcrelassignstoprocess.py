@@ -0,0 +1,27 @@
+from .ifcrelassigns import IfcRelAssigns
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmeasurewithunit import IfcMeasureWithUnit
+    from .ifcprocess import IfcProcess
+
+class IfcRelAssignsToProcess(IfcRelAssigns):
+    """Wrapper class for IfcRelAssignsToProcess."""
+
+    @property
+    def RelatingProcess(self)-> "IfcProcess":
+        """<attribute RelatingProcess: <entity IfcProcess>>"""
+        return self._get_attribute("RelatingProcess")
+
+    @RelatingProcess.setter
+    def RelatingProcess(self, value: "IfcProcess"):
+        return self._set_attribute("RelatingProcess", value)
+
+    @property
+    def QuantityInProcess(self)-> "IfcMeasureWithUnit":
+        """<attribute QuantityInProcess?: <entity IfcMeasureWithUnit>>"""
+        return self._get_attribute("QuantityInProcess")
+
+    @QuantityInProcess.setter
+    def QuantityInProcess(self, value: "IfcMeasureWithUnit"):
+        return self._set_attribute("QuantityInProcess", value)
@@ -0,0 +1,17 @@
+from .ifcrelassigns import IfcRelAssigns
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcproduct import IfcProduct
+
+class IfcRelAssignsToProduct(IfcRelAssigns):
+    """Wrapper class for IfcRelAssignsToProduct."""
+
+    @property
+    def RelatingProduct(self)-> "IfcProduct":
+        """<attribute RelatingProduct: <entity IfcProduct>>"""
+        return self._get_attribute("RelatingProduct")
+
+    @RelatingProduct.setter
+    def RelatingProduct(self, value: "IfcProduct"):
+        return self._set_attribute("RelatingProduct", value)
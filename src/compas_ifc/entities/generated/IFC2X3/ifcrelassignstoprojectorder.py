@@ -0,0 +1,5 @@
+from .ifcrelassignstocontrol import IfcRelAssignsToControl
+
+
+class IfcRelAssignsToProjectOrder(IfcRelAssignsToControl):
+    """Wrapper class for IfcRelAssignsToProjectOrder."""
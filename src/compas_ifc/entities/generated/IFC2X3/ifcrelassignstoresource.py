@@ -0,0 +1,17 @@
+from .ifcrelassigns import IfcRelAssigns
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcresource import IfcResource
+
+class IfcRelAssignsToResource(IfcRelAssigns):
+    """Wrapper class for IfcRelAssignsToResource."""
+
+    @property
+    def RelatingResource(self)-> "IfcResource":
+        """<attribute RelatingResource: <entity IfcResource>>"""
+        return self._get_attribute("RelatingResource")
+
+    @RelatingResource.setter
+    def RelatingResource(self, value: "IfcResource"):
+        return self._set_attribute("RelatingResource", value)
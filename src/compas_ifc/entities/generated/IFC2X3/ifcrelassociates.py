@@ -0,0 +1,17 @@
+from .ifcrelationship import IfcRelationship
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcroot import IfcRoot
+
+class IfcRelAssociates(IfcRelationship):
+    """Wrapper class for IfcRelAssociates."""
+
+    @property
+    def RelatedObjects(self)-> list["IfcRoot"]:
+        """<attribute RelatedObjects: <set [1:?] of <entity IfcRoot>>>"""
+        return self._get_attribute("RelatedObjects")
+
+    @RelatedObjects.setter
+    def RelatedObjects(self, value: list["IfcRoot"]):
+        return self._set_attribute("RelatedObjects", value)
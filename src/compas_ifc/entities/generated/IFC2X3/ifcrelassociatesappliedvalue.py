@@ -0,0 +1,17 @@
+from .ifcrelassociates import IfcRelAssociates
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcappliedvalue import IfcAppliedValue
+
+class IfcRelAssociatesAppliedValue(IfcRelAssociates):
+    """Wrapper class for IfcRelAssociatesAppliedValue."""
+
+    @property
+    def RelatingAppliedValue(self)-> "IfcAppliedValue":
+        """<attribute RelatingAppliedValue: <entity IfcAppliedValue>>"""
+        return self._get_attribute("RelatingAppliedValue")
+
+    @RelatingAppliedValue.setter
+    def RelatingAppliedValue(self, value: "IfcAppliedValue"):
+        return self._set_attribute("RelatingAppliedValue", value)
@@ -0,0 +1,17 @@
+from .ifcrelassociates import IfcRelAssociates
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcapproval import IfcApproval
+
+class IfcRelAssociatesApproval(IfcRelAssociates):
+    """Wrapper class for IfcRelAssociatesApproval."""
+
+    @property
+    def RelatingApproval(self)-> "IfcApproval":
+        """<attribute RelatingApproval: <entity IfcApproval>>"""
+        return self._get_attribute("RelatingApproval")
+
+    @RelatingApproval.setter
+    def RelatingApproval(self, value: "IfcApproval"):
+        return self._set_attribute("RelatingApproval", value)
@@ -0,0 +1,26 @@
+from .ifcrelassociates import IfcRelAssociates
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcconstraint import IfcConstraint
+
+class IfcRelAssociatesConstraint(IfcRelAssociates):
+    """Wrapper class for IfcRelAssociatesConstraint."""
+
+    @property
+    def Intent(self)-> str:
+        """<attribute Intent: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Intent")
+
+    @Intent.setter
+    def Intent(self, value: str):
+        return self._set_attribute("Intent", value)
+
+    @property
+    def RelatingConstraint(self)-> "IfcConstraint":
+        """<attribute RelatingConstraint: <entity IfcConstraint>>"""
+        return self._get_attribute("RelatingConstraint")
+
+    @RelatingConstraint.setter
+    def RelatingConstraint(self, value: "IfcConstraint"):
+        return self._set_attribute("RelatingConstraint", value)
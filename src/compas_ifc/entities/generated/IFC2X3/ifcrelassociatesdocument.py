@@ -0,0 +1,19 @@
+from .ifcrelassociates import IfcRelAssociates
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdocumentinformation import IfcDocumentInformation
+    from .ifcdocumentreference import IfcDocumentReference
+
+class IfcRelAssociatesDocument(IfcRelAssociates):
+    """Wrapper class for IfcRelAssociatesDocument."""
+
+    @property
+    def RelatingDocument(self)-> Union["IfcDocumentInformation", "IfcDocumentReference"]:
+        """<attribute RelatingDocument: <select IfcDocumentSelect: (<entity IfcDocumentInformation> | <entity IfcDocumentReference>)>>"""
+        return self._get_attribute("RelatingDocument")
+
+    @RelatingDocument.setter
+    def RelatingDocument(self, value: Union["IfcDocumentInformation", "IfcDocumentReference"]):
+        return self._set_attribute("RelatingDocument", value)
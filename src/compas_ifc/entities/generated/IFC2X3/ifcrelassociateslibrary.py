@@ -0,0 +1,19 @@
+from .ifcrelassociates import IfcRelAssociates
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifclibraryinformation import IfcLibraryInformation
+    from .ifclibraryreference import IfcLibraryReference
+
+class IfcRelAssociatesLibrary(IfcRelAssociates):
+    """Wrapper class for IfcRelAssociatesLibrary."""
+
+    @property
+    def RelatingLibrary(self)-> Union["IfcLibraryInformation", "IfcLibraryReference"]:
+        """<attribute RelatingLibrary: <select IfcLibrarySelect: (<entity IfcLibraryInformation> | <entity IfcLibraryReference>)>>"""
+        return self._get_attribute("RelatingLibrary")
+
+    @RelatingLibrary.setter
+    def RelatingLibrary(self, value: Union["IfcLibraryInformation", "IfcLibraryReference"]):
+        return self._set_attribute("RelatingLibrary", value)
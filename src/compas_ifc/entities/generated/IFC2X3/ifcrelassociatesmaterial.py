@@ -0,0 +1,22 @@
+from .ifcrelassociates import IfcRelAssociates
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmaterial import IfcMaterial
+    from .ifcmateriallayer import IfcMaterialLayer
+    from .ifcmateriallayerset import IfcMaterialLayerSet
+    from .ifcmateriallayersetusage import IfcMaterialLayerSetUsage
+    from .ifcmateriallist import IfcMaterialList
+
+class IfcRelAssociatesMaterial(IfcRelAssociates):
+    """Wrapper class for IfcRelAssociatesMaterial."""
+
+    @property
+    def RelatingMaterial(self)-> Union["IfcMaterial", "IfcMaterialList", "IfcMaterialLayer", "IfcMaterialLayerSet", "IfcMaterialLayerSetUsage"]:
+        """<attribute RelatingMaterial: <select IfcMaterialSelect: (<entity IfcMaterial> | <entity IfcMaterialLayer> | <entity IfcMaterialLayerSet> | <entity IfcMaterialLayerSetUsage> | <entity IfcMaterialList>)>>"""
+        return self._get_attribute("RelatingMaterial")
+
+    @RelatingMaterial.setter
+    def RelatingMaterial(self, value: Union["IfcMaterial", "IfcMaterialList", "IfcMaterialLayer", "IfcMaterialLayerSet", "IfcMaterialLayerSetUsage"]):
+        return self._set_attribute("RelatingMaterial", value)
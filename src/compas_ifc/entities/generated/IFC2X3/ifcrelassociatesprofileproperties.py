@@ -0,0 +1,38 @@
+from .ifcrelassociates import IfcRelAssociates
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdirection import IfcDirection
+    from .ifcprofileproperties import IfcProfileProperties
+    from .ifcshapeaspect import IfcShapeAspect
+
+class IfcRelAssociatesProfileProperties(IfcRelAssociates):
+    """Wrapper class for IfcRelAssociatesProfileProperties."""
+
+    @property
+    def RelatingProfileProperties(self)-> "IfcProfileProperties":
+        """<attribute RelatingProfileProperties: <entity IfcProfileProperties>>"""
+        return self._get_attribute("RelatingProfileProperties")
+
+    @RelatingProfileProperties.setter
+    def RelatingProfileProperties(self, value: "IfcProfileProperties"):
+        return self._set_attribute("RelatingProfileProperties", value)
+
+    @property
+    def ProfileSectionLocation(self)-> "IfcShapeAspect":
+        """<attribute ProfileSectionLocation?: <entity IfcShapeAspect>>"""
+        return self._get_attribute("ProfileSectionLocation")
+
+    @ProfileSectionLocation.setter
+    def ProfileSectionLocation(self, value: "IfcShapeAspect"):
+        return self._set_attribute("ProfileSectionLocation", value)
+
+    @property
+    def ProfileOrientation(self)-> Union[float, "IfcDirection"]:
+        """<attribute ProfileOrientation?: <select IfcOrientationSelect: (<entity IfcDirection> | <type IfcPlaneAngleMeasure: <real>>)>>"""
+        return self._get_attribute("ProfileOrientation")
+
+    @ProfileOrientation.setter
+    def ProfileOrientation(self, value: Union[float, "IfcDirection"]):
+        return self._set_attribute("ProfileOrientation", value)
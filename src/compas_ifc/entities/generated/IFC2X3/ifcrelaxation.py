@@ -0,0 +1,23 @@
+from compas_ifc.entities.base import Base
+
+
+class IfcRelaxation(Base):
+    """Wrapper class for IfcRelaxation."""
+
+    @property
+    def RelaxationValue(self)-> float:
+        """<attribute RelaxationValue: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("RelaxationValue")
+
+    @RelaxationValue.setter
+    def RelaxationValue(self, value: float):
+        return self._set_attribute("RelaxationValue", value)
+
+    @property
+    def InitialStress(self)-> float:
+        """<attribute InitialStress: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("InitialStress")
+
+    @InitialStress.setter
+    def InitialStress(self, value: float):
+        return self._set_attribute("InitialStress", value)
@@ -0,0 +1,5 @@
+from .ifcrelationship import IfcRelationship
+
+
+class IfcRelConnects(IfcRelationship):
+    """Wrapper class for IfcRelConnects."""
@@ -0,0 +1,36 @@
+from .ifcrelconnects import IfcRelConnects
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcconnectiongeometry import IfcConnectionGeometry
+    from .ifcelement import IfcElement
+
+class IfcRelConnectsElements(IfcRelConnects):
+    """Wrapper class for IfcRelConnectsElements."""
+
+    @property
+    def ConnectionGeometry(self)-> "IfcConnectionGeometry":
+        """<attribute ConnectionGeometry?: <entity IfcConnectionGeometry>>"""
+        return self._get_attribute("ConnectionGeometry")
+
+    @ConnectionGeometry.setter
+    def ConnectionGeometry(self, value: "IfcConnectionGeometry"):
+        return self._set_attribute("ConnectionGeometry", value)
+
+    @property
+    def RelatingElement(self)-> "IfcElement":
+        """<attribute RelatingElement: <entity IfcElement>>"""
+        return self._get_attribute("RelatingElement")
+
+    @RelatingElement.setter
+    def RelatingElement(self, value: "IfcElement"):
+        return self._set_attribute("RelatingElement", value)
+
+    @property
+    def RelatedElement(self)-> "IfcElement":
+        """<attribute RelatedElement: <entity IfcElement>>"""
+        return self._get_attribute("RelatedElement")
+
+    @RelatedElement.setter
+    def RelatedElement(self, value: "IfcElement"):
+        return self._set_attribute("RelatedElement", value)
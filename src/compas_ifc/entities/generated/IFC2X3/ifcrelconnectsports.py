@@ -0,0 +1,36 @@
+from .ifcrelconnects import IfcRelConnects
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelement import IfcElement
+    from .ifcport import IfcPort
+
+class IfcRelConnectsPorts(IfcRelConnects):
+    """Wrapper class for IfcRelConnectsPorts."""
+
+    @property
+    def RelatingPort(self)-> "IfcPort":
+        """<attribute RelatingPort: <entity IfcPort>>"""
+        return self._get_attribute("RelatingPort")
+
+    @RelatingPort.setter
+    def RelatingPort(self, value: "IfcPort"):
+        return self._set_attribute("RelatingPort", value)
+
+    @property
+    def RelatedPort(self)-> "IfcPort":
+        """<attribute RelatedPort: <entity IfcPort>>"""
+        return self._get_attribute("RelatedPort")
+
+    @RelatedPort.setter
+    def RelatedPort(self, value: "IfcPort"):
+        return self._set_attribute("RelatedPort", value)
+
+    @property
+    def RealizingElement(self)-> "IfcElement":
+        """<attribute RealizingElement?: <entity IfcElement>>"""
+        return self._get_attribute("RealizingElement")
+
+    @RealizingElement.setter
+    def RealizingElement(self, value: "IfcElement"):
+        return self._set_attribute("RealizingElement", value)
@@ -0,0 +1,27 @@
+from .ifcrelconnects import IfcRelConnects
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelement import IfcElement
+    from .ifcport import IfcPort
+
+class IfcRelConnectsPortToElement(IfcRelConnects):
+    """Wrapper class for IfcRelConnectsPortToElement."""
+
+    @property
+    def RelatingPort(self)-> "IfcPort":
+        """<attribute RelatingPort: <entity IfcPort>>"""
+        return self._get_attribute("RelatingPort")
+
+    @RelatingPort.setter
+    def RelatingPort(self, value: "IfcPort"):
+        return self._set_attribute("RelatingPort", value)
+
+    @property
+    def RelatedElement(self)-> "IfcElement":
+        """<attribute RelatedElement: <entity IfcElement>>"""
+        return self._get_attribute("RelatedElement")
+
+    @RelatedElement.setter
+    def RelatedElement(self, value: "IfcElement"):
+        return self._set_attribute("RelatedElement", value)
@@ -0,0 +1,29 @@
+from .ifcrelconnects import IfcRelConnects
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelement import IfcElement
+    from .ifcstructuralactivity import IfcStructuralActivity
+    from .ifcstructuralitem import IfcStructuralItem
+
+class IfcRelConnectsStructuralActivity(IfcRelConnects):
+    """Wrapper class for IfcRelConnectsStructuralActivity."""
+
+    @property
+    def RelatingElement(self)-> Union["IfcElement", "IfcStructuralItem"]:
+        """<attribute RelatingElement: <select IfcStructuralActivityAssignmentSelect: (<entity IfcElement> | <entity IfcStructuralItem>)>>"""
+        return self._get_attribute("RelatingElement")
+
+    @RelatingElement.setter
+    def RelatingElement(self, value: Union["IfcElement", "IfcStructuralItem"]):
+        return self._set_attribute("RelatingElement", value)
+
+    @property
+    def RelatedStructuralActivity(self)-> "IfcStructuralActivity":
+        """<attribute RelatedStructuralActivity: <entity IfcStructuralActivity>>"""
+        return self._get_attribute("RelatedStructuralActivity")
+
+    @RelatedStructuralActivity.setter
+    def RelatedStructuralActivity(self, value: "IfcStructuralActivity"):
+        return self._set_attribute("RelatedStructuralActivity", value)
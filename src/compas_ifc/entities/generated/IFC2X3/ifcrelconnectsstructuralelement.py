@@ -0,0 +1,27 @@
+from .ifcrelconnects import IfcRelConnects
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelement import IfcElement
+    from .ifcstructuralmember import IfcStructuralMember
+
+class IfcRelConnectsStructuralElement(IfcRelConnects):
+    """Wrapper class for IfcRelConnectsStructuralElement."""
+
+    @property
+    def RelatingElement(self)-> "IfcElement":
+        """<attribute RelatingElement: <entity IfcElement>>"""
+        return self._get_attribute("RelatingElement")
+
+    @RelatingElement.setter
+    def RelatingElement(self, value: "IfcElement"):
+        return self._set_attribute("RelatingElement", value)
+
+    @property
+    def RelatedStructuralMember(self)-> "IfcStructuralMember":
+        """<attribute RelatedStructuralMember: <entity IfcStructuralMember>>"""
+        return self._get_attribute("RelatedStructuralMember")
+
+    @RelatedStructuralMember.setter
+    def RelatedStructuralMember(self, value: "IfcStructuralMember"):
+        return self._set_attribute("RelatedStructuralMember", value)
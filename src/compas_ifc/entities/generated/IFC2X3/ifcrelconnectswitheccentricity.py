@@ -0,0 +1,17 @@
+from .ifcrelconnectsstructuralmember import IfcRelConnectsStructuralMember
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcconnectiongeometry import IfcConnectionGeometry
+
+class IfcRelConnectsWithEccentricity(IfcRelConnectsStructuralMember):
+    """Wrapper class for IfcRelConnectsWithEccentricity."""
+
+    @property
+    def ConnectionConstraint(self)-> "IfcConnectionGeometry":
+        """<attribute ConnectionConstraint: <entity IfcConnectionGeometry>>"""
+        return self._get_attribute("ConnectionConstraint")
+
+    @ConnectionConstraint.setter
+    def ConnectionConstraint(self, value: "IfcConnectionGeometry"):
+        return self._set_attribute("ConnectionConstraint", value)
@@ -0,0 +1,27 @@
+from .ifcrelconnects import IfcRelConnects
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccovering import IfcCovering
+    from .ifcelement import IfcElement
+
+class IfcRelCoversBldgElements(IfcRelConnects):
+    """Wrapper class for IfcRelCoversBldgElements."""
+
+    @property
+    def RelatingBuildingElement(self)-> "IfcElement":
+        """<attribute RelatingBuildingElement: <entity IfcElement>>"""
+        return self._get_attribute("RelatingBuildingElement")
+
+    @RelatingBuildingElement.setter
+    def RelatingBuildingElement(self, value: "IfcElement"):
+        return self._set_attribute("RelatingBuildingElement", value)
+
+    @property
+    def RelatedCoverings(self)-> list["IfcCovering"]:
+        """<attribute RelatedCoverings: <set [1:?] of <entity IfcCovering>>>"""
+        return self._get_attribute("RelatedCoverings")
+
+    @RelatedCoverings.setter
+    def RelatedCoverings(self, value: list["IfcCovering"]):
+        return self._set_attribute("RelatedCoverings", value)
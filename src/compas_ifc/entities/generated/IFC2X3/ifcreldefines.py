@@ -0,0 +1,17 @@
+from .ifcrelationship import IfcRelationship
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcobject import IfcObject
+
+class IfcRelDefines(IfcRelationship):
+    """Wrapper class for IfcRelDefines."""
+
+    @property
+    def RelatedObjects(self)-> list["IfcObject"]:
+        """<attribute RelatedObjects: <set [1:?] of <entity IfcObject>>>"""
+        return self._get_attribute("RelatedObjects")
+
+    @RelatedObjects.setter
+    def RelatedObjects(self, value: list["IfcObject"]):
+        return self._set_attribute("RelatedObjects", value)
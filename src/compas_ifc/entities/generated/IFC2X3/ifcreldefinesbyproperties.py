@@ -0,0 +1,17 @@
+from .ifcreldefines import IfcRelDefines
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpropertysetdefinition import IfcPropertySetDefinition
+
+class IfcRelDefinesByProperties(IfcRelDefines):
+    """Wrapper class for IfcRelDefinesByProperties."""
+
+    @property
+    def RelatingPropertyDefinition(self)-> "IfcPropertySetDefinition":
+        """<attribute RelatingPropertyDefinition: <entity IfcPropertySetDefinition>>"""
+        return self._get_attribute("RelatingPropertyDefinition")
+
+    @RelatingPropertyDefinition.setter
+    def RelatingPropertyDefinition(self, value: "IfcPropertySetDefinition"):
+        return self._set_attribute("RelatingPropertyDefinition", value)
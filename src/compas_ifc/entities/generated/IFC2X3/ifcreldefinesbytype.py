@@ -0,0 +1,17 @@
+from .ifcreldefines import IfcRelDefines
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctypeobject import IfcTypeObject
+
+class IfcRelDefinesByType(IfcRelDefines):
+    """Wrapper class for IfcRelDefinesByType."""
+
+    @property
+    def RelatingType(self)-> "IfcTypeObject":
+        """<attribute RelatingType: <entity IfcTypeObject>>"""
+        return self._get_attribute("RelatingType")
+
+    @RelatingType.setter
+    def RelatingType(self, value: "IfcTypeObject"):
+        return self._set_attribute("RelatingType", value)
@@ -0,0 +1,27 @@
+from .ifcrelconnects import IfcRelConnects
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelement import IfcElement
+    from .ifcopeningelement import IfcOpeningElement
+
+class IfcRelFillsElement(IfcRelConnects):
+    """Wrapper class for IfcRelFillsElement."""
+
+    @property
+    def RelatingOpeningElement(self)-> "IfcOpeningElement":
+        """<attribute RelatingOpeningElement: <entity IfcOpeningElement>>"""
+        return self._get_attribute("RelatingOpeningElement")
+
+    @RelatingOpeningElement.setter
+    def RelatingOpeningElement(self, value: "IfcOpeningElement"):
+        return self._set_attribute("RelatingOpeningElement", value)
+
+    @property
+    def RelatedBuildingElement(self)-> "IfcElement":
+        """<attribute RelatedBuildingElement: <entity IfcElement>>"""
+        return self._get_attribute("RelatedBuildingElement")
+
+    @RelatedBuildingElement.setter
+    def RelatedBuildingElement(self, value: "IfcElement"):
+        return self._set_attribute("RelatedBuildingElement", value)
@@ -0,0 +1,27 @@
+from .ifcrelconnects import IfcRelConnects
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdistributioncontrolelement import IfcDistributionControlElement
+    from .ifcdistributionflowelement import IfcDistributionFlowElement
+
+class IfcRelFlowControlElements(IfcRelConnects):
+    """Wrapper class for IfcRelFlowControlElements."""
+
+    @property
+    def RelatedControlElements(self)-> list["IfcDistributionControlElement"]:
+        """<attribute RelatedControlElements: <set [1:?] of <entity IfcDistributionControlElement>>>"""
+        return self._get_attribute("RelatedControlElements")
+
+    @RelatedControlElements.setter
+    def RelatedControlElements(self, value: list["IfcDistributionControlElement"]):
+        return self._set_attribute("RelatedControlElements", value)
+
+    @property
+    def RelatingFlowElement(self)-> "IfcDistributionFlowElement":
+        """<attribute RelatingFlowElement: <entity IfcDistributionFlowElement>>"""
+        return self._get_attribute("RelatingFlowElement")
+
+    @RelatingFlowElement.setter
+    def RelatingFlowElement(self, value: "IfcDistributionFlowElement"):
+        return self._set_attribute("RelatingFlowElement", value)
@@ -0,0 +1,54 @@
+from .ifcrelconnects import IfcRelConnects
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcspaceprogram import IfcSpaceProgram
+    from .ifcspatialstructureelement import IfcSpatialStructureElement
+
+class IfcRelInteractionRequirements(IfcRelConnects):
+    """Wrapper class for IfcRelInteractionRequirements."""
+
+    @property
+    def DailyInteraction(self)-> float:
+        """<attribute DailyInteraction?: <type IfcCountMeasure: <number>>>"""
+        return self._get_attribute("DailyInteraction")
+
+    @DailyInteraction.setter
+    def DailyInteraction(self, value: float):
+        return self._set_attribute("DailyInteraction", value)
+
+    @property
+    def ImportanceRating(self)-> float:
+        """<attribute ImportanceRating?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("ImportanceRating")
+
+    @ImportanceRating.setter
+    def ImportanceRating(self, value: float):
+        return self._set_attribute("ImportanceRating", value)
+
+    @property
+    def LocationOfInteraction(self)-> "IfcSpatialStructureElement":
+        """<attribute LocationOfInteraction?: <entity IfcSpatialStructureElement>>"""
+        return self._get_attribute("LocationOfInteraction")
+
+    @LocationOfInteraction.setter
+    def LocationOfInteraction(self, value: "IfcSpatialStructureElement"):
+        return self._set_attribute("LocationOfInteraction", value)
+
+    @property
+    def RelatedSpaceProgram(self)-> "IfcSpaceProgram":
+        """<attribute RelatedSpaceProgram: <entity IfcSpaceProgram>>"""
+        return self._get_attribute("RelatedSpaceProgram")
+
+    @RelatedSpaceProgram.setter
+    def RelatedSpaceProgram(self, value: "IfcSpaceProgram"):
+        return self._set_attribute("RelatedSpaceProgram", value)
+
+    @property
+    def RelatingSpaceProgram(self)-> "IfcSpaceProgram":
+        """<attribute RelatingSpaceProgram: <entity IfcSpaceProgram>>"""
+        return self._get_attribute("RelatingSpaceProgram")
+
+    @RelatingSpaceProgram.setter
+    def RelatingSpaceProgram(self, value: "IfcSpaceProgram"):
+        return self._set_attribute("RelatingSpaceProgram", value)
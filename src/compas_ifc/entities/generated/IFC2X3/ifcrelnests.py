@@ -0,0 +1,5 @@
+from .ifcreldecomposes import IfcRelDecomposes
+
+
+class IfcRelNests(IfcRelDecomposes):
+    """Wrapper class for IfcRelNests."""
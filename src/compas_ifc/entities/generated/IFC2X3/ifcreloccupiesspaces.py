@@ -0,0 +1,5 @@
+from .ifcrelassignstoactor import IfcRelAssignsToActor
+
+
+class IfcRelOccupiesSpaces(IfcRelAssignsToActor):
+    """Wrapper class for IfcRelOccupiesSpaces."""
@@ -0,0 +1,17 @@
+from .ifcreldefinesbyproperties import IfcRelDefinesByProperties
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcproperty import IfcProperty
+
+class IfcRelOverridesProperties(IfcRelDefinesByProperties):
+    """Wrapper class for IfcRelOverridesProperties."""
+
+    @property
+    def OverridingProperties(self)-> list["IfcProperty"]:
+        """<attribute OverridingProperties: <set [1:?] of <entity IfcProperty>>>"""
+        return self._get_attribute("OverridingProperties")
+
+    @OverridingProperties.setter
+    def OverridingProperties(self, value: list["IfcProperty"]):
+        return self._set_attribute("OverridingProperties", value)
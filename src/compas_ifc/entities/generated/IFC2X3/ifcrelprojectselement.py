@@ -0,0 +1,27 @@
+from .ifcrelconnects import IfcRelConnects
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelement import IfcElement
+    from .ifcfeatureelementaddition import IfcFeatureElementAddition
+
+class IfcRelProjectsElement(IfcRelConnects):
+    """Wrapper class for IfcRelProjectsElement."""
+
+    @property
+    def RelatingElement(self)-> "IfcElement":
+        """<attribute RelatingElement: <entity IfcElement>>"""
+        return self._get_attribute("RelatingElement")
+
+    @RelatingElement.setter
+    def RelatingElement(self, value: "IfcElement"):
+        return self._set_attribute("RelatingElement", value)
+
+    @property
+    def RelatedFeatureElement(self)-> "IfcFeatureElementAddition":
+        """<attribute RelatedFeatureElement: <entity IfcFeatureElementAddition>>"""
+        return self._get_attribute("RelatedFeatureElement")
+
+    @RelatedFeatureElement.setter
+    def RelatedFeatureElement(self, value: "IfcFeatureElementAddition"):
+        return self._set_attribute("RelatedFeatureElement", value)
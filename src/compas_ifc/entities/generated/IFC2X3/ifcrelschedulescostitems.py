@@ -0,0 +1,5 @@
+from .ifcrelassignstocontrol import IfcRelAssignsToControl
+
+
+class IfcRelSchedulesCostItems(IfcRelAssignsToControl):
+    """Wrapper class for IfcRelSchedulesCostItems."""
@@ -0,0 +1,57 @@
+from .ifcrelconnects import IfcRelConnects
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcconnectiongeometry import IfcConnectionGeometry
+    from .ifcelement import IfcElement
+    from .ifcinternalorexternalenum import IfcInternalOrExternalEnum
+    from .ifcphysicalorvirtualenum import IfcPhysicalOrVirtualEnum
+    from .ifcspace import IfcSpace
+
+class IfcRelSpaceBoundary(IfcRelConnects):
+    """Wrapper class for IfcRelSpaceBoundary."""
+
+    @property
+    def RelatingSpace(self)-> "IfcSpace":
+        """<attribute RelatingSpace: <entity IfcSpace>>"""
+        return self._get_attribute("RelatingSpace")
+
+    @RelatingSpace.setter
+    def RelatingSpace(self, value: "IfcSpace"):
+        return self._set_attribute("RelatingSpace", value)
+
+    @property
+    def RelatedBuildingElement(self)-> "IfcElement":
+        """<attribute RelatedBuildingElement?: <entity IfcElement>>"""
+        return self._get_attribute("RelatedBuildingElement")
+
+    @RelatedBuildingElement.setter
+    def RelatedBuildingElement(self, value: "IfcElement"):
+        return self._set_attribute("RelatedBuildingElement", value)
+
+    @property
+    def ConnectionGeometry(self)-> "IfcConnectionGeometry":
+        """<attribute ConnectionGeometry?: <entity IfcConnectionGeometry>>"""
+        return self._get_attribute("ConnectionGeometry")
+
+    @ConnectionGeometry.setter
+    def ConnectionGeometry(self, value: "IfcConnectionGeometry"):
+        return self._set_attribute("ConnectionGeometry", value)
+
+    @property
+    def PhysicalOrVirtualBoundary(self)-> "IfcPhysicalOrVirtualEnum":
+        """<attribute PhysicalOrVirtualBoundary: <enumeration IfcPhysicalOrVirtualEnum: (PHYSICAL, VIRTUAL, NOTDEFINED)>>"""
+        return self._get_attribute("PhysicalOrVirtualBoundary")
+
+    @PhysicalOrVirtualBoundary.setter
+    def PhysicalOrVirtualBoundary(self, value: "IfcPhysicalOrVirtualEnum"):
+        return self._set_attribute("PhysicalOrVirtualBoundary", value)
+
+    @property
+    def InternalOrExternalBoundary(self)-> "IfcInternalOrExternalEnum":
+        """<attribute InternalOrExternalBoundary: <enumeration IfcInternalOrExternalEnum: (INTERNAL, EXTERNAL, NOTDEFINED)>>"""
+        return self._get_attribute("InternalOrExternalBoundary")
+
+    @InternalOrExternalBoundary.setter
+    def InternalOrExternalBoundary(self, value: "IfcInternalOrExternalEnum"):
+        return self._set_attribute("InternalOrExternalBoundary", value)
@@ -0,0 +1,27 @@
+from .ifcrelconnects import IfcRelConnects
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelement import IfcElement
+    from .ifcfeatureelementsubtraction import IfcFeatureElementSubtraction
+
+class IfcRelVoidsElement(IfcRelConnects):
+    """Wrapper class for IfcRelVoidsElement."""
+
+    @property
+    def RelatingBuildingElement(self)-> "IfcElement":
+        """<attribute RelatingBuildingElement: <entity IfcElement>>"""
+        return self._get_attribute("RelatingBuildingElement")
+
+    @RelatingBuildingElement.setter
+    def RelatingBuildingElement(self, value: "IfcElement"):
+        return self._set_attribute("RelatingBuildingElement", value)
+
+    @property
+    def RelatedOpeningElement(self)-> "IfcFeatureElementSubtraction":
+        """<attribute RelatedOpeningElement: <entity IfcFeatureElementSubtraction>>"""
+        return self._get_attribute("RelatedOpeningElement")
+
+    @RelatedOpeningElement.setter
+    def RelatedOpeningElement(self, value: "IfcFeatureElementSubtraction"):
+        return self._set_attribute("RelatedOpeningElement", value)
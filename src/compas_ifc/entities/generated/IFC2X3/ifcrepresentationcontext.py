@@ -0,0 +1,30 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrepresentation import IfcRepresentation
+
+class IfcRepresentationContext(Base):
+    """Wrapper class for IfcRepresentationContext."""
+
+    @property
+    def ContextIdentifier(self)-> str:
+        """<attribute ContextIdentifier?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ContextIdentifier")
+
+    @ContextIdentifier.setter
+    def ContextIdentifier(self, value: str):
+        return self._set_attribute("ContextIdentifier", value)
+
+    @property
+    def ContextType(self)-> str:
+        """<attribute ContextType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ContextType")
+
+    @ContextType.setter
+    def ContextType(self, value: str):
+        return self._set_attribute("ContextType", value)
+
+    def RepresentationsInContext(self)-> list["IfcRepresentation"]:
+        """<inverse RepresentationsInContext: set [0:?] of <entity IfcRepresentation> for <attribute ContextOfItems: <entity IfcRepresentationContext>>>"""
+        return self._get_inverse_attribute("RepresentationsInContext")
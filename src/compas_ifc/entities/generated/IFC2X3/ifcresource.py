@@ -0,0 +1,12 @@
+from .ifcobject import IfcObject
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelassignstoresource import IfcRelAssignsToResource
+
+class IfcResource(IfcObject):
+    """Wrapper class for IfcResource."""
+
+    def ResourceOf(self)-> list["IfcRelAssignsToResource"]:
+        """<inverse ResourceOf: set [0:?] of <entity IfcRelAssignsToResource> for <attribute RelatingResource: <entity IfcResource>>>"""
+        return self._get_inverse_attribute("ResourceOf")
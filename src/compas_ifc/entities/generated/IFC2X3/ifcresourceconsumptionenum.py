@@ -0,0 +1,2 @@
+class IfcResourceConsumptionEnum(str):
+    items = ['CONSUMED', 'PARTIALLYCONSUMED', 'NOTCONSUMED', 'OCCUPIED', 'PARTIALLYOCCUPIED', 'NOTOCCUPIED', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,26 @@
+from .ifcsweptareasolid import IfcSweptAreaSolid
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaxis1placement import IfcAxis1Placement
+
+class IfcRevolvedAreaSolid(IfcSweptAreaSolid):
+    """Wrapper class for IfcRevolvedAreaSolid."""
+
+    @property
+    def Axis(self)-> "IfcAxis1Placement":
+        """<attribute Axis: <entity IfcAxis1Placement>>"""
+        return self._get_attribute("Axis")
+
+    @Axis.setter
+    def Axis(self, value: "IfcAxis1Placement"):
+        return self._set_attribute("Axis", value)
+
+    @property
+    def Angle(self)-> float:
+        """<attribute Angle: <type IfcPlaneAngleMeasure: <real>>>"""
+        return self._get_attribute("Angle")
+
+    @Angle.setter
+    def Angle(self, value: float):
+        return self._set_attribute("Angle", value)
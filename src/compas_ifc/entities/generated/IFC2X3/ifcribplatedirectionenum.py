@@ -0,0 +1,2 @@
+class IfcRibPlateDirectionEnum(str):
+    items = ['DIRECTION_X', 'DIRECTION_Y']
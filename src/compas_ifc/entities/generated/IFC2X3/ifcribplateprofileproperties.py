@@ -0,0 +1,53 @@
+from .ifcprofileproperties import IfcProfileProperties
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcribplatedirectionenum import IfcRibPlateDirectionEnum
+
+class IfcRibPlateProfileProperties(IfcProfileProperties):
+    """Wrapper class for IfcRibPlateProfileProperties."""
+
+    @property
+    def Thickness(self)-> float:
+        """<attribute Thickness?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Thickness")
+
+    @Thickness.setter
+    def Thickness(self, value: float):
+        return self._set_attribute("Thickness", value)
+
+    @property
+    def RibHeight(self)-> float:
+        """<attribute RibHeight?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("RibHeight")
+
+    @RibHeight.setter
+    def RibHeight(self, value: float):
+        return self._set_attribute("RibHeight", value)
+
+    @property
+    def RibWidth(self)-> float:
+        """<attribute RibWidth?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("RibWidth")
+
+    @RibWidth.setter
+    def RibWidth(self, value: float):
+        return self._set_attribute("RibWidth", value)
+
+    @property
+    def RibSpacing(self)-> float:
+        """<attribute RibSpacing?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("RibSpacing")
+
+    @RibSpacing.setter
+    def RibSpacing(self, value: float):
+        return self._set_attribute("RibSpacing", value)
+
+    @property
+    def Direction(self)-> "IfcRibPlateDirectionEnum":
+        """<attribute Direction: <enumeration IfcRibPlateDirectionEnum: (DIRECTION_X, DIRECTION_Y)>>"""
+        return self._get_attribute("Direction")
+
+    @Direction.setter
+    def Direction(self, value: "IfcRibPlateDirectionEnum"):
+        return self._set_attribute("Direction", value)
@@ -0,0 +1,23 @@
+from .ifccsgprimitive3d import IfcCsgPrimitive3D
+
+
+class IfcRightCircularCone(IfcCsgPrimitive3D):
+    """Wrapper class for IfcRightCircularCone."""
+
+    @property
+    def Height(self)-> float:
+        """<attribute Height: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Height")
+
+    @Height.setter
+    def Height(self, value: float):
+        return self._set_attribute("Height", value)
+
+    @property
+    def BottomRadius(self)-> float:
+        """<attribute BottomRadius: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("BottomRadius")
+
+    @BottomRadius.setter
+    def BottomRadius(self, value: float):
+        return self._set_attribute("BottomRadius", value)
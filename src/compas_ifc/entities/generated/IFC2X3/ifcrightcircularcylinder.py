@@ -0,0 +1,23 @@
+from .ifccsgprimitive3d import IfcCsgPrimitive3D
+
+
+class IfcRightCircularCylinder(IfcCsgPrimitive3D):
+    """Wrapper class for IfcRightCircularCylinder."""
+
+    @property
+    def Height(self)-> float:
+        """<attribute Height: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Height")
+
+    @Height.setter
+    def Height(self, value: float):
+        return self._set_attribute("Height", value)
+
+    @property
+    def Radius(self)-> float:
+        """<attribute Radius: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Radius")
+
+    @Radius.setter
+    def Radius(self, value: float):
+        return self._set_attribute("Radius", value)
@@ -0,0 +1,17 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrooftypeenum import IfcRoofTypeEnum
+
+class IfcRoof(IfcBuildingElement):
+    """Wrapper class for IfcRoof."""
+
+    @property
+    def ShapeType(self)-> "IfcRoofTypeEnum":
+        """<attribute ShapeType: <enumeration IfcRoofTypeEnum: (FLAT_ROOF, SHED_ROOF, GABLE_ROOF, HIP_ROOF, HIPPED_GABLE_ROOF, GAMBREL_ROOF, MANSARD_ROOF, BARREL_ROOF, RAINBOW_ROOF, BUTTERFLY_ROOF, PAVILION_ROOF, DOME_ROOF, FREEFORM, NOTDEFINED)>>"""
+        return self._get_attribute("ShapeType")
+
+    @ShapeType.setter
+    def ShapeType(self, value: "IfcRoofTypeEnum"):
+        return self._set_attribute("ShapeType", value)
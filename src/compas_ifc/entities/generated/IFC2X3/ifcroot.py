@@ -0,0 +1,44 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcownerhistory import IfcOwnerHistory
+
+class IfcRoot(Base):
+    """Wrapper class for IfcRoot."""
+
+    @property
+    def GlobalId(self)-> str:
+        """<attribute GlobalId: <type IfcGloballyUniqueId: <string>>>"""
+        return self._get_attribute("GlobalId")
+
+    @GlobalId.setter
+    def GlobalId(self, value: str):
+        return self._set_attribute("GlobalId", value)
+
+    @property
+    def OwnerHistory(self)-> "IfcOwnerHistory":
+        """<attribute OwnerHistory: <entity IfcOwnerHistory>>"""
+        return self._get_attribute("OwnerHistory")
+
+    @OwnerHistory.setter
+    def OwnerHistory(self, value: "IfcOwnerHistory"):
+        return self._set_attribute("OwnerHistory", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
@@ -0,0 +1,14 @@
+from .ifcedgefeature import IfcEdgeFeature
+
+
+class IfcRoundedEdgeFeature(IfcEdgeFeature):
+    """Wrapper class for IfcRoundedEdgeFeature."""
+
+    @property
+    def Radius(self)-> float:
+        """<attribute Radius?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Radius")
+
+    @Radius.setter
+    def Radius(self, value: float):
+        return self._set_attribute("Radius", value)
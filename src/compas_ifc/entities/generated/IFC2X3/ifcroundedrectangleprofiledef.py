@@ -0,0 +1,14 @@
+from .ifcrectangleprofiledef import IfcRectangleProfileDef
+
+
+class IfcRoundedRectangleProfileDef(IfcRectangleProfileDef):
+    """Wrapper class for IfcRoundedRectangleProfileDef."""
+
+    @property
+    def RoundingRadius(self)-> float:
+        """<attribute RoundingRadius: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("RoundingRadius")
+
+    @RoundingRadius.setter
+    def RoundingRadius(self, value: float):
+        return self._set_attribute("RoundingRadius", value)
@@ -0,0 +1,17 @@
+from .ifcflowterminaltype import IfcFlowTerminalType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcsanitaryterminaltypeenum import IfcSanitaryTerminalTypeEnum
+
+class IfcSanitaryTerminalType(IfcFlowTerminalType):
+    """Wrapper class for IfcSanitaryTerminalType."""
+
+    @property
+    def PredefinedType(self)-> "IfcSanitaryTerminalTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcSanitaryTerminalTypeEnum: (BATH, BIDET, CISTERN, SHOWER, SINK, SANITARYFOUNTAIN, TOILETPAN, URINAL, WASHHANDBASIN, WCSEAT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcSanitaryTerminalTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcSanitaryTerminalTypeEnum(str):
+    items = ['BATH', 'BIDET', 'CISTERN', 'SHOWER', 'SINK', 'SANITARYFOUNTAIN', 'TOILETPAN', 'URINAL', 'WASHHANDBASIN', 'WCSEAT', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,178 @@
+from .ifccontrol import IfcControl
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccalendardate import IfcCalendarDate
+    from .ifcdateandtime import IfcDateAndTime
+    from .ifclocaltime import IfcLocalTime
+    from .ifcrelassignstasks import IfcRelAssignsTasks
+
+class IfcScheduleTimeControl(IfcControl):
+    """Wrapper class for IfcScheduleTimeControl."""
+
+    @property
+    def ActualStart(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute ActualStart?: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("ActualStart")
+
+    @ActualStart.setter
+    def ActualStart(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("ActualStart", value)
+
+    @property
+    def EarlyStart(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute EarlyStart?: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("EarlyStart")
+
+    @EarlyStart.setter
+    def EarlyStart(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("EarlyStart", value)
+
+    @property
+    def LateStart(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute LateStart?: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("LateStart")
+
+    @LateStart.setter
+    def LateStart(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("LateStart", value)
+
+    @property
+    def ScheduleStart(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute ScheduleStart?: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("ScheduleStart")
+
+    @ScheduleStart.setter
+    def ScheduleStart(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("ScheduleStart", value)
+
+    @property
+    def ActualFinish(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute ActualFinish?: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("ActualFinish")
+
+    @ActualFinish.setter
+    def ActualFinish(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("ActualFinish", value)
+
+    @property
+    def EarlyFinish(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute EarlyFinish?: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("EarlyFinish")
+
+    @EarlyFinish.setter
+    def EarlyFinish(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("EarlyFinish", value)
+
+    @property
+    def LateFinish(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute LateFinish?: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("LateFinish")
+
+    @LateFinish.setter
+    def LateFinish(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("LateFinish", value)
+
+    @property
+    def ScheduleFinish(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute ScheduleFinish?: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("ScheduleFinish")
+
+    @ScheduleFinish.setter
+    def ScheduleFinish(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("ScheduleFinish", value)
+
+    @property
+    def ScheduleDuration(self)-> float:
+        """<attribute ScheduleDuration?: <type IfcTimeMeasure: <real>>>"""
+        return self._get_attribute("ScheduleDuration")
+
+    @ScheduleDuration.setter
+    def ScheduleDuration(self, value: float):
+        return self._set_attribute("ScheduleDuration", value)
+
+    @property
+    def ActualDuration(self)-> float:
+        """<attribute ActualDuration?: <type IfcTimeMeasure: <real>>>"""
+        return self._get_attribute("ActualDuration")
+
+    @ActualDuration.setter
+    def ActualDuration(self, value: float):
+        return self._set_attribute("ActualDuration", value)
+
+    @property
+    def RemainingTime(self)-> float:
+        """<attribute RemainingTime?: <type IfcTimeMeasure: <real>>>"""
+        return self._get_attribute("RemainingTime")
+
+    @RemainingTime.setter
+    def RemainingTime(self, value: float):
+        return self._set_attribute("RemainingTime", value)
+
+    @property
+    def FreeFloat(self)-> float:
+        """<attribute FreeFloat?: <type IfcTimeMeasure: <real>>>"""
+        return self._get_attribute("FreeFloat")
+
+    @FreeFloat.setter
+    def FreeFloat(self, value: float):
+        return self._set_attribute("FreeFloat", value)
+
+    @property
+    def TotalFloat(self)-> float:
+        """<attribute TotalFloat?: <type IfcTimeMeasure: <real>>>"""
+        return self._get_attribute("TotalFloat")
+
+    @TotalFloat.setter
+    def TotalFloat(self, value: float):
+        return self._set_attribute("TotalFloat", value)
+
+    @property
+    def IsCritical(self)-> bool:
+        """<attribute IsCritical?: <boolean>>"""
+        return self._get_attribute("IsCritical")
+
+    @IsCritical.setter
+    def IsCritical(self, value: bool):
+        return self._set_attribute("IsCritical", value)
+
+    @property
+    def StatusTime(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute StatusTime?: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("StatusTime")
+
+    @StatusTime.setter
+    def StatusTime(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("StatusTime", value)
+
+    @property
+    def StartFloat(self)-> float:
+        """<attribute StartFloat?: <type IfcTimeMeasure: <real>>>"""
+        return self._get_attribute("StartFloat")
+
+    @StartFloat.setter
+    def StartFloat(self, value: float):
+        return self._set_attribute("StartFloat", value)
+
+    @property
+    def FinishFloat(self)-> float:
+        """<attribute FinishFloat?: <type IfcTimeMeasure: <real>>>"""
+        return self._get_attribute("FinishFloat")
+
+    @FinishFloat.setter
+    def FinishFloat(self, value: float):
+        return self._set_attribute("FinishFloat", value)
+
+    @property
+    def Completion(self)-> float:
+        """<attribute Completion?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("Completion")
+
+    @Completion.setter
+    def Completion(self, value: float):
+        return self._set_attribute("Completion", value)
+
+    def ScheduleTimeControlAssigned(self)-> list["IfcRelAssignsTasks"]:
+        """<inverse ScheduleTimeControlAssigned:  [?:?] of <entity IfcRelAssignsTasks> for <attribute TimeForTask?: <entity IfcScheduleTimeControl>>>"""
+        return self._get_inverse_attribute("ScheduleTimeControlAssigned")
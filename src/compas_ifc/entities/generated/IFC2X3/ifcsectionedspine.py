@@ -0,0 +1,37 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaxis2placement3d import IfcAxis2Placement3D
+    from .ifccompositecurve import IfcCompositeCurve
+    from .ifcprofiledef import IfcProfileDef
+
+class IfcSectionedSpine(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcSectionedSpine."""
+
+    @property
+    def SpineCurve(self)-> "IfcCompositeCurve":
+        """<attribute SpineCurve: <entity IfcCompositeCurve>>"""
+        return self._get_attribute("SpineCurve")
+
+    @SpineCurve.setter
+    def SpineCurve(self, value: "IfcCompositeCurve"):
+        return self._set_attribute("SpineCurve", value)
+
+    @property
+    def CrossSections(self)-> list["IfcProfileDef"]:
+        """<attribute CrossSections: <list [2:?] of <entity IfcProfileDef>>>"""
+        return self._get_attribute("CrossSections")
+
+    @CrossSections.setter
+    def CrossSections(self, value: list["IfcProfileDef"]):
+        return self._set_attribute("CrossSections", value)
+
+    @property
+    def CrossSectionPositions(self)-> list["IfcAxis2Placement3D"]:
+        """<attribute CrossSectionPositions: <list [2:?] of <entity IfcAxis2Placement3D>>>"""
+        return self._get_attribute("CrossSectionPositions")
+
+    @CrossSectionPositions.setter
+    def CrossSectionPositions(self, value: list["IfcAxis2Placement3D"]):
+        return self._set_attribute("CrossSectionPositions", value)
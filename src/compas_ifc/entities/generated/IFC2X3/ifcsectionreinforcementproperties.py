@@ -0,0 +1,64 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcreinforcementbarproperties import IfcReinforcementBarProperties
+    from .ifcreinforcingbarroleenum import IfcReinforcingBarRoleEnum
+    from .ifcsectionproperties import IfcSectionProperties
+
+class IfcSectionReinforcementProperties(Base):
+    """Wrapper class for IfcSectionReinforcementProperties."""
+
+    @property
+    def LongitudinalStartPosition(self)-> float:
+        """<attribute LongitudinalStartPosition: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("LongitudinalStartPosition")
+
+    @LongitudinalStartPosition.setter
+    def LongitudinalStartPosition(self, value: float):
+        return self._set_attribute("LongitudinalStartPosition", value)
+
+    @property
+    def LongitudinalEndPosition(self)-> float:
+        """<attribute LongitudinalEndPosition: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("LongitudinalEndPosition")
+
+    @LongitudinalEndPosition.setter
+    def LongitudinalEndPosition(self, value: float):
+        return self._set_attribute("LongitudinalEndPosition", value)
+
+    @property
+    def TransversePosition(self)-> float:
+        """<attribute TransversePosition?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("TransversePosition")
+
+    @TransversePosition.setter
+    def TransversePosition(self, value: float):
+        return self._set_attribute("TransversePosition", value)
+
+    @property
+    def ReinforcementRole(self)-> "IfcReinforcingBarRoleEnum":
+        """<attribute ReinforcementRole: <enumeration IfcReinforcingBarRoleEnum: (MAIN, SHEAR, LIGATURE, STUD, PUNCHING, EDGE, RING, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("ReinforcementRole")
+
+    @ReinforcementRole.setter
+    def ReinforcementRole(self, value: "IfcReinforcingBarRoleEnum"):
+        return self._set_attribute("ReinforcementRole", value)
+
+    @property
+    def SectionDefinition(self)-> "IfcSectionProperties":
+        """<attribute SectionDefinition: <entity IfcSectionProperties>>"""
+        return self._get_attribute("SectionDefinition")
+
+    @SectionDefinition.setter
+    def SectionDefinition(self, value: "IfcSectionProperties"):
+        return self._set_attribute("SectionDefinition", value)
+
+    @property
+    def CrossSectionReinforcementDefinitions(self)-> list["IfcReinforcementBarProperties"]:
+        """<attribute CrossSectionReinforcementDefinitions: <set [1:?] of <entity IfcReinforcementBarProperties>>>"""
+        return self._get_attribute("CrossSectionReinforcementDefinitions")
+
+    @CrossSectionReinforcementDefinitions.setter
+    def CrossSectionReinforcementDefinitions(self, value: list["IfcReinforcementBarProperties"]):
+        return self._set_attribute("CrossSectionReinforcementDefinitions", value)
@@ -0,0 +1,2 @@
+class IfcSectionTypeEnum(str):
+    items = ['UNIFORM', 'TAPERED']
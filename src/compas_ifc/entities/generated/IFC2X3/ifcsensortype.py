@@ -0,0 +1,17 @@
+from .ifcdistributioncontrolelementtype import IfcDistributionControlElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcsensortypeenum import IfcSensorTypeEnum
+
+class IfcSensorType(IfcDistributionControlElementType):
+    """Wrapper class for IfcSensorType."""
+
+    @property
+    def PredefinedType(self)-> "IfcSensorTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcSensorTypeEnum: (CO2SENSOR, FIRESENSOR, FLOWSENSOR, GASSENSOR, HEATSENSOR, HUMIDITYSENSOR, LIGHTSENSOR, MOISTURESENSOR, MOVEMENTSENSOR, PRESSURESENSOR, SMOKESENSOR, SOUNDSENSOR, TEMPERATURESENSOR, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcSensorTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
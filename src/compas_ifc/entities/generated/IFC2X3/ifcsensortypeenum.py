@@ -0,0 +1,2 @@
+class IfcSensorTypeEnum(str):
+    items = ['CO2SENSOR', 'FIRESENSOR', 'FLOWSENSOR', 'GASSENSOR', 'HEATSENSOR', 'HUMIDITYSENSOR', 'LIGHTSENSOR', 'MOISTURESENSOR', 'MOVEMENTSENSOR', 'PRESSURESENSOR', 'SMOKESENSOR', 'SOUNDSENSOR', 'TEMPERATURESENSOR', 'USERDEFINED', 'NOTDEFINED']
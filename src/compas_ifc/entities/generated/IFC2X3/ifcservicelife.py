@@ -0,0 +1,26 @@
+from .ifccontrol import IfcControl
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcservicelifetypeenum import IfcServiceLifeTypeEnum
+
+class IfcServiceLife(IfcControl):
+    """Wrapper class for IfcServiceLife."""
+
+    @property
+    def ServiceLifeType(self)-> "IfcServiceLifeTypeEnum":
+        """<attribute ServiceLifeType: <enumeration IfcServiceLifeTypeEnum: (ACTUALSERVICELIFE, EXPECTEDSERVICELIFE, OPTIMISTICREFERENCESERVICELIFE, PESSIMISTICREFERENCESERVICELIFE, REFERENCESERVICELIFE)>>"""
+        return self._get_attribute("ServiceLifeType")
+
+    @ServiceLifeType.setter
+    def ServiceLifeType(self, value: "IfcServiceLifeTypeEnum"):
+        return self._set_attribute("ServiceLifeType", value)
+
+    @property
+    def ServiceLifeDuration(self)-> float:
+        """<attribute ServiceLifeDuration: <type IfcTimeMeasure: <real>>>"""
+        return self._get_attribute("ServiceLifeDuration")
+
+    @ServiceLifeDuration.setter
+    def ServiceLifeDuration(self, value: float):
+        return self._set_attribute("ServiceLifeDuration", value)
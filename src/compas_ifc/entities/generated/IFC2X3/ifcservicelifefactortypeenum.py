@@ -0,0 +1,2 @@
+class IfcServiceLifeFactorTypeEnum(str):
+    items = ['A_QUALITYOFCOMPONENTS', 'B_DESIGNLEVEL', 'C_WORKEXECUTIONLEVEL', 'D_INDOORENVIRONMENT', 'E_OUTDOORENVIRONMENT', 'F_INUSECONDITIONS', 'G_MAINTENANCELEVEL', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,2 @@
+class IfcServiceLifeTypeEnum(str):
+    items = ['ACTUALSERVICELIFE', 'EXPECTEDSERVICELIFE', 'OPTIMISTICREFERENCESERVICELIFE', 'PESSIMISTICREFERENCESERVICELIFE', 'REFERENCESERVICELIFE']
@@ -0,0 +1,54 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcproductdefinitionshape import IfcProductDefinitionShape
+    from .ifcshapemodel import IfcShapeModel
+
+class IfcShapeAspect(Base):
+    """Wrapper class for IfcShapeAspect."""
+
+    @property
+    def ShapeRepresentations(self)-> list["IfcShapeModel"]:
+        """<attribute ShapeRepresentations: <list [1:?] of <entity IfcShapeModel>>>"""
+        return self._get_attribute("ShapeRepresentations")
+
+    @ShapeRepresentations.setter
+    def ShapeRepresentations(self, value: list["IfcShapeModel"]):
+        return self._set_attribute("ShapeRepresentations", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def ProductDefinitional(self)-> bool:
+        """<attribute ProductDefinitional: <logical>>"""
+        return self._get_attribute("ProductDefinitional")
+
+    @ProductDefinitional.setter
+    def ProductDefinitional(self, value: bool):
+        return self._set_attribute("ProductDefinitional", value)
+
+    @property
+    def PartOfProductDefinitionShape(self)-> "IfcProductDefinitionShape":
+        """<attribute PartOfProductDefinitionShape: <entity IfcProductDefinitionShape>>"""
+        return self._get_attribute("PartOfProductDefinitionShape")
+
+    @PartOfProductDefinitionShape.setter
+    def PartOfProductDefinitionShape(self, value: "IfcProductDefinitionShape"):
+        return self._set_attribute("PartOfProductDefinitionShape", value)
@@ -0,0 +1,12 @@
+from .ifcrepresentation import IfcRepresentation
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcshapeaspect import IfcShapeAspect
+
+class IfcShapeModel(IfcRepresentation):
+    """Wrapper class for IfcShapeModel."""
+
+    def OfShapeAspect(self)-> list["IfcShapeAspect"]:
+        """<inverse OfShapeAspect: set [0:1] of <entity IfcShapeAspect> for <attribute ShapeRepresentations: <list [1:?] of <entity IfcShapeModel>>>>"""
+        return self._get_inverse_attribute("OfShapeAspect")
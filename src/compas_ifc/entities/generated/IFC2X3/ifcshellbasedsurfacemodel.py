@@ -0,0 +1,19 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcclosedshell import IfcClosedShell
+    from .ifcopenshell import IfcOpenShell
+
+class IfcShellBasedSurfaceModel(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcShellBasedSurfaceModel."""
+
+    @property
+    def SbsmBoundary(self)-> list[Union["IfcClosedShell", "IfcOpenShell"]]:
+        """<attribute SbsmBoundary: <set [1:?] of <select IfcShell: (<entity IfcClosedShell> | <entity IfcOpenShell>)>>>"""
+        return self._get_attribute("SbsmBoundary")
+
+    @SbsmBoundary.setter
+    def SbsmBoundary(self, value: list[Union["IfcClosedShell", "IfcOpenShell"]]):
+        return self._set_attribute("SbsmBoundary", value)
@@ -0,0 +1,54 @@
+from .ifcspatialstructureelement import IfcSpatialStructureElement
+from compas_ifc.entities.extensions import IfcSite as IfcSite_Ext   # type: ignore
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpostaladdress import IfcPostalAddress
+
+class IfcSite(IfcSite_Ext, IfcSpatialStructureElement):
+    """Wrapper class for IfcSite."""
+
+    @property
+    def RefLatitude(self)-> list[int]:
+        """<attribute RefLatitude?: <type IfcCompoundPlaneAngleMeasure: <list [3:4] of <integer>>>>"""
+        return self._get_attribute("RefLatitude")
+
+    @RefLatitude.setter
+    def RefLatitude(self, value: list[int]):
+        return self._set_attribute("RefLatitude", value)
+
+    @property
+    def RefLongitude(self)-> list[int]:
+        """<attribute RefLongitude?: <type IfcCompoundPlaneAngleMeasure: <list [3:4] of <integer>>>>"""
+        return self._get_attribute("RefLongitude")
+
+    @RefLongitude.setter
+    def RefLongitude(self, value: list[int]):
+        return self._set_attribute("RefLongitude", value)
+
+    @property
+    def RefElevation(self)-> float:
+        """<attribute RefElevation?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("RefElevation")
+
+    @RefElevation.setter
+    def RefElevation(self, value: float):
+        return self._set_attribute("RefElevation", value)
+
+    @property
+    def LandTitleNumber(self)-> str:
+        """<attribute LandTitleNumber?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("LandTitleNumber")
+
+    @LandTitleNumber.setter
+    def LandTitleNumber(self, value: str):
+        return self._set_attribute("LandTitleNumber", value)
+
+    @property
+    def SiteAddress(self)-> "IfcPostalAddress":
+        """<attribute SiteAddress?: <entity IfcPostalAddress>>"""
+        return self._get_attribute("SiteAddress")
+
+    @SiteAddress.setter
+    def SiteAddress(self, value: "IfcPostalAddress"):
+        return self._set_attribute("SiteAddress", value)
@@ -0,0 +1,38 @@
+from .ifcnamedunit import IfcNamedUnit
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdimensionalexponents import IfcDimensionalExponents
+    from .ifcsiprefix import IfcSIPrefix
+    from .ifcsiunitname import IfcSIUnitName
+
+class IfcSIUnit(IfcNamedUnit):
+    """Wrapper class for IfcSIUnit."""
+
+    @property
+    def Dimensions(self)-> "IfcDimensionalExponents":
+        """<attribute Dimensions: <entity IfcDimensionalExponents>>"""
+        return self._get_attribute("Dimensions")
+
+    @Dimensions.setter
+    def Dimensions(self, value: "IfcDimensionalExponents"):
+        # Derived attribute
+        pass
+
+    @property
+    def Prefix(self)-> "IfcSIPrefix":
+        """<attribute Prefix?: <enumeration IfcSIPrefix: (EXA, PETA, TERA, GIGA, MEGA, KILO, HECTO, DECA, DECI, CENTI, MILLI, MICRO, NANO, PICO, FEMTO, ATTO)>>"""
+        return self._get_attribute("Prefix")
+
+    @Prefix.setter
+    def Prefix(self, value: "IfcSIPrefix"):
+        return self._set_attribute("Prefix", value)
+
+    @property
+    def Name(self)-> "IfcSIUnitName":
+        """<attribute Name: <enumeration IfcSIUnitName: (AMPERE, BECQUEREL, CANDELA, COULOMB, CUBIC_METRE, DEGREE_CELSIUS, FARAD, GRAM, GRAY, HENRY, HERTZ, JOULE, KELVIN, LUMEN, LUX, METRE, MOLE, NEWTON, OHM, PASCAL, RADIAN, SECOND, SIEMENS, SIEVERT, SQUARE_METRE, STERADIAN, TESLA, VOLT, WATT, WEBER)>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: "IfcSIUnitName"):
+        return self._set_attribute("Name", value)
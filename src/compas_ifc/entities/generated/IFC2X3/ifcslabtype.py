@@ -0,0 +1,17 @@
+from .ifcbuildingelementtype import IfcBuildingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcslabtypeenum import IfcSlabTypeEnum
+
+class IfcSlabType(IfcBuildingElementType):
+    """Wrapper class for IfcSlabType."""
+
+    @property
+    def PredefinedType(self)-> "IfcSlabTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcSlabTypeEnum: (FLOOR, ROOF, LANDING, BASESLAB, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcSlabTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,36 @@
+from .ifcpropertysetdefinition import IfcPropertySetDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcsoundscaleenum import IfcSoundScaleEnum
+    from .ifcsoundvalue import IfcSoundValue
+
+class IfcSoundProperties(IfcPropertySetDefinition):
+    """Wrapper class for IfcSoundProperties."""
+
+    @property
+    def IsAttenuating(self)-> bool:
+        """<attribute IsAttenuating: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("IsAttenuating")
+
+    @IsAttenuating.setter
+    def IsAttenuating(self, value: bool):
+        return self._set_attribute("IsAttenuating", value)
+
+    @property
+    def SoundScale(self)-> "IfcSoundScaleEnum":
+        """<attribute SoundScale?: <enumeration IfcSoundScaleEnum: (DBA, DBB, DBC, NC, NR, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("SoundScale")
+
+    @SoundScale.setter
+    def SoundScale(self, value: "IfcSoundScaleEnum"):
+        return self._set_attribute("SoundScale", value)
+
+    @property
+    def SoundValues(self)-> list["IfcSoundValue"]:
+        """<attribute SoundValues: <list [1:8] of <entity IfcSoundValue>>>"""
+        return self._get_attribute("SoundValues")
+
+    @SoundValues.setter
+    def SoundValues(self, value: list["IfcSoundValue"]):
+        return self._set_attribute("SoundValues", value)
@@ -0,0 +1,2 @@
+class IfcSoundScaleEnum(str):
+    items = ['DBA', 'DBB', 'DBC', 'NC', 'NR', 'USERDEFINED', 'NOTDEFINED']
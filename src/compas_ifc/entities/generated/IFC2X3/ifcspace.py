@@ -0,0 +1,36 @@
+from .ifcspatialstructureelement import IfcSpatialStructureElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcinternalorexternalenum import IfcInternalOrExternalEnum
+    from .ifcrelcoversspaces import IfcRelCoversSpaces
+    from .ifcrelspaceboundary import IfcRelSpaceBoundary
+
+class IfcSpace(IfcSpatialStructureElement):
+    """Wrapper class for IfcSpace."""
+
+    @property
+    def InteriorOrExteriorSpace(self)-> "IfcInternalOrExternalEnum":
+        """<attribute InteriorOrExteriorSpace: <enumeration IfcInternalOrExternalEnum: (INTERNAL, EXTERNAL, NOTDEFINED)>>"""
+        return self._get_attribute("InteriorOrExteriorSpace")
+
+    @InteriorOrExteriorSpace.setter
+    def InteriorOrExteriorSpace(self, value: "IfcInternalOrExternalEnum"):
+        return self._set_attribute("InteriorOrExteriorSpace", value)
+
+    @property
+    def ElevationWithFlooring(self)-> float:
+        """<attribute ElevationWithFlooring?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("ElevationWithFlooring")
+
+    @ElevationWithFlooring.setter
+    def ElevationWithFlooring(self, value: float):
+        return self._set_attribute("ElevationWithFlooring", value)
+
+    def HasCoverings(self)-> list["IfcRelCoversSpaces"]:
+        """<inverse HasCoverings: set [0:?] of <entity IfcRelCoversSpaces> for <attribute RelatedSpace: <entity IfcSpace>>>"""
+        return self._get_inverse_attribute("HasCoverings")
+
+    def BoundedBy(self)-> list["IfcRelSpaceBoundary"]:
+        """<inverse BoundedBy: set [0:?] of <entity IfcRelSpaceBoundary> for <attribute RelatingSpace: <entity IfcSpace>>>"""
+        return self._get_inverse_attribute("BoundedBy")
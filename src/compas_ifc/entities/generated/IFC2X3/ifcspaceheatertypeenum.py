@@ -0,0 +1,2 @@
+class IfcSpaceHeaterTypeEnum(str):
+    items = ['SECTIONALRADIATOR', 'PANELRADIATOR', 'TUBULARRADIATOR', 'CONVECTOR', 'BASEBOARDHEATER', 'FINNEDTUBEUNIT', 'UNITHEATER', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,62 @@
+from .ifccontrol import IfcControl
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelinteractionrequirements import IfcRelInteractionRequirements
+    from .ifcspatialstructureelement import IfcSpatialStructureElement
+
+class IfcSpaceProgram(IfcControl):
+    """Wrapper class for IfcSpaceProgram."""
+
+    @property
+    def SpaceProgramIdentifier(self)-> str:
+        """<attribute SpaceProgramIdentifier: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("SpaceProgramIdentifier")
+
+    @SpaceProgramIdentifier.setter
+    def SpaceProgramIdentifier(self, value: str):
+        return self._set_attribute("SpaceProgramIdentifier", value)
+
+    @property
+    def MaxRequiredArea(self)-> float:
+        """<attribute MaxRequiredArea?: <type IfcAreaMeasure: <real>>>"""
+        return self._get_attribute("MaxRequiredArea")
+
+    @MaxRequiredArea.setter
+    def MaxRequiredArea(self, value: float):
+        return self._set_attribute("MaxRequiredArea", value)
+
+    @property
+    def MinRequiredArea(self)-> float:
+        """<attribute MinRequiredArea?: <type IfcAreaMeasure: <real>>>"""
+        return self._get_attribute("MinRequiredArea")
+
+    @MinRequiredArea.setter
+    def MinRequiredArea(self, value: float):
+        return self._set_attribute("MinRequiredArea", value)
+
+    @property
+    def RequestedLocation(self)-> "IfcSpatialStructureElement":
+        """<attribute RequestedLocation?: <entity IfcSpatialStructureElement>>"""
+        return self._get_attribute("RequestedLocation")
+
+    @RequestedLocation.setter
+    def RequestedLocation(self, value: "IfcSpatialStructureElement"):
+        return self._set_attribute("RequestedLocation", value)
+
+    @property
+    def StandardRequiredArea(self)-> float:
+        """<attribute StandardRequiredArea: <type IfcAreaMeasure: <real>>>"""
+        return self._get_attribute("StandardRequiredArea")
+
+    @StandardRequiredArea.setter
+    def StandardRequiredArea(self, value: float):
+        return self._set_attribute("StandardRequiredArea", value)
+
+    def HasInteractionReqsFrom(self)-> list["IfcRelInteractionRequirements"]:
+        """<inverse HasInteractionReqsFrom: set [0:?] of <entity IfcRelInteractionRequirements> for <attribute RelatedSpaceProgram: <entity IfcSpaceProgram>>>"""
+        return self._get_inverse_attribute("HasInteractionReqsFrom")
+
+    def HasInteractionReqsTo(self)-> list["IfcRelInteractionRequirements"]:
+        """<inverse HasInteractionReqsTo: set [0:?] of <entity IfcRelInteractionRequirements> for <attribute RelatingSpaceProgram: <entity IfcSpaceProgram>>>"""
+        return self._get_inverse_attribute("HasInteractionReqsTo")
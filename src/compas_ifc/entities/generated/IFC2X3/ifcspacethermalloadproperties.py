@@ -0,0 +1,101 @@
+from .ifcpropertysetdefinition import IfcPropertySetDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpropertysourceenum import IfcPropertySourceEnum
+    from .ifcthermalloadsourceenum import IfcThermalLoadSourceEnum
+    from .ifcthermalloadtypeenum import IfcThermalLoadTypeEnum
+    from .ifctimeseries import IfcTimeSeries
+
+class IfcSpaceThermalLoadProperties(IfcPropertySetDefinition):
+    """Wrapper class for IfcSpaceThermalLoadProperties."""
+
+    @property
+    def ApplicableValueRatio(self)-> float:
+        """<attribute ApplicableValueRatio?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("ApplicableValueRatio")
+
+    @ApplicableValueRatio.setter
+    def ApplicableValueRatio(self, value: float):
+        return self._set_attribute("ApplicableValueRatio", value)
+
+    @property
+    def ThermalLoadSource(self)-> "IfcThermalLoadSourceEnum":
+        """<attribute ThermalLoadSource: <enumeration IfcThermalLoadSourceEnum: (PEOPLE, LIGHTING, EQUIPMENT, VENTILATIONINDOORAIR, VENTILATIONOUTSIDEAIR, RECIRCULATEDAIR, EXHAUSTAIR, AIREXCHANGERATE, DRYBULBTEMPERATURE, RELATIVEHUMIDITY, INFILTRATION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("ThermalLoadSource")
+
+    @ThermalLoadSource.setter
+    def ThermalLoadSource(self, value: "IfcThermalLoadSourceEnum"):
+        return self._set_attribute("ThermalLoadSource", value)
+
+    @property
+    def PropertySource(self)-> "IfcPropertySourceEnum":
+        """<attribute PropertySource: <enumeration IfcPropertySourceEnum: (DESIGN, DESIGNMAXIMUM, DESIGNMINIMUM, SIMULATED, ASBUILT, COMMISSIONING, MEASURED, USERDEFINED, NOTKNOWN)>>"""
+        return self._get_attribute("PropertySource")
+
+    @PropertySource.setter
+    def PropertySource(self, value: "IfcPropertySourceEnum"):
+        return self._set_attribute("PropertySource", value)
+
+    @property
+    def SourceDescription(self)-> str:
+        """<attribute SourceDescription?: <type IfcText: <string>>>"""
+        return self._get_attribute("SourceDescription")
+
+    @SourceDescription.setter
+    def SourceDescription(self, value: str):
+        return self._set_attribute("SourceDescription", value)
+
+    @property
+    def MaximumValue(self)-> float:
+        """<attribute MaximumValue: <type IfcPowerMeasure: <real>>>"""
+        return self._get_attribute("MaximumValue")
+
+    @MaximumValue.setter
+    def MaximumValue(self, value: float):
+        return self._set_attribute("MaximumValue", value)
+
+    @property
+    def MinimumValue(self)-> float:
+        """<attribute MinimumValue?: <type IfcPowerMeasure: <real>>>"""
+        return self._get_attribute("MinimumValue")
+
+    @MinimumValue.setter
+    def MinimumValue(self, value: float):
+        return self._set_attribute("MinimumValue", value)
+
+    @property
+    def ThermalLoadTimeSeriesValues(self)-> "IfcTimeSeries":
+        """<attribute ThermalLoadTimeSeriesValues?: <entity IfcTimeSeries>>"""
+        return self._get_attribute("ThermalLoadTimeSeriesValues")
+
+    @ThermalLoadTimeSeriesValues.setter
+    def ThermalLoadTimeSeriesValues(self, value: "IfcTimeSeries"):
+        return self._set_attribute("ThermalLoadTimeSeriesValues", value)
+
+    @property
+    def UserDefinedThermalLoadSource(self)-> str:
+        """<attribute UserDefinedThermalLoadSource?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedThermalLoadSource")
+
+    @UserDefinedThermalLoadSource.setter
+    def UserDefinedThermalLoadSource(self, value: str):
+        return self._set_attribute("UserDefinedThermalLoadSource", value)
+
+    @property
+    def UserDefinedPropertySource(self)-> str:
+        """<attribute UserDefinedPropertySource?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedPropertySource")
+
+    @UserDefinedPropertySource.setter
+    def UserDefinedPropertySource(self, value: str):
+        return self._set_attribute("UserDefinedPropertySource", value)
+
+    @property
+    def ThermalLoadType(self)-> "IfcThermalLoadTypeEnum":
+        """<attribute ThermalLoadType: <enumeration IfcThermalLoadTypeEnum: (SENSIBLE, LATENT, RADIANT, NOTDEFINED)>>"""
+        return self._get_attribute("ThermalLoadType")
+
+    @ThermalLoadType.setter
+    def ThermalLoadType(self, value: "IfcThermalLoadTypeEnum"):
+        return self._set_attribute("ThermalLoadType", value)
@@ -0,0 +1,17 @@
+from .ifcspatialstructureelementtype import IfcSpatialStructureElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcspacetypeenum import IfcSpaceTypeEnum
+
+class IfcSpaceType(IfcSpatialStructureElementType):
+    """Wrapper class for IfcSpaceType."""
+
+    @property
+    def PredefinedType(self)-> "IfcSpaceTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcSpaceTypeEnum: (USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcSpaceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcSpaceTypeEnum(str):
+    items = ['USERDEFINED', 'NOTDEFINED']
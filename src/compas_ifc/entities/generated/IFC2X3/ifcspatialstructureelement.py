@@ -0,0 +1,42 @@
+from .ifcproduct import IfcProduct
+from compas_ifc.entities.extensions import IfcSpatialStructureElement as IfcSpatialStructureElement_Ext   # type: ignore
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelementcompositionenum import IfcElementCompositionEnum
+    from .ifcrelcontainedinspatialstructure import IfcRelContainedInSpatialStructure
+    from .ifcrelreferencedinspatialstructure import IfcRelReferencedInSpatialStructure
+    from .ifcrelservicesbuildings import IfcRelServicesBuildings
+
+class IfcSpatialStructureElement(IfcSpatialStructureElement_Ext, IfcProduct):
+    """Wrapper class for IfcSpatialStructureElement."""
+
+    @property
+    def LongName(self)-> str:
+        """<attribute LongName?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("LongName")
+
+    @LongName.setter
+    def LongName(self, value: str):
+        return self._set_attribute("LongName", value)
+
+    @property
+    def CompositionType(self)-> "IfcElementCompositionEnum":
+        """<attribute CompositionType: <enumeration IfcElementCompositionEnum: (COMPLEX, ELEMENT, PARTIAL)>>"""
+        return self._get_attribute("CompositionType")
+
+    @CompositionType.setter
+    def CompositionType(self, value: "IfcElementCompositionEnum"):
+        return self._set_attribute("CompositionType", value)
+
+    def ReferencesElements(self)-> list["IfcRelReferencedInSpatialStructure"]:
+        """<inverse ReferencesElements: set [0:?] of <entity IfcRelReferencedInSpatialStructure> for <attribute RelatingStructure: <entity IfcSpatialStructureElement>>>"""
+        return self._get_inverse_attribute("ReferencesElements")
+
+    def ServicedBySystems(self)-> list["IfcRelServicesBuildings"]:
+        """<inverse ServicedBySystems: set [0:?] of <entity IfcRelServicesBuildings> for <attribute RelatedBuildings: <set [1:?] of <entity IfcSpatialStructureElement>>>>"""
+        return self._get_inverse_attribute("ServicedBySystems")
+
+    def ContainsElements(self)-> list["IfcRelContainedInSpatialStructure"]:
+        """<inverse ContainsElements: set [0:?] of <entity IfcRelContainedInSpatialStructure> for <attribute RelatingStructure: <entity IfcSpatialStructureElement>>>"""
+        return self._get_inverse_attribute("ContainsElements")
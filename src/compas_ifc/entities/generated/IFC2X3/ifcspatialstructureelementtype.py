@@ -0,0 +1,5 @@
+from .ifcelementtype import IfcElementType
+
+
+class IfcSpatialStructureElementType(IfcElementType):
+    """Wrapper class for IfcSpatialStructureElementType."""
@@ -0,0 +1,2 @@
+class IfcStackTerminalTypeEnum(str):
+    items = ['BIRDCAGE', 'COWL', 'RAINWATERHOPPER', 'USERDEFINED', 'NOTDEFINED']
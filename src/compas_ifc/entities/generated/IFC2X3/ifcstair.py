@@ -0,0 +1,17 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcstairtypeenum import IfcStairTypeEnum
+
+class IfcStair(IfcBuildingElement):
+    """Wrapper class for IfcStair."""
+
+    @property
+    def ShapeType(self)-> "IfcStairTypeEnum":
+        """<attribute ShapeType: <enumeration IfcStairTypeEnum: (STRAIGHT_RUN_STAIR, TWO_STRAIGHT_RUN_STAIR, QUARTER_WINDING_STAIR, QUARTER_TURN_STAIR, HALF_WINDING_STAIR, HALF_TURN_STAIR, TWO_QUARTER_WINDING_STAIR, TWO_QUARTER_TURN_STAIR, THREE_QUARTER_WINDING_STAIR, THREE_QUARTER_TURN_STAIR, SPIRAL_STAIR, DOUBLE_RETURN_STAIR, CURVED_RUN_STAIR, TWO_CURVED_RUN_STAIR, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("ShapeType")
+
+    @ShapeType.setter
+    def ShapeType(self, value: "IfcStairTypeEnum"):
+        return self._set_attribute("ShapeType", value)
@@ -0,0 +1,41 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+
+class IfcStairFlight(IfcBuildingElement):
+    """Wrapper class for IfcStairFlight."""
+
+    @property
+    def NumberOfRiser(self)-> int:
+        """<attribute NumberOfRiser?: <integer>>"""
+        return self._get_attribute("NumberOfRiser")
+
+    @NumberOfRiser.setter
+    def NumberOfRiser(self, value: int):
+        return self._set_attribute("NumberOfRiser", value)
+
+    @property
+    def NumberOfTreads(self)-> int:
+        """<attribute NumberOfTreads?: <integer>>"""
+        return self._get_attribute("NumberOfTreads")
+
+    @NumberOfTreads.setter
+    def NumberOfTreads(self, value: int):
+        return self._set_attribute("NumberOfTreads", value)
+
+    @property
+    def RiserHeight(self)-> float:
+        """<attribute RiserHeight?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("RiserHeight")
+
+    @RiserHeight.setter
+    def RiserHeight(self, value: float):
+        return self._set_attribute("RiserHeight", value)
+
+    @property
+    def TreadLength(self)-> float:
+        """<attribute TreadLength?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("TreadLength")
+
+    @TreadLength.setter
+    def TreadLength(self, value: float):
+        return self._set_attribute("TreadLength", value)
@@ -0,0 +1,26 @@
+from .ifcstructuralactivity import IfcStructuralActivity
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcstructuralreaction import IfcStructuralReaction
+
+class IfcStructuralAction(IfcStructuralActivity):
+    """Wrapper class for IfcStructuralAction."""
+
+    @property
+    def DestabilizingLoad(self)-> bool:
+        """<attribute DestabilizingLoad: <boolean>>"""
+        return self._get_attribute("DestabilizingLoad")
+
+    @DestabilizingLoad.setter
+    def DestabilizingLoad(self, value: bool):
+        return self._set_attribute("DestabilizingLoad", value)
+
+    @property
+    def CausedBy(self)-> "IfcStructuralReaction":
+        """<attribute CausedBy?: <entity IfcStructuralReaction>>"""
+        return self._get_attribute("CausedBy")
+
+    @CausedBy.setter
+    def CausedBy(self, value: "IfcStructuralReaction"):
+        return self._set_attribute("CausedBy", value)
@@ -0,0 +1,32 @@
+from .ifcproduct import IfcProduct
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcglobalorlocalenum import IfcGlobalOrLocalEnum
+    from .ifcrelconnectsstructuralactivity import IfcRelConnectsStructuralActivity
+    from .ifcstructuralload import IfcStructuralLoad
+
+class IfcStructuralActivity(IfcProduct):
+    """Wrapper class for IfcStructuralActivity."""
+
+    @property
+    def AppliedLoad(self)-> "IfcStructuralLoad":
+        """<attribute AppliedLoad: <entity IfcStructuralLoad>>"""
+        return self._get_attribute("AppliedLoad")
+
+    @AppliedLoad.setter
+    def AppliedLoad(self, value: "IfcStructuralLoad"):
+        return self._set_attribute("AppliedLoad", value)
+
+    @property
+    def GlobalOrLocal(self)-> "IfcGlobalOrLocalEnum":
+        """<attribute GlobalOrLocal: <enumeration IfcGlobalOrLocalEnum: (GLOBAL_COORDS, LOCAL_COORDS)>>"""
+        return self._get_attribute("GlobalOrLocal")
+
+    @GlobalOrLocal.setter
+    def GlobalOrLocal(self, value: "IfcGlobalOrLocalEnum"):
+        return self._set_attribute("GlobalOrLocal", value)
+
+    def AssignedToStructuralItem(self)-> list["IfcRelConnectsStructuralActivity"]:
+        """<inverse AssignedToStructuralItem:  [?:?] of <entity IfcRelConnectsStructuralActivity> for <attribute RelatedStructuralActivity: <entity IfcStructuralActivity>>>"""
+        return self._get_inverse_attribute("AssignedToStructuralItem")
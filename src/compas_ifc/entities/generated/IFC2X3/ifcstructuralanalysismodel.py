@@ -0,0 +1,47 @@
+from .ifcsystem import IfcSystem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcanalysismodeltypeenum import IfcAnalysisModelTypeEnum
+    from .ifcaxis2placement3d import IfcAxis2Placement3D
+    from .ifcstructuralloadgroup import IfcStructuralLoadGroup
+    from .ifcstructuralresultgroup import IfcStructuralResultGroup
+
+class IfcStructuralAnalysisModel(IfcSystem):
+    """Wrapper class for IfcStructuralAnalysisModel."""
+
+    @property
+    def PredefinedType(self)-> "IfcAnalysisModelTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcAnalysisModelTypeEnum: (IN_PLANE_LOADING_2D, OUT_PLANE_LOADING_2D, LOADING_3D, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcAnalysisModelTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def OrientationOf2DPlane(self)-> "IfcAxis2Placement3D":
+        """<attribute OrientationOf2DPlane?: <entity IfcAxis2Placement3D>>"""
+        return self._get_attribute("OrientationOf2DPlane")
+
+    @OrientationOf2DPlane.setter
+    def OrientationOf2DPlane(self, value: "IfcAxis2Placement3D"):
+        return self._set_attribute("OrientationOf2DPlane", value)
+
+    @property
+    def LoadedBy(self)-> list["IfcStructuralLoadGroup"]:
+        """<attribute LoadedBy?: <set [1:?] of <entity IfcStructuralLoadGroup>>>"""
+        return self._get_attribute("LoadedBy")
+
+    @LoadedBy.setter
+    def LoadedBy(self, value: list["IfcStructuralLoadGroup"]):
+        return self._set_attribute("LoadedBy", value)
+
+    @property
+    def HasResults(self)-> list["IfcStructuralResultGroup"]:
+        """<attribute HasResults?: <set [1:?] of <entity IfcStructuralResultGroup>>>"""
+        return self._get_attribute("HasResults")
+
+    @HasResults.setter
+    def HasResults(self, value: list["IfcStructuralResultGroup"]):
+        return self._set_attribute("HasResults", value)
@@ -0,0 +1,22 @@
+from .ifcstructuralitem import IfcStructuralItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcboundarycondition import IfcBoundaryCondition
+    from .ifcrelconnectsstructuralmember import IfcRelConnectsStructuralMember
+
+class IfcStructuralConnection(IfcStructuralItem):
+    """Wrapper class for IfcStructuralConnection."""
+
+    @property
+    def AppliedCondition(self)-> "IfcBoundaryCondition":
+        """<attribute AppliedCondition?: <entity IfcBoundaryCondition>>"""
+        return self._get_attribute("AppliedCondition")
+
+    @AppliedCondition.setter
+    def AppliedCondition(self, value: "IfcBoundaryCondition"):
+        return self._set_attribute("AppliedCondition", value)
+
+    def ConnectsStructuralMembers(self)-> list["IfcRelConnectsStructuralMember"]:
+        """<inverse ConnectsStructuralMembers: set [1:?] of <entity IfcRelConnectsStructuralMember> for <attribute RelatedStructuralConnection: <entity IfcStructuralConnection>>>"""
+        return self._get_inverse_attribute("ConnectsStructuralMembers")
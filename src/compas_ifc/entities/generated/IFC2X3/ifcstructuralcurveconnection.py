@@ -0,0 +1,5 @@
+from .ifcstructuralconnection import IfcStructuralConnection
+
+
+class IfcStructuralCurveConnection(IfcStructuralConnection):
+    """Wrapper class for IfcStructuralCurveConnection."""
@@ -0,0 +1,17 @@
+from .ifcstructuralmember import IfcStructuralMember
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcstructuralcurvetypeenum import IfcStructuralCurveTypeEnum
+
+class IfcStructuralCurveMember(IfcStructuralMember):
+    """Wrapper class for IfcStructuralCurveMember."""
+
+    @property
+    def PredefinedType(self)-> "IfcStructuralCurveTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcStructuralCurveTypeEnum: (RIGID_JOINED_MEMBER, PIN_JOINED_MEMBER, CABLE, TENSION_MEMBER, COMPRESSION_MEMBER, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcStructuralCurveTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
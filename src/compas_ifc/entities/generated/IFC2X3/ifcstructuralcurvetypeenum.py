@@ -0,0 +1,2 @@
+class IfcStructuralCurveTypeEnum(str):
+    items = ['RIGID_JOINED_MEMBER', 'PIN_JOINED_MEMBER', 'CABLE', 'TENSION_MEMBER', 'COMPRESSION_MEMBER', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcstructuralaction import IfcStructuralAction
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcprojectedortruelengthenum import IfcProjectedOrTrueLengthEnum
+
+class IfcStructuralLinearAction(IfcStructuralAction):
+    """Wrapper class for IfcStructuralLinearAction."""
+
+    @property
+    def ProjectedOrTrue(self)-> "IfcProjectedOrTrueLengthEnum":
+        """<attribute ProjectedOrTrue: <enumeration IfcProjectedOrTrueLengthEnum: (PROJECTED_LENGTH, TRUE_LENGTH)>>"""
+        return self._get_attribute("ProjectedOrTrue")
+
+    @ProjectedOrTrue.setter
+    def ProjectedOrTrue(self, value: "IfcProjectedOrTrueLengthEnum"):
+        return self._set_attribute("ProjectedOrTrue", value)
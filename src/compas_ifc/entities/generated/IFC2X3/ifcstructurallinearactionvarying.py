@@ -0,0 +1,27 @@
+from .ifcstructurallinearaction import IfcStructuralLinearAction
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcshapeaspect import IfcShapeAspect
+    from .ifcstructuralload import IfcStructuralLoad
+
+class IfcStructuralLinearActionVarying(IfcStructuralLinearAction):
+    """Wrapper class for IfcStructuralLinearActionVarying."""
+
+    @property
+    def VaryingAppliedLoadLocation(self)-> "IfcShapeAspect":
+        """<attribute VaryingAppliedLoadLocation: <entity IfcShapeAspect>>"""
+        return self._get_attribute("VaryingAppliedLoadLocation")
+
+    @VaryingAppliedLoadLocation.setter
+    def VaryingAppliedLoadLocation(self, value: "IfcShapeAspect"):
+        return self._set_attribute("VaryingAppliedLoadLocation", value)
+
+    @property
+    def SubsequentAppliedLoads(self)-> list["IfcStructuralLoad"]:
+        """<attribute SubsequentAppliedLoads: <list [1:?] of <entity IfcStructuralLoad>>>"""
+        return self._get_attribute("SubsequentAppliedLoads")
+
+    @SubsequentAppliedLoads.setter
+    def SubsequentAppliedLoads(self, value: list["IfcStructuralLoad"]):
+        return self._set_attribute("SubsequentAppliedLoads", value)
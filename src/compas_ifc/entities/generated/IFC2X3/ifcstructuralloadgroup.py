@@ -0,0 +1,65 @@
+from .ifcgroup import IfcGroup
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcactionsourcetypeenum import IfcActionSourceTypeEnum
+    from .ifcactiontypeenum import IfcActionTypeEnum
+    from .ifcloadgrouptypeenum import IfcLoadGroupTypeEnum
+    from .ifcstructuralanalysismodel import IfcStructuralAnalysisModel
+    from .ifcstructuralresultgroup import IfcStructuralResultGroup
+
+class IfcStructuralLoadGroup(IfcGroup):
+    """Wrapper class for IfcStructuralLoadGroup."""
+
+    @property
+    def PredefinedType(self)-> "IfcLoadGroupTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcLoadGroupTypeEnum: (LOAD_GROUP, LOAD_CASE, LOAD_COMBINATION_GROUP, LOAD_COMBINATION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcLoadGroupTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def ActionType(self)-> "IfcActionTypeEnum":
+        """<attribute ActionType: <enumeration IfcActionTypeEnum: (PERMANENT_G, VARIABLE_Q, EXTRAORDINARY_A, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("ActionType")
+
+    @ActionType.setter
+    def ActionType(self, value: "IfcActionTypeEnum"):
+        return self._set_attribute("ActionType", value)
+
+    @property
+    def ActionSource(self)-> "IfcActionSourceTypeEnum":
+        """<attribute ActionSource: <enumeration IfcActionSourceTypeEnum: (DEAD_LOAD_G, COMPLETION_G1, LIVE_LOAD_Q, SNOW_S, WIND_W, PRESTRESSING_P, SETTLEMENT_U, TEMPERATURE_T, EARTHQUAKE_E, FIRE, IMPULSE, IMPACT, TRANSPORT, ERECTION, PROPPING, SYSTEM_IMPERFECTION, SHRINKAGE, CREEP, LACK_OF_FIT, BUOYANCY, ICE, CURRENT, WAVE, RAIN, BRAKES, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("ActionSource")
+
+    @ActionSource.setter
+    def ActionSource(self, value: "IfcActionSourceTypeEnum"):
+        return self._set_attribute("ActionSource", value)
+
+    @property
+    def Coefficient(self)-> float:
+        """<attribute Coefficient?: <type IfcRatioMeasure: <real>>>"""
+        return self._get_attribute("Coefficient")
+
+    @Coefficient.setter
+    def Coefficient(self, value: float):
+        return self._set_attribute("Coefficient", value)
+
+    @property
+    def Purpose(self)-> str:
+        """<attribute Purpose?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Purpose")
+
+    @Purpose.setter
+    def Purpose(self, value: str):
+        return self._set_attribute("Purpose", value)
+
+    def SourceOfResultGroup(self)-> list["IfcStructuralResultGroup"]:
+        """<inverse SourceOfResultGroup: set [0:1] of <entity IfcStructuralResultGroup> for <attribute ResultForLoadGroup?: <entity IfcStructuralLoadGroup>>>"""
+        return self._get_inverse_attribute("SourceOfResultGroup")
+
+    def LoadGroupFor(self)-> list["IfcStructuralAnalysisModel"]:
+        """<inverse LoadGroupFor: set [0:?] of <entity IfcStructuralAnalysisModel> for <attribute LoadedBy?: <set [1:?] of <entity IfcStructuralLoadGroup>>>>"""
+        return self._get_inverse_attribute("LoadGroupFor")
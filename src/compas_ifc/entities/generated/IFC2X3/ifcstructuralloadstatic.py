@@ -0,0 +1,5 @@
+from .ifcstructuralload import IfcStructuralLoad
+
+
+class IfcStructuralLoadStatic(IfcStructuralLoad):
+    """Wrapper class for IfcStructuralLoadStatic."""
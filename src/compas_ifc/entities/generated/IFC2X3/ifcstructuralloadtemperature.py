@@ -0,0 +1,32 @@
+from .ifcstructuralloadstatic import IfcStructuralLoadStatic
+
+
+class IfcStructuralLoadTemperature(IfcStructuralLoadStatic):
+    """Wrapper class for IfcStructuralLoadTemperature."""
+
+    @property
+    def DeltaT_Constant(self)-> float:
+        """<attribute DeltaT_Constant?: <type IfcThermodynamicTemperatureMeasure: <real>>>"""
+        return self._get_attribute("DeltaT_Constant")
+
+    @DeltaT_Constant.setter
+    def DeltaT_Constant(self, value: float):
+        return self._set_attribute("DeltaT_Constant", value)
+
+    @property
+    def DeltaT_Y(self)-> float:
+        """<attribute DeltaT_Y?: <type IfcThermodynamicTemperatureMeasure: <real>>>"""
+        return self._get_attribute("DeltaT_Y")
+
+    @DeltaT_Y.setter
+    def DeltaT_Y(self, value: float):
+        return self._set_attribute("DeltaT_Y", value)
+
+    @property
+    def DeltaT_Z(self)-> float:
+        """<attribute DeltaT_Z?: <type IfcThermodynamicTemperatureMeasure: <real>>>"""
+        return self._get_attribute("DeltaT_Z")
+
+    @DeltaT_Z.setter
+    def DeltaT_Z(self, value: float):
+        return self._set_attribute("DeltaT_Z", value)
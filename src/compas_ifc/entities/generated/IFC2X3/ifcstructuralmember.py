@@ -0,0 +1,17 @@
+from .ifcstructuralitem import IfcStructuralItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelconnectsstructuralelement import IfcRelConnectsStructuralElement
+    from .ifcrelconnectsstructuralmember import IfcRelConnectsStructuralMember
+
+class IfcStructuralMember(IfcStructuralItem):
+    """Wrapper class for IfcStructuralMember."""
+
+    def ReferencesElement(self)-> list["IfcRelConnectsStructuralElement"]:
+        """<inverse ReferencesElement: set [0:?] of <entity IfcRelConnectsStructuralElement> for <attribute RelatedStructuralMember: <entity IfcStructuralMember>>>"""
+        return self._get_inverse_attribute("ReferencesElement")
+
+    def ConnectedBy(self)-> list["IfcRelConnectsStructuralMember"]:
+        """<inverse ConnectedBy: set [0:?] of <entity IfcRelConnectsStructuralMember> for <attribute RelatingStructuralMember: <entity IfcStructuralMember>>>"""
+        return self._get_inverse_attribute("ConnectedBy")
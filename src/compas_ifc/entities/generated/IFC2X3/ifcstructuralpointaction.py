@@ -0,0 +1,5 @@
+from .ifcstructuralaction import IfcStructuralAction
+
+
+class IfcStructuralPointAction(IfcStructuralAction):
+    """Wrapper class for IfcStructuralPointAction."""
@@ -0,0 +1,5 @@
+from .ifcstructuralconnection import IfcStructuralConnection
+
+
+class IfcStructuralPointConnection(IfcStructuralConnection):
+    """Wrapper class for IfcStructuralPointConnection."""
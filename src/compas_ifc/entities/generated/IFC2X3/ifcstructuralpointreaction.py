@@ -0,0 +1,5 @@
+from .ifcstructuralreaction import IfcStructuralReaction
+
+
+class IfcStructuralPointReaction(IfcStructuralReaction):
+    """Wrapper class for IfcStructuralPointReaction."""
@@ -0,0 +1,149 @@
+from .ifcgeneralprofileproperties import IfcGeneralProfileProperties
+
+
+class IfcStructuralProfileProperties(IfcGeneralProfileProperties):
+    """Wrapper class for IfcStructuralProfileProperties."""
+
+    @property
+    def TorsionalConstantX(self)-> float:
+        """<attribute TorsionalConstantX?: <type IfcMomentOfInertiaMeasure: <real>>>"""
+        return self._get_attribute("TorsionalConstantX")
+
+    @TorsionalConstantX.setter
+    def TorsionalConstantX(self, value: float):
+        return self._set_attribute("TorsionalConstantX", value)
+
+    @property
+    def MomentOfInertiaYZ(self)-> float:
+        """<attribute MomentOfInertiaYZ?: <type IfcMomentOfInertiaMeasure: <real>>>"""
+        return self._get_attribute("MomentOfInertiaYZ")
+
+    @MomentOfInertiaYZ.setter
+    def MomentOfInertiaYZ(self, value: float):
+        return self._set_attribute("MomentOfInertiaYZ", value)
+
+    @property
+    def MomentOfInertiaY(self)-> float:
+        """<attribute MomentOfInertiaY?: <type IfcMomentOfInertiaMeasure: <real>>>"""
+        return self._get_attribute("MomentOfInertiaY")
+
+    @MomentOfInertiaY.setter
+    def MomentOfInertiaY(self, value: float):
+        return self._set_attribute("MomentOfInertiaY", value)
+
+    @property
+    def MomentOfInertiaZ(self)-> float:
+        """<attribute MomentOfInertiaZ?: <type IfcMomentOfInertiaMeasure: <real>>>"""
+        return self._get_attribute("MomentOfInertiaZ")
+
+    @MomentOfInertiaZ.setter
+    def MomentOfInertiaZ(self, value: float):
+        return self._set_attribute("MomentOfInertiaZ", value)
+
+    @property
+    def WarpingConstant(self)-> float:
+        """<attribute WarpingConstant?: <type IfcWarpingConstantMeasure: <real>>>"""
+        return self._get_attribute("WarpingConstant")
+
+    @WarpingConstant.setter
+    def WarpingConstant(self, value: float):
+        return self._set_attribute("WarpingConstant", value)
+
+    @property
+    def ShearCentreZ(self)-> float:
+        """<attribute ShearCentreZ?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("ShearCentreZ")
+
+    @ShearCentreZ.setter
+    def ShearCentreZ(self, value: float):
+        return self._set_attribute("ShearCentreZ", value)
+
+    @property
+    def ShearCentreY(self)-> float:
+        """<attribute ShearCentreY?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("ShearCentreY")
+
+    @ShearCentreY.setter
+    def ShearCentreY(self, value: float):
+        return self._set_attribute("ShearCentreY", value)
+
+    @property
+    def ShearDeformationAreaZ(self)-> float:
+        """<attribute ShearDeformationAreaZ?: <type IfcAreaMeasure: <real>>>"""
+        return self._get_attribute("ShearDeformationAreaZ")
+
+    @ShearDeformationAreaZ.setter
+    def ShearDeformationAreaZ(self, value: float):
+        return self._set_attribute("ShearDeformationAreaZ", value)
+
+    @property
+    def ShearDeformationAreaY(self)-> float:
+        """<attribute ShearDeformationAreaY?: <type IfcAreaMeasure: <real>>>"""
+        return self._get_attribute("ShearDeformationAreaY")
+
+    @ShearDeformationAreaY.setter
+    def ShearDeformationAreaY(self, value: float):
+        return self._set_attribute("ShearDeformationAreaY", value)
+
+    @property
+    def MaximumSectionModulusY(self)-> float:
+        """<attribute MaximumSectionModulusY?: <type IfcSectionModulusMeasure: <real>>>"""
+        return self._get_attribute("MaximumSectionModulusY")
+
+    @MaximumSectionModulusY.setter
+    def MaximumSectionModulusY(self, value: float):
+        return self._set_attribute("MaximumSectionModulusY", value)
+
+    @property
+    def MinimumSectionModulusY(self)-> float:
+        """<attribute MinimumSectionModulusY?: <type IfcSectionModulusMeasure: <real>>>"""
+        return self._get_attribute("MinimumSectionModulusY")
+
+    @MinimumSectionModulusY.setter
+    def MinimumSectionModulusY(self, value: float):
+        return self._set_attribute("MinimumSectionModulusY", value)
+
+    @property
+    def MaximumSectionModulusZ(self)-> float:
+        """<attribute MaximumSectionModulusZ?: <type IfcSectionModulusMeasure: <real>>>"""
+        return self._get_attribute("MaximumSectionModulusZ")
+
+    @MaximumSectionModulusZ.setter
+    def MaximumSectionModulusZ(self, value: float):
+        return self._set_attribute("MaximumSectionModulusZ", value)
+
+    @property
+    def MinimumSectionModulusZ(self)-> float:
+        """<attribute MinimumSectionModulusZ?: <type IfcSectionModulusMeasure: <real>>>"""
+        return self._get_attribute("MinimumSectionModulusZ")
+
+    @MinimumSectionModulusZ.setter
+    def MinimumSectionModulusZ(self, value: float):
+        return self._set_attribute("MinimumSectionModulusZ", value)
+
+    @property
+    def TorsionalSectionModulus(self)-> float:
+        """<attribute TorsionalSectionModulus?: <type IfcSectionModulusMeasure: <real>>>"""
+        return self._get_attribute("TorsionalSectionModulus")
+
+    @TorsionalSectionModulus.setter
+    def TorsionalSectionModulus(self, value: float):
+        return self._set_attribute("TorsionalSectionModulus", value)
+
+    @property
+    def CentreOfGravityInX(self)-> float:
+        """<attribute CentreOfGravityInX?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("CentreOfGravityInX")
+
+    @CentreOfGravityInX.setter
+    def CentreOfGravityInX(self, value: float):
+        return self._set_attribute("CentreOfGravityInX", value)
+
+    @property
+    def CentreOfGravityInY(self)-> float:
+        """<attribute CentreOfGravityInY?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("CentreOfGravityInY")
+
+    @CentreOfGravityInY.setter
+    def CentreOfGravityInY(self, value: float):
+        return self._set_attribute("CentreOfGravityInY", value)
@@ -0,0 +1,12 @@
+from .ifcstructuralactivity import IfcStructuralActivity
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcstructuralaction import IfcStructuralAction
+
+class IfcStructuralReaction(IfcStructuralActivity):
+    """Wrapper class for IfcStructuralReaction."""
+
+    def Causes(self)-> list["IfcStructuralAction"]:
+        """<inverse Causes: set [0:?] of <entity IfcStructuralAction> for <attribute CausedBy?: <entity IfcStructuralReaction>>>"""
+        return self._get_inverse_attribute("Causes")
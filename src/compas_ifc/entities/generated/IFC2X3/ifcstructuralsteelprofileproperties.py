@@ -0,0 +1,41 @@
+from .ifcstructuralprofileproperties import IfcStructuralProfileProperties
+
+
+class IfcStructuralSteelProfileProperties(IfcStructuralProfileProperties):
+    """Wrapper class for IfcStructuralSteelProfileProperties."""
+
+    @property
+    def ShearAreaZ(self)-> float:
+        """<attribute ShearAreaZ?: <type IfcAreaMeasure: <real>>>"""
+        return self._get_attribute("ShearAreaZ")
+
+    @ShearAreaZ.setter
+    def ShearAreaZ(self, value: float):
+        return self._set_attribute("ShearAreaZ", value)
+
+    @property
+    def ShearAreaY(self)-> float:
+        """<attribute ShearAreaY?: <type IfcAreaMeasure: <real>>>"""
+        return self._get_attribute("ShearAreaY")
+
+    @ShearAreaY.setter
+    def ShearAreaY(self, value: float):
+        return self._set_attribute("ShearAreaY", value)
+
+    @property
+    def PlasticShapeFactorY(self)-> float:
+        """<attribute PlasticShapeFactorY?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("PlasticShapeFactorY")
+
+    @PlasticShapeFactorY.setter
+    def PlasticShapeFactorY(self, value: float):
+        return self._set_attribute("PlasticShapeFactorY", value)
+
+    @property
+    def PlasticShapeFactorZ(self)-> float:
+        """<attribute PlasticShapeFactorZ?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("PlasticShapeFactorZ")
+
+    @PlasticShapeFactorZ.setter
+    def PlasticShapeFactorZ(self, value: float):
+        return self._set_attribute("PlasticShapeFactorZ", value)
@@ -0,0 +1,5 @@
+from .ifcstructuralconnection import IfcStructuralConnection
+
+
+class IfcStructuralSurfaceConnection(IfcStructuralConnection):
+    """Wrapper class for IfcStructuralSurfaceConnection."""
@@ -0,0 +1,26 @@
+from .ifcstructuralmember import IfcStructuralMember
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcstructuralsurfacetypeenum import IfcStructuralSurfaceTypeEnum
+
+class IfcStructuralSurfaceMember(IfcStructuralMember):
+    """Wrapper class for IfcStructuralSurfaceMember."""
+
+    @property
+    def PredefinedType(self)-> "IfcStructuralSurfaceTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcStructuralSurfaceTypeEnum: (BENDING_ELEMENT, MEMBRANE_ELEMENT, SHELL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcStructuralSurfaceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def Thickness(self)-> float:
+        """<attribute Thickness?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Thickness")
+
+    @Thickness.setter
+    def Thickness(self, value: float):
+        return self._set_attribute("Thickness", value)
@@ -0,0 +1,26 @@
+from .ifcstructuralsurfacemember import IfcStructuralSurfaceMember
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcshapeaspect import IfcShapeAspect
+
+class IfcStructuralSurfaceMemberVarying(IfcStructuralSurfaceMember):
+    """Wrapper class for IfcStructuralSurfaceMemberVarying."""
+
+    @property
+    def SubsequentThickness(self)-> list[float]:
+        """<attribute SubsequentThickness: <list [2:?] of <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>>"""
+        return self._get_attribute("SubsequentThickness")
+
+    @SubsequentThickness.setter
+    def SubsequentThickness(self, value: list[float]):
+        return self._set_attribute("SubsequentThickness", value)
+
+    @property
+    def VaryingThicknessLocation(self)-> "IfcShapeAspect":
+        """<attribute VaryingThicknessLocation: <entity IfcShapeAspect>>"""
+        return self._get_attribute("VaryingThicknessLocation")
+
+    @VaryingThicknessLocation.setter
+    def VaryingThicknessLocation(self, value: "IfcShapeAspect"):
+        return self._set_attribute("VaryingThicknessLocation", value)
@@ -0,0 +1,5 @@
+from .ifcdraughtingcallout import IfcDraughtingCallout
+
+
+class IfcStructuredDimensionCallout(IfcDraughtingCallout):
+    """Wrapper class for IfcStructuredDimensionCallout."""
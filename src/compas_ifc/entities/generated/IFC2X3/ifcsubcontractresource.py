@@ -0,0 +1,29 @@
+from .ifcconstructionresource import IfcConstructionResource
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcorganization import IfcOrganization
+    from .ifcperson import IfcPerson
+    from .ifcpersonandorganization import IfcPersonAndOrganization
+
+class IfcSubContractResource(IfcConstructionResource):
+    """Wrapper class for IfcSubContractResource."""
+
+    @property
+    def SubContractor(self)-> Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]:
+        """<attribute SubContractor?: <select IfcActorSelect: (<entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization>)>>"""
+        return self._get_attribute("SubContractor")
+
+    @SubContractor.setter
+    def SubContractor(self, value: Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]):
+        return self._set_attribute("SubContractor", value)
+
+    @property
+    def JobDescription(self)-> str:
+        """<attribute JobDescription?: <type IfcText: <string>>>"""
+        return self._get_attribute("JobDescription")
+
+    @JobDescription.setter
+    def JobDescription(self, value: str):
+        return self._set_attribute("JobDescription", value)
@@ -0,0 +1,45 @@
+from .ifcsweptareasolid import IfcSweptAreaSolid
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccurve import IfcCurve
+    from .ifcsurface import IfcSurface
+
+class IfcSurfaceCurveSweptAreaSolid(IfcSweptAreaSolid):
+    """Wrapper class for IfcSurfaceCurveSweptAreaSolid."""
+
+    @property
+    def Directrix(self)-> "IfcCurve":
+        """<attribute Directrix: <entity IfcCurve>>"""
+        return self._get_attribute("Directrix")
+
+    @Directrix.setter
+    def Directrix(self, value: "IfcCurve"):
+        return self._set_attribute("Directrix", value)
+
+    @property
+    def StartParam(self)-> float:
+        """<attribute StartParam: <type IfcParameterValue: <real>>>"""
+        return self._get_attribute("StartParam")
+
+    @StartParam.setter
+    def StartParam(self, value: float):
+        return self._set_attribute("StartParam", value)
+
+    @property
+    def EndParam(self)-> float:
+        """<attribute EndParam: <type IfcParameterValue: <real>>>"""
+        return self._get_attribute("EndParam")
+
+    @EndParam.setter
+    def EndParam(self, value: float):
+        return self._set_attribute("EndParam", value)
+
+    @property
+    def ReferenceSurface(self)-> "IfcSurface":
+        """<attribute ReferenceSurface: <entity IfcSurface>>"""
+        return self._get_attribute("ReferenceSurface")
+
+    @ReferenceSurface.setter
+    def ReferenceSurface(self, value: "IfcSurface"):
+        return self._set_attribute("ReferenceSurface", value)
@@ -0,0 +1,17 @@
+from .ifcsweptsurface import IfcSweptSurface
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaxis1placement import IfcAxis1Placement
+
+class IfcSurfaceOfRevolution(IfcSweptSurface):
+    """Wrapper class for IfcSurfaceOfRevolution."""
+
+    @property
+    def AxisPosition(self)-> "IfcAxis1Placement":
+        """<attribute AxisPosition: <entity IfcAxis1Placement>>"""
+        return self._get_attribute("AxisPosition")
+
+    @AxisPosition.setter
+    def AxisPosition(self, value: "IfcAxis1Placement"):
+        return self._set_attribute("AxisPosition", value)
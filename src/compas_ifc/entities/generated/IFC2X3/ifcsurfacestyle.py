@@ -0,0 +1,32 @@
+from .ifcpresentationstyle import IfcPresentationStyle
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcexternallydefinedsurfacestyle import IfcExternallyDefinedSurfaceStyle
+    from .ifcsurfaceside import IfcSurfaceSide
+    from .ifcsurfacestylelighting import IfcSurfaceStyleLighting
+    from .ifcsurfacestylerefraction import IfcSurfaceStyleRefraction
+    from .ifcsurfacestyleshading import IfcSurfaceStyleShading
+    from .ifcsurfacestylewithtextures import IfcSurfaceStyleWithTextures
+
+class IfcSurfaceStyle(IfcPresentationStyle):
+    """Wrapper class for IfcSurfaceStyle."""
+
+    @property
+    def Side(self)-> "IfcSurfaceSide":
+        """<attribute Side: <enumeration IfcSurfaceSide: (POSITIVE, NEGATIVE, BOTH)>>"""
+        return self._get_attribute("Side")
+
+    @Side.setter
+    def Side(self, value: "IfcSurfaceSide"):
+        return self._set_attribute("Side", value)
+
+    @property
+    def Styles(self)-> list[Union["IfcSurfaceStyleRefraction", "IfcSurfaceStyleWithTextures", "IfcSurfaceStyleLighting", "IfcExternallyDefinedSurfaceStyle", "IfcSurfaceStyleShading"]]:
+        """<attribute Styles: <set [1:5] of <select IfcSurfaceStyleElementSelect: (<entity IfcExternallyDefinedSurfaceStyle> | <entity IfcSurfaceStyleLighting> | <entity IfcSurfaceStyleRefraction> | <entity IfcSurfaceStyleShading> | <entity IfcSurfaceStyleWithTextures>)>>>"""
+        return self._get_attribute("Styles")
+
+    @Styles.setter
+    def Styles(self, value: list[Union["IfcSurfaceStyleRefraction", "IfcSurfaceStyleWithTextures", "IfcSurfaceStyleLighting", "IfcExternallyDefinedSurfaceStyle", "IfcSurfaceStyleShading"]]):
+        return self._set_attribute("Styles", value)
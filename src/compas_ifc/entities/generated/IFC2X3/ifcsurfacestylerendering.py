@@ -0,0 +1,82 @@
+from .ifcsurfacestyleshading import IfcSurfaceStyleShading
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccolourrgb import IfcColourRgb
+    from .ifcreflectancemethodenum import IfcReflectanceMethodEnum
+
+class IfcSurfaceStyleRendering(IfcSurfaceStyleShading):
+    """Wrapper class for IfcSurfaceStyleRendering."""
+
+    @property
+    def Transparency(self)-> float:
+        """<attribute Transparency?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("Transparency")
+
+    @Transparency.setter
+    def Transparency(self, value: float):
+        return self._set_attribute("Transparency", value)
+
+    @property
+    def DiffuseColour(self)-> Union[float, "IfcColourRgb"]:
+        """<attribute DiffuseColour?: <select IfcColourOrFactor: (<entity IfcColourRgb> | <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>)>>"""
+        return self._get_attribute("DiffuseColour")
+
+    @DiffuseColour.setter
+    def DiffuseColour(self, value: Union[float, "IfcColourRgb"]):
+        return self._set_attribute("DiffuseColour", value)
+
+    @property
+    def TransmissionColour(self)-> Union[float, "IfcColourRgb"]:
+        """<attribute TransmissionColour?: <select IfcColourOrFactor: (<entity IfcColourRgb> | <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>)>>"""
+        return self._get_attribute("TransmissionColour")
+
+    @TransmissionColour.setter
+    def TransmissionColour(self, value: Union[float, "IfcColourRgb"]):
+        return self._set_attribute("TransmissionColour", value)
+
+    @property
+    def DiffuseTransmissionColour(self)-> Union[float, "IfcColourRgb"]:
+        """<attribute DiffuseTransmissionColour?: <select IfcColourOrFactor: (<entity IfcColourRgb> | <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>)>>"""
+        return self._get_attribute("DiffuseTransmissionColour")
+
+    @DiffuseTransmissionColour.setter
+    def DiffuseTransmissionColour(self, value: Union[float, "IfcColourRgb"]):
+        return self._set_attribute("DiffuseTransmissionColour", value)
+
+    @property
+    def ReflectionColour(self)-> Union[float, "IfcColourRgb"]:
+        """<attribute ReflectionColour?: <select IfcColourOrFactor: (<entity IfcColourRgb> | <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>)>>"""
+        return self._get_attribute("ReflectionColour")
+
+    @ReflectionColour.setter
+    def ReflectionColour(self, value: Union[float, "IfcColourRgb"]):
+        return self._set_attribute("ReflectionColour", value)
+
+    @property
+    def SpecularColour(self)-> Union[float, "IfcColourRgb"]:
+        """<attribute SpecularColour?: <select IfcColourOrFactor: (<entity IfcColourRgb> | <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>)>>"""
+        return self._get_attribute("SpecularColour")
+
+    @SpecularColour.setter
+    def SpecularColour(self, value: Union[float, "IfcColourRgb"]):
+        return self._set_attribute("SpecularColour", value)
+
+    @property
+    def SpecularHighlight(self)-> Union[float]:
+        """<attribute SpecularHighlight?: <select IfcSpecularHighlightSelect: (<type IfcSpecularExponent: <real>> | <type IfcSpecularRoughness: <real>>)>>"""
+        return self._get_attribute("SpecularHighlight")
+
+    @SpecularHighlight.setter
+    def SpecularHighlight(self, value: Union[float]):
+        return self._set_attribute("SpecularHighlight", value)
+
+    @property
+    def ReflectanceMethod(self)-> "IfcReflectanceMethodEnum":
+        """<attribute ReflectanceMethod: <enumeration IfcReflectanceMethodEnum: (BLINN, FLAT, GLASS, MATT, METAL, MIRROR, PHONG, PLASTIC, STRAUSS, NOTDEFINED)>>"""
+        return self._get_attribute("ReflectanceMethod")
+
+    @ReflectanceMethod.setter
+    def ReflectanceMethod(self, value: "IfcReflectanceMethodEnum"):
+        return self._set_attribute("ReflectanceMethod", value)
@@ -0,0 +1,17 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccolourrgb import IfcColourRgb
+
+class IfcSurfaceStyleShading(Base):
+    """Wrapper class for IfcSurfaceStyleShading."""
+
+    @property
+    def SurfaceColour(self)-> "IfcColourRgb":
+        """<attribute SurfaceColour: <entity IfcColourRgb>>"""
+        return self._get_attribute("SurfaceColour")
+
+    @SurfaceColour.setter
+    def SurfaceColour(self, value: "IfcColourRgb"):
+        return self._set_attribute("SurfaceColour", value)
@@ -0,0 +1,17 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcsurfacetexture import IfcSurfaceTexture
+
+class IfcSurfaceStyleWithTextures(Base):
+    """Wrapper class for IfcSurfaceStyleWithTextures."""
+
+    @property
+    def Textures(self)-> list["IfcSurfaceTexture"]:
+        """<attribute Textures: <list [1:?] of <entity IfcSurfaceTexture>>>"""
+        return self._get_attribute("Textures")
+
+    @Textures.setter
+    def Textures(self, value: list["IfcSurfaceTexture"]):
+        return self._set_attribute("Textures", value)
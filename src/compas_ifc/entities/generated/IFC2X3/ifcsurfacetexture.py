@@ -0,0 +1,45 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccartesiantransformationoperator2d import IfcCartesianTransformationOperator2D
+    from .ifcsurfacetextureenum import IfcSurfaceTextureEnum
+
+class IfcSurfaceTexture(Base):
+    """Wrapper class for IfcSurfaceTexture."""
+
+    @property
+    def RepeatS(self)-> bool:
+        """<attribute RepeatS: <boolean>>"""
+        return self._get_attribute("RepeatS")
+
+    @RepeatS.setter
+    def RepeatS(self, value: bool):
+        return self._set_attribute("RepeatS", value)
+
+    @property
+    def RepeatT(self)-> bool:
+        """<attribute RepeatT: <boolean>>"""
+        return self._get_attribute("RepeatT")
+
+    @RepeatT.setter
+    def RepeatT(self, value: bool):
+        return self._set_attribute("RepeatT", value)
+
+    @property
+    def TextureType(self)-> "IfcSurfaceTextureEnum":
+        """<attribute TextureType: <enumeration IfcSurfaceTextureEnum: (BUMP, OPACITY, REFLECTION, SELFILLUMINATION, SHININESS, SPECULAR, TEXTURE, TRANSPARENCYMAP, NOTDEFINED)>>"""
+        return self._get_attribute("TextureType")
+
+    @TextureType.setter
+    def TextureType(self, value: "IfcSurfaceTextureEnum"):
+        return self._set_attribute("TextureType", value)
+
+    @property
+    def TextureTransform(self)-> "IfcCartesianTransformationOperator2D":
+        """<attribute TextureTransform?: <entity IfcCartesianTransformationOperator2D>>"""
+        return self._get_attribute("TextureTransform")
+
+    @TextureTransform.setter
+    def TextureTransform(self, value: "IfcCartesianTransformationOperator2D"):
+        return self._set_attribute("TextureTransform", value)
@@ -0,0 +1,2 @@
+class IfcSurfaceTextureEnum(str):
+    items = ['BUMP', 'OPACITY', 'REFLECTION', 'SELFILLUMINATION', 'SHININESS', 'SPECULAR', 'TEXTURE', 'TRANSPARENCYMAP', 'NOTDEFINED']
@@ -0,0 +1,27 @@
+from .ifcsurface import IfcSurface
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaxis2placement3d import IfcAxis2Placement3D
+    from .ifcprofiledef import IfcProfileDef
+
+class IfcSweptSurface(IfcSurface):
+    """Wrapper class for IfcSweptSurface."""
+
+    @property
+    def SweptCurve(self)-> "IfcProfileDef":
+        """<attribute SweptCurve: <entity IfcProfileDef>>"""
+        return self._get_attribute("SweptCurve")
+
+    @SweptCurve.setter
+    def SweptCurve(self, value: "IfcProfileDef"):
+        return self._set_attribute("SweptCurve", value)
+
+    @property
+    def Position(self)-> "IfcAxis2Placement3D":
+        """<attribute Position: <entity IfcAxis2Placement3D>>"""
+        return self._get_attribute("Position")
+
+    @Position.setter
+    def Position(self, value: "IfcAxis2Placement3D"):
+        return self._set_attribute("Position", value)
@@ -0,0 +1,17 @@
+from .ifcflowcontrollertype import IfcFlowControllerType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcswitchingdevicetypeenum import IfcSwitchingDeviceTypeEnum
+
+class IfcSwitchingDeviceType(IfcFlowControllerType):
+    """Wrapper class for IfcSwitchingDeviceType."""
+
+    @property
+    def PredefinedType(self)-> "IfcSwitchingDeviceTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcSwitchingDeviceTypeEnum: (CONTACTOR, EMERGENCYSTOP, STARTER, SWITCHDISCONNECTOR, TOGGLESWITCH, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcSwitchingDeviceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
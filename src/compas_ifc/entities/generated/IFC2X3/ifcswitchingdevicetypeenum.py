@@ -0,0 +1,2 @@
+class IfcSwitchingDeviceTypeEnum(str):
+    items = ['CONTACTOR', 'EMERGENCYSTOP', 'STARTER', 'SWITCHDISCONNECTOR', 'TOGGLESWITCH', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,19 @@
+from .ifcpresentationstyle import IfcPresentationStyle
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccolourspecification import IfcColourSpecification
+    from .ifcpredefinedcolour import IfcPreDefinedColour
+
+class IfcSymbolStyle(IfcPresentationStyle):
+    """Wrapper class for IfcSymbolStyle."""
+
+    @property
+    def StyleOfSymbol(self)-> Union["IfcPreDefinedColour", "IfcColourSpecification"]:
+        """<attribute StyleOfSymbol: <select IfcSymbolStyleSelect: (<select IfcColour: (<entity IfcColourSpecification> | <entity IfcPreDefinedColour>)>)>>"""
+        return self._get_attribute("StyleOfSymbol")
+
+    @StyleOfSymbol.setter
+    def StyleOfSymbol(self, value: Union["IfcPreDefinedColour", "IfcColourSpecification"]):
+        return self._set_attribute("StyleOfSymbol", value)
@@ -0,0 +1,12 @@
+from .ifcgroup import IfcGroup
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelservicesbuildings import IfcRelServicesBuildings
+
+class IfcSystem(IfcGroup):
+    """Wrapper class for IfcSystem."""
+
+    def ServicesBuildings(self)-> list["IfcRelServicesBuildings"]:
+        """<inverse ServicesBuildings: set [0:1] of <entity IfcRelServicesBuildings> for <attribute RelatingSystem: <entity IfcSystem>>>"""
+        return self._get_inverse_attribute("ServicesBuildings")
@@ -0,0 +1,5 @@
+from .ifcfurnishingelementtype import IfcFurnishingElementType
+
+
+class IfcSystemFurnitureElementType(IfcFurnishingElementType):
+    """Wrapper class for IfcSystemFurnitureElementType."""
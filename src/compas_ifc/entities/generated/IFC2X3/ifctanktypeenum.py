@@ -0,0 +1,2 @@
+class IfcTankTypeEnum(str):
+    items = ['PREFORMED', 'SECTIONAL', 'EXPANSION', 'PRESSUREVESSEL', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,50 @@
+from .ifcprocess import IfcProcess
+
+
+class IfcTask(IfcProcess):
+    """Wrapper class for IfcTask."""
+
+    @property
+    def TaskId(self)-> str:
+        """<attribute TaskId: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("TaskId")
+
+    @TaskId.setter
+    def TaskId(self, value: str):
+        return self._set_attribute("TaskId", value)
+
+    @property
+    def Status(self)-> str:
+        """<attribute Status?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Status")
+
+    @Status.setter
+    def Status(self, value: str):
+        return self._set_attribute("Status", value)
+
+    @property
+    def WorkMethod(self)-> str:
+        """<attribute WorkMethod?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("WorkMethod")
+
+    @WorkMethod.setter
+    def WorkMethod(self, value: str):
+        return self._set_attribute("WorkMethod", value)
+
+    @property
+    def IsMilestone(self)-> bool:
+        """<attribute IsMilestone: <boolean>>"""
+        return self._get_attribute("IsMilestone")
+
+    @IsMilestone.setter
+    def IsMilestone(self, value: bool):
+        return self._set_attribute("IsMilestone", value)
+
+    @property
+    def Priority(self)-> int:
+        """<attribute Priority?: <integer>>"""
+        return self._get_attribute("Priority")
+
+    @Priority.setter
+    def Priority(self, value: int):
+        return self._set_attribute("Priority", value)
@@ -0,0 +1,5 @@
+from .ifcreinforcingelement import IfcReinforcingElement
+
+
+class IfcTendonAnchor(IfcReinforcingElement):
+    """Wrapper class for IfcTendonAnchor."""
@@ -0,0 +1,2 @@
+class IfcTendonTypeEnum(str):
+    items = ['STRAND', 'WIRE', 'BAR', 'COATED', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcannotationsymboloccurrence import IfcAnnotationSymbolOccurrence
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcannotationcurveoccurrence import IfcAnnotationCurveOccurrence
+
+class IfcTerminatorSymbol(IfcAnnotationSymbolOccurrence):
+    """Wrapper class for IfcTerminatorSymbol."""
+
+    @property
+    def AnnotatedCurve(self)-> "IfcAnnotationCurveOccurrence":
+        """<attribute AnnotatedCurve: <entity IfcAnnotationCurveOccurrence>>"""
+        return self._get_attribute("AnnotatedCurve")
+
+    @AnnotatedCurve.setter
+    def AnnotatedCurve(self, value: "IfcAnnotationCurveOccurrence"):
+        return self._set_attribute("AnnotatedCurve", value)
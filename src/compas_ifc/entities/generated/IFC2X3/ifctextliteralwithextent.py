@@ -0,0 +1,26 @@
+from .ifctextliteral import IfcTextLiteral
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcplanarextent import IfcPlanarExtent
+
+class IfcTextLiteralWithExtent(IfcTextLiteral):
+    """Wrapper class for IfcTextLiteralWithExtent."""
+
+    @property
+    def Extent(self)-> "IfcPlanarExtent":
+        """<attribute Extent: <entity IfcPlanarExtent>>"""
+        return self._get_attribute("Extent")
+
+    @Extent.setter
+    def Extent(self, value: "IfcPlanarExtent"):
+        return self._set_attribute("Extent", value)
+
+    @property
+    def BoxAlignment(self)-> str:
+        """<attribute BoxAlignment: <type IfcBoxAlignment: <type IfcLabel: <string>>>>"""
+        return self._get_attribute("BoxAlignment")
+
+    @BoxAlignment.setter
+    def BoxAlignment(self, value: str):
+        return self._set_attribute("BoxAlignment", value)
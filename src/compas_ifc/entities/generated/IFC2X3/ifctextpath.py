@@ -0,0 +1,2 @@
+class IfcTextPath(str):
+    items = ['LEFT', 'RIGHT', 'UP', 'DOWN']
@@ -0,0 +1,40 @@
+from .ifcpresentationstyle import IfcPresentationStyle
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcexternallydefinedtextfont import IfcExternallyDefinedTextFont
+    from .ifcpredefinedtextfont import IfcPreDefinedTextFont
+    from .ifctextstylefordefinedfont import IfcTextStyleForDefinedFont
+    from .ifctextstyletextmodel import IfcTextStyleTextModel
+    from .ifctextstylewithboxcharacteristics import IfcTextStyleWithBoxCharacteristics
+
+class IfcTextStyle(IfcPresentationStyle):
+    """Wrapper class for IfcTextStyle."""
+
+    @property
+    def TextCharacterAppearance(self)-> Union["IfcTextStyleForDefinedFont"]:
+        """<attribute TextCharacterAppearance?: <select IfcCharacterStyleSelect: (<entity IfcTextStyleForDefinedFont>)>>"""
+        return self._get_attribute("TextCharacterAppearance")
+
+    @TextCharacterAppearance.setter
+    def TextCharacterAppearance(self, value: Union["IfcTextStyleForDefinedFont"]):
+        return self._set_attribute("TextCharacterAppearance", value)
+
+    @property
+    def TextStyle(self)-> Union["IfcTextStyleTextModel", "IfcTextStyleWithBoxCharacteristics"]:
+        """<attribute TextStyle?: <select IfcTextStyleSelect: (<entity IfcTextStyleTextModel> | <entity IfcTextStyleWithBoxCharacteristics>)>>"""
+        return self._get_attribute("TextStyle")
+
+    @TextStyle.setter
+    def TextStyle(self, value: Union["IfcTextStyleTextModel", "IfcTextStyleWithBoxCharacteristics"]):
+        return self._set_attribute("TextStyle", value)
+
+    @property
+    def TextFontStyle(self)-> Union["IfcPreDefinedTextFont", "IfcExternallyDefinedTextFont"]:
+        """<attribute TextFontStyle: <select IfcTextFontSelect: (<entity IfcExternallyDefinedTextFont> | <entity IfcPreDefinedTextFont>)>>"""
+        return self._get_attribute("TextFontStyle")
+
+    @TextFontStyle.setter
+    def TextFontStyle(self, value: Union["IfcPreDefinedTextFont", "IfcExternallyDefinedTextFont"]):
+        return self._set_attribute("TextFontStyle", value)
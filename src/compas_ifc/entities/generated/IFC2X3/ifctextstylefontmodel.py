@@ -0,0 +1,51 @@
+from .ifcpredefinedtextfont import IfcPreDefinedTextFont
+from typing import Union
+
+
+class IfcTextStyleFontModel(IfcPreDefinedTextFont):
+    """Wrapper class for IfcTextStyleFontModel."""
+
+    @property
+    def FontFamily(self)-> list[str]:
+        """<attribute FontFamily?: <list [1:?] of <type IfcTextFontName: <string>>>>"""
+        return self._get_attribute("FontFamily")
+
+    @FontFamily.setter
+    def FontFamily(self, value: list[str]):
+        return self._set_attribute("FontFamily", value)
+
+    @property
+    def FontStyle(self)-> str:
+        """<attribute FontStyle?: <type IfcFontStyle: <string>>>"""
+        return self._get_attribute("FontStyle")
+
+    @FontStyle.setter
+    def FontStyle(self, value: str):
+        return self._set_attribute("FontStyle", value)
+
+    @property
+    def FontVariant(self)-> str:
+        """<attribute FontVariant?: <type IfcFontVariant: <string>>>"""
+        return self._get_attribute("FontVariant")
+
+    @FontVariant.setter
+    def FontVariant(self, value: str):
+        return self._set_attribute("FontVariant", value)
+
+    @property
+    def FontWeight(self)-> str:
+        """<attribute FontWeight?: <type IfcFontWeight: <string>>>"""
+        return self._get_attribute("FontWeight")
+
+    @FontWeight.setter
+    def FontWeight(self, value: str):
+        return self._set_attribute("FontWeight", value)
+
+    @property
+    def FontSize(self)-> Union[float, str]:
+        """<attribute FontSize: <select IfcSizeSelect: (<type IfcDescriptiveMeasure: <string>> | <type IfcLengthMeasure: <real>> | <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>> | <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>> | <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>> | <type IfcRatioMeasure: <real>>)>>"""
+        return self._get_attribute("FontSize")
+
+    @FontSize.setter
+    def FontSize(self, value: Union[float, str]):
+        return self._set_attribute("FontSize", value)
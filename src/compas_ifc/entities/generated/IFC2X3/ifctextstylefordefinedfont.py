@@ -0,0 +1,28 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccolourspecification import IfcColourSpecification
+    from .ifcpredefinedcolour import IfcPreDefinedColour
+
+class IfcTextStyleForDefinedFont(Base):
+    """Wrapper class for IfcTextStyleForDefinedFont."""
+
+    @property
+    def Colour(self)-> Union["IfcPreDefinedColour", "IfcColourSpecification"]:
+        """<attribute Colour: <select IfcColour: (<entity IfcColourSpecification> | <entity IfcPreDefinedColour>)>>"""
+        return self._get_attribute("Colour")
+
+    @Colour.setter
+    def Colour(self, value: Union["IfcPreDefinedColour", "IfcColourSpecification"]):
+        return self._set_attribute("Colour", value)
+
+    @property
+    def BackgroundColour(self)-> Union["IfcPreDefinedColour", "IfcColourSpecification"]:
+        """<attribute BackgroundColour?: <select IfcColour: (<entity IfcColourSpecification> | <entity IfcPreDefinedColour>)>>"""
+        return self._get_attribute("BackgroundColour")
+
+    @BackgroundColour.setter
+    def BackgroundColour(self, value: Union["IfcPreDefinedColour", "IfcColourSpecification"]):
+        return self._set_attribute("BackgroundColour", value)
@@ -0,0 +1,69 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+
+class IfcTextStyleTextModel(Base):
+    """Wrapper class for IfcTextStyleTextModel."""
+
+    @property
+    def TextIndent(self)-> Union[float, str]:
+        """<attribute TextIndent?: <select IfcSizeSelect: (<type IfcDescriptiveMeasure: <string>> | <type IfcLengthMeasure: <real>> | <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>> | <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>> | <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>> | <type IfcRatioMeasure: <real>>)>>"""
+        return self._get_attribute("TextIndent")
+
+    @TextIndent.setter
+    def TextIndent(self, value: Union[float, str]):
+        return self._set_attribute("TextIndent", value)
+
+    @property
+    def TextAlign(self)-> str:
+        """<attribute TextAlign?: <type IfcTextAlignment: <string>>>"""
+        return self._get_attribute("TextAlign")
+
+    @TextAlign.setter
+    def TextAlign(self, value: str):
+        return self._set_attribute("TextAlign", value)
+
+    @property
+    def TextDecoration(self)-> str:
+        """<attribute TextDecoration?: <type IfcTextDecoration: <string>>>"""
+        return self._get_attribute("TextDecoration")
+
+    @TextDecoration.setter
+    def TextDecoration(self, value: str):
+        return self._set_attribute("TextDecoration", value)
+
+    @property
+    def LetterSpacing(self)-> Union[float, str]:
+        """<attribute LetterSpacing?: <select IfcSizeSelect: (<type IfcDescriptiveMeasure: <string>> | <type IfcLengthMeasure: <real>> | <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>> | <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>> | <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>> | <type IfcRatioMeasure: <real>>)>>"""
+        return self._get_attribute("LetterSpacing")
+
+    @LetterSpacing.setter
+    def LetterSpacing(self, value: Union[float, str]):
+        return self._set_attribute("LetterSpacing", value)
+
+    @property
+    def WordSpacing(self)-> Union[float, str]:
+        """<attribute WordSpacing?: <select IfcSizeSelect: (<type IfcDescriptiveMeasure: <string>> | <type IfcLengthMeasure: <real>> | <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>> | <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>> | <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>> | <type IfcRatioMeasure: <real>>)>>"""
+        return self._get_attribute("WordSpacing")
+
+    @WordSpacing.setter
+    def WordSpacing(self, value: Union[float, str]):
+        return self._set_attribute("WordSpacing", value)
+
+    @property
+    def TextTransform(self)-> str:
+        """<attribute TextTransform?: <type IfcTextTransformation: <string>>>"""
+        return self._get_attribute("TextTransform")
+
+    @TextTransform.setter
+    def TextTransform(self, value: str):
+        return self._set_attribute("TextTransform", value)
+
+    @property
+    def LineHeight(self)-> Union[float, str]:
+        """<attribute LineHeight?: <select IfcSizeSelect: (<type IfcDescriptiveMeasure: <string>> | <type IfcLengthMeasure: <real>> | <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>> | <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>> | <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>> | <type IfcRatioMeasure: <real>>)>>"""
+        return self._get_attribute("LineHeight")
+
+    @LineHeight.setter
+    def LineHeight(self, value: Union[float, str]):
+        return self._set_attribute("LineHeight", value)
@@ -0,0 +1,51 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+
+class IfcTextStyleWithBoxCharacteristics(Base):
+    """Wrapper class for IfcTextStyleWithBoxCharacteristics."""
+
+    @property
+    def BoxHeight(self)-> float:
+        """<attribute BoxHeight?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("BoxHeight")
+
+    @BoxHeight.setter
+    def BoxHeight(self, value: float):
+        return self._set_attribute("BoxHeight", value)
+
+    @property
+    def BoxWidth(self)-> float:
+        """<attribute BoxWidth?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("BoxWidth")
+
+    @BoxWidth.setter
+    def BoxWidth(self, value: float):
+        return self._set_attribute("BoxWidth", value)
+
+    @property
+    def BoxSlantAngle(self)-> float:
+        """<attribute BoxSlantAngle?: <type IfcPlaneAngleMeasure: <real>>>"""
+        return self._get_attribute("BoxSlantAngle")
+
+    @BoxSlantAngle.setter
+    def BoxSlantAngle(self, value: float):
+        return self._set_attribute("BoxSlantAngle", value)
+
+    @property
+    def BoxRotateAngle(self)-> float:
+        """<attribute BoxRotateAngle?: <type IfcPlaneAngleMeasure: <real>>>"""
+        return self._get_attribute("BoxRotateAngle")
+
+    @BoxRotateAngle.setter
+    def BoxRotateAngle(self, value: float):
+        return self._set_attribute("BoxRotateAngle", value)
+
+    @property
+    def CharacterSpacing(self)-> Union[float, str]:
+        """<attribute CharacterSpacing?: <select IfcSizeSelect: (<type IfcDescriptiveMeasure: <string>> | <type IfcLengthMeasure: <real>> | <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>> | <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>> | <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>> | <type IfcRatioMeasure: <real>>)>>"""
+        return self._get_attribute("CharacterSpacing")
+
+    @CharacterSpacing.setter
+    def CharacterSpacing(self, value: Union[float, str]):
+        return self._set_attribute("CharacterSpacing", value)
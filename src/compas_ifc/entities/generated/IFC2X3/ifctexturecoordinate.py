@@ -0,0 +1,12 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcannotationsurface import IfcAnnotationSurface
+
+class IfcTextureCoordinate(Base):
+    """Wrapper class for IfcTextureCoordinate."""
+
+    def AnnotatedSurface(self)-> list["IfcAnnotationSurface"]:
+        """<inverse AnnotatedSurface: set [1:1] of <entity IfcAnnotationSurface> for <attribute TextureCoordinates?: <entity IfcTextureCoordinate>>>"""
+        return self._get_inverse_attribute("AnnotatedSurface")
@@ -0,0 +1,24 @@
+from .ifctexturecoordinate import IfcTextureCoordinate
+from typing import Union
+
+
+class IfcTextureCoordinateGenerator(IfcTextureCoordinate):
+    """Wrapper class for IfcTextureCoordinateGenerator."""
+
+    @property
+    def Mode(self)-> str:
+        """<attribute Mode: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Mode")
+
+    @Mode.setter
+    def Mode(self, value: str):
+        return self._set_attribute("Mode", value)
+
+    @property
+    def Parameter(self)-> list[Union[float, int, bool, str]]:
+        """<attribute Parameter: <list [1:?] of <select IfcSimpleValue: (<type IfcBoolean: <boolean>> | <type IfcIdentifier: <string>> | <type IfcInteger: <integer>> | <type IfcLabel: <string>> | <type IfcLogical: <logical>> | <type IfcReal: <real>> | <type IfcText: <string>>)>>>"""
+        return self._get_attribute("Parameter")
+
+    @Parameter.setter
+    def Parameter(self, value: list[Union[float, int, bool, str]]):
+        return self._set_attribute("Parameter", value)
@@ -0,0 +1,17 @@
+from .ifctexturecoordinate import IfcTextureCoordinate
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcvertexbasedtexturemap import IfcVertexBasedTextureMap
+
+class IfcTextureMap(IfcTextureCoordinate):
+    """Wrapper class for IfcTextureMap."""
+
+    @property
+    def TextureMaps(self)-> list["IfcVertexBasedTextureMap"]:
+        """<attribute TextureMaps: <set [1:?] of <entity IfcVertexBasedTextureMap>>>"""
+        return self._get_attribute("TextureMaps")
+
+    @TextureMaps.setter
+    def TextureMaps(self, value: list["IfcVertexBasedTextureMap"]):
+        return self._set_attribute("TextureMaps", value)
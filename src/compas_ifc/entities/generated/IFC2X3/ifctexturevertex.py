@@ -0,0 +1,14 @@
+from compas_ifc.entities.base import Base
+
+
+class IfcTextureVertex(Base):
+    """Wrapper class for IfcTextureVertex."""
+
+    @property
+    def Coordinates(self)-> list[float]:
+        """<attribute Coordinates: <list [2:2] of <type IfcParameterValue: <real>>>>"""
+        return self._get_attribute("Coordinates")
+
+    @Coordinates.setter
+    def Coordinates(self, value: list[float]):
+        return self._set_attribute("Coordinates", value)
@@ -0,0 +1,2 @@
+class IfcThermalLoadSourceEnum(str):
+    items = ['PEOPLE', 'LIGHTING', 'EQUIPMENT', 'VENTILATIONINDOORAIR', 'VENTILATIONOUTSIDEAIR', 'RECIRCULATEDAIR', 'EXHAUSTAIR', 'AIREXCHANGERATE', 'DRYBULBTEMPERATURE', 'RELATIVEHUMIDITY', 'INFILTRATION', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,2 @@
+class IfcThermalLoadTypeEnum(str):
+    items = ['SENSIBLE', 'LATENT', 'RADIANT', 'NOTDEFINED']
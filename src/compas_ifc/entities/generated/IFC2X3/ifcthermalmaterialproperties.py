@@ -0,0 +1,41 @@
+from .ifcmaterialproperties import IfcMaterialProperties
+
+
+class IfcThermalMaterialProperties(IfcMaterialProperties):
+    """Wrapper class for IfcThermalMaterialProperties."""
+
+    @property
+    def SpecificHeatCapacity(self)-> float:
+        """<attribute SpecificHeatCapacity?: <type IfcSpecificHeatCapacityMeasure: <real>>>"""
+        return self._get_attribute("SpecificHeatCapacity")
+
+    @SpecificHeatCapacity.setter
+    def SpecificHeatCapacity(self, value: float):
+        return self._set_attribute("SpecificHeatCapacity", value)
+
+    @property
+    def BoilingPoint(self)-> float:
+        """<attribute BoilingPoint?: <type IfcThermodynamicTemperatureMeasure: <real>>>"""
+        return self._get_attribute("BoilingPoint")
+
+    @BoilingPoint.setter
+    def BoilingPoint(self, value: float):
+        return self._set_attribute("BoilingPoint", value)
+
+    @property
+    def FreezingPoint(self)-> float:
+        """<attribute FreezingPoint?: <type IfcThermodynamicTemperatureMeasure: <real>>>"""
+        return self._get_attribute("FreezingPoint")
+
+    @FreezingPoint.setter
+    def FreezingPoint(self, value: float):
+        return self._set_attribute("FreezingPoint", value)
+
+    @property
+    def ThermalConductivity(self)-> float:
+        """<attribute ThermalConductivity?: <type IfcThermalConductivityMeasure: <real>>>"""
+        return self._get_attribute("ThermalConductivity")
+
+    @ThermalConductivity.setter
+    def ThermalConductivity(self, value: float):
+        return self._set_attribute("ThermalConductivity", value)
@@ -0,0 +1,93 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccalendardate import IfcCalendarDate
+    from .ifcdataoriginenum import IfcDataOriginEnum
+    from .ifcdateandtime import IfcDateAndTime
+    from .ifcderivedunit import IfcDerivedUnit
+    from .ifclocaltime import IfcLocalTime
+    from .ifcmonetaryunit import IfcMonetaryUnit
+    from .ifcnamedunit import IfcNamedUnit
+    from .ifctimeseriesdatatypeenum import IfcTimeSeriesDataTypeEnum
+    from .ifctimeseriesreferencerelationship import IfcTimeSeriesReferenceRelationship
+
+class IfcTimeSeries(Base):
+    """Wrapper class for IfcTimeSeries."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def StartTime(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute StartTime: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("StartTime")
+
+    @StartTime.setter
+    def StartTime(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("StartTime", value)
+
+    @property
+    def EndTime(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute EndTime: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("EndTime")
+
+    @EndTime.setter
+    def EndTime(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("EndTime", value)
+
+    @property
+    def TimeSeriesDataType(self)-> "IfcTimeSeriesDataTypeEnum":
+        """<attribute TimeSeriesDataType: <enumeration IfcTimeSeriesDataTypeEnum: (CONTINUOUS, DISCRETE, DISCRETEBINARY, PIECEWISEBINARY, PIECEWISECONSTANT, PIECEWISECONTINUOUS, NOTDEFINED)>>"""
+        return self._get_attribute("TimeSeriesDataType")
+
+    @TimeSeriesDataType.setter
+    def TimeSeriesDataType(self, value: "IfcTimeSeriesDataTypeEnum"):
+        return self._set_attribute("TimeSeriesDataType", value)
+
+    @property
+    def DataOrigin(self)-> "IfcDataOriginEnum":
+        """<attribute DataOrigin: <enumeration IfcDataOriginEnum: (MEASURED, PREDICTED, SIMULATED, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("DataOrigin")
+
+    @DataOrigin.setter
+    def DataOrigin(self, value: "IfcDataOriginEnum"):
+        return self._set_attribute("DataOrigin", value)
+
+    @property
+    def UserDefinedDataOrigin(self)-> str:
+        """<attribute UserDefinedDataOrigin?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedDataOrigin")
+
+    @UserDefinedDataOrigin.setter
+    def UserDefinedDataOrigin(self, value: str):
+        return self._set_attribute("UserDefinedDataOrigin", value)
+
+    @property
+    def Unit(self)-> Union["IfcDerivedUnit", "IfcNamedUnit", "IfcMonetaryUnit"]:
+        """<attribute Unit?: <select IfcUnit: (<entity IfcDerivedUnit> | <entity IfcMonetaryUnit> | <entity IfcNamedUnit>)>>"""
+        return self._get_attribute("Unit")
+
+    @Unit.setter
+    def Unit(self, value: Union["IfcDerivedUnit", "IfcNamedUnit", "IfcMonetaryUnit"]):
+        return self._set_attribute("Unit", value)
+
+    def DocumentedBy(self)-> list["IfcTimeSeriesReferenceRelationship"]:
+        """<inverse DocumentedBy: set [0:1] of <entity IfcTimeSeriesReferenceRelationship> for <attribute ReferencedTimeSeries: <entity IfcTimeSeries>>>"""
+        return self._get_inverse_attribute("DocumentedBy")
@@ -0,0 +1,29 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdocumentinformation import IfcDocumentInformation
+    from .ifcdocumentreference import IfcDocumentReference
+    from .ifctimeseries import IfcTimeSeries
+
+class IfcTimeSeriesReferenceRelationship(Base):
+    """Wrapper class for IfcTimeSeriesReferenceRelationship."""
+
+    @property
+    def ReferencedTimeSeries(self)-> "IfcTimeSeries":
+        """<attribute ReferencedTimeSeries: <entity IfcTimeSeries>>"""
+        return self._get_attribute("ReferencedTimeSeries")
+
+    @ReferencedTimeSeries.setter
+    def ReferencedTimeSeries(self, value: "IfcTimeSeries"):
+        return self._set_attribute("ReferencedTimeSeries", value)
+
+    @property
+    def TimeSeriesReferences(self)-> list[Union["IfcDocumentInformation", "IfcDocumentReference"]]:
+        """<attribute TimeSeriesReferences: <set [1:?] of <select IfcDocumentSelect: (<entity IfcDocumentInformation> | <entity IfcDocumentReference>)>>>"""
+        return self._get_attribute("TimeSeriesReferences")
+
+    @TimeSeriesReferences.setter
+    def TimeSeriesReferences(self, value: list[Union["IfcDocumentInformation", "IfcDocumentReference"]]):
+        return self._set_attribute("TimeSeriesReferences", value)
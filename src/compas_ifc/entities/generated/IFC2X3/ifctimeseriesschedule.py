@@ -0,0 +1,40 @@
+from .ifccontrol import IfcControl
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccalendardate import IfcCalendarDate
+    from .ifcdateandtime import IfcDateAndTime
+    from .ifclocaltime import IfcLocalTime
+    from .ifctimeseries import IfcTimeSeries
+    from .ifctimeseriesscheduletypeenum import IfcTimeSeriesScheduleTypeEnum
+
+class IfcTimeSeriesSchedule(IfcControl):
+    """Wrapper class for IfcTimeSeriesSchedule."""
+
+    @property
+    def ApplicableDates(self)-> list[Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]]:
+        """<attribute ApplicableDates?: <list [1:?] of <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>>"""
+        return self._get_attribute("ApplicableDates")
+
+    @ApplicableDates.setter
+    def ApplicableDates(self, value: list[Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]]):
+        return self._set_attribute("ApplicableDates", value)
+
+    @property
+    def TimeSeriesScheduleType(self)-> "IfcTimeSeriesScheduleTypeEnum":
+        """<attribute TimeSeriesScheduleType: <enumeration IfcTimeSeriesScheduleTypeEnum: (ANNUAL, MONTHLY, WEEKLY, DAILY, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("TimeSeriesScheduleType")
+
+    @TimeSeriesScheduleType.setter
+    def TimeSeriesScheduleType(self, value: "IfcTimeSeriesScheduleTypeEnum"):
+        return self._set_attribute("TimeSeriesScheduleType", value)
+
+    @property
+    def TimeSeries(self)-> "IfcTimeSeries":
+        """<attribute TimeSeries: <entity IfcTimeSeries>>"""
+        return self._get_attribute("TimeSeries")
+
+    @TimeSeries.setter
+    def TimeSeries(self, value: "IfcTimeSeries"):
+        return self._set_attribute("TimeSeries", value)
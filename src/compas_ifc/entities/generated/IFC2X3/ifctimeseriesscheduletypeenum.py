@@ -0,0 +1,2 @@
+class IfcTimeSeriesScheduleTypeEnum(str):
+    items = ['ANNUAL', 'MONTHLY', 'WEEKLY', 'DAILY', 'USERDEFINED', 'NOTDEFINED']
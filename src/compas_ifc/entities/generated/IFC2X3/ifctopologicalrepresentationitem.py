@@ -0,0 +1,5 @@
+from .ifcrepresentationitem import IfcRepresentationItem
+
+
+class IfcTopologicalRepresentationItem(IfcRepresentationItem):
+    """Wrapper class for IfcTopologicalRepresentationItem."""
@@ -0,0 +1,5 @@
+from .ifcshapemodel import IfcShapeModel
+
+
+class IfcTopologyRepresentation(IfcShapeModel):
+    """Wrapper class for IfcTopologyRepresentation."""
@@ -0,0 +1,2 @@
+class IfcTransformerTypeEnum(str):
+    items = ['CURRENT', 'FREQUENCY', 'VOLTAGE', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,2 @@
+class IfcTransitionCode(str):
+    items = ['DISCONTINUOUS', 'CONTINUOUS', 'CONTSAMEGRADIENT', 'CONTSAMEGRADIENTSAMECURVATURE']
@@ -0,0 +1,35 @@
+from .ifcelement import IfcElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctransportelementtypeenum import IfcTransportElementTypeEnum
+
+class IfcTransportElement(IfcElement):
+    """Wrapper class for IfcTransportElement."""
+
+    @property
+    def OperationType(self)-> "IfcTransportElementTypeEnum":
+        """<attribute OperationType?: <enumeration IfcTransportElementTypeEnum: (ELEVATOR, ESCALATOR, MOVINGWALKWAY, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("OperationType")
+
+    @OperationType.setter
+    def OperationType(self, value: "IfcTransportElementTypeEnum"):
+        return self._set_attribute("OperationType", value)
+
+    @property
+    def CapacityByWeight(self)-> float:
+        """<attribute CapacityByWeight?: <type IfcMassMeasure: <real>>>"""
+        return self._get_attribute("CapacityByWeight")
+
+    @CapacityByWeight.setter
+    def CapacityByWeight(self, value: float):
+        return self._set_attribute("CapacityByWeight", value)
+
+    @property
+    def CapacityByNumber(self)-> float:
+        """<attribute CapacityByNumber?: <type IfcCountMeasure: <number>>>"""
+        return self._get_attribute("CapacityByNumber")
+
+    @CapacityByNumber.setter
+    def CapacityByNumber(self, value: float):
+        return self._set_attribute("CapacityByNumber", value)
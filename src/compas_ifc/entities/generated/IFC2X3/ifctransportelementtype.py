@@ -0,0 +1,17 @@
+from .ifcelementtype import IfcElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctransportelementtypeenum import IfcTransportElementTypeEnum
+
+class IfcTransportElementType(IfcElementType):
+    """Wrapper class for IfcTransportElementType."""
+
+    @property
+    def PredefinedType(self)-> "IfcTransportElementTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcTransportElementTypeEnum: (ELEVATOR, ESCALATOR, MOVINGWALKWAY, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcTransportElementTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
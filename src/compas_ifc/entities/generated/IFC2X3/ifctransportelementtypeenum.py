@@ -0,0 +1,2 @@
+class IfcTransportElementTypeEnum(str):
+    items = ['ELEVATOR', 'ESCALATOR', 'MOVINGWALKWAY', 'USERDEFINED', 'NOTDEFINED']
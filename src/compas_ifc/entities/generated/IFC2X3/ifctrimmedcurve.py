@@ -0,0 +1,56 @@
+from .ifcboundedcurve import IfcBoundedCurve
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccartesianpoint import IfcCartesianPoint
+    from .ifccurve import IfcCurve
+    from .ifctrimmingpreference import IfcTrimmingPreference
+
+class IfcTrimmedCurve(IfcBoundedCurve):
+    """Wrapper class for IfcTrimmedCurve."""
+
+    @property
+    def BasisCurve(self)-> "IfcCurve":
+        """<attribute BasisCurve: <entity IfcCurve>>"""
+        return self._get_attribute("BasisCurve")
+
+    @BasisCurve.setter
+    def BasisCurve(self, value: "IfcCurve"):
+        return self._set_attribute("BasisCurve", value)
+
+    @property
+    def Trim1(self)-> list[Union["IfcCartesianPoint", float]]:
+        """<attribute Trim1: <set [1:2] of <select IfcTrimmingSelect: (<entity IfcCartesianPoint> | <type IfcParameterValue: <real>>)>>>"""
+        return self._get_attribute("Trim1")
+
+    @Trim1.setter
+    def Trim1(self, value: list[Union["IfcCartesianPoint", float]]):
+        return self._set_attribute("Trim1", value)
+
+    @property
+    def Trim2(self)-> list[Union["IfcCartesianPoint", float]]:
+        """<attribute Trim2: <set [1:2] of <select IfcTrimmingSelect: (<entity IfcCartesianPoint> | <type IfcParameterValue: <real>>)>>>"""
+        return self._get_attribute("Trim2")
+
+    @Trim2.setter
+    def Trim2(self, value: list[Union["IfcCartesianPoint", float]]):
+        return self._set_attribute("Trim2", value)
+
+    @property
+    def SenseAgreement(self)-> bool:
+        """<attribute SenseAgreement: <boolean>>"""
+        return self._get_attribute("SenseAgreement")
+
+    @SenseAgreement.setter
+    def SenseAgreement(self, value: bool):
+        return self._set_attribute("SenseAgreement", value)
+
+    @property
+    def MasterRepresentation(self)-> "IfcTrimmingPreference":
+        """<attribute MasterRepresentation: <enumeration IfcTrimmingPreference: (CARTESIAN, PARAMETER, UNSPECIFIED)>>"""
+        return self._get_attribute("MasterRepresentation")
+
+    @MasterRepresentation.setter
+    def MasterRepresentation(self, value: "IfcTrimmingPreference"):
+        return self._set_attribute("MasterRepresentation", value)
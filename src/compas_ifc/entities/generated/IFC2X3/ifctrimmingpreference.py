@@ -0,0 +1,2 @@
+class IfcTrimmingPreference(str):
+    items = ['CARTESIAN', 'PARAMETER', 'UNSPECIFIED']
@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevicetype import IfcEnergyConversionDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctubebundletypeenum import IfcTubeBundleTypeEnum
+
+class IfcTubeBundleType(IfcEnergyConversionDeviceType):
+    """Wrapper class for IfcTubeBundleType."""
+
+    @property
+    def PredefinedType(self)-> "IfcTubeBundleTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcTubeBundleTypeEnum: (FINNED, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcTubeBundleTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
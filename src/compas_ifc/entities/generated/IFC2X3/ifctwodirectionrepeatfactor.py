@@ -0,0 +1,17 @@
+from .ifconedirectionrepeatfactor import IfcOneDirectionRepeatFactor
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcvector import IfcVector
+
+class IfcTwoDirectionRepeatFactor(IfcOneDirectionRepeatFactor):
+    """Wrapper class for IfcTwoDirectionRepeatFactor."""
+
+    @property
+    def SecondRepeatFactor(self)-> "IfcVector":
+        """<attribute SecondRepeatFactor: <entity IfcVector>>"""
+        return self._get_attribute("SecondRepeatFactor")
+
+    @SecondRepeatFactor.setter
+    def SecondRepeatFactor(self, value: "IfcVector"):
+        return self._set_attribute("SecondRepeatFactor", value)
@@ -0,0 +1,26 @@
+from .ifctypeobject import IfcTypeObject
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrepresentationmap import IfcRepresentationMap
+
+class IfcTypeProduct(IfcTypeObject):
+    """Wrapper class for IfcTypeProduct."""
+
+    @property
+    def RepresentationMaps(self)-> list["IfcRepresentationMap"]:
+        """<attribute RepresentationMaps?: <list [1:?] of <entity IfcRepresentationMap>>>"""
+        return self._get_attribute("RepresentationMaps")
+
+    @RepresentationMaps.setter
+    def RepresentationMaps(self, value: list["IfcRepresentationMap"]):
+        return self._set_attribute("RepresentationMaps", value)
+
+    @property
+    def Tag(self)-> str:
+        """<attribute Tag?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Tag")
+
+    @Tag.setter
+    def Tag(self, value: str):
+        return self._set_attribute("Tag", value)
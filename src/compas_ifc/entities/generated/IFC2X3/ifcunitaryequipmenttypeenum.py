@@ -0,0 +1,2 @@
+class IfcUnitaryEquipmentTypeEnum(str):
+    items = ['AIRHANDLER', 'AIRCONDITIONINGUNIT', 'SPLITSYSTEM', 'ROOFTOPUNIT', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,20 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcderivedunit import IfcDerivedUnit
+    from .ifcmonetaryunit import IfcMonetaryUnit
+    from .ifcnamedunit import IfcNamedUnit
+
+class IfcUnitAssignment(Base):
+    """Wrapper class for IfcUnitAssignment."""
+
+    @property
+    def Units(self)-> list[Union["IfcDerivedUnit", "IfcNamedUnit", "IfcMonetaryUnit"]]:
+        """<attribute Units: <set [1:?] of <select IfcUnit: (<entity IfcDerivedUnit> | <entity IfcMonetaryUnit> | <entity IfcNamedUnit>)>>>"""
+        return self._get_attribute("Units")
+
+    @Units.setter
+    def Units(self, value: list[Union["IfcDerivedUnit", "IfcNamedUnit", "IfcMonetaryUnit"]]):
+        return self._set_attribute("Units", value)
@@ -0,0 +1,5 @@
+from .ifctopologicalrepresentationitem import IfcTopologicalRepresentationItem
+
+
+class IfcVertex(IfcTopologicalRepresentationItem):
+    """Wrapper class for IfcVertex."""
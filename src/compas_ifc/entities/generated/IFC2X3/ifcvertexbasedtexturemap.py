@@ -0,0 +1,27 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccartesianpoint import IfcCartesianPoint
+    from .ifctexturevertex import IfcTextureVertex
+
+class IfcVertexBasedTextureMap(Base):
+    """Wrapper class for IfcVertexBasedTextureMap."""
+
+    @property
+    def TextureVertices(self)-> list["IfcTextureVertex"]:
+        """<attribute TextureVertices: <list [3:?] of <entity IfcTextureVertex>>>"""
+        return self._get_attribute("TextureVertices")
+
+    @TextureVertices.setter
+    def TextureVertices(self, value: list["IfcTextureVertex"]):
+        return self._set_attribute("TextureVertices", value)
+
+    @property
+    def TexturePoints(self)-> list["IfcCartesianPoint"]:
+        """<attribute TexturePoints: <list [3:?] of <entity IfcCartesianPoint>>>"""
+        return self._get_attribute("TexturePoints")
+
+    @TexturePoints.setter
+    def TexturePoints(self, value: list["IfcCartesianPoint"]):
+        return self._set_attribute("TexturePoints", value)
@@ -0,0 +1,17 @@
+from .ifcloop import IfcLoop
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcvertex import IfcVertex
+
+class IfcVertexLoop(IfcLoop):
+    """Wrapper class for IfcVertexLoop."""
+
+    @property
+    def LoopVertex(self)-> "IfcVertex":
+        """<attribute LoopVertex: <entity IfcVertex>>"""
+        return self._get_attribute("LoopVertex")
+
+    @LoopVertex.setter
+    def LoopVertex(self, value: "IfcVertex"):
+        return self._set_attribute("LoopVertex", value)
@@ -0,0 +1,17 @@
+from .ifcvertex import IfcVertex
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpoint import IfcPoint
+
+class IfcVertexPoint(IfcVertex):
+    """Wrapper class for IfcVertexPoint."""
+
+    @property
+    def VertexGeometry(self)-> "IfcPoint":
+        """<attribute VertexGeometry: <entity IfcPoint>>"""
+        return self._get_attribute("VertexGeometry")
+
+    @VertexGeometry.setter
+    def VertexGeometry(self, value: "IfcPoint"):
+        return self._set_attribute("VertexGeometry", value)
@@ -0,0 +1,17 @@
+from .ifcdiscreteaccessorytype import IfcDiscreteAccessoryType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcvibrationisolatortypeenum import IfcVibrationIsolatorTypeEnum
+
+class IfcVibrationIsolatorType(IfcDiscreteAccessoryType):
+    """Wrapper class for IfcVibrationIsolatorType."""
+
+    @property
+    def PredefinedType(self)-> "IfcVibrationIsolatorTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcVibrationIsolatorTypeEnum: (COMPRESSION, SPRING, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcVibrationIsolatorTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcVibrationIsolatorTypeEnum(str):
+    items = ['COMPRESSION', 'SPRING', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,26 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcgridaxis import IfcGridAxis
+
+class IfcVirtualGridIntersection(Base):
+    """Wrapper class for IfcVirtualGridIntersection."""
+
+    @property
+    def IntersectingAxes(self)-> list["IfcGridAxis"]:
+        """<attribute IntersectingAxes: <list [2:2] of <entity IfcGridAxis>>>"""
+        return self._get_attribute("IntersectingAxes")
+
+    @IntersectingAxes.setter
+    def IntersectingAxes(self, value: list["IfcGridAxis"]):
+        return self._set_attribute("IntersectingAxes", value)
+
+    @property
+    def OffsetDistances(self)-> list[float]:
+        """<attribute OffsetDistances: <list [2:3] of <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("OffsetDistances")
+
+    @OffsetDistances.setter
+    def OffsetDistances(self, value: list[float]):
+        return self._set_attribute("OffsetDistances", value)
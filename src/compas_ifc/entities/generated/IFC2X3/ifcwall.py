@@ -0,0 +1,5 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+
+class IfcWall(IfcBuildingElement):
+    """Wrapper class for IfcWall."""
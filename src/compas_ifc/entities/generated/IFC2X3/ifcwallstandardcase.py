@@ -0,0 +1,5 @@
+from .ifcwall import IfcWall
+
+
+class IfcWallStandardCase(IfcWall):
+    """Wrapper class for IfcWallStandardCase."""
@@ -0,0 +1,17 @@
+from .ifcbuildingelementtype import IfcBuildingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcwalltypeenum import IfcWallTypeEnum
+
+class IfcWallType(IfcBuildingElementType):
+    """Wrapper class for IfcWallType."""
+
+    @property
+    def PredefinedType(self)-> "IfcWallTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcWallTypeEnum: (STANDARD, POLYGONAL, SHEAR, ELEMENTEDWALL, PLUMBINGWALL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcWallTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
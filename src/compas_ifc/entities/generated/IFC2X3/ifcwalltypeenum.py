@@ -0,0 +1,2 @@
+class IfcWallTypeEnum(str):
+    items = ['STANDARD', 'POLYGONAL', 'SHEAR', 'ELEMENTEDWALL', 'PLUMBINGWALL', 'USERDEFINED', 'NOTDEFINED']
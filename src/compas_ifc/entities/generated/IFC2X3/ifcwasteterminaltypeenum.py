@@ -0,0 +1,2 @@
+class IfcWasteTerminalTypeEnum(str):
+    items = ['FLOORTRAP', 'FLOORWASTE', 'GULLYSUMP', 'GULLYTRAP', 'GREASEINTERCEPTOR', 'OILINTERCEPTOR', 'PETROLINTERCEPTOR', 'ROOFDRAIN', 'WASTEDISPOSALUNIT', 'WASTETRAP', 'USERDEFINED', 'NOTDEFINED']
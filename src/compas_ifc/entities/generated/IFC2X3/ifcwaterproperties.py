@@ -0,0 +1,68 @@
+from .ifcmaterialproperties import IfcMaterialProperties
+
+
+class IfcWaterProperties(IfcMaterialProperties):
+    """Wrapper class for IfcWaterProperties."""
+
+    @property
+    def IsPotable(self)-> bool:
+        """<attribute IsPotable?: <boolean>>"""
+        return self._get_attribute("IsPotable")
+
+    @IsPotable.setter
+    def IsPotable(self, value: bool):
+        return self._set_attribute("IsPotable", value)
+
+    @property
+    def Hardness(self)-> float:
+        """<attribute Hardness?: <type IfcIonConcentrationMeasure: <real>>>"""
+        return self._get_attribute("Hardness")
+
+    @Hardness.setter
+    def Hardness(self, value: float):
+        return self._set_attribute("Hardness", value)
+
+    @property
+    def AlkalinityConcentration(self)-> float:
+        """<attribute AlkalinityConcentration?: <type IfcIonConcentrationMeasure: <real>>>"""
+        return self._get_attribute("AlkalinityConcentration")
+
+    @AlkalinityConcentration.setter
+    def AlkalinityConcentration(self, value: float):
+        return self._set_attribute("AlkalinityConcentration", value)
+
+    @property
+    def AcidityConcentration(self)-> float:
+        """<attribute AcidityConcentration?: <type IfcIonConcentrationMeasure: <real>>>"""
+        return self._get_attribute("AcidityConcentration")
+
+    @AcidityConcentration.setter
+    def AcidityConcentration(self, value: float):
+        return self._set_attribute("AcidityConcentration", value)
+
+    @property
+    def ImpuritiesContent(self)-> float:
+        """<attribute ImpuritiesContent?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("ImpuritiesContent")
+
+    @ImpuritiesContent.setter
+    def ImpuritiesContent(self, value: float):
+        return self._set_attribute("ImpuritiesContent", value)
+
+    @property
+    def PHLevel(self)-> float:
+        """<attribute PHLevel?: <type IfcPHMeasure: <real>>>"""
+        return self._get_attribute("PHLevel")
+
+    @PHLevel.setter
+    def PHLevel(self, value: float):
+        return self._set_attribute("PHLevel", value)
+
+    @property
+    def DissolvedSolidsContent(self)-> float:
+        """<attribute DissolvedSolidsContent?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("DissolvedSolidsContent")
+
+    @DissolvedSolidsContent.setter
+    def DissolvedSolidsContent(self, value: float):
+        return self._set_attribute("DissolvedSolidsContent", value)
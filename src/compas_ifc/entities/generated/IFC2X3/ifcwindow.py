@@ -0,0 +1,23 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+
+class IfcWindow(IfcBuildingElement):
+    """Wrapper class for IfcWindow."""
+
+    @property
+    def OverallHeight(self)-> float:
+        """<attribute OverallHeight?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("OverallHeight")
+
+    @OverallHeight.setter
+    def OverallHeight(self, value: float):
+        return self._set_attribute("OverallHeight", value)
+
+    @property
+    def OverallWidth(self)-> float:
+        """<attribute OverallWidth?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("OverallWidth")
+
+    @OverallWidth.setter
+    def OverallWidth(self, value: float):
+        return self._set_attribute("OverallWidth", value)
@@ -0,0 +1,89 @@
+from .ifcpropertysetdefinition import IfcPropertySetDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcshapeaspect import IfcShapeAspect
+
+class IfcWindowLiningProperties(IfcPropertySetDefinition):
+    """Wrapper class for IfcWindowLiningProperties."""
+
+    @property
+    def LiningDepth(self)-> float:
+        """<attribute LiningDepth?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("LiningDepth")
+
+    @LiningDepth.setter
+    def LiningDepth(self, value: float):
+        return self._set_attribute("LiningDepth", value)
+
+    @property
+    def LiningThickness(self)-> float:
+        """<attribute LiningThickness?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("LiningThickness")
+
+    @LiningThickness.setter
+    def LiningThickness(self, value: float):
+        return self._set_attribute("LiningThickness", value)
+
+    @property
+    def TransomThickness(self)-> float:
+        """<attribute TransomThickness?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("TransomThickness")
+
+    @TransomThickness.setter
+    def TransomThickness(self, value: float):
+        return self._set_attribute("TransomThickness", value)
+
+    @property
+    def MullionThickness(self)-> float:
+        """<attribute MullionThickness?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("MullionThickness")
+
+    @MullionThickness.setter
+    def MullionThickness(self, value: float):
+        return self._set_attribute("MullionThickness", value)
+
+    @property
+    def FirstTransomOffset(self)-> float:
+        """<attribute FirstTransomOffset?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("FirstTransomOffset")
+
+    @FirstTransomOffset.setter
+    def FirstTransomOffset(self, value: float):
+        return self._set_attribute("FirstTransomOffset", value)
+
+    @property
+    def SecondTransomOffset(self)-> float:
+        """<attribute SecondTransomOffset?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("SecondTransomOffset")
+
+    @SecondTransomOffset.setter
+    def SecondTransomOffset(self, value: float):
+        return self._set_attribute("SecondTransomOffset", value)
+
+    @property
+    def FirstMullionOffset(self)-> float:
+        """<attribute FirstMullionOffset?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("FirstMullionOffset")
+
+    @FirstMullionOffset.setter
+    def FirstMullionOffset(self, value: float):
+        return self._set_attribute("FirstMullionOffset", value)
+
+    @property
+    def SecondMullionOffset(self)-> float:
+        """<attribute SecondMullionOffset?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("SecondMullionOffset")
+
+    @SecondMullionOffset.setter
+    def SecondMullionOffset(self, value: float):
+        return self._set_attribute("SecondMullionOffset", value)
+
+    @property
+    def ShapeAspectStyle(self)-> "IfcShapeAspect":
+        """<attribute ShapeAspectStyle?: <entity IfcShapeAspect>>"""
+        return self._get_attribute("ShapeAspectStyle")
+
+    @ShapeAspectStyle.setter
+    def ShapeAspectStyle(self, value: "IfcShapeAspect"):
+        return self._set_attribute("ShapeAspectStyle", value)
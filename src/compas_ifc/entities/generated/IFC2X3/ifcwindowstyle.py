@@ -0,0 +1,45 @@
+from .ifctypeproduct import IfcTypeProduct
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcwindowstyleconstructionenum import IfcWindowStyleConstructionEnum
+    from .ifcwindowstyleoperationenum import IfcWindowStyleOperationEnum
+
+class IfcWindowStyle(IfcTypeProduct):
+    """Wrapper class for IfcWindowStyle."""
+
+    @property
+    def ConstructionType(self)-> "IfcWindowStyleConstructionEnum":
+        """<attribute ConstructionType: <enumeration IfcWindowStyleConstructionEnum: (ALUMINIUM, HIGH_GRADE_STEEL, STEEL, WOOD, ALUMINIUM_WOOD, PLASTIC, OTHER_CONSTRUCTION, NOTDEFINED)>>"""
+        return self._get_attribute("ConstructionType")
+
+    @ConstructionType.setter
+    def ConstructionType(self, value: "IfcWindowStyleConstructionEnum"):
+        return self._set_attribute("ConstructionType", value)
+
+    @property
+    def OperationType(self)-> "IfcWindowStyleOperationEnum":
+        """<attribute OperationType: <enumeration IfcWindowStyleOperationEnum: (SINGLE_PANEL, DOUBLE_PANEL_VERTICAL, DOUBLE_PANEL_HORIZONTAL, TRIPLE_PANEL_VERTICAL, TRIPLE_PANEL_BOTTOM, TRIPLE_PANEL_TOP, TRIPLE_PANEL_LEFT, TRIPLE_PANEL_RIGHT, TRIPLE_PANEL_HORIZONTAL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("OperationType")
+
+    @OperationType.setter
+    def OperationType(self, value: "IfcWindowStyleOperationEnum"):
+        return self._set_attribute("OperationType", value)
+
+    @property
+    def ParameterTakesPrecedence(self)-> bool:
+        """<attribute ParameterTakesPrecedence: <boolean>>"""
+        return self._get_attribute("ParameterTakesPrecedence")
+
+    @ParameterTakesPrecedence.setter
+    def ParameterTakesPrecedence(self, value: bool):
+        return self._set_attribute("ParameterTakesPrecedence", value)
+
+    @property
+    def Sizeable(self)-> bool:
+        """<attribute Sizeable: <boolean>>"""
+        return self._get_attribute("Sizeable")
+
+    @Sizeable.setter
+    def Sizeable(self, value: bool):
+        return self._set_attribute("Sizeable", value)
@@ -0,0 +1,2 @@
+class IfcWindowStyleConstructionEnum(str):
+    items = ['ALUMINIUM', 'HIGH_GRADE_STEEL', 'STEEL', 'WOOD', 'ALUMINIUM_WOOD', 'PLASTIC', 'OTHER_CONSTRUCTION', 'NOTDEFINED']
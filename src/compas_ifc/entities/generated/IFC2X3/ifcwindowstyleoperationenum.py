@@ -0,0 +1,2 @@
+class IfcWindowStyleOperationEnum(str):
+    items = ['SINGLE_PANEL', 'DOUBLE_PANEL_VERTICAL', 'DOUBLE_PANEL_HORIZONTAL', 'TRIPLE_PANEL_VERTICAL', 'TRIPLE_PANEL_BOTTOM', 'TRIPLE_PANEL_TOP', 'TRIPLE_PANEL_LEFT', 'TRIPLE_PANEL_RIGHT', 'TRIPLE_PANEL_HORIZONTAL', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,103 @@
+from .ifccontrol import IfcControl
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccalendardate import IfcCalendarDate
+    from .ifcdateandtime import IfcDateAndTime
+    from .ifclocaltime import IfcLocalTime
+    from .ifcperson import IfcPerson
+    from .ifcworkcontroltypeenum import IfcWorkControlTypeEnum
+
+class IfcWorkControl(IfcControl):
+    """Wrapper class for IfcWorkControl."""
+
+    @property
+    def Identifier(self)-> str:
+        """<attribute Identifier: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Identifier")
+
+    @Identifier.setter
+    def Identifier(self, value: str):
+        return self._set_attribute("Identifier", value)
+
+    @property
+    def CreationDate(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute CreationDate: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("CreationDate")
+
+    @CreationDate.setter
+    def CreationDate(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("CreationDate", value)
+
+    @property
+    def Creators(self)-> list["IfcPerson"]:
+        """<attribute Creators?: <set [1:?] of <entity IfcPerson>>>"""
+        return self._get_attribute("Creators")
+
+    @Creators.setter
+    def Creators(self, value: list["IfcPerson"]):
+        return self._set_attribute("Creators", value)
+
+    @property
+    def Purpose(self)-> str:
+        """<attribute Purpose?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Purpose")
+
+    @Purpose.setter
+    def Purpose(self, value: str):
+        return self._set_attribute("Purpose", value)
+
+    @property
+    def Duration(self)-> float:
+        """<attribute Duration?: <type IfcTimeMeasure: <real>>>"""
+        return self._get_attribute("Duration")
+
+    @Duration.setter
+    def Duration(self, value: float):
+        return self._set_attribute("Duration", value)
+
+    @property
+    def TotalFloat(self)-> float:
+        """<attribute TotalFloat?: <type IfcTimeMeasure: <real>>>"""
+        return self._get_attribute("TotalFloat")
+
+    @TotalFloat.setter
+    def TotalFloat(self, value: float):
+        return self._set_attribute("TotalFloat", value)
+
+    @property
+    def StartTime(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute StartTime: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("StartTime")
+
+    @StartTime.setter
+    def StartTime(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("StartTime", value)
+
+    @property
+    def FinishTime(self)-> Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]:
+        """<attribute FinishTime?: <select IfcDateTimeSelect: (<entity IfcCalendarDate> | <entity IfcDateAndTime> | <entity IfcLocalTime>)>>"""
+        return self._get_attribute("FinishTime")
+
+    @FinishTime.setter
+    def FinishTime(self, value: Union["IfcLocalTime", "IfcDateAndTime", "IfcCalendarDate"]):
+        return self._set_attribute("FinishTime", value)
+
+    @property
+    def WorkControlType(self)-> "IfcWorkControlTypeEnum":
+        """<attribute WorkControlType?: <enumeration IfcWorkControlTypeEnum: (ACTUAL, BASELINE, PLANNED, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("WorkControlType")
+
+    @WorkControlType.setter
+    def WorkControlType(self, value: "IfcWorkControlTypeEnum"):
+        return self._set_attribute("WorkControlType", value)
+
+    @property
+    def UserDefinedControlType(self)-> str:
+        """<attribute UserDefinedControlType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedControlType")
+
+    @UserDefinedControlType.setter
+    def UserDefinedControlType(self, value: str):
+        return self._set_attribute("UserDefinedControlType", value)
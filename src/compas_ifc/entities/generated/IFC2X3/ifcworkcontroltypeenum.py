@@ -0,0 +1,2 @@
+class IfcWorkControlTypeEnum(str):
+    items = ['ACTUAL', 'BASELINE', 'PLANNED', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,5 @@
+from .ifcworkcontrol import IfcWorkControl
+
+
+class IfcWorkPlan(IfcWorkControl):
+    """Wrapper class for IfcWorkPlan."""
@@ -0,0 +1,5 @@
+from .ifcworkcontrol import IfcWorkControl
+
+
+class IfcWorkSchedule(IfcWorkControl):
+    """Wrapper class for IfcWorkSchedule."""
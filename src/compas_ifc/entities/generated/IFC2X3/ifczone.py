@@ -0,0 +1,5 @@
+from .ifcgroup import IfcGroup
+
+
+class IfcZone(IfcGroup):
+    """Wrapper class for IfcZone."""
@@ -0,0 +1,59 @@
+from .ifcparameterizedprofiledef import IfcParameterizedProfileDef
+
+
+class IfcZShapeProfileDef(IfcParameterizedProfileDef):
+    """Wrapper class for IfcZShapeProfileDef."""
+
+    @property
+    def Depth(self)-> float:
+        """<attribute Depth: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Depth")
+
+    @Depth.setter
+    def Depth(self, value: float):
+        return self._set_attribute("Depth", value)
+
+    @property
+    def FlangeWidth(self)-> float:
+        """<attribute FlangeWidth: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("FlangeWidth")
+
+    @FlangeWidth.setter
+    def FlangeWidth(self, value: float):
+        return self._set_attribute("FlangeWidth", value)
+
+    @property
+    def WebThickness(self)-> float:
+        """<attribute WebThickness: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("WebThickness")
+
+    @WebThickness.setter
+    def WebThickness(self, value: float):
+        return self._set_attribute("WebThickness", value)
+
+    @property
+    def FlangeThickness(self)-> float:
+        """<attribute FlangeThickness: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("FlangeThickness")
+
+    @FlangeThickness.setter
+    def FlangeThickness(self, value: float):
+        return self._set_attribute("FlangeThickness", value)
+
+    @property
+    def FilletRadius(self)-> float:
+        """<attribute FilletRadius?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("FilletRadius")
+
+    @FilletRadius.setter
+    def FilletRadius(self, value: float):
+        return self._set_attribute("FilletRadius", value)
+
+    @property
+    def EdgeRadius(self)-> float:
+        """<attribute EdgeRadius?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("EdgeRadius")
+
+    @EdgeRadius.setter
+    def EdgeRadius(self, value: float):
+        return self._set_attribute("EdgeRadius", value)
@@ -0,0 +1,1992 @@
+"""
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+    :template: class.rst
+
+    IfcActionRequest
+    IfcActionRequestTypeEnum
+    IfcActionSourceTypeEnum
+    IfcActionTypeEnum
+    IfcActor
+    IfcActorRole
+    IfcActuator
+    IfcActuatorType
+    IfcActuatorTypeEnum
+    IfcAddress
+    IfcAddressTypeEnum
+    IfcAdvancedBrep
+    IfcAdvancedBrepWithVoids
+    IfcAdvancedFace
+    IfcAirTerminal
+    IfcAirTerminalBox
+    IfcAirTerminalBoxType
+    IfcAirTerminalBoxTypeEnum
+    IfcAirTerminalType
+    IfcAirTerminalTypeEnum
+    IfcAirToAirHeatRecovery
+    IfcAirToAirHeatRecoveryType
+    IfcAirToAirHeatRecoveryTypeEnum
+    IfcAlarm
+    IfcAlarmType
+    IfcAlarmTypeEnum
+    IfcAnalysisModelTypeEnum
+    IfcAnalysisTheoryTypeEnum
+    IfcAnnotation
+    IfcAnnotationFillArea
+    IfcApplication
+    IfcAppliedValue
+    IfcApproval
+    IfcApprovalRelationship
+    IfcArbitraryClosedProfileDef
+    IfcArbitraryOpenProfileDef
+    IfcArbitraryProfileDefWithVoids
+    IfcArithmeticOperatorEnum
+    IfcAssemblyPlaceEnum
+    IfcAsset
+    IfcAsymmetricIShapeProfileDef
+    IfcAudioVisualAppliance
+    IfcAudioVisualApplianceType
+    IfcAudioVisualApplianceTypeEnum
+    IfcAxis1Placement
+    IfcAxis2Placement2D
+    IfcAxis2Placement3D
+    IfcBeam
+    IfcBeamStandardCase
+    IfcBeamType
+    IfcBeamTypeEnum
+    IfcBenchmarkEnum
+    IfcBlobTexture
+    IfcBlock
+    IfcBoiler
+    IfcBoilerType
+    IfcBoilerTypeEnum
+    IfcBooleanClippingResult
+    IfcBooleanOperator
+    IfcBooleanResult
+    IfcBoundaryCondition
+    IfcBoundaryCurve
+    IfcBoundaryEdgeCondition
+    IfcBoundaryFaceCondition
+    IfcBoundaryNodeCondition
+    IfcBoundaryNodeConditionWarping
+    IfcBoundedCurve
+    IfcBoundedSurface
+    IfcBoundingBox
+    IfcBoxedHalfSpace
+    IfcBSplineCurve
+    IfcBSplineCurveForm
+    IfcBSplineCurveWithKnots
+    IfcBSplineSurface
+    IfcBSplineSurfaceForm
+    IfcBSplineSurfaceWithKnots
+    IfcBuilding
+    IfcBuildingElement
+    IfcBuildingElementPart
+    IfcBuildingElementPartType
+    IfcBuildingElementPartTypeEnum
+    IfcBuildingElementProxy
+    IfcBuildingElementProxyType
+    IfcBuildingElementProxyTypeEnum
+    IfcBuildingElementType
+    IfcBuildingStorey
+    IfcBuildingSystem
+    IfcBuildingSystemTypeEnum
+    IfcBurner
+    IfcBurnerType
+    IfcBurnerTypeEnum
+    IfcCableCarrierFitting
+    IfcCableCarrierFittingType
+    IfcCableCarrierFittingTypeEnum
+    IfcCableCarrierSegment
+    IfcCableCarrierSegmentType
+    IfcCableCarrierSegmentTypeEnum
+    IfcCableFitting
+    IfcCableFittingType
+    IfcCableFittingTypeEnum
+    IfcCableSegment
+    IfcCableSegmentType
+    IfcCableSegmentTypeEnum
+    IfcCartesianPoint
+    IfcCartesianPointList
+    IfcCartesianPointList2D
+    IfcCartesianPointList3D
+    IfcCartesianTransformationOperator
+    IfcCartesianTransformationOperator2D
+    IfcCartesianTransformationOperator2DnonUniform
+    IfcCartesianTransformationOperator3D
+    IfcCartesianTransformationOperator3DnonUniform
+    IfcCenterLineProfileDef
+    IfcChangeActionEnum
+    IfcChiller
+    IfcChillerType
+    IfcChillerTypeEnum
+    IfcChimney
+    IfcChimneyType
+    IfcChimneyTypeEnum
+    IfcCircle
+    IfcCircleHollowProfileDef
+    IfcCircleProfileDef
+    IfcCivilElement
+    IfcCivilElementType
+    IfcClassification
+    IfcClassificationReference
+    IfcClosedShell
+    IfcCoil
+    IfcCoilType
+    IfcCoilTypeEnum
+    IfcColourRgb
+    IfcColourRgbList
+    IfcColourSpecification
+    IfcColumn
+    IfcColumnStandardCase
+    IfcColumnType
+    IfcColumnTypeEnum
+    IfcCommunicationsAppliance
+    IfcCommunicationsApplianceType
+    IfcCommunicationsApplianceTypeEnum
+    IfcComplexProperty
+    IfcComplexPropertyTemplate
+    IfcComplexPropertyTemplateTypeEnum
+    IfcCompositeCurve
+    IfcCompositeCurveOnSurface
+    IfcCompositeCurveSegment
+    IfcCompositeProfileDef
+    IfcCompressor
+    IfcCompressorType
+    IfcCompressorTypeEnum
+    IfcCondenser
+    IfcCondenserType
+    IfcCondenserTypeEnum
+    IfcConic
+    IfcConnectedFaceSet
+    IfcConnectionCurveGeometry
+    IfcConnectionGeometry
+    IfcConnectionPointEccentricity
+    IfcConnectionPointGeometry
+    IfcConnectionSurfaceGeometry
+    IfcConnectionTypeEnum
+    IfcConnectionVolumeGeometry
+    IfcConstraint
+    IfcConstraintEnum
+    IfcConstructionEquipmentResource
+    IfcConstructionEquipmentResourceType
+    IfcConstructionEquipmentResourceTypeEnum
+    IfcConstructionMaterialResource
+    IfcConstructionMaterialResourceType
+    IfcConstructionMaterialResourceTypeEnum
+    IfcConstructionProductResource
+    IfcConstructionProductResourceType
+    IfcConstructionProductResourceTypeEnum
+    IfcConstructionResource
+    IfcConstructionResourceType
+    IfcContext
+    IfcContextDependentUnit
+    IfcControl
+    IfcController
+    IfcControllerType
+    IfcControllerTypeEnum
+    IfcConversionBasedUnit
+    IfcConversionBasedUnitWithOffset
+    IfcCooledBeam
+    IfcCooledBeamType
+    IfcCooledBeamTypeEnum
+    IfcCoolingTower
+    IfcCoolingTowerType
+    IfcCoolingTowerTypeEnum
+    IfcCoordinateOperation
+    IfcCoordinateReferenceSystem
+    IfcCostItem
+    IfcCostItemTypeEnum
+    IfcCostSchedule
+    IfcCostScheduleTypeEnum
+    IfcCostValue
+    IfcCovering
+    IfcCoveringType
+    IfcCoveringTypeEnum
+    IfcCrewResource
+    IfcCrewResourceType
+    IfcCrewResourceTypeEnum
+    IfcCsgPrimitive3D
+    IfcCsgSolid
+    IfcCShapeProfileDef
+    IfcCurrencyRelationship
+    IfcCurtainWall
+    IfcCurtainWallType
+    IfcCurtainWallTypeEnum
+    IfcCurve
+    IfcCurveBoundedPlane
+    IfcCurveBoundedSurface
+    IfcCurveInterpolationEnum
+    IfcCurveStyle
+    IfcCurveStyleFont
+    IfcCurveStyleFontAndScaling
+    IfcCurveStyleFontPattern
+    IfcCylindricalSurface
+    IfcDamper
+    IfcDamperType
+    IfcDamperTypeEnum
+    IfcDataOriginEnum
+    IfcDerivedProfileDef
+    IfcDerivedUnit
+    IfcDerivedUnitElement
+    IfcDerivedUnitEnum
+    IfcDimensionalExponents
+    IfcDirection
+    IfcDirectionSenseEnum
+    IfcDiscreteAccessory
+    IfcDiscreteAccessoryType
+    IfcDiscreteAccessoryTypeEnum
+    IfcDistributionChamberElement
+    IfcDistributionChamberElementType
+    IfcDistributionChamberElementTypeEnum
+    IfcDistributionCircuit
+    IfcDistributionControlElement
+    IfcDistributionControlElementType
+    IfcDistributionElement
+    IfcDistributionElementType
+    IfcDistributionFlowElement
+    IfcDistributionFlowElementType
+    IfcDistributionPort
+    IfcDistributionPortTypeEnum
+    IfcDistributionSystem
+    IfcDistributionSystemEnum
+    IfcDocumentConfidentialityEnum
+    IfcDocumentInformation
+    IfcDocumentInformationRelationship
+    IfcDocumentReference
+    IfcDocumentStatusEnum
+    IfcDoor
+    IfcDoorLiningProperties
+    IfcDoorPanelOperationEnum
+    IfcDoorPanelPositionEnum
+    IfcDoorPanelProperties
+    IfcDoorStandardCase
+    IfcDoorStyle
+    IfcDoorStyleConstructionEnum
+    IfcDoorStyleOperationEnum
+    IfcDoorType
+    IfcDoorTypeEnum
+    IfcDoorTypeOperationEnum
+    IfcDraughtingPreDefinedColour
+    IfcDraughtingPreDefinedCurveFont
+    IfcDuctFitting
+    IfcDuctFittingType
+    IfcDuctFittingTypeEnum
+    IfcDuctSegment
+    IfcDuctSegmentType
+    IfcDuctSegmentTypeEnum
+    IfcDuctSilencer
+    IfcDuctSilencerType
+    IfcDuctSilencerTypeEnum
+    IfcEdge
+    IfcEdgeCurve
+    IfcEdgeLoop
+    IfcElectricAppliance
+    IfcElectricApplianceType
+    IfcElectricApplianceTypeEnum
+    IfcElectricDistributionBoard
+    IfcElectricDistributionBoardType
+    IfcElectricDistributionBoardTypeEnum
+    IfcElectricFlowStorageDevice
+    IfcElectricFlowStorageDeviceType
+    IfcElectricFlowStorageDeviceTypeEnum
+    IfcElectricGenerator
+    IfcElectricGeneratorType
+    IfcElectricGeneratorTypeEnum
+    IfcElectricMotor
+    IfcElectricMotorType
+    IfcElectricMotorTypeEnum
+    IfcElectricTimeControl
+    IfcElectricTimeControlType
+    IfcElectricTimeControlTypeEnum
+    IfcElement
+    IfcElementarySurface
+    IfcElementAssembly
+    IfcElementAssemblyType
+    IfcElementAssemblyTypeEnum
+    IfcElementComponent
+    IfcElementComponentType
+    IfcElementCompositionEnum
+    IfcElementQuantity
+    IfcElementType
+    IfcEllipse
+    IfcEllipseProfileDef
+    IfcEnergyConversionDevice
+    IfcEnergyConversionDeviceType
+    IfcEngine
+    IfcEngineType
+    IfcEngineTypeEnum
+    IfcEvaporativeCooler
+    IfcEvaporativeCoolerType
+    IfcEvaporativeCoolerTypeEnum
+    IfcEvaporator
+    IfcEvaporatorType
+    IfcEvaporatorTypeEnum
+    IfcEvent
+    IfcEventTime
+    IfcEventTriggerTypeEnum
+    IfcEventType
+    IfcEventTypeEnum
+    IfcExtendedProperties
+    IfcExternalInformation
+    IfcExternallyDefinedHatchStyle
+    IfcExternallyDefinedSurfaceStyle
+    IfcExternallyDefinedTextFont
+    IfcExternalReference
+    IfcExternalReferenceRelationship
+    IfcExternalSpatialElement
+    IfcExternalSpatialElementTypeEnum
+    IfcExternalSpatialStructureElement
+    IfcExtrudedAreaSolid
+    IfcExtrudedAreaSolidTapered
+    IfcFace
+    IfcFaceBasedSurfaceModel
+    IfcFaceBound
+    IfcFaceOuterBound
+    IfcFaceSurface
+    IfcFacetedBrep
+    IfcFacetedBrepWithVoids
+    IfcFailureConnectionCondition
+    IfcFan
+    IfcFanType
+    IfcFanTypeEnum
+    IfcFastener
+    IfcFastenerType
+    IfcFastenerTypeEnum
+    IfcFeatureElement
+    IfcFeatureElementAddition
+    IfcFeatureElementSubtraction
+    IfcFillAreaStyle
+    IfcFillAreaStyleHatching
+    IfcFillAreaStyleTiles
+    IfcFilter
+    IfcFilterType
+    IfcFilterTypeEnum
+    IfcFireSuppressionTerminal
+    IfcFireSuppressionTerminalType
+    IfcFireSuppressionTerminalTypeEnum
+    IfcFixedReferenceSweptAreaSolid
+    IfcFlowController
+    IfcFlowControllerType
+    IfcFlowDirectionEnum
+    IfcFlowFitting
+    IfcFlowFittingType
+    IfcFlowInstrument
+    IfcFlowInstrumentType
+    IfcFlowInstrumentTypeEnum
+    IfcFlowMeter
+    IfcFlowMeterType
+    IfcFlowMeterTypeEnum
+    IfcFlowMovingDevice
+    IfcFlowMovingDeviceType
+    IfcFlowSegment
+    IfcFlowSegmentType
+    IfcFlowStorageDevice
+    IfcFlowStorageDeviceType
+    IfcFlowTerminal
+    IfcFlowTerminalType
+    IfcFlowTreatmentDevice
+    IfcFlowTreatmentDeviceType
+    IfcFooting
+    IfcFootingType
+    IfcFootingTypeEnum
+    IfcFurnishingElement
+    IfcFurnishingElementType
+    IfcFurniture
+    IfcFurnitureType
+    IfcFurnitureTypeEnum
+    IfcGeographicElement
+    IfcGeographicElementType
+    IfcGeographicElementTypeEnum
+    IfcGeometricCurveSet
+    IfcGeometricProjectionEnum
+    IfcGeometricRepresentationContext
+    IfcGeometricRepresentationItem
+    IfcGeometricRepresentationSubContext
+    IfcGeometricSet
+    IfcGlobalOrLocalEnum
+    IfcGrid
+    IfcGridAxis
+    IfcGridPlacement
+    IfcGridTypeEnum
+    IfcGroup
+    IfcHalfSpaceSolid
+    IfcHeatExchanger
+    IfcHeatExchangerType
+    IfcHeatExchangerTypeEnum
+    IfcHumidifier
+    IfcHumidifierType
+    IfcHumidifierTypeEnum
+    IfcImageTexture
+    IfcIndexedColourMap
+    IfcIndexedPolyCurve
+    IfcIndexedPolygonalFace
+    IfcIndexedPolygonalFaceWithVoids
+    IfcIndexedTextureMap
+    IfcIndexedTriangleTextureMap
+    IfcInterceptor
+    IfcInterceptorType
+    IfcInterceptorTypeEnum
+    IfcInternalOrExternalEnum
+    IfcIntersectionCurve
+    IfcInventory
+    IfcInventoryTypeEnum
+    IfcIrregularTimeSeries
+    IfcIrregularTimeSeriesValue
+    IfcIShapeProfileDef
+    IfcJunctionBox
+    IfcJunctionBoxType
+    IfcJunctionBoxTypeEnum
+    IfcKnotType
+    IfcLaborResource
+    IfcLaborResourceType
+    IfcLaborResourceTypeEnum
+    IfcLagTime
+    IfcLamp
+    IfcLampType
+    IfcLampTypeEnum
+    IfcLayerSetDirectionEnum
+    IfcLibraryInformation
+    IfcLibraryReference
+    IfcLightDistributionCurveEnum
+    IfcLightDistributionData
+    IfcLightEmissionSourceEnum
+    IfcLightFixture
+    IfcLightFixtureType
+    IfcLightFixtureTypeEnum
+    IfcLightIntensityDistribution
+    IfcLightSource
+    IfcLightSourceAmbient
+    IfcLightSourceDirectional
+    IfcLightSourceGoniometric
+    IfcLightSourcePositional
+    IfcLightSourceSpot
+    IfcLine
+    IfcLoadGroupTypeEnum
+    IfcLocalPlacement
+    IfcLogicalOperatorEnum
+    IfcLoop
+    IfcLShapeProfileDef
+    IfcManifoldSolidBrep
+    IfcMapConversion
+    IfcMappedItem
+    IfcMaterial
+    IfcMaterialClassificationRelationship
+    IfcMaterialConstituent
+    IfcMaterialConstituentSet
+    IfcMaterialDefinition
+    IfcMaterialDefinitionRepresentation
+    IfcMaterialLayer
+    IfcMaterialLayerSet
+    IfcMaterialLayerSetUsage
+    IfcMaterialLayerWithOffsets
+    IfcMaterialList
+    IfcMaterialProfile
+    IfcMaterialProfileSet
+    IfcMaterialProfileSetUsage
+    IfcMaterialProfileSetUsageTapering
+    IfcMaterialProfileWithOffsets
+    IfcMaterialProperties
+    IfcMaterialRelationship
+    IfcMaterialUsageDefinition
+    IfcMeasureWithUnit
+    IfcMechanicalFastener
+    IfcMechanicalFastenerType
+    IfcMechanicalFastenerTypeEnum
+    IfcMedicalDevice
+    IfcMedicalDeviceType
+    IfcMedicalDeviceTypeEnum
+    IfcMember
+    IfcMemberStandardCase
+    IfcMemberType
+    IfcMemberTypeEnum
+    IfcMetric
+    IfcMirroredProfileDef
+    IfcMonetaryUnit
+    IfcMotorConnection
+    IfcMotorConnectionType
+    IfcMotorConnectionTypeEnum
+    IfcNamedUnit
+    IfcNullStyle
+    IfcObject
+    IfcObjectDefinition
+    IfcObjective
+    IfcObjectiveEnum
+    IfcObjectPlacement
+    IfcObjectTypeEnum
+    IfcOccupant
+    IfcOccupantTypeEnum
+    IfcOffsetCurve2D
+    IfcOffsetCurve3D
+    IfcOpeningElement
+    IfcOpeningElementTypeEnum
+    IfcOpeningStandardCase
+    IfcOpenShell
+    IfcOrganization
+    IfcOrganizationRelationship
+    IfcOrientedEdge
+    IfcOuterBoundaryCurve
+    IfcOutlet
+    IfcOutletType
+    IfcOutletTypeEnum
+    IfcOwnerHistory
+    IfcParameterizedProfileDef
+    IfcPath
+    IfcPcurve
+    IfcPerformanceHistory
+    IfcPerformanceHistoryTypeEnum
+    IfcPermeableCoveringOperationEnum
+    IfcPermeableCoveringProperties
+    IfcPermit
+    IfcPermitTypeEnum
+    IfcPerson
+    IfcPersonAndOrganization
+    IfcPhysicalComplexQuantity
+    IfcPhysicalOrVirtualEnum
+    IfcPhysicalQuantity
+    IfcPhysicalSimpleQuantity
+    IfcPile
+    IfcPileConstructionEnum
+    IfcPileType
+    IfcPileTypeEnum
+    IfcPipeFitting
+    IfcPipeFittingType
+    IfcPipeFittingTypeEnum
+    IfcPipeSegment
+    IfcPipeSegmentType
+    IfcPipeSegmentTypeEnum
+    IfcPixelTexture
+    IfcPlacement
+    IfcPlanarBox
+    IfcPlanarExtent
+    IfcPlane
+    IfcPlate
+    IfcPlateStandardCase
+    IfcPlateType
+    IfcPlateTypeEnum
+    IfcPoint
+    IfcPointOnCurve
+    IfcPointOnSurface
+    IfcPolygonalBoundedHalfSpace
+    IfcPolygonalFaceSet
+    IfcPolyline
+    IfcPolyLoop
+    IfcPort
+    IfcPostalAddress
+    IfcPreDefinedColour
+    IfcPreDefinedCurveFont
+    IfcPreDefinedItem
+    IfcPreDefinedProperties
+    IfcPreDefinedPropertySet
+    IfcPreDefinedTextFont
+    IfcPreferredSurfaceCurveRepresentation
+    IfcPresentationItem
+    IfcPresentationLayerAssignment
+    IfcPresentationLayerWithStyle
+    IfcPresentationStyle
+    IfcPresentationStyleAssignment
+    IfcProcedure
+    IfcProcedureType
+    IfcProcedureTypeEnum
+    IfcProcess
+    IfcProduct
+    IfcProductDefinitionShape
+    IfcProductRepresentation
+    IfcProfileDef
+    IfcProfileProperties
+    IfcProfileTypeEnum
+    IfcProject
+    IfcProjectedCRS
+    IfcProjectedOrTrueLengthEnum
+    IfcProjectionElement
+    IfcProjectionElementTypeEnum
+    IfcProjectLibrary
+    IfcProjectOrder
+    IfcProjectOrderTypeEnum
+    IfcProperty
+    IfcPropertyAbstraction
+    IfcPropertyBoundedValue
+    IfcPropertyDefinition
+    IfcPropertyDependencyRelationship
+    IfcPropertyEnumeratedValue
+    IfcPropertyEnumeration
+    IfcPropertyListValue
+    IfcPropertyReferenceValue
+    IfcPropertySet
+    IfcPropertySetDefinition
+    IfcPropertySetTemplate
+    IfcPropertySetTemplateTypeEnum
+    IfcPropertySingleValue
+    IfcPropertyTableValue
+    IfcPropertyTemplate
+    IfcPropertyTemplateDefinition
+    IfcProtectiveDevice
+    IfcProtectiveDeviceTrippingUnit
+    IfcProtectiveDeviceTrippingUnitType
+    IfcProtectiveDeviceTrippingUnitTypeEnum
+    IfcProtectiveDeviceType
+    IfcProtectiveDeviceTypeEnum
+    IfcProxy
+    IfcPump
+    IfcPumpType
+    IfcPumpTypeEnum
+    IfcQuantityArea
+    IfcQuantityCount
+    IfcQuantityLength
+    IfcQuantitySet
+    IfcQuantityTime
+    IfcQuantityVolume
+    IfcQuantityWeight
+    IfcRailing
+    IfcRailingType
+    IfcRailingTypeEnum
+    IfcRamp
+    IfcRampFlight
+    IfcRampFlightType
+    IfcRampFlightTypeEnum
+    IfcRampType
+    IfcRampTypeEnum
+    IfcRationalBSplineCurveWithKnots
+    IfcRationalBSplineSurfaceWithKnots
+    IfcRectangleHollowProfileDef
+    IfcRectangleProfileDef
+    IfcRectangularPyramid
+    IfcRectangularTrimmedSurface
+    IfcRecurrencePattern
+    IfcRecurrenceTypeEnum
+    IfcReference
+    IfcReflectanceMethodEnum
+    IfcRegularTimeSeries
+    IfcReinforcementBarProperties
+    IfcReinforcementDefinitionProperties
+    IfcReinforcingBar
+    IfcReinforcingBarRoleEnum
+    IfcReinforcingBarSurfaceEnum
+    IfcReinforcingBarType
+    IfcReinforcingBarTypeEnum
+    IfcReinforcingElement
+    IfcReinforcingElementType
+    IfcReinforcingMesh
+    IfcReinforcingMeshType
+    IfcReinforcingMeshTypeEnum
+    IfcRelAggregates
+    IfcRelAssigns
+    IfcRelAssignsToActor
+    IfcRelAssignsToControl
+    IfcRelAssignsToGroup
+    IfcRelAssignsToGroupByFactor
+    IfcRelAssignsToProcess
+    IfcRelAssignsToProduct
+    IfcRelAssignsToResource
+    IfcRelAssociates
+    IfcRelAssociatesApproval
+    IfcRelAssociatesClassification
+    IfcRelAssociatesConstraint
+    IfcRelAssociatesDocument
+    IfcRelAssociatesLibrary
+    IfcRelAssociatesMaterial
+    IfcRelationship
+    IfcRelConnects
+    IfcRelConnectsElements
+    IfcRelConnectsPathElements
+    IfcRelConnectsPorts
+    IfcRelConnectsPortToElement
+    IfcRelConnectsStructuralActivity
+    IfcRelConnectsStructuralMember
+    IfcRelConnectsWithEccentricity
+    IfcRelConnectsWithRealizingElements
+    IfcRelContainedInSpatialStructure
+    IfcRelCoversBldgElements
+    IfcRelCoversSpaces
+    IfcRelDeclares
+    IfcRelDecomposes
+    IfcRelDefines
+    IfcRelDefinesByObject
+    IfcRelDefinesByProperties
+    IfcRelDefinesByTemplate
+    IfcRelDefinesByType
+    IfcRelFillsElement
+    IfcRelFlowControlElements
+    IfcRelInterferesElements
+    IfcRelNests
+    IfcRelProjectsElement
+    IfcRelReferencedInSpatialStructure
+    IfcRelSequence
+    IfcRelServicesBuildings
+    IfcRelSpaceBoundary
+    IfcRelSpaceBoundary1stLevel
+    IfcRelSpaceBoundary2ndLevel
+    IfcRelVoidsElement
+    IfcReparametrisedCompositeCurveSegment
+    IfcRepresentation
+    IfcRepresentationContext
+    IfcRepresentationItem
+    IfcRepresentationMap
+    IfcResource
+    IfcResourceApprovalRelationship
+    IfcResourceConstraintRelationship
+    IfcResourceLevelRelationship
+    IfcResourceTime
+    IfcRevolvedAreaSolid
+    IfcRevolvedAreaSolidTapered
+    IfcRightCircularCone
+    IfcRightCircularCylinder
+    IfcRoleEnum
+    IfcRoof
+    IfcRoofType
+    IfcRoofTypeEnum
+    IfcRoot
+    IfcRoundedRectangleProfileDef
+    IfcSanitaryTerminal
+    IfcSanitaryTerminalType
+    IfcSanitaryTerminalTypeEnum
+    IfcSchedulingTime
+    IfcSeamCurve
+    IfcSectionedSpine
+    IfcSectionProperties
+    IfcSectionReinforcementProperties
+    IfcSectionTypeEnum
+    IfcSensor
+    IfcSensorType
+    IfcSensorTypeEnum
+    IfcSequenceEnum
+    IfcShadingDevice
+    IfcShadingDeviceType
+    IfcShadingDeviceTypeEnum
+    IfcShapeAspect
+    IfcShapeModel
+    IfcShapeRepresentation
+    IfcShellBasedSurfaceModel
+    IfcSimpleProperty
+    IfcSimplePropertyTemplate
+    IfcSimplePropertyTemplateTypeEnum
+    IfcSIPrefix
+    IfcSite
+    IfcSIUnit
+    IfcSIUnitName
+    IfcSlab
+    IfcSlabElementedCase
+    IfcSlabStandardCase
+    IfcSlabType
+    IfcSlabTypeEnum
+    IfcSlippageConnectionCondition
+    IfcSolarDevice
+    IfcSolarDeviceType
+    IfcSolarDeviceTypeEnum
+    IfcSolidModel
+    IfcSpace
+    IfcSpaceHeater
+    IfcSpaceHeaterType
+    IfcSpaceHeaterTypeEnum
+    IfcSpaceType
+    IfcSpaceTypeEnum
+    IfcSpatialElement
+    IfcSpatialElementType
+    IfcSpatialStructureElement
+    IfcSpatialStructureElementType
+    IfcSpatialZone
+    IfcSpatialZoneType
+    IfcSpatialZoneTypeEnum
+    IfcSphere
+    IfcSphericalSurface
+    IfcStackTerminal
+    IfcStackTerminalType
+    IfcStackTerminalTypeEnum
+    IfcStair
+    IfcStairFlight
+    IfcStairFlightType
+    IfcStairFlightTypeEnum
+    IfcStairType
+    IfcStairTypeEnum
+    IfcStateEnum
+    IfcStructuralAction
+    IfcStructuralActivity
+    IfcStructuralAnalysisModel
+    IfcStructuralConnection
+    IfcStructuralConnectionCondition
+    IfcStructuralCurveAction
+    IfcStructuralCurveActivityTypeEnum
+    IfcStructuralCurveConnection
+    IfcStructuralCurveMember
+    IfcStructuralCurveMemberTypeEnum
+    IfcStructuralCurveMemberVarying
+    IfcStructuralCurveReaction
+    IfcStructuralItem
+    IfcStructuralLinearAction
+    IfcStructuralLoad
+    IfcStructuralLoadCase
+    IfcStructuralLoadConfiguration
+    IfcStructuralLoadGroup
+    IfcStructuralLoadLinearForce
+    IfcStructuralLoadOrResult
+    IfcStructuralLoadPlanarForce
+    IfcStructuralLoadSingleDisplacement
+    IfcStructuralLoadSingleDisplacementDistortion
+    IfcStructuralLoadSingleForce
+    IfcStructuralLoadSingleForceWarping
+    IfcStructuralLoadStatic
+    IfcStructuralLoadTemperature
+    IfcStructuralMember
+    IfcStructuralPlanarAction
+    IfcStructuralPointAction
+    IfcStructuralPointConnection
+    IfcStructuralPointReaction
+    IfcStructuralReaction
+    IfcStructuralResultGroup
+    IfcStructuralSurfaceAction
+    IfcStructuralSurfaceActivityTypeEnum
+    IfcStructuralSurfaceConnection
+    IfcStructuralSurfaceMember
+    IfcStructuralSurfaceMemberTypeEnum
+    IfcStructuralSurfaceMemberVarying
+    IfcStructuralSurfaceReaction
+    IfcStyledItem
+    IfcStyledRepresentation
+    IfcStyleModel
+    IfcSubContractResource
+    IfcSubContractResourceType
+    IfcSubContractResourceTypeEnum
+    IfcSubedge
+    IfcSurface
+    IfcSurfaceCurve
+    IfcSurfaceCurveSweptAreaSolid
+    IfcSurfaceFeature
+    IfcSurfaceFeatureTypeEnum
+    IfcSurfaceOfLinearExtrusion
+    IfcSurfaceOfRevolution
+    IfcSurfaceReinforcementArea
+    IfcSurfaceSide
+    IfcSurfaceStyle
+    IfcSurfaceStyleLighting
+    IfcSurfaceStyleRefraction
+    IfcSurfaceStyleRendering
+    IfcSurfaceStyleShading
+    IfcSurfaceStyleWithTextures
+    IfcSurfaceTexture
+    IfcSweptAreaSolid
+    IfcSweptDiskSolid
+    IfcSweptDiskSolidPolygonal
+    IfcSweptSurface
+    IfcSwitchingDevice
+    IfcSwitchingDeviceType
+    IfcSwitchingDeviceTypeEnum
+    IfcSystem
+    IfcSystemFurnitureElement
+    IfcSystemFurnitureElementType
+    IfcSystemFurnitureElementTypeEnum
+    IfcTable
+    IfcTableColumn
+    IfcTableRow
+    IfcTank
+    IfcTankType
+    IfcTankTypeEnum
+    IfcTask
+    IfcTaskDurationEnum
+    IfcTaskTime
+    IfcTaskTimeRecurring
+    IfcTaskType
+    IfcTaskTypeEnum
+    IfcTelecomAddress
+    IfcTendon
+    IfcTendonAnchor
+    IfcTendonAnchorType
+    IfcTendonAnchorTypeEnum
+    IfcTendonType
+    IfcTendonTypeEnum
+    IfcTessellatedFaceSet
+    IfcTessellatedItem
+    IfcTextLiteral
+    IfcTextLiteralWithExtent
+    IfcTextPath
+    IfcTextStyle
+    IfcTextStyleFontModel
+    IfcTextStyleForDefinedFont
+    IfcTextStyleTextModel
+    IfcTextureCoordinate
+    IfcTextureCoordinateGenerator
+    IfcTextureMap
+    IfcTextureVertex
+    IfcTextureVertexList
+    IfcTimePeriod
+    IfcTimeSeries
+    IfcTimeSeriesDataTypeEnum
+    IfcTimeSeriesValue
+    IfcTopologicalRepresentationItem
+    IfcTopologyRepresentation
+    IfcToroidalSurface
+    IfcTransformer
+    IfcTransformerType
+    IfcTransformerTypeEnum
+    IfcTransitionCode
+    IfcTransportElement
+    IfcTransportElementType
+    IfcTransportElementTypeEnum
+    IfcTrapeziumProfileDef
+    IfcTriangulatedFaceSet
+    IfcTrimmedCurve
+    IfcTrimmingPreference
+    IfcTShapeProfileDef
+    IfcTubeBundle
+    IfcTubeBundleType
+    IfcTubeBundleTypeEnum
+    IfcTypeObject
+    IfcTypeProcess
+    IfcTypeProduct
+    IfcTypeResource
+    IfcUnitaryControlElement
+    IfcUnitaryControlElementType
+    IfcUnitaryControlElementTypeEnum
+    IfcUnitaryEquipment
+    IfcUnitaryEquipmentType
+    IfcUnitaryEquipmentTypeEnum
+    IfcUnitAssignment
+    IfcUnitEnum
+    IfcUShapeProfileDef
+    IfcValve
+    IfcValveType
+    IfcValveTypeEnum
+    IfcVector
+    IfcVertex
+    IfcVertexLoop
+    IfcVertexPoint
+    IfcVibrationIsolator
+    IfcVibrationIsolatorType
+    IfcVibrationIsolatorTypeEnum
+    IfcVirtualElement
+    IfcVirtualGridIntersection
+    IfcVoidingFeature
+    IfcVoidingFeatureTypeEnum
+    IfcWall
+    IfcWallElementedCase
+    IfcWallStandardCase
+    IfcWallType
+    IfcWallTypeEnum
+    IfcWasteTerminal
+    IfcWasteTerminalType
+    IfcWasteTerminalTypeEnum
+    IfcWindow
+    IfcWindowLiningProperties
+    IfcWindowPanelOperationEnum
+    IfcWindowPanelPositionEnum
+    IfcWindowPanelProperties
+    IfcWindowStandardCase
+    IfcWindowStyle
+    IfcWindowStyleConstructionEnum
+    IfcWindowStyleOperationEnum
+    IfcWindowType
+    IfcWindowTypeEnum
+    IfcWindowTypePartitioningEnum
+    IfcWorkCalendar
+    IfcWorkCalendarTypeEnum
+    IfcWorkControl
+    IfcWorkPlan
+    IfcWorkPlanTypeEnum
+    IfcWorkSchedule
+    IfcWorkScheduleTypeEnum
+    IfcWorkTime
+    IfcZone
+    IfcZShapeProfileDef
+"""
+
+import importlib
+
+__all__ = [
+    "IfcActionRequest",
+    "IfcActionRequestTypeEnum",
+    "IfcActionSourceTypeEnum",
+    "IfcActionTypeEnum",
+    "IfcActor",
+    "IfcActorRole",
+    "IfcActuator",
+    "IfcActuatorType",
+    "IfcActuatorTypeEnum",
+    "IfcAddress",
+    "IfcAddressTypeEnum",
+    "IfcAdvancedBrep",
+    "IfcAdvancedBrepWithVoids",
+    "IfcAdvancedFace",
+    "IfcAirTerminal",
+    "IfcAirTerminalBox",
+    "IfcAirTerminalBoxType",
+    "IfcAirTerminalBoxTypeEnum",
+    "IfcAirTerminalType",
+    "IfcAirTerminalTypeEnum",
+    "IfcAirToAirHeatRecovery",
+    "IfcAirToAirHeatRecoveryType",
+    "IfcAirToAirHeatRecoveryTypeEnum",
+    "IfcAlarm",
+    "IfcAlarmType",
+    "IfcAlarmTypeEnum",
+    "IfcAnalysisModelTypeEnum",
+    "IfcAnalysisTheoryTypeEnum",
+    "IfcAnnotation",
+    "IfcAnnotationFillArea",
+    "IfcApplication",
+    "IfcAppliedValue",
+    "IfcApproval",
+    "IfcApprovalRelationship",
+    "IfcArbitraryClosedProfileDef",
+    "IfcArbitraryOpenProfileDef",
+    "IfcArbitraryProfileDefWithVoids",
+    "IfcArithmeticOperatorEnum",
+    "IfcAssemblyPlaceEnum",
+    "IfcAsset",
+    "IfcAsymmetricIShapeProfileDef",
+    "IfcAudioVisualAppliance",
+    "IfcAudioVisualApplianceType",
+    "IfcAudioVisualApplianceTypeEnum",
+    "IfcAxis1Placement",
+    "IfcAxis2Placement2D",
+    "IfcAxis2Placement3D",
+    "IfcBeam",
+    "IfcBeamStandardCase",
+    "IfcBeamType",
+    "IfcBeamTypeEnum",
+    "IfcBenchmarkEnum",
+    "IfcBlobTexture",
+    "IfcBlock",
+    "IfcBoiler",
+    "IfcBoilerType",
+    "IfcBoilerTypeEnum",
+    "IfcBooleanClippingResult",
+    "IfcBooleanOperator",
+    "IfcBooleanResult",
+    "IfcBoundaryCondition",
+    "IfcBoundaryCurve",
+    "IfcBoundaryEdgeCondition",
+    "IfcBoundaryFaceCondition",
+    "IfcBoundaryNodeCondition",
+    "IfcBoundaryNodeConditionWarping",
+    "IfcBoundedCurve",
+    "IfcBoundedSurface",
+    "IfcBoundingBox",
+    "IfcBoxedHalfSpace",
+    "IfcBSplineCurve",
+    "IfcBSplineCurveForm",
+    "IfcBSplineCurveWithKnots",
+    "IfcBSplineSurface",
+    "IfcBSplineSurfaceForm",
+    "IfcBSplineSurfaceWithKnots",
+    "IfcBuilding",
+    "IfcBuildingElement",
+    "IfcBuildingElementPart",
+    "IfcBuildingElementPartType",
+    "IfcBuildingElementPartTypeEnum",
+    "IfcBuildingElementProxy",
+    "IfcBuildingElementProxyType",
+    "IfcBuildingElementProxyTypeEnum",
+    "IfcBuildingElementType",
+    "IfcBuildingStorey",
+    "IfcBuildingSystem",
+    "IfcBuildingSystemTypeEnum",
+    "IfcBurner",
+    "IfcBurnerType",
+    "IfcBurnerTypeEnum",
+    "IfcCableCarrierFitting",
+    "IfcCableCarrierFittingType",
+    "IfcCableCarrierFittingTypeEnum",
+    "IfcCableCarrierSegment",
+    "IfcCableCarrierSegmentType",
+    "IfcCableCarrierSegmentTypeEnum",
+    "IfcCableFitting",
+    "IfcCableFittingType",
+    "IfcCableFittingTypeEnum",
+    "IfcCableSegment",
+    "IfcCableSegmentType",
+    "IfcCableSegmentTypeEnum",
+    "IfcCartesianPoint",
+    "IfcCartesianPointList",
+    "IfcCartesianPointList2D",
+    "IfcCartesianPointList3D",
+    "IfcCartesianTransformationOperator",
+    "IfcCartesianTransformationOperator2D",
+    "IfcCartesianTransformationOperator2DnonUniform",
+    "IfcCartesianTransformationOperator3D",
+    "IfcCartesianTransformationOperator3DnonUniform",
+    "IfcCenterLineProfileDef",
+    "IfcChangeActionEnum",
+    "IfcChiller",
+    "IfcChillerType",
+    "IfcChillerTypeEnum",
+    "IfcChimney",
+    "IfcChimneyType",
+    "IfcChimneyTypeEnum",
+    "IfcCircle",
+    "IfcCircleHollowProfileDef",
+    "IfcCircleProfileDef",
+    "IfcCivilElement",
+    "IfcCivilElementType",
+    "IfcClassification",
+    "IfcClassificationReference",
+    "IfcClosedShell",
+    "IfcCoil",
+    "IfcCoilType",
+    "IfcCoilTypeEnum",
+    "IfcColourRgb",
+    "IfcColourRgbList",
+    "IfcColourSpecification",
+    "IfcColumn",
+    "IfcColumnStandardCase",
+    "IfcColumnType",
+    "IfcColumnTypeEnum",
+    "IfcCommunicationsAppliance",
+    "IfcCommunicationsApplianceType",
+    "IfcCommunicationsApplianceTypeEnum",
+    "IfcComplexProperty",
+    "IfcComplexPropertyTemplate",
+    "IfcComplexPropertyTemplateTypeEnum",
+    "IfcCompositeCurve",
+    "IfcCompositeCurveOnSurface",
+    "IfcCompositeCurveSegment",
+    "IfcCompositeProfileDef",
+    "IfcCompressor",
+    "IfcCompressorType",
+    "IfcCompressorTypeEnum",
+    "IfcCondenser",
+    "IfcCondenserType",
+    "IfcCondenserTypeEnum",
+    "IfcConic",
+    "IfcConnectedFaceSet",
+    "IfcConnectionCurveGeometry",
+    "IfcConnectionGeometry",
+    "IfcConnectionPointEccentricity",
+    "IfcConnectionPointGeometry",
+    "IfcConnectionSurfaceGeometry",
+    "IfcConnectionTypeEnum",
+    "IfcConnectionVolumeGeometry",
+    "IfcConstraint",
+    "IfcConstraintEnum",
+    "IfcConstructionEquipmentResource",
+    "IfcConstructionEquipmentResourceType",
+    "IfcConstructionEquipmentResourceTypeEnum",
+    "IfcConstructionMaterialResource",
+    "IfcConstructionMaterialResourceType",
+    "IfcConstructionMaterialResourceTypeEnum",
+    "IfcConstructionProductResource",
+    "IfcConstructionProductResourceType",
+    "IfcConstructionProductResourceTypeEnum",
+    "IfcConstructionResource",
+    "IfcConstructionResourceType",
+    "IfcContext",
+    "IfcContextDependentUnit",
+    "IfcControl",
+    "IfcController",
+    "IfcControllerType",
+    "IfcControllerTypeEnum",
+    "IfcConversionBasedUnit",
+    "IfcConversionBasedUnitWithOffset",
+    "IfcCooledBeam",
+    "IfcCooledBeamType",
+    "IfcCooledBeamTypeEnum",
+    "IfcCoolingTower",
+    "IfcCoolingTowerType",
+    "IfcCoolingTowerTypeEnum",
+    "IfcCoordinateOperation",
+    "IfcCoordinateReferenceSystem",
+    "IfcCostItem",
+    "IfcCostItemTypeEnum",
+    "IfcCostSchedule",
+    "IfcCostScheduleTypeEnum",
+    "IfcCostValue",
+    "IfcCovering",
+    "IfcCoveringType",
+    "IfcCoveringTypeEnum",
+    "IfcCrewResource",
+    "IfcCrewResourceType",
+    "IfcCrewResourceTypeEnum",
+    "IfcCsgPrimitive3D",
+    "IfcCsgSolid",
+    "IfcCShapeProfileDef",
+    "IfcCurrencyRelationship",
+    "IfcCurtainWall",
+    "IfcCurtainWallType",
+    "IfcCurtainWallTypeEnum",
+    "IfcCurve",
+    "IfcCurveBoundedPlane",
+    "IfcCurveBoundedSurface",
+    "IfcCurveInterpolationEnum",
+    "IfcCurveStyle",
+    "IfcCurveStyleFont",
+    "IfcCurveStyleFontAndScaling",
+    "IfcCurveStyleFontPattern",
+    "IfcCylindricalSurface",
+    "IfcDamper",
+    "IfcDamperType",
+    "IfcDamperTypeEnum",
+    "IfcDataOriginEnum",
+    "IfcDerivedProfileDef",
+    "IfcDerivedUnit",
+    "IfcDerivedUnitElement",
+    "IfcDerivedUnitEnum",
+    "IfcDimensionalExponents",
+    "IfcDirection",
+    "IfcDirectionSenseEnum",
+    "IfcDiscreteAccessory",
+    "IfcDiscreteAccessoryType",
+    "IfcDiscreteAccessoryTypeEnum",
+    "IfcDistributionChamberElement",
+    "IfcDistributionChamberElementType",
+    "IfcDistributionChamberElementTypeEnum",
+    "IfcDistributionCircuit",
+    "IfcDistributionControlElement",
+    "IfcDistributionControlElementType",
+    "IfcDistributionElement",
+    "IfcDistributionElementType",
+    "IfcDistributionFlowElement",
+    "IfcDistributionFlowElementType",
+    "IfcDistributionPort",
+    "IfcDistributionPortTypeEnum",
+    "IfcDistributionSystem",
+    "IfcDistributionSystemEnum",
+    "IfcDocumentConfidentialityEnum",
+    "IfcDocumentInformation",
+    "IfcDocumentInformationRelationship",
+    "IfcDocumentReference",
+    "IfcDocumentStatusEnum",
+    "IfcDoor",
+    "IfcDoorLiningProperties",
+    "IfcDoorPanelOperationEnum",
+    "IfcDoorPanelPositionEnum",
+    "IfcDoorPanelProperties",
+    "IfcDoorStandardCase",
+    "IfcDoorStyle",
+    "IfcDoorStyleConstructionEnum",
+    "IfcDoorStyleOperationEnum",
+    "IfcDoorType",
+    "IfcDoorTypeEnum",
+    "IfcDoorTypeOperationEnum",
+    "IfcDraughtingPreDefinedColour",
+    "IfcDraughtingPreDefinedCurveFont",
+    "IfcDuctFitting",
+    "IfcDuctFittingType",
+    "IfcDuctFittingTypeEnum",
+    "IfcDuctSegment",
+    "IfcDuctSegmentType",
+    "IfcDuctSegmentTypeEnum",
+    "IfcDuctSilencer",
+    "IfcDuctSilencerType",
+    "IfcDuctSilencerTypeEnum",
+    "IfcEdge",
+    "IfcEdgeCurve",
+    "IfcEdgeLoop",
+    "IfcElectricAppliance",
+    "IfcElectricApplianceType",
+    "IfcElectricApplianceTypeEnum",
+    "IfcElectricDistributionBoard",
+    "IfcElectricDistributionBoardType",
+    "IfcElectricDistributionBoardTypeEnum",
+    "IfcElectricFlowStorageDevice",
+    "IfcElectricFlowStorageDeviceType",
+    "IfcElectricFlowStorageDeviceTypeEnum",
+    "IfcElectricGenerator",
+    "IfcElectricGeneratorType",
+    "IfcElectricGeneratorTypeEnum",
+    "IfcElectricMotor",
+    "IfcElectricMotorType",
+    "IfcElectricMotorTypeEnum",
+    "IfcElectricTimeControl",
+    "IfcElectricTimeControlType",
+    "IfcElectricTimeControlTypeEnum",
+    "IfcElement",
+    "IfcElementarySurface",
+    "IfcElementAssembly",
+    "IfcElementAssemblyType",
+    "IfcElementAssemblyTypeEnum",
+    "IfcElementComponent",
+    "IfcElementComponentType",
+    "IfcElementCompositionEnum",
+    "IfcElementQuantity",
+    "IfcElementType",
+    "IfcEllipse",
+    "IfcEllipseProfileDef",
+    "IfcEnergyConversionDevice",
+    "IfcEnergyConversionDeviceType",
+    "IfcEngine",
+    "IfcEngineType",
+    "IfcEngineTypeEnum",
+    "IfcEvaporativeCooler",
+    "IfcEvaporativeCoolerType",
+    "IfcEvaporativeCoolerTypeEnum",
+    "IfcEvaporator",
+    "IfcEvaporatorType",
+    "IfcEvaporatorTypeEnum",
+    "IfcEvent",
+    "IfcEventTime",
+    "IfcEventTriggerTypeEnum",
+    "IfcEventType",
+    "IfcEventTypeEnum",
+    "IfcExtendedProperties",
+    "IfcExternalInformation",
+    "IfcExternallyDefinedHatchStyle",
+    "IfcExternallyDefinedSurfaceStyle",
+    "IfcExternallyDefinedTextFont",
+    "IfcExternalReference",
+    "IfcExternalReferenceRelationship",
+    "IfcExternalSpatialElement",
+    "IfcExternalSpatialElementTypeEnum",
+    "IfcExternalSpatialStructureElement",
+    "IfcExtrudedAreaSolid",
+    "IfcExtrudedAreaSolidTapered",
+    "IfcFace",
+    "IfcFaceBasedSurfaceModel",
+    "IfcFaceBound",
+    "IfcFaceOuterBound",
+    "IfcFaceSurface",
+    "IfcFacetedBrep",
+    "IfcFacetedBrepWithVoids",
+    "IfcFailureConnectionCondition",
+    "IfcFan",
+    "IfcFanType",
+    "IfcFanTypeEnum",
+    "IfcFastener",
+    "IfcFastenerType",
+    "IfcFastenerTypeEnum",
+    "IfcFeatureElement",
+    "IfcFeatureElementAddition",
+    "IfcFeatureElementSubtraction",
+    "IfcFillAreaStyle",
+    "IfcFillAreaStyleHatching",
+    "IfcFillAreaStyleTiles",
+    "IfcFilter",
+    "IfcFilterType",
+    "IfcFilterTypeEnum",
+    "IfcFireSuppressionTerminal",
+    "IfcFireSuppressionTerminalType",
+    "IfcFireSuppressionTerminalTypeEnum",
+    "IfcFixedReferenceSweptAreaSolid",
+    "IfcFlowController",
+    "IfcFlowControllerType",
+    "IfcFlowDirectionEnum",
+    "IfcFlowFitting",
+    "IfcFlowFittingType",
+    "IfcFlowInstrument",
+    "IfcFlowInstrumentType",
+    "IfcFlowInstrumentTypeEnum",
+    "IfcFlowMeter",
+    "IfcFlowMeterType",
+    "IfcFlowMeterTypeEnum",
+    "IfcFlowMovingDevice",
+    "IfcFlowMovingDeviceType",
+    "IfcFlowSegment",
+    "IfcFlowSegmentType",
+    "IfcFlowStorageDevice",
+    "IfcFlowStorageDeviceType",
+    "IfcFlowTerminal",
+    "IfcFlowTerminalType",
+    "IfcFlowTreatmentDevice",
+    "IfcFlowTreatmentDeviceType",
+    "IfcFooting",
+    "IfcFootingType",
+    "IfcFootingTypeEnum",
+    "IfcFurnishingElement",
+    "IfcFurnishingElementType",
+    "IfcFurniture",
+    "IfcFurnitureType",
+    "IfcFurnitureTypeEnum",
+    "IfcGeographicElement",
+    "IfcGeographicElementType",
+    "IfcGeographicElementTypeEnum",
+    "IfcGeometricCurveSet",
+    "IfcGeometricProjectionEnum",
+    "IfcGeometricRepresentationContext",
+    "IfcGeometricRepresentationItem",
+    "IfcGeometricRepresentationSubContext",
+    "IfcGeometricSet",
+    "IfcGlobalOrLocalEnum",
+    "IfcGrid",
+    "IfcGridAxis",
+    "IfcGridPlacement",
+    "IfcGridTypeEnum",
+    "IfcGroup",
+    "IfcHalfSpaceSolid",
+    "IfcHeatExchanger",
+    "IfcHeatExchangerType",
+    "IfcHeatExchangerTypeEnum",
+    "IfcHumidifier",
+    "IfcHumidifierType",
+    "IfcHumidifierTypeEnum",
+    "IfcImageTexture",
+    "IfcIndexedColourMap",
+    "IfcIndexedPolyCurve",
+    "IfcIndexedPolygonalFace",
+    "IfcIndexedPolygonalFaceWithVoids",
+    "IfcIndexedTextureMap",
+    "IfcIndexedTriangleTextureMap",
+    "IfcInterceptor",
+    "IfcInterceptorType",
+    "IfcInterceptorTypeEnum",
+    "IfcInternalOrExternalEnum",
+    "IfcIntersectionCurve",
+    "IfcInventory",
+    "IfcInventoryTypeEnum",
+    "IfcIrregularTimeSeries",
+    "IfcIrregularTimeSeriesValue",
+    "IfcIShapeProfileDef",
+    "IfcJunctionBox",
+    "IfcJunctionBoxType",
+    "IfcJunctionBoxTypeEnum",
+    "IfcKnotType",
+    "IfcLaborResource",
+    "IfcLaborResourceType",
+    "IfcLaborResourceTypeEnum",
+    "IfcLagTime",
+    "IfcLamp",
+    "IfcLampType",
+    "IfcLampTypeEnum",
+    "IfcLayerSetDirectionEnum",
+    "IfcLibraryInformation",
+    "IfcLibraryReference",
+    "IfcLightDistributionCurveEnum",
+    "IfcLightDistributionData",
+    "IfcLightEmissionSourceEnum",
+    "IfcLightFixture",
+    "IfcLightFixtureType",
+    "IfcLightFixtureTypeEnum",
+    "IfcLightIntensityDistribution",
+    "IfcLightSource",
+    "IfcLightSourceAmbient",
+    "IfcLightSourceDirectional",
+    "IfcLightSourceGoniometric",
+    "IfcLightSourcePositional",
+    "IfcLightSourceSpot",
+    "IfcLine",
+    "IfcLoadGroupTypeEnum",
+    "IfcLocalPlacement",
+    "IfcLogicalOperatorEnum",
+    "IfcLoop",
+    "IfcLShapeProfileDef",
+    "IfcManifoldSolidBrep",
+    "IfcMapConversion",
+    "IfcMappedItem",
+    "IfcMaterial",
+    "IfcMaterialClassificationRelationship",
+    "IfcMaterialConstituent",
+    "IfcMaterialConstituentSet",
+    "IfcMaterialDefinition",
+    "IfcMaterialDefinitionRepresentation",
+    "IfcMaterialLayer",
+    "IfcMaterialLayerSet",
+    "IfcMaterialLayerSetUsage",
+    "IfcMaterialLayerWithOffsets",
+    "IfcMaterialList",
+    "IfcMaterialProfile",
+    "IfcMaterialProfileSet",
+    "IfcMaterialProfileSetUsage",
+    "IfcMaterialProfileSetUsageTapering",
+    "IfcMaterialProfileWithOffsets",
+    "IfcMaterialProperties",
+    "IfcMaterialRelationship",
+    "IfcMaterialUsageDefinition",
+    "IfcMeasureWithUnit",
+    "IfcMechanicalFastener",
+    "IfcMechanicalFastenerType",
+    "IfcMechanicalFastenerTypeEnum",
+    "IfcMedicalDevice",
+    "IfcMedicalDeviceType",
+    "IfcMedicalDeviceTypeEnum",
+    "IfcMember",
+    "IfcMemberStandardCase",
+    "IfcMemberType",
+    "IfcMemberTypeEnum",
+    "IfcMetric",
+    "IfcMirroredProfileDef",
+    "IfcMonetaryUnit",
+    "IfcMotorConnection",
+    "IfcMotorConnectionType",
+    "IfcMotorConnectionTypeEnum",
+    "IfcNamedUnit",
+    "IfcNullStyle",
+    "IfcObject",
+    "IfcObjectDefinition",
+    "IfcObjective",
+    "IfcObjectiveEnum",
+    "IfcObjectPlacement",
+    "IfcObjectTypeEnum",
+    "IfcOccupant",
+    "IfcOccupantTypeEnum",
+    "IfcOffsetCurve2D",
+    "IfcOffsetCurve3D",
+    "IfcOpeningElement",
+    "IfcOpeningElementTypeEnum",
+    "IfcOpeningStandardCase",
+    "IfcOpenShell",
+    "IfcOrganization",
+    "IfcOrganizationRelationship",
+    "IfcOrientedEdge",
+    "IfcOuterBoundaryCurve",
+    "IfcOutlet",
+    "IfcOutletType",
+    "IfcOutletTypeEnum",
+    "IfcOwnerHistory",
+    "IfcParameterizedProfileDef",
+    "IfcPath",
+    "IfcPcurve",
+    "IfcPerformanceHistory",
+    "IfcPerformanceHistoryTypeEnum",
+    "IfcPermeableCoveringOperationEnum",
+    "IfcPermeableCoveringProperties",
+    "IfcPermit",
+    "IfcPermitTypeEnum",
+    "IfcPerson",
+    "IfcPersonAndOrganization",
+    "IfcPhysicalComplexQuantity",
+    "IfcPhysicalOrVirtualEnum",
+    "IfcPhysicalQuantity",
+    "IfcPhysicalSimpleQuantity",
+    "IfcPile",
+    "IfcPileConstructionEnum",
+    "IfcPileType",
+    "IfcPileTypeEnum",
+    "IfcPipeFitting",
+    "IfcPipeFittingType",
+    "IfcPipeFittingTypeEnum",
+    "IfcPipeSegment",
+    "IfcPipeSegmentType",
+    "IfcPipeSegmentTypeEnum",
+    "IfcPixelTexture",
+    "IfcPlacement",
+    "IfcPlanarBox",
+    "IfcPlanarExtent",
+    "IfcPlane",
+    "IfcPlate",
+    "IfcPlateStandardCase",
+    "IfcPlateType",
+    "IfcPlateTypeEnum",
+    "IfcPoint",
+    "IfcPointOnCurve",
+    "IfcPointOnSurface",
+    "IfcPolygonalBoundedHalfSpace",
+    "IfcPolygonalFaceSet",
+    "IfcPolyline",
+    "IfcPolyLoop",
+    "IfcPort",
+    "IfcPostalAddress",
+    "IfcPreDefinedColour",
+    "IfcPreDefinedCurveFont",
+    "IfcPreDefinedItem",
+    "IfcPreDefinedProperties",
+    "IfcPreDefinedPropertySet",
+    "IfcPreDefinedTextFont",
+    "IfcPreferredSurfaceCurveRepresentation",
+    "IfcPresentationItem",
+    "IfcPresentationLayerAssignment",
+    "IfcPresentationLayerWithStyle",
+    "IfcPresentationStyle",
+    "IfcPresentationStyleAssignment",
+    "IfcProcedure",
+    "IfcProcedureType",
+    "IfcProcedureTypeEnum",
+    "IfcProcess",
+    "IfcProduct",
+    "IfcProductDefinitionShape",
+    "IfcProductRepresentation",
+    "IfcProfileDef",
+    "IfcProfileProperties",
+    "IfcProfileTypeEnum",
+    "IfcProject",
+    "IfcProjectedCRS",
+    "IfcProjectedOrTrueLengthEnum",
+    "IfcProjectionElement",
+    "IfcProjectionElementTypeEnum",
+    "IfcProjectLibrary",
+    "IfcProjectOrder",
+    "IfcProjectOrderTypeEnum",
+    "IfcProperty",
+    "IfcPropertyAbstraction",
+    "IfcPropertyBoundedValue",
+    "IfcPropertyDefinition",
+    "IfcPropertyDependencyRelationship",
+    "IfcPropertyEnumeratedValue",
+    "IfcPropertyEnumeration",
+    "IfcPropertyListValue",
+    "IfcPropertyReferenceValue",
+    "IfcPropertySet",
+    "IfcPropertySetDefinition",
+    "IfcPropertySetTemplate",
+    "IfcPropertySetTemplateTypeEnum",
+    "IfcPropertySingleValue",
+    "IfcPropertyTableValue",
+    "IfcPropertyTemplate",
+    "IfcPropertyTemplateDefinition",
+    "IfcProtectiveDevice",
+    "IfcProtectiveDeviceTrippingUnit",
+    "IfcProtectiveDeviceTrippingUnitType",
+    "IfcProtectiveDeviceTrippingUnitTypeEnum",
+    "IfcProtectiveDeviceType",
+    "IfcProtectiveDeviceTypeEnum",
+    "IfcProxy",
+    "IfcPump",
+    "IfcPumpType",
+    "IfcPumpTypeEnum",
+    "IfcQuantityArea",
+    "IfcQuantityCount",
+    "IfcQuantityLength",
+    "IfcQuantitySet",
+    "IfcQuantityTime",
+    "IfcQuantityVolume",
+    "IfcQuantityWeight",
+    "IfcRailing",
+    "IfcRailingType",
+    "IfcRailingTypeEnum",
+    "IfcRamp",
+    "IfcRampFlight",
+    "IfcRampFlightType",
+    "IfcRampFlightTypeEnum",
+    "IfcRampType",
+    "IfcRampTypeEnum",
+    "IfcRationalBSplineCurveWithKnots",
+    "IfcRationalBSplineSurfaceWithKnots",
+    "IfcRectangleHollowProfileDef",
+    "IfcRectangleProfileDef",
+    "IfcRectangularPyramid",
+    "IfcRectangularTrimmedSurface",
+    "IfcRecurrencePattern",
+    "IfcRecurrenceTypeEnum",
+    "IfcReference",
+    "IfcReflectanceMethodEnum",
+    "IfcRegularTimeSeries",
+    "IfcReinforcementBarProperties",
+    "IfcReinforcementDefinitionProperties",
+    "IfcReinforcingBar",
+    "IfcReinforcingBarRoleEnum",
+    "IfcReinforcingBarSurfaceEnum",
+    "IfcReinforcingBarType",
+    "IfcReinforcingBarTypeEnum",
+    "IfcReinforcingElement",
+    "IfcReinforcingElementType",
+    "IfcReinforcingMesh",
+    "IfcReinforcingMeshType",
+    "IfcReinforcingMeshTypeEnum",
+    "IfcRelAggregates",
+    "IfcRelAssigns",
+    "IfcRelAssignsToActor",
+    "IfcRelAssignsToControl",
+    "IfcRelAssignsToGroup",
+    "IfcRelAssignsToGroupByFactor",
+    "IfcRelAssignsToProcess",
+    "IfcRelAssignsToProduct",
+    "IfcRelAssignsToResource",
+    "IfcRelAssociates",
+    "IfcRelAssociatesApproval",
+    "IfcRelAssociatesClassification",
+    "IfcRelAssociatesConstraint",
+    "IfcRelAssociatesDocument",
+    "IfcRelAssociatesLibrary",
+    "IfcRelAssociatesMaterial",
+    "IfcRelationship",
+    "IfcRelConnects",
+    "IfcRelConnectsElements",
+    "IfcRelConnectsPathElements",
+    "IfcRelConnectsPorts",
+    "IfcRelConnectsPortToElement",
+    "IfcRelConnectsStructuralActivity",
+    "IfcRelConnectsStructuralMember",
+    "IfcRelConnectsWithEccentricity",
+    "IfcRelConnectsWithRealizingElements",
+    "IfcRelContainedInSpatialStructure",
+    "IfcRelCoversBldgElements",
+    "IfcRelCoversSpaces",
+    "IfcRelDeclares",
+    "IfcRelDecomposes",
+    "IfcRelDefines",
+    "IfcRelDefinesByObject",
+    "IfcRelDefinesByProperties",
+    "IfcRelDefinesByTemplate",
+    "IfcRelDefinesByType",
+    "IfcRelFillsElement",
+    "IfcRelFlowControlElements",
+    "IfcRelInterferesElements",
+    "IfcRelNests",
+    "IfcRelProjectsElement",
+    "IfcRelReferencedInSpatialStructure",
+    "IfcRelSequence",
+    "IfcRelServicesBuildings",
+    "IfcRelSpaceBoundary",
+    "IfcRelSpaceBoundary1stLevel",
+    "IfcRelSpaceBoundary2ndLevel",
+    "IfcRelVoidsElement",
+    "IfcReparametrisedCompositeCurveSegment",
+    "IfcRepresentation",
+    "IfcRepresentationContext",
+    "IfcRepresentationItem",
+    "IfcRepresentationMap",
+    "IfcResource",
+    "IfcResourceApprovalRelationship",
+    "IfcResourceConstraintRelationship",
+    "IfcResourceLevelRelationship",
+    "IfcResourceTime",
+    "IfcRevolvedAreaSolid",
+    "IfcRevolvedAreaSolidTapered",
+    "IfcRightCircularCone",
+    "IfcRightCircularCylinder",
+    "IfcRoleEnum",
+    "IfcRoof",
+    "IfcRoofType",
+    "IfcRoofTypeEnum",
+    "IfcRoot",
+    "IfcRoundedRectangleProfileDef",
+    "IfcSanitaryTerminal",
+    "IfcSanitaryTerminalType",
+    "IfcSanitaryTerminalTypeEnum",
+    "IfcSchedulingTime",
+    "IfcSeamCurve",
+    "IfcSectionedSpine",
+    "IfcSectionProperties",
+    "IfcSectionReinforcementProperties",
+    "IfcSectionTypeEnum",
+    "IfcSensor",
+    "IfcSensorType",
+    "IfcSensorTypeEnum",
+    "IfcSequenceEnum",
+    "IfcShadingDevice",
+    "IfcShadingDeviceType",
+    "IfcShadingDeviceTypeEnum",
+    "IfcShapeAspect",
+    "IfcShapeModel",
+    "IfcShapeRepresentation",
+    "IfcShellBasedSurfaceModel",
+    "IfcSimpleProperty",
+    "IfcSimplePropertyTemplate",
+    "IfcSimplePropertyTemplateTypeEnum",
+    "IfcSIPrefix",
+    "IfcSite",
+    "IfcSIUnit",
+    "IfcSIUnitName",
+    "IfcSlab",
+    "IfcSlabElementedCase",
+    "IfcSlabStandardCase",
+    "IfcSlabType",
+    "IfcSlabTypeEnum",
+    "IfcSlippageConnectionCondition",
+    "IfcSolarDevice",
+    "IfcSolarDeviceType",
+    "IfcSolarDeviceTypeEnum",
+    "IfcSolidModel",
+    "IfcSpace",
+    "IfcSpaceHeater",
+    "IfcSpaceHeaterType",
+    "IfcSpaceHeaterTypeEnum",
+    "IfcSpaceType",
+    "IfcSpaceTypeEnum",
+    "IfcSpatialElement",
+    "IfcSpatialElementType",
+    "IfcSpatialStructureElement",
+    "IfcSpatialStructureElementType",
+    "IfcSpatialZone",
+    "IfcSpatialZoneType",
+    "IfcSpatialZoneTypeEnum",
+    "IfcSphere",
+    "IfcSphericalSurface",
+    "IfcStackTerminal",
+    "IfcStackTerminalType",
+    "IfcStackTerminalTypeEnum",
+    "IfcStair",
+    "IfcStairFlight",
+    "IfcStairFlightType",
+    "IfcStairFlightTypeEnum",
+    "IfcStairType",
+    "IfcStairTypeEnum",
+    "IfcStateEnum",
+    "IfcStructuralAction",
+    "IfcStructuralActivity",
+    "IfcStructuralAnalysisModel",
+    "IfcStructuralConnection",
+    "IfcStructuralConnectionCondition",
+    "IfcStructuralCurveAction",
+    "IfcStructuralCurveActivityTypeEnum",
+    "IfcStructuralCurveConnection",
+    "IfcStructuralCurveMember",
+    "IfcStructuralCurveMemberTypeEnum",
+    "IfcStructuralCurveMemberVarying",
+    "IfcStructuralCurveReaction",
+    "IfcStructuralItem",
+    "IfcStructuralLinearAction",
+    "IfcStructuralLoad",
+    "IfcStructuralLoadCase",
+    "IfcStructuralLoadConfiguration",
+    "IfcStructuralLoadGroup",
+    "IfcStructuralLoadLinearForce",
+    "IfcStructuralLoadOrResult",
+    "IfcStructuralLoadPlanarForce",
+    "IfcStructuralLoadSingleDisplacement",
+    "IfcStructuralLoadSingleDisplacementDistortion",
+    "IfcStructuralLoadSingleForce",
+    "IfcStructuralLoadSingleForceWarping",
+    "IfcStructuralLoadStatic",
+    "IfcStructuralLoadTemperature",
+    "IfcStructuralMember",
+    "IfcStructuralPlanarAction",
+    "IfcStructuralPointAction",
+    "IfcStructuralPointConnection",
+    "IfcStructuralPointReaction",
+    "IfcStructuralReaction",
+    "IfcStructuralResultGroup",
+    "IfcStructuralSurfaceAction",
+    "IfcStructuralSurfaceActivityTypeEnum",
+    "IfcStructuralSurfaceConnection",
+    "IfcStructuralSurfaceMember",
+    "IfcStructuralSurfaceMemberTypeEnum",
+    "IfcStructuralSurfaceMemberVarying",
+    "IfcStructuralSurfaceReaction",
+    "IfcStyledItem",
+    "IfcStyledRepresentation",
+    "IfcStyleModel",
+    "IfcSubContractResource",
+    "IfcSubContractResourceType",
+    "IfcSubContractResourceTypeEnum",
+    "IfcSubedge",
+    "IfcSurface",
+    "IfcSurfaceCurve",
+    "IfcSurfaceCurveSweptAreaSolid",
+    "IfcSurfaceFeature",
+    "IfcSurfaceFeatureTypeEnum",
+    "IfcSurfaceOfLinearExtrusion",
+    "IfcSurfaceOfRevolution",
+    "IfcSurfaceReinforcementArea",
+    "IfcSurfaceSide",
+    "IfcSurfaceStyle",
+    "IfcSurfaceStyleLighting",
+    "IfcSurfaceStyleRefraction",
+    "IfcSurfaceStyleRendering",
+    "IfcSurfaceStyleShading",
+    "IfcSurfaceStyleWithTextures",
+    "IfcSurfaceTexture",
+    "IfcSweptAreaSolid",
+    "IfcSweptDiskSolid",
+    "IfcSweptDiskSolidPolygonal",
+    "IfcSweptSurface",
+    "IfcSwitchingDevice",
+    "IfcSwitchingDeviceType",
+    "IfcSwitchingDeviceTypeEnum",
+    "IfcSystem",
+    "IfcSystemFurnitureElement",
+    "IfcSystemFurnitureElementType",
+    "IfcSystemFurnitureElementTypeEnum",
+    "IfcTable",
+    "IfcTableColumn",
+    "IfcTableRow",
+    "IfcTank",
+    "IfcTankType",
+    "IfcTankTypeEnum",
+    "IfcTask",
+    "IfcTaskDurationEnum",
+    "IfcTaskTime",
+    "IfcTaskTimeRecurring",
+    "IfcTaskType",
+    "IfcTaskTypeEnum",
+    "IfcTelecomAddress",
+    "IfcTendon",
+    "IfcTendonAnchor",
+    "IfcTendonAnchorType",
+    "IfcTendonAnchorTypeEnum",
+    "IfcTendonType",
+    "IfcTendonTypeEnum",
+    "IfcTessellatedFaceSet",
+    "IfcTessellatedItem",
+    "IfcTextLiteral",
+    "IfcTextLiteralWithExtent",
+    "IfcTextPath",
+    "IfcTextStyle",
+    "IfcTextStyleFontModel",
+    "IfcTextStyleForDefinedFont",
+    "IfcTextStyleTextModel",
+    "IfcTextureCoordinate",
+    "IfcTextureCoordinateGenerator",
+    "IfcTextureMap",
+    "IfcTextureVertex",
+    "IfcTextureVertexList",
+    "IfcTimePeriod",
+    "IfcTimeSeries",
+    "IfcTimeSeriesDataTypeEnum",
+    "IfcTimeSeriesValue",
+    "IfcTopologicalRepresentationItem",
+    "IfcTopologyRepresentation",
+    "IfcToroidalSurface",
+    "IfcTransformer",
+    "IfcTransformerType",
+    "IfcTransformerTypeEnum",
+    "IfcTransitionCode",
+    "IfcTransportElement",
+    "IfcTransportElementType",
+    "IfcTransportElementTypeEnum",
+    "IfcTrapeziumProfileDef",
+    "IfcTriangulatedFaceSet",
+    "IfcTrimmedCurve",
+    "IfcTrimmingPreference",
+    "IfcTShapeProfileDef",
+    "IfcTubeBundle",
+    "IfcTubeBundleType",
+    "IfcTubeBundleTypeEnum",
+    "IfcTypeObject",
+    "IfcTypeProcess",
+    "IfcTypeProduct",
+    "IfcTypeResource",
+    "IfcUnitaryControlElement",
+    "IfcUnitaryControlElementType",
+    "IfcUnitaryControlElementTypeEnum",
+    "IfcUnitaryEquipment",
+    "IfcUnitaryEquipmentType",
+    "IfcUnitaryEquipmentTypeEnum",
+    "IfcUnitAssignment",
+    "IfcUnitEnum",
+    "IfcUShapeProfileDef",
+    "IfcValve",
+    "IfcValveType",
+    "IfcValveTypeEnum",
+    "IfcVector",
+    "IfcVertex",
+    "IfcVertexLoop",
+    "IfcVertexPoint",
+    "IfcVibrationIsolator",
+    "IfcVibrationIsolatorType",
+    "IfcVibrationIsolatorTypeEnum",
+    "IfcVirtualElement",
+    "IfcVirtualGridIntersection",
+    "IfcVoidingFeature",
+    "IfcVoidingFeatureTypeEnum",
+    "IfcWall",
+    "IfcWallElementedCase",
+    "IfcWallStandardCase",
+    "IfcWallType",
+    "IfcWallTypeEnum",
+    "IfcWasteTerminal",
+    "IfcWasteTerminalType",
+    "IfcWasteTerminalTypeEnum",
+    "IfcWindow",
+    "IfcWindowLiningProperties",
+    "IfcWindowPanelOperationEnum",
+    "IfcWindowPanelPositionEnum",
+    "IfcWindowPanelProperties",
+    "IfcWindowStandardCase",
+    "IfcWindowStyle",
+    "IfcWindowStyleConstructionEnum",
+    "IfcWindowStyleOperationEnum",
+    "IfcWindowType",
+    "IfcWindowTypeEnum",
+    "IfcWindowTypePartitioningEnum",
+    "IfcWorkCalendar",
+    "IfcWorkCalendarTypeEnum",
+    "IfcWorkControl",
+    "IfcWorkPlan",
+    "IfcWorkPlanTypeEnum",
+    "IfcWorkSchedule",
+    "IfcWorkScheduleTypeEnum",
+    "IfcWorkTime",
+    "IfcZone",
+    "IfcZShapeProfileDef",
+]
+
+_NAMES = set(__all__)
+
+
+def __getattr__(name):
+    if name not in _NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cls = getattr(importlib.import_module(f".{name.lower()}", __name__), name)
+    globals()[name] = cls
+    return cls
+
+
+def __dir__():
+    return list(__all__)
@@ -0,0 +1,35 @@
+from .ifccontrol import IfcControl
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcactionrequesttypeenum import IfcActionRequestTypeEnum
+
+class IfcActionRequest(IfcControl):
+    """Wrapper class for IfcActionRequest."""
+
+    @property
+    def PredefinedType(self)-> "IfcActionRequestTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcActionRequestTypeEnum: (EMAIL, FAX, PHONE, POST, VERBAL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcActionRequestTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def Status(self)-> str:
+        """<attribute Status?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Status")
+
+    @Status.setter
+    def Status(self, value: str):
+        return self._set_attribute("Status", value)
+
+    @property
+    def LongDescription(self)-> str:
+        """<attribute LongDescription?: <type IfcText: <string>>>"""
+        return self._get_attribute("LongDescription")
+
+    @LongDescription.setter
+    def LongDescription(self, value: str):
+        return self._set_attribute("LongDescription", value)
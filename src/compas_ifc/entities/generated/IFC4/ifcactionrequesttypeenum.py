@@ -0,0 +1,2 @@
+class IfcActionRequestTypeEnum(str):
+    items = ['EMAIL', 'FAX', 'PHONE', 'POST', 'VERBAL', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,40 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcexternalreferencerelationship import IfcExternalReferenceRelationship
+    from .ifcroleenum import IfcRoleEnum
+
+class IfcActorRole(Base):
+    """Wrapper class for IfcActorRole."""
+
+    @property
+    def Role(self)-> "IfcRoleEnum":
+        """<attribute Role: <enumeration IfcRoleEnum: (SUPPLIER, MANUFACTURER, CONTRACTOR, SUBCONTRACTOR, ARCHITECT, STRUCTURALENGINEER, COSTENGINEER, CLIENT, BUILDINGOWNER, BUILDINGOPERATOR, MECHANICALENGINEER, ELECTRICALENGINEER, PROJECTMANAGER, FACILITIESMANAGER, CIVILENGINEER, COMMISSIONINGENGINEER, ENGINEER, OWNER, CONSULTANT, CONSTRUCTIONMANAGER, FIELDCONSTRUCTIONMANAGER, RESELLER, USERDEFINED)>>"""
+        return self._get_attribute("Role")
+
+    @Role.setter
+    def Role(self, value: "IfcRoleEnum"):
+        return self._set_attribute("Role", value)
+
+    @property
+    def UserDefinedRole(self)-> str:
+        """<attribute UserDefinedRole?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedRole")
+
+    @UserDefinedRole.setter
+    def UserDefinedRole(self, value: str):
+        return self._set_attribute("UserDefinedRole", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    def HasExternalReference(self)-> list["IfcExternalReferenceRelationship"]:
+        """<inverse HasExternalReference: set [0:?] of <entity IfcExternalReferenceRelationship> for <attribute RelatedResourceObjects: <set [1:?] of <select IfcResourceObjectSelect: (<entity IfcActorRole> | <entity IfcAppliedValue> | <entity IfcApproval> | <entity IfcConstraint> | <entity IfcContextDependentUnit> | <entity IfcConversionBasedUnit> | <entity IfcExternalInformation> | <entity IfcExternalReference> | <entity IfcMaterialDefinition> | <entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization> | <entity IfcPhysicalQuantity> | <entity IfcProfileDef> | <entity IfcPropertyAbstraction> | <entity IfcTimeSeries>)>>>>"""
+        return self._get_inverse_attribute("HasExternalReference")
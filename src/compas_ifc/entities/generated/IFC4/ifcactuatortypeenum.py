@@ -0,0 +1,2 @@
+class IfcActuatorTypeEnum(str):
+    items = ['ELECTRICACTUATOR', 'HANDOPERATEDACTUATOR', 'HYDRAULICACTUATOR', 'PNEUMATICACTUATOR', 'THERMOSTATICACTUATOR', 'USERDEFINED', 'NOTDEFINED']
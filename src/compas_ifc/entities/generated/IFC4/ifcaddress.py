@@ -0,0 +1,45 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaddresstypeenum import IfcAddressTypeEnum
+    from .ifcorganization import IfcOrganization
+    from .ifcperson import IfcPerson
+
+class IfcAddress(Base):
+    """Wrapper class for IfcAddress."""
+
+    @property
+    def Purpose(self)-> "IfcAddressTypeEnum":
+        """<attribute Purpose?: <enumeration IfcAddressTypeEnum: (OFFICE, SITE, HOME, DISTRIBUTIONPOINT, USERDEFINED)>>"""
+        return self._get_attribute("Purpose")
+
+    @Purpose.setter
+    def Purpose(self, value: "IfcAddressTypeEnum"):
+        return self._set_attribute("Purpose", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def UserDefinedPurpose(self)-> str:
+        """<attribute UserDefinedPurpose?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedPurpose")
+
+    @UserDefinedPurpose.setter
+    def UserDefinedPurpose(self, value: str):
+        return self._set_attribute("UserDefinedPurpose", value)
+
+    def OfPerson(self)-> list["IfcPerson"]:
+        """<inverse OfPerson: set [0:?] of <entity IfcPerson> for <attribute Addresses?: <list [1:?] of <entity IfcAddress>>>>"""
+        return self._get_inverse_attribute("OfPerson")
+
+    def OfOrganization(self)-> list["IfcOrganization"]:
+        """<inverse OfOrganization: set [0:?] of <entity IfcOrganization> for <attribute Addresses?: <list [1:?] of <entity IfcAddress>>>>"""
+        return self._get_inverse_attribute("OfOrganization")
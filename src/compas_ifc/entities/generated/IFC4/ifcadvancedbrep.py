@@ -0,0 +1,5 @@
+from .ifcmanifoldsolidbrep import IfcManifoldSolidBrep
+
+
+class IfcAdvancedBrep(IfcManifoldSolidBrep):
+    """Wrapper class for IfcAdvancedBrep."""
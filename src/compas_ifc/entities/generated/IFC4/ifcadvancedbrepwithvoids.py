@@ -0,0 +1,17 @@
+from .ifcadvancedbrep import IfcAdvancedBrep
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcclosedshell import IfcClosedShell
+
+class IfcAdvancedBrepWithVoids(IfcAdvancedBrep):
+    """Wrapper class for IfcAdvancedBrepWithVoids."""
+
+    @property
+    def Voids(self)-> list["IfcClosedShell"]:
+        """<attribute Voids: <set [1:?] of <entity IfcClosedShell>>>"""
+        return self._get_attribute("Voids")
+
+    @Voids.setter
+    def Voids(self, value: list["IfcClosedShell"]):
+        return self._set_attribute("Voids", value)
@@ -0,0 +1,5 @@
+from .ifcfacesurface import IfcFaceSurface
+
+
+class IfcAdvancedFace(IfcFaceSurface):
+    """Wrapper class for IfcAdvancedFace."""
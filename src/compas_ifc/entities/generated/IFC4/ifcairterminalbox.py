@@ -0,0 +1,17 @@
+from .ifcflowcontroller import IfcFlowController
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcairterminalboxtypeenum import IfcAirTerminalBoxTypeEnum
+
+class IfcAirTerminalBox(IfcFlowController):
+    """Wrapper class for IfcAirTerminalBox."""
+
+    @property
+    def PredefinedType(self)-> "IfcAirTerminalBoxTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcAirTerminalBoxTypeEnum: (CONSTANTFLOW, VARIABLEFLOWPRESSUREDEPENDANT, VARIABLEFLOWPRESSUREINDEPENDANT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcAirTerminalBoxTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
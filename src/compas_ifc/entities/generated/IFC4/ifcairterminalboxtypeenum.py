@@ -0,0 +1,2 @@
+class IfcAirTerminalBoxTypeEnum(str):
+    items = ['CONSTANTFLOW', 'VARIABLEFLOWPRESSUREDEPENDANT', 'VARIABLEFLOWPRESSUREINDEPENDANT', 'USERDEFINED', 'NOTDEFINED']
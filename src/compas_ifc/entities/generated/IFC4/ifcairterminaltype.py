@@ -0,0 +1,17 @@
+from .ifcflowterminaltype import IfcFlowTerminalType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcairterminaltypeenum import IfcAirTerminalTypeEnum
+
+class IfcAirTerminalType(IfcFlowTerminalType):
+    """Wrapper class for IfcAirTerminalType."""
+
+    @property
+    def PredefinedType(self)-> "IfcAirTerminalTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcAirTerminalTypeEnum: (DIFFUSER, GRILLE, LOUVRE, REGISTER, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcAirTerminalTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
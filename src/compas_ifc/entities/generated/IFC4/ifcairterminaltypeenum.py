@@ -0,0 +1,2 @@
+class IfcAirTerminalTypeEnum(str):
+    items = ['DIFFUSER', 'GRILLE', 'LOUVRE', 'REGISTER', 'USERDEFINED', 'NOTDEFINED']
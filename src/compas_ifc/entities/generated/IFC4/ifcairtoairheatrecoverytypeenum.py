@@ -0,0 +1,2 @@
+class IfcAirToAirHeatRecoveryTypeEnum(str):
+    items = ['FIXEDPLATECOUNTERFLOWEXCHANGER', 'FIXEDPLATECROSSFLOWEXCHANGER', 'FIXEDPLATEPARALLELFLOWEXCHANGER', 'ROTARYWHEEL', 'RUNAROUNDCOILLOOP', 'HEATPIPE', 'TWINTOWERENTHALPYRECOVERYLOOPS', 'THERMOSIPHONSEALEDTUBEHEATEXCHANGERS', 'THERMOSIPHONCOILTYPEHEATEXCHANGERS', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcdistributioncontrolelement import IfcDistributionControlElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcalarmtypeenum import IfcAlarmTypeEnum
+
+class IfcAlarm(IfcDistributionControlElement):
+    """Wrapper class for IfcAlarm."""
+
+    @property
+    def PredefinedType(self)-> "IfcAlarmTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcAlarmTypeEnum: (BELL, BREAKGLASSBUTTON, LIGHT, MANUALPULLBOX, SIREN, WHISTLE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcAlarmTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
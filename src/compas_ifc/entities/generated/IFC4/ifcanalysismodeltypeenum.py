@@ -0,0 +1,2 @@
+class IfcAnalysisModelTypeEnum(str):
+    items = ['IN_PLANE_LOADING_2D', 'OUT_PLANE_LOADING_2D', 'LOADING_3D', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,12 @@
+from .ifcproduct import IfcProduct
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelcontainedinspatialstructure import IfcRelContainedInSpatialStructure
+
+class IfcAnnotation(IfcProduct):
+    """Wrapper class for IfcAnnotation."""
+
+    def ContainedInStructure(self)-> list["IfcRelContainedInSpatialStructure"]:
+        """<inverse ContainedInStructure: set [0:1] of <entity IfcRelContainedInSpatialStructure> for <attribute RelatedElements: <set [1:?] of <entity IfcProduct>>>>"""
+        return self._get_inverse_attribute("ContainedInStructure")
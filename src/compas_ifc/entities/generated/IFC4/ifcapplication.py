@@ -0,0 +1,44 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcorganization import IfcOrganization
+
+class IfcApplication(Base):
+    """Wrapper class for IfcApplication."""
+
+    @property
+    def ApplicationDeveloper(self)-> "IfcOrganization":
+        """<attribute ApplicationDeveloper: <entity IfcOrganization>>"""
+        return self._get_attribute("ApplicationDeveloper")
+
+    @ApplicationDeveloper.setter
+    def ApplicationDeveloper(self, value: "IfcOrganization"):
+        return self._set_attribute("ApplicationDeveloper", value)
+
+    @property
+    def Version(self)-> str:
+        """<attribute Version: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Version")
+
+    @Version.setter
+    def Version(self, value: str):
+        return self._set_attribute("Version", value)
+
+    @property
+    def ApplicationFullName(self)-> str:
+        """<attribute ApplicationFullName: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ApplicationFullName")
+
+    @ApplicationFullName.setter
+    def ApplicationFullName(self, value: str):
+        return self._set_attribute("ApplicationFullName", value)
+
+    @property
+    def ApplicationIdentifier(self)-> str:
+        """<attribute ApplicationIdentifier: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("ApplicationIdentifier")
+
+    @ApplicationIdentifier.setter
+    def ApplicationIdentifier(self, value: str):
+        return self._set_attribute("ApplicationIdentifier", value)
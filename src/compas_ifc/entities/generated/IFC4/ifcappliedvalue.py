@@ -0,0 +1,106 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcarithmeticoperatorenum import IfcArithmeticOperatorEnum
+    from .ifcexternalreferencerelationship import IfcExternalReferenceRelationship
+    from .ifcmeasurewithunit import IfcMeasureWithUnit
+    from .ifcreference import IfcReference
+
+class IfcAppliedValue(Base):
+    """Wrapper class for IfcAppliedValue."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def AppliedValue(self)-> Union[bytes, list[float], list[int], "IfcReference", str, float, int, bool, "IfcMeasureWithUnit"]:
+        """<attribute AppliedValue?: <select IfcAppliedValueSelect: (<entity IfcMeasureWithUnit> | <entity IfcReference> | <select IfcValue: (<select IfcDerivedMeasureValue: (<type IfcAbsorbedDoseMeasure: <real>> | <type IfcAccelerationMeasure: <real>> | <type IfcAngularVelocityMeasure: <real>> | <type IfcAreaDensityMeasure: <real>> | <type IfcCompoundPlaneAngleMeasure: <list [3:4] of <integer>>> | <type IfcCurvatureMeasure: <real>> | <type IfcDoseEquivalentMeasure: <real>> | <type IfcDynamicViscosityMeasure: <real>> | <type IfcElectricCapacitanceMeasure: <real>> | <type IfcElectricChargeMeasure: <real>> | <type IfcElectricConductanceMeasure: <real>> | <type IfcElectricResistanceMeasure: <real>> | <type IfcElectricVoltageMeasure: <real>> | <type IfcEnergyMeasure: <real>> | <type IfcForceMeasure: <real>> | <type IfcFrequencyMeasure: <real>> | <type IfcHeatFluxDensityMeasure: <real>> | <type IfcHeatingValueMeasure: <real>> | <type IfcIlluminanceMeasure: <real>> | <type IfcInductanceMeasure: <real>> | <type IfcIntegerCountRateMeasure: <integer>> | <type IfcIonConcentrationMeasure: <real>> | <type IfcIsothermalMoistureCapacityMeasure: <real>> | <type IfcKinematicViscosityMeasure: <real>> | <type IfcLinearForceMeasure: <real>> | <type IfcLinearMomentMeasure: <real>> | <type IfcLinearStiffnessMeasure: <real>> | <type IfcLinearVelocityMeasure: <real>> | <type IfcLuminousFluxMeasure: <real>> | <type IfcLuminousIntensityDistributionMeasure: <real>> | <type IfcMagneticFluxDensityMeasure: <real>> | <type IfcMagneticFluxMeasure: <real>> | <type IfcMassDensityMeasure: <real>> | <type IfcMassFlowRateMeasure: <real>> | <type IfcMassPerLengthMeasure: <real>> | <type IfcModulusOfElasticityMeasure: <real>> | <type IfcModulusOfLinearSubgradeReactionMeasure: <real>> | <type IfcModulusOfRotationalSubgradeReactionMeasure: <real>> | <type IfcModulusOfSubgradeReactionMeasure: <real>> | <type IfcMoistureDiffusivityMeasure: <real>> | <type IfcMolecularWeightMeasure: <real>> | <type IfcMomentOfInertiaMeasure: <real>> | <type IfcMonetaryMeasure: <real>> | <type IfcPHMeasure: <real>> | <type IfcPlanarForceMeasure: <real>> | <type IfcPowerMeasure: <real>> | <type IfcPressureMeasure: <real>> | <type IfcRadioActivityMeasure: <real>> | <type IfcRotationalFrequencyMeasure: <real>> | <type IfcRotationalMassMeasure: <real>> | <type IfcRotationalStiffnessMeasure: <real>> | <type IfcSectionModulusMeasure: <real>> | <type IfcSectionalAreaIntegralMeasure: <real>> | <type IfcShearModulusMeasure: <real>> | <type IfcSoundPowerLevelMeasure: <real>> | <type IfcSoundPowerMeasure: <real>> | <type IfcSoundPressureLevelMeasure: <real>> | <type IfcSoundPressureMeasure: <real>> | <type IfcSpecificHeatCapacityMeasure: <real>> | <type IfcTemperatureGradientMeasure: <real>> | <type IfcTemperatureRateOfChangeMeasure: <real>> | <type IfcThermalAdmittanceMeasure: <real>> | <type IfcThermalConductivityMeasure: <real>> | <type IfcThermalExpansionCoefficientMeasure: <real>> | <type IfcThermalResistanceMeasure: <real>> | <type IfcThermalTransmittanceMeasure: <real>> | <type IfcTorqueMeasure: <real>> | <type IfcVaporPermeabilityMeasure: <real>> | <type IfcVolumetricFlowRateMeasure: <real>> | <type IfcWarpingConstantMeasure: <real>> | <type IfcWarpingMomentMeasure: <real>>)> | <select IfcMeasureValue: (<type IfcAmountOfSubstanceMeasure: <real>> | <type IfcAreaMeasure: <real>> | <type IfcComplexNumber: <array [1:2] of <real>>> | <type IfcContextDependentMeasure: <real>> | <type IfcCountMeasure: <number>> | <type IfcDescriptiveMeasure: <string>> | <type IfcElectricCurrentMeasure: <real>> | <type IfcLengthMeasure: <real>> | <type IfcLuminousIntensityMeasure: <real>> | <type IfcMassMeasure: <real>> | <type IfcNonNegativeLengthMeasure: <type IfcLengthMeasure: <real>>> | <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>> | <type IfcNumericMeasure: <number>> | <type IfcParameterValue: <real>> | <type IfcPlaneAngleMeasure: <real>> | <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>> | <type IfcPositivePlaneAngleMeasure: <type IfcPlaneAngleMeasure: <real>>> | <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>> | <type IfcRatioMeasure: <real>> | <type IfcSolidAngleMeasure: <real>> | <type IfcThermodynamicTemperatureMeasure: <real>> | <type IfcTimeMeasure: <real>> | <type IfcVolumeMeasure: <real>>)> | <select IfcSimpleValue: (<type IfcBinary: <binary>> | <type IfcBoolean: <boolean>> | <type IfcDate: <string>> | <type IfcDateTime: <string>> | <type IfcDuration: <string>> | <type IfcIdentifier: <string>> | <type IfcInteger: <integer>> | <type IfcLabel: <string>> | <type IfcLogical: <logical>> | <type IfcPositiveInteger: <type IfcInteger: <integer>>> | <type IfcReal: <real>> | <type IfcText: <string>> | <type IfcTime: <string>> | <type IfcTimeStamp: <integer>>)>)>)>>"""
+        return self._get_attribute("AppliedValue")
+
+    @AppliedValue.setter
+    def AppliedValue(self, value: Union[bytes, list[float], list[int], "IfcReference", str, float, int, bool, "IfcMeasureWithUnit"]):
+        return self._set_attribute("AppliedValue", value)
+
+    @property
+    def UnitBasis(self)-> "IfcMeasureWithUnit":
+        """<attribute UnitBasis?: <entity IfcMeasureWithUnit>>"""
+        return self._get_attribute("UnitBasis")
+
+    @UnitBasis.setter
+    def UnitBasis(self, value: "IfcMeasureWithUnit"):
+        return self._set_attribute("UnitBasis", value)
+
+    @property
+    def ApplicableDate(self)-> str:
+        """<attribute ApplicableDate?: <type IfcDate: <string>>>"""
+        return self._get_attribute("ApplicableDate")
+
+    @ApplicableDate.setter
+    def ApplicableDate(self, value: str):
+        return self._set_attribute("ApplicableDate", value)
+
+    @property
+    def FixedUntilDate(self)-> str:
+        """<attribute FixedUntilDate?: <type IfcDate: <string>>>"""
+        return self._get_attribute("FixedUntilDate")
+
+    @FixedUntilDate.setter
+    def FixedUntilDate(self, value: str):
+        return self._set_attribute("FixedUntilDate", value)
+
+    @property
+    def Category(self)-> str:
+        """<attribute Category?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Category")
+
+    @Category.setter
+    def Category(self, value: str):
+        return self._set_attribute("Category", value)
+
+    @property
+    def Condition(self)-> str:
+        """<attribute Condition?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Condition")
+
+    @Condition.setter
+    def Condition(self, value: str):
+        return self._set_attribute("Condition", value)
+
+    @property
+    def ArithmeticOperator(self)-> "IfcArithmeticOperatorEnum":
+        """<attribute ArithmeticOperator?: <enumeration IfcArithmeticOperatorEnum: (ADD, DIVIDE, MULTIPLY, SUBTRACT)>>"""
+        return self._get_attribute("ArithmeticOperator")
+
+    @ArithmeticOperator.setter
+    def ArithmeticOperator(self, value: "IfcArithmeticOperatorEnum"):
+        return self._set_attribute("ArithmeticOperator", value)
+
+    @property
+    def Components(self)-> list["IfcAppliedValue"]:
+        """<attribute Components?: <list [1:?] of <entity IfcAppliedValue>>>"""
+        return self._get_attribute("Components")
+
+    @Components.setter
+    def Components(self, value: list["IfcAppliedValue"]):
+        return self._set_attribute("Components", value)
+
+    def HasExternalReference(self)-> list["IfcExternalReferenceRelationship"]:
+        """<inverse HasExternalReference: set [0:?] of <entity IfcExternalReferenceRelationship> for <attribute RelatedResourceObjects: <set [1:?] of <select IfcResourceObjectSelect: (<entity IfcActorRole> | <entity IfcAppliedValue> | <entity IfcApproval> | <entity IfcConstraint> | <entity IfcContextDependentUnit> | <entity IfcConversionBasedUnit> | <entity IfcExternalInformation> | <entity IfcExternalReference> | <entity IfcMaterialDefinition> | <entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization> | <entity IfcPhysicalQuantity> | <entity IfcProfileDef> | <entity IfcPropertyAbstraction> | <entity IfcTimeSeries>)>>>>"""
+        return self._get_inverse_attribute("HasExternalReference")
@@ -0,0 +1,116 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcapprovalrelationship import IfcApprovalRelationship
+    from .ifcexternalreferencerelationship import IfcExternalReferenceRelationship
+    from .ifcorganization import IfcOrganization
+    from .ifcperson import IfcPerson
+    from .ifcpersonandorganization import IfcPersonAndOrganization
+    from .ifcrelassociatesapproval import IfcRelAssociatesApproval
+    from .ifcresourceapprovalrelationship import IfcResourceApprovalRelationship
+
+class IfcApproval(Base):
+    """Wrapper class for IfcApproval."""
+
+    @property
+    def Identifier(self)-> str:
+        """<attribute Identifier?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Identifier")
+
+    @Identifier.setter
+    def Identifier(self, value: str):
+        return self._set_attribute("Identifier", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def TimeOfApproval(self)-> str:
+        """<attribute TimeOfApproval?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("TimeOfApproval")
+
+    @TimeOfApproval.setter
+    def TimeOfApproval(self, value: str):
+        return self._set_attribute("TimeOfApproval", value)
+
+    @property
+    def Status(self)-> str:
+        """<attribute Status?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Status")
+
+    @Status.setter
+    def Status(self, value: str):
+        return self._set_attribute("Status", value)
+
+    @property
+    def Level(self)-> str:
+        """<attribute Level?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Level")
+
+    @Level.setter
+    def Level(self, value: str):
+        return self._set_attribute("Level", value)
+
+    @property
+    def Qualifier(self)-> str:
+        """<attribute Qualifier?: <type IfcText: <string>>>"""
+        return self._get_attribute("Qualifier")
+
+    @Qualifier.setter
+    def Qualifier(self, value: str):
+        return self._set_attribute("Qualifier", value)
+
+    @property
+    def RequestingApproval(self)-> Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]:
+        """<attribute RequestingApproval?: <select IfcActorSelect: (<entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization>)>>"""
+        return self._get_attribute("RequestingApproval")
+
+    @RequestingApproval.setter
+    def RequestingApproval(self, value: Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]):
+        return self._set_attribute("RequestingApproval", value)
+
+    @property
+    def GivingApproval(self)-> Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]:
+        """<attribute GivingApproval?: <select IfcActorSelect: (<entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization>)>>"""
+        return self._get_attribute("GivingApproval")
+
+    @GivingApproval.setter
+    def GivingApproval(self, value: Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]):
+        return self._set_attribute("GivingApproval", value)
+
+    def HasExternalReferences(self)-> list["IfcExternalReferenceRelationship"]:
+        """<inverse HasExternalReferences: set [0:?] of <entity IfcExternalReferenceRelationship> for <attribute RelatedResourceObjects: <set [1:?] of <select IfcResourceObjectSelect: (<entity IfcActorRole> | <entity IfcAppliedValue> | <entity IfcApproval> | <entity IfcConstraint> | <entity IfcContextDependentUnit> | <entity IfcConversionBasedUnit> | <entity IfcExternalInformation> | <entity IfcExternalReference> | <entity IfcMaterialDefinition> | <entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization> | <entity IfcPhysicalQuantity> | <entity IfcProfileDef> | <entity IfcPropertyAbstraction> | <entity IfcTimeSeries>)>>>>"""
+        return self._get_inverse_attribute("HasExternalReferences")
+
+    def ApprovedObjects(self)-> list["IfcRelAssociatesApproval"]:
+        """<inverse ApprovedObjects: set [0:?] of <entity IfcRelAssociatesApproval> for <attribute RelatingApproval: <entity IfcApproval>>>"""
+        return self._get_inverse_attribute("ApprovedObjects")
+
+    def ApprovedResources(self)-> list["IfcResourceApprovalRelationship"]:
+        """<inverse ApprovedResources: set [0:?] of <entity IfcResourceApprovalRelationship> for <attribute RelatingApproval: <entity IfcApproval>>>"""
+        return self._get_inverse_attribute("ApprovedResources")
+
+    def IsRelatedWith(self)-> list["IfcApprovalRelationship"]:
+        """<inverse IsRelatedWith: set [0:?] of <entity IfcApprovalRelationship> for <attribute RelatedApprovals: <set [1:?] of <entity IfcApproval>>>>"""
+        return self._get_inverse_attribute("IsRelatedWith")
+
+    def Relates(self)-> list["IfcApprovalRelationship"]:
+        """<inverse Relates: set [0:?] of <entity IfcApprovalRelationship> for <attribute RelatingApproval: <entity IfcApproval>>>"""
+        return self._get_inverse_attribute("Relates")
@@ -0,0 +1,26 @@
+from .ifcresourcelevelrelationship import IfcResourceLevelRelationship
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcapproval import IfcApproval
+
+class IfcApprovalRelationship(IfcResourceLevelRelationship):
+    """Wrapper class for IfcApprovalRelationship."""
+
+    @property
+    def RelatingApproval(self)-> "IfcApproval":
+        """<attribute RelatingApproval: <entity IfcApproval>>"""
+        return self._get_attribute("RelatingApproval")
+
+    @RelatingApproval.setter
+    def RelatingApproval(self, value: "IfcApproval"):
+        return self._set_attribute("RelatingApproval", value)
+
+    @property
+    def RelatedApprovals(self)-> list["IfcApproval"]:
+        """<attribute RelatedApprovals: <set [1:?] of <entity IfcApproval>>>"""
+        return self._get_attribute("RelatedApprovals")
+
+    @RelatedApprovals.setter
+    def RelatedApprovals(self, value: list["IfcApproval"]):
+        return self._set_attribute("RelatedApprovals", value)
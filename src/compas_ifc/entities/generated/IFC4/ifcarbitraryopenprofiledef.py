@@ -0,0 +1,17 @@
+from .ifcprofiledef import IfcProfileDef
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcboundedcurve import IfcBoundedCurve
+
+class IfcArbitraryOpenProfileDef(IfcProfileDef):
+    """Wrapper class for IfcArbitraryOpenProfileDef."""
+
+    @property
+    def Curve(self)-> "IfcBoundedCurve":
+        """<attribute Curve: <entity IfcBoundedCurve>>"""
+        return self._get_attribute("Curve")
+
+    @Curve.setter
+    def Curve(self, value: "IfcBoundedCurve"):
+        return self._set_attribute("Curve", value)
@@ -0,0 +1,17 @@
+from .ifcarbitraryclosedprofiledef import IfcArbitraryClosedProfileDef
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccurve import IfcCurve
+
+class IfcArbitraryProfileDefWithVoids(IfcArbitraryClosedProfileDef):
+    """Wrapper class for IfcArbitraryProfileDefWithVoids."""
+
+    @property
+    def InnerCurves(self)-> list["IfcCurve"]:
+        """<attribute InnerCurves: <set [1:?] of <entity IfcCurve>>>"""
+        return self._get_attribute("InnerCurves")
+
+    @InnerCurves.setter
+    def InnerCurves(self, value: list["IfcCurve"]):
+        return self._set_attribute("InnerCurves", value)
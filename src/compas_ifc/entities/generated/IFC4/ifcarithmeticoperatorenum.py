@@ -0,0 +1,2 @@
+class IfcArithmeticOperatorEnum(str):
+    items = ['ADD', 'DIVIDE', 'MULTIPLY', 'SUBTRACT']
@@ -0,0 +1,2 @@
+class IfcAssemblyPlaceEnum(str):
+    items = ['SITE', 'FACTORY', 'NOTDEFINED']
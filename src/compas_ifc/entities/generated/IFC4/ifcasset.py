@@ -0,0 +1,93 @@
+from .ifcgroup import IfcGroup
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccostvalue import IfcCostValue
+    from .ifcorganization import IfcOrganization
+    from .ifcperson import IfcPerson
+    from .ifcpersonandorganization import IfcPersonAndOrganization
+
+class IfcAsset(IfcGroup):
+    """Wrapper class for IfcAsset."""
+
+    @property
+    def Identification(self)-> str:
+        """<attribute Identification?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Identification")
+
+    @Identification.setter
+    def Identification(self, value: str):
+        return self._set_attribute("Identification", value)
+
+    @property
+    def OriginalValue(self)-> "IfcCostValue":
+        """<attribute OriginalValue?: <entity IfcCostValue>>"""
+        return self._get_attribute("OriginalValue")
+
+    @OriginalValue.setter
+    def OriginalValue(self, value: "IfcCostValue"):
+        return self._set_attribute("OriginalValue", value)
+
+    @property
+    def CurrentValue(self)-> "IfcCostValue":
+        """<attribute CurrentValue?: <entity IfcCostValue>>"""
+        return self._get_attribute("CurrentValue")
+
+    @CurrentValue.setter
+    def CurrentValue(self, value: "IfcCostValue"):
+        return self._set_attribute("CurrentValue", value)
+
+    @property
+    def TotalReplacementCost(self)-> "IfcCostValue":
+        """<attribute TotalReplacementCost?: <entity IfcCostValue>>"""
+        return self._get_attribute("TotalReplacementCost")
+
+    @TotalReplacementCost.setter
+    def TotalReplacementCost(self, value: "IfcCostValue"):
+        return self._set_attribute("TotalReplacementCost", value)
+
+    @property
+    def Owner(self)-> Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]:
+        """<attribute Owner?: <select IfcActorSelect: (<entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization>)>>"""
+        return self._get_attribute("Owner")
+
+    @Owner.setter
+    def Owner(self, value: Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]):
+        return self._set_attribute("Owner", value)
+
+    @property
+    def User(self)-> Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]:
+        """<attribute User?: <select IfcActorSelect: (<entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization>)>>"""
+        return self._get_attribute("User")
+
+    @User.setter
+    def User(self, value: Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]):
+        return self._set_attribute("User", value)
+
+    @property
+    def ResponsiblePerson(self)-> "IfcPerson":
+        """<attribute ResponsiblePerson?: <entity IfcPerson>>"""
+        return self._get_attribute("ResponsiblePerson")
+
+    @ResponsiblePerson.setter
+    def ResponsiblePerson(self, value: "IfcPerson"):
+        return self._set_attribute("ResponsiblePerson", value)
+
+    @property
+    def IncorporationDate(self)-> str:
+        """<attribute IncorporationDate?: <type IfcDate: <string>>>"""
+        return self._get_attribute("IncorporationDate")
+
+    @IncorporationDate.setter
+    def IncorporationDate(self, value: str):
+        return self._set_attribute("IncorporationDate", value)
+
+    @property
+    def DepreciatedValue(self)-> "IfcCostValue":
+        """<attribute DepreciatedValue?: <entity IfcCostValue>>"""
+        return self._get_attribute("DepreciatedValue")
+
+    @DepreciatedValue.setter
+    def DepreciatedValue(self, value: "IfcCostValue"):
+        return self._set_attribute("DepreciatedValue", value)
@@ -0,0 +1,113 @@
+from .ifcparameterizedprofiledef import IfcParameterizedProfileDef
+
+
+class IfcAsymmetricIShapeProfileDef(IfcParameterizedProfileDef):
+    """Wrapper class for IfcAsymmetricIShapeProfileDef."""
+
+    @property
+    def BottomFlangeWidth(self)-> float:
+        """<attribute BottomFlangeWidth: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("BottomFlangeWidth")
+
+    @BottomFlangeWidth.setter
+    def BottomFlangeWidth(self, value: float):
+        return self._set_attribute("BottomFlangeWidth", value)
+
+    @property
+    def OverallDepth(self)-> float:
+        """<attribute OverallDepth: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("OverallDepth")
+
+    @OverallDepth.setter
+    def OverallDepth(self, value: float):
+        return self._set_attribute("OverallDepth", value)
+
+    @property
+    def WebThickness(self)-> float:
+        """<attribute WebThickness: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("WebThickness")
+
+    @WebThickness.setter
+    def WebThickness(self, value: float):
+        return self._set_attribute("WebThickness", value)
+
+    @property
+    def BottomFlangeThickness(self)-> float:
+        """<attribute BottomFlangeThickness: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("BottomFlangeThickness")
+
+    @BottomFlangeThickness.setter
+    def BottomFlangeThickness(self, value: float):
+        return self._set_attribute("BottomFlangeThickness", value)
+
+    @property
+    def BottomFlangeFilletRadius(self)-> float:
+        """<attribute BottomFlangeFilletRadius?: <type IfcNonNegativeLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("BottomFlangeFilletRadius")
+
+    @BottomFlangeFilletRadius.setter
+    def BottomFlangeFilletRadius(self, value: float):
+        return self._set_attribute("BottomFlangeFilletRadius", value)
+
+    @property
+    def TopFlangeWidth(self)-> float:
+        """<attribute TopFlangeWidth: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("TopFlangeWidth")
+
+    @TopFlangeWidth.setter
+    def TopFlangeWidth(self, value: float):
+        return self._set_attribute("TopFlangeWidth", value)
+
+    @property
+    def TopFlangeThickness(self)-> float:
+        """<attribute TopFlangeThickness?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("TopFlangeThickness")
+
+    @TopFlangeThickness.setter
+    def TopFlangeThickness(self, value: float):
+        return self._set_attribute("TopFlangeThickness", value)
+
+    @property
+    def TopFlangeFilletRadius(self)-> float:
+        """<attribute TopFlangeFilletRadius?: <type IfcNonNegativeLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("TopFlangeFilletRadius")
+
+    @TopFlangeFilletRadius.setter
+    def TopFlangeFilletRadius(self, value: float):
+        return self._set_attribute("TopFlangeFilletRadius", value)
+
+    @property
+    def BottomFlangeEdgeRadius(self)-> float:
+        """<attribute BottomFlangeEdgeRadius?: <type IfcNonNegativeLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("BottomFlangeEdgeRadius")
+
+    @BottomFlangeEdgeRadius.setter
+    def BottomFlangeEdgeRadius(self, value: float):
+        return self._set_attribute("BottomFlangeEdgeRadius", value)
+
+    @property
+    def BottomFlangeSlope(self)-> float:
+        """<attribute BottomFlangeSlope?: <type IfcPlaneAngleMeasure: <real>>>"""
+        return self._get_attribute("BottomFlangeSlope")
+
+    @BottomFlangeSlope.setter
+    def BottomFlangeSlope(self, value: float):
+        return self._set_attribute("BottomFlangeSlope", value)
+
+    @property
+    def TopFlangeEdgeRadius(self)-> float:
+        """<attribute TopFlangeEdgeRadius?: <type IfcNonNegativeLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("TopFlangeEdgeRadius")
+
+    @TopFlangeEdgeRadius.setter
+    def TopFlangeEdgeRadius(self, value: float):
+        return self._set_attribute("TopFlangeEdgeRadius", value)
+
+    @property
+    def TopFlangeSlope(self)-> float:
+        """<attribute TopFlangeSlope?: <type IfcPlaneAngleMeasure: <real>>>"""
+        return self._get_attribute("TopFlangeSlope")
+
+    @TopFlangeSlope.setter
+    def TopFlangeSlope(self, value: float):
+        return self._set_attribute("TopFlangeSlope", value)
@@ -0,0 +1,17 @@
+from .ifcflowterminaltype import IfcFlowTerminalType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaudiovisualappliancetypeenum import IfcAudioVisualApplianceTypeEnum
+
+class IfcAudioVisualApplianceType(IfcFlowTerminalType):
+    """Wrapper class for IfcAudioVisualApplianceType."""
+
+    @property
+    def PredefinedType(self)-> "IfcAudioVisualApplianceTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcAudioVisualApplianceTypeEnum: (AMPLIFIER, CAMERA, DISPLAY, MICROPHONE, PLAYER, PROJECTOR, RECEIVER, SPEAKER, SWITCHER, TELEPHONE, TUNER, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcAudioVisualApplianceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcAudioVisualApplianceTypeEnum(str):
+    items = ['AMPLIFIER', 'CAMERA', 'DISPLAY', 'MICROPHONE', 'PLAYER', 'PROJECTOR', 'RECEIVER', 'SPEAKER', 'SWITCHER', 'TELEPHONE', 'TUNER', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,26 @@
+from .ifcplacement import IfcPlacement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdirection import IfcDirection
+
+class IfcAxis2Placement3D(IfcPlacement):
+    """Wrapper class for IfcAxis2Placement3D."""
+
+    @property
+    def Axis(self)-> "IfcDirection":
+        """<attribute Axis?: <entity IfcDirection>>"""
+        return self._get_attribute("Axis")
+
+    @Axis.setter
+    def Axis(self, value: "IfcDirection"):
+        return self._set_attribute("Axis", value)
+
+    @property
+    def RefDirection(self)-> "IfcDirection":
+        """<attribute RefDirection?: <entity IfcDirection>>"""
+        return self._get_attribute("RefDirection")
+
+    @RefDirection.setter
+    def RefDirection(self, value: "IfcDirection"):
+        return self._set_attribute("RefDirection", value)
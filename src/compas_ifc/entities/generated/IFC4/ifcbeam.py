@@ -0,0 +1,17 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcbeamtypeenum import IfcBeamTypeEnum
+
+class IfcBeam(IfcBuildingElement):
+    """Wrapper class for IfcBeam."""
+
+    @property
+    def PredefinedType(self)-> "IfcBeamTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcBeamTypeEnum: (BEAM, JOIST, HOLLOWCORE, LINTEL, SPANDREL, T_BEAM, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcBeamTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
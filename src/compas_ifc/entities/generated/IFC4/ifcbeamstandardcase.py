@@ -0,0 +1,5 @@
+from .ifcbeam import IfcBeam
+
+
+class IfcBeamStandardCase(IfcBeam):
+    """Wrapper class for IfcBeamStandardCase."""
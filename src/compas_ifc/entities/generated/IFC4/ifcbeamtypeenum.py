@@ -0,0 +1,2 @@
+class IfcBeamTypeEnum(str):
+    items = ['BEAM', 'JOIST', 'HOLLOWCORE', 'LINTEL', 'SPANDREL', 'T_BEAM', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,2 @@
+class IfcBenchmarkEnum(str):
+    items = ['GREATERTHAN', 'GREATERTHANOREQUALTO', 'LESSTHAN', 'LESSTHANOREQUALTO', 'EQUALTO', 'NOTEQUALTO', 'INCLUDES', 'NOTINCLUDES', 'INCLUDEDIN', 'NOTINCLUDEDIN']
@@ -0,0 +1,23 @@
+from .ifcsurfacetexture import IfcSurfaceTexture
+
+
+class IfcBlobTexture(IfcSurfaceTexture):
+    """Wrapper class for IfcBlobTexture."""
+
+    @property
+    def RasterFormat(self)-> str:
+        """<attribute RasterFormat: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("RasterFormat")
+
+    @RasterFormat.setter
+    def RasterFormat(self, value: str):
+        return self._set_attribute("RasterFormat", value)
+
+    @property
+    def RasterCode(self)-> bytes:
+        """<attribute RasterCode: <type IfcBinary: <binary>>>"""
+        return self._get_attribute("RasterCode")
+
+    @RasterCode.setter
+    def RasterCode(self, value: bytes):
+        return self._set_attribute("RasterCode", value)
@@ -0,0 +1,40 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcbooleanoperator import IfcBooleanOperator
+    from .ifccsgprimitive3d import IfcCsgPrimitive3D
+    from .ifchalfspacesolid import IfcHalfSpaceSolid
+    from .ifcsolidmodel import IfcSolidModel
+    from .ifctessellatedfaceset import IfcTessellatedFaceSet
+
+class IfcBooleanResult(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcBooleanResult."""
+
+    @property
+    def Operator(self)-> "IfcBooleanOperator":
+        """<attribute Operator: <enumeration IfcBooleanOperator: (UNION, INTERSECTION, DIFFERENCE)>>"""
+        return self._get_attribute("Operator")
+
+    @Operator.setter
+    def Operator(self, value: "IfcBooleanOperator"):
+        return self._set_attribute("Operator", value)
+
+    @property
+    def FirstOperand(self)-> Union["IfcHalfSpaceSolid", "IfcSolidModel", "IfcCsgPrimitive3D", "IfcBooleanResult", "IfcTessellatedFaceSet"]:
+        """<attribute FirstOperand: <select IfcBooleanOperand: (<entity IfcBooleanResult> | <entity IfcCsgPrimitive3D> | <entity IfcHalfSpaceSolid> | <entity IfcSolidModel> | <entity IfcTessellatedFaceSet>)>>"""
+        return self._get_attribute("FirstOperand")
+
+    @FirstOperand.setter
+    def FirstOperand(self, value: Union["IfcHalfSpaceSolid", "IfcSolidModel", "IfcCsgPrimitive3D", "IfcBooleanResult", "IfcTessellatedFaceSet"]):
+        return self._set_attribute("FirstOperand", value)
+
+    @property
+    def SecondOperand(self)-> Union["IfcHalfSpaceSolid", "IfcSolidModel", "IfcCsgPrimitive3D", "IfcBooleanResult", "IfcTessellatedFaceSet"]:
+        """<attribute SecondOperand: <select IfcBooleanOperand: (<entity IfcBooleanResult> | <entity IfcCsgPrimitive3D> | <entity IfcHalfSpaceSolid> | <entity IfcSolidModel> | <entity IfcTessellatedFaceSet>)>>"""
+        return self._get_attribute("SecondOperand")
+
+    @SecondOperand.setter
+    def SecondOperand(self, value: Union["IfcHalfSpaceSolid", "IfcSolidModel", "IfcCsgPrimitive3D", "IfcBooleanResult", "IfcTessellatedFaceSet"]):
+        return self._set_attribute("SecondOperand", value)
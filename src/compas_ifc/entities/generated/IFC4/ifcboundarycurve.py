@@ -0,0 +1,5 @@
+from .ifccompositecurveonsurface import IfcCompositeCurveOnSurface
+
+
+class IfcBoundaryCurve(IfcCompositeCurveOnSurface):
+    """Wrapper class for IfcBoundaryCurve."""
@@ -0,0 +1,60 @@
+from .ifcboundarycondition import IfcBoundaryCondition
+from typing import Union
+
+
+class IfcBoundaryEdgeCondition(IfcBoundaryCondition):
+    """Wrapper class for IfcBoundaryEdgeCondition."""
+
+    @property
+    def TranslationalStiffnessByLengthX(self)-> Union[float, bool]:
+        """<attribute TranslationalStiffnessByLengthX?: <select IfcModulusOfTranslationalSubgradeReactionSelect: (<type IfcBoolean: <boolean>> | <type IfcModulusOfLinearSubgradeReactionMeasure: <real>>)>>"""
+        return self._get_attribute("TranslationalStiffnessByLengthX")
+
+    @TranslationalStiffnessByLengthX.setter
+    def TranslationalStiffnessByLengthX(self, value: Union[float, bool]):
+        return self._set_attribute("TranslationalStiffnessByLengthX", value)
+
+    @property
+    def TranslationalStiffnessByLengthY(self)-> Union[float, bool]:
+        """<attribute TranslationalStiffnessByLengthY?: <select IfcModulusOfTranslationalSubgradeReactionSelect: (<type IfcBoolean: <boolean>> | <type IfcModulusOfLinearSubgradeReactionMeasure: <real>>)>>"""
+        return self._get_attribute("TranslationalStiffnessByLengthY")
+
+    @TranslationalStiffnessByLengthY.setter
+    def TranslationalStiffnessByLengthY(self, value: Union[float, bool]):
+        return self._set_attribute("TranslationalStiffnessByLengthY", value)
+
+    @property
+    def TranslationalStiffnessByLengthZ(self)-> Union[float, bool]:
+        """<attribute TranslationalStiffnessByLengthZ?: <select IfcModulusOfTranslationalSubgradeReactionSelect: (<type IfcBoolean: <boolean>> | <type IfcModulusOfLinearSubgradeReactionMeasure: <real>>)>>"""
+        return self._get_attribute("TranslationalStiffnessByLengthZ")
+
+    @TranslationalStiffnessByLengthZ.setter
+    def TranslationalStiffnessByLengthZ(self, value: Union[float, bool]):
+        return self._set_attribute("TranslationalStiffnessByLengthZ", value)
+
+    @property
+    def RotationalStiffnessByLengthX(self)-> Union[float, bool]:
+        """<attribute RotationalStiffnessByLengthX?: <select IfcModulusOfRotationalSubgradeReactionSelect: (<type IfcBoolean: <boolean>> | <type IfcModulusOfRotationalSubgradeReactionMeasure: <real>>)>>"""
+        return self._get_attribute("RotationalStiffnessByLengthX")
+
+    @RotationalStiffnessByLengthX.setter
+    def RotationalStiffnessByLengthX(self, value: Union[float, bool]):
+        return self._set_attribute("RotationalStiffnessByLengthX", value)
+
+    @property
+    def RotationalStiffnessByLengthY(self)-> Union[float, bool]:
+        """<attribute RotationalStiffnessByLengthY?: <select IfcModulusOfRotationalSubgradeReactionSelect: (<type IfcBoolean: <boolean>> | <type IfcModulusOfRotationalSubgradeReactionMeasure: <real>>)>>"""
+        return self._get_attribute("RotationalStiffnessByLengthY")
+
+    @RotationalStiffnessByLengthY.setter
+    def RotationalStiffnessByLengthY(self, value: Union[float, bool]):
+        return self._set_attribute("RotationalStiffnessByLengthY", value)
+
+    @property
+    def RotationalStiffnessByLengthZ(self)-> Union[float, bool]:
+        """<attribute RotationalStiffnessByLengthZ?: <select IfcModulusOfRotationalSubgradeReactionSelect: (<type IfcBoolean: <boolean>> | <type IfcModulusOfRotationalSubgradeReactionMeasure: <real>>)>>"""
+        return self._get_attribute("RotationalStiffnessByLengthZ")
+
+    @RotationalStiffnessByLengthZ.setter
+    def RotationalStiffnessByLengthZ(self, value: Union[float, bool]):
+        return self._set_attribute("RotationalStiffnessByLengthZ", value)
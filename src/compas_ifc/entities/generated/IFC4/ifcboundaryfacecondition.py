@@ -0,0 +1,33 @@
+from .ifcboundarycondition import IfcBoundaryCondition
+from typing import Union
+
+
+class IfcBoundaryFaceCondition(IfcBoundaryCondition):
+    """Wrapper class for IfcBoundaryFaceCondition."""
+
+    @property
+    def TranslationalStiffnessByAreaX(self)-> Union[float, bool]:
+        """<attribute TranslationalStiffnessByAreaX?: <select IfcModulusOfSubgradeReactionSelect: (<type IfcBoolean: <boolean>> | <type IfcModulusOfSubgradeReactionMeasure: <real>>)>>"""
+        return self._get_attribute("TranslationalStiffnessByAreaX")
+
+    @TranslationalStiffnessByAreaX.setter
+    def TranslationalStiffnessByAreaX(self, value: Union[float, bool]):
+        return self._set_attribute("TranslationalStiffnessByAreaX", value)
+
+    @property
+    def TranslationalStiffnessByAreaY(self)-> Union[float, bool]:
+        """<attribute TranslationalStiffnessByAreaY?: <select IfcModulusOfSubgradeReactionSelect: (<type IfcBoolean: <boolean>> | <type IfcModulusOfSubgradeReactionMeasure: <real>>)>>"""
+        return self._get_attribute("TranslationalStiffnessByAreaY")
+
+    @TranslationalStiffnessByAreaY.setter
+    def TranslationalStiffnessByAreaY(self, value: Union[float, bool]):
+        return self._set_attribute("TranslationalStiffnessByAreaY", value)
+
+    @property
+    def TranslationalStiffnessByAreaZ(self)-> Union[float, bool]:
+        """<attribute TranslationalStiffnessByAreaZ?: <select IfcModulusOfSubgradeReactionSelect: (<type IfcBoolean: <boolean>> | <type IfcModulusOfSubgradeReactionMeasure: <real>>)>>"""
+        return self._get_attribute("TranslationalStiffnessByAreaZ")
+
+    @TranslationalStiffnessByAreaZ.setter
+    def TranslationalStiffnessByAreaZ(self, value: Union[float, bool]):
+        return self._set_attribute("TranslationalStiffnessByAreaZ", value)
@@ -0,0 +1,60 @@
+from .ifcboundarycondition import IfcBoundaryCondition
+from typing import Union
+
+
+class IfcBoundaryNodeCondition(IfcBoundaryCondition):
+    """Wrapper class for IfcBoundaryNodeCondition."""
+
+    @property
+    def TranslationalStiffnessX(self)-> Union[float, bool]:
+        """<attribute TranslationalStiffnessX?: <select IfcTranslationalStiffnessSelect: (<type IfcBoolean: <boolean>> | <type IfcLinearStiffnessMeasure: <real>>)>>"""
+        return self._get_attribute("TranslationalStiffnessX")
+
+    @TranslationalStiffnessX.setter
+    def TranslationalStiffnessX(self, value: Union[float, bool]):
+        return self._set_attribute("TranslationalStiffnessX", value)
+
+    @property
+    def TranslationalStiffnessY(self)-> Union[float, bool]:
+        """<attribute TranslationalStiffnessY?: <select IfcTranslationalStiffnessSelect: (<type IfcBoolean: <boolean>> | <type IfcLinearStiffnessMeasure: <real>>)>>"""
+        return self._get_attribute("TranslationalStiffnessY")
+
+    @TranslationalStiffnessY.setter
+    def TranslationalStiffnessY(self, value: Union[float, bool]):
+        return self._set_attribute("TranslationalStiffnessY", value)
+
+    @property
+    def TranslationalStiffnessZ(self)-> Union[float, bool]:
+        """<attribute TranslationalStiffnessZ?: <select IfcTranslationalStiffnessSelect: (<type IfcBoolean: <boolean>> | <type IfcLinearStiffnessMeasure: <real>>)>>"""
+        return self._get_attribute("TranslationalStiffnessZ")
+
+    @TranslationalStiffnessZ.setter
+    def TranslationalStiffnessZ(self, value: Union[float, bool]):
+        return self._set_attribute("TranslationalStiffnessZ", value)
+
+    @property
+    def RotationalStiffnessX(self)-> Union[float, bool]:
+        """<attribute RotationalStiffnessX?: <select IfcRotationalStiffnessSelect: (<type IfcBoolean: <boolean>> | <type IfcRotationalStiffnessMeasure: <real>>)>>"""
+        return self._get_attribute("RotationalStiffnessX")
+
+    @RotationalStiffnessX.setter
+    def RotationalStiffnessX(self, value: Union[float, bool]):
+        return self._set_attribute("RotationalStiffnessX", value)
+
+    @property
+    def RotationalStiffnessY(self)-> Union[float, bool]:
+        """<attribute RotationalStiffnessY?: <select IfcRotationalStiffnessSelect: (<type IfcBoolean: <boolean>> | <type IfcRotationalStiffnessMeasure: <real>>)>>"""
+        return self._get_attribute("RotationalStiffnessY")
+
+    @RotationalStiffnessY.setter
+    def RotationalStiffnessY(self, value: Union[float, bool]):
+        return self._set_attribute("RotationalStiffnessY", value)
+
+    @property
+    def RotationalStiffnessZ(self)-> Union[float, bool]:
+        """<attribute RotationalStiffnessZ?: <select IfcRotationalStiffnessSelect: (<type IfcBoolean: <boolean>> | <type IfcRotationalStiffnessMeasure: <real>>)>>"""
+        return self._get_attribute("RotationalStiffnessZ")
+
+    @RotationalStiffnessZ.setter
+    def RotationalStiffnessZ(self, value: Union[float, bool]):
+        return self._set_attribute("RotationalStiffnessZ", value)
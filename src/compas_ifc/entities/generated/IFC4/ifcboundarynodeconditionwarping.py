@@ -0,0 +1,15 @@
+from .ifcboundarynodecondition import IfcBoundaryNodeCondition
+from typing import Union
+
+
+class IfcBoundaryNodeConditionWarping(IfcBoundaryNodeCondition):
+    """Wrapper class for IfcBoundaryNodeConditionWarping."""
+
+    @property
+    def WarpingStiffness(self)-> Union[float, bool]:
+        """<attribute WarpingStiffness?: <select IfcWarpingStiffnessSelect: (<type IfcBoolean: <boolean>> | <type IfcWarpingMomentMeasure: <real>>)>>"""
+        return self._get_attribute("WarpingStiffness")
+
+    @WarpingStiffness.setter
+    def WarpingStiffness(self, value: Union[float, bool]):
+        return self._set_attribute("WarpingStiffness", value)
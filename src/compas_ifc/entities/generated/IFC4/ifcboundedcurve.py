@@ -0,0 +1,5 @@
+from .ifccurve import IfcCurve
+
+
+class IfcBoundedCurve(IfcCurve):
+    """Wrapper class for IfcBoundedCurve."""
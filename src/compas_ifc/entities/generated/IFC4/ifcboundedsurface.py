@@ -0,0 +1,5 @@
+from .ifcsurface import IfcSurface
+
+
+class IfcBoundedSurface(IfcSurface):
+    """Wrapper class for IfcBoundedSurface."""
@@ -0,0 +1,17 @@
+from .ifchalfspacesolid import IfcHalfSpaceSolid
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcboundingbox import IfcBoundingBox
+
+class IfcBoxedHalfSpace(IfcHalfSpaceSolid):
+    """Wrapper class for IfcBoxedHalfSpace."""
+
+    @property
+    def Enclosure(self)-> "IfcBoundingBox":
+        """<attribute Enclosure: <entity IfcBoundingBox>>"""
+        return self._get_attribute("Enclosure")
+
+    @Enclosure.setter
+    def Enclosure(self, value: "IfcBoundingBox"):
+        return self._set_attribute("Enclosure", value)
@@ -0,0 +1,2 @@
+class IfcBSplineCurveForm(str):
+    items = ['POLYLINE_FORM', 'CIRCULAR_ARC', 'ELLIPTIC_ARC', 'PARABOLIC_ARC', 'HYPERBOLIC_ARC', 'UNSPECIFIED']
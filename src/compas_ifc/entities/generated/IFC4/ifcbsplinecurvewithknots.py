@@ -0,0 +1,35 @@
+from .ifcbsplinecurve import IfcBSplineCurve
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcknottype import IfcKnotType
+
+class IfcBSplineCurveWithKnots(IfcBSplineCurve):
+    """Wrapper class for IfcBSplineCurveWithKnots."""
+
+    @property
+    def KnotMultiplicities(self)-> list[int]:
+        """<attribute KnotMultiplicities: <list [2:?] of <type IfcInteger: <integer>>>>"""
+        return self._get_attribute("KnotMultiplicities")
+
+    @KnotMultiplicities.setter
+    def KnotMultiplicities(self, value: list[int]):
+        return self._set_attribute("KnotMultiplicities", value)
+
+    @property
+    def Knots(self)-> list[float]:
+        """<attribute Knots: <list [2:?] of <type IfcParameterValue: <real>>>>"""
+        return self._get_attribute("Knots")
+
+    @Knots.setter
+    def Knots(self, value: list[float]):
+        return self._set_attribute("Knots", value)
+
+    @property
+    def KnotSpec(self)-> "IfcKnotType":
+        """<attribute KnotSpec: <enumeration IfcKnotType: (UNIFORM_KNOTS, QUASI_UNIFORM_KNOTS, PIECEWISE_BEZIER_KNOTS, UNSPECIFIED)>>"""
+        return self._get_attribute("KnotSpec")
+
+    @KnotSpec.setter
+    def KnotSpec(self, value: "IfcKnotType"):
+        return self._set_attribute("KnotSpec", value)
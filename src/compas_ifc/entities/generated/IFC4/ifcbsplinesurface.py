@@ -0,0 +1,72 @@
+from .ifcboundedsurface import IfcBoundedSurface
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcbsplinesurfaceform import IfcBSplineSurfaceForm
+    from .ifccartesianpoint import IfcCartesianPoint
+
+class IfcBSplineSurface(IfcBoundedSurface):
+    """Wrapper class for IfcBSplineSurface."""
+
+    @property
+    def UDegree(self)-> int:
+        """<attribute UDegree: <type IfcInteger: <integer>>>"""
+        return self._get_attribute("UDegree")
+
+    @UDegree.setter
+    def UDegree(self, value: int):
+        return self._set_attribute("UDegree", value)
+
+    @property
+    def VDegree(self)-> int:
+        """<attribute VDegree: <type IfcInteger: <integer>>>"""
+        return self._get_attribute("VDegree")
+
+    @VDegree.setter
+    def VDegree(self, value: int):
+        return self._set_attribute("VDegree", value)
+
+    @property
+    def ControlPointsList(self)-> list[list["IfcCartesianPoint"]]:
+        """<attribute ControlPointsList: <list [2:?] of <list [2:?] of <entity IfcCartesianPoint>>>>"""
+        return self._get_attribute("ControlPointsList")
+
+    @ControlPointsList.setter
+    def ControlPointsList(self, value: list[list["IfcCartesianPoint"]]):
+        return self._set_attribute("ControlPointsList", value)
+
+    @property
+    def SurfaceForm(self)-> "IfcBSplineSurfaceForm":
+        """<attribute SurfaceForm: <enumeration IfcBSplineSurfaceForm: (PLANE_SURF, CYLINDRICAL_SURF, CONICAL_SURF, SPHERICAL_SURF, TOROIDAL_SURF, SURF_OF_REVOLUTION, RULED_SURF, GENERALISED_CONE, QUADRIC_SURF, SURF_OF_LINEAR_EXTRUSION, UNSPECIFIED)>>"""
+        return self._get_attribute("SurfaceForm")
+
+    @SurfaceForm.setter
+    def SurfaceForm(self, value: "IfcBSplineSurfaceForm"):
+        return self._set_attribute("SurfaceForm", value)
+
+    @property
+    def UClosed(self)-> bool:
+        """<attribute UClosed: <type IfcLogical: <logical>>>"""
+        return self._get_attribute("UClosed")
+
+    @UClosed.setter
+    def UClosed(self, value: bool):
+        return self._set_attribute("UClosed", value)
+
+    @property
+    def VClosed(self)-> bool:
+        """<attribute VClosed: <type IfcLogical: <logical>>>"""
+        return self._get_attribute("VClosed")
+
+    @VClosed.setter
+    def VClosed(self, value: bool):
+        return self._set_attribute("VClosed", value)
+
+    @property
+    def SelfIntersect(self)-> bool:
+        """<attribute SelfIntersect: <type IfcLogical: <logical>>>"""
+        return self._get_attribute("SelfIntersect")
+
+    @SelfIntersect.setter
+    def SelfIntersect(self, value: bool):
+        return self._set_attribute("SelfIntersect", value)
@@ -0,0 +1,2 @@
+class IfcBSplineSurfaceForm(str):
+    items = ['PLANE_SURF', 'CYLINDRICAL_SURF', 'CONICAL_SURF', 'SPHERICAL_SURF', 'TOROIDAL_SURF', 'SURF_OF_REVOLUTION', 'RULED_SURF', 'GENERALISED_CONE', 'QUADRIC_SURF', 'SURF_OF_LINEAR_EXTRUSION', 'UNSPECIFIED']
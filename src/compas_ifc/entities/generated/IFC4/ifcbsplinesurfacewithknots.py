@@ -0,0 +1,53 @@
+from .ifcbsplinesurface import IfcBSplineSurface
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcknottype import IfcKnotType
+
+class IfcBSplineSurfaceWithKnots(IfcBSplineSurface):
+    """Wrapper class for IfcBSplineSurfaceWithKnots."""
+
+    @property
+    def UMultiplicities(self)-> list[int]:
+        """<attribute UMultiplicities: <list [2:?] of <type IfcInteger: <integer>>>>"""
+        return self._get_attribute("UMultiplicities")
+
+    @UMultiplicities.setter
+    def UMultiplicities(self, value: list[int]):
+        return self._set_attribute("UMultiplicities", value)
+
+    @property
+    def VMultiplicities(self)-> list[int]:
+        """<attribute VMultiplicities: <list [2:?] of <type IfcInteger: <integer>>>>"""
+        return self._get_attribute("VMultiplicities")
+
+    @VMultiplicities.setter
+    def VMultiplicities(self, value: list[int]):
+        return self._set_attribute("VMultiplicities", value)
+
+    @property
+    def UKnots(self)-> list[float]:
+        """<attribute UKnots: <list [2:?] of <type IfcParameterValue: <real>>>>"""
+        return self._get_attribute("UKnots")
+
+    @UKnots.setter
+    def UKnots(self, value: list[float]):
+        return self._set_attribute("UKnots", value)
+
+    @property
+    def VKnots(self)-> list[float]:
+        """<attribute VKnots: <list [2:?] of <type IfcParameterValue: <real>>>>"""
+        return self._get_attribute("VKnots")
+
+    @VKnots.setter
+    def VKnots(self, value: list[float]):
+        return self._set_attribute("VKnots", value)
+
+    @property
+    def KnotSpec(self)-> "IfcKnotType":
+        """<attribute KnotSpec: <enumeration IfcKnotType: (UNIFORM_KNOTS, QUASI_UNIFORM_KNOTS, PIECEWISE_BEZIER_KNOTS, UNSPECIFIED)>>"""
+        return self._get_attribute("KnotSpec")
+
+    @KnotSpec.setter
+    def KnotSpec(self, value: "IfcKnotType"):
+        return self._set_attribute("KnotSpec", value)
@@ -0,0 +1,17 @@
+from .ifcelementcomponent import IfcElementComponent
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcbuildingelementparttypeenum import IfcBuildingElementPartTypeEnum
+
+class IfcBuildingElementPart(IfcElementComponent):
+    """Wrapper class for IfcBuildingElementPart."""
+
+    @property
+    def PredefinedType(self)-> "IfcBuildingElementPartTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcBuildingElementPartTypeEnum: (INSULATION, PRECASTPANEL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcBuildingElementPartTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
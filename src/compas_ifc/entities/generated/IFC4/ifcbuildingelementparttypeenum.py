@@ -0,0 +1,2 @@
+class IfcBuildingElementPartTypeEnum(str):
+    items = ['INSULATION', 'PRECASTPANEL', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcbuildingelementtype import IfcBuildingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcbuildingelementproxytypeenum import IfcBuildingElementProxyTypeEnum
+
+class IfcBuildingElementProxyType(IfcBuildingElementType):
+    """Wrapper class for IfcBuildingElementProxyType."""
+
+    @property
+    def PredefinedType(self)-> "IfcBuildingElementProxyTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcBuildingElementProxyTypeEnum: (COMPLEX, ELEMENT, PARTIAL, PROVISIONFORVOID, PROVISIONFORSPACE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcBuildingElementProxyTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
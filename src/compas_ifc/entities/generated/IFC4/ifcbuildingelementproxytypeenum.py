@@ -0,0 +1,2 @@
+class IfcBuildingElementProxyTypeEnum(str):
+    items = ['COMPLEX', 'ELEMENT', 'PARTIAL', 'PROVISIONFORVOID', 'PROVISIONFORSPACE', 'USERDEFINED', 'NOTDEFINED']
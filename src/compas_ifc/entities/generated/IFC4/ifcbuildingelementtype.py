@@ -0,0 +1,5 @@
+from .ifcelementtype import IfcElementType
+
+
+class IfcBuildingElementType(IfcElementType):
+    """Wrapper class for IfcBuildingElementType."""
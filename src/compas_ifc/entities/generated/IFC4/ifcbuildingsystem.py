@@ -0,0 +1,26 @@
+from .ifcsystem import IfcSystem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcbuildingsystemtypeenum import IfcBuildingSystemTypeEnum
+
+class IfcBuildingSystem(IfcSystem):
+    """Wrapper class for IfcBuildingSystem."""
+
+    @property
+    def PredefinedType(self)-> "IfcBuildingSystemTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcBuildingSystemTypeEnum: (FENESTRATION, FOUNDATION, LOADBEARING, OUTERSHELL, SHADING, TRANSPORT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcBuildingSystemTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def LongName(self)-> str:
+        """<attribute LongName?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("LongName")
+
+    @LongName.setter
+    def LongName(self, value: str):
+        return self._set_attribute("LongName", value)
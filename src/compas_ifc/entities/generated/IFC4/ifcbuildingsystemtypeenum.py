@@ -0,0 +1,2 @@
+class IfcBuildingSystemTypeEnum(str):
+    items = ['FENESTRATION', 'FOUNDATION', 'LOADBEARING', 'OUTERSHELL', 'SHADING', 'TRANSPORT', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevice import IfcEnergyConversionDevice
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcburnertypeenum import IfcBurnerTypeEnum
+
+class IfcBurner(IfcEnergyConversionDevice):
+    """Wrapper class for IfcBurner."""
+
+    @property
+    def PredefinedType(self)-> "IfcBurnerTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcBurnerTypeEnum: (USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcBurnerTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcBurnerTypeEnum(str):
+    items = ['USERDEFINED', 'NOTDEFINED']
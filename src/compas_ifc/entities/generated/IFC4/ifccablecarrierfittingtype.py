@@ -0,0 +1,17 @@
+from .ifcflowfittingtype import IfcFlowFittingType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccablecarrierfittingtypeenum import IfcCableCarrierFittingTypeEnum
+
+class IfcCableCarrierFittingType(IfcFlowFittingType):
+    """Wrapper class for IfcCableCarrierFittingType."""
+
+    @property
+    def PredefinedType(self)-> "IfcCableCarrierFittingTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcCableCarrierFittingTypeEnum: (BEND, CROSS, REDUCER, TEE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcCableCarrierFittingTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcCableCarrierFittingTypeEnum(str):
+    items = ['BEND', 'CROSS', 'REDUCER', 'TEE', 'USERDEFINED', 'NOTDEFINED']
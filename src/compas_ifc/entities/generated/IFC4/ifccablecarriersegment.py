@@ -0,0 +1,17 @@
+from .ifcflowsegment import IfcFlowSegment
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccablecarriersegmenttypeenum import IfcCableCarrierSegmentTypeEnum
+
+class IfcCableCarrierSegment(IfcFlowSegment):
+    """Wrapper class for IfcCableCarrierSegment."""
+
+    @property
+    def PredefinedType(self)-> "IfcCableCarrierSegmentTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcCableCarrierSegmentTypeEnum: (CABLELADDERSEGMENT, CABLETRAYSEGMENT, CABLETRUNKINGSEGMENT, CONDUITSEGMENT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcCableCarrierSegmentTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcCableCarrierSegmentTypeEnum(str):
+    items = ['CABLELADDERSEGMENT', 'CABLETRAYSEGMENT', 'CABLETRUNKINGSEGMENT', 'CONDUITSEGMENT', 'USERDEFINED', 'NOTDEFINED']
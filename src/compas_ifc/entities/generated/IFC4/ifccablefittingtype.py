@@ -0,0 +1,17 @@
+from .ifcflowfittingtype import IfcFlowFittingType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccablefittingtypeenum import IfcCableFittingTypeEnum
+
+class IfcCableFittingType(IfcFlowFittingType):
+    """Wrapper class for IfcCableFittingType."""
+
+    @property
+    def PredefinedType(self)-> "IfcCableFittingTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcCableFittingTypeEnum: (CONNECTOR, ENTRY, EXIT, JUNCTION, TRANSITION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcCableFittingTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
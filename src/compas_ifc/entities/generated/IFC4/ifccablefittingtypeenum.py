@@ -0,0 +1,2 @@
+class IfcCableFittingTypeEnum(str):
+    items = ['CONNECTOR', 'ENTRY', 'EXIT', 'JUNCTION', 'TRANSITION', 'USERDEFINED', 'NOTDEFINED']
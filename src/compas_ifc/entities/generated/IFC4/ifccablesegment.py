@@ -0,0 +1,17 @@
+from .ifcflowsegment import IfcFlowSegment
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccablesegmenttypeenum import IfcCableSegmentTypeEnum
+
+class IfcCableSegment(IfcFlowSegment):
+    """Wrapper class for IfcCableSegment."""
+
+    @property
+    def PredefinedType(self)-> "IfcCableSegmentTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcCableSegmentTypeEnum: (BUSBARSEGMENT, CABLESEGMENT, CONDUCTORSEGMENT, CORESEGMENT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcCableSegmentTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
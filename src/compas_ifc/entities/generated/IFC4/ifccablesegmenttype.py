@@ -0,0 +1,17 @@
+from .ifcflowsegmenttype import IfcFlowSegmentType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccablesegmenttypeenum import IfcCableSegmentTypeEnum
+
+class IfcCableSegmentType(IfcFlowSegmentType):
+    """Wrapper class for IfcCableSegmentType."""
+
+    @property
+    def PredefinedType(self)-> "IfcCableSegmentTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcCableSegmentTypeEnum: (BUSBARSEGMENT, CABLESEGMENT, CONDUCTORSEGMENT, CORESEGMENT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcCableSegmentTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
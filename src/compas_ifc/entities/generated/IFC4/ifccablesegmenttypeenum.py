@@ -0,0 +1,2 @@
+class IfcCableSegmentTypeEnum(str):
+    items = ['BUSBARSEGMENT', 'CABLESEGMENT', 'CONDUCTORSEGMENT', 'CORESEGMENT', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,5 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+
+class IfcCartesianPointList(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcCartesianPointList."""
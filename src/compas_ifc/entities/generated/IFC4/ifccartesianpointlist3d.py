@@ -0,0 +1,14 @@
+from .ifccartesianpointlist import IfcCartesianPointList
+
+
+class IfcCartesianPointList3D(IfcCartesianPointList):
+    """Wrapper class for IfcCartesianPointList3D."""
+
+    @property
+    def CoordList(self)-> list[list[float]]:
+        """<attribute CoordList: <list [1:?] of <list [3:3] of <type IfcLengthMeasure: <real>>>>>"""
+        return self._get_attribute("CoordList")
+
+    @CoordList.setter
+    def CoordList(self, value: list[list[float]]):
+        return self._set_attribute("CoordList", value)
@@ -0,0 +1,45 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccartesianpoint import IfcCartesianPoint
+    from .ifcdirection import IfcDirection
+
+class IfcCartesianTransformationOperator(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcCartesianTransformationOperator."""
+
+    @property
+    def Axis1(self)-> "IfcDirection":
+        """<attribute Axis1?: <entity IfcDirection>>"""
+        return self._get_attribute("Axis1")
+
+    @Axis1.setter
+    def Axis1(self, value: "IfcDirection"):
+        return self._set_attribute("Axis1", value)
+
+    @property
+    def Axis2(self)-> "IfcDirection":
+        """<attribute Axis2?: <entity IfcDirection>>"""
+        return self._get_attribute("Axis2")
+
+    @Axis2.setter
+    def Axis2(self, value: "IfcDirection"):
+        return self._set_attribute("Axis2", value)
+
+    @property
+    def LocalOrigin(self)-> "IfcCartesianPoint":
+        """<attribute LocalOrigin: <entity IfcCartesianPoint>>"""
+        return self._get_attribute("LocalOrigin")
+
+    @LocalOrigin.setter
+    def LocalOrigin(self, value: "IfcCartesianPoint"):
+        return self._set_attribute("LocalOrigin", value)
+
+    @property
+    def Scale(self)-> float:
+        """<attribute Scale?: <type IfcReal: <real>>>"""
+        return self._get_attribute("Scale")
+
+    @Scale.setter
+    def Scale(self, value: float):
+        return self._set_attribute("Scale", value)
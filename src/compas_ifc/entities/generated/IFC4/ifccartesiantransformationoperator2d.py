@@ -0,0 +1,5 @@
+from .ifccartesiantransformationoperator import IfcCartesianTransformationOperator
+
+
+class IfcCartesianTransformationOperator2D(IfcCartesianTransformationOperator):
+    """Wrapper class for IfcCartesianTransformationOperator2D."""
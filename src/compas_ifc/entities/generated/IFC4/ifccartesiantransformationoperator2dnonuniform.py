@@ -0,0 +1,14 @@
+from .ifccartesiantransformationoperator2d import IfcCartesianTransformationOperator2D
+
+
+class IfcCartesianTransformationOperator2DnonUniform(IfcCartesianTransformationOperator2D):
+    """Wrapper class for IfcCartesianTransformationOperator2DnonUniform."""
+
+    @property
+    def Scale2(self)-> float:
+        """<attribute Scale2?: <type IfcReal: <real>>>"""
+        return self._get_attribute("Scale2")
+
+    @Scale2.setter
+    def Scale2(self, value: float):
+        return self._set_attribute("Scale2", value)
@@ -0,0 +1,17 @@
+from .ifccartesiantransformationoperator import IfcCartesianTransformationOperator
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdirection import IfcDirection
+
+class IfcCartesianTransformationOperator3D(IfcCartesianTransformationOperator):
+    """Wrapper class for IfcCartesianTransformationOperator3D."""
+
+    @property
+    def Axis3(self)-> "IfcDirection":
+        """<attribute Axis3?: <entity IfcDirection>>"""
+        return self._get_attribute("Axis3")
+
+    @Axis3.setter
+    def Axis3(self, value: "IfcDirection"):
+        return self._set_attribute("Axis3", value)
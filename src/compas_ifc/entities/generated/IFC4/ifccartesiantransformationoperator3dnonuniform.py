@@ -0,0 +1,23 @@
+from .ifccartesiantransformationoperator3d import IfcCartesianTransformationOperator3D
+
+
+class IfcCartesianTransformationOperator3DnonUniform(IfcCartesianTransformationOperator3D):
+    """Wrapper class for IfcCartesianTransformationOperator3DnonUniform."""
+
+    @property
+    def Scale2(self)-> float:
+        """<attribute Scale2?: <type IfcReal: <real>>>"""
+        return self._get_attribute("Scale2")
+
+    @Scale2.setter
+    def Scale2(self, value: float):
+        return self._set_attribute("Scale2", value)
+
+    @property
+    def Scale3(self)-> float:
+        """<attribute Scale3?: <type IfcReal: <real>>>"""
+        return self._get_attribute("Scale3")
+
+    @Scale3.setter
+    def Scale3(self, value: float):
+        return self._set_attribute("Scale3", value)
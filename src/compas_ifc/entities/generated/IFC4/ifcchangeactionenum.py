@@ -0,0 +1,2 @@
+class IfcChangeActionEnum(str):
+    items = ['NOCHANGE', 'MODIFIED', 'ADDED', 'DELETED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevice import IfcEnergyConversionDevice
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcchillertypeenum import IfcChillerTypeEnum
+
+class IfcChiller(IfcEnergyConversionDevice):
+    """Wrapper class for IfcChiller."""
+
+    @property
+    def PredefinedType(self)-> "IfcChillerTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcChillerTypeEnum: (AIRCOOLED, WATERCOOLED, HEATRECOVERY, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcChillerTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevicetype import IfcEnergyConversionDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcchillertypeenum import IfcChillerTypeEnum
+
+class IfcChillerType(IfcEnergyConversionDeviceType):
+    """Wrapper class for IfcChillerType."""
+
+    @property
+    def PredefinedType(self)-> "IfcChillerTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcChillerTypeEnum: (AIRCOOLED, WATERCOOLED, HEATRECOVERY, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcChillerTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcChillerTypeEnum(str):
+    items = ['AIRCOOLED', 'WATERCOOLED', 'HEATRECOVERY', 'USERDEFINED', 'NOTDEFINED']
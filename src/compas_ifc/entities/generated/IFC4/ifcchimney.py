@@ -0,0 +1,17 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcchimneytypeenum import IfcChimneyTypeEnum
+
+class IfcChimney(IfcBuildingElement):
+    """Wrapper class for IfcChimney."""
+
+    @property
+    def PredefinedType(self)-> "IfcChimneyTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcChimneyTypeEnum: (USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcChimneyTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
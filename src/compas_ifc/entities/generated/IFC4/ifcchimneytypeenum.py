@@ -0,0 +1,2 @@
+class IfcChimneyTypeEnum(str):
+    items = ['USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,14 @@
+from .ifccircleprofiledef import IfcCircleProfileDef
+
+
+class IfcCircleHollowProfileDef(IfcCircleProfileDef):
+    """Wrapper class for IfcCircleHollowProfileDef."""
+
+    @property
+    def WallThickness(self)-> float:
+        """<attribute WallThickness: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("WallThickness")
+
+    @WallThickness.setter
+    def WallThickness(self, value: float):
+        return self._set_attribute("WallThickness", value)
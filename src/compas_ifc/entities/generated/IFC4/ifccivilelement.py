@@ -0,0 +1,5 @@
+from .ifcelement import IfcElement
+
+
+class IfcCivilElement(IfcElement):
+    """Wrapper class for IfcCivilElement."""
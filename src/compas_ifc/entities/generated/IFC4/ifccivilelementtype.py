@@ -0,0 +1,5 @@
+from .ifcelementtype import IfcElementType
+
+
+class IfcCivilElementType(IfcElementType):
+    """Wrapper class for IfcCivilElementType."""
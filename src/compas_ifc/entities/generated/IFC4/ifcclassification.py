@@ -0,0 +1,80 @@
+from .ifcexternalinformation import IfcExternalInformation
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcclassificationreference import IfcClassificationReference
+    from .ifcrelassociatesclassification import IfcRelAssociatesClassification
+
+class IfcClassification(IfcExternalInformation):
+    """Wrapper class for IfcClassification."""
+
+    @property
+    def Source(self)-> str:
+        """<attribute Source?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Source")
+
+    @Source.setter
+    def Source(self, value: str):
+        return self._set_attribute("Source", value)
+
+    @property
+    def Edition(self)-> str:
+        """<attribute Edition?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Edition")
+
+    @Edition.setter
+    def Edition(self, value: str):
+        return self._set_attribute("Edition", value)
+
+    @property
+    def EditionDate(self)-> str:
+        """<attribute EditionDate?: <type IfcDate: <string>>>"""
+        return self._get_attribute("EditionDate")
+
+    @EditionDate.setter
+    def EditionDate(self, value: str):
+        return self._set_attribute("EditionDate", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def Location(self)-> str:
+        """<attribute Location?: <type IfcURIReference: <string>>>"""
+        return self._get_attribute("Location")
+
+    @Location.setter
+    def Location(self, value: str):
+        return self._set_attribute("Location", value)
+
+    @property
+    def ReferenceTokens(self)-> list[str]:
+        """<attribute ReferenceTokens?: <list [1:?] of <type IfcIdentifier: <string>>>>"""
+        return self._get_attribute("ReferenceTokens")
+
+    @ReferenceTokens.setter
+    def ReferenceTokens(self, value: list[str]):
+        return self._set_attribute("ReferenceTokens", value)
+
+    def ClassificationForObjects(self)-> list["IfcRelAssociatesClassification"]:
+        """<inverse ClassificationForObjects: set [0:?] of <entity IfcRelAssociatesClassification> for <attribute RelatingClassification: <select IfcClassificationSelect: (<entity IfcClassification> | <entity IfcClassificationReference>)>>>"""
+        return self._get_inverse_attribute("ClassificationForObjects")
+
+    def HasReferences(self)-> list["IfcClassificationReference"]:
+        """<inverse HasReferences: set [0:?] of <entity IfcClassificationReference> for <attribute ReferencedSource?: <select IfcClassificationReferenceSelect: (<entity IfcClassification> | <entity IfcClassificationReference>)>>>"""
+        return self._get_inverse_attribute("HasReferences")
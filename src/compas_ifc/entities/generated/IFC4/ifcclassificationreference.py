@@ -0,0 +1,46 @@
+from .ifcexternalreference import IfcExternalReference
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcclassification import IfcClassification
+    from .ifcclassificationreference import IfcClassificationReference
+    from .ifcrelassociatesclassification import IfcRelAssociatesClassification
+
+class IfcClassificationReference(IfcExternalReference):
+    """Wrapper class for IfcClassificationReference."""
+
+    @property
+    def ReferencedSource(self)-> Union["IfcClassificationReference", "IfcClassification"]:
+        """<attribute ReferencedSource?: <select IfcClassificationReferenceSelect: (<entity IfcClassification> | <entity IfcClassificationReference>)>>"""
+        return self._get_attribute("ReferencedSource")
+
+    @ReferencedSource.setter
+    def ReferencedSource(self, value: Union["IfcClassificationReference", "IfcClassification"]):
+        return self._set_attribute("ReferencedSource", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def Sort(self)-> str:
+        """<attribute Sort?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Sort")
+
+    @Sort.setter
+    def Sort(self, value: str):
+        return self._set_attribute("Sort", value)
+
+    def ClassificationRefForObjects(self)-> list["IfcRelAssociatesClassification"]:
+        """<inverse ClassificationRefForObjects: set [0:?] of <entity IfcRelAssociatesClassification> for <attribute RelatingClassification: <select IfcClassificationSelect: (<entity IfcClassification> | <entity IfcClassificationReference>)>>>"""
+        return self._get_inverse_attribute("ClassificationRefForObjects")
+
+    def HasReferences(self)-> list["IfcClassificationReference"]:
+        """<inverse HasReferences: set [0:?] of <entity IfcClassificationReference> for <attribute ReferencedSource?: <select IfcClassificationReferenceSelect: (<entity IfcClassification> | <entity IfcClassificationReference>)>>>"""
+        return self._get_inverse_attribute("HasReferences")
@@ -0,0 +1,2 @@
+class IfcCoilTypeEnum(str):
+    items = ['DXCOOLINGCOIL', 'ELECTRICHEATINGCOIL', 'GASHEATINGCOIL', 'HYDRONICCOIL', 'STEAMHEATINGCOIL', 'WATERCOOLINGCOIL', 'WATERHEATINGCOIL', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,32 @@
+from .ifccolourspecification import IfcColourSpecification
+
+
+class IfcColourRgb(IfcColourSpecification):
+    """Wrapper class for IfcColourRgb."""
+
+    @property
+    def Red(self)-> float:
+        """<attribute Red: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("Red")
+
+    @Red.setter
+    def Red(self, value: float):
+        return self._set_attribute("Red", value)
+
+    @property
+    def Green(self)-> float:
+        """<attribute Green: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("Green")
+
+    @Green.setter
+    def Green(self, value: float):
+        return self._set_attribute("Green", value)
+
+    @property
+    def Blue(self)-> float:
+        """<attribute Blue: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("Blue")
+
+    @Blue.setter
+    def Blue(self, value: float):
+        return self._set_attribute("Blue", value)
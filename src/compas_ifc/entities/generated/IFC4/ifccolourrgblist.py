@@ -0,0 +1,14 @@
+from .ifcpresentationitem import IfcPresentationItem
+
+
+class IfcColourRgbList(IfcPresentationItem):
+    """Wrapper class for IfcColourRgbList."""
+
+    @property
+    def ColourList(self)-> list[list[float]]:
+        """<attribute ColourList: <list [1:?] of <list [3:3] of <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>>>"""
+        return self._get_attribute("ColourList")
+
+    @ColourList.setter
+    def ColourList(self, value: list[list[float]]):
+        return self._set_attribute("ColourList", value)
@@ -0,0 +1,5 @@
+from .ifccolumn import IfcColumn
+
+
+class IfcColumnStandardCase(IfcColumn):
+    """Wrapper class for IfcColumnStandardCase."""
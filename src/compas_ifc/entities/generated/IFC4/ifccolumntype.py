@@ -0,0 +1,17 @@
+from .ifcbuildingelementtype import IfcBuildingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccolumntypeenum import IfcColumnTypeEnum
+
+class IfcColumnType(IfcBuildingElementType):
+    """Wrapper class for IfcColumnType."""
+
+    @property
+    def PredefinedType(self)-> "IfcColumnTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcColumnTypeEnum: (COLUMN, PILASTER, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcColumnTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
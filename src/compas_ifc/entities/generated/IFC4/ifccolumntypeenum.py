@@ -0,0 +1,2 @@
+class IfcColumnTypeEnum(str):
+    items = ['COLUMN', 'PILASTER', 'USERDEFINED', 'NOTDEFINED']
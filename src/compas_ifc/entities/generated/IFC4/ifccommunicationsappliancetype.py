@@ -0,0 +1,17 @@
+from .ifcflowterminaltype import IfcFlowTerminalType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccommunicationsappliancetypeenum import IfcCommunicationsApplianceTypeEnum
+
+class IfcCommunicationsApplianceType(IfcFlowTerminalType):
+    """Wrapper class for IfcCommunicationsApplianceType."""
+
+    @property
+    def PredefinedType(self)-> "IfcCommunicationsApplianceTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcCommunicationsApplianceTypeEnum: (ANTENNA, COMPUTER, FAX, GATEWAY, MODEM, NETWORKAPPLIANCE, NETWORKBRIDGE, NETWORKHUB, PRINTER, REPEATER, ROUTER, SCANNER, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcCommunicationsApplianceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcCommunicationsApplianceTypeEnum(str):
+    items = ['ANTENNA', 'COMPUTER', 'FAX', 'GATEWAY', 'MODEM', 'NETWORKAPPLIANCE', 'NETWORKBRIDGE', 'NETWORKHUB', 'PRINTER', 'REPEATER', 'ROUTER', 'SCANNER', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,36 @@
+from .ifcpropertytemplate import IfcPropertyTemplate
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccomplexpropertytemplatetypeenum import IfcComplexPropertyTemplateTypeEnum
+    from .ifcpropertytemplate import IfcPropertyTemplate
+
+class IfcComplexPropertyTemplate(IfcPropertyTemplate):
+    """Wrapper class for IfcComplexPropertyTemplate."""
+
+    @property
+    def UsageName(self)-> str:
+        """<attribute UsageName?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UsageName")
+
+    @UsageName.setter
+    def UsageName(self, value: str):
+        return self._set_attribute("UsageName", value)
+
+    @property
+    def TemplateType(self)-> "IfcComplexPropertyTemplateTypeEnum":
+        """<attribute TemplateType?: <enumeration IfcComplexPropertyTemplateTypeEnum: (P_COMPLEX, Q_COMPLEX)>>"""
+        return self._get_attribute("TemplateType")
+
+    @TemplateType.setter
+    def TemplateType(self, value: "IfcComplexPropertyTemplateTypeEnum"):
+        return self._set_attribute("TemplateType", value)
+
+    @property
+    def HasPropertyTemplates(self)-> list["IfcPropertyTemplate"]:
+        """<attribute HasPropertyTemplates?: <set [1:?] of <entity IfcPropertyTemplate>>>"""
+        return self._get_attribute("HasPropertyTemplates")
+
+    @HasPropertyTemplates.setter
+    def HasPropertyTemplates(self, value: list["IfcPropertyTemplate"]):
+        return self._set_attribute("HasPropertyTemplates", value)
@@ -0,0 +1,2 @@
+class IfcComplexPropertyTemplateTypeEnum(str):
+    items = ['P_COMPLEX', 'Q_COMPLEX']
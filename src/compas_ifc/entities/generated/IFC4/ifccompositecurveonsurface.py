@@ -0,0 +1,5 @@
+from .ifccompositecurve import IfcCompositeCurve
+
+
+class IfcCompositeCurveOnSurface(IfcCompositeCurve):
+    """Wrapper class for IfcCompositeCurveOnSurface."""
@@ -0,0 +1,2 @@
+class IfcCompressorTypeEnum(str):
+    items = ['DYNAMIC', 'RECIPROCATING', 'ROTARY', 'SCROLL', 'TROCHOIDAL', 'SINGLESTAGE', 'BOOSTER', 'OPENTYPE', 'HERMETIC', 'SEMIHERMETIC', 'WELDEDSHELLHERMETIC', 'ROLLINGPISTON', 'ROTARYVANE', 'SINGLESCREW', 'TWINSCREW', 'USERDEFINED', 'NOTDEFINED']
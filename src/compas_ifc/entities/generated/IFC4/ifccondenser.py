@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevice import IfcEnergyConversionDevice
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccondensertypeenum import IfcCondenserTypeEnum
+
+class IfcCondenser(IfcEnergyConversionDevice):
+    """Wrapper class for IfcCondenser."""
+
+    @property
+    def PredefinedType(self)-> "IfcCondenserTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcCondenserTypeEnum: (AIRCOOLED, EVAPORATIVECOOLED, WATERCOOLED, WATERCOOLEDBRAZEDPLATE, WATERCOOLEDSHELLCOIL, WATERCOOLEDSHELLTUBE, WATERCOOLEDTUBEINTUBE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcCondenserTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
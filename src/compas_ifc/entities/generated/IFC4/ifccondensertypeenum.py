@@ -0,0 +1,2 @@
+class IfcCondenserTypeEnum(str):
+    items = ['AIRCOOLED', 'EVAPORATIVECOOLED', 'WATERCOOLED', 'WATERCOOLEDBRAZEDPLATE', 'WATERCOOLEDSHELLCOIL', 'WATERCOOLEDSHELLTUBE', 'WATERCOOLEDTUBEINTUBE', 'USERDEFINED', 'NOTDEFINED']
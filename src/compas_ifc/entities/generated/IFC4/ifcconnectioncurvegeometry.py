@@ -0,0 +1,28 @@
+from .ifcconnectiongeometry import IfcConnectionGeometry
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcboundedcurve import IfcBoundedCurve
+    from .ifcedgecurve import IfcEdgeCurve
+
+class IfcConnectionCurveGeometry(IfcConnectionGeometry):
+    """Wrapper class for IfcConnectionCurveGeometry."""
+
+    @property
+    def CurveOnRelatingElement(self)-> Union["IfcBoundedCurve", "IfcEdgeCurve"]:
+        """<attribute CurveOnRelatingElement: <select IfcCurveOrEdgeCurve: (<entity IfcBoundedCurve> | <entity IfcEdgeCurve>)>>"""
+        return self._get_attribute("CurveOnRelatingElement")
+
+    @CurveOnRelatingElement.setter
+    def CurveOnRelatingElement(self, value: Union["IfcBoundedCurve", "IfcEdgeCurve"]):
+        return self._set_attribute("CurveOnRelatingElement", value)
+
+    @property
+    def CurveOnRelatedElement(self)-> Union["IfcBoundedCurve", "IfcEdgeCurve"]:
+        """<attribute CurveOnRelatedElement?: <select IfcCurveOrEdgeCurve: (<entity IfcBoundedCurve> | <entity IfcEdgeCurve>)>>"""
+        return self._get_attribute("CurveOnRelatedElement")
+
+    @CurveOnRelatedElement.setter
+    def CurveOnRelatedElement(self, value: Union["IfcBoundedCurve", "IfcEdgeCurve"]):
+        return self._set_attribute("CurveOnRelatedElement", value)
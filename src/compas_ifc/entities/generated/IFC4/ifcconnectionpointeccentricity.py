@@ -0,0 +1,32 @@
+from .ifcconnectionpointgeometry import IfcConnectionPointGeometry
+
+
+class IfcConnectionPointEccentricity(IfcConnectionPointGeometry):
+    """Wrapper class for IfcConnectionPointEccentricity."""
+
+    @property
+    def EccentricityInX(self)-> float:
+        """<attribute EccentricityInX?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("EccentricityInX")
+
+    @EccentricityInX.setter
+    def EccentricityInX(self, value: float):
+        return self._set_attribute("EccentricityInX", value)
+
+    @property
+    def EccentricityInY(self)-> float:
+        """<attribute EccentricityInY?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("EccentricityInY")
+
+    @EccentricityInY.setter
+    def EccentricityInY(self, value: float):
+        return self._set_attribute("EccentricityInY", value)
+
+    @property
+    def EccentricityInZ(self)-> float:
+        """<attribute EccentricityInZ?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("EccentricityInZ")
+
+    @EccentricityInZ.setter
+    def EccentricityInZ(self, value: float):
+        return self._set_attribute("EccentricityInZ", value)
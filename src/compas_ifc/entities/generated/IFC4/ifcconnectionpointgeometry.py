@@ -0,0 +1,28 @@
+from .ifcconnectiongeometry import IfcConnectionGeometry
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpoint import IfcPoint
+    from .ifcvertexpoint import IfcVertexPoint
+
+class IfcConnectionPointGeometry(IfcConnectionGeometry):
+    """Wrapper class for IfcConnectionPointGeometry."""
+
+    @property
+    def PointOnRelatingElement(self)-> Union["IfcPoint", "IfcVertexPoint"]:
+        """<attribute PointOnRelatingElement: <select IfcPointOrVertexPoint: (<entity IfcPoint> | <entity IfcVertexPoint>)>>"""
+        return self._get_attribute("PointOnRelatingElement")
+
+    @PointOnRelatingElement.setter
+    def PointOnRelatingElement(self, value: Union["IfcPoint", "IfcVertexPoint"]):
+        return self._set_attribute("PointOnRelatingElement", value)
+
+    @property
+    def PointOnRelatedElement(self)-> Union["IfcPoint", "IfcVertexPoint"]:
+        """<attribute PointOnRelatedElement?: <select IfcPointOrVertexPoint: (<entity IfcPoint> | <entity IfcVertexPoint>)>>"""
+        return self._get_attribute("PointOnRelatedElement")
+
+    @PointOnRelatedElement.setter
+    def PointOnRelatedElement(self, value: Union["IfcPoint", "IfcVertexPoint"]):
+        return self._set_attribute("PointOnRelatedElement", value)
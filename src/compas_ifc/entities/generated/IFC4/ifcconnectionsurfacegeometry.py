@@ -0,0 +1,29 @@
+from .ifcconnectiongeometry import IfcConnectionGeometry
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcfacebasedsurfacemodel import IfcFaceBasedSurfaceModel
+    from .ifcfacesurface import IfcFaceSurface
+    from .ifcsurface import IfcSurface
+
+class IfcConnectionSurfaceGeometry(IfcConnectionGeometry):
+    """Wrapper class for IfcConnectionSurfaceGeometry."""
+
+    @property
+    def SurfaceOnRelatingElement(self)-> Union["IfcSurface", "IfcFaceSurface", "IfcFaceBasedSurfaceModel"]:
+        """<attribute SurfaceOnRelatingElement: <select IfcSurfaceOrFaceSurface: (<entity IfcFaceBasedSurfaceModel> | <entity IfcFaceSurface> | <entity IfcSurface>)>>"""
+        return self._get_attribute("SurfaceOnRelatingElement")
+
+    @SurfaceOnRelatingElement.setter
+    def SurfaceOnRelatingElement(self, value: Union["IfcSurface", "IfcFaceSurface", "IfcFaceBasedSurfaceModel"]):
+        return self._set_attribute("SurfaceOnRelatingElement", value)
+
+    @property
+    def SurfaceOnRelatedElement(self)-> Union["IfcSurface", "IfcFaceSurface", "IfcFaceBasedSurfaceModel"]:
+        """<attribute SurfaceOnRelatedElement?: <select IfcSurfaceOrFaceSurface: (<entity IfcFaceBasedSurfaceModel> | <entity IfcFaceSurface> | <entity IfcSurface>)>>"""
+        return self._get_attribute("SurfaceOnRelatedElement")
+
+    @SurfaceOnRelatedElement.setter
+    def SurfaceOnRelatedElement(self, value: Union["IfcSurface", "IfcFaceSurface", "IfcFaceBasedSurfaceModel"]):
+        return self._set_attribute("SurfaceOnRelatedElement", value)
@@ -0,0 +1,2 @@
+class IfcConnectionTypeEnum(str):
+    items = ['ATPATH', 'ATSTART', 'ATEND', 'NOTDEFINED']
@@ -0,0 +1,28 @@
+from .ifcconnectiongeometry import IfcConnectionGeometry
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcclosedshell import IfcClosedShell
+    from .ifcsolidmodel import IfcSolidModel
+
+class IfcConnectionVolumeGeometry(IfcConnectionGeometry):
+    """Wrapper class for IfcConnectionVolumeGeometry."""
+
+    @property
+    def VolumeOnRelatingElement(self)-> Union["IfcClosedShell", "IfcSolidModel"]:
+        """<attribute VolumeOnRelatingElement: <select IfcSolidOrShell: (<entity IfcClosedShell> | <entity IfcSolidModel>)>>"""
+        return self._get_attribute("VolumeOnRelatingElement")
+
+    @VolumeOnRelatingElement.setter
+    def VolumeOnRelatingElement(self, value: Union["IfcClosedShell", "IfcSolidModel"]):
+        return self._set_attribute("VolumeOnRelatingElement", value)
+
+    @property
+    def VolumeOnRelatedElement(self)-> Union["IfcClosedShell", "IfcSolidModel"]:
+        """<attribute VolumeOnRelatedElement?: <select IfcSolidOrShell: (<entity IfcClosedShell> | <entity IfcSolidModel>)>>"""
+        return self._get_attribute("VolumeOnRelatedElement")
+
+    @VolumeOnRelatedElement.setter
+    def VolumeOnRelatedElement(self, value: Union["IfcClosedShell", "IfcSolidModel"]):
+        return self._set_attribute("VolumeOnRelatedElement", value)
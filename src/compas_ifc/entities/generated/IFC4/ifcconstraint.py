@@ -0,0 +1,85 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcconstraintenum import IfcConstraintEnum
+    from .ifcexternalreferencerelationship import IfcExternalReferenceRelationship
+    from .ifcorganization import IfcOrganization
+    from .ifcperson import IfcPerson
+    from .ifcpersonandorganization import IfcPersonAndOrganization
+    from .ifcresourceconstraintrelationship import IfcResourceConstraintRelationship
+
+class IfcConstraint(Base):
+    """Wrapper class for IfcConstraint."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def ConstraintGrade(self)-> "IfcConstraintEnum":
+        """<attribute ConstraintGrade: <enumeration IfcConstraintEnum: (HARD, SOFT, ADVISORY, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("ConstraintGrade")
+
+    @ConstraintGrade.setter
+    def ConstraintGrade(self, value: "IfcConstraintEnum"):
+        return self._set_attribute("ConstraintGrade", value)
+
+    @property
+    def ConstraintSource(self)-> str:
+        """<attribute ConstraintSource?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ConstraintSource")
+
+    @ConstraintSource.setter
+    def ConstraintSource(self, value: str):
+        return self._set_attribute("ConstraintSource", value)
+
+    @property
+    def CreatingActor(self)-> Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]:
+        """<attribute CreatingActor?: <select IfcActorSelect: (<entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization>)>>"""
+        return self._get_attribute("CreatingActor")
+
+    @CreatingActor.setter
+    def CreatingActor(self, value: Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]):
+        return self._set_attribute("CreatingActor", value)
+
+    @property
+    def CreationTime(self)-> str:
+        """<attribute CreationTime?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("CreationTime")
+
+    @CreationTime.setter
+    def CreationTime(self, value: str):
+        return self._set_attribute("CreationTime", value)
+
+    @property
+    def UserDefinedGrade(self)-> str:
+        """<attribute UserDefinedGrade?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedGrade")
+
+    @UserDefinedGrade.setter
+    def UserDefinedGrade(self, value: str):
+        return self._set_attribute("UserDefinedGrade", value)
+
+    def HasExternalReferences(self)-> list["IfcExternalReferenceRelationship"]:
+        """<inverse HasExternalReferences: set [0:?] of <entity IfcExternalReferenceRelationship> for <attribute RelatedResourceObjects: <set [1:?] of <select IfcResourceObjectSelect: (<entity IfcActorRole> | <entity IfcAppliedValue> | <entity IfcApproval> | <entity IfcConstraint> | <entity IfcContextDependentUnit> | <entity IfcConversionBasedUnit> | <entity IfcExternalInformation> | <entity IfcExternalReference> | <entity IfcMaterialDefinition> | <entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization> | <entity IfcPhysicalQuantity> | <entity IfcProfileDef> | <entity IfcPropertyAbstraction> | <entity IfcTimeSeries>)>>>>"""
+        return self._get_inverse_attribute("HasExternalReferences")
+
+    def PropertiesForConstraint(self)-> list["IfcResourceConstraintRelationship"]:
+        """<inverse PropertiesForConstraint: set [0:?] of <entity IfcResourceConstraintRelationship> for <attribute RelatingConstraint: <entity IfcConstraint>>>"""
+        return self._get_inverse_attribute("PropertiesForConstraint")
@@ -0,0 +1,17 @@
+from .ifcconstructionresourcetype import IfcConstructionResourceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcconstructionequipmentresourcetypeenum import IfcConstructionEquipmentResourceTypeEnum
+
+class IfcConstructionEquipmentResourceType(IfcConstructionResourceType):
+    """Wrapper class for IfcConstructionEquipmentResourceType."""
+
+    @property
+    def PredefinedType(self)-> "IfcConstructionEquipmentResourceTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcConstructionEquipmentResourceTypeEnum: (DEMOLISHING, EARTHMOVING, ERECTING, HEATING, LIGHTING, PAVING, PUMPING, TRANSPORTING, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcConstructionEquipmentResourceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
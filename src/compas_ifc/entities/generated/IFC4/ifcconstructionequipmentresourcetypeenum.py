@@ -0,0 +1,2 @@
+class IfcConstructionEquipmentResourceTypeEnum(str):
+    items = ['DEMOLISHING', 'EARTHMOVING', 'ERECTING', 'HEATING', 'LIGHTING', 'PAVING', 'PUMPING', 'TRANSPORTING', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcconstructionresourcetype import IfcConstructionResourceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcconstructionmaterialresourcetypeenum import IfcConstructionMaterialResourceTypeEnum
+
+class IfcConstructionMaterialResourceType(IfcConstructionResourceType):
+    """Wrapper class for IfcConstructionMaterialResourceType."""
+
+    @property
+    def PredefinedType(self)-> "IfcConstructionMaterialResourceTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcConstructionMaterialResourceTypeEnum: (AGGREGATES, CONCRETE, DRYWALL, FUEL, GYPSUM, MASONRY, METAL, PLASTIC, WOOD, NOTDEFINED, USERDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcConstructionMaterialResourceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcConstructionMaterialResourceTypeEnum(str):
+    items = ['AGGREGATES', 'CONCRETE', 'DRYWALL', 'FUEL', 'GYPSUM', 'MASONRY', 'METAL', 'PLASTIC', 'WOOD', 'NOTDEFINED', 'USERDEFINED']
@@ -0,0 +1,17 @@
+from .ifcconstructionresource import IfcConstructionResource
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcconstructionproductresourcetypeenum import IfcConstructionProductResourceTypeEnum
+
+class IfcConstructionProductResource(IfcConstructionResource):
+    """Wrapper class for IfcConstructionProductResource."""
+
+    @property
+    def PredefinedType(self)-> "IfcConstructionProductResourceTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcConstructionProductResourceTypeEnum: (ASSEMBLY, FORMWORK, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcConstructionProductResourceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,17 @@
+from .ifcconstructionresourcetype import IfcConstructionResourceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcconstructionproductresourcetypeenum import IfcConstructionProductResourceTypeEnum
+
+class IfcConstructionProductResourceType(IfcConstructionResourceType):
+    """Wrapper class for IfcConstructionProductResourceType."""
+
+    @property
+    def PredefinedType(self)-> "IfcConstructionProductResourceTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcConstructionProductResourceTypeEnum: (ASSEMBLY, FORMWORK, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcConstructionProductResourceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
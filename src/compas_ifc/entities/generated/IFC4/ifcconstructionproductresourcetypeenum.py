@@ -0,0 +1,2 @@
+class IfcConstructionProductResourceTypeEnum(str):
+    items = ['ASSEMBLY', 'FORMWORK', 'USERDEFINED', 'NOTDEFINED']
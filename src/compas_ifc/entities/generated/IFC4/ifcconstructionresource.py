@@ -0,0 +1,37 @@
+from .ifcresource import IfcResource
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcappliedvalue import IfcAppliedValue
+    from .ifcphysicalquantity import IfcPhysicalQuantity
+    from .ifcresourcetime import IfcResourceTime
+
+class IfcConstructionResource(IfcResource):
+    """Wrapper class for IfcConstructionResource."""
+
+    @property
+    def Usage(self)-> "IfcResourceTime":
+        """<attribute Usage?: <entity IfcResourceTime>>"""
+        return self._get_attribute("Usage")
+
+    @Usage.setter
+    def Usage(self, value: "IfcResourceTime"):
+        return self._set_attribute("Usage", value)
+
+    @property
+    def BaseCosts(self)-> list["IfcAppliedValue"]:
+        """<attribute BaseCosts?: <list [1:?] of <entity IfcAppliedValue>>>"""
+        return self._get_attribute("BaseCosts")
+
+    @BaseCosts.setter
+    def BaseCosts(self, value: list["IfcAppliedValue"]):
+        return self._set_attribute("BaseCosts", value)
+
+    @property
+    def BaseQuantity(self)-> "IfcPhysicalQuantity":
+        """<attribute BaseQuantity?: <entity IfcPhysicalQuantity>>"""
+        return self._get_attribute("BaseQuantity")
+
+    @BaseQuantity.setter
+    def BaseQuantity(self, value: "IfcPhysicalQuantity"):
+        return self._set_attribute("BaseQuantity", value)
@@ -0,0 +1,27 @@
+from .ifctyperesource import IfcTypeResource
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcappliedvalue import IfcAppliedValue
+    from .ifcphysicalquantity import IfcPhysicalQuantity
+
+class IfcConstructionResourceType(IfcTypeResource):
+    """Wrapper class for IfcConstructionResourceType."""
+
+    @property
+    def BaseCosts(self)-> list["IfcAppliedValue"]:
+        """<attribute BaseCosts?: <list [1:?] of <entity IfcAppliedValue>>>"""
+        return self._get_attribute("BaseCosts")
+
+    @BaseCosts.setter
+    def BaseCosts(self, value: list["IfcAppliedValue"]):
+        return self._set_attribute("BaseCosts", value)
+
+    @property
+    def BaseQuantity(self)-> "IfcPhysicalQuantity":
+        """<attribute BaseQuantity?: <entity IfcPhysicalQuantity>>"""
+        return self._get_attribute("BaseQuantity")
+
+    @BaseQuantity.setter
+    def BaseQuantity(self, value: "IfcPhysicalQuantity"):
+        return self._set_attribute("BaseQuantity", value)
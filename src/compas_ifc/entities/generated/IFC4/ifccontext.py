@@ -0,0 +1,65 @@
+from .ifcobjectdefinition import IfcObjectDefinition
+from compas_ifc.entities.extensions import IfcContext as IfcContext_Ext   # type: ignore
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcreldeclares import IfcRelDeclares
+    from .ifcreldefinesbyproperties import IfcRelDefinesByProperties
+    from .ifcrepresentationcontext import IfcRepresentationContext
+    from .ifcunitassignment import IfcUnitAssignment
+
+class IfcContext(IfcContext_Ext, IfcObjectDefinition):
+    """Wrapper class for IfcContext."""
+
+    @property
+    def ObjectType(self)-> str:
+        """<attribute ObjectType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ObjectType")
+
+    @ObjectType.setter
+    def ObjectType(self, value: str):
+        return self._set_attribute("ObjectType", value)
+
+    @property
+    def LongName(self)-> str:
+        """<attribute LongName?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("LongName")
+
+    @LongName.setter
+    def LongName(self, value: str):
+        return self._set_attribute("LongName", value)
+
+    @property
+    def Phase(self)-> str:
+        """<attribute Phase?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Phase")
+
+    @Phase.setter
+    def Phase(self, value: str):
+        return self._set_attribute("Phase", value)
+
+    @property
+    def RepresentationContexts(self)-> list["IfcRepresentationContext"]:
+        """<attribute RepresentationContexts?: <set [1:?] of <entity IfcRepresentationContext>>>"""
+        return self._get_attribute("RepresentationContexts")
+
+    @RepresentationContexts.setter
+    def RepresentationContexts(self, value: list["IfcRepresentationContext"]):
+        return self._set_attribute("RepresentationContexts", value)
+
+    @property
+    def UnitsInContext(self)-> "IfcUnitAssignment":
+        """<attribute UnitsInContext?: <entity IfcUnitAssignment>>"""
+        return self._get_attribute("UnitsInContext")
+
+    @UnitsInContext.setter
+    def UnitsInContext(self, value: "IfcUnitAssignment"):
+        return self._set_attribute("UnitsInContext", value)
+
+    def IsDefinedBy(self)-> list["IfcRelDefinesByProperties"]:
+        """<inverse IsDefinedBy: set [0:?] of <entity IfcRelDefinesByProperties> for <attribute RelatedObjects: <set [1:?] of <entity IfcObjectDefinition>>>>"""
+        return self._get_inverse_attribute("IsDefinedBy")
+
+    def Declares(self)-> list["IfcRelDeclares"]:
+        """<inverse Declares: set [0:?] of <entity IfcRelDeclares> for <attribute RelatingContext: <entity IfcContext>>>"""
+        return self._get_inverse_attribute("Declares")
@@ -0,0 +1,21 @@
+from .ifcnamedunit import IfcNamedUnit
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcexternalreferencerelationship import IfcExternalReferenceRelationship
+
+class IfcContextDependentUnit(IfcNamedUnit):
+    """Wrapper class for IfcContextDependentUnit."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    def HasExternalReference(self)-> list["IfcExternalReferenceRelationship"]:
+        """<inverse HasExternalReference: set [0:?] of <entity IfcExternalReferenceRelationship> for <attribute RelatedResourceObjects: <set [1:?] of <select IfcResourceObjectSelect: (<entity IfcActorRole> | <entity IfcAppliedValue> | <entity IfcApproval> | <entity IfcConstraint> | <entity IfcContextDependentUnit> | <entity IfcConversionBasedUnit> | <entity IfcExternalInformation> | <entity IfcExternalReference> | <entity IfcMaterialDefinition> | <entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization> | <entity IfcPhysicalQuantity> | <entity IfcProfileDef> | <entity IfcPropertyAbstraction> | <entity IfcTimeSeries>)>>>>"""
+        return self._get_inverse_attribute("HasExternalReference")
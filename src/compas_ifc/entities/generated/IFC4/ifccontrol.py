@@ -0,0 +1,21 @@
+from .ifcobject import IfcObject
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelassignstocontrol import IfcRelAssignsToControl
+
+class IfcControl(IfcObject):
+    """Wrapper class for IfcControl."""
+
+    @property
+    def Identification(self)-> str:
+        """<attribute Identification?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Identification")
+
+    @Identification.setter
+    def Identification(self, value: str):
+        return self._set_attribute("Identification", value)
+
+    def Controls(self)-> list["IfcRelAssignsToControl"]:
+        """<inverse Controls: set [0:?] of <entity IfcRelAssignsToControl> for <attribute RelatingControl: <entity IfcControl>>>"""
+        return self._get_inverse_attribute("Controls")
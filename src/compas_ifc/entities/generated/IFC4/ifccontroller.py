@@ -0,0 +1,17 @@
+from .ifcdistributioncontrolelement import IfcDistributionControlElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccontrollertypeenum import IfcControllerTypeEnum
+
+class IfcController(IfcDistributionControlElement):
+    """Wrapper class for IfcController."""
+
+    @property
+    def PredefinedType(self)-> "IfcControllerTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcControllerTypeEnum: (FLOATING, PROGRAMMABLE, PROPORTIONAL, MULTIPOSITION, TWOPOSITION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcControllerTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
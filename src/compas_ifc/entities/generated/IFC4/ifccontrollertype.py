@@ -0,0 +1,17 @@
+from .ifcdistributioncontrolelementtype import IfcDistributionControlElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccontrollertypeenum import IfcControllerTypeEnum
+
+class IfcControllerType(IfcDistributionControlElementType):
+    """Wrapper class for IfcControllerType."""
+
+    @property
+    def PredefinedType(self)-> "IfcControllerTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcControllerTypeEnum: (FLOATING, PROGRAMMABLE, PROPORTIONAL, MULTIPOSITION, TWOPOSITION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcControllerTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcControllerTypeEnum(str):
+    items = ['FLOATING', 'PROGRAMMABLE', 'PROPORTIONAL', 'MULTIPOSITION', 'TWOPOSITION', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,31 @@
+from .ifcnamedunit import IfcNamedUnit
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcexternalreferencerelationship import IfcExternalReferenceRelationship
+    from .ifcmeasurewithunit import IfcMeasureWithUnit
+
+class IfcConversionBasedUnit(IfcNamedUnit):
+    """Wrapper class for IfcConversionBasedUnit."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def ConversionFactor(self)-> "IfcMeasureWithUnit":
+        """<attribute ConversionFactor: <entity IfcMeasureWithUnit>>"""
+        return self._get_attribute("ConversionFactor")
+
+    @ConversionFactor.setter
+    def ConversionFactor(self, value: "IfcMeasureWithUnit"):
+        return self._set_attribute("ConversionFactor", value)
+
+    def HasExternalReference(self)-> list["IfcExternalReferenceRelationship"]:
+        """<inverse HasExternalReference: set [0:?] of <entity IfcExternalReferenceRelationship> for <attribute RelatedResourceObjects: <set [1:?] of <select IfcResourceObjectSelect: (<entity IfcActorRole> | <entity IfcAppliedValue> | <entity IfcApproval> | <entity IfcConstraint> | <entity IfcContextDependentUnit> | <entity IfcConversionBasedUnit> | <entity IfcExternalInformation> | <entity IfcExternalReference> | <entity IfcMaterialDefinition> | <entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization> | <entity IfcPhysicalQuantity> | <entity IfcProfileDef> | <entity IfcPropertyAbstraction> | <entity IfcTimeSeries>)>>>>"""
+        return self._get_inverse_attribute("HasExternalReference")
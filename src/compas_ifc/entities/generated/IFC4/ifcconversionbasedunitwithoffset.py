@@ -0,0 +1,14 @@
+from .ifcconversionbasedunit import IfcConversionBasedUnit
+
+
+class IfcConversionBasedUnitWithOffset(IfcConversionBasedUnit):
+    """Wrapper class for IfcConversionBasedUnitWithOffset."""
+
+    @property
+    def ConversionOffset(self)-> float:
+        """<attribute ConversionOffset: <type IfcReal: <real>>>"""
+        return self._get_attribute("ConversionOffset")
+
+    @ConversionOffset.setter
+    def ConversionOffset(self, value: float):
+        return self._set_attribute("ConversionOffset", value)
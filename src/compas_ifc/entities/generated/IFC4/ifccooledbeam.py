@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevice import IfcEnergyConversionDevice
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccooledbeamtypeenum import IfcCooledBeamTypeEnum
+
+class IfcCooledBeam(IfcEnergyConversionDevice):
+    """Wrapper class for IfcCooledBeam."""
+
+    @property
+    def PredefinedType(self)-> "IfcCooledBeamTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcCooledBeamTypeEnum: (ACTIVE, PASSIVE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcCooledBeamTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcCooledBeamTypeEnum(str):
+    items = ['ACTIVE', 'PASSIVE', 'USERDEFINED', 'NOTDEFINED']
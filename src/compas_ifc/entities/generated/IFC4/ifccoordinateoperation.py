@@ -0,0 +1,28 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccoordinatereferencesystem import IfcCoordinateReferenceSystem
+    from .ifcgeometricrepresentationcontext import IfcGeometricRepresentationContext
+
+class IfcCoordinateOperation(Base):
+    """Wrapper class for IfcCoordinateOperation."""
+
+    @property
+    def SourceCRS(self)-> Union["IfcCoordinateReferenceSystem", "IfcGeometricRepresentationContext"]:
+        """<attribute SourceCRS: <select IfcCoordinateReferenceSystemSelect: (<entity IfcCoordinateReferenceSystem> | <entity IfcGeometricRepresentationContext>)>>"""
+        return self._get_attribute("SourceCRS")
+
+    @SourceCRS.setter
+    def SourceCRS(self, value: Union["IfcCoordinateReferenceSystem", "IfcGeometricRepresentationContext"]):
+        return self._set_attribute("SourceCRS", value)
+
+    @property
+    def TargetCRS(self)-> "IfcCoordinateReferenceSystem":
+        """<attribute TargetCRS: <entity IfcCoordinateReferenceSystem>>"""
+        return self._get_attribute("TargetCRS")
+
+    @TargetCRS.setter
+    def TargetCRS(self, value: "IfcCoordinateReferenceSystem"):
+        return self._set_attribute("TargetCRS", value)
@@ -0,0 +1,48 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccoordinateoperation import IfcCoordinateOperation
+
+class IfcCoordinateReferenceSystem(Base):
+    """Wrapper class for IfcCoordinateReferenceSystem."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def GeodeticDatum(self)-> str:
+        """<attribute GeodeticDatum?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("GeodeticDatum")
+
+    @GeodeticDatum.setter
+    def GeodeticDatum(self, value: str):
+        return self._set_attribute("GeodeticDatum", value)
+
+    @property
+    def VerticalDatum(self)-> str:
+        """<attribute VerticalDatum?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("VerticalDatum")
+
+    @VerticalDatum.setter
+    def VerticalDatum(self, value: str):
+        return self._set_attribute("VerticalDatum", value)
+
+    def HasCoordinateOperation(self)-> list["IfcCoordinateOperation"]:
+        """<inverse HasCoordinateOperation: set [0:1] of <entity IfcCoordinateOperation> for <attribute SourceCRS: <select IfcCoordinateReferenceSystemSelect: (<entity IfcCoordinateReferenceSystem> | <entity IfcGeometricRepresentationContext>)>>>"""
+        return self._get_inverse_attribute("HasCoordinateOperation")
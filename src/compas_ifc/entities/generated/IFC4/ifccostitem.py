@@ -0,0 +1,37 @@
+from .ifccontrol import IfcControl
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccostitemtypeenum import IfcCostItemTypeEnum
+    from .ifccostvalue import IfcCostValue
+    from .ifcphysicalquantity import IfcPhysicalQuantity
+
+class IfcCostItem(IfcControl):
+    """Wrapper class for IfcCostItem."""
+
+    @property
+    def PredefinedType(self)-> "IfcCostItemTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcCostItemTypeEnum: (USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcCostItemTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def CostValues(self)-> list["IfcCostValue"]:
+        """<attribute CostValues?: <list [1:?] of <entity IfcCostValue>>>"""
+        return self._get_attribute("CostValues")
+
+    @CostValues.setter
+    def CostValues(self, value: list["IfcCostValue"]):
+        return self._set_attribute("CostValues", value)
+
+    @property
+    def CostQuantities(self)-> list["IfcPhysicalQuantity"]:
+        """<attribute CostQuantities?: <list [1:?] of <entity IfcPhysicalQuantity>>>"""
+        return self._get_attribute("CostQuantities")
+
+    @CostQuantities.setter
+    def CostQuantities(self, value: list["IfcPhysicalQuantity"]):
+        return self._set_attribute("CostQuantities", value)
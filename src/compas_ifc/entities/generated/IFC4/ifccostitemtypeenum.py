@@ -0,0 +1,2 @@
+class IfcCostItemTypeEnum(str):
+    items = ['USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,44 @@
+from .ifccontrol import IfcControl
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccostscheduletypeenum import IfcCostScheduleTypeEnum
+
+class IfcCostSchedule(IfcControl):
+    """Wrapper class for IfcCostSchedule."""
+
+    @property
+    def PredefinedType(self)-> "IfcCostScheduleTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcCostScheduleTypeEnum: (BUDGET, COSTPLAN, ESTIMATE, TENDER, PRICEDBILLOFQUANTITIES, UNPRICEDBILLOFQUANTITIES, SCHEDULEOFRATES, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcCostScheduleTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def Status(self)-> str:
+        """<attribute Status?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Status")
+
+    @Status.setter
+    def Status(self, value: str):
+        return self._set_attribute("Status", value)
+
+    @property
+    def SubmittedOn(self)-> str:
+        """<attribute SubmittedOn?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("SubmittedOn")
+
+    @SubmittedOn.setter
+    def SubmittedOn(self, value: str):
+        return self._set_attribute("SubmittedOn", value)
+
+    @property
+    def UpdateDate(self)-> str:
+        """<attribute UpdateDate?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("UpdateDate")
+
+    @UpdateDate.setter
+    def UpdateDate(self, value: str):
+        return self._set_attribute("UpdateDate", value)
@@ -0,0 +1,5 @@
+from .ifcappliedvalue import IfcAppliedValue
+
+
+class IfcCostValue(IfcAppliedValue):
+    """Wrapper class for IfcCostValue."""
@@ -0,0 +1,27 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccoveringtypeenum import IfcCoveringTypeEnum
+    from .ifcrelcoversbldgelements import IfcRelCoversBldgElements
+    from .ifcrelcoversspaces import IfcRelCoversSpaces
+
+class IfcCovering(IfcBuildingElement):
+    """Wrapper class for IfcCovering."""
+
+    @property
+    def PredefinedType(self)-> "IfcCoveringTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcCoveringTypeEnum: (CEILING, FLOORING, CLADDING, ROOFING, MOLDING, SKIRTINGBOARD, INSULATION, MEMBRANE, SLEEVING, WRAPPING, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcCoveringTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    def CoversSpaces(self)-> list["IfcRelCoversSpaces"]:
+        """<inverse CoversSpaces: set [0:1] of <entity IfcRelCoversSpaces> for <attribute RelatedCoverings: <set [1:?] of <entity IfcCovering>>>>"""
+        return self._get_inverse_attribute("CoversSpaces")
+
+    def CoversElements(self)-> list["IfcRelCoversBldgElements"]:
+        """<inverse CoversElements: set [0:1] of <entity IfcRelCoversBldgElements> for <attribute RelatedCoverings: <set [1:?] of <entity IfcCovering>>>>"""
+        return self._get_inverse_attribute("CoversElements")
@@ -0,0 +1,17 @@
+from .ifcbuildingelementtype import IfcBuildingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccoveringtypeenum import IfcCoveringTypeEnum
+
+class IfcCoveringType(IfcBuildingElementType):
+    """Wrapper class for IfcCoveringType."""
+
+    @property
+    def PredefinedType(self)-> "IfcCoveringTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcCoveringTypeEnum: (CEILING, FLOORING, CLADDING, ROOFING, MOLDING, SKIRTINGBOARD, INSULATION, MEMBRANE, SLEEVING, WRAPPING, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcCoveringTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcCoveringTypeEnum(str):
+    items = ['CEILING', 'FLOORING', 'CLADDING', 'ROOFING', 'MOLDING', 'SKIRTINGBOARD', 'INSULATION', 'MEMBRANE', 'SLEEVING', 'WRAPPING', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcconstructionresource import IfcConstructionResource
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccrewresourcetypeenum import IfcCrewResourceTypeEnum
+
+class IfcCrewResource(IfcConstructionResource):
+    """Wrapper class for IfcCrewResource."""
+
+    @property
+    def PredefinedType(self)-> "IfcCrewResourceTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcCrewResourceTypeEnum: (OFFICE, SITE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcCrewResourceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcCrewResourceTypeEnum(str):
+    items = ['OFFICE', 'SITE', 'USERDEFINED', 'NOTDEFINED']
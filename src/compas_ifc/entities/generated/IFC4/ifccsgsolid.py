@@ -0,0 +1,19 @@
+from .ifcsolidmodel import IfcSolidModel
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcbooleanresult import IfcBooleanResult
+    from .ifccsgprimitive3d import IfcCsgPrimitive3D
+
+class IfcCsgSolid(IfcSolidModel):
+    """Wrapper class for IfcCsgSolid."""
+
+    @property
+    def TreeRootExpression(self)-> Union["IfcCsgPrimitive3D", "IfcBooleanResult"]:
+        """<attribute TreeRootExpression: <select IfcCsgSelect: (<entity IfcBooleanResult> | <entity IfcCsgPrimitive3D>)>>"""
+        return self._get_attribute("TreeRootExpression")
+
+    @TreeRootExpression.setter
+    def TreeRootExpression(self, value: Union["IfcCsgPrimitive3D", "IfcBooleanResult"]):
+        return self._set_attribute("TreeRootExpression", value)
@@ -0,0 +1,54 @@
+from .ifcresourcelevelrelationship import IfcResourceLevelRelationship
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifclibraryinformation import IfcLibraryInformation
+    from .ifcmonetaryunit import IfcMonetaryUnit
+
+class IfcCurrencyRelationship(IfcResourceLevelRelationship):
+    """Wrapper class for IfcCurrencyRelationship."""
+
+    @property
+    def RelatingMonetaryUnit(self)-> "IfcMonetaryUnit":
+        """<attribute RelatingMonetaryUnit: <entity IfcMonetaryUnit>>"""
+        return self._get_attribute("RelatingMonetaryUnit")
+
+    @RelatingMonetaryUnit.setter
+    def RelatingMonetaryUnit(self, value: "IfcMonetaryUnit"):
+        return self._set_attribute("RelatingMonetaryUnit", value)
+
+    @property
+    def RelatedMonetaryUnit(self)-> "IfcMonetaryUnit":
+        """<attribute RelatedMonetaryUnit: <entity IfcMonetaryUnit>>"""
+        return self._get_attribute("RelatedMonetaryUnit")
+
+    @RelatedMonetaryUnit.setter
+    def RelatedMonetaryUnit(self, value: "IfcMonetaryUnit"):
+        return self._set_attribute("RelatedMonetaryUnit", value)
+
+    @property
+    def ExchangeRate(self)-> float:
+        """<attribute ExchangeRate: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("ExchangeRate")
+
+    @ExchangeRate.setter
+    def ExchangeRate(self, value: float):
+        return self._set_attribute("ExchangeRate", value)
+
+    @property
+    def RateDateTime(self)-> str:
+        """<attribute RateDateTime?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("RateDateTime")
+
+    @RateDateTime.setter
+    def RateDateTime(self, value: str):
+        return self._set_attribute("RateDateTime", value)
+
+    @property
+    def RateSource(self)-> "IfcLibraryInformation":
+        """<attribute RateSource?: <entity IfcLibraryInformation>>"""
+        return self._get_attribute("RateSource")
+
+    @RateSource.setter
+    def RateSource(self, value: "IfcLibraryInformation"):
+        return self._set_attribute("RateSource", value)
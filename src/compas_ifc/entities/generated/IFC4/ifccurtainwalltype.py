@@ -0,0 +1,17 @@
+from .ifcbuildingelementtype import IfcBuildingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccurtainwalltypeenum import IfcCurtainWallTypeEnum
+
+class IfcCurtainWallType(IfcBuildingElementType):
+    """Wrapper class for IfcCurtainWallType."""
+
+    @property
+    def PredefinedType(self)-> "IfcCurtainWallTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcCurtainWallTypeEnum: (USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcCurtainWallTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
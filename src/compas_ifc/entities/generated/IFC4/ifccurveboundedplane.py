@@ -0,0 +1,36 @@
+from .ifcboundedsurface import IfcBoundedSurface
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccurve import IfcCurve
+    from .ifcplane import IfcPlane
+
+class IfcCurveBoundedPlane(IfcBoundedSurface):
+    """Wrapper class for IfcCurveBoundedPlane."""
+
+    @property
+    def BasisSurface(self)-> "IfcPlane":
+        """<attribute BasisSurface: <entity IfcPlane>>"""
+        return self._get_attribute("BasisSurface")
+
+    @BasisSurface.setter
+    def BasisSurface(self, value: "IfcPlane"):
+        return self._set_attribute("BasisSurface", value)
+
+    @property
+    def OuterBoundary(self)-> "IfcCurve":
+        """<attribute OuterBoundary: <entity IfcCurve>>"""
+        return self._get_attribute("OuterBoundary")
+
+    @OuterBoundary.setter
+    def OuterBoundary(self, value: "IfcCurve"):
+        return self._set_attribute("OuterBoundary", value)
+
+    @property
+    def InnerBoundaries(self)-> list["IfcCurve"]:
+        """<attribute InnerBoundaries: <set [0:?] of <entity IfcCurve>>>"""
+        return self._get_attribute("InnerBoundaries")
+
+    @InnerBoundaries.setter
+    def InnerBoundaries(self, value: list["IfcCurve"]):
+        return self._set_attribute("InnerBoundaries", value)
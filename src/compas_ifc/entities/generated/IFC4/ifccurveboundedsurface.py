@@ -0,0 +1,36 @@
+from .ifcboundedsurface import IfcBoundedSurface
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcboundarycurve import IfcBoundaryCurve
+    from .ifcsurface import IfcSurface
+
+class IfcCurveBoundedSurface(IfcBoundedSurface):
+    """Wrapper class for IfcCurveBoundedSurface."""
+
+    @property
+    def BasisSurface(self)-> "IfcSurface":
+        """<attribute BasisSurface: <entity IfcSurface>>"""
+        return self._get_attribute("BasisSurface")
+
+    @BasisSurface.setter
+    def BasisSurface(self, value: "IfcSurface"):
+        return self._set_attribute("BasisSurface", value)
+
+    @property
+    def Boundaries(self)-> list["IfcBoundaryCurve"]:
+        """<attribute Boundaries: <set [1:?] of <entity IfcBoundaryCurve>>>"""
+        return self._get_attribute("Boundaries")
+
+    @Boundaries.setter
+    def Boundaries(self, value: list["IfcBoundaryCurve"]):
+        return self._set_attribute("Boundaries", value)
+
+    @property
+    def ImplicitOuter(self)-> bool:
+        """<attribute ImplicitOuter: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("ImplicitOuter")
+
+    @ImplicitOuter.setter
+    def ImplicitOuter(self, value: bool):
+        return self._set_attribute("ImplicitOuter", value)
@@ -0,0 +1,2 @@
+class IfcCurveInterpolationEnum(str):
+    items = ['LINEAR', 'LOG_LINEAR', 'LOG_LOG', 'NOTDEFINED']
@@ -0,0 +1,49 @@
+from .ifcpresentationstyle import IfcPresentationStyle
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccolourspecification import IfcColourSpecification
+    from .ifccurvestylefont import IfcCurveStyleFont
+    from .ifccurvestylefontandscaling import IfcCurveStyleFontAndScaling
+    from .ifcpredefinedcolour import IfcPreDefinedColour
+    from .ifcpredefinedcurvefont import IfcPreDefinedCurveFont
+
+class IfcCurveStyle(IfcPresentationStyle):
+    """Wrapper class for IfcCurveStyle."""
+
+    @property
+    def CurveFont(self)-> Union["IfcPreDefinedCurveFont", "IfcCurveStyleFontAndScaling", "IfcCurveStyleFont"]:
+        """<attribute CurveFont?: <select IfcCurveFontOrScaledCurveFontSelect: (<entity IfcCurveStyleFontAndScaling> | <select IfcCurveStyleFontSelect: (<entity IfcCurveStyleFont> | <entity IfcPreDefinedCurveFont>)>)>>"""
+        return self._get_attribute("CurveFont")
+
+    @CurveFont.setter
+    def CurveFont(self, value: Union["IfcPreDefinedCurveFont", "IfcCurveStyleFontAndScaling", "IfcCurveStyleFont"]):
+        return self._set_attribute("CurveFont", value)
+
+    @property
+    def CurveWidth(self)-> Union[float, str]:
+        """<attribute CurveWidth?: <select IfcSizeSelect: (<type IfcDescriptiveMeasure: <string>> | <type IfcLengthMeasure: <real>> | <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>> | <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>> | <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>> | <type IfcRatioMeasure: <real>>)>>"""
+        return self._get_attribute("CurveWidth")
+
+    @CurveWidth.setter
+    def CurveWidth(self, value: Union[float, str]):
+        return self._set_attribute("CurveWidth", value)
+
+    @property
+    def CurveColour(self)-> Union["IfcPreDefinedColour", "IfcColourSpecification"]:
+        """<attribute CurveColour?: <select IfcColour: (<entity IfcColourSpecification> | <entity IfcPreDefinedColour>)>>"""
+        return self._get_attribute("CurveColour")
+
+    @CurveColour.setter
+    def CurveColour(self, value: Union["IfcPreDefinedColour", "IfcColourSpecification"]):
+        return self._set_attribute("CurveColour", value)
+
+    @property
+    def ModelOrDraughting(self)-> bool:
+        """<attribute ModelOrDraughting?: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("ModelOrDraughting")
+
+    @ModelOrDraughting.setter
+    def ModelOrDraughting(self, value: bool):
+        return self._set_attribute("ModelOrDraughting", value)
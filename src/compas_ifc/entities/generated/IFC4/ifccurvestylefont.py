@@ -0,0 +1,26 @@
+from .ifcpresentationitem import IfcPresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccurvestylefontpattern import IfcCurveStyleFontPattern
+
+class IfcCurveStyleFont(IfcPresentationItem):
+    """Wrapper class for IfcCurveStyleFont."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def PatternList(self)-> list["IfcCurveStyleFontPattern"]:
+        """<attribute PatternList: <list [1:?] of <entity IfcCurveStyleFontPattern>>>"""
+        return self._get_attribute("PatternList")
+
+    @PatternList.setter
+    def PatternList(self, value: list["IfcCurveStyleFontPattern"]):
+        return self._set_attribute("PatternList", value)
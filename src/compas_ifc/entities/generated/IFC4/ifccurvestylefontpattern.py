@@ -0,0 +1,23 @@
+from .ifcpresentationitem import IfcPresentationItem
+
+
+class IfcCurveStyleFontPattern(IfcPresentationItem):
+    """Wrapper class for IfcCurveStyleFontPattern."""
+
+    @property
+    def VisibleSegmentLength(self)-> float:
+        """<attribute VisibleSegmentLength: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("VisibleSegmentLength")
+
+    @VisibleSegmentLength.setter
+    def VisibleSegmentLength(self, value: float):
+        return self._set_attribute("VisibleSegmentLength", value)
+
+    @property
+    def InvisibleSegmentLength(self)-> float:
+        """<attribute InvisibleSegmentLength: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("InvisibleSegmentLength")
+
+    @InvisibleSegmentLength.setter
+    def InvisibleSegmentLength(self, value: float):
+        return self._set_attribute("InvisibleSegmentLength", value)
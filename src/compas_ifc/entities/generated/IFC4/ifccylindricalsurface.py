@@ -0,0 +1,14 @@
+from .ifcelementarysurface import IfcElementarySurface
+
+
+class IfcCylindricalSurface(IfcElementarySurface):
+    """Wrapper class for IfcCylindricalSurface."""
+
+    @property
+    def Radius(self)-> float:
+        """<attribute Radius: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Radius")
+
+    @Radius.setter
+    def Radius(self, value: float):
+        return self._set_attribute("Radius", value)
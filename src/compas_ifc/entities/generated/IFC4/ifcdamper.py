@@ -0,0 +1,17 @@
+from .ifcflowcontroller import IfcFlowController
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdampertypeenum import IfcDamperTypeEnum
+
+class IfcDamper(IfcFlowController):
+    """Wrapper class for IfcDamper."""
+
+    @property
+    def PredefinedType(self)-> "IfcDamperTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcDamperTypeEnum: (BACKDRAFTDAMPER, BALANCINGDAMPER, BLASTDAMPER, CONTROLDAMPER, FIREDAMPER, FIRESMOKEDAMPER, FUMEHOODEXHAUST, GRAVITYDAMPER, GRAVITYRELIEFDAMPER, RELIEFDAMPER, SMOKEDAMPER, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcDamperTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcDamperTypeEnum(str):
+    items = ['BACKDRAFTDAMPER', 'BALANCINGDAMPER', 'BLASTDAMPER', 'CONTROLDAMPER', 'FIREDAMPER', 'FIRESMOKEDAMPER', 'FUMEHOODEXHAUST', 'GRAVITYDAMPER', 'GRAVITYRELIEFDAMPER', 'RELIEFDAMPER', 'SMOKEDAMPER', 'USERDEFINED', 'NOTDEFINED']
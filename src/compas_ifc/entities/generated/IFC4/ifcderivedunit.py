@@ -0,0 +1,36 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcderivedunitelement import IfcDerivedUnitElement
+    from .ifcderivedunitenum import IfcDerivedUnitEnum
+
+class IfcDerivedUnit(Base):
+    """Wrapper class for IfcDerivedUnit."""
+
+    @property
+    def Elements(self)-> list["IfcDerivedUnitElement"]:
+        """<attribute Elements: <set [1:?] of <entity IfcDerivedUnitElement>>>"""
+        return self._get_attribute("Elements")
+
+    @Elements.setter
+    def Elements(self, value: list["IfcDerivedUnitElement"]):
+        return self._set_attribute("Elements", value)
+
+    @property
+    def UnitType(self)-> "IfcDerivedUnitEnum":
+        """<attribute UnitType: <enumeration IfcDerivedUnitEnum: (ANGULARVELOCITYUNIT, AREADENSITYUNIT, COMPOUNDPLANEANGLEUNIT, DYNAMICVISCOSITYUNIT, HEATFLUXDENSITYUNIT, INTEGERCOUNTRATEUNIT, ISOTHERMALMOISTURECAPACITYUNIT, KINEMATICVISCOSITYUNIT, LINEARVELOCITYUNIT, MASSDENSITYUNIT, MASSFLOWRATEUNIT, MOISTUREDIFFUSIVITYUNIT, MOLECULARWEIGHTUNIT, SPECIFICHEATCAPACITYUNIT, THERMALADMITTANCEUNIT, THERMALCONDUCTANCEUNIT, THERMALRESISTANCEUNIT, THERMALTRANSMITTANCEUNIT, VAPORPERMEABILITYUNIT, VOLUMETRICFLOWRATEUNIT, ROTATIONALFREQUENCYUNIT, TORQUEUNIT, MOMENTOFINERTIAUNIT, LINEARMOMENTUNIT, LINEARFORCEUNIT, PLANARFORCEUNIT, MODULUSOFELASTICITYUNIT, SHEARMODULUSUNIT, LINEARSTIFFNESSUNIT, ROTATIONALSTIFFNESSUNIT, MODULUSOFSUBGRADEREACTIONUNIT, ACCELERATIONUNIT, CURVATUREUNIT, HEATINGVALUEUNIT, IONCONCENTRATIONUNIT, LUMINOUSINTENSITYDISTRIBUTIONUNIT, MASSPERLENGTHUNIT, MODULUSOFLINEARSUBGRADEREACTIONUNIT, MODULUSOFROTATIONALSUBGRADEREACTIONUNIT, PHUNIT, ROTATIONALMASSUNIT, SECTIONAREAINTEGRALUNIT, SECTIONMODULUSUNIT, SOUNDPOWERLEVELUNIT, SOUNDPOWERUNIT, SOUNDPRESSURELEVELUNIT, SOUNDPRESSUREUNIT, TEMPERATUREGRADIENTUNIT, TEMPERATURERATEOFCHANGEUNIT, THERMALEXPANSIONCOEFFICIENTUNIT, WARPINGCONSTANTUNIT, WARPINGMOMENTUNIT, USERDEFINED)>>"""
+        return self._get_attribute("UnitType")
+
+    @UnitType.setter
+    def UnitType(self, value: "IfcDerivedUnitEnum"):
+        return self._set_attribute("UnitType", value)
+
+    @property
+    def UserDefinedType(self)-> str:
+        """<attribute UserDefinedType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedType")
+
+    @UserDefinedType.setter
+    def UserDefinedType(self, value: str):
+        return self._set_attribute("UserDefinedType", value)
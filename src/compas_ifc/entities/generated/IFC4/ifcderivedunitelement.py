@@ -0,0 +1,26 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcnamedunit import IfcNamedUnit
+
+class IfcDerivedUnitElement(Base):
+    """Wrapper class for IfcDerivedUnitElement."""
+
+    @property
+    def Unit(self)-> "IfcNamedUnit":
+        """<attribute Unit: <entity IfcNamedUnit>>"""
+        return self._get_attribute("Unit")
+
+    @Unit.setter
+    def Unit(self, value: "IfcNamedUnit"):
+        return self._set_attribute("Unit", value)
+
+    @property
+    def Exponent(self)-> int:
+        """<attribute Exponent: <integer>>"""
+        return self._get_attribute("Exponent")
+
+    @Exponent.setter
+    def Exponent(self, value: int):
+        return self._set_attribute("Exponent", value)
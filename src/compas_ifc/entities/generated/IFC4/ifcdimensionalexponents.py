@@ -0,0 +1,68 @@
+from compas_ifc.entities.base import Base
+
+
+class IfcDimensionalExponents(Base):
+    """Wrapper class for IfcDimensionalExponents."""
+
+    @property
+    def LengthExponent(self)-> int:
+        """<attribute LengthExponent: <integer>>"""
+        return self._get_attribute("LengthExponent")
+
+    @LengthExponent.setter
+    def LengthExponent(self, value: int):
+        return self._set_attribute("LengthExponent", value)
+
+    @property
+    def MassExponent(self)-> int:
+        """<attribute MassExponent: <integer>>"""
+        return self._get_attribute("MassExponent")
+
+    @MassExponent.setter
+    def MassExponent(self, value: int):
+        return self._set_attribute("MassExponent", value)
+
+    @property
+    def TimeExponent(self)-> int:
+        """<attribute TimeExponent: <integer>>"""
+        return self._get_attribute("TimeExponent")
+
+    @TimeExponent.setter
+    def TimeExponent(self, value: int):
+        return self._set_attribute("TimeExponent", value)
+
+    @property
+    def ElectricCurrentExponent(self)-> int:
+        """<attribute ElectricCurrentExponent: <integer>>"""
+        return self._get_attribute("ElectricCurrentExponent")
+
+    @ElectricCurrentExponent.setter
+    def ElectricCurrentExponent(self, value: int):
+        return self._set_attribute("ElectricCurrentExponent", value)
+
+    @property
+    def ThermodynamicTemperatureExponent(self)-> int:
+        """<attribute ThermodynamicTemperatureExponent: <integer>>"""
+        return self._get_attribute("ThermodynamicTemperatureExponent")
+
+    @ThermodynamicTemperatureExponent.setter
+    def ThermodynamicTemperatureExponent(self, value: int):
+        return self._set_attribute("ThermodynamicTemperatureExponent", value)
+
+    @property
+    def AmountOfSubstanceExponent(self)-> int:
+        """<attribute AmountOfSubstanceExponent: <integer>>"""
+        return self._get_attribute("AmountOfSubstanceExponent")
+
+    @AmountOfSubstanceExponent.setter
+    def AmountOfSubstanceExponent(self, value: int):
+        return self._set_attribute("AmountOfSubstanceExponent", value)
+
+    @property
+    def LuminousIntensityExponent(self)-> int:
+        """<attribute LuminousIntensityExponent: <integer>>"""
+        return self._get_attribute("LuminousIntensityExponent")
+
+    @LuminousIntensityExponent.setter
+    def LuminousIntensityExponent(self, value: int):
+        return self._set_attribute("LuminousIntensityExponent", value)
@@ -0,0 +1,2 @@
+class IfcDirectionSenseEnum(str):
+    items = ['POSITIVE', 'NEGATIVE']
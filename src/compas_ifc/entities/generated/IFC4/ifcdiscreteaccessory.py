@@ -0,0 +1,17 @@
+from .ifcelementcomponent import IfcElementComponent
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdiscreteaccessorytypeenum import IfcDiscreteAccessoryTypeEnum
+
+class IfcDiscreteAccessory(IfcElementComponent):
+    """Wrapper class for IfcDiscreteAccessory."""
+
+    @property
+    def PredefinedType(self)-> "IfcDiscreteAccessoryTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcDiscreteAccessoryTypeEnum: (ANCHORPLATE, BRACKET, SHOE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcDiscreteAccessoryTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
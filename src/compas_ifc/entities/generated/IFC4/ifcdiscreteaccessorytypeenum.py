@@ -0,0 +1,2 @@
+class IfcDiscreteAccessoryTypeEnum(str):
+    items = ['ANCHORPLATE', 'BRACKET', 'SHOE', 'USERDEFINED', 'NOTDEFINED']
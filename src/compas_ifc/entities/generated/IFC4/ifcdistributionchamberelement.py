@@ -0,0 +1,17 @@
+from .ifcdistributionflowelement import IfcDistributionFlowElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdistributionchamberelementtypeenum import IfcDistributionChamberElementTypeEnum
+
+class IfcDistributionChamberElement(IfcDistributionFlowElement):
+    """Wrapper class for IfcDistributionChamberElement."""
+
+    @property
+    def PredefinedType(self)-> "IfcDistributionChamberElementTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcDistributionChamberElementTypeEnum: (FORMEDDUCT, INSPECTIONCHAMBER, INSPECTIONPIT, MANHOLE, METERCHAMBER, SUMP, TRENCH, VALVECHAMBER, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcDistributionChamberElementTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcDistributionChamberElementTypeEnum(str):
+    items = ['FORMEDDUCT', 'INSPECTIONCHAMBER', 'INSPECTIONPIT', 'MANHOLE', 'METERCHAMBER', 'SUMP', 'TRENCH', 'VALVECHAMBER', 'USERDEFINED', 'NOTDEFINED']
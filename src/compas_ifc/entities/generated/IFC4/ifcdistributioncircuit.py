@@ -0,0 +1,5 @@
+from .ifcdistributionsystem import IfcDistributionSystem
+
+
+class IfcDistributionCircuit(IfcDistributionSystem):
+    """Wrapper class for IfcDistributionCircuit."""
@@ -0,0 +1,5 @@
+from .ifcdistributionelementtype import IfcDistributionElementType
+
+
+class IfcDistributionControlElementType(IfcDistributionElementType):
+    """Wrapper class for IfcDistributionControlElementType."""
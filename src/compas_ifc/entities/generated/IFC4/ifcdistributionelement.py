@@ -0,0 +1,12 @@
+from .ifcelement import IfcElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelconnectsporttoelement import IfcRelConnectsPortToElement
+
+class IfcDistributionElement(IfcElement):
+    """Wrapper class for IfcDistributionElement."""
+
+    def HasPorts(self)-> list["IfcRelConnectsPortToElement"]:
+        """<inverse HasPorts: set [0:?] of <entity IfcRelConnectsPortToElement> for <attribute RelatedElement: <entity IfcDistributionElement>>>"""
+        return self._get_inverse_attribute("HasPorts")
@@ -0,0 +1,5 @@
+from .ifcelementtype import IfcElementType
+
+
+class IfcDistributionElementType(IfcElementType):
+    """Wrapper class for IfcDistributionElementType."""
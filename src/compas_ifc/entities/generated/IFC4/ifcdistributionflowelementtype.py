@@ -0,0 +1,5 @@
+from .ifcdistributionelementtype import IfcDistributionElementType
+
+
+class IfcDistributionFlowElementType(IfcDistributionElementType):
+    """Wrapper class for IfcDistributionFlowElementType."""
@@ -0,0 +1,37 @@
+from .ifcport import IfcPort
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdistributionporttypeenum import IfcDistributionPortTypeEnum
+    from .ifcdistributionsystemenum import IfcDistributionSystemEnum
+    from .ifcflowdirectionenum import IfcFlowDirectionEnum
+
+class IfcDistributionPort(IfcPort):
+    """Wrapper class for IfcDistributionPort."""
+
+    @property
+    def FlowDirection(self)-> "IfcFlowDirectionEnum":
+        """<attribute FlowDirection?: <enumeration IfcFlowDirectionEnum: (SOURCE, SINK, SOURCEANDSINK, NOTDEFINED)>>"""
+        return self._get_attribute("FlowDirection")
+
+    @FlowDirection.setter
+    def FlowDirection(self, value: "IfcFlowDirectionEnum"):
+        return self._set_attribute("FlowDirection", value)
+
+    @property
+    def PredefinedType(self)-> "IfcDistributionPortTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcDistributionPortTypeEnum: (CABLE, CABLECARRIER, DUCT, PIPE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcDistributionPortTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def SystemType(self)-> "IfcDistributionSystemEnum":
+        """<attribute SystemType?: <enumeration IfcDistributionSystemEnum: (AIRCONDITIONING, AUDIOVISUAL, CHEMICAL, CHILLEDWATER, COMMUNICATION, COMPRESSEDAIR, CONDENSERWATER, CONTROL, CONVEYING, DATA, DISPOSAL, DOMESTICCOLDWATER, DOMESTICHOTWATER, DRAINAGE, EARTHING, ELECTRICAL, ELECTROACOUSTIC, EXHAUST, FIREPROTECTION, FUEL, GAS, HAZARDOUS, HEATING, LIGHTING, LIGHTNINGPROTECTION, MUNICIPALSOLIDWASTE, OIL, OPERATIONAL, POWERGENERATION, RAINWATER, REFRIGERATION, SECURITY, SEWAGE, SIGNAL, STORMWATER, TELEPHONE, TV, VACUUM, VENT, VENTILATION, WASTEWATER, WATERSUPPLY, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("SystemType")
+
+    @SystemType.setter
+    def SystemType(self, value: "IfcDistributionSystemEnum"):
+        return self._set_attribute("SystemType", value)
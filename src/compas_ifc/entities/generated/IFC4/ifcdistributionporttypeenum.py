@@ -0,0 +1,2 @@
+class IfcDistributionPortTypeEnum(str):
+    items = ['CABLE', 'CABLECARRIER', 'DUCT', 'PIPE', 'USERDEFINED', 'NOTDEFINED']
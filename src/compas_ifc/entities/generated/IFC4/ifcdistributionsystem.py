@@ -0,0 +1,26 @@
+from .ifcsystem import IfcSystem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdistributionsystemenum import IfcDistributionSystemEnum
+
+class IfcDistributionSystem(IfcSystem):
+    """Wrapper class for IfcDistributionSystem."""
+
+    @property
+    def LongName(self)-> str:
+        """<attribute LongName?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("LongName")
+
+    @LongName.setter
+    def LongName(self, value: str):
+        return self._set_attribute("LongName", value)
+
+    @property
+    def PredefinedType(self)-> "IfcDistributionSystemEnum":
+        """<attribute PredefinedType?: <enumeration IfcDistributionSystemEnum: (AIRCONDITIONING, AUDIOVISUAL, CHEMICAL, CHILLEDWATER, COMMUNICATION, COMPRESSEDAIR, CONDENSERWATER, CONTROL, CONVEYING, DATA, DISPOSAL, DOMESTICCOLDWATER, DOMESTICHOTWATER, DRAINAGE, EARTHING, ELECTRICAL, ELECTROACOUSTIC, EXHAUST, FIREPROTECTION, FUEL, GAS, HAZARDOUS, HEATING, LIGHTING, LIGHTNINGPROTECTION, MUNICIPALSOLIDWASTE, OIL, OPERATIONAL, POWERGENERATION, RAINWATER, REFRIGERATION, SECURITY, SEWAGE, SIGNAL, STORMWATER, TELEPHONE, TV, VACUUM, VENT, VENTILATION, WASTEWATER, WATERSUPPLY, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcDistributionSystemEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcDistributionSystemEnum(str):
+    items = ['AIRCONDITIONING', 'AUDIOVISUAL', 'CHEMICAL', 'CHILLEDWATER', 'COMMUNICATION', 'COMPRESSEDAIR', 'CONDENSERWATER', 'CONTROL', 'CONVEYING', 'DATA', 'DISPOSAL', 'DOMESTICCOLDWATER', 'DOMESTICHOTWATER', 'DRAINAGE', 'EARTHING', 'ELECTRICAL', 'ELECTROACOUSTIC', 'EXHAUST', 'FIREPROTECTION', 'FUEL', 'GAS', 'HAZARDOUS', 'HEATING', 'LIGHTING', 'LIGHTNINGPROTECTION', 'MUNICIPALSOLIDWASTE', 'OIL', 'OPERATIONAL', 'POWERGENERATION', 'RAINWATER', 'REFRIGERATION', 'SECURITY', 'SEWAGE', 'SIGNAL', 'STORMWATER', 'TELEPHONE', 'TV', 'VACUUM', 'VENT', 'VENTILATION', 'WASTEWATER', 'WATERSUPPLY', 'USERDEFINED', 'NOTDEFINED']
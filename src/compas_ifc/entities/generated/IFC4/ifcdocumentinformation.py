@@ -0,0 +1,185 @@
+from .ifcexternalinformation import IfcExternalInformation
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdocumentconfidentialityenum import IfcDocumentConfidentialityEnum
+    from .ifcdocumentinformationrelationship import IfcDocumentInformationRelationship
+    from .ifcdocumentreference import IfcDocumentReference
+    from .ifcdocumentstatusenum import IfcDocumentStatusEnum
+    from .ifcorganization import IfcOrganization
+    from .ifcperson import IfcPerson
+    from .ifcpersonandorganization import IfcPersonAndOrganization
+    from .ifcrelassociatesdocument import IfcRelAssociatesDocument
+
+class IfcDocumentInformation(IfcExternalInformation):
+    """Wrapper class for IfcDocumentInformation."""
+
+    @property
+    def Identification(self)-> str:
+        """<attribute Identification: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Identification")
+
+    @Identification.setter
+    def Identification(self, value: str):
+        return self._set_attribute("Identification", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def Location(self)-> str:
+        """<attribute Location?: <type IfcURIReference: <string>>>"""
+        return self._get_attribute("Location")
+
+    @Location.setter
+    def Location(self, value: str):
+        return self._set_attribute("Location", value)
+
+    @property
+    def Purpose(self)-> str:
+        """<attribute Purpose?: <type IfcText: <string>>>"""
+        return self._get_attribute("Purpose")
+
+    @Purpose.setter
+    def Purpose(self, value: str):
+        return self._set_attribute("Purpose", value)
+
+    @property
+    def IntendedUse(self)-> str:
+        """<attribute IntendedUse?: <type IfcText: <string>>>"""
+        return self._get_attribute("IntendedUse")
+
+    @IntendedUse.setter
+    def IntendedUse(self, value: str):
+        return self._set_attribute("IntendedUse", value)
+
+    @property
+    def Scope(self)-> str:
+        """<attribute Scope?: <type IfcText: <string>>>"""
+        return self._get_attribute("Scope")
+
+    @Scope.setter
+    def Scope(self, value: str):
+        return self._set_attribute("Scope", value)
+
+    @property
+    def Revision(self)-> str:
+        """<attribute Revision?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Revision")
+
+    @Revision.setter
+    def Revision(self, value: str):
+        return self._set_attribute("Revision", value)
+
+    @property
+    def DocumentOwner(self)-> Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]:
+        """<attribute DocumentOwner?: <select IfcActorSelect: (<entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization>)>>"""
+        return self._get_attribute("DocumentOwner")
+
+    @DocumentOwner.setter
+    def DocumentOwner(self, value: Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]):
+        return self._set_attribute("DocumentOwner", value)
+
+    @property
+    def Editors(self)-> list[Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]]:
+        """<attribute Editors?: <set [1:?] of <select IfcActorSelect: (<entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization>)>>>"""
+        return self._get_attribute("Editors")
+
+    @Editors.setter
+    def Editors(self, value: list[Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]]):
+        return self._set_attribute("Editors", value)
+
+    @property
+    def CreationTime(self)-> str:
+        """<attribute CreationTime?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("CreationTime")
+
+    @CreationTime.setter
+    def CreationTime(self, value: str):
+        return self._set_attribute("CreationTime", value)
+
+    @property
+    def LastRevisionTime(self)-> str:
+        """<attribute LastRevisionTime?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("LastRevisionTime")
+
+    @LastRevisionTime.setter
+    def LastRevisionTime(self, value: str):
+        return self._set_attribute("LastRevisionTime", value)
+
+    @property
+    def ElectronicFormat(self)-> str:
+        """<attribute ElectronicFormat?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("ElectronicFormat")
+
+    @ElectronicFormat.setter
+    def ElectronicFormat(self, value: str):
+        return self._set_attribute("ElectronicFormat", value)
+
+    @property
+    def ValidFrom(self)-> str:
+        """<attribute ValidFrom?: <type IfcDate: <string>>>"""
+        return self._get_attribute("ValidFrom")
+
+    @ValidFrom.setter
+    def ValidFrom(self, value: str):
+        return self._set_attribute("ValidFrom", value)
+
+    @property
+    def ValidUntil(self)-> str:
+        """<attribute ValidUntil?: <type IfcDate: <string>>>"""
+        return self._get_attribute("ValidUntil")
+
+    @ValidUntil.setter
+    def ValidUntil(self, value: str):
+        return self._set_attribute("ValidUntil", value)
+
+    @property
+    def Confidentiality(self)-> "IfcDocumentConfidentialityEnum":
+        """<attribute Confidentiality?: <enumeration IfcDocumentConfidentialityEnum: (PUBLIC, RESTRICTED, CONFIDENTIAL, PERSONAL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("Confidentiality")
+
+    @Confidentiality.setter
+    def Confidentiality(self, value: "IfcDocumentConfidentialityEnum"):
+        return self._set_attribute("Confidentiality", value)
+
+    @property
+    def Status(self)-> "IfcDocumentStatusEnum":
+        """<attribute Status?: <enumeration IfcDocumentStatusEnum: (DRAFT, FINALDRAFT, FINAL, REVISION, NOTDEFINED)>>"""
+        return self._get_attribute("Status")
+
+    @Status.setter
+    def Status(self, value: "IfcDocumentStatusEnum"):
+        return self._set_attribute("Status", value)
+
+    def DocumentInfoForObjects(self)-> list["IfcRelAssociatesDocument"]:
+        """<inverse DocumentInfoForObjects: set [0:?] of <entity IfcRelAssociatesDocument> for <attribute RelatingDocument: <select IfcDocumentSelect: (<entity IfcDocumentInformation> | <entity IfcDocumentReference>)>>>"""
+        return self._get_inverse_attribute("DocumentInfoForObjects")
+
+    def HasDocumentReferences(self)-> list["IfcDocumentReference"]:
+        """<inverse HasDocumentReferences: set [0:?] of <entity IfcDocumentReference> for <attribute ReferencedDocument?: <entity IfcDocumentInformation>>>"""
+        return self._get_inverse_attribute("HasDocumentReferences")
+
+    def IsPointedTo(self)-> list["IfcDocumentInformationRelationship"]:
+        """<inverse IsPointedTo: set [0:?] of <entity IfcDocumentInformationRelationship> for <attribute RelatedDocuments: <set [1:?] of <entity IfcDocumentInformation>>>>"""
+        return self._get_inverse_attribute("IsPointedTo")
+
+    def IsPointer(self)-> list["IfcDocumentInformationRelationship"]:
+        """<inverse IsPointer: set [0:1] of <entity IfcDocumentInformationRelationship> for <attribute RelatingDocument: <entity IfcDocumentInformation>>>"""
+        return self._get_inverse_attribute("IsPointer")
@@ -0,0 +1,35 @@
+from .ifcresourcelevelrelationship import IfcResourceLevelRelationship
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdocumentinformation import IfcDocumentInformation
+
+class IfcDocumentInformationRelationship(IfcResourceLevelRelationship):
+    """Wrapper class for IfcDocumentInformationRelationship."""
+
+    @property
+    def RelatingDocument(self)-> "IfcDocumentInformation":
+        """<attribute RelatingDocument: <entity IfcDocumentInformation>>"""
+        return self._get_attribute("RelatingDocument")
+
+    @RelatingDocument.setter
+    def RelatingDocument(self, value: "IfcDocumentInformation"):
+        return self._set_attribute("RelatingDocument", value)
+
+    @property
+    def RelatedDocuments(self)-> list["IfcDocumentInformation"]:
+        """<attribute RelatedDocuments: <set [1:?] of <entity IfcDocumentInformation>>>"""
+        return self._get_attribute("RelatedDocuments")
+
+    @RelatedDocuments.setter
+    def RelatedDocuments(self, value: list["IfcDocumentInformation"]):
+        return self._set_attribute("RelatedDocuments", value)
+
+    @property
+    def RelationshipType(self)-> str:
+        """<attribute RelationshipType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("RelationshipType")
+
+    @RelationshipType.setter
+    def RelationshipType(self, value: str):
+        return self._set_attribute("RelationshipType", value)
@@ -0,0 +1,31 @@
+from .ifcexternalreference import IfcExternalReference
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdocumentinformation import IfcDocumentInformation
+    from .ifcrelassociatesdocument import IfcRelAssociatesDocument
+
+class IfcDocumentReference(IfcExternalReference):
+    """Wrapper class for IfcDocumentReference."""
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def ReferencedDocument(self)-> "IfcDocumentInformation":
+        """<attribute ReferencedDocument?: <entity IfcDocumentInformation>>"""
+        return self._get_attribute("ReferencedDocument")
+
+    @ReferencedDocument.setter
+    def ReferencedDocument(self, value: "IfcDocumentInformation"):
+        return self._set_attribute("ReferencedDocument", value)
+
+    def DocumentRefForObjects(self)-> list["IfcRelAssociatesDocument"]:
+        """<inverse DocumentRefForObjects: set [0:?] of <entity IfcRelAssociatesDocument> for <attribute RelatingDocument: <select IfcDocumentSelect: (<entity IfcDocumentInformation> | <entity IfcDocumentReference>)>>>"""
+        return self._get_inverse_attribute("DocumentRefForObjects")
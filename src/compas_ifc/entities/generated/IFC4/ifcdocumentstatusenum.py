@@ -0,0 +1,2 @@
+class IfcDocumentStatusEnum(str):
+    items = ['DRAFT', 'FINALDRAFT', 'FINAL', 'REVISION', 'NOTDEFINED']
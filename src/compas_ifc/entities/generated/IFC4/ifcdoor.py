@@ -0,0 +1,54 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdoortypeenum import IfcDoorTypeEnum
+    from .ifcdoortypeoperationenum import IfcDoorTypeOperationEnum
+
+class IfcDoor(IfcBuildingElement):
+    """Wrapper class for IfcDoor."""
+
+    @property
+    def OverallHeight(self)-> float:
+        """<attribute OverallHeight?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("OverallHeight")
+
+    @OverallHeight.setter
+    def OverallHeight(self, value: float):
+        return self._set_attribute("OverallHeight", value)
+
+    @property
+    def OverallWidth(self)-> float:
+        """<attribute OverallWidth?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("OverallWidth")
+
+    @OverallWidth.setter
+    def OverallWidth(self, value: float):
+        return self._set_attribute("OverallWidth", value)
+
+    @property
+    def PredefinedType(self)-> "IfcDoorTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcDoorTypeEnum: (DOOR, GATE, TRAPDOOR, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcDoorTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def OperationType(self)-> "IfcDoorTypeOperationEnum":
+        """<attribute OperationType?: <enumeration IfcDoorTypeOperationEnum: (SINGLE_SWING_LEFT, SINGLE_SWING_RIGHT, DOUBLE_DOOR_SINGLE_SWING, DOUBLE_DOOR_SINGLE_SWING_OPPOSITE_LEFT, DOUBLE_DOOR_SINGLE_SWING_OPPOSITE_RIGHT, DOUBLE_SWING_LEFT, DOUBLE_SWING_RIGHT, DOUBLE_DOOR_DOUBLE_SWING, SLIDING_TO_LEFT, SLIDING_TO_RIGHT, DOUBLE_DOOR_SLIDING, FOLDING_TO_LEFT, FOLDING_TO_RIGHT, DOUBLE_DOOR_FOLDING, REVOLVING, ROLLINGUP, SWING_FIXED_LEFT, SWING_FIXED_RIGHT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("OperationType")
+
+    @OperationType.setter
+    def OperationType(self, value: "IfcDoorTypeOperationEnum"):
+        return self._set_attribute("OperationType", value)
+
+    @property
+    def UserDefinedOperationType(self)-> str:
+        """<attribute UserDefinedOperationType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedOperationType")
+
+    @UserDefinedOperationType.setter
+    def UserDefinedOperationType(self, value: str):
+        return self._set_attribute("UserDefinedOperationType", value)
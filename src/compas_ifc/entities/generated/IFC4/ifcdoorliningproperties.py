@@ -0,0 +1,125 @@
+from .ifcpredefinedpropertyset import IfcPreDefinedPropertySet
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcshapeaspect import IfcShapeAspect
+
+class IfcDoorLiningProperties(IfcPreDefinedPropertySet):
+    """Wrapper class for IfcDoorLiningProperties."""
+
+    @property
+    def LiningDepth(self)-> float:
+        """<attribute LiningDepth?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("LiningDepth")
+
+    @LiningDepth.setter
+    def LiningDepth(self, value: float):
+        return self._set_attribute("LiningDepth", value)
+
+    @property
+    def LiningThickness(self)-> float:
+        """<attribute LiningThickness?: <type IfcNonNegativeLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("LiningThickness")
+
+    @LiningThickness.setter
+    def LiningThickness(self, value: float):
+        return self._set_attribute("LiningThickness", value)
+
+    @property
+    def ThresholdDepth(self)-> float:
+        """<attribute ThresholdDepth?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("ThresholdDepth")
+
+    @ThresholdDepth.setter
+    def ThresholdDepth(self, value: float):
+        return self._set_attribute("ThresholdDepth", value)
+
+    @property
+    def ThresholdThickness(self)-> float:
+        """<attribute ThresholdThickness?: <type IfcNonNegativeLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("ThresholdThickness")
+
+    @ThresholdThickness.setter
+    def ThresholdThickness(self, value: float):
+        return self._set_attribute("ThresholdThickness", value)
+
+    @property
+    def TransomThickness(self)-> float:
+        """<attribute TransomThickness?: <type IfcNonNegativeLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("TransomThickness")
+
+    @TransomThickness.setter
+    def TransomThickness(self, value: float):
+        return self._set_attribute("TransomThickness", value)
+
+    @property
+    def TransomOffset(self)-> float:
+        """<attribute TransomOffset?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("TransomOffset")
+
+    @TransomOffset.setter
+    def TransomOffset(self, value: float):
+        return self._set_attribute("TransomOffset", value)
+
+    @property
+    def LiningOffset(self)-> float:
+        """<attribute LiningOffset?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("LiningOffset")
+
+    @LiningOffset.setter
+    def LiningOffset(self, value: float):
+        return self._set_attribute("LiningOffset", value)
+
+    @property
+    def ThresholdOffset(self)-> float:
+        """<attribute ThresholdOffset?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("ThresholdOffset")
+
+    @ThresholdOffset.setter
+    def ThresholdOffset(self, value: float):
+        return self._set_attribute("ThresholdOffset", value)
+
+    @property
+    def CasingThickness(self)-> float:
+        """<attribute CasingThickness?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("CasingThickness")
+
+    @CasingThickness.setter
+    def CasingThickness(self, value: float):
+        return self._set_attribute("CasingThickness", value)
+
+    @property
+    def CasingDepth(self)-> float:
+        """<attribute CasingDepth?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("CasingDepth")
+
+    @CasingDepth.setter
+    def CasingDepth(self, value: float):
+        return self._set_attribute("CasingDepth", value)
+
+    @property
+    def ShapeAspectStyle(self)-> "IfcShapeAspect":
+        """<attribute ShapeAspectStyle?: <entity IfcShapeAspect>>"""
+        return self._get_attribute("ShapeAspectStyle")
+
+    @ShapeAspectStyle.setter
+    def ShapeAspectStyle(self, value: "IfcShapeAspect"):
+        return self._set_attribute("ShapeAspectStyle", value)
+
+    @property
+    def LiningToPanelOffsetX(self)-> float:
+        """<attribute LiningToPanelOffsetX?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("LiningToPanelOffsetX")
+
+    @LiningToPanelOffsetX.setter
+    def LiningToPanelOffsetX(self, value: float):
+        return self._set_attribute("LiningToPanelOffsetX", value)
+
+    @property
+    def LiningToPanelOffsetY(self)-> float:
+        """<attribute LiningToPanelOffsetY?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("LiningToPanelOffsetY")
+
+    @LiningToPanelOffsetY.setter
+    def LiningToPanelOffsetY(self, value: float):
+        return self._set_attribute("LiningToPanelOffsetY", value)
@@ -0,0 +1,5 @@
+from .ifcdoor import IfcDoor
+
+
+class IfcDoorStandardCase(IfcDoor):
+    """Wrapper class for IfcDoorStandardCase."""
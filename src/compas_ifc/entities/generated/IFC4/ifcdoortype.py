@@ -0,0 +1,45 @@
+from .ifcbuildingelementtype import IfcBuildingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdoortypeenum import IfcDoorTypeEnum
+    from .ifcdoortypeoperationenum import IfcDoorTypeOperationEnum
+
+class IfcDoorType(IfcBuildingElementType):
+    """Wrapper class for IfcDoorType."""
+
+    @property
+    def PredefinedType(self)-> "IfcDoorTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcDoorTypeEnum: (DOOR, GATE, TRAPDOOR, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcDoorTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def OperationType(self)-> "IfcDoorTypeOperationEnum":
+        """<attribute OperationType: <enumeration IfcDoorTypeOperationEnum: (SINGLE_SWING_LEFT, SINGLE_SWING_RIGHT, DOUBLE_DOOR_SINGLE_SWING, DOUBLE_DOOR_SINGLE_SWING_OPPOSITE_LEFT, DOUBLE_DOOR_SINGLE_SWING_OPPOSITE_RIGHT, DOUBLE_SWING_LEFT, DOUBLE_SWING_RIGHT, DOUBLE_DOOR_DOUBLE_SWING, SLIDING_TO_LEFT, SLIDING_TO_RIGHT, DOUBLE_DOOR_SLIDING, FOLDING_TO_LEFT, FOLDING_TO_RIGHT, DOUBLE_DOOR_FOLDING, REVOLVING, ROLLINGUP, SWING_FIXED_LEFT, SWING_FIXED_RIGHT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("OperationType")
+
+    @OperationType.setter
+    def OperationType(self, value: "IfcDoorTypeOperationEnum"):
+        return self._set_attribute("OperationType", value)
+
+    @property
+    def ParameterTakesPrecedence(self)-> bool:
+        """<attribute ParameterTakesPrecedence?: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("ParameterTakesPrecedence")
+
+    @ParameterTakesPrecedence.setter
+    def ParameterTakesPrecedence(self, value: bool):
+        return self._set_attribute("ParameterTakesPrecedence", value)
+
+    @property
+    def UserDefinedOperationType(self)-> str:
+        """<attribute UserDefinedOperationType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedOperationType")
+
+    @UserDefinedOperationType.setter
+    def UserDefinedOperationType(self, value: str):
+        return self._set_attribute("UserDefinedOperationType", value)
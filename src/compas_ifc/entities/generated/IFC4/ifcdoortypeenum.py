@@ -0,0 +1,2 @@
+class IfcDoorTypeEnum(str):
+    items = ['DOOR', 'GATE', 'TRAPDOOR', 'USERDEFINED', 'NOTDEFINED']
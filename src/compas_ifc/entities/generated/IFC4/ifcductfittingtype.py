@@ -0,0 +1,17 @@
+from .ifcflowfittingtype import IfcFlowFittingType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcductfittingtypeenum import IfcDuctFittingTypeEnum
+
+class IfcDuctFittingType(IfcFlowFittingType):
+    """Wrapper class for IfcDuctFittingType."""
+
+    @property
+    def PredefinedType(self)-> "IfcDuctFittingTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcDuctFittingTypeEnum: (BEND, CONNECTOR, ENTRY, EXIT, JUNCTION, OBSTRUCTION, TRANSITION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcDuctFittingTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,17 @@
+from .ifcflowterminaltype import IfcFlowTerminalType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelectricappliancetypeenum import IfcElectricApplianceTypeEnum
+
+class IfcElectricApplianceType(IfcFlowTerminalType):
+    """Wrapper class for IfcElectricApplianceType."""
+
+    @property
+    def PredefinedType(self)-> "IfcElectricApplianceTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcElectricApplianceTypeEnum: (DISHWASHER, ELECTRICCOOKER, FREESTANDINGELECTRICHEATER, FREESTANDINGFAN, FREESTANDINGWATERHEATER, FREESTANDINGWATERCOOLER, FREEZER, FRIDGE_FREEZER, HANDDRYER, KITCHENMACHINE, MICROWAVE, PHOTOCOPIER, REFRIGERATOR, TUMBLEDRYER, VENDINGMACHINE, WASHINGMACHINE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcElectricApplianceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
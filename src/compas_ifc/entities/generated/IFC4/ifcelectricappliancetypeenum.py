@@ -0,0 +1,2 @@
+class IfcElectricApplianceTypeEnum(str):
+    items = ['DISHWASHER', 'ELECTRICCOOKER', 'FREESTANDINGELECTRICHEATER', 'FREESTANDINGFAN', 'FREESTANDINGWATERHEATER', 'FREESTANDINGWATERCOOLER', 'FREEZER', 'FRIDGE_FREEZER', 'HANDDRYER', 'KITCHENMACHINE', 'MICROWAVE', 'PHOTOCOPIER', 'REFRIGERATOR', 'TUMBLEDRYER', 'VENDINGMACHINE', 'WASHINGMACHINE', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcflowcontroller import IfcFlowController
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelectricdistributionboardtypeenum import IfcElectricDistributionBoardTypeEnum
+
+class IfcElectricDistributionBoard(IfcFlowController):
+    """Wrapper class for IfcElectricDistributionBoard."""
+
+    @property
+    def PredefinedType(self)-> "IfcElectricDistributionBoardTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcElectricDistributionBoardTypeEnum: (CONSUMERUNIT, DISTRIBUTIONBOARD, MOTORCONTROLCENTRE, SWITCHBOARD, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcElectricDistributionBoardTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
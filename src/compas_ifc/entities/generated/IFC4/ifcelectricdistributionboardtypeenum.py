@@ -0,0 +1,2 @@
+class IfcElectricDistributionBoardTypeEnum(str):
+    items = ['CONSUMERUNIT', 'DISTRIBUTIONBOARD', 'MOTORCONTROLCENTRE', 'SWITCHBOARD', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,2 @@
+class IfcElectricFlowStorageDeviceTypeEnum(str):
+    items = ['BATTERY', 'CAPACITORBANK', 'HARMONICFILTER', 'INDUCTORBANK', 'UPS', 'USERDEFINED', 'NOTDEFINED']
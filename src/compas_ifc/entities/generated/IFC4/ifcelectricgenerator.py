@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevice import IfcEnergyConversionDevice
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelectricgeneratortypeenum import IfcElectricGeneratorTypeEnum
+
+class IfcElectricGenerator(IfcEnergyConversionDevice):
+    """Wrapper class for IfcElectricGenerator."""
+
+    @property
+    def PredefinedType(self)-> "IfcElectricGeneratorTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcElectricGeneratorTypeEnum: (CHP, ENGINEGENERATOR, STANDALONE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcElectricGeneratorTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
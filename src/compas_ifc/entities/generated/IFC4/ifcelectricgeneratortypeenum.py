@@ -0,0 +1,2 @@
+class IfcElectricGeneratorTypeEnum(str):
+    items = ['CHP', 'ENGINEGENERATOR', 'STANDALONE', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevice import IfcEnergyConversionDevice
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelectricmotortypeenum import IfcElectricMotorTypeEnum
+
+class IfcElectricMotor(IfcEnergyConversionDevice):
+    """Wrapper class for IfcElectricMotor."""
+
+    @property
+    def PredefinedType(self)-> "IfcElectricMotorTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcElectricMotorTypeEnum: (DC, INDUCTION, POLYPHASE, RELUCTANCESYNCHRONOUS, SYNCHRONOUS, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcElectricMotorTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,17 @@
+from .ifcflowcontroller import IfcFlowController
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelectrictimecontroltypeenum import IfcElectricTimeControlTypeEnum
+
+class IfcElectricTimeControl(IfcFlowController):
+    """Wrapper class for IfcElectricTimeControl."""
+
+    @property
+    def PredefinedType(self)-> "IfcElectricTimeControlTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcElectricTimeControlTypeEnum: (TIMECLOCK, TIMEDELAY, RELAY, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcElectricTimeControlTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
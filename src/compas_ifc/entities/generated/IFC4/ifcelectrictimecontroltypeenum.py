@@ -0,0 +1,2 @@
+class IfcElectricTimeControlTypeEnum(str):
+    items = ['TIMECLOCK', 'TIMEDELAY', 'RELAY', 'USERDEFINED', 'NOTDEFINED']
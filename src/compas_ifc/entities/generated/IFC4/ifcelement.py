@@ -0,0 +1,75 @@
+from .ifcproduct import IfcProduct
+from compas_ifc.entities.extensions import IfcElement as IfcElement_Ext   # type: ignore
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelconnectselements import IfcRelConnectsElements
+    from .ifcrelconnectswithrealizingelements import IfcRelConnectsWithRealizingElements
+    from .ifcrelcontainedinspatialstructure import IfcRelContainedInSpatialStructure
+    from .ifcrelcoversbldgelements import IfcRelCoversBldgElements
+    from .ifcrelfillselement import IfcRelFillsElement
+    from .ifcrelinterfereselements import IfcRelInterferesElements
+    from .ifcrelprojectselement import IfcRelProjectsElement
+    from .ifcrelreferencedinspatialstructure import IfcRelReferencedInSpatialStructure
+    from .ifcrelspaceboundary import IfcRelSpaceBoundary
+    from .ifcrelvoidselement import IfcRelVoidsElement
+
+class IfcElement(IfcElement_Ext, IfcProduct):
+    """Wrapper class for IfcElement."""
+
+    @property
+    def Tag(self)-> str:
+        """<attribute Tag?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Tag")
+
+    @Tag.setter
+    def Tag(self, value: str):
+        return self._set_attribute("Tag", value)
+
+    def FillsVoids(self)-> list["IfcRelFillsElement"]:
+        """<inverse FillsVoids: set [0:1] of <entity IfcRelFillsElement> for <attribute RelatedBuildingElement: <entity IfcElement>>>"""
+        return self._get_inverse_attribute("FillsVoids")
+
+    def ConnectedTo(self)-> list["IfcRelConnectsElements"]:
+        """<inverse ConnectedTo: set [0:?] of <entity IfcRelConnectsElements> for <attribute RelatingElement: <entity IfcElement>>>"""
+        return self._get_inverse_attribute("ConnectedTo")
+
+    def IsInterferedByElements(self)-> list["IfcRelInterferesElements"]:
+        """<inverse IsInterferedByElements: set [0:?] of <entity IfcRelInterferesElements> for <attribute RelatedElement: <entity IfcElement>>>"""
+        return self._get_inverse_attribute("IsInterferedByElements")
+
+    def InterferesElements(self)-> list["IfcRelInterferesElements"]:
+        """<inverse InterferesElements: set [0:?] of <entity IfcRelInterferesElements> for <attribute RelatingElement: <entity IfcElement>>>"""
+        return self._get_inverse_attribute("InterferesElements")
+
+    def HasProjections(self)-> list["IfcRelProjectsElement"]:
+        """<inverse HasProjections: set [0:?] of <entity IfcRelProjectsElement> for <attribute RelatingElement: <entity IfcElement>>>"""
+        return self._get_inverse_attribute("HasProjections")
+
+    def ReferencedInStructures(self)-> list["IfcRelReferencedInSpatialStructure"]:
+        """<inverse ReferencedInStructures: set [0:?] of <entity IfcRelReferencedInSpatialStructure> for <attribute RelatedElements: <set [1:?] of <entity IfcProduct>>>>"""
+        return self._get_inverse_attribute("ReferencedInStructures")
+
+    def HasOpenings(self)-> list["IfcRelVoidsElement"]:
+        """<inverse HasOpenings: set [0:?] of <entity IfcRelVoidsElement> for <attribute RelatingBuildingElement: <entity IfcElement>>>"""
+        return self._get_inverse_attribute("HasOpenings")
+
+    def IsConnectionRealization(self)-> list["IfcRelConnectsWithRealizingElements"]:
+        """<inverse IsConnectionRealization: set [0:?] of <entity IfcRelConnectsWithRealizingElements> for <attribute RealizingElements: <set [1:?] of <entity IfcElement>>>>"""
+        return self._get_inverse_attribute("IsConnectionRealization")
+
+    def ProvidesBoundaries(self)-> list["IfcRelSpaceBoundary"]:
+        """<inverse ProvidesBoundaries: set [0:?] of <entity IfcRelSpaceBoundary> for <attribute RelatedBuildingElement: <entity IfcElement>>>"""
+        return self._get_inverse_attribute("ProvidesBoundaries")
+
+    def ConnectedFrom(self)-> list["IfcRelConnectsElements"]:
+        """<inverse ConnectedFrom: set [0:?] of <entity IfcRelConnectsElements> for <attribute RelatedElement: <entity IfcElement>>>"""
+        return self._get_inverse_attribute("ConnectedFrom")
+
+    def ContainedInStructure(self)-> list["IfcRelContainedInSpatialStructure"]:
+        """<inverse ContainedInStructure: set [0:1] of <entity IfcRelContainedInSpatialStructure> for <attribute RelatedElements: <set [1:?] of <entity IfcProduct>>>>"""
+        return self._get_inverse_attribute("ContainedInStructure")
+
+    def HasCoverings(self)-> list["IfcRelCoversBldgElements"]:
+        """<inverse HasCoverings: set [0:?] of <entity IfcRelCoversBldgElements> for <attribute RelatingBuildingElement: <entity IfcElement>>>"""
+        return self._get_inverse_attribute("HasCoverings")
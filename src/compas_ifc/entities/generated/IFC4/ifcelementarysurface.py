@@ -0,0 +1,17 @@
+from .ifcsurface import IfcSurface
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaxis2placement3d import IfcAxis2Placement3D
+
+class IfcElementarySurface(IfcSurface):
+    """Wrapper class for IfcElementarySurface."""
+
+    @property
+    def Position(self)-> "IfcAxis2Placement3D":
+        """<attribute Position: <entity IfcAxis2Placement3D>>"""
+        return self._get_attribute("Position")
+
+    @Position.setter
+    def Position(self, value: "IfcAxis2Placement3D"):
+        return self._set_attribute("Position", value)
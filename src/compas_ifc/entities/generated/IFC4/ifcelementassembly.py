@@ -0,0 +1,27 @@
+from .ifcelement import IfcElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcassemblyplaceenum import IfcAssemblyPlaceEnum
+    from .ifcelementassemblytypeenum import IfcElementAssemblyTypeEnum
+
+class IfcElementAssembly(IfcElement):
+    """Wrapper class for IfcElementAssembly."""
+
+    @property
+    def AssemblyPlace(self)-> "IfcAssemblyPlaceEnum":
+        """<attribute AssemblyPlace?: <enumeration IfcAssemblyPlaceEnum: (SITE, FACTORY, NOTDEFINED)>>"""
+        return self._get_attribute("AssemblyPlace")
+
+    @AssemblyPlace.setter
+    def AssemblyPlace(self, value: "IfcAssemblyPlaceEnum"):
+        return self._set_attribute("AssemblyPlace", value)
+
+    @property
+    def PredefinedType(self)-> "IfcElementAssemblyTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcElementAssemblyTypeEnum: (ACCESSORY_ASSEMBLY, ARCH, BEAM_GRID, BRACED_FRAME, GIRDER, REINFORCEMENT_UNIT, RIGID_FRAME, SLAB_FIELD, TRUSS, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcElementAssemblyTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
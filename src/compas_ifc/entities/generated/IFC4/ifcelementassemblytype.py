@@ -0,0 +1,17 @@
+from .ifcelementtype import IfcElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelementassemblytypeenum import IfcElementAssemblyTypeEnum
+
+class IfcElementAssemblyType(IfcElementType):
+    """Wrapper class for IfcElementAssemblyType."""
+
+    @property
+    def PredefinedType(self)-> "IfcElementAssemblyTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcElementAssemblyTypeEnum: (ACCESSORY_ASSEMBLY, ARCH, BEAM_GRID, BRACED_FRAME, GIRDER, REINFORCEMENT_UNIT, RIGID_FRAME, SLAB_FIELD, TRUSS, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcElementAssemblyTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcElementAssemblyTypeEnum(str):
+    items = ['ACCESSORY_ASSEMBLY', 'ARCH', 'BEAM_GRID', 'BRACED_FRAME', 'GIRDER', 'REINFORCEMENT_UNIT', 'RIGID_FRAME', 'SLAB_FIELD', 'TRUSS', 'USERDEFINED', 'NOTDEFINED']
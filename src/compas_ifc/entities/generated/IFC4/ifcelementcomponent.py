@@ -0,0 +1,5 @@
+from .ifcelement import IfcElement
+
+
+class IfcElementComponent(IfcElement):
+    """Wrapper class for IfcElementComponent."""
@@ -0,0 +1,5 @@
+from .ifcelementtype import IfcElementType
+
+
+class IfcElementComponentType(IfcElementType):
+    """Wrapper class for IfcElementComponentType."""
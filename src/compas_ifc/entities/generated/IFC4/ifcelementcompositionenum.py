@@ -0,0 +1,2 @@
+class IfcElementCompositionEnum(str):
+    items = ['COMPLEX', 'ELEMENT', 'PARTIAL']
@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevice import IfcEnergyConversionDevice
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcenginetypeenum import IfcEngineTypeEnum
+
+class IfcEngine(IfcEnergyConversionDevice):
+    """Wrapper class for IfcEngine."""
+
+    @property
+    def PredefinedType(self)-> "IfcEngineTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcEngineTypeEnum: (EXTERNALCOMBUSTION, INTERNALCOMBUSTION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcEngineTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevicetype import IfcEnergyConversionDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcenginetypeenum import IfcEngineTypeEnum
+
+class IfcEngineType(IfcEnergyConversionDeviceType):
+    """Wrapper class for IfcEngineType."""
+
+    @property
+    def PredefinedType(self)-> "IfcEngineTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcEngineTypeEnum: (EXTERNALCOMBUSTION, INTERNALCOMBUSTION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcEngineTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
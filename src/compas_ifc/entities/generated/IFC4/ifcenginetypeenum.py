@@ -0,0 +1,2 @@
+class IfcEngineTypeEnum(str):
+    items = ['EXTERNALCOMBUSTION', 'INTERNALCOMBUSTION', 'USERDEFINED', 'NOTDEFINED']
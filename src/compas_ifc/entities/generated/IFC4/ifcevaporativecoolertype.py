@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevicetype import IfcEnergyConversionDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcevaporativecoolertypeenum import IfcEvaporativeCoolerTypeEnum
+
+class IfcEvaporativeCoolerType(IfcEnergyConversionDeviceType):
+    """Wrapper class for IfcEvaporativeCoolerType."""
+
+    @property
+    def PredefinedType(self)-> "IfcEvaporativeCoolerTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcEvaporativeCoolerTypeEnum: (DIRECTEVAPORATIVERANDOMMEDIAAIRCOOLER, DIRECTEVAPORATIVERIGIDMEDIAAIRCOOLER, DIRECTEVAPORATIVESLINGERSPACKAGEDAIRCOOLER, DIRECTEVAPORATIVEPACKAGEDROTARYAIRCOOLER, DIRECTEVAPORATIVEAIRWASHER, INDIRECTEVAPORATIVEPACKAGEAIRCOOLER, INDIRECTEVAPORATIVEWETCOIL, INDIRECTEVAPORATIVECOOLINGTOWERORCOILCOOLER, INDIRECTDIRECTCOMBINATION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcEvaporativeCoolerTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
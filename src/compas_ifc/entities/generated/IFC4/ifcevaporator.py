@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevice import IfcEnergyConversionDevice
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcevaporatortypeenum import IfcEvaporatorTypeEnum
+
+class IfcEvaporator(IfcEnergyConversionDevice):
+    """Wrapper class for IfcEvaporator."""
+
+    @property
+    def PredefinedType(self)-> "IfcEvaporatorTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcEvaporatorTypeEnum: (DIRECTEXPANSION, DIRECTEXPANSIONSHELLANDTUBE, DIRECTEXPANSIONTUBEINTUBE, DIRECTEXPANSIONBRAZEDPLATE, FLOODEDSHELLANDTUBE, SHELLANDCOIL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcEvaporatorTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcEvaporatorTypeEnum(str):
+    items = ['DIRECTEXPANSION', 'DIRECTEXPANSIONSHELLANDTUBE', 'DIRECTEXPANSIONTUBEINTUBE', 'DIRECTEXPANSIONBRAZEDPLATE', 'FLOODEDSHELLANDTUBE', 'SHELLANDCOIL', 'USERDEFINED', 'NOTDEFINED']
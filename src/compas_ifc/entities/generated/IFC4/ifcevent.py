@@ -0,0 +1,46 @@
+from .ifcprocess import IfcProcess
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifceventtime import IfcEventTime
+    from .ifceventtriggertypeenum import IfcEventTriggerTypeEnum
+    from .ifceventtypeenum import IfcEventTypeEnum
+
+class IfcEvent(IfcProcess):
+    """Wrapper class for IfcEvent."""
+
+    @property
+    def PredefinedType(self)-> "IfcEventTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcEventTypeEnum: (STARTEVENT, ENDEVENT, INTERMEDIATEEVENT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcEventTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def EventTriggerType(self)-> "IfcEventTriggerTypeEnum":
+        """<attribute EventTriggerType?: <enumeration IfcEventTriggerTypeEnum: (EVENTRULE, EVENTMESSAGE, EVENTTIME, EVENTCOMPLEX, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("EventTriggerType")
+
+    @EventTriggerType.setter
+    def EventTriggerType(self, value: "IfcEventTriggerTypeEnum"):
+        return self._set_attribute("EventTriggerType", value)
+
+    @property
+    def UserDefinedEventTriggerType(self)-> str:
+        """<attribute UserDefinedEventTriggerType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedEventTriggerType")
+
+    @UserDefinedEventTriggerType.setter
+    def UserDefinedEventTriggerType(self, value: str):
+        return self._set_attribute("UserDefinedEventTriggerType", value)
+
+    @property
+    def EventOccurenceTime(self)-> "IfcEventTime":
+        """<attribute EventOccurenceTime?: <entity IfcEventTime>>"""
+        return self._get_attribute("EventOccurenceTime")
+
+    @EventOccurenceTime.setter
+    def EventOccurenceTime(self, value: "IfcEventTime"):
+        return self._set_attribute("EventOccurenceTime", value)
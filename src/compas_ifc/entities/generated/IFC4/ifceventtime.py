@@ -0,0 +1,41 @@
+from .ifcschedulingtime import IfcSchedulingTime
+
+
+class IfcEventTime(IfcSchedulingTime):
+    """Wrapper class for IfcEventTime."""
+
+    @property
+    def ActualDate(self)-> str:
+        """<attribute ActualDate?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("ActualDate")
+
+    @ActualDate.setter
+    def ActualDate(self, value: str):
+        return self._set_attribute("ActualDate", value)
+
+    @property
+    def EarlyDate(self)-> str:
+        """<attribute EarlyDate?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("EarlyDate")
+
+    @EarlyDate.setter
+    def EarlyDate(self, value: str):
+        return self._set_attribute("EarlyDate", value)
+
+    @property
+    def LateDate(self)-> str:
+        """<attribute LateDate?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("LateDate")
+
+    @LateDate.setter
+    def LateDate(self, value: str):
+        return self._set_attribute("LateDate", value)
+
+    @property
+    def ScheduleDate(self)-> str:
+        """<attribute ScheduleDate?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("ScheduleDate")
+
+    @ScheduleDate.setter
+    def ScheduleDate(self, value: str):
+        return self._set_attribute("ScheduleDate", value)
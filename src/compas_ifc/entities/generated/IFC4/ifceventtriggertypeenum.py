@@ -0,0 +1,2 @@
+class IfcEventTriggerTypeEnum(str):
+    items = ['EVENTRULE', 'EVENTMESSAGE', 'EVENTTIME', 'EVENTCOMPLEX', 'USERDEFINED', 'NOTDEFINED']
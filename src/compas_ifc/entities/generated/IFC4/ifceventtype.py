@@ -0,0 +1,36 @@
+from .ifctypeprocess import IfcTypeProcess
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifceventtriggertypeenum import IfcEventTriggerTypeEnum
+    from .ifceventtypeenum import IfcEventTypeEnum
+
+class IfcEventType(IfcTypeProcess):
+    """Wrapper class for IfcEventType."""
+
+    @property
+    def PredefinedType(self)-> "IfcEventTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcEventTypeEnum: (STARTEVENT, ENDEVENT, INTERMEDIATEEVENT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcEventTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def EventTriggerType(self)-> "IfcEventTriggerTypeEnum":
+        """<attribute EventTriggerType: <enumeration IfcEventTriggerTypeEnum: (EVENTRULE, EVENTMESSAGE, EVENTTIME, EVENTCOMPLEX, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("EventTriggerType")
+
+    @EventTriggerType.setter
+    def EventTriggerType(self, value: "IfcEventTriggerTypeEnum"):
+        return self._set_attribute("EventTriggerType", value)
+
+    @property
+    def UserDefinedEventTriggerType(self)-> str:
+        """<attribute UserDefinedEventTriggerType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedEventTriggerType")
+
+    @UserDefinedEventTriggerType.setter
+    def UserDefinedEventTriggerType(self, value: str):
+        return self._set_attribute("UserDefinedEventTriggerType", value)
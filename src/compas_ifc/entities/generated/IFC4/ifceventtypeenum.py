@@ -0,0 +1,2 @@
+class IfcEventTypeEnum(str):
+    items = ['STARTEVENT', 'ENDEVENT', 'INTERMEDIATEEVENT', 'USERDEFINED', 'NOTDEFINED']
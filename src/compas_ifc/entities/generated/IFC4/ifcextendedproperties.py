@@ -0,0 +1,35 @@
+from .ifcpropertyabstraction import IfcPropertyAbstraction
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcproperty import IfcProperty
+
+class IfcExtendedProperties(IfcPropertyAbstraction):
+    """Wrapper class for IfcExtendedProperties."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def Properties(self)-> list["IfcProperty"]:
+        """<attribute Properties: <set [1:?] of <entity IfcProperty>>>"""
+        return self._get_attribute("Properties")
+
+    @Properties.setter
+    def Properties(self, value: list["IfcProperty"]):
+        return self._set_attribute("Properties", value)
@@ -0,0 +1,5 @@
+from .ifcexternalreference import IfcExternalReference
+
+
+class IfcExternallyDefinedTextFont(IfcExternalReference):
+    """Wrapper class for IfcExternallyDefinedTextFont."""
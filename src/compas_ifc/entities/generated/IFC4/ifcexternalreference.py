@@ -0,0 +1,39 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcexternalreferencerelationship import IfcExternalReferenceRelationship
+
+class IfcExternalReference(Base):
+    """Wrapper class for IfcExternalReference."""
+
+    @property
+    def Location(self)-> str:
+        """<attribute Location?: <type IfcURIReference: <string>>>"""
+        return self._get_attribute("Location")
+
+    @Location.setter
+    def Location(self, value: str):
+        return self._set_attribute("Location", value)
+
+    @property
+    def Identification(self)-> str:
+        """<attribute Identification?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Identification")
+
+    @Identification.setter
+    def Identification(self, value: str):
+        return self._set_attribute("Identification", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    def ExternalReferenceForResources(self)-> list["IfcExternalReferenceRelationship"]:
+        """<inverse ExternalReferenceForResources: set [0:?] of <entity IfcExternalReferenceRelationship> for <attribute RelatingReference: <entity IfcExternalReference>>>"""
+        return self._get_inverse_attribute("ExternalReferenceForResources")
@@ -0,0 +1,22 @@
+from .ifcexternalspatialstructureelement import IfcExternalSpatialStructureElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcexternalspatialelementtypeenum import IfcExternalSpatialElementTypeEnum
+    from .ifcrelspaceboundary import IfcRelSpaceBoundary
+
+class IfcExternalSpatialElement(IfcExternalSpatialStructureElement):
+    """Wrapper class for IfcExternalSpatialElement."""
+
+    @property
+    def PredefinedType(self)-> "IfcExternalSpatialElementTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcExternalSpatialElementTypeEnum: (EXTERNAL, EXTERNAL_EARTH, EXTERNAL_WATER, EXTERNAL_FIRE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcExternalSpatialElementTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    def BoundedBy(self)-> list["IfcRelSpaceBoundary"]:
+        """<inverse BoundedBy: set [0:?] of <entity IfcRelSpaceBoundary> for <attribute RelatingSpace: <select IfcSpaceBoundarySelect: (<entity IfcExternalSpatialElement> | <entity IfcSpace>)>>>"""
+        return self._get_inverse_attribute("BoundedBy")
@@ -0,0 +1,2 @@
+class IfcExternalSpatialElementTypeEnum(str):
+    items = ['EXTERNAL', 'EXTERNAL_EARTH', 'EXTERNAL_WATER', 'EXTERNAL_FIRE', 'USERDEFINED', 'NOTDEFINED']
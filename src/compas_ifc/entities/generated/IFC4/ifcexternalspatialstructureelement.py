@@ -0,0 +1,5 @@
+from .ifcspatialelement import IfcSpatialElement
+
+
+class IfcExternalSpatialStructureElement(IfcSpatialElement):
+    """Wrapper class for IfcExternalSpatialStructureElement."""
@@ -0,0 +1,17 @@
+from .ifcextrudedareasolid import IfcExtrudedAreaSolid
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcprofiledef import IfcProfileDef
+
+class IfcExtrudedAreaSolidTapered(IfcExtrudedAreaSolid):
+    """Wrapper class for IfcExtrudedAreaSolidTapered."""
+
+    @property
+    def EndSweptArea(self)-> "IfcProfileDef":
+        """<attribute EndSweptArea: <entity IfcProfileDef>>"""
+        return self._get_attribute("EndSweptArea")
+
+    @EndSweptArea.setter
+    def EndSweptArea(self, value: "IfcProfileDef"):
+        return self._set_attribute("EndSweptArea", value)
@@ -0,0 +1,22 @@
+from .ifctopologicalrepresentationitem import IfcTopologicalRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcfacebound import IfcFaceBound
+    from .ifctexturemap import IfcTextureMap
+
+class IfcFace(IfcTopologicalRepresentationItem):
+    """Wrapper class for IfcFace."""
+
+    @property
+    def Bounds(self)-> list["IfcFaceBound"]:
+        """<attribute Bounds: <set [1:?] of <entity IfcFaceBound>>>"""
+        return self._get_attribute("Bounds")
+
+    @Bounds.setter
+    def Bounds(self, value: list["IfcFaceBound"]):
+        return self._set_attribute("Bounds", value)
+
+    def HasTextureMaps(self)-> list["IfcTextureMap"]:
+        """<inverse HasTextureMaps: set [0:?] of <entity IfcTextureMap> for <attribute MappedTo: <entity IfcFace>>>"""
+        return self._get_inverse_attribute("HasTextureMaps")
@@ -0,0 +1,26 @@
+from .ifctopologicalrepresentationitem import IfcTopologicalRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcloop import IfcLoop
+
+class IfcFaceBound(IfcTopologicalRepresentationItem):
+    """Wrapper class for IfcFaceBound."""
+
+    @property
+    def Bound(self)-> "IfcLoop":
+        """<attribute Bound: <entity IfcLoop>>"""
+        return self._get_attribute("Bound")
+
+    @Bound.setter
+    def Bound(self, value: "IfcLoop"):
+        return self._set_attribute("Bound", value)
+
+    @property
+    def Orientation(self)-> bool:
+        """<attribute Orientation: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("Orientation")
+
+    @Orientation.setter
+    def Orientation(self, value: bool):
+        return self._set_attribute("Orientation", value)
@@ -0,0 +1,26 @@
+from .ifcface import IfcFace
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcsurface import IfcSurface
+
+class IfcFaceSurface(IfcFace):
+    """Wrapper class for IfcFaceSurface."""
+
+    @property
+    def FaceSurface(self)-> "IfcSurface":
+        """<attribute FaceSurface: <entity IfcSurface>>"""
+        return self._get_attribute("FaceSurface")
+
+    @FaceSurface.setter
+    def FaceSurface(self, value: "IfcSurface"):
+        return self._set_attribute("FaceSurface", value)
+
+    @property
+    def SameSense(self)-> bool:
+        """<attribute SameSense: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("SameSense")
+
+    @SameSense.setter
+    def SameSense(self, value: bool):
+        return self._set_attribute("SameSense", value)
@@ -0,0 +1,59 @@
+from .ifcstructuralconnectioncondition import IfcStructuralConnectionCondition
+
+
+class IfcFailureConnectionCondition(IfcStructuralConnectionCondition):
+    """Wrapper class for IfcFailureConnectionCondition."""
+
+    @property
+    def TensionFailureX(self)-> float:
+        """<attribute TensionFailureX?: <type IfcForceMeasure: <real>>>"""
+        return self._get_attribute("TensionFailureX")
+
+    @TensionFailureX.setter
+    def TensionFailureX(self, value: float):
+        return self._set_attribute("TensionFailureX", value)
+
+    @property
+    def TensionFailureY(self)-> float:
+        """<attribute TensionFailureY?: <type IfcForceMeasure: <real>>>"""
+        return self._get_attribute("TensionFailureY")
+
+    @TensionFailureY.setter
+    def TensionFailureY(self, value: float):
+        return self._set_attribute("TensionFailureY", value)
+
+    @property
+    def TensionFailureZ(self)-> float:
+        """<attribute TensionFailureZ?: <type IfcForceMeasure: <real>>>"""
+        return self._get_attribute("TensionFailureZ")
+
+    @TensionFailureZ.setter
+    def TensionFailureZ(self, value: float):
+        return self._set_attribute("TensionFailureZ", value)
+
+    @property
+    def CompressionFailureX(self)-> float:
+        """<attribute CompressionFailureX?: <type IfcForceMeasure: <real>>>"""
+        return self._get_attribute("CompressionFailureX")
+
+    @CompressionFailureX.setter
+    def CompressionFailureX(self, value: float):
+        return self._set_attribute("CompressionFailureX", value)
+
+    @property
+    def CompressionFailureY(self)-> float:
+        """<attribute CompressionFailureY?: <type IfcForceMeasure: <real>>>"""
+        return self._get_attribute("CompressionFailureY")
+
+    @CompressionFailureY.setter
+    def CompressionFailureY(self, value: float):
+        return self._set_attribute("CompressionFailureY", value)
+
+    @property
+    def CompressionFailureZ(self)-> float:
+        """<attribute CompressionFailureZ?: <type IfcForceMeasure: <real>>>"""
+        return self._get_attribute("CompressionFailureZ")
+
+    @CompressionFailureZ.setter
+    def CompressionFailureZ(self, value: float):
+        return self._set_attribute("CompressionFailureZ", value)
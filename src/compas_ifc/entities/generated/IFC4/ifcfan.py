@@ -0,0 +1,17 @@
+from .ifcflowmovingdevice import IfcFlowMovingDevice
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcfantypeenum import IfcFanTypeEnum
+
+class IfcFan(IfcFlowMovingDevice):
+    """Wrapper class for IfcFan."""
+
+    @property
+    def PredefinedType(self)-> "IfcFanTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcFanTypeEnum: (CENTRIFUGALFORWARDCURVED, CENTRIFUGALRADIAL, CENTRIFUGALBACKWARDINCLINEDCURVED, CENTRIFUGALAIRFOIL, TUBEAXIAL, VANEAXIAL, PROPELLORAXIAL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcFanTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
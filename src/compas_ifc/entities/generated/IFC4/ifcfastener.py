@@ -0,0 +1,17 @@
+from .ifcelementcomponent import IfcElementComponent
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcfastenertypeenum import IfcFastenerTypeEnum
+
+class IfcFastener(IfcElementComponent):
+    """Wrapper class for IfcFastener."""
+
+    @property
+    def PredefinedType(self)-> "IfcFastenerTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcFastenerTypeEnum: (GLUE, MORTAR, WELD, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcFastenerTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcFastenerTypeEnum(str):
+    items = ['GLUE', 'MORTAR', 'WELD', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,5 @@
+from .ifcelement import IfcElement
+
+
+class IfcFeatureElement(IfcElement):
+    """Wrapper class for IfcFeatureElement."""
@@ -0,0 +1,12 @@
+from .ifcfeatureelement import IfcFeatureElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelvoidselement import IfcRelVoidsElement
+
+class IfcFeatureElementSubtraction(IfcFeatureElement):
+    """Wrapper class for IfcFeatureElementSubtraction."""
+
+    def VoidsElements(self)-> list["IfcRelVoidsElement"]:
+        """<inverse VoidsElements:  [?:?] of <entity IfcRelVoidsElement> for <attribute RelatedOpeningElement: <entity IfcFeatureElementSubtraction>>>"""
+        return self._get_inverse_attribute("VoidsElements")
@@ -0,0 +1,56 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccartesianpoint import IfcCartesianPoint
+    from .ifccurvestyle import IfcCurveStyle
+    from .ifcvector import IfcVector
+
+class IfcFillAreaStyleHatching(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcFillAreaStyleHatching."""
+
+    @property
+    def HatchLineAppearance(self)-> "IfcCurveStyle":
+        """<attribute HatchLineAppearance: <entity IfcCurveStyle>>"""
+        return self._get_attribute("HatchLineAppearance")
+
+    @HatchLineAppearance.setter
+    def HatchLineAppearance(self, value: "IfcCurveStyle"):
+        return self._set_attribute("HatchLineAppearance", value)
+
+    @property
+    def StartOfNextHatchLine(self)-> Union[float, "IfcVector"]:
+        """<attribute StartOfNextHatchLine: <select IfcHatchLineDistanceSelect: (<type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>> | <entity IfcVector>)>>"""
+        return self._get_attribute("StartOfNextHatchLine")
+
+    @StartOfNextHatchLine.setter
+    def StartOfNextHatchLine(self, value: Union[float, "IfcVector"]):
+        return self._set_attribute("StartOfNextHatchLine", value)
+
+    @property
+    def PointOfReferenceHatchLine(self)-> "IfcCartesianPoint":
+        """<attribute PointOfReferenceHatchLine?: <entity IfcCartesianPoint>>"""
+        return self._get_attribute("PointOfReferenceHatchLine")
+
+    @PointOfReferenceHatchLine.setter
+    def PointOfReferenceHatchLine(self, value: "IfcCartesianPoint"):
+        return self._set_attribute("PointOfReferenceHatchLine", value)
+
+    @property
+    def PatternStart(self)-> "IfcCartesianPoint":
+        """<attribute PatternStart?: <entity IfcCartesianPoint>>"""
+        return self._get_attribute("PatternStart")
+
+    @PatternStart.setter
+    def PatternStart(self, value: "IfcCartesianPoint"):
+        return self._set_attribute("PatternStart", value)
+
+    @property
+    def HatchLineAngle(self)-> float:
+        """<attribute HatchLineAngle: <type IfcPlaneAngleMeasure: <real>>>"""
+        return self._get_attribute("HatchLineAngle")
+
+    @HatchLineAngle.setter
+    def HatchLineAngle(self, value: float):
+        return self._set_attribute("HatchLineAngle", value)
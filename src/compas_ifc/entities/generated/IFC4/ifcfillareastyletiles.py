@@ -0,0 +1,36 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcstyleditem import IfcStyledItem
+    from .ifcvector import IfcVector
+
+class IfcFillAreaStyleTiles(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcFillAreaStyleTiles."""
+
+    @property
+    def TilingPattern(self)-> list["IfcVector"]:
+        """<attribute TilingPattern: <list [2:2] of <entity IfcVector>>>"""
+        return self._get_attribute("TilingPattern")
+
+    @TilingPattern.setter
+    def TilingPattern(self, value: list["IfcVector"]):
+        return self._set_attribute("TilingPattern", value)
+
+    @property
+    def Tiles(self)-> list["IfcStyledItem"]:
+        """<attribute Tiles: <set [1:?] of <entity IfcStyledItem>>>"""
+        return self._get_attribute("Tiles")
+
+    @Tiles.setter
+    def Tiles(self, value: list["IfcStyledItem"]):
+        return self._set_attribute("Tiles", value)
+
+    @property
+    def TilingScale(self)-> float:
+        """<attribute TilingScale: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("TilingScale")
+
+    @TilingScale.setter
+    def TilingScale(self, value: float):
+        return self._set_attribute("TilingScale", value)
@@ -0,0 +1,17 @@
+from .ifcflowtreatmentdevice import IfcFlowTreatmentDevice
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcfiltertypeenum import IfcFilterTypeEnum
+
+class IfcFilter(IfcFlowTreatmentDevice):
+    """Wrapper class for IfcFilter."""
+
+    @property
+    def PredefinedType(self)-> "IfcFilterTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcFilterTypeEnum: (AIRPARTICLEFILTER, COMPRESSEDAIRFILTER, ODORFILTER, OILFILTER, STRAINER, WATERFILTER, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcFilterTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,17 @@
+from .ifcflowtreatmentdevicetype import IfcFlowTreatmentDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcfiltertypeenum import IfcFilterTypeEnum
+
+class IfcFilterType(IfcFlowTreatmentDeviceType):
+    """Wrapper class for IfcFilterType."""
+
+    @property
+    def PredefinedType(self)-> "IfcFilterTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcFilterTypeEnum: (AIRPARTICLEFILTER, COMPRESSEDAIRFILTER, ODORFILTER, OILFILTER, STRAINER, WATERFILTER, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcFilterTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcFilterTypeEnum(str):
+    items = ['AIRPARTICLEFILTER', 'COMPRESSEDAIRFILTER', 'ODORFILTER', 'OILFILTER', 'STRAINER', 'WATERFILTER', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcflowterminal import IfcFlowTerminal
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcfiresuppressionterminaltypeenum import IfcFireSuppressionTerminalTypeEnum
+
+class IfcFireSuppressionTerminal(IfcFlowTerminal):
+    """Wrapper class for IfcFireSuppressionTerminal."""
+
+    @property
+    def PredefinedType(self)-> "IfcFireSuppressionTerminalTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcFireSuppressionTerminalTypeEnum: (BREECHINGINLET, FIREHYDRANT, HOSEREEL, SPRINKLER, SPRINKLERDEFLECTOR, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcFireSuppressionTerminalTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
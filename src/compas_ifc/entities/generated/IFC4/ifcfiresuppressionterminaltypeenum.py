@@ -0,0 +1,2 @@
+class IfcFireSuppressionTerminalTypeEnum(str):
+    items = ['BREECHINGINLET', 'FIREHYDRANT', 'HOSEREEL', 'SPRINKLER', 'SPRINKLERDEFLECTOR', 'USERDEFINED', 'NOTDEFINED']
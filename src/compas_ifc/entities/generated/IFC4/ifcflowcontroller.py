@@ -0,0 +1,5 @@
+from .ifcdistributionflowelement import IfcDistributionFlowElement
+
+
+class IfcFlowController(IfcDistributionFlowElement):
+    """Wrapper class for IfcFlowController."""
@@ -0,0 +1,2 @@
+class IfcFlowDirectionEnum(str):
+    items = ['SOURCE', 'SINK', 'SOURCEANDSINK', 'NOTDEFINED']
@@ -0,0 +1,5 @@
+from .ifcdistributionflowelementtype import IfcDistributionFlowElementType
+
+
+class IfcFlowFittingType(IfcDistributionFlowElementType):
+    """Wrapper class for IfcFlowFittingType."""
@@ -0,0 +1,17 @@
+from .ifcdistributioncontrolelement import IfcDistributionControlElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcflowinstrumenttypeenum import IfcFlowInstrumentTypeEnum
+
+class IfcFlowInstrument(IfcDistributionControlElement):
+    """Wrapper class for IfcFlowInstrument."""
+
+    @property
+    def PredefinedType(self)-> "IfcFlowInstrumentTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcFlowInstrumentTypeEnum: (PRESSUREGAUGE, THERMOMETER, AMMETER, FREQUENCYMETER, POWERFACTORMETER, PHASEANGLEMETER, VOLTMETER_PEAK, VOLTMETER_RMS, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcFlowInstrumentTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
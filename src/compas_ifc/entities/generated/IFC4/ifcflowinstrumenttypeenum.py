@@ -0,0 +1,2 @@
+class IfcFlowInstrumentTypeEnum(str):
+    items = ['PRESSUREGAUGE', 'THERMOMETER', 'AMMETER', 'FREQUENCYMETER', 'POWERFACTORMETER', 'PHASEANGLEMETER', 'VOLTMETER_PEAK', 'VOLTMETER_RMS', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcflowcontroller import IfcFlowController
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcflowmetertypeenum import IfcFlowMeterTypeEnum
+
+class IfcFlowMeter(IfcFlowController):
+    """Wrapper class for IfcFlowMeter."""
+
+    @property
+    def PredefinedType(self)-> "IfcFlowMeterTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcFlowMeterTypeEnum: (ENERGYMETER, GASMETER, OILMETER, WATERMETER, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcFlowMeterTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
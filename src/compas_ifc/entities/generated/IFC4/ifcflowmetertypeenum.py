@@ -0,0 +1,2 @@
+class IfcFlowMeterTypeEnum(str):
+    items = ['ENERGYMETER', 'GASMETER', 'OILMETER', 'WATERMETER', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,5 @@
+from .ifcdistributionflowelement import IfcDistributionFlowElement
+
+
+class IfcFlowMovingDevice(IfcDistributionFlowElement):
+    """Wrapper class for IfcFlowMovingDevice."""
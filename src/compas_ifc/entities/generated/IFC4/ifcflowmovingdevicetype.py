@@ -0,0 +1,5 @@
+from .ifcdistributionflowelementtype import IfcDistributionFlowElementType
+
+
+class IfcFlowMovingDeviceType(IfcDistributionFlowElementType):
+    """Wrapper class for IfcFlowMovingDeviceType."""
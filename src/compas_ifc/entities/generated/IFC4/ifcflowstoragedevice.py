@@ -0,0 +1,5 @@
+from .ifcdistributionflowelement import IfcDistributionFlowElement
+
+
+class IfcFlowStorageDevice(IfcDistributionFlowElement):
+    """Wrapper class for IfcFlowStorageDevice."""
@@ -0,0 +1,5 @@
+from .ifcdistributionflowelementtype import IfcDistributionFlowElementType
+
+
+class IfcFlowStorageDeviceType(IfcDistributionFlowElementType):
+    """Wrapper class for IfcFlowStorageDeviceType."""
@@ -0,0 +1,5 @@
+from .ifcdistributionflowelementtype import IfcDistributionFlowElementType
+
+
+class IfcFlowTreatmentDeviceType(IfcDistributionFlowElementType):
+    """Wrapper class for IfcFlowTreatmentDeviceType."""
@@ -0,0 +1,5 @@
+from .ifcelementtype import IfcElementType
+
+
+class IfcFurnishingElementType(IfcElementType):
+    """Wrapper class for IfcFurnishingElementType."""
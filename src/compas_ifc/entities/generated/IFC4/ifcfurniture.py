@@ -0,0 +1,17 @@
+from .ifcfurnishingelement import IfcFurnishingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcfurnituretypeenum import IfcFurnitureTypeEnum
+
+class IfcFurniture(IfcFurnishingElement):
+    """Wrapper class for IfcFurniture."""
+
+    @property
+    def PredefinedType(self)-> "IfcFurnitureTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcFurnitureTypeEnum: (CHAIR, TABLE, DESK, BED, FILECABINET, SHELF, SOFA, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcFurnitureTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,27 @@
+from .ifcfurnishingelementtype import IfcFurnishingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcassemblyplaceenum import IfcAssemblyPlaceEnum
+    from .ifcfurnituretypeenum import IfcFurnitureTypeEnum
+
+class IfcFurnitureType(IfcFurnishingElementType):
+    """Wrapper class for IfcFurnitureType."""
+
+    @property
+    def AssemblyPlace(self)-> "IfcAssemblyPlaceEnum":
+        """<attribute AssemblyPlace: <enumeration IfcAssemblyPlaceEnum: (SITE, FACTORY, NOTDEFINED)>>"""
+        return self._get_attribute("AssemblyPlace")
+
+    @AssemblyPlace.setter
+    def AssemblyPlace(self, value: "IfcAssemblyPlaceEnum"):
+        return self._set_attribute("AssemblyPlace", value)
+
+    @property
+    def PredefinedType(self)-> "IfcFurnitureTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcFurnitureTypeEnum: (CHAIR, TABLE, DESK, BED, FILECABINET, SHELF, SOFA, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcFurnitureTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcFurnitureTypeEnum(str):
+    items = ['CHAIR', 'TABLE', 'DESK', 'BED', 'FILECABINET', 'SHELF', 'SOFA', 'USERDEFINED', 'NOTDEFINED']
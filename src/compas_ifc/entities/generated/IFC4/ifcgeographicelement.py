@@ -0,0 +1,17 @@
+from .ifcelement import IfcElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcgeographicelementtypeenum import IfcGeographicElementTypeEnum
+
+class IfcGeographicElement(IfcElement):
+    """Wrapper class for IfcGeographicElement."""
+
+    @property
+    def PredefinedType(self)-> "IfcGeographicElementTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcGeographicElementTypeEnum: (TERRAIN, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcGeographicElementTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
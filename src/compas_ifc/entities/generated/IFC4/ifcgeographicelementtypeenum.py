@@ -0,0 +1,2 @@
+class IfcGeographicElementTypeEnum(str):
+    items = ['TERRAIN', 'USERDEFINED', 'NOTDEFINED']
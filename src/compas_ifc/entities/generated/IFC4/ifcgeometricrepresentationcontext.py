@@ -0,0 +1,57 @@
+from .ifcrepresentationcontext import IfcRepresentationContext
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaxis2placement2d import IfcAxis2Placement2D
+    from .ifcaxis2placement3d import IfcAxis2Placement3D
+    from .ifccoordinateoperation import IfcCoordinateOperation
+    from .ifcdirection import IfcDirection
+    from .ifcgeometricrepresentationsubcontext import IfcGeometricRepresentationSubContext
+
+class IfcGeometricRepresentationContext(IfcRepresentationContext):
+    """Wrapper class for IfcGeometricRepresentationContext."""
+
+    @property
+    def CoordinateSpaceDimension(self)-> int:
+        """<attribute CoordinateSpaceDimension: <type IfcDimensionCount: <integer>>>"""
+        return self._get_attribute("CoordinateSpaceDimension")
+
+    @CoordinateSpaceDimension.setter
+    def CoordinateSpaceDimension(self, value: int):
+        return self._set_attribute("CoordinateSpaceDimension", value)
+
+    @property
+    def Precision(self)-> float:
+        """<attribute Precision?: <type IfcReal: <real>>>"""
+        return self._get_attribute("Precision")
+
+    @Precision.setter
+    def Precision(self, value: float):
+        return self._set_attribute("Precision", value)
+
+    @property
+    def WorldCoordinateSystem(self)-> Union["IfcAxis2Placement3D", "IfcAxis2Placement2D"]:
+        """<attribute WorldCoordinateSystem: <select IfcAxis2Placement: (<entity IfcAxis2Placement2D> | <entity IfcAxis2Placement3D>)>>"""
+        return self._get_attribute("WorldCoordinateSystem")
+
+    @WorldCoordinateSystem.setter
+    def WorldCoordinateSystem(self, value: Union["IfcAxis2Placement3D", "IfcAxis2Placement2D"]):
+        return self._set_attribute("WorldCoordinateSystem", value)
+
+    @property
+    def TrueNorth(self)-> "IfcDirection":
+        """<attribute TrueNorth?: <entity IfcDirection>>"""
+        return self._get_attribute("TrueNorth")
+
+    @TrueNorth.setter
+    def TrueNorth(self, value: "IfcDirection"):
+        return self._set_attribute("TrueNorth", value)
+
+    def HasSubContexts(self)-> list["IfcGeometricRepresentationSubContext"]:
+        """<inverse HasSubContexts: set [0:?] of <entity IfcGeometricRepresentationSubContext> for <attribute ParentContext: <entity IfcGeometricRepresentationContext>>>"""
+        return self._get_inverse_attribute("HasSubContexts")
+
+    def HasCoordinateOperation(self)-> list["IfcCoordinateOperation"]:
+        """<inverse HasCoordinateOperation: set [0:1] of <entity IfcCoordinateOperation> for <attribute SourceCRS: <select IfcCoordinateReferenceSystemSelect: (<entity IfcCoordinateReferenceSystem> | <entity IfcGeometricRepresentationContext>)>>>"""
+        return self._get_inverse_attribute("HasCoordinateOperation")
@@ -0,0 +1,5 @@
+from .ifcrepresentationitem import IfcRepresentationItem
+
+
+class IfcGeometricRepresentationItem(IfcRepresentationItem):
+    """Wrapper class for IfcGeometricRepresentationItem."""
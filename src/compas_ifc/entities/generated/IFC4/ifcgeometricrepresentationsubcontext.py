@@ -0,0 +1,89 @@
+from .ifcgeometricrepresentationcontext import IfcGeometricRepresentationContext
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaxis2placement2d import IfcAxis2Placement2D
+    from .ifcaxis2placement3d import IfcAxis2Placement3D
+    from .ifcdirection import IfcDirection
+    from .ifcgeometricprojectionenum import IfcGeometricProjectionEnum
+    from .ifcgeometricrepresentationcontext import IfcGeometricRepresentationContext
+
+class IfcGeometricRepresentationSubContext(IfcGeometricRepresentationContext):
+    """Wrapper class for IfcGeometricRepresentationSubContext."""
+
+    @property
+    def CoordinateSpaceDimension(self)-> int:
+        """<attribute CoordinateSpaceDimension: <type IfcDimensionCount: <integer>>>"""
+        return self._get_attribute("CoordinateSpaceDimension")
+
+    @CoordinateSpaceDimension.setter
+    def CoordinateSpaceDimension(self, value: int):
+        # Derived attribute
+        pass
+
+    @property
+    def Precision(self)-> float:
+        """<attribute Precision?: <type IfcReal: <real>>>"""
+        return self._get_attribute("Precision")
+
+    @Precision.setter
+    def Precision(self, value: float):
+        # Derived attribute
+        pass
+
+    @property
+    def WorldCoordinateSystem(self)-> Union["IfcAxis2Placement3D", "IfcAxis2Placement2D"]:
+        """<attribute WorldCoordinateSystem: <select IfcAxis2Placement: (<entity IfcAxis2Placement2D> | <entity IfcAxis2Placement3D>)>>"""
+        return self._get_attribute("WorldCoordinateSystem")
+
+    @WorldCoordinateSystem.setter
+    def WorldCoordinateSystem(self, value: Union["IfcAxis2Placement3D", "IfcAxis2Placement2D"]):
+        # Derived attribute
+        pass
+
+    @property
+    def TrueNorth(self)-> "IfcDirection":
+        """<attribute TrueNorth?: <entity IfcDirection>>"""
+        return self._get_attribute("TrueNorth")
+
+    @TrueNorth.setter
+    def TrueNorth(self, value: "IfcDirection"):
+        # Derived attribute
+        pass
+
+    @property
+    def ParentContext(self)-> "IfcGeometricRepresentationContext":
+        """<attribute ParentContext: <entity IfcGeometricRepresentationContext>>"""
+        return self._get_attribute("ParentContext")
+
+    @ParentContext.setter
+    def ParentContext(self, value: "IfcGeometricRepresentationContext"):
+        return self._set_attribute("ParentContext", value)
+
+    @property
+    def TargetScale(self)-> float:
+        """<attribute TargetScale?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("TargetScale")
+
+    @TargetScale.setter
+    def TargetScale(self, value: float):
+        return self._set_attribute("TargetScale", value)
+
+    @property
+    def TargetView(self)-> "IfcGeometricProjectionEnum":
+        """<attribute TargetView: <enumeration IfcGeometricProjectionEnum: (GRAPH_VIEW, SKETCH_VIEW, MODEL_VIEW, PLAN_VIEW, REFLECTED_PLAN_VIEW, SECTION_VIEW, ELEVATION_VIEW, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("TargetView")
+
+    @TargetView.setter
+    def TargetView(self, value: "IfcGeometricProjectionEnum"):
+        return self._set_attribute("TargetView", value)
+
+    @property
+    def UserDefinedTargetView(self)-> str:
+        """<attribute UserDefinedTargetView?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedTargetView")
+
+    @UserDefinedTargetView.setter
+    def UserDefinedTargetView(self, value: str):
+        return self._set_attribute("UserDefinedTargetView", value)
@@ -0,0 +1,28 @@
+from .ifcobjectplacement import IfcObjectPlacement
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdirection import IfcDirection
+    from .ifcvirtualgridintersection import IfcVirtualGridIntersection
+
+class IfcGridPlacement(IfcObjectPlacement):
+    """Wrapper class for IfcGridPlacement."""
+
+    @property
+    def PlacementLocation(self)-> "IfcVirtualGridIntersection":
+        """<attribute PlacementLocation: <entity IfcVirtualGridIntersection>>"""
+        return self._get_attribute("PlacementLocation")
+
+    @PlacementLocation.setter
+    def PlacementLocation(self, value: "IfcVirtualGridIntersection"):
+        return self._set_attribute("PlacementLocation", value)
+
+    @property
+    def PlacementRefDirection(self)-> Union["IfcDirection", "IfcVirtualGridIntersection"]:
+        """<attribute PlacementRefDirection?: <select IfcGridPlacementDirectionSelect: (<entity IfcDirection> | <entity IfcVirtualGridIntersection>)>>"""
+        return self._get_attribute("PlacementRefDirection")
+
+    @PlacementRefDirection.setter
+    def PlacementRefDirection(self, value: Union["IfcDirection", "IfcVirtualGridIntersection"]):
+        return self._set_attribute("PlacementRefDirection", value)
@@ -0,0 +1,2 @@
+class IfcGridTypeEnum(str):
+    items = ['RECTANGULAR', 'RADIAL', 'TRIANGULAR', 'IRREGULAR', 'USERDEFINED', 'NOTDEFINED']
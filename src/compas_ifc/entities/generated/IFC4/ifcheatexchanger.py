@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevice import IfcEnergyConversionDevice
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcheatexchangertypeenum import IfcHeatExchangerTypeEnum
+
+class IfcHeatExchanger(IfcEnergyConversionDevice):
+    """Wrapper class for IfcHeatExchanger."""
+
+    @property
+    def PredefinedType(self)-> "IfcHeatExchangerTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcHeatExchangerTypeEnum: (PLATE, SHELLANDTUBE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcHeatExchangerTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevicetype import IfcEnergyConversionDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcheatexchangertypeenum import IfcHeatExchangerTypeEnum
+
+class IfcHeatExchangerType(IfcEnergyConversionDeviceType):
+    """Wrapper class for IfcHeatExchangerType."""
+
+    @property
+    def PredefinedType(self)-> "IfcHeatExchangerTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcHeatExchangerTypeEnum: (PLATE, SHELLANDTUBE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcHeatExchangerTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
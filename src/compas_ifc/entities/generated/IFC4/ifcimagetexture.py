@@ -0,0 +1,14 @@
+from .ifcsurfacetexture import IfcSurfaceTexture
+
+
+class IfcImageTexture(IfcSurfaceTexture):
+    """Wrapper class for IfcImageTexture."""
+
+    @property
+    def URLReference(self)-> str:
+        """<attribute URLReference: <type IfcURIReference: <string>>>"""
+        return self._get_attribute("URLReference")
+
+    @URLReference.setter
+    def URLReference(self, value: str):
+        return self._set_attribute("URLReference", value)
@@ -0,0 +1,45 @@
+from .ifcpresentationitem import IfcPresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccolourrgblist import IfcColourRgbList
+    from .ifctessellatedfaceset import IfcTessellatedFaceSet
+
+class IfcIndexedColourMap(IfcPresentationItem):
+    """Wrapper class for IfcIndexedColourMap."""
+
+    @property
+    def MappedTo(self)-> "IfcTessellatedFaceSet":
+        """<attribute MappedTo: <entity IfcTessellatedFaceSet>>"""
+        return self._get_attribute("MappedTo")
+
+    @MappedTo.setter
+    def MappedTo(self, value: "IfcTessellatedFaceSet"):
+        return self._set_attribute("MappedTo", value)
+
+    @property
+    def Opacity(self)-> float:
+        """<attribute Opacity?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("Opacity")
+
+    @Opacity.setter
+    def Opacity(self, value: float):
+        return self._set_attribute("Opacity", value)
+
+    @property
+    def Colours(self)-> "IfcColourRgbList":
+        """<attribute Colours: <entity IfcColourRgbList>>"""
+        return self._get_attribute("Colours")
+
+    @Colours.setter
+    def Colours(self, value: "IfcColourRgbList"):
+        return self._set_attribute("Colours", value)
+
+    @property
+    def ColourIndex(self)-> list[int]:
+        """<attribute ColourIndex: <list [1:?] of <type IfcPositiveInteger: <type IfcInteger: <integer>>>>>"""
+        return self._get_attribute("ColourIndex")
+
+    @ColourIndex.setter
+    def ColourIndex(self, value: list[int]):
+        return self._set_attribute("ColourIndex", value)
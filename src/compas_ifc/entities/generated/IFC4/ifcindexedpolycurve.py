@@ -0,0 +1,36 @@
+from .ifcboundedcurve import IfcBoundedCurve
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccartesianpointlist import IfcCartesianPointList
+
+class IfcIndexedPolyCurve(IfcBoundedCurve):
+    """Wrapper class for IfcIndexedPolyCurve."""
+
+    @property
+    def Points(self)-> "IfcCartesianPointList":
+        """<attribute Points: <entity IfcCartesianPointList>>"""
+        return self._get_attribute("Points")
+
+    @Points.setter
+    def Points(self, value: "IfcCartesianPointList"):
+        return self._set_attribute("Points", value)
+
+    @property
+    def Segments(self)-> list[Union[list[int]]]:
+        """<attribute Segments?: <list [1:?] of <select IfcSegmentIndexSelect: (<type IfcArcIndex: <list [3:3] of <type IfcPositiveInteger: <type IfcInteger: <integer>>>>> | <type IfcLineIndex: <list [2:?] of <type IfcPositiveInteger: <type IfcInteger: <integer>>>>>)>>>"""
+        return self._get_attribute("Segments")
+
+    @Segments.setter
+    def Segments(self, value: list[Union[list[int]]]):
+        return self._set_attribute("Segments", value)
+
+    @property
+    def SelfIntersect(self)-> bool:
+        """<attribute SelfIntersect?: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("SelfIntersect")
+
+    @SelfIntersect.setter
+    def SelfIntersect(self, value: bool):
+        return self._set_attribute("SelfIntersect", value)
@@ -0,0 +1,21 @@
+from .ifctessellateditem import IfcTessellatedItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpolygonalfaceset import IfcPolygonalFaceSet
+
+class IfcIndexedPolygonalFace(IfcTessellatedItem):
+    """Wrapper class for IfcIndexedPolygonalFace."""
+
+    @property
+    def CoordIndex(self)-> list[int]:
+        """<attribute CoordIndex: <list [3:?] of <type IfcPositiveInteger: <type IfcInteger: <integer>>>>>"""
+        return self._get_attribute("CoordIndex")
+
+    @CoordIndex.setter
+    def CoordIndex(self, value: list[int]):
+        return self._set_attribute("CoordIndex", value)
+
+    def ToFaceSet(self)-> list["IfcPolygonalFaceSet"]:
+        """<inverse ToFaceSet: set [1:?] of <entity IfcPolygonalFaceSet> for <attribute Faces: <list [1:?] of <entity IfcIndexedPolygonalFace>>>>"""
+        return self._get_inverse_attribute("ToFaceSet")
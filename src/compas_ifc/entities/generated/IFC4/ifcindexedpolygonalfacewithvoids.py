@@ -0,0 +1,14 @@
+from .ifcindexedpolygonalface import IfcIndexedPolygonalFace
+
+
+class IfcIndexedPolygonalFaceWithVoids(IfcIndexedPolygonalFace):
+    """Wrapper class for IfcIndexedPolygonalFaceWithVoids."""
+
+    @property
+    def InnerCoordIndices(self)-> list[list[int]]:
+        """<attribute InnerCoordIndices: <list [1:?] of <list [3:?] of <type IfcPositiveInteger: <type IfcInteger: <integer>>>>>>"""
+        return self._get_attribute("InnerCoordIndices")
+
+    @InnerCoordIndices.setter
+    def InnerCoordIndices(self, value: list[list[int]]):
+        return self._set_attribute("InnerCoordIndices", value)
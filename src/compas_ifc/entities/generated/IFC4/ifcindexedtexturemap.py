@@ -0,0 +1,27 @@
+from .ifctexturecoordinate import IfcTextureCoordinate
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctessellatedfaceset import IfcTessellatedFaceSet
+    from .ifctexturevertexlist import IfcTextureVertexList
+
+class IfcIndexedTextureMap(IfcTextureCoordinate):
+    """Wrapper class for IfcIndexedTextureMap."""
+
+    @property
+    def MappedTo(self)-> "IfcTessellatedFaceSet":
+        """<attribute MappedTo: <entity IfcTessellatedFaceSet>>"""
+        return self._get_attribute("MappedTo")
+
+    @MappedTo.setter
+    def MappedTo(self, value: "IfcTessellatedFaceSet"):
+        return self._set_attribute("MappedTo", value)
+
+    @property
+    def TexCoords(self)-> "IfcTextureVertexList":
+        """<attribute TexCoords: <entity IfcTextureVertexList>>"""
+        return self._get_attribute("TexCoords")
+
+    @TexCoords.setter
+    def TexCoords(self, value: "IfcTextureVertexList"):
+        return self._set_attribute("TexCoords", value)
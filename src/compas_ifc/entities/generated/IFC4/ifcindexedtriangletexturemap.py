@@ -0,0 +1,14 @@
+from .ifcindexedtexturemap import IfcIndexedTextureMap
+
+
+class IfcIndexedTriangleTextureMap(IfcIndexedTextureMap):
+    """Wrapper class for IfcIndexedTriangleTextureMap."""
+
+    @property
+    def TexCoordIndex(self)-> list[list[int]]:
+        """<attribute TexCoordIndex?: <list [1:?] of <list [3:3] of <type IfcPositiveInteger: <type IfcInteger: <integer>>>>>>"""
+        return self._get_attribute("TexCoordIndex")
+
+    @TexCoordIndex.setter
+    def TexCoordIndex(self, value: list[list[int]]):
+        return self._set_attribute("TexCoordIndex", value)
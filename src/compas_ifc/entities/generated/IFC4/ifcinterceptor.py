@@ -0,0 +1,17 @@
+from .ifcflowtreatmentdevice import IfcFlowTreatmentDevice
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcinterceptortypeenum import IfcInterceptorTypeEnum
+
+class IfcInterceptor(IfcFlowTreatmentDevice):
+    """Wrapper class for IfcInterceptor."""
+
+    @property
+    def PredefinedType(self)-> "IfcInterceptorTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcInterceptorTypeEnum: (CYCLONIC, GREASE, OIL, PETROL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcInterceptorTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,17 @@
+from .ifcflowtreatmentdevicetype import IfcFlowTreatmentDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcinterceptortypeenum import IfcInterceptorTypeEnum
+
+class IfcInterceptorType(IfcFlowTreatmentDeviceType):
+    """Wrapper class for IfcInterceptorType."""
+
+    @property
+    def PredefinedType(self)-> "IfcInterceptorTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcInterceptorTypeEnum: (CYCLONIC, GREASE, OIL, PETROL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcInterceptorTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcInterceptorTypeEnum(str):
+    items = ['CYCLONIC', 'GREASE', 'OIL', 'PETROL', 'USERDEFINED', 'NOTDEFINED']
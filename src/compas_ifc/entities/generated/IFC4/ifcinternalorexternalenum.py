@@ -0,0 +1,2 @@
+class IfcInternalOrExternalEnum(str):
+    items = ['INTERNAL', 'EXTERNAL', 'EXTERNAL_EARTH', 'EXTERNAL_WATER', 'EXTERNAL_FIRE', 'NOTDEFINED']
@@ -0,0 +1,5 @@
+from .ifcsurfacecurve import IfcSurfaceCurve
+
+
+class IfcIntersectionCurve(IfcSurfaceCurve):
+    """Wrapper class for IfcIntersectionCurve."""
@@ -0,0 +1,67 @@
+from .ifcgroup import IfcGroup
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccostvalue import IfcCostValue
+    from .ifcinventorytypeenum import IfcInventoryTypeEnum
+    from .ifcorganization import IfcOrganization
+    from .ifcperson import IfcPerson
+    from .ifcpersonandorganization import IfcPersonAndOrganization
+
+class IfcInventory(IfcGroup):
+    """Wrapper class for IfcInventory."""
+
+    @property
+    def PredefinedType(self)-> "IfcInventoryTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcInventoryTypeEnum: (ASSETINVENTORY, SPACEINVENTORY, FURNITUREINVENTORY, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcInventoryTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def Jurisdiction(self)-> Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]:
+        """<attribute Jurisdiction?: <select IfcActorSelect: (<entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization>)>>"""
+        return self._get_attribute("Jurisdiction")
+
+    @Jurisdiction.setter
+    def Jurisdiction(self, value: Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]):
+        return self._set_attribute("Jurisdiction", value)
+
+    @property
+    def ResponsiblePersons(self)-> list["IfcPerson"]:
+        """<attribute ResponsiblePersons?: <set [1:?] of <entity IfcPerson>>>"""
+        return self._get_attribute("ResponsiblePersons")
+
+    @ResponsiblePersons.setter
+    def ResponsiblePersons(self, value: list["IfcPerson"]):
+        return self._set_attribute("ResponsiblePersons", value)
+
+    @property
+    def LastUpdateDate(self)-> str:
+        """<attribute LastUpdateDate?: <type IfcDate: <string>>>"""
+        return self._get_attribute("LastUpdateDate")
+
+    @LastUpdateDate.setter
+    def LastUpdateDate(self, value: str):
+        return self._set_attribute("LastUpdateDate", value)
+
+    @property
+    def CurrentValue(self)-> "IfcCostValue":
+        """<attribute CurrentValue?: <entity IfcCostValue>>"""
+        return self._get_attribute("CurrentValue")
+
+    @CurrentValue.setter
+    def CurrentValue(self, value: "IfcCostValue"):
+        return self._set_attribute("CurrentValue", value)
+
+    @property
+    def OriginalValue(self)-> "IfcCostValue":
+        """<attribute OriginalValue?: <entity IfcCostValue>>"""
+        return self._get_attribute("OriginalValue")
+
+    @OriginalValue.setter
+    def OriginalValue(self, value: "IfcCostValue"):
+        return self._set_attribute("OriginalValue", value)
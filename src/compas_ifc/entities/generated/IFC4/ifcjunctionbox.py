@@ -0,0 +1,17 @@
+from .ifcflowfitting import IfcFlowFitting
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcjunctionboxtypeenum import IfcJunctionBoxTypeEnum
+
+class IfcJunctionBox(IfcFlowFitting):
+    """Wrapper class for IfcJunctionBox."""
+
+    @property
+    def PredefinedType(self)-> "IfcJunctionBoxTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcJunctionBoxTypeEnum: (DATA, POWER, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcJunctionBoxTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
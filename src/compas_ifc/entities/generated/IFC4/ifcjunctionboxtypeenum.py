@@ -0,0 +1,2 @@
+class IfcJunctionBoxTypeEnum(str):
+    items = ['DATA', 'POWER', 'USERDEFINED', 'NOTDEFINED']
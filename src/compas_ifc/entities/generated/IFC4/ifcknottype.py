@@ -0,0 +1,2 @@
+class IfcKnotType(str):
+    items = ['UNIFORM_KNOTS', 'QUASI_UNIFORM_KNOTS', 'PIECEWISE_BEZIER_KNOTS', 'UNSPECIFIED']
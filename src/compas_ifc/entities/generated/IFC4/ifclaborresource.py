@@ -0,0 +1,17 @@
+from .ifcconstructionresource import IfcConstructionResource
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifclaborresourcetypeenum import IfcLaborResourceTypeEnum
+
+class IfcLaborResource(IfcConstructionResource):
+    """Wrapper class for IfcLaborResource."""
+
+    @property
+    def PredefinedType(self)-> "IfcLaborResourceTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcLaborResourceTypeEnum: (ADMINISTRATION, CARPENTRY, CLEANING, CONCRETE, DRYWALL, ELECTRIC, FINISHING, FLOORING, GENERAL, HVAC, LANDSCAPING, MASONRY, PAINTING, PAVING, PLUMBING, ROOFING, SITEGRADING, STEELWORK, SURVEYING, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcLaborResourceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcLaborResourceTypeEnum(str):
+    items = ['ADMINISTRATION', 'CARPENTRY', 'CLEANING', 'CONCRETE', 'DRYWALL', 'ELECTRIC', 'FINISHING', 'FLOORING', 'GENERAL', 'HVAC', 'LANDSCAPING', 'MASONRY', 'PAINTING', 'PAVING', 'PLUMBING', 'ROOFING', 'SITEGRADING', 'STEELWORK', 'SURVEYING', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,27 @@
+from .ifcschedulingtime import IfcSchedulingTime
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctaskdurationenum import IfcTaskDurationEnum
+
+class IfcLagTime(IfcSchedulingTime):
+    """Wrapper class for IfcLagTime."""
+
+    @property
+    def LagValue(self)-> Union[float, str]:
+        """<attribute LagValue: <select IfcTimeOrRatioSelect: (<type IfcDuration: <string>> | <type IfcRatioMeasure: <real>>)>>"""
+        return self._get_attribute("LagValue")
+
+    @LagValue.setter
+    def LagValue(self, value: Union[float, str]):
+        return self._set_attribute("LagValue", value)
+
+    @property
+    def DurationType(self)-> "IfcTaskDurationEnum":
+        """<attribute DurationType: <enumeration IfcTaskDurationEnum: (ELAPSEDTIME, WORKTIME, NOTDEFINED)>>"""
+        return self._get_attribute("DurationType")
+
+    @DurationType.setter
+    def DurationType(self, value: "IfcTaskDurationEnum"):
+        return self._set_attribute("DurationType", value)
@@ -0,0 +1,17 @@
+from .ifcflowterminal import IfcFlowTerminal
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifclamptypeenum import IfcLampTypeEnum
+
+class IfcLamp(IfcFlowTerminal):
+    """Wrapper class for IfcLamp."""
+
+    @property
+    def PredefinedType(self)-> "IfcLampTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcLampTypeEnum: (COMPACTFLUORESCENT, FLUORESCENT, HALOGEN, HIGHPRESSUREMERCURY, HIGHPRESSURESODIUM, LED, METALHALIDE, OLED, TUNGSTENFILAMENT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcLampTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,17 @@
+from .ifcflowterminaltype import IfcFlowTerminalType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifclamptypeenum import IfcLampTypeEnum
+
+class IfcLampType(IfcFlowTerminalType):
+    """Wrapper class for IfcLampType."""
+
+    @property
+    def PredefinedType(self)-> "IfcLampTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcLampTypeEnum: (COMPACTFLUORESCENT, FLUORESCENT, HALOGEN, HIGHPRESSUREMERCURY, HIGHPRESSURESODIUM, LED, METALHALIDE, OLED, TUNGSTENFILAMENT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcLampTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
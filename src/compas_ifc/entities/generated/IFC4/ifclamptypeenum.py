@@ -0,0 +1,2 @@
+class IfcLampTypeEnum(str):
+    items = ['COMPACTFLUORESCENT', 'FLUORESCENT', 'HALOGEN', 'HIGHPRESSUREMERCURY', 'HIGHPRESSURESODIUM', 'LED', 'METALHALIDE', 'OLED', 'TUNGSTENFILAMENT', 'USERDEFINED', 'NOTDEFINED']
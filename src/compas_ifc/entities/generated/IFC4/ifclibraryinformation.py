@@ -0,0 +1,75 @@
+from .ifcexternalinformation import IfcExternalInformation
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifclibraryreference import IfcLibraryReference
+    from .ifcorganization import IfcOrganization
+    from .ifcperson import IfcPerson
+    from .ifcpersonandorganization import IfcPersonAndOrganization
+    from .ifcrelassociateslibrary import IfcRelAssociatesLibrary
+
+class IfcLibraryInformation(IfcExternalInformation):
+    """Wrapper class for IfcLibraryInformation."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Version(self)-> str:
+        """<attribute Version?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Version")
+
+    @Version.setter
+    def Version(self, value: str):
+        return self._set_attribute("Version", value)
+
+    @property
+    def Publisher(self)-> Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]:
+        """<attribute Publisher?: <select IfcActorSelect: (<entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization>)>>"""
+        return self._get_attribute("Publisher")
+
+    @Publisher.setter
+    def Publisher(self, value: Union["IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]):
+        return self._set_attribute("Publisher", value)
+
+    @property
+    def VersionDate(self)-> str:
+        """<attribute VersionDate?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("VersionDate")
+
+    @VersionDate.setter
+    def VersionDate(self, value: str):
+        return self._set_attribute("VersionDate", value)
+
+    @property
+    def Location(self)-> str:
+        """<attribute Location?: <type IfcURIReference: <string>>>"""
+        return self._get_attribute("Location")
+
+    @Location.setter
+    def Location(self, value: str):
+        return self._set_attribute("Location", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    def LibraryInfoForObjects(self)-> list["IfcRelAssociatesLibrary"]:
+        """<inverse LibraryInfoForObjects: set [0:?] of <entity IfcRelAssociatesLibrary> for <attribute RelatingLibrary: <select IfcLibrarySelect: (<entity IfcLibraryInformation> | <entity IfcLibraryReference>)>>>"""
+        return self._get_inverse_attribute("LibraryInfoForObjects")
+
+    def HasLibraryReferences(self)-> list["IfcLibraryReference"]:
+        """<inverse HasLibraryReferences: set [0:?] of <entity IfcLibraryReference> for <attribute ReferencedLibrary?: <entity IfcLibraryInformation>>>"""
+        return self._get_inverse_attribute("HasLibraryReferences")
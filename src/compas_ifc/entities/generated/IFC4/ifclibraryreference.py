@@ -0,0 +1,40 @@
+from .ifcexternalreference import IfcExternalReference
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifclibraryinformation import IfcLibraryInformation
+    from .ifcrelassociateslibrary import IfcRelAssociatesLibrary
+
+class IfcLibraryReference(IfcExternalReference):
+    """Wrapper class for IfcLibraryReference."""
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def Language(self)-> str:
+        """<attribute Language?: <type IfcLanguageId: <type IfcIdentifier: <string>>>>"""
+        return self._get_attribute("Language")
+
+    @Language.setter
+    def Language(self, value: str):
+        return self._set_attribute("Language", value)
+
+    @property
+    def ReferencedLibrary(self)-> "IfcLibraryInformation":
+        """<attribute ReferencedLibrary?: <entity IfcLibraryInformation>>"""
+        return self._get_attribute("ReferencedLibrary")
+
+    @ReferencedLibrary.setter
+    def ReferencedLibrary(self, value: "IfcLibraryInformation"):
+        return self._set_attribute("ReferencedLibrary", value)
+
+    def LibraryRefForObjects(self)-> list["IfcRelAssociatesLibrary"]:
+        """<inverse LibraryRefForObjects: set [0:?] of <entity IfcRelAssociatesLibrary> for <attribute RelatingLibrary: <select IfcLibrarySelect: (<entity IfcLibraryInformation> | <entity IfcLibraryReference>)>>>"""
+        return self._get_inverse_attribute("LibraryRefForObjects")
@@ -0,0 +1,2 @@
+class IfcLightDistributionCurveEnum(str):
+    items = ['TYPE_A', 'TYPE_B', 'TYPE_C', 'NOTDEFINED']
@@ -0,0 +1,2 @@
+class IfcLightEmissionSourceEnum(str):
+    items = ['COMPACTFLUORESCENT', 'FLUORESCENT', 'HIGHPRESSUREMERCURY', 'HIGHPRESSURESODIUM', 'LIGHTEMITTINGDIODE', 'LOWPRESSURESODIUM', 'LOWVOLTAGEHALOGEN', 'MAINVOLTAGEHALOGEN', 'METALHALIDE', 'TUNGSTENFILAMENT', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcflowterminal import IfcFlowTerminal
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifclightfixturetypeenum import IfcLightFixtureTypeEnum
+
+class IfcLightFixture(IfcFlowTerminal):
+    """Wrapper class for IfcLightFixture."""
+
+    @property
+    def PredefinedType(self)-> "IfcLightFixtureTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcLightFixtureTypeEnum: (POINTSOURCE, DIRECTIONSOURCE, SECURITYLIGHTING, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcLightFixtureTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
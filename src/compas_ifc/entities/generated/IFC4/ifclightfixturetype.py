@@ -0,0 +1,17 @@
+from .ifcflowterminaltype import IfcFlowTerminalType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifclightfixturetypeenum import IfcLightFixtureTypeEnum
+
+class IfcLightFixtureType(IfcFlowTerminalType):
+    """Wrapper class for IfcLightFixtureType."""
+
+    @property
+    def PredefinedType(self)-> "IfcLightFixtureTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcLightFixtureTypeEnum: (POINTSOURCE, DIRECTIONSOURCE, SECURITYLIGHTING, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcLightFixtureTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcLightFixtureTypeEnum(str):
+    items = ['POINTSOURCE', 'DIRECTIONSOURCE', 'SECURITYLIGHTING', 'USERDEFINED', 'NOTDEFINED']
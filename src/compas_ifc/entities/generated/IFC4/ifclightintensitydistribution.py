@@ -0,0 +1,27 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifclightdistributioncurveenum import IfcLightDistributionCurveEnum
+    from .ifclightdistributiondata import IfcLightDistributionData
+
+class IfcLightIntensityDistribution(Base):
+    """Wrapper class for IfcLightIntensityDistribution."""
+
+    @property
+    def LightDistributionCurve(self)-> "IfcLightDistributionCurveEnum":
+        """<attribute LightDistributionCurve: <enumeration IfcLightDistributionCurveEnum: (TYPE_A, TYPE_B, TYPE_C, NOTDEFINED)>>"""
+        return self._get_attribute("LightDistributionCurve")
+
+    @LightDistributionCurve.setter
+    def LightDistributionCurve(self, value: "IfcLightDistributionCurveEnum"):
+        return self._set_attribute("LightDistributionCurve", value)
+
+    @property
+    def DistributionData(self)-> list["IfcLightDistributionData"]:
+        """<attribute DistributionData: <list [1:?] of <entity IfcLightDistributionData>>>"""
+        return self._get_attribute("DistributionData")
+
+    @DistributionData.setter
+    def DistributionData(self, value: list["IfcLightDistributionData"]):
+        return self._set_attribute("DistributionData", value)
@@ -0,0 +1,5 @@
+from .ifclightsource import IfcLightSource
+
+
+class IfcLightSourceAmbient(IfcLightSource):
+    """Wrapper class for IfcLightSourceAmbient."""
@@ -0,0 +1,17 @@
+from .ifclightsource import IfcLightSource
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdirection import IfcDirection
+
+class IfcLightSourceDirectional(IfcLightSource):
+    """Wrapper class for IfcLightSourceDirectional."""
+
+    @property
+    def Orientation(self)-> "IfcDirection":
+        """<attribute Orientation: <entity IfcDirection>>"""
+        return self._get_attribute("Orientation")
+
+    @Orientation.setter
+    def Orientation(self, value: "IfcDirection"):
+        return self._set_attribute("Orientation", value)
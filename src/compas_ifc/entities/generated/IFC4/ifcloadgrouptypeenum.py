@@ -0,0 +1,2 @@
+class IfcLoadGroupTypeEnum(str):
+    items = ['LOAD_GROUP', 'LOAD_CASE', 'LOAD_COMBINATION', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,59 @@
+from .ifcparameterizedprofiledef import IfcParameterizedProfileDef
+
+
+class IfcLShapeProfileDef(IfcParameterizedProfileDef):
+    """Wrapper class for IfcLShapeProfileDef."""
+
+    @property
+    def Depth(self)-> float:
+        """<attribute Depth: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Depth")
+
+    @Depth.setter
+    def Depth(self, value: float):
+        return self._set_attribute("Depth", value)
+
+    @property
+    def Width(self)-> float:
+        """<attribute Width?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Width")
+
+    @Width.setter
+    def Width(self, value: float):
+        return self._set_attribute("Width", value)
+
+    @property
+    def Thickness(self)-> float:
+        """<attribute Thickness: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Thickness")
+
+    @Thickness.setter
+    def Thickness(self, value: float):
+        return self._set_attribute("Thickness", value)
+
+    @property
+    def FilletRadius(self)-> float:
+        """<attribute FilletRadius?: <type IfcNonNegativeLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("FilletRadius")
+
+    @FilletRadius.setter
+    def FilletRadius(self, value: float):
+        return self._set_attribute("FilletRadius", value)
+
+    @property
+    def EdgeRadius(self)-> float:
+        """<attribute EdgeRadius?: <type IfcNonNegativeLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("EdgeRadius")
+
+    @EdgeRadius.setter
+    def EdgeRadius(self, value: float):
+        return self._set_attribute("EdgeRadius", value)
+
+    @property
+    def LegSlope(self)-> float:
+        """<attribute LegSlope?: <type IfcPlaneAngleMeasure: <real>>>"""
+        return self._get_attribute("LegSlope")
+
+    @LegSlope.setter
+    def LegSlope(self, value: float):
+        return self._set_attribute("LegSlope", value)
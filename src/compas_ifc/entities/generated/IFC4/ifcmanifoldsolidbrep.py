@@ -0,0 +1,17 @@
+from .ifcsolidmodel import IfcSolidModel
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcclosedshell import IfcClosedShell
+
+class IfcManifoldSolidBrep(IfcSolidModel):
+    """Wrapper class for IfcManifoldSolidBrep."""
+
+    @property
+    def Outer(self)-> "IfcClosedShell":
+        """<attribute Outer: <entity IfcClosedShell>>"""
+        return self._get_attribute("Outer")
+
+    @Outer.setter
+    def Outer(self, value: "IfcClosedShell"):
+        return self._set_attribute("Outer", value)
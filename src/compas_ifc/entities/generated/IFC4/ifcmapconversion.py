@@ -0,0 +1,59 @@
+from .ifccoordinateoperation import IfcCoordinateOperation
+
+
+class IfcMapConversion(IfcCoordinateOperation):
+    """Wrapper class for IfcMapConversion."""
+
+    @property
+    def Eastings(self)-> float:
+        """<attribute Eastings: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("Eastings")
+
+    @Eastings.setter
+    def Eastings(self, value: float):
+        return self._set_attribute("Eastings", value)
+
+    @property
+    def Northings(self)-> float:
+        """<attribute Northings: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("Northings")
+
+    @Northings.setter
+    def Northings(self, value: float):
+        return self._set_attribute("Northings", value)
+
+    @property
+    def OrthogonalHeight(self)-> float:
+        """<attribute OrthogonalHeight: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("OrthogonalHeight")
+
+    @OrthogonalHeight.setter
+    def OrthogonalHeight(self, value: float):
+        return self._set_attribute("OrthogonalHeight", value)
+
+    @property
+    def XAxisAbscissa(self)-> float:
+        """<attribute XAxisAbscissa?: <type IfcReal: <real>>>"""
+        return self._get_attribute("XAxisAbscissa")
+
+    @XAxisAbscissa.setter
+    def XAxisAbscissa(self, value: float):
+        return self._set_attribute("XAxisAbscissa", value)
+
+    @property
+    def XAxisOrdinate(self)-> float:
+        """<attribute XAxisOrdinate?: <type IfcReal: <real>>>"""
+        return self._get_attribute("XAxisOrdinate")
+
+    @XAxisOrdinate.setter
+    def XAxisOrdinate(self, value: float):
+        return self._set_attribute("XAxisOrdinate", value)
+
+    @property
+    def Scale(self)-> float:
+        """<attribute Scale?: <type IfcReal: <real>>>"""
+        return self._get_attribute("Scale")
+
+    @Scale.setter
+    def Scale(self, value: float):
+        return self._set_attribute("Scale", value)
@@ -0,0 +1,48 @@
+from .ifcmaterialdefinition import IfcMaterialDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmaterialdefinitionrepresentation import IfcMaterialDefinitionRepresentation
+    from .ifcmaterialrelationship import IfcMaterialRelationship
+
+class IfcMaterial(IfcMaterialDefinition):
+    """Wrapper class for IfcMaterial."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def Category(self)-> str:
+        """<attribute Category?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Category")
+
+    @Category.setter
+    def Category(self, value: str):
+        return self._set_attribute("Category", value)
+
+    def HasRepresentation(self)-> list["IfcMaterialDefinitionRepresentation"]:
+        """<inverse HasRepresentation: set [0:1] of <entity IfcMaterialDefinitionRepresentation> for <attribute RepresentedMaterial: <entity IfcMaterial>>>"""
+        return self._get_inverse_attribute("HasRepresentation")
+
+    def IsRelatedWith(self)-> list["IfcMaterialRelationship"]:
+        """<inverse IsRelatedWith: set [0:?] of <entity IfcMaterialRelationship> for <attribute RelatedMaterials: <set [1:?] of <entity IfcMaterial>>>>"""
+        return self._get_inverse_attribute("IsRelatedWith")
+
+    def RelatesTo(self)-> list["IfcMaterialRelationship"]:
+        """<inverse RelatesTo: set [0:1] of <entity IfcMaterialRelationship> for <attribute RelatingMaterial: <entity IfcMaterial>>>"""
+        return self._get_inverse_attribute("RelatesTo")
@@ -0,0 +1,29 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcclassification import IfcClassification
+    from .ifcclassificationreference import IfcClassificationReference
+    from .ifcmaterial import IfcMaterial
+
+class IfcMaterialClassificationRelationship(Base):
+    """Wrapper class for IfcMaterialClassificationRelationship."""
+
+    @property
+    def MaterialClassifications(self)-> list[Union["IfcClassificationReference", "IfcClassification"]]:
+        """<attribute MaterialClassifications: <set [1:?] of <select IfcClassificationSelect: (<entity IfcClassification> | <entity IfcClassificationReference>)>>>"""
+        return self._get_attribute("MaterialClassifications")
+
+    @MaterialClassifications.setter
+    def MaterialClassifications(self, value: list[Union["IfcClassificationReference", "IfcClassification"]]):
+        return self._set_attribute("MaterialClassifications", value)
+
+    @property
+    def ClassifiedMaterial(self)-> "IfcMaterial":
+        """<attribute ClassifiedMaterial: <entity IfcMaterial>>"""
+        return self._get_attribute("ClassifiedMaterial")
+
+    @ClassifiedMaterial.setter
+    def ClassifiedMaterial(self, value: "IfcMaterial"):
+        return self._set_attribute("ClassifiedMaterial", value)
@@ -0,0 +1,58 @@
+from .ifcmaterialdefinition import IfcMaterialDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmaterial import IfcMaterial
+    from .ifcmaterialconstituentset import IfcMaterialConstituentSet
+
+class IfcMaterialConstituent(IfcMaterialDefinition):
+    """Wrapper class for IfcMaterialConstituent."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def Material(self)-> "IfcMaterial":
+        """<attribute Material: <entity IfcMaterial>>"""
+        return self._get_attribute("Material")
+
+    @Material.setter
+    def Material(self, value: "IfcMaterial"):
+        return self._set_attribute("Material", value)
+
+    @property
+    def Fraction(self)-> float:
+        """<attribute Fraction?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("Fraction")
+
+    @Fraction.setter
+    def Fraction(self, value: float):
+        return self._set_attribute("Fraction", value)
+
+    @property
+    def Category(self)-> str:
+        """<attribute Category?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Category")
+
+    @Category.setter
+    def Category(self, value: str):
+        return self._set_attribute("Category", value)
+
+    def ToMaterialConstituentSet(self)-> list["IfcMaterialConstituentSet"]:
+        """<inverse ToMaterialConstituentSet:  [?:?] of <entity IfcMaterialConstituentSet> for <attribute MaterialConstituents?: <set [1:?] of <entity IfcMaterialConstituent>>>>"""
+        return self._get_inverse_attribute("ToMaterialConstituentSet")
@@ -0,0 +1,35 @@
+from .ifcmaterialdefinition import IfcMaterialDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmaterialconstituent import IfcMaterialConstituent
+
+class IfcMaterialConstituentSet(IfcMaterialDefinition):
+    """Wrapper class for IfcMaterialConstituentSet."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def MaterialConstituents(self)-> list["IfcMaterialConstituent"]:
+        """<attribute MaterialConstituents?: <set [1:?] of <entity IfcMaterialConstituent>>>"""
+        return self._get_attribute("MaterialConstituents")
+
+    @MaterialConstituents.setter
+    def MaterialConstituents(self, value: list["IfcMaterialConstituent"]):
+        return self._set_attribute("MaterialConstituents", value)
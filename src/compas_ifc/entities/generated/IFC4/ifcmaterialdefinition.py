@@ -0,0 +1,22 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcexternalreferencerelationship import IfcExternalReferenceRelationship
+    from .ifcmaterialproperties import IfcMaterialProperties
+    from .ifcrelassociatesmaterial import IfcRelAssociatesMaterial
+
+class IfcMaterialDefinition(Base):
+    """Wrapper class for IfcMaterialDefinition."""
+
+    def AssociatedTo(self)-> list["IfcRelAssociatesMaterial"]:
+        """<inverse AssociatedTo: set [0:?] of <entity IfcRelAssociatesMaterial> for <attribute RelatingMaterial: <select IfcMaterialSelect: (<entity IfcMaterialDefinition> | <entity IfcMaterialList> | <entity IfcMaterialUsageDefinition>)>>>"""
+        return self._get_inverse_attribute("AssociatedTo")
+
+    def HasExternalReferences(self)-> list["IfcExternalReferenceRelationship"]:
+        """<inverse HasExternalReferences: set [0:?] of <entity IfcExternalReferenceRelationship> for <attribute RelatedResourceObjects: <set [1:?] of <select IfcResourceObjectSelect: (<entity IfcActorRole> | <entity IfcAppliedValue> | <entity IfcApproval> | <entity IfcConstraint> | <entity IfcContextDependentUnit> | <entity IfcConversionBasedUnit> | <entity IfcExternalInformation> | <entity IfcExternalReference> | <entity IfcMaterialDefinition> | <entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization> | <entity IfcPhysicalQuantity> | <entity IfcProfileDef> | <entity IfcPropertyAbstraction> | <entity IfcTimeSeries>)>>>>"""
+        return self._get_inverse_attribute("HasExternalReferences")
+
+    def HasProperties(self)-> list["IfcMaterialProperties"]:
+        """<inverse HasProperties: set [0:?] of <entity IfcMaterialProperties> for <attribute Material: <entity IfcMaterialDefinition>>>"""
+        return self._get_inverse_attribute("HasProperties")
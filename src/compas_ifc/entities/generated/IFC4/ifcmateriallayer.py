@@ -0,0 +1,76 @@
+from .ifcmaterialdefinition import IfcMaterialDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmaterial import IfcMaterial
+    from .ifcmateriallayerset import IfcMaterialLayerSet
+
+class IfcMaterialLayer(IfcMaterialDefinition):
+    """Wrapper class for IfcMaterialLayer."""
+
+    @property
+    def Material(self)-> "IfcMaterial":
+        """<attribute Material?: <entity IfcMaterial>>"""
+        return self._get_attribute("Material")
+
+    @Material.setter
+    def Material(self, value: "IfcMaterial"):
+        return self._set_attribute("Material", value)
+
+    @property
+    def LayerThickness(self)-> float:
+        """<attribute LayerThickness: <type IfcNonNegativeLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("LayerThickness")
+
+    @LayerThickness.setter
+    def LayerThickness(self, value: float):
+        return self._set_attribute("LayerThickness", value)
+
+    @property
+    def IsVentilated(self)-> bool:
+        """<attribute IsVentilated?: <type IfcLogical: <logical>>>"""
+        return self._get_attribute("IsVentilated")
+
+    @IsVentilated.setter
+    def IsVentilated(self, value: bool):
+        return self._set_attribute("IsVentilated", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def Category(self)-> str:
+        """<attribute Category?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Category")
+
+    @Category.setter
+    def Category(self, value: str):
+        return self._set_attribute("Category", value)
+
+    @property
+    def Priority(self)-> int:
+        """<attribute Priority?: <type IfcInteger: <integer>>>"""
+        return self._get_attribute("Priority")
+
+    @Priority.setter
+    def Priority(self, value: int):
+        return self._set_attribute("Priority", value)
+
+    def ToMaterialLayerSet(self)-> list["IfcMaterialLayerSet"]:
+        """<inverse ToMaterialLayerSet:  [?:?] of <entity IfcMaterialLayerSet> for <attribute MaterialLayers: <list [1:?] of <entity IfcMaterialLayer>>>>"""
+        return self._get_inverse_attribute("ToMaterialLayerSet")
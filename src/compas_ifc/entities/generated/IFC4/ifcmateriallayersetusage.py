@@ -0,0 +1,55 @@
+from .ifcmaterialusagedefinition import IfcMaterialUsageDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdirectionsenseenum import IfcDirectionSenseEnum
+    from .ifclayersetdirectionenum import IfcLayerSetDirectionEnum
+    from .ifcmateriallayerset import IfcMaterialLayerSet
+
+class IfcMaterialLayerSetUsage(IfcMaterialUsageDefinition):
+    """Wrapper class for IfcMaterialLayerSetUsage."""
+
+    @property
+    def ForLayerSet(self)-> "IfcMaterialLayerSet":
+        """<attribute ForLayerSet: <entity IfcMaterialLayerSet>>"""
+        return self._get_attribute("ForLayerSet")
+
+    @ForLayerSet.setter
+    def ForLayerSet(self, value: "IfcMaterialLayerSet"):
+        return self._set_attribute("ForLayerSet", value)
+
+    @property
+    def LayerSetDirection(self)-> "IfcLayerSetDirectionEnum":
+        """<attribute LayerSetDirection: <enumeration IfcLayerSetDirectionEnum: (AXIS1, AXIS2, AXIS3)>>"""
+        return self._get_attribute("LayerSetDirection")
+
+    @LayerSetDirection.setter
+    def LayerSetDirection(self, value: "IfcLayerSetDirectionEnum"):
+        return self._set_attribute("LayerSetDirection", value)
+
+    @property
+    def DirectionSense(self)-> "IfcDirectionSenseEnum":
+        """<attribute DirectionSense: <enumeration IfcDirectionSenseEnum: (POSITIVE, NEGATIVE)>>"""
+        return self._get_attribute("DirectionSense")
+
+    @DirectionSense.setter
+    def DirectionSense(self, value: "IfcDirectionSenseEnum"):
+        return self._set_attribute("DirectionSense", value)
+
+    @property
+    def OffsetFromReferenceLine(self)-> float:
+        """<attribute OffsetFromReferenceLine: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("OffsetFromReferenceLine")
+
+    @OffsetFromReferenceLine.setter
+    def OffsetFromReferenceLine(self, value: float):
+        return self._set_attribute("OffsetFromReferenceLine", value)
+
+    @property
+    def ReferenceExtent(self)-> float:
+        """<attribute ReferenceExtent?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("ReferenceExtent")
+
+    @ReferenceExtent.setter
+    def ReferenceExtent(self, value: float):
+        return self._set_attribute("ReferenceExtent", value)
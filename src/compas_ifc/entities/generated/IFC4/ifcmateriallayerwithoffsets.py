@@ -0,0 +1,26 @@
+from .ifcmateriallayer import IfcMaterialLayer
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifclayersetdirectionenum import IfcLayerSetDirectionEnum
+
+class IfcMaterialLayerWithOffsets(IfcMaterialLayer):
+    """Wrapper class for IfcMaterialLayerWithOffsets."""
+
+    @property
+    def OffsetDirection(self)-> "IfcLayerSetDirectionEnum":
+        """<attribute OffsetDirection: <enumeration IfcLayerSetDirectionEnum: (AXIS1, AXIS2, AXIS3)>>"""
+        return self._get_attribute("OffsetDirection")
+
+    @OffsetDirection.setter
+    def OffsetDirection(self, value: "IfcLayerSetDirectionEnum"):
+        return self._set_attribute("OffsetDirection", value)
+
+    @property
+    def OffsetValues(self)-> list[float]:
+        """<attribute OffsetValues: <array [1:2] of <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("OffsetValues")
+
+    @OffsetValues.setter
+    def OffsetValues(self, value: list[float]):
+        return self._set_attribute("OffsetValues", value)
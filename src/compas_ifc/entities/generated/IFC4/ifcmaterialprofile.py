@@ -0,0 +1,68 @@
+from .ifcmaterialdefinition import IfcMaterialDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmaterial import IfcMaterial
+    from .ifcmaterialprofileset import IfcMaterialProfileSet
+    from .ifcprofiledef import IfcProfileDef
+
+class IfcMaterialProfile(IfcMaterialDefinition):
+    """Wrapper class for IfcMaterialProfile."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def Material(self)-> "IfcMaterial":
+        """<attribute Material?: <entity IfcMaterial>>"""
+        return self._get_attribute("Material")
+
+    @Material.setter
+    def Material(self, value: "IfcMaterial"):
+        return self._set_attribute("Material", value)
+
+    @property
+    def Profile(self)-> "IfcProfileDef":
+        """<attribute Profile: <entity IfcProfileDef>>"""
+        return self._get_attribute("Profile")
+
+    @Profile.setter
+    def Profile(self, value: "IfcProfileDef"):
+        return self._set_attribute("Profile", value)
+
+    @property
+    def Priority(self)-> int:
+        """<attribute Priority?: <type IfcInteger: <integer>>>"""
+        return self._get_attribute("Priority")
+
+    @Priority.setter
+    def Priority(self, value: int):
+        return self._set_attribute("Priority", value)
+
+    @property
+    def Category(self)-> str:
+        """<attribute Category?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Category")
+
+    @Category.setter
+    def Category(self, value: str):
+        return self._set_attribute("Category", value)
+
+    def ToMaterialProfileSet(self)-> list["IfcMaterialProfileSet"]:
+        """<inverse ToMaterialProfileSet:  [?:?] of <entity IfcMaterialProfileSet> for <attribute MaterialProfiles: <list [1:?] of <entity IfcMaterialProfile>>>>"""
+        return self._get_inverse_attribute("ToMaterialProfileSet")
@@ -0,0 +1,45 @@
+from .ifcmaterialdefinition import IfcMaterialDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccompositeprofiledef import IfcCompositeProfileDef
+    from .ifcmaterialprofile import IfcMaterialProfile
+
+class IfcMaterialProfileSet(IfcMaterialDefinition):
+    """Wrapper class for IfcMaterialProfileSet."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def MaterialProfiles(self)-> list["IfcMaterialProfile"]:
+        """<attribute MaterialProfiles: <list [1:?] of <entity IfcMaterialProfile>>>"""
+        return self._get_attribute("MaterialProfiles")
+
+    @MaterialProfiles.setter
+    def MaterialProfiles(self, value: list["IfcMaterialProfile"]):
+        return self._set_attribute("MaterialProfiles", value)
+
+    @property
+    def CompositeProfile(self)-> "IfcCompositeProfileDef":
+        """<attribute CompositeProfile?: <entity IfcCompositeProfileDef>>"""
+        return self._get_attribute("CompositeProfile")
+
+    @CompositeProfile.setter
+    def CompositeProfile(self, value: "IfcCompositeProfileDef"):
+        return self._set_attribute("CompositeProfile", value)
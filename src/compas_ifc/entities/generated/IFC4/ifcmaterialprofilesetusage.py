@@ -0,0 +1,35 @@
+from .ifcmaterialusagedefinition import IfcMaterialUsageDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmaterialprofileset import IfcMaterialProfileSet
+
+class IfcMaterialProfileSetUsage(IfcMaterialUsageDefinition):
+    """Wrapper class for IfcMaterialProfileSetUsage."""
+
+    @property
+    def ForProfileSet(self)-> "IfcMaterialProfileSet":
+        """<attribute ForProfileSet: <entity IfcMaterialProfileSet>>"""
+        return self._get_attribute("ForProfileSet")
+
+    @ForProfileSet.setter
+    def ForProfileSet(self, value: "IfcMaterialProfileSet"):
+        return self._set_attribute("ForProfileSet", value)
+
+    @property
+    def CardinalPoint(self)-> int:
+        """<attribute CardinalPoint?: <type IfcCardinalPointReference: <integer>>>"""
+        return self._get_attribute("CardinalPoint")
+
+    @CardinalPoint.setter
+    def CardinalPoint(self, value: int):
+        return self._set_attribute("CardinalPoint", value)
+
+    @property
+    def ReferenceExtent(self)-> float:
+        """<attribute ReferenceExtent?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("ReferenceExtent")
+
+    @ReferenceExtent.setter
+    def ReferenceExtent(self, value: float):
+        return self._set_attribute("ReferenceExtent", value)
@@ -0,0 +1,26 @@
+from .ifcmaterialprofilesetusage import IfcMaterialProfileSetUsage
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmaterialprofileset import IfcMaterialProfileSet
+
+class IfcMaterialProfileSetUsageTapering(IfcMaterialProfileSetUsage):
+    """Wrapper class for IfcMaterialProfileSetUsageTapering."""
+
+    @property
+    def ForProfileEndSet(self)-> "IfcMaterialProfileSet":
+        """<attribute ForProfileEndSet: <entity IfcMaterialProfileSet>>"""
+        return self._get_attribute("ForProfileEndSet")
+
+    @ForProfileEndSet.setter
+    def ForProfileEndSet(self, value: "IfcMaterialProfileSet"):
+        return self._set_attribute("ForProfileEndSet", value)
+
+    @property
+    def CardinalEndPoint(self)-> int:
+        """<attribute CardinalEndPoint?: <type IfcCardinalPointReference: <integer>>>"""
+        return self._get_attribute("CardinalEndPoint")
+
+    @CardinalEndPoint.setter
+    def CardinalEndPoint(self, value: int):
+        return self._set_attribute("CardinalEndPoint", value)
@@ -0,0 +1,14 @@
+from .ifcmaterialprofile import IfcMaterialProfile
+
+
+class IfcMaterialProfileWithOffsets(IfcMaterialProfile):
+    """Wrapper class for IfcMaterialProfileWithOffsets."""
+
+    @property
+    def OffsetValues(self)-> list[float]:
+        """<attribute OffsetValues: <array [1:2] of <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("OffsetValues")
+
+    @OffsetValues.setter
+    def OffsetValues(self, value: list[float]):
+        return self._set_attribute("OffsetValues", value)
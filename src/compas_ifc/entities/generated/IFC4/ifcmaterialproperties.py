@@ -0,0 +1,17 @@
+from .ifcextendedproperties import IfcExtendedProperties
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmaterialdefinition import IfcMaterialDefinition
+
+class IfcMaterialProperties(IfcExtendedProperties):
+    """Wrapper class for IfcMaterialProperties."""
+
+    @property
+    def Material(self)-> "IfcMaterialDefinition":
+        """<attribute Material: <entity IfcMaterialDefinition>>"""
+        return self._get_attribute("Material")
+
+    @Material.setter
+    def Material(self, value: "IfcMaterialDefinition"):
+        return self._set_attribute("Material", value)
@@ -0,0 +1,35 @@
+from .ifcresourcelevelrelationship import IfcResourceLevelRelationship
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmaterial import IfcMaterial
+
+class IfcMaterialRelationship(IfcResourceLevelRelationship):
+    """Wrapper class for IfcMaterialRelationship."""
+
+    @property
+    def RelatingMaterial(self)-> "IfcMaterial":
+        """<attribute RelatingMaterial: <entity IfcMaterial>>"""
+        return self._get_attribute("RelatingMaterial")
+
+    @RelatingMaterial.setter
+    def RelatingMaterial(self, value: "IfcMaterial"):
+        return self._set_attribute("RelatingMaterial", value)
+
+    @property
+    def RelatedMaterials(self)-> list["IfcMaterial"]:
+        """<attribute RelatedMaterials: <set [1:?] of <entity IfcMaterial>>>"""
+        return self._get_attribute("RelatedMaterials")
+
+    @RelatedMaterials.setter
+    def RelatedMaterials(self, value: list["IfcMaterial"]):
+        return self._set_attribute("RelatedMaterials", value)
+
+    @property
+    def Expression(self)-> str:
+        """<attribute Expression?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Expression")
+
+    @Expression.setter
+    def Expression(self, value: str):
+        return self._set_attribute("Expression", value)
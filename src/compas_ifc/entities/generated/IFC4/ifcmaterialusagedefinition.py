@@ -0,0 +1,12 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelassociatesmaterial import IfcRelAssociatesMaterial
+
+class IfcMaterialUsageDefinition(Base):
+    """Wrapper class for IfcMaterialUsageDefinition."""
+
+    def AssociatedTo(self)-> list["IfcRelAssociatesMaterial"]:
+        """<inverse AssociatedTo: set [1:?] of <entity IfcRelAssociatesMaterial> for <attribute RelatingMaterial: <select IfcMaterialSelect: (<entity IfcMaterialDefinition> | <entity IfcMaterialList> | <entity IfcMaterialUsageDefinition>)>>>"""
+        return self._get_inverse_attribute("AssociatedTo")
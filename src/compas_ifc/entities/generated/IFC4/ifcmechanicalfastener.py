@@ -0,0 +1,35 @@
+from .ifcelementcomponent import IfcElementComponent
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmechanicalfastenertypeenum import IfcMechanicalFastenerTypeEnum
+
+class IfcMechanicalFastener(IfcElementComponent):
+    """Wrapper class for IfcMechanicalFastener."""
+
+    @property
+    def NominalDiameter(self)-> float:
+        """<attribute NominalDiameter?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("NominalDiameter")
+
+    @NominalDiameter.setter
+    def NominalDiameter(self, value: float):
+        return self._set_attribute("NominalDiameter", value)
+
+    @property
+    def NominalLength(self)-> float:
+        """<attribute NominalLength?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("NominalLength")
+
+    @NominalLength.setter
+    def NominalLength(self, value: float):
+        return self._set_attribute("NominalLength", value)
+
+    @property
+    def PredefinedType(self)-> "IfcMechanicalFastenerTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcMechanicalFastenerTypeEnum: (ANCHORBOLT, BOLT, DOWEL, NAIL, NAILPLATE, RIVET, SCREW, SHEARCONNECTOR, STAPLE, STUDSHEARCONNECTOR, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcMechanicalFastenerTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcMechanicalFastenerTypeEnum(str):
+    items = ['ANCHORBOLT', 'BOLT', 'DOWEL', 'NAIL', 'NAILPLATE', 'RIVET', 'SCREW', 'SHEARCONNECTOR', 'STAPLE', 'STUDSHEARCONNECTOR', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcflowterminaltype import IfcFlowTerminalType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmedicaldevicetypeenum import IfcMedicalDeviceTypeEnum
+
+class IfcMedicalDeviceType(IfcFlowTerminalType):
+    """Wrapper class for IfcMedicalDeviceType."""
+
+    @property
+    def PredefinedType(self)-> "IfcMedicalDeviceTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcMedicalDeviceTypeEnum: (AIRSTATION, FEEDAIRUNIT, OXYGENGENERATOR, OXYGENPLANT, VACUUMSTATION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcMedicalDeviceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcMedicalDeviceTypeEnum(str):
+    items = ['AIRSTATION', 'FEEDAIRUNIT', 'OXYGENGENERATOR', 'OXYGENPLANT', 'VACUUMSTATION', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmembertypeenum import IfcMemberTypeEnum
+
+class IfcMember(IfcBuildingElement):
+    """Wrapper class for IfcMember."""
+
+    @property
+    def PredefinedType(self)-> "IfcMemberTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcMemberTypeEnum: (BRACE, CHORD, COLLAR, MEMBER, MULLION, PLATE, POST, PURLIN, RAFTER, STRINGER, STRUT, STUD, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcMemberTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,5 @@
+from .ifcmember import IfcMember
+
+
+class IfcMemberStandardCase(IfcMember):
+    """Wrapper class for IfcMemberStandardCase."""
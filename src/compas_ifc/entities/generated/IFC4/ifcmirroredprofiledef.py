@@ -0,0 +1,18 @@
+from .ifcderivedprofiledef import IfcDerivedProfileDef
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccartesiantransformationoperator2d import IfcCartesianTransformationOperator2D
+
+class IfcMirroredProfileDef(IfcDerivedProfileDef):
+    """Wrapper class for IfcMirroredProfileDef."""
+
+    @property
+    def Operator(self)-> "IfcCartesianTransformationOperator2D":
+        """<attribute Operator: <entity IfcCartesianTransformationOperator2D>>"""
+        return self._get_attribute("Operator")
+
+    @Operator.setter
+    def Operator(self, value: "IfcCartesianTransformationOperator2D"):
+        # Derived attribute
+        pass
@@ -0,0 +1,14 @@
+from compas_ifc.entities.base import Base
+
+
+class IfcMonetaryUnit(Base):
+    """Wrapper class for IfcMonetaryUnit."""
+
+    @property
+    def Currency(self)-> str:
+        """<attribute Currency: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Currency")
+
+    @Currency.setter
+    def Currency(self, value: str):
+        return self._set_attribute("Currency", value)
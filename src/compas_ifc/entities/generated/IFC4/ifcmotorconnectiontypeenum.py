@@ -0,0 +1,2 @@
+class IfcMotorConnectionTypeEnum(str):
+    items = ['BELTDRIVE', 'COUPLING', 'DIRECTDRIVE', 'USERDEFINED', 'NOTDEFINED']
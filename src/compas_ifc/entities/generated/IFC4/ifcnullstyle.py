@@ -0,0 +1,2 @@
+class IfcNullStyle(str):
+    items = ['NULL']
@@ -0,0 +1,36 @@
+from .ifcobjectdefinition import IfcObjectDefinition
+from compas_ifc.entities.extensions import IfcObject as IfcObject_Ext   # type: ignore
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcreldefinesbyobject import IfcRelDefinesByObject
+    from .ifcreldefinesbyproperties import IfcRelDefinesByProperties
+    from .ifcreldefinesbytype import IfcRelDefinesByType
+
+class IfcObject(IfcObject_Ext, IfcObjectDefinition):
+    """Wrapper class for IfcObject."""
+
+    @property
+    def ObjectType(self)-> str:
+        """<attribute ObjectType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ObjectType")
+
+    @ObjectType.setter
+    def ObjectType(self, value: str):
+        return self._set_attribute("ObjectType", value)
+
+    def IsDeclaredBy(self)-> list["IfcRelDefinesByObject"]:
+        """<inverse IsDeclaredBy: set [0:1] of <entity IfcRelDefinesByObject> for <attribute RelatedObjects: <set [1:?] of <entity IfcObject>>>>"""
+        return self._get_inverse_attribute("IsDeclaredBy")
+
+    def Declares(self)-> list["IfcRelDefinesByObject"]:
+        """<inverse Declares: set [0:?] of <entity IfcRelDefinesByObject> for <attribute RelatingObject: <entity IfcObject>>>"""
+        return self._get_inverse_attribute("Declares")
+
+    def IsTypedBy(self)-> list["IfcRelDefinesByType"]:
+        """<inverse IsTypedBy: set [0:1] of <entity IfcRelDefinesByType> for <attribute RelatedObjects: <set [1:?] of <entity IfcObject>>>>"""
+        return self._get_inverse_attribute("IsTypedBy")
+
+    def IsDefinedBy(self)-> list["IfcRelDefinesByProperties"]:
+        """<inverse IsDefinedBy: set [0:?] of <entity IfcRelDefinesByProperties> for <attribute RelatedObjects: <set [1:?] of <entity IfcObjectDefinition>>>>"""
+        return self._get_inverse_attribute("IsDefinedBy")
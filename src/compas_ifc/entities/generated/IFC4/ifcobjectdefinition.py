@@ -0,0 +1,41 @@
+from .ifcroot import IfcRoot
+from compas_ifc.entities.extensions import IfcObjectDefinition as IfcObjectDefinition_Ext   # type: ignore
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelaggregates import IfcRelAggregates
+    from .ifcrelassigns import IfcRelAssigns
+    from .ifcrelassociates import IfcRelAssociates
+    from .ifcreldeclares import IfcRelDeclares
+    from .ifcrelnests import IfcRelNests
+
+class IfcObjectDefinition(IfcObjectDefinition_Ext, IfcRoot):
+    """Wrapper class for IfcObjectDefinition."""
+
+    def HasAssignments(self)-> list["IfcRelAssigns"]:
+        """<inverse HasAssignments: set [0:?] of <entity IfcRelAssigns> for <attribute RelatedObjects: <set [1:?] of <entity IfcObjectDefinition>>>>"""
+        return self._get_inverse_attribute("HasAssignments")
+
+    def Nests(self)-> list["IfcRelNests"]:
+        """<inverse Nests: set [0:1] of <entity IfcRelNests> for <attribute RelatedObjects: <list [1:?] of <entity IfcObjectDefinition>>>>"""
+        return self._get_inverse_attribute("Nests")
+
+    def IsNestedBy(self)-> list["IfcRelNests"]:
+        """<inverse IsNestedBy: set [0:?] of <entity IfcRelNests> for <attribute RelatingObject: <entity IfcObjectDefinition>>>"""
+        return self._get_inverse_attribute("IsNestedBy")
+
+    def HasContext(self)-> list["IfcRelDeclares"]:
+        """<inverse HasContext: set [0:1] of <entity IfcRelDeclares> for <attribute RelatedDefinitions: <set [1:?] of <select IfcDefinitionSelect: (<entity IfcObjectDefinition> | <entity IfcPropertyDefinition>)>>>>"""
+        return self._get_inverse_attribute("HasContext")
+
+    def IsDecomposedBy(self)-> list["IfcRelAggregates"]:
+        """<inverse IsDecomposedBy: set [0:?] of <entity IfcRelAggregates> for <attribute RelatingObject: <entity IfcObjectDefinition>>>"""
+        return self._get_inverse_attribute("IsDecomposedBy")
+
+    def Decomposes(self)-> list["IfcRelAggregates"]:
+        """<inverse Decomposes: set [0:1] of <entity IfcRelAggregates> for <attribute RelatedObjects: <set [1:?] of <entity IfcObjectDefinition>>>>"""
+        return self._get_inverse_attribute("Decomposes")
+
+    def HasAssociations(self)-> list["IfcRelAssociates"]:
+        """<inverse HasAssociations: set [0:?] of <entity IfcRelAssociates> for <attribute RelatedObjects: <set [1:?] of <select IfcDefinitionSelect: (<entity IfcObjectDefinition> | <entity IfcPropertyDefinition>)>>>>"""
+        return self._get_inverse_attribute("HasAssociations")
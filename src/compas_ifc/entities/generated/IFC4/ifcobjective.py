@@ -0,0 +1,46 @@
+from .ifcconstraint import IfcConstraint
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcconstraint import IfcConstraint
+    from .ifclogicaloperatorenum import IfcLogicalOperatorEnum
+    from .ifcobjectiveenum import IfcObjectiveEnum
+
+class IfcObjective(IfcConstraint):
+    """Wrapper class for IfcObjective."""
+
+    @property
+    def BenchmarkValues(self)-> list["IfcConstraint"]:
+        """<attribute BenchmarkValues?: <list [1:?] of <entity IfcConstraint>>>"""
+        return self._get_attribute("BenchmarkValues")
+
+    @BenchmarkValues.setter
+    def BenchmarkValues(self, value: list["IfcConstraint"]):
+        return self._set_attribute("BenchmarkValues", value)
+
+    @property
+    def LogicalAggregator(self)-> "IfcLogicalOperatorEnum":
+        """<attribute LogicalAggregator?: <enumeration IfcLogicalOperatorEnum: (LOGICALAND, LOGICALOR, LOGICALXOR, LOGICALNOTAND, LOGICALNOTOR)>>"""
+        return self._get_attribute("LogicalAggregator")
+
+    @LogicalAggregator.setter
+    def LogicalAggregator(self, value: "IfcLogicalOperatorEnum"):
+        return self._set_attribute("LogicalAggregator", value)
+
+    @property
+    def ObjectiveQualifier(self)-> "IfcObjectiveEnum":
+        """<attribute ObjectiveQualifier: <enumeration IfcObjectiveEnum: (CODECOMPLIANCE, CODEWAIVER, DESIGNINTENT, EXTERNAL, HEALTHANDSAFETY, MERGECONFLICT, MODELVIEW, PARAMETER, REQUIREMENT, SPECIFICATION, TRIGGERCONDITION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("ObjectiveQualifier")
+
+    @ObjectiveQualifier.setter
+    def ObjectiveQualifier(self, value: "IfcObjectiveEnum"):
+        return self._set_attribute("ObjectiveQualifier", value)
+
+    @property
+    def UserDefinedQualifier(self)-> str:
+        """<attribute UserDefinedQualifier?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedQualifier")
+
+    @UserDefinedQualifier.setter
+    def UserDefinedQualifier(self, value: str):
+        return self._set_attribute("UserDefinedQualifier", value)
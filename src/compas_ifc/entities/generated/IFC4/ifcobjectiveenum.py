@@ -0,0 +1,2 @@
+class IfcObjectiveEnum(str):
+    items = ['CODECOMPLIANCE', 'CODEWAIVER', 'DESIGNINTENT', 'EXTERNAL', 'HEALTHANDSAFETY', 'MERGECONFLICT', 'MODELVIEW', 'PARAMETER', 'REQUIREMENT', 'SPECIFICATION', 'TRIGGERCONDITION', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifclocalplacement import IfcLocalPlacement
+    from .ifcproduct import IfcProduct
+
+class IfcObjectPlacement(Base):
+    """Wrapper class for IfcObjectPlacement."""
+
+    def PlacesObject(self)-> list["IfcProduct"]:
+        """<inverse PlacesObject: set [0:?] of <entity IfcProduct> for <attribute ObjectPlacement?: <entity IfcObjectPlacement>>>"""
+        return self._get_inverse_attribute("PlacesObject")
+
+    def ReferencedByPlacements(self)-> list["IfcLocalPlacement"]:
+        """<inverse ReferencedByPlacements: set [0:?] of <entity IfcLocalPlacement> for <attribute PlacementRelTo?: <entity IfcObjectPlacement>>>"""
+        return self._get_inverse_attribute("ReferencedByPlacements")
@@ -0,0 +1,2 @@
+class IfcOccupantTypeEnum(str):
+    items = ['ASSIGNEE', 'ASSIGNOR', 'LESSEE', 'LESSOR', 'LETTINGAGENT', 'OWNER', 'TENANT', 'USERDEFINED', 'NOTDEFINED']
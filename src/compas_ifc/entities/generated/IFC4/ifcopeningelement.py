@@ -0,0 +1,22 @@
+from .ifcfeatureelementsubtraction import IfcFeatureElementSubtraction
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcopeningelementtypeenum import IfcOpeningElementTypeEnum
+    from .ifcrelfillselement import IfcRelFillsElement
+
+class IfcOpeningElement(IfcFeatureElementSubtraction):
+    """Wrapper class for IfcOpeningElement."""
+
+    @property
+    def PredefinedType(self)-> "IfcOpeningElementTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcOpeningElementTypeEnum: (OPENING, RECESS, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcOpeningElementTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    def HasFillings(self)-> list["IfcRelFillsElement"]:
+        """<inverse HasFillings: set [0:?] of <entity IfcRelFillsElement> for <attribute RelatingOpeningElement: <entity IfcOpeningElement>>>"""
+        return self._get_inverse_attribute("HasFillings")
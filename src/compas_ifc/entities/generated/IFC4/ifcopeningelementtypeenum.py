@@ -0,0 +1,2 @@
+class IfcOpeningElementTypeEnum(str):
+    items = ['OPENING', 'RECESS', 'USERDEFINED', 'NOTDEFINED']
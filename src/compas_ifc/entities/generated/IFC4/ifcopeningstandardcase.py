@@ -0,0 +1,5 @@
+from .ifcopeningelement import IfcOpeningElement
+
+
+class IfcOpeningStandardCase(IfcOpeningElement):
+    """Wrapper class for IfcOpeningStandardCase."""
@@ -0,0 +1,68 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcactorrole import IfcActorRole
+    from .ifcaddress import IfcAddress
+    from .ifcorganizationrelationship import IfcOrganizationRelationship
+    from .ifcpersonandorganization import IfcPersonAndOrganization
+
+class IfcOrganization(Base):
+    """Wrapper class for IfcOrganization."""
+
+    @property
+    def Identification(self)-> str:
+        """<attribute Identification?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Identification")
+
+    @Identification.setter
+    def Identification(self, value: str):
+        return self._set_attribute("Identification", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def Roles(self)-> list["IfcActorRole"]:
+        """<attribute Roles?: <list [1:?] of <entity IfcActorRole>>>"""
+        return self._get_attribute("Roles")
+
+    @Roles.setter
+    def Roles(self, value: list["IfcActorRole"]):
+        return self._set_attribute("Roles", value)
+
+    @property
+    def Addresses(self)-> list["IfcAddress"]:
+        """<attribute Addresses?: <list [1:?] of <entity IfcAddress>>>"""
+        return self._get_attribute("Addresses")
+
+    @Addresses.setter
+    def Addresses(self, value: list["IfcAddress"]):
+        return self._set_attribute("Addresses", value)
+
+    def IsRelatedBy(self)-> list["IfcOrganizationRelationship"]:
+        """<inverse IsRelatedBy: set [0:?] of <entity IfcOrganizationRelationship> for <attribute RelatedOrganizations: <set [1:?] of <entity IfcOrganization>>>>"""
+        return self._get_inverse_attribute("IsRelatedBy")
+
+    def Relates(self)-> list["IfcOrganizationRelationship"]:
+        """<inverse Relates: set [0:?] of <entity IfcOrganizationRelationship> for <attribute RelatingOrganization: <entity IfcOrganization>>>"""
+        return self._get_inverse_attribute("Relates")
+
+    def Engages(self)-> list["IfcPersonAndOrganization"]:
+        """<inverse Engages: set [0:?] of <entity IfcPersonAndOrganization> for <attribute TheOrganization: <entity IfcOrganization>>>"""
+        return self._get_inverse_attribute("Engages")
@@ -0,0 +1,26 @@
+from .ifcresourcelevelrelationship import IfcResourceLevelRelationship
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcorganization import IfcOrganization
+
+class IfcOrganizationRelationship(IfcResourceLevelRelationship):
+    """Wrapper class for IfcOrganizationRelationship."""
+
+    @property
+    def RelatingOrganization(self)-> "IfcOrganization":
+        """<attribute RelatingOrganization: <entity IfcOrganization>>"""
+        return self._get_attribute("RelatingOrganization")
+
+    @RelatingOrganization.setter
+    def RelatingOrganization(self, value: "IfcOrganization"):
+        return self._set_attribute("RelatingOrganization", value)
+
+    @property
+    def RelatedOrganizations(self)-> list["IfcOrganization"]:
+        """<attribute RelatedOrganizations: <set [1:?] of <entity IfcOrganization>>>"""
+        return self._get_attribute("RelatedOrganizations")
+
+    @RelatedOrganizations.setter
+    def RelatedOrganizations(self, value: list["IfcOrganization"]):
+        return self._set_attribute("RelatedOrganizations", value)
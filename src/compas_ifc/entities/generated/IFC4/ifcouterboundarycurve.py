@@ -0,0 +1,5 @@
+from .ifcboundarycurve import IfcBoundaryCurve
+
+
+class IfcOuterBoundaryCurve(IfcBoundaryCurve):
+    """Wrapper class for IfcOuterBoundaryCurve."""
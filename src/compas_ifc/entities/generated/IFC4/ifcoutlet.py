@@ -0,0 +1,17 @@
+from .ifcflowterminal import IfcFlowTerminal
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcoutlettypeenum import IfcOutletTypeEnum
+
+class IfcOutlet(IfcFlowTerminal):
+    """Wrapper class for IfcOutlet."""
+
+    @property
+    def PredefinedType(self)-> "IfcOutletTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcOutletTypeEnum: (AUDIOVISUALOUTLET, COMMUNICATIONSOUTLET, POWEROUTLET, DATAOUTLET, TELEPHONEOUTLET, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcOutletTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
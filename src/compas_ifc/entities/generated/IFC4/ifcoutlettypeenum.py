@@ -0,0 +1,2 @@
+class IfcOutletTypeEnum(str):
+    items = ['AUDIOVISUALOUTLET', 'COMMUNICATIONSOUTLET', 'POWEROUTLET', 'DATAOUTLET', 'TELEPHONEOUTLET', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,83 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcapplication import IfcApplication
+    from .ifcchangeactionenum import IfcChangeActionEnum
+    from .ifcpersonandorganization import IfcPersonAndOrganization
+    from .ifcstateenum import IfcStateEnum
+
+class IfcOwnerHistory(Base):
+    """Wrapper class for IfcOwnerHistory."""
+
+    @property
+    def OwningUser(self)-> "IfcPersonAndOrganization":
+        """<attribute OwningUser: <entity IfcPersonAndOrganization>>"""
+        return self._get_attribute("OwningUser")
+
+    @OwningUser.setter
+    def OwningUser(self, value: "IfcPersonAndOrganization"):
+        return self._set_attribute("OwningUser", value)
+
+    @property
+    def OwningApplication(self)-> "IfcApplication":
+        """<attribute OwningApplication: <entity IfcApplication>>"""
+        return self._get_attribute("OwningApplication")
+
+    @OwningApplication.setter
+    def OwningApplication(self, value: "IfcApplication"):
+        return self._set_attribute("OwningApplication", value)
+
+    @property
+    def State(self)-> "IfcStateEnum":
+        """<attribute State?: <enumeration IfcStateEnum: (READWRITE, READONLY, LOCKED, READWRITELOCKED, READONLYLOCKED)>>"""
+        return self._get_attribute("State")
+
+    @State.setter
+    def State(self, value: "IfcStateEnum"):
+        return self._set_attribute("State", value)
+
+    @property
+    def ChangeAction(self)-> "IfcChangeActionEnum":
+        """<attribute ChangeAction?: <enumeration IfcChangeActionEnum: (NOCHANGE, MODIFIED, ADDED, DELETED, NOTDEFINED)>>"""
+        return self._get_attribute("ChangeAction")
+
+    @ChangeAction.setter
+    def ChangeAction(self, value: "IfcChangeActionEnum"):
+        return self._set_attribute("ChangeAction", value)
+
+    @property
+    def LastModifiedDate(self)-> int:
+        """<attribute LastModifiedDate?: <type IfcTimeStamp: <integer>>>"""
+        return self._get_attribute("LastModifiedDate")
+
+    @LastModifiedDate.setter
+    def LastModifiedDate(self, value: int):
+        return self._set_attribute("LastModifiedDate", value)
+
+    @property
+    def LastModifyingUser(self)-> "IfcPersonAndOrganization":
+        """<attribute LastModifyingUser?: <entity IfcPersonAndOrganization>>"""
+        return self._get_attribute("LastModifyingUser")
+
+    @LastModifyingUser.setter
+    def LastModifyingUser(self, value: "IfcPersonAndOrganization"):
+        return self._set_attribute("LastModifyingUser", value)
+
+    @property
+    def LastModifyingApplication(self)-> "IfcApplication":
+        """<attribute LastModifyingApplication?: <entity IfcApplication>>"""
+        return self._get_attribute("LastModifyingApplication")
+
+    @LastModifyingApplication.setter
+    def LastModifyingApplication(self, value: "IfcApplication"):
+        return self._set_attribute("LastModifyingApplication", value)
+
+    @property
+    def CreationDate(self)-> int:
+        """<attribute CreationDate: <type IfcTimeStamp: <integer>>>"""
+        return self._get_attribute("CreationDate")
+
+    @CreationDate.setter
+    def CreationDate(self, value: int):
+        return self._set_attribute("CreationDate", value)
@@ -0,0 +1,17 @@
+from .ifcprofiledef import IfcProfileDef
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaxis2placement2d import IfcAxis2Placement2D
+
+class IfcParameterizedProfileDef(IfcProfileDef):
+    """Wrapper class for IfcParameterizedProfileDef."""
+
+    @property
+    def Position(self)-> "IfcAxis2Placement2D":
+        """<attribute Position?: <entity IfcAxis2Placement2D>>"""
+        return self._get_attribute("Position")
+
+    @Position.setter
+    def Position(self, value: "IfcAxis2Placement2D"):
+        return self._set_attribute("Position", value)
@@ -0,0 +1,27 @@
+from .ifccurve import IfcCurve
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccurve import IfcCurve
+    from .ifcsurface import IfcSurface
+
+class IfcPcurve(IfcCurve):
+    """Wrapper class for IfcPcurve."""
+
+    @property
+    def BasisSurface(self)-> "IfcSurface":
+        """<attribute BasisSurface: <entity IfcSurface>>"""
+        return self._get_attribute("BasisSurface")
+
+    @BasisSurface.setter
+    def BasisSurface(self, value: "IfcSurface"):
+        return self._set_attribute("BasisSurface", value)
+
+    @property
+    def ReferenceCurve(self)-> "IfcCurve":
+        """<attribute ReferenceCurve: <entity IfcCurve>>"""
+        return self._get_attribute("ReferenceCurve")
+
+    @ReferenceCurve.setter
+    def ReferenceCurve(self, value: "IfcCurve"):
+        return self._set_attribute("ReferenceCurve", value)
@@ -0,0 +1,26 @@
+from .ifccontrol import IfcControl
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcperformancehistorytypeenum import IfcPerformanceHistoryTypeEnum
+
+class IfcPerformanceHistory(IfcControl):
+    """Wrapper class for IfcPerformanceHistory."""
+
+    @property
+    def LifeCyclePhase(self)-> str:
+        """<attribute LifeCyclePhase: <type IfcLabel: <string>>>"""
+        return self._get_attribute("LifeCyclePhase")
+
+    @LifeCyclePhase.setter
+    def LifeCyclePhase(self, value: str):
+        return self._set_attribute("LifeCyclePhase", value)
+
+    @property
+    def PredefinedType(self)-> "IfcPerformanceHistoryTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcPerformanceHistoryTypeEnum: (USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcPerformanceHistoryTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcPerformanceHistoryTypeEnum(str):
+    items = ['USERDEFINED', 'NOTDEFINED']
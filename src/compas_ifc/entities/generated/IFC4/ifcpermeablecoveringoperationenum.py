@@ -0,0 +1,2 @@
+class IfcPermeableCoveringOperationEnum(str):
+    items = ['GRILL', 'LOUVER', 'SCREEN', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,35 @@
+from .ifccontrol import IfcControl
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpermittypeenum import IfcPermitTypeEnum
+
+class IfcPermit(IfcControl):
+    """Wrapper class for IfcPermit."""
+
+    @property
+    def PredefinedType(self)-> "IfcPermitTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcPermitTypeEnum: (ACCESS, BUILDING, WORK, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcPermitTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def Status(self)-> str:
+        """<attribute Status?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Status")
+
+    @Status.setter
+    def Status(self, value: str):
+        return self._set_attribute("Status", value)
+
+    @property
+    def LongDescription(self)-> str:
+        """<attribute LongDescription?: <type IfcText: <string>>>"""
+        return self._get_attribute("LongDescription")
+
+    @LongDescription.setter
+    def LongDescription(self, value: str):
+        return self._set_attribute("LongDescription", value)
@@ -0,0 +1,2 @@
+class IfcPermitTypeEnum(str):
+    items = ['ACCESS', 'BUILDING', 'WORK', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,86 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcactorrole import IfcActorRole
+    from .ifcaddress import IfcAddress
+    from .ifcpersonandorganization import IfcPersonAndOrganization
+
+class IfcPerson(Base):
+    """Wrapper class for IfcPerson."""
+
+    @property
+    def Identification(self)-> str:
+        """<attribute Identification?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Identification")
+
+    @Identification.setter
+    def Identification(self, value: str):
+        return self._set_attribute("Identification", value)
+
+    @property
+    def FamilyName(self)-> str:
+        """<attribute FamilyName?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("FamilyName")
+
+    @FamilyName.setter
+    def FamilyName(self, value: str):
+        return self._set_attribute("FamilyName", value)
+
+    @property
+    def GivenName(self)-> str:
+        """<attribute GivenName?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("GivenName")
+
+    @GivenName.setter
+    def GivenName(self, value: str):
+        return self._set_attribute("GivenName", value)
+
+    @property
+    def MiddleNames(self)-> list[str]:
+        """<attribute MiddleNames?: <list [1:?] of <type IfcLabel: <string>>>>"""
+        return self._get_attribute("MiddleNames")
+
+    @MiddleNames.setter
+    def MiddleNames(self, value: list[str]):
+        return self._set_attribute("MiddleNames", value)
+
+    @property
+    def PrefixTitles(self)-> list[str]:
+        """<attribute PrefixTitles?: <list [1:?] of <type IfcLabel: <string>>>>"""
+        return self._get_attribute("PrefixTitles")
+
+    @PrefixTitles.setter
+    def PrefixTitles(self, value: list[str]):
+        return self._set_attribute("PrefixTitles", value)
+
+    @property
+    def SuffixTitles(self)-> list[str]:
+        """<attribute SuffixTitles?: <list [1:?] of <type IfcLabel: <string>>>>"""
+        return self._get_attribute("SuffixTitles")
+
+    @SuffixTitles.setter
+    def SuffixTitles(self, value: list[str]):
+        return self._set_attribute("SuffixTitles", value)
+
+    @property
+    def Roles(self)-> list["IfcActorRole"]:
+        """<attribute Roles?: <list [1:?] of <entity IfcActorRole>>>"""
+        return self._get_attribute("Roles")
+
+    @Roles.setter
+    def Roles(self, value: list["IfcActorRole"]):
+        return self._set_attribute("Roles", value)
+
+    @property
+    def Addresses(self)-> list["IfcAddress"]:
+        """<attribute Addresses?: <list [1:?] of <entity IfcAddress>>>"""
+        return self._get_attribute("Addresses")
+
+    @Addresses.setter
+    def Addresses(self, value: list["IfcAddress"]):
+        return self._set_attribute("Addresses", value)
+
+    def EngagedIn(self)-> list["IfcPersonAndOrganization"]:
+        """<inverse EngagedIn: set [0:?] of <entity IfcPersonAndOrganization> for <attribute ThePerson: <entity IfcPerson>>>"""
+        return self._get_inverse_attribute("EngagedIn")
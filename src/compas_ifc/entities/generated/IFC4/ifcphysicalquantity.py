@@ -0,0 +1,35 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcexternalreferencerelationship import IfcExternalReferenceRelationship
+    from .ifcphysicalcomplexquantity import IfcPhysicalComplexQuantity
+
+class IfcPhysicalQuantity(Base):
+    """Wrapper class for IfcPhysicalQuantity."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    def HasExternalReferences(self)-> list["IfcExternalReferenceRelationship"]:
+        """<inverse HasExternalReferences: set [0:?] of <entity IfcExternalReferenceRelationship> for <attribute RelatedResourceObjects: <set [1:?] of <select IfcResourceObjectSelect: (<entity IfcActorRole> | <entity IfcAppliedValue> | <entity IfcApproval> | <entity IfcConstraint> | <entity IfcContextDependentUnit> | <entity IfcConversionBasedUnit> | <entity IfcExternalInformation> | <entity IfcExternalReference> | <entity IfcMaterialDefinition> | <entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization> | <entity IfcPhysicalQuantity> | <entity IfcProfileDef> | <entity IfcPropertyAbstraction> | <entity IfcTimeSeries>)>>>>"""
+        return self._get_inverse_attribute("HasExternalReferences")
+
+    def PartOfComplex(self)-> list["IfcPhysicalComplexQuantity"]:
+        """<inverse PartOfComplex: set [0:1] of <entity IfcPhysicalComplexQuantity> for <attribute HasQuantities: <set [1:?] of <entity IfcPhysicalQuantity>>>>"""
+        return self._get_inverse_attribute("PartOfComplex")
@@ -0,0 +1,17 @@
+from .ifcphysicalquantity import IfcPhysicalQuantity
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcnamedunit import IfcNamedUnit
+
+class IfcPhysicalSimpleQuantity(IfcPhysicalQuantity):
+    """Wrapper class for IfcPhysicalSimpleQuantity."""
+
+    @property
+    def Unit(self)-> "IfcNamedUnit":
+        """<attribute Unit?: <entity IfcNamedUnit>>"""
+        return self._get_attribute("Unit")
+
+    @Unit.setter
+    def Unit(self, value: "IfcNamedUnit"):
+        return self._set_attribute("Unit", value)
@@ -0,0 +1,27 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpileconstructionenum import IfcPileConstructionEnum
+    from .ifcpiletypeenum import IfcPileTypeEnum
+
+class IfcPile(IfcBuildingElement):
+    """Wrapper class for IfcPile."""
+
+    @property
+    def PredefinedType(self)-> "IfcPileTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcPileTypeEnum: (BORED, DRIVEN, JETGROUTING, COHESION, FRICTION, SUPPORT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcPileTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def ConstructionType(self)-> "IfcPileConstructionEnum":
+        """<attribute ConstructionType?: <enumeration IfcPileConstructionEnum: (CAST_IN_PLACE, COMPOSITE, PRECAST_CONCRETE, PREFAB_STEEL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("ConstructionType")
+
+    @ConstructionType.setter
+    def ConstructionType(self, value: "IfcPileConstructionEnum"):
+        return self._set_attribute("ConstructionType", value)
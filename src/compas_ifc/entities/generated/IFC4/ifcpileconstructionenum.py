@@ -0,0 +1,2 @@
+class IfcPileConstructionEnum(str):
+    items = ['CAST_IN_PLACE', 'COMPOSITE', 'PRECAST_CONCRETE', 'PREFAB_STEEL', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcbuildingelementtype import IfcBuildingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpiletypeenum import IfcPileTypeEnum
+
+class IfcPileType(IfcBuildingElementType):
+    """Wrapper class for IfcPileType."""
+
+    @property
+    def PredefinedType(self)-> "IfcPileTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcPileTypeEnum: (BORED, DRIVEN, JETGROUTING, COHESION, FRICTION, SUPPORT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcPileTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
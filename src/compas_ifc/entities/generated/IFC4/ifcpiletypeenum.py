@@ -0,0 +1,2 @@
+class IfcPileTypeEnum(str):
+    items = ['BORED', 'DRIVEN', 'JETGROUTING', 'COHESION', 'FRICTION', 'SUPPORT', 'USERDEFINED', 'NOTDEFINED']
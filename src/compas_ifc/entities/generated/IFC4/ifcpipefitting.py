@@ -0,0 +1,17 @@
+from .ifcflowfitting import IfcFlowFitting
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpipefittingtypeenum import IfcPipeFittingTypeEnum
+
+class IfcPipeFitting(IfcFlowFitting):
+    """Wrapper class for IfcPipeFitting."""
+
+    @property
+    def PredefinedType(self)-> "IfcPipeFittingTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcPipeFittingTypeEnum: (BEND, CONNECTOR, ENTRY, EXIT, JUNCTION, OBSTRUCTION, TRANSITION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcPipeFittingTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,17 @@
+from .ifcflowsegmenttype import IfcFlowSegmentType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpipesegmenttypeenum import IfcPipeSegmentTypeEnum
+
+class IfcPipeSegmentType(IfcFlowSegmentType):
+    """Wrapper class for IfcPipeSegmentType."""
+
+    @property
+    def PredefinedType(self)-> "IfcPipeSegmentTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcPipeSegmentTypeEnum: (CULVERT, FLEXIBLESEGMENT, RIGIDSEGMENT, GUTTER, SPOOL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcPipeSegmentTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
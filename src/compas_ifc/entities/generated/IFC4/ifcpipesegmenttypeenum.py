@@ -0,0 +1,2 @@
+class IfcPipeSegmentTypeEnum(str):
+    items = ['CULVERT', 'FLEXIBLESEGMENT', 'RIGIDSEGMENT', 'GUTTER', 'SPOOL', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccartesianpoint import IfcCartesianPoint
+
+class IfcPlacement(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcPlacement."""
+
+    @property
+    def Location(self)-> "IfcCartesianPoint":
+        """<attribute Location: <entity IfcCartesianPoint>>"""
+        return self._get_attribute("Location")
+
+    @Location.setter
+    def Location(self, value: "IfcCartesianPoint"):
+        return self._set_attribute("Location", value)
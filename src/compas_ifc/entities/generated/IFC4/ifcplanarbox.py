@@ -0,0 +1,19 @@
+from .ifcplanarextent import IfcPlanarExtent
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaxis2placement2d import IfcAxis2Placement2D
+    from .ifcaxis2placement3d import IfcAxis2Placement3D
+
+class IfcPlanarBox(IfcPlanarExtent):
+    """Wrapper class for IfcPlanarBox."""
+
+    @property
+    def Placement(self)-> Union["IfcAxis2Placement3D", "IfcAxis2Placement2D"]:
+        """<attribute Placement: <select IfcAxis2Placement: (<entity IfcAxis2Placement2D> | <entity IfcAxis2Placement3D>)>>"""
+        return self._get_attribute("Placement")
+
+    @Placement.setter
+    def Placement(self, value: Union["IfcAxis2Placement3D", "IfcAxis2Placement2D"]):
+        return self._set_attribute("Placement", value)
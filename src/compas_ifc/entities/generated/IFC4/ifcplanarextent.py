@@ -0,0 +1,23 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+
+class IfcPlanarExtent(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcPlanarExtent."""
+
+    @property
+    def SizeInX(self)-> float:
+        """<attribute SizeInX: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("SizeInX")
+
+    @SizeInX.setter
+    def SizeInX(self, value: float):
+        return self._set_attribute("SizeInX", value)
+
+    @property
+    def SizeInY(self)-> float:
+        """<attribute SizeInY: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("SizeInY")
+
+    @SizeInY.setter
+    def SizeInY(self, value: float):
+        return self._set_attribute("SizeInY", value)
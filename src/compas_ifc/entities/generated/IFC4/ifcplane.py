@@ -0,0 +1,5 @@
+from .ifcelementarysurface import IfcElementarySurface
+
+
+class IfcPlane(IfcElementarySurface):
+    """Wrapper class for IfcPlane."""
@@ -0,0 +1,5 @@
+from .ifcplate import IfcPlate
+
+
+class IfcPlateStandardCase(IfcPlate):
+    """Wrapper class for IfcPlateStandardCase."""
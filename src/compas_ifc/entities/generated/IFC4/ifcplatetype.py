@@ -0,0 +1,17 @@
+from .ifcbuildingelementtype import IfcBuildingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcplatetypeenum import IfcPlateTypeEnum
+
+class IfcPlateType(IfcBuildingElementType):
+    """Wrapper class for IfcPlateType."""
+
+    @property
+    def PredefinedType(self)-> "IfcPlateTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcPlateTypeEnum: (CURTAIN_PANEL, SHEET, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcPlateTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
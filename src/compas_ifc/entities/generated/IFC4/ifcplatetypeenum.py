@@ -0,0 +1,2 @@
+class IfcPlateTypeEnum(str):
+    items = ['CURTAIN_PANEL', 'SHEET', 'USERDEFINED', 'NOTDEFINED']
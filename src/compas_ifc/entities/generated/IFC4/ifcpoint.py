@@ -0,0 +1,5 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+
+class IfcPoint(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcPoint."""
@@ -0,0 +1,27 @@
+from .ifchalfspacesolid import IfcHalfSpaceSolid
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaxis2placement3d import IfcAxis2Placement3D
+    from .ifcboundedcurve import IfcBoundedCurve
+
+class IfcPolygonalBoundedHalfSpace(IfcHalfSpaceSolid):
+    """Wrapper class for IfcPolygonalBoundedHalfSpace."""
+
+    @property
+    def Position(self)-> "IfcAxis2Placement3D":
+        """<attribute Position: <entity IfcAxis2Placement3D>>"""
+        return self._get_attribute("Position")
+
+    @Position.setter
+    def Position(self, value: "IfcAxis2Placement3D"):
+        return self._set_attribute("Position", value)
+
+    @property
+    def PolygonalBoundary(self)-> "IfcBoundedCurve":
+        """<attribute PolygonalBoundary: <entity IfcBoundedCurve>>"""
+        return self._get_attribute("PolygonalBoundary")
+
+    @PolygonalBoundary.setter
+    def PolygonalBoundary(self, value: "IfcBoundedCurve"):
+        return self._set_attribute("PolygonalBoundary", value)
@@ -0,0 +1,35 @@
+from .ifctessellatedfaceset import IfcTessellatedFaceSet
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcindexedpolygonalface import IfcIndexedPolygonalFace
+
+class IfcPolygonalFaceSet(IfcTessellatedFaceSet):
+    """Wrapper class for IfcPolygonalFaceSet."""
+
+    @property
+    def Closed(self)-> bool:
+        """<attribute Closed?: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("Closed")
+
+    @Closed.setter
+    def Closed(self, value: bool):
+        return self._set_attribute("Closed", value)
+
+    @property
+    def Faces(self)-> list["IfcIndexedPolygonalFace"]:
+        """<attribute Faces: <list [1:?] of <entity IfcIndexedPolygonalFace>>>"""
+        return self._get_attribute("Faces")
+
+    @Faces.setter
+    def Faces(self, value: list["IfcIndexedPolygonalFace"]):
+        return self._set_attribute("Faces", value)
+
+    @property
+    def PnIndex(self)-> list[int]:
+        """<attribute PnIndex?: <list [1:?] of <type IfcPositiveInteger: <type IfcInteger: <integer>>>>>"""
+        return self._get_attribute("PnIndex")
+
+    @PnIndex.setter
+    def PnIndex(self, value: list[int]):
+        return self._set_attribute("PnIndex", value)
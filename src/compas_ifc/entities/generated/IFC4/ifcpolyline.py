@@ -0,0 +1,17 @@
+from .ifcboundedcurve import IfcBoundedCurve
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccartesianpoint import IfcCartesianPoint
+
+class IfcPolyline(IfcBoundedCurve):
+    """Wrapper class for IfcPolyline."""
+
+    @property
+    def Points(self)-> list["IfcCartesianPoint"]:
+        """<attribute Points: <list [2:?] of <entity IfcCartesianPoint>>>"""
+        return self._get_attribute("Points")
+
+    @Points.setter
+    def Points(self, value: list["IfcCartesianPoint"]):
+        return self._set_attribute("Points", value)
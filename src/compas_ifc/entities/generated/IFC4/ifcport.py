@@ -0,0 +1,21 @@
+from .ifcproduct import IfcProduct
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelconnectsports import IfcRelConnectsPorts
+    from .ifcrelconnectsporttoelement import IfcRelConnectsPortToElement
+
+class IfcPort(IfcProduct):
+    """Wrapper class for IfcPort."""
+
+    def ContainedIn(self)-> list["IfcRelConnectsPortToElement"]:
+        """<inverse ContainedIn: set [0:1] of <entity IfcRelConnectsPortToElement> for <attribute RelatingPort: <entity IfcPort>>>"""
+        return self._get_inverse_attribute("ContainedIn")
+
+    def ConnectedFrom(self)-> list["IfcRelConnectsPorts"]:
+        """<inverse ConnectedFrom: set [0:1] of <entity IfcRelConnectsPorts> for <attribute RelatedPort: <entity IfcPort>>>"""
+        return self._get_inverse_attribute("ConnectedFrom")
+
+    def ConnectedTo(self)-> list["IfcRelConnectsPorts"]:
+        """<inverse ConnectedTo: set [0:1] of <entity IfcRelConnectsPorts> for <attribute RelatingPort: <entity IfcPort>>>"""
+        return self._get_inverse_attribute("ConnectedTo")
@@ -0,0 +1,68 @@
+from .ifcaddress import IfcAddress
+
+
+class IfcPostalAddress(IfcAddress):
+    """Wrapper class for IfcPostalAddress."""
+
+    @property
+    def InternalLocation(self)-> str:
+        """<attribute InternalLocation?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("InternalLocation")
+
+    @InternalLocation.setter
+    def InternalLocation(self, value: str):
+        return self._set_attribute("InternalLocation", value)
+
+    @property
+    def AddressLines(self)-> list[str]:
+        """<attribute AddressLines?: <list [1:?] of <type IfcLabel: <string>>>>"""
+        return self._get_attribute("AddressLines")
+
+    @AddressLines.setter
+    def AddressLines(self, value: list[str]):
+        return self._set_attribute("AddressLines", value)
+
+    @property
+    def PostalBox(self)-> str:
+        """<attribute PostalBox?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("PostalBox")
+
+    @PostalBox.setter
+    def PostalBox(self, value: str):
+        return self._set_attribute("PostalBox", value)
+
+    @property
+    def Town(self)-> str:
+        """<attribute Town?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Town")
+
+    @Town.setter
+    def Town(self, value: str):
+        return self._set_attribute("Town", value)
+
+    @property
+    def Region(self)-> str:
+        """<attribute Region?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Region")
+
+    @Region.setter
+    def Region(self, value: str):
+        return self._set_attribute("Region", value)
+
+    @property
+    def PostalCode(self)-> str:
+        """<attribute PostalCode?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("PostalCode")
+
+    @PostalCode.setter
+    def PostalCode(self, value: str):
+        return self._set_attribute("PostalCode", value)
+
+    @property
+    def Country(self)-> str:
+        """<attribute Country?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Country")
+
+    @Country.setter
+    def Country(self, value: str):
+        return self._set_attribute("Country", value)
@@ -0,0 +1,5 @@
+from .ifcpredefineditem import IfcPreDefinedItem
+
+
+class IfcPreDefinedColour(IfcPreDefinedItem):
+    """Wrapper class for IfcPreDefinedColour."""
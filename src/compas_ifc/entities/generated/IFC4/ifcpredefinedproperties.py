@@ -0,0 +1,5 @@
+from .ifcpropertyabstraction import IfcPropertyAbstraction
+
+
+class IfcPreDefinedProperties(IfcPropertyAbstraction):
+    """Wrapper class for IfcPreDefinedProperties."""
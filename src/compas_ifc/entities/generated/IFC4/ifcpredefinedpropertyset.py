@@ -0,0 +1,5 @@
+from .ifcpropertysetdefinition import IfcPropertySetDefinition
+
+
+class IfcPreDefinedPropertySet(IfcPropertySetDefinition):
+    """Wrapper class for IfcPreDefinedPropertySet."""
@@ -0,0 +1,2 @@
+class IfcPreferredSurfaceCurveRepresentation(str):
+    items = ['CURVE3D', 'PCURVE_S1', 'PCURVE_S2']
@@ -0,0 +1,5 @@
+from compas_ifc.entities.base import Base
+
+
+class IfcPresentationItem(Base):
+    """Wrapper class for IfcPresentationItem."""
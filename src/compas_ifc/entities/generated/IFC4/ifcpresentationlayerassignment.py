@@ -0,0 +1,46 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrepresentation import IfcRepresentation
+    from .ifcrepresentationitem import IfcRepresentationItem
+
+class IfcPresentationLayerAssignment(Base):
+    """Wrapper class for IfcPresentationLayerAssignment."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def AssignedItems(self)-> list[Union["IfcRepresentation", "IfcRepresentationItem"]]:
+        """<attribute AssignedItems: <set [1:?] of <select IfcLayeredItem: (<entity IfcRepresentation> | <entity IfcRepresentationItem>)>>>"""
+        return self._get_attribute("AssignedItems")
+
+    @AssignedItems.setter
+    def AssignedItems(self, value: list[Union["IfcRepresentation", "IfcRepresentationItem"]]):
+        return self._set_attribute("AssignedItems", value)
+
+    @property
+    def Identifier(self)-> str:
+        """<attribute Identifier?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Identifier")
+
+    @Identifier.setter
+    def Identifier(self, value: str):
+        return self._set_attribute("Identifier", value)
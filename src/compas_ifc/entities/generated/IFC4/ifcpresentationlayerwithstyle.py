@@ -0,0 +1,44 @@
+from .ifcpresentationlayerassignment import IfcPresentationLayerAssignment
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpresentationstyle import IfcPresentationStyle
+
+class IfcPresentationLayerWithStyle(IfcPresentationLayerAssignment):
+    """Wrapper class for IfcPresentationLayerWithStyle."""
+
+    @property
+    def LayerOn(self)-> bool:
+        """<attribute LayerOn: <type IfcLogical: <logical>>>"""
+        return self._get_attribute("LayerOn")
+
+    @LayerOn.setter
+    def LayerOn(self, value: bool):
+        return self._set_attribute("LayerOn", value)
+
+    @property
+    def LayerFrozen(self)-> bool:
+        """<attribute LayerFrozen: <type IfcLogical: <logical>>>"""
+        return self._get_attribute("LayerFrozen")
+
+    @LayerFrozen.setter
+    def LayerFrozen(self, value: bool):
+        return self._set_attribute("LayerFrozen", value)
+
+    @property
+    def LayerBlocked(self)-> bool:
+        """<attribute LayerBlocked: <type IfcLogical: <logical>>>"""
+        return self._get_attribute("LayerBlocked")
+
+    @LayerBlocked.setter
+    def LayerBlocked(self, value: bool):
+        return self._set_attribute("LayerBlocked", value)
+
+    @property
+    def LayerStyles(self)-> list["IfcPresentationStyle"]:
+        """<attribute LayerStyles: <set [0:?] of <entity IfcPresentationStyle>>>"""
+        return self._get_attribute("LayerStyles")
+
+    @LayerStyles.setter
+    def LayerStyles(self, value: list["IfcPresentationStyle"]):
+        return self._set_attribute("LayerStyles", value)
@@ -0,0 +1,22 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccurvestyle import IfcCurveStyle
+    from .ifcfillareastyle import IfcFillAreaStyle
+    from .ifcnullstyle import IfcNullStyle
+    from .ifcsurfacestyle import IfcSurfaceStyle
+    from .ifctextstyle import IfcTextStyle
+
+class IfcPresentationStyleAssignment(Base):
+    """Wrapper class for IfcPresentationStyleAssignment."""
+
+    @property
+    def Styles(self)-> list[Union["IfcSurfaceStyle", "IfcTextStyle", "IfcNullStyle", "IfcFillAreaStyle", "IfcCurveStyle"]]:
+        """<attribute Styles: <set [1:?] of <select IfcPresentationStyleSelect: (<entity IfcCurveStyle> | <entity IfcFillAreaStyle> | <enumeration IfcNullStyle: (NULL)> | <entity IfcSurfaceStyle> | <entity IfcTextStyle>)>>>"""
+        return self._get_attribute("Styles")
+
+    @Styles.setter
+    def Styles(self, value: list[Union["IfcSurfaceStyle", "IfcTextStyle", "IfcNullStyle", "IfcFillAreaStyle", "IfcCurveStyle"]]):
+        return self._set_attribute("Styles", value)
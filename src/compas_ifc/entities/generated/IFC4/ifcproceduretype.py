@@ -0,0 +1,17 @@
+from .ifctypeprocess import IfcTypeProcess
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcproceduretypeenum import IfcProcedureTypeEnum
+
+class IfcProcedureType(IfcTypeProcess):
+    """Wrapper class for IfcProcedureType."""
+
+    @property
+    def PredefinedType(self)-> "IfcProcedureTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcProcedureTypeEnum: (ADVICE_CAUTION, ADVICE_NOTE, ADVICE_WARNING, CALIBRATION, DIAGNOSTIC, SHUTDOWN, STARTUP, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcProcedureTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
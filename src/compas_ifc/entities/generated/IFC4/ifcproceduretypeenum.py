@@ -0,0 +1,2 @@
+class IfcProcedureTypeEnum(str):
+    items = ['ADVICE_CAUTION', 'ADVICE_NOTE', 'ADVICE_WARNING', 'CALIBRATION', 'DIAGNOSTIC', 'SHUTDOWN', 'STARTUP', 'USERDEFINED', 'NOTDEFINED']
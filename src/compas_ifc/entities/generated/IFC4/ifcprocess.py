@@ -0,0 +1,39 @@
+from .ifcobject import IfcObject
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelassignstoprocess import IfcRelAssignsToProcess
+    from .ifcrelsequence import IfcRelSequence
+
+class IfcProcess(IfcObject):
+    """Wrapper class for IfcProcess."""
+
+    @property
+    def Identification(self)-> str:
+        """<attribute Identification?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Identification")
+
+    @Identification.setter
+    def Identification(self, value: str):
+        return self._set_attribute("Identification", value)
+
+    @property
+    def LongDescription(self)-> str:
+        """<attribute LongDescription?: <type IfcText: <string>>>"""
+        return self._get_attribute("LongDescription")
+
+    @LongDescription.setter
+    def LongDescription(self, value: str):
+        return self._set_attribute("LongDescription", value)
+
+    def IsPredecessorTo(self)-> list["IfcRelSequence"]:
+        """<inverse IsPredecessorTo: set [0:?] of <entity IfcRelSequence> for <attribute RelatingProcess: <entity IfcProcess>>>"""
+        return self._get_inverse_attribute("IsPredecessorTo")
+
+    def IsSuccessorFrom(self)-> list["IfcRelSequence"]:
+        """<inverse IsSuccessorFrom: set [0:?] of <entity IfcRelSequence> for <attribute RelatedProcess: <entity IfcProcess>>>"""
+        return self._get_inverse_attribute("IsSuccessorFrom")
+
+    def OperatesOn(self)-> list["IfcRelAssignsToProcess"]:
+        """<inverse OperatesOn: set [0:?] of <entity IfcRelAssignsToProcess> for <attribute RelatingProcess: <select IfcProcessSelect: (<entity IfcProcess> | <entity IfcTypeProcess>)>>>"""
+        return self._get_inverse_attribute("OperatesOn")
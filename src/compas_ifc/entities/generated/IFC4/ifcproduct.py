@@ -0,0 +1,33 @@
+from .ifcobject import IfcObject
+from compas_ifc.entities.extensions import IfcProduct as IfcProduct_Ext   # type: ignore
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcobjectplacement import IfcObjectPlacement
+    from .ifcproductrepresentation import IfcProductRepresentation
+    from .ifcrelassignstoproduct import IfcRelAssignsToProduct
+
+class IfcProduct(IfcProduct_Ext, IfcObject):
+    """Wrapper class for IfcProduct."""
+
+    @property
+    def ObjectPlacement(self)-> "IfcObjectPlacement":
+        """<attribute ObjectPlacement?: <entity IfcObjectPlacement>>"""
+        return self._get_attribute("ObjectPlacement")
+
+    @ObjectPlacement.setter
+    def ObjectPlacement(self, value: "IfcObjectPlacement"):
+        return self._set_attribute("ObjectPlacement", value)
+
+    @property
+    def Representation(self)-> "IfcProductRepresentation":
+        """<attribute Representation?: <entity IfcProductRepresentation>>"""
+        return self._get_attribute("Representation")
+
+    @Representation.setter
+    def Representation(self, value: "IfcProductRepresentation"):
+        return self._set_attribute("Representation", value)
+
+    def ReferencedBy(self)-> list["IfcRelAssignsToProduct"]:
+        """<inverse ReferencedBy: set [0:?] of <entity IfcRelAssignsToProduct> for <attribute RelatingProduct: <select IfcProductSelect: (<entity IfcProduct> | <entity IfcTypeProduct>)>>>"""
+        return self._get_inverse_attribute("ReferencedBy")
@@ -0,0 +1,17 @@
+from .ifcproductrepresentation import IfcProductRepresentation
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcproduct import IfcProduct
+    from .ifcshapeaspect import IfcShapeAspect
+
+class IfcProductDefinitionShape(IfcProductRepresentation):
+    """Wrapper class for IfcProductDefinitionShape."""
+
+    def ShapeOfProduct(self)-> list["IfcProduct"]:
+        """<inverse ShapeOfProduct: set [1:?] of <entity IfcProduct> for <attribute Representation?: <entity IfcProductRepresentation>>>"""
+        return self._get_inverse_attribute("ShapeOfProduct")
+
+    def HasShapeAspects(self)-> list["IfcShapeAspect"]:
+        """<inverse HasShapeAspects: set [0:?] of <entity IfcShapeAspect> for <attribute PartOfProductDefinitionShape?: <select IfcProductRepresentationSelect: (<entity IfcProductDefinitionShape> | <entity IfcRepresentationMap>)>>>"""
+        return self._get_inverse_attribute("HasShapeAspects")
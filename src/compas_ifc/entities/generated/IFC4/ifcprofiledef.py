@@ -0,0 +1,36 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcexternalreferencerelationship import IfcExternalReferenceRelationship
+    from .ifcprofileproperties import IfcProfileProperties
+    from .ifcprofiletypeenum import IfcProfileTypeEnum
+
+class IfcProfileDef(Base):
+    """Wrapper class for IfcProfileDef."""
+
+    @property
+    def ProfileType(self)-> "IfcProfileTypeEnum":
+        """<attribute ProfileType: <enumeration IfcProfileTypeEnum: (CURVE, AREA)>>"""
+        return self._get_attribute("ProfileType")
+
+    @ProfileType.setter
+    def ProfileType(self, value: "IfcProfileTypeEnum"):
+        return self._set_attribute("ProfileType", value)
+
+    @property
+    def ProfileName(self)-> str:
+        """<attribute ProfileName?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ProfileName")
+
+    @ProfileName.setter
+    def ProfileName(self, value: str):
+        return self._set_attribute("ProfileName", value)
+
+    def HasExternalReference(self)-> list["IfcExternalReferenceRelationship"]:
+        """<inverse HasExternalReference: set [0:?] of <entity IfcExternalReferenceRelationship> for <attribute RelatedResourceObjects: <set [1:?] of <select IfcResourceObjectSelect: (<entity IfcActorRole> | <entity IfcAppliedValue> | <entity IfcApproval> | <entity IfcConstraint> | <entity IfcContextDependentUnit> | <entity IfcConversionBasedUnit> | <entity IfcExternalInformation> | <entity IfcExternalReference> | <entity IfcMaterialDefinition> | <entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization> | <entity IfcPhysicalQuantity> | <entity IfcProfileDef> | <entity IfcPropertyAbstraction> | <entity IfcTimeSeries>)>>>>"""
+        return self._get_inverse_attribute("HasExternalReference")
+
+    def HasProperties(self)-> list["IfcProfileProperties"]:
+        """<inverse HasProperties: set [0:?] of <entity IfcProfileProperties> for <attribute ProfileDefinition: <entity IfcProfileDef>>>"""
+        return self._get_inverse_attribute("HasProperties")
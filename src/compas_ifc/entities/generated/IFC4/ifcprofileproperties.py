@@ -0,0 +1,17 @@
+from .ifcextendedproperties import IfcExtendedProperties
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcprofiledef import IfcProfileDef
+
+class IfcProfileProperties(IfcExtendedProperties):
+    """Wrapper class for IfcProfileProperties."""
+
+    @property
+    def ProfileDefinition(self)-> "IfcProfileDef":
+        """<attribute ProfileDefinition: <entity IfcProfileDef>>"""
+        return self._get_attribute("ProfileDefinition")
+
+    @ProfileDefinition.setter
+    def ProfileDefinition(self, value: "IfcProfileDef"):
+        return self._set_attribute("ProfileDefinition", value)
@@ -0,0 +1,6 @@
+from .ifccontext import IfcContext
+from compas_ifc.entities.extensions import IfcProject as IfcProject_Ext   # type: ignore
+
+
+class IfcProject(IfcProject_Ext, IfcContext):
+    """Wrapper class for IfcProject."""
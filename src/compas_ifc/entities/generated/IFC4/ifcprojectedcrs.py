@@ -0,0 +1,35 @@
+from .ifccoordinatereferencesystem import IfcCoordinateReferenceSystem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcnamedunit import IfcNamedUnit
+
+class IfcProjectedCRS(IfcCoordinateReferenceSystem):
+    """Wrapper class for IfcProjectedCRS."""
+
+    @property
+    def MapProjection(self)-> str:
+        """<attribute MapProjection?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("MapProjection")
+
+    @MapProjection.setter
+    def MapProjection(self, value: str):
+        return self._set_attribute("MapProjection", value)
+
+    @property
+    def MapZone(self)-> str:
+        """<attribute MapZone?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("MapZone")
+
+    @MapZone.setter
+    def MapZone(self, value: str):
+        return self._set_attribute("MapZone", value)
+
+    @property
+    def MapUnit(self)-> "IfcNamedUnit":
+        """<attribute MapUnit?: <entity IfcNamedUnit>>"""
+        return self._get_attribute("MapUnit")
+
+    @MapUnit.setter
+    def MapUnit(self, value: "IfcNamedUnit"):
+        return self._set_attribute("MapUnit", value)
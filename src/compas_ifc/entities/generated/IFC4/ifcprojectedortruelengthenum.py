@@ -0,0 +1,2 @@
+class IfcProjectedOrTrueLengthEnum(str):
+    items = ['PROJECTED_LENGTH', 'TRUE_LENGTH']
@@ -0,0 +1,17 @@
+from .ifcfeatureelementaddition import IfcFeatureElementAddition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcprojectionelementtypeenum import IfcProjectionElementTypeEnum
+
+class IfcProjectionElement(IfcFeatureElementAddition):
+    """Wrapper class for IfcProjectionElement."""
+
+    @property
+    def PredefinedType(self)-> "IfcProjectionElementTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcProjectionElementTypeEnum: (USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcProjectionElementTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcProjectionElementTypeEnum(str):
+    items = ['USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,5 @@
+from .ifccontext import IfcContext
+
+
+class IfcProjectLibrary(IfcContext):
+    """Wrapper class for IfcProjectLibrary."""
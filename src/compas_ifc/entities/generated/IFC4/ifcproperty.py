@@ -0,0 +1,54 @@
+from .ifcpropertyabstraction import IfcPropertyAbstraction
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccomplexproperty import IfcComplexProperty
+    from .ifcpropertydependencyrelationship import IfcPropertyDependencyRelationship
+    from .ifcpropertyset import IfcPropertySet
+    from .ifcresourceapprovalrelationship import IfcResourceApprovalRelationship
+    from .ifcresourceconstraintrelationship import IfcResourceConstraintRelationship
+
+class IfcProperty(IfcPropertyAbstraction):
+    """Wrapper class for IfcProperty."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    def PartOfPset(self)-> list["IfcPropertySet"]:
+        """<inverse PartOfPset: set [0:?] of <entity IfcPropertySet> for <attribute HasProperties: <set [1:?] of <entity IfcProperty>>>>"""
+        return self._get_inverse_attribute("PartOfPset")
+
+    def PropertyForDependance(self)-> list["IfcPropertyDependencyRelationship"]:
+        """<inverse PropertyForDependance: set [0:?] of <entity IfcPropertyDependencyRelationship> for <attribute DependingProperty: <entity IfcProperty>>>"""
+        return self._get_inverse_attribute("PropertyForDependance")
+
+    def PropertyDependsOn(self)-> list["IfcPropertyDependencyRelationship"]:
+        """<inverse PropertyDependsOn: set [0:?] of <entity IfcPropertyDependencyRelationship> for <attribute DependantProperty: <entity IfcProperty>>>"""
+        return self._get_inverse_attribute("PropertyDependsOn")
+
+    def PartOfComplex(self)-> list["IfcComplexProperty"]:
+        """<inverse PartOfComplex: set [0:?] of <entity IfcComplexProperty> for <attribute HasProperties: <set [1:?] of <entity IfcProperty>>>>"""
+        return self._get_inverse_attribute("PartOfComplex")
+
+    def HasConstraints(self)-> list["IfcResourceConstraintRelationship"]:
+        """<inverse HasConstraints: set [0:?] of <entity IfcResourceConstraintRelationship> for <attribute RelatedResourceObjects: <set [1:?] of <select IfcResourceObjectSelect: (<entity IfcActorRole> | <entity IfcAppliedValue> | <entity IfcApproval> | <entity IfcConstraint> | <entity IfcContextDependentUnit> | <entity IfcConversionBasedUnit> | <entity IfcExternalInformation> | <entity IfcExternalReference> | <entity IfcMaterialDefinition> | <entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization> | <entity IfcPhysicalQuantity> | <entity IfcProfileDef> | <entity IfcPropertyAbstraction> | <entity IfcTimeSeries>)>>>>"""
+        return self._get_inverse_attribute("HasConstraints")
+
+    def HasApprovals(self)-> list["IfcResourceApprovalRelationship"]:
+        """<inverse HasApprovals: set [0:?] of <entity IfcResourceApprovalRelationship> for <attribute RelatedResourceObjects: <set [1:?] of <select IfcResourceObjectSelect: (<entity IfcActorRole> | <entity IfcAppliedValue> | <entity IfcApproval> | <entity IfcConstraint> | <entity IfcContextDependentUnit> | <entity IfcConversionBasedUnit> | <entity IfcExternalInformation> | <entity IfcExternalReference> | <entity IfcMaterialDefinition> | <entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization> | <entity IfcPhysicalQuantity> | <entity IfcProfileDef> | <entity IfcPropertyAbstraction> | <entity IfcTimeSeries>)>>>>"""
+        return self._get_inverse_attribute("HasApprovals")
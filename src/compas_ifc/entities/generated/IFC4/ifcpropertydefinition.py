@@ -0,0 +1,17 @@
+from .ifcroot import IfcRoot
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelassociates import IfcRelAssociates
+    from .ifcreldeclares import IfcRelDeclares
+
+class IfcPropertyDefinition(IfcRoot):
+    """Wrapper class for IfcPropertyDefinition."""
+
+    def HasContext(self)-> list["IfcRelDeclares"]:
+        """<inverse HasContext: set [0:1] of <entity IfcRelDeclares> for <attribute RelatedDefinitions: <set [1:?] of <select IfcDefinitionSelect: (<entity IfcObjectDefinition> | <entity IfcPropertyDefinition>)>>>>"""
+        return self._get_inverse_attribute("HasContext")
+
+    def HasAssociations(self)-> list["IfcRelAssociates"]:
+        """<inverse HasAssociations: set [0:?] of <entity IfcRelAssociates> for <attribute RelatedObjects: <set [1:?] of <select IfcDefinitionSelect: (<entity IfcObjectDefinition> | <entity IfcPropertyDefinition>)>>>>"""
+        return self._get_inverse_attribute("HasAssociations")
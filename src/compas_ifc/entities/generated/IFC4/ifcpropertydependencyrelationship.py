@@ -0,0 +1,35 @@
+from .ifcresourcelevelrelationship import IfcResourceLevelRelationship
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcproperty import IfcProperty
+
+class IfcPropertyDependencyRelationship(IfcResourceLevelRelationship):
+    """Wrapper class for IfcPropertyDependencyRelationship."""
+
+    @property
+    def DependingProperty(self)-> "IfcProperty":
+        """<attribute DependingProperty: <entity IfcProperty>>"""
+        return self._get_attribute("DependingProperty")
+
+    @DependingProperty.setter
+    def DependingProperty(self, value: "IfcProperty"):
+        return self._set_attribute("DependingProperty", value)
+
+    @property
+    def DependantProperty(self)-> "IfcProperty":
+        """<attribute DependantProperty: <entity IfcProperty>>"""
+        return self._get_attribute("DependantProperty")
+
+    @DependantProperty.setter
+    def DependantProperty(self, value: "IfcProperty"):
+        return self._set_attribute("DependantProperty", value)
+
+    @property
+    def Expression(self)-> str:
+        """<attribute Expression?: <type IfcText: <string>>>"""
+        return self._get_attribute("Expression")
+
+    @Expression.setter
+    def Expression(self, value: str):
+        return self._set_attribute("Expression", value)
@@ -0,0 +1,35 @@
+from .ifcsimpleproperty import IfcSimpleProperty
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaddress import IfcAddress
+    from .ifcappliedvalue import IfcAppliedValue
+    from .ifcexternalreference import IfcExternalReference
+    from .ifcmaterialdefinition import IfcMaterialDefinition
+    from .ifcorganization import IfcOrganization
+    from .ifcperson import IfcPerson
+    from .ifcpersonandorganization import IfcPersonAndOrganization
+    from .ifctable import IfcTable
+    from .ifctimeseries import IfcTimeSeries
+
+class IfcPropertyReferenceValue(IfcSimpleProperty):
+    """Wrapper class for IfcPropertyReferenceValue."""
+
+    @property
+    def UsageName(self)-> str:
+        """<attribute UsageName?: <type IfcText: <string>>>"""
+        return self._get_attribute("UsageName")
+
+    @UsageName.setter
+    def UsageName(self, value: str):
+        return self._set_attribute("UsageName", value)
+
+    @property
+    def PropertyReference(self)-> Union["IfcAddress", "IfcMaterialDefinition", "IfcTable", "IfcTimeSeries", "IfcExternalReference", "IfcAppliedValue", "IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]:
+        """<attribute PropertyReference?: <select IfcObjectReferenceSelect: (<entity IfcAddress> | <entity IfcAppliedValue> | <entity IfcExternalReference> | <entity IfcMaterialDefinition> | <entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization> | <entity IfcTable> | <entity IfcTimeSeries>)>>"""
+        return self._get_attribute("PropertyReference")
+
+    @PropertyReference.setter
+    def PropertyReference(self, value: Union["IfcAddress", "IfcMaterialDefinition", "IfcTable", "IfcTimeSeries", "IfcExternalReference", "IfcAppliedValue", "IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]):
+        return self._set_attribute("PropertyReference", value)
@@ -0,0 +1,22 @@
+from .ifcpropertydefinition import IfcPropertyDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcreldefinesbyproperties import IfcRelDefinesByProperties
+    from .ifcreldefinesbytemplate import IfcRelDefinesByTemplate
+    from .ifctypeobject import IfcTypeObject
+
+class IfcPropertySetDefinition(IfcPropertyDefinition):
+    """Wrapper class for IfcPropertySetDefinition."""
+
+    def DefinesType(self)-> list["IfcTypeObject"]:
+        """<inverse DefinesType: set [0:?] of <entity IfcTypeObject> for <attribute HasPropertySets?: <set [1:?] of <entity IfcPropertySetDefinition>>>>"""
+        return self._get_inverse_attribute("DefinesType")
+
+    def IsDefinedBy(self)-> list["IfcRelDefinesByTemplate"]:
+        """<inverse IsDefinedBy: set [0:?] of <entity IfcRelDefinesByTemplate> for <attribute RelatedPropertySets: <set [1:?] of <entity IfcPropertySetDefinition>>>>"""
+        return self._get_inverse_attribute("IsDefinedBy")
+
+    def DefinesOccurrence(self)-> list["IfcRelDefinesByProperties"]:
+        """<inverse DefinesOccurrence: set [0:?] of <entity IfcRelDefinesByProperties> for <attribute RelatingPropertyDefinition: <select IfcPropertySetDefinitionSelect: (<entity IfcPropertySetDefinition> | <type IfcPropertySetDefinitionSet: <set [1:?] of <entity IfcPropertySetDefinition>>>)>>>"""
+        return self._get_inverse_attribute("DefinesOccurrence")
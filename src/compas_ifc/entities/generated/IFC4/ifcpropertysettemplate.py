@@ -0,0 +1,41 @@
+from .ifcpropertytemplatedefinition import IfcPropertyTemplateDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpropertysettemplatetypeenum import IfcPropertySetTemplateTypeEnum
+    from .ifcpropertytemplate import IfcPropertyTemplate
+    from .ifcreldefinesbytemplate import IfcRelDefinesByTemplate
+
+class IfcPropertySetTemplate(IfcPropertyTemplateDefinition):
+    """Wrapper class for IfcPropertySetTemplate."""
+
+    @property
+    def TemplateType(self)-> "IfcPropertySetTemplateTypeEnum":
+        """<attribute TemplateType?: <enumeration IfcPropertySetTemplateTypeEnum: (PSET_TYPEDRIVENONLY, PSET_TYPEDRIVENOVERRIDE, PSET_OCCURRENCEDRIVEN, PSET_PERFORMANCEDRIVEN, QTO_TYPEDRIVENONLY, QTO_TYPEDRIVENOVERRIDE, QTO_OCCURRENCEDRIVEN, NOTDEFINED)>>"""
+        return self._get_attribute("TemplateType")
+
+    @TemplateType.setter
+    def TemplateType(self, value: "IfcPropertySetTemplateTypeEnum"):
+        return self._set_attribute("TemplateType", value)
+
+    @property
+    def ApplicableEntity(self)-> str:
+        """<attribute ApplicableEntity?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("ApplicableEntity")
+
+    @ApplicableEntity.setter
+    def ApplicableEntity(self, value: str):
+        return self._set_attribute("ApplicableEntity", value)
+
+    @property
+    def HasPropertyTemplates(self)-> list["IfcPropertyTemplate"]:
+        """<attribute HasPropertyTemplates: <set [1:?] of <entity IfcPropertyTemplate>>>"""
+        return self._get_attribute("HasPropertyTemplates")
+
+    @HasPropertyTemplates.setter
+    def HasPropertyTemplates(self, value: list["IfcPropertyTemplate"]):
+        return self._set_attribute("HasPropertyTemplates", value)
+
+    def Defines(self)-> list["IfcRelDefinesByTemplate"]:
+        """<inverse Defines: set [0:?] of <entity IfcRelDefinesByTemplate> for <attribute RelatingTemplate: <entity IfcPropertySetTemplate>>>"""
+        return self._get_inverse_attribute("Defines")
@@ -0,0 +1,2 @@
+class IfcPropertySetTemplateTypeEnum(str):
+    items = ['PSET_TYPEDRIVENONLY', 'PSET_TYPEDRIVENOVERRIDE', 'PSET_OCCURRENCEDRIVEN', 'PSET_PERFORMANCEDRIVEN', 'QTO_TYPEDRIVENONLY', 'QTO_TYPEDRIVENOVERRIDE', 'QTO_OCCURRENCEDRIVEN', 'NOTDEFINED']
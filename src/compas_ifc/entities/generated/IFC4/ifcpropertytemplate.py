@@ -0,0 +1,17 @@
+from .ifcpropertytemplatedefinition import IfcPropertyTemplateDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccomplexpropertytemplate import IfcComplexPropertyTemplate
+    from .ifcpropertysettemplate import IfcPropertySetTemplate
+
+class IfcPropertyTemplate(IfcPropertyTemplateDefinition):
+    """Wrapper class for IfcPropertyTemplate."""
+
+    def PartOfComplexTemplate(self)-> list["IfcComplexPropertyTemplate"]:
+        """<inverse PartOfComplexTemplate: set [0:?] of <entity IfcComplexPropertyTemplate> for <attribute HasPropertyTemplates?: <set [1:?] of <entity IfcPropertyTemplate>>>>"""
+        return self._get_inverse_attribute("PartOfComplexTemplate")
+
+    def PartOfPsetTemplate(self)-> list["IfcPropertySetTemplate"]:
+        """<inverse PartOfPsetTemplate: set [0:?] of <entity IfcPropertySetTemplate> for <attribute HasPropertyTemplates: <set [1:?] of <entity IfcPropertyTemplate>>>>"""
+        return self._get_inverse_attribute("PartOfPsetTemplate")
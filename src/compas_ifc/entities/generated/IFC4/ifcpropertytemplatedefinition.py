@@ -0,0 +1,5 @@
+from .ifcpropertydefinition import IfcPropertyDefinition
+
+
+class IfcPropertyTemplateDefinition(IfcPropertyDefinition):
+    """Wrapper class for IfcPropertyTemplateDefinition."""
@@ -0,0 +1,17 @@
+from .ifcdistributioncontrolelement import IfcDistributionControlElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcprotectivedevicetrippingunittypeenum import IfcProtectiveDeviceTrippingUnitTypeEnum
+
+class IfcProtectiveDeviceTrippingUnit(IfcDistributionControlElement):
+    """Wrapper class for IfcProtectiveDeviceTrippingUnit."""
+
+    @property
+    def PredefinedType(self)-> "IfcProtectiveDeviceTrippingUnitTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcProtectiveDeviceTrippingUnitTypeEnum: (ELECTRONIC, ELECTROMAGNETIC, RESIDUALCURRENT, THERMAL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcProtectiveDeviceTrippingUnitTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
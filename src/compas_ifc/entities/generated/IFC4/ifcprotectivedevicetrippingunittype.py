@@ -0,0 +1,17 @@
+from .ifcdistributioncontrolelementtype import IfcDistributionControlElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcprotectivedevicetrippingunittypeenum import IfcProtectiveDeviceTrippingUnitTypeEnum
+
+class IfcProtectiveDeviceTrippingUnitType(IfcDistributionControlElementType):
+    """Wrapper class for IfcProtectiveDeviceTrippingUnitType."""
+
+    @property
+    def PredefinedType(self)-> "IfcProtectiveDeviceTrippingUnitTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcProtectiveDeviceTrippingUnitTypeEnum: (ELECTRONIC, ELECTROMAGNETIC, RESIDUALCURRENT, THERMAL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcProtectiveDeviceTrippingUnitTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
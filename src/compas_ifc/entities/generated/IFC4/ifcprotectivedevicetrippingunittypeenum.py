@@ -0,0 +1,2 @@
+class IfcProtectiveDeviceTrippingUnitTypeEnum(str):
+    items = ['ELECTRONIC', 'ELECTROMAGNETIC', 'RESIDUALCURRENT', 'THERMAL', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,2 @@
+class IfcProtectiveDeviceTypeEnum(str):
+    items = ['CIRCUITBREAKER', 'EARTHLEAKAGECIRCUITBREAKER', 'EARTHINGSWITCH', 'FUSEDISCONNECTOR', 'RESIDUALCURRENTCIRCUITBREAKER', 'RESIDUALCURRENTSWITCH', 'VARISTOR', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcflowmovingdevice import IfcFlowMovingDevice
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpumptypeenum import IfcPumpTypeEnum
+
+class IfcPump(IfcFlowMovingDevice):
+    """Wrapper class for IfcPump."""
+
+    @property
+    def PredefinedType(self)-> "IfcPumpTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcPumpTypeEnum: (CIRCULATOR, ENDSUCTION, SPLITCASE, SUBMERSIBLEPUMP, SUMPPUMP, VERTICALINLINE, VERTICALTURBINE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcPumpTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,17 @@
+from .ifcflowmovingdevicetype import IfcFlowMovingDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpumptypeenum import IfcPumpTypeEnum
+
+class IfcPumpType(IfcFlowMovingDeviceType):
+    """Wrapper class for IfcPumpType."""
+
+    @property
+    def PredefinedType(self)-> "IfcPumpTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcPumpTypeEnum: (CIRCULATOR, ENDSUCTION, SPLITCASE, SUBMERSIBLEPUMP, SUMPPUMP, VERTICALINLINE, VERTICALTURBINE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcPumpTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
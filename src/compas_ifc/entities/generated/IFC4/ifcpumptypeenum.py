@@ -0,0 +1,2 @@
+class IfcPumpTypeEnum(str):
+    items = ['CIRCULATOR', 'ENDSUCTION', 'SPLITCASE', 'SUBMERSIBLEPUMP', 'SUMPPUMP', 'VERTICALINLINE', 'VERTICALTURBINE', 'USERDEFINED', 'NOTDEFINED']
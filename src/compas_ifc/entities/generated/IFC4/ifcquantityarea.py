@@ -0,0 +1,23 @@
+from .ifcphysicalsimplequantity import IfcPhysicalSimpleQuantity
+
+
+class IfcQuantityArea(IfcPhysicalSimpleQuantity):
+    """Wrapper class for IfcQuantityArea."""
+
+    @property
+    def AreaValue(self)-> float:
+        """<attribute AreaValue: <type IfcAreaMeasure: <real>>>"""
+        return self._get_attribute("AreaValue")
+
+    @AreaValue.setter
+    def AreaValue(self, value: float):
+        return self._set_attribute("AreaValue", value)
+
+    @property
+    def Formula(self)-> str:
+        """<attribute Formula?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Formula")
+
+    @Formula.setter
+    def Formula(self, value: str):
+        return self._set_attribute("Formula", value)
@@ -0,0 +1,23 @@
+from .ifcphysicalsimplequantity import IfcPhysicalSimpleQuantity
+
+
+class IfcQuantityCount(IfcPhysicalSimpleQuantity):
+    """Wrapper class for IfcQuantityCount."""
+
+    @property
+    def CountValue(self)-> float:
+        """<attribute CountValue: <type IfcCountMeasure: <number>>>"""
+        return self._get_attribute("CountValue")
+
+    @CountValue.setter
+    def CountValue(self, value: float):
+        return self._set_attribute("CountValue", value)
+
+    @property
+    def Formula(self)-> str:
+        """<attribute Formula?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Formula")
+
+    @Formula.setter
+    def Formula(self, value: str):
+        return self._set_attribute("Formula", value)
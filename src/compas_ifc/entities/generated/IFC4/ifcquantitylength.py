@@ -0,0 +1,23 @@
+from .ifcphysicalsimplequantity import IfcPhysicalSimpleQuantity
+
+
+class IfcQuantityLength(IfcPhysicalSimpleQuantity):
+    """Wrapper class for IfcQuantityLength."""
+
+    @property
+    def LengthValue(self)-> float:
+        """<attribute LengthValue: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("LengthValue")
+
+    @LengthValue.setter
+    def LengthValue(self, value: float):
+        return self._set_attribute("LengthValue", value)
+
+    @property
+    def Formula(self)-> str:
+        """<attribute Formula?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Formula")
+
+    @Formula.setter
+    def Formula(self, value: str):
+        return self._set_attribute("Formula", value)
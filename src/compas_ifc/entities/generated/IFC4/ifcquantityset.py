@@ -0,0 +1,5 @@
+from .ifcpropertysetdefinition import IfcPropertySetDefinition
+
+
+class IfcQuantitySet(IfcPropertySetDefinition):
+    """Wrapper class for IfcQuantitySet."""
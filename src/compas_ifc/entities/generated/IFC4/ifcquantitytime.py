@@ -0,0 +1,23 @@
+from .ifcphysicalsimplequantity import IfcPhysicalSimpleQuantity
+
+
+class IfcQuantityTime(IfcPhysicalSimpleQuantity):
+    """Wrapper class for IfcQuantityTime."""
+
+    @property
+    def TimeValue(self)-> float:
+        """<attribute TimeValue: <type IfcTimeMeasure: <real>>>"""
+        return self._get_attribute("TimeValue")
+
+    @TimeValue.setter
+    def TimeValue(self, value: float):
+        return self._set_attribute("TimeValue", value)
+
+    @property
+    def Formula(self)-> str:
+        """<attribute Formula?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Formula")
+
+    @Formula.setter
+    def Formula(self, value: str):
+        return self._set_attribute("Formula", value)
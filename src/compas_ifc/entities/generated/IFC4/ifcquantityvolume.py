@@ -0,0 +1,23 @@
+from .ifcphysicalsimplequantity import IfcPhysicalSimpleQuantity
+
+
+class IfcQuantityVolume(IfcPhysicalSimpleQuantity):
+    """Wrapper class for IfcQuantityVolume."""
+
+    @property
+    def VolumeValue(self)-> float:
+        """<attribute VolumeValue: <type IfcVolumeMeasure: <real>>>"""
+        return self._get_attribute("VolumeValue")
+
+    @VolumeValue.setter
+    def VolumeValue(self, value: float):
+        return self._set_attribute("VolumeValue", value)
+
+    @property
+    def Formula(self)-> str:
+        """<attribute Formula?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Formula")
+
+    @Formula.setter
+    def Formula(self, value: str):
+        return self._set_attribute("Formula", value)
@@ -0,0 +1,2 @@
+class IfcRailingTypeEnum(str):
+    items = ['HANDRAIL', 'GUARDRAIL', 'BALUSTRADE', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcramptypeenum import IfcRampTypeEnum
+
+class IfcRamp(IfcBuildingElement):
+    """Wrapper class for IfcRamp."""
+
+    @property
+    def PredefinedType(self)-> "IfcRampTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcRampTypeEnum: (STRAIGHT_RUN_RAMP, TWO_STRAIGHT_RUN_RAMP, QUARTER_TURN_RAMP, TWO_QUARTER_TURN_RAMP, HALF_TURN_RAMP, SPIRAL_RAMP, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcRampTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
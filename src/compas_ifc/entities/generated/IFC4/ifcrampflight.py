@@ -0,0 +1,17 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrampflighttypeenum import IfcRampFlightTypeEnum
+
+class IfcRampFlight(IfcBuildingElement):
+    """Wrapper class for IfcRampFlight."""
+
+    @property
+    def PredefinedType(self)-> "IfcRampFlightTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcRampFlightTypeEnum: (STRAIGHT, SPIRAL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcRampFlightTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
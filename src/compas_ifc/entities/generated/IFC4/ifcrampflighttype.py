@@ -0,0 +1,17 @@
+from .ifcbuildingelementtype import IfcBuildingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrampflighttypeenum import IfcRampFlightTypeEnum
+
+class IfcRampFlightType(IfcBuildingElementType):
+    """Wrapper class for IfcRampFlightType."""
+
+    @property
+    def PredefinedType(self)-> "IfcRampFlightTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcRampFlightTypeEnum: (STRAIGHT, SPIRAL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcRampFlightTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
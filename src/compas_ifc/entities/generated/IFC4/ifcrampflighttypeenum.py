@@ -0,0 +1,2 @@
+class IfcRampFlightTypeEnum(str):
+    items = ['STRAIGHT', 'SPIRAL', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,14 @@
+from .ifcbsplinecurvewithknots import IfcBSplineCurveWithKnots
+
+
+class IfcRationalBSplineCurveWithKnots(IfcBSplineCurveWithKnots):
+    """Wrapper class for IfcRationalBSplineCurveWithKnots."""
+
+    @property
+    def WeightsData(self)-> list[float]:
+        """<attribute WeightsData: <list [2:?] of <type IfcReal: <real>>>>"""
+        return self._get_attribute("WeightsData")
+
+    @WeightsData.setter
+    def WeightsData(self, value: list[float]):
+        return self._set_attribute("WeightsData", value)
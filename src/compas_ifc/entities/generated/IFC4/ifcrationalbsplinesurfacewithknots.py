@@ -0,0 +1,14 @@
+from .ifcbsplinesurfacewithknots import IfcBSplineSurfaceWithKnots
+
+
+class IfcRationalBSplineSurfaceWithKnots(IfcBSplineSurfaceWithKnots):
+    """Wrapper class for IfcRationalBSplineSurfaceWithKnots."""
+
+    @property
+    def WeightsData(self)-> list[list[float]]:
+        """<attribute WeightsData: <list [2:?] of <list [2:?] of <type IfcReal: <real>>>>>"""
+        return self._get_attribute("WeightsData")
+
+    @WeightsData.setter
+    def WeightsData(self, value: list[list[float]]):
+        return self._set_attribute("WeightsData", value)
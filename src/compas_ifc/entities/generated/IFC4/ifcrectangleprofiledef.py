@@ -0,0 +1,23 @@
+from .ifcparameterizedprofiledef import IfcParameterizedProfileDef
+
+
+class IfcRectangleProfileDef(IfcParameterizedProfileDef):
+    """Wrapper class for IfcRectangleProfileDef."""
+
+    @property
+    def XDim(self)-> float:
+        """<attribute XDim: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("XDim")
+
+    @XDim.setter
+    def XDim(self, value: float):
+        return self._set_attribute("XDim", value)
+
+    @property
+    def YDim(self)-> float:
+        """<attribute YDim: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("YDim")
+
+    @YDim.setter
+    def YDim(self, value: float):
+        return self._set_attribute("YDim", value)
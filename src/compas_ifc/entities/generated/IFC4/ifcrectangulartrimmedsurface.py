@@ -0,0 +1,71 @@
+from .ifcboundedsurface import IfcBoundedSurface
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcsurface import IfcSurface
+
+class IfcRectangularTrimmedSurface(IfcBoundedSurface):
+    """Wrapper class for IfcRectangularTrimmedSurface."""
+
+    @property
+    def BasisSurface(self)-> "IfcSurface":
+        """<attribute BasisSurface: <entity IfcSurface>>"""
+        return self._get_attribute("BasisSurface")
+
+    @BasisSurface.setter
+    def BasisSurface(self, value: "IfcSurface"):
+        return self._set_attribute("BasisSurface", value)
+
+    @property
+    def U1(self)-> float:
+        """<attribute U1: <type IfcParameterValue: <real>>>"""
+        return self._get_attribute("U1")
+
+    @U1.setter
+    def U1(self, value: float):
+        return self._set_attribute("U1", value)
+
+    @property
+    def V1(self)-> float:
+        """<attribute V1: <type IfcParameterValue: <real>>>"""
+        return self._get_attribute("V1")
+
+    @V1.setter
+    def V1(self, value: float):
+        return self._set_attribute("V1", value)
+
+    @property
+    def U2(self)-> float:
+        """<attribute U2: <type IfcParameterValue: <real>>>"""
+        return self._get_attribute("U2")
+
+    @U2.setter
+    def U2(self, value: float):
+        return self._set_attribute("U2", value)
+
+    @property
+    def V2(self)-> float:
+        """<attribute V2: <type IfcParameterValue: <real>>>"""
+        return self._get_attribute("V2")
+
+    @V2.setter
+    def V2(self, value: float):
+        return self._set_attribute("V2", value)
+
+    @property
+    def Usense(self)-> bool:
+        """<attribute Usense: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("Usense")
+
+    @Usense.setter
+    def Usense(self, value: bool):
+        return self._set_attribute("Usense", value)
+
+    @property
+    def Vsense(self)-> bool:
+        """<attribute Vsense: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("Vsense")
+
+    @Vsense.setter
+    def Vsense(self, value: bool):
+        return self._set_attribute("Vsense", value)
@@ -0,0 +1,81 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrecurrencetypeenum import IfcRecurrenceTypeEnum
+    from .ifctimeperiod import IfcTimePeriod
+
+class IfcRecurrencePattern(Base):
+    """Wrapper class for IfcRecurrencePattern."""
+
+    @property
+    def RecurrenceType(self)-> "IfcRecurrenceTypeEnum":
+        """<attribute RecurrenceType: <enumeration IfcRecurrenceTypeEnum: (DAILY, WEEKLY, MONTHLY_BY_DAY_OF_MONTH, MONTHLY_BY_POSITION, BY_DAY_COUNT, BY_WEEKDAY_COUNT, YEARLY_BY_DAY_OF_MONTH, YEARLY_BY_POSITION)>>"""
+        return self._get_attribute("RecurrenceType")
+
+    @RecurrenceType.setter
+    def RecurrenceType(self, value: "IfcRecurrenceTypeEnum"):
+        return self._set_attribute("RecurrenceType", value)
+
+    @property
+    def DayComponent(self)-> list[int]:
+        """<attribute DayComponent?: <set [1:?] of <type IfcDayInMonthNumber: <integer>>>>"""
+        return self._get_attribute("DayComponent")
+
+    @DayComponent.setter
+    def DayComponent(self, value: list[int]):
+        return self._set_attribute("DayComponent", value)
+
+    @property
+    def WeekdayComponent(self)-> list[int]:
+        """<attribute WeekdayComponent?: <set [1:?] of <type IfcDayInWeekNumber: <integer>>>>"""
+        return self._get_attribute("WeekdayComponent")
+
+    @WeekdayComponent.setter
+    def WeekdayComponent(self, value: list[int]):
+        return self._set_attribute("WeekdayComponent", value)
+
+    @property
+    def MonthComponent(self)-> list[int]:
+        """<attribute MonthComponent?: <set [1:?] of <type IfcMonthInYearNumber: <integer>>>>"""
+        return self._get_attribute("MonthComponent")
+
+    @MonthComponent.setter
+    def MonthComponent(self, value: list[int]):
+        return self._set_attribute("MonthComponent", value)
+
+    @property
+    def Position(self)-> int:
+        """<attribute Position?: <type IfcInteger: <integer>>>"""
+        return self._get_attribute("Position")
+
+    @Position.setter
+    def Position(self, value: int):
+        return self._set_attribute("Position", value)
+
+    @property
+    def Interval(self)-> int:
+        """<attribute Interval?: <type IfcInteger: <integer>>>"""
+        return self._get_attribute("Interval")
+
+    @Interval.setter
+    def Interval(self, value: int):
+        return self._set_attribute("Interval", value)
+
+    @property
+    def Occurrences(self)-> int:
+        """<attribute Occurrences?: <type IfcInteger: <integer>>>"""
+        return self._get_attribute("Occurrences")
+
+    @Occurrences.setter
+    def Occurrences(self, value: int):
+        return self._set_attribute("Occurrences", value)
+
+    @property
+    def TimePeriods(self)-> list["IfcTimePeriod"]:
+        """<attribute TimePeriods?: <list [1:?] of <entity IfcTimePeriod>>>"""
+        return self._get_attribute("TimePeriods")
+
+    @TimePeriods.setter
+    def TimePeriods(self, value: list["IfcTimePeriod"]):
+        return self._set_attribute("TimePeriods", value)
@@ -0,0 +1,2 @@
+class IfcRecurrenceTypeEnum(str):
+    items = ['DAILY', 'WEEKLY', 'MONTHLY_BY_DAY_OF_MONTH', 'MONTHLY_BY_POSITION', 'BY_DAY_COUNT', 'BY_WEEKDAY_COUNT', 'YEARLY_BY_DAY_OF_MONTH', 'YEARLY_BY_POSITION']
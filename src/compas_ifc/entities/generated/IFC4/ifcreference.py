@@ -0,0 +1,50 @@
+from compas_ifc.entities.base import Base
+
+
+class IfcReference(Base):
+    """Wrapper class for IfcReference."""
+
+    @property
+    def TypeIdentifier(self)-> str:
+        """<attribute TypeIdentifier?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("TypeIdentifier")
+
+    @TypeIdentifier.setter
+    def TypeIdentifier(self, value: str):
+        return self._set_attribute("TypeIdentifier", value)
+
+    @property
+    def AttributeIdentifier(self)-> str:
+        """<attribute AttributeIdentifier?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("AttributeIdentifier")
+
+    @AttributeIdentifier.setter
+    def AttributeIdentifier(self, value: str):
+        return self._set_attribute("AttributeIdentifier", value)
+
+    @property
+    def InstanceName(self)-> str:
+        """<attribute InstanceName?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("InstanceName")
+
+    @InstanceName.setter
+    def InstanceName(self, value: str):
+        return self._set_attribute("InstanceName", value)
+
+    @property
+    def ListPositions(self)-> list[int]:
+        """<attribute ListPositions?: <list [1:?] of <type IfcInteger: <integer>>>>"""
+        return self._get_attribute("ListPositions")
+
+    @ListPositions.setter
+    def ListPositions(self, value: list[int]):
+        return self._set_attribute("ListPositions", value)
+
+    @property
+    def InnerReference(self)-> "IfcReference":
+        """<attribute InnerReference?: <entity IfcReference>>"""
+        return self._get_attribute("InnerReference")
+
+    @InnerReference.setter
+    def InnerReference(self, value: "IfcReference"):
+        return self._set_attribute("InnerReference", value)
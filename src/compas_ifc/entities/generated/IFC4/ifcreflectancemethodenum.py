@@ -0,0 +1,2 @@
+class IfcReflectanceMethodEnum(str):
+    items = ['BLINN', 'FLAT', 'GLASS', 'MATT', 'METAL', 'MIRROR', 'PHONG', 'PLASTIC', 'STRAUSS', 'NOTDEFINED']
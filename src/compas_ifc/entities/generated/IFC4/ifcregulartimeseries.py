@@ -0,0 +1,26 @@
+from .ifctimeseries import IfcTimeSeries
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctimeseriesvalue import IfcTimeSeriesValue
+
+class IfcRegularTimeSeries(IfcTimeSeries):
+    """Wrapper class for IfcRegularTimeSeries."""
+
+    @property
+    def TimeStep(self)-> float:
+        """<attribute TimeStep: <type IfcTimeMeasure: <real>>>"""
+        return self._get_attribute("TimeStep")
+
+    @TimeStep.setter
+    def TimeStep(self, value: float):
+        return self._set_attribute("TimeStep", value)
+
+    @property
+    def Values(self)-> list["IfcTimeSeriesValue"]:
+        """<attribute Values: <list [1:?] of <entity IfcTimeSeriesValue>>>"""
+        return self._get_attribute("Values")
+
+    @Values.setter
+    def Values(self, value: list["IfcTimeSeriesValue"]):
+        return self._set_attribute("Values", value)
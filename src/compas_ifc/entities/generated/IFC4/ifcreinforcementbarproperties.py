@@ -0,0 +1,62 @@
+from .ifcpredefinedproperties import IfcPreDefinedProperties
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcreinforcingbarsurfaceenum import IfcReinforcingBarSurfaceEnum
+
+class IfcReinforcementBarProperties(IfcPreDefinedProperties):
+    """Wrapper class for IfcReinforcementBarProperties."""
+
+    @property
+    def TotalCrossSectionArea(self)-> float:
+        """<attribute TotalCrossSectionArea: <type IfcAreaMeasure: <real>>>"""
+        return self._get_attribute("TotalCrossSectionArea")
+
+    @TotalCrossSectionArea.setter
+    def TotalCrossSectionArea(self, value: float):
+        return self._set_attribute("TotalCrossSectionArea", value)
+
+    @property
+    def SteelGrade(self)-> str:
+        """<attribute SteelGrade: <type IfcLabel: <string>>>"""
+        return self._get_attribute("SteelGrade")
+
+    @SteelGrade.setter
+    def SteelGrade(self, value: str):
+        return self._set_attribute("SteelGrade", value)
+
+    @property
+    def BarSurface(self)-> "IfcReinforcingBarSurfaceEnum":
+        """<attribute BarSurface?: <enumeration IfcReinforcingBarSurfaceEnum: (PLAIN, TEXTURED)>>"""
+        return self._get_attribute("BarSurface")
+
+    @BarSurface.setter
+    def BarSurface(self, value: "IfcReinforcingBarSurfaceEnum"):
+        return self._set_attribute("BarSurface", value)
+
+    @property
+    def EffectiveDepth(self)-> float:
+        """<attribute EffectiveDepth?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("EffectiveDepth")
+
+    @EffectiveDepth.setter
+    def EffectiveDepth(self, value: float):
+        return self._set_attribute("EffectiveDepth", value)
+
+    @property
+    def NominalBarDiameter(self)-> float:
+        """<attribute NominalBarDiameter?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("NominalBarDiameter")
+
+    @NominalBarDiameter.setter
+    def NominalBarDiameter(self, value: float):
+        return self._set_attribute("NominalBarDiameter", value)
+
+    @property
+    def BarCount(self)-> float:
+        """<attribute BarCount?: <type IfcCountMeasure: <number>>>"""
+        return self._get_attribute("BarCount")
+
+    @BarCount.setter
+    def BarCount(self, value: float):
+        return self._set_attribute("BarCount", value)
@@ -0,0 +1,26 @@
+from .ifcpredefinedpropertyset import IfcPreDefinedPropertySet
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcsectionreinforcementproperties import IfcSectionReinforcementProperties
+
+class IfcReinforcementDefinitionProperties(IfcPreDefinedPropertySet):
+    """Wrapper class for IfcReinforcementDefinitionProperties."""
+
+    @property
+    def DefinitionType(self)-> str:
+        """<attribute DefinitionType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("DefinitionType")
+
+    @DefinitionType.setter
+    def DefinitionType(self, value: str):
+        return self._set_attribute("DefinitionType", value)
+
+    @property
+    def ReinforcementSectionDefinitions(self)-> list["IfcSectionReinforcementProperties"]:
+        """<attribute ReinforcementSectionDefinitions: <list [1:?] of <entity IfcSectionReinforcementProperties>>>"""
+        return self._get_attribute("ReinforcementSectionDefinitions")
+
+    @ReinforcementSectionDefinitions.setter
+    def ReinforcementSectionDefinitions(self, value: list["IfcSectionReinforcementProperties"]):
+        return self._set_attribute("ReinforcementSectionDefinitions", value)
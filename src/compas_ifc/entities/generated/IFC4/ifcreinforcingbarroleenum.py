@@ -0,0 +1,2 @@
+class IfcReinforcingBarRoleEnum(str):
+    items = ['MAIN', 'SHEAR', 'LIGATURE', 'STUD', 'PUNCHING', 'EDGE', 'RING', 'ANCHORING', 'USERDEFINED', 'NOTDEFINED']
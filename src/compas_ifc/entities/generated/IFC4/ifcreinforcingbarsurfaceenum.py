@@ -0,0 +1,2 @@
+class IfcReinforcingBarSurfaceEnum(str):
+    items = ['PLAIN', 'TEXTURED']
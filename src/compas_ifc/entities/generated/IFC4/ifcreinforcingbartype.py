@@ -0,0 +1,73 @@
+from .ifcreinforcingelementtype import IfcReinforcingElementType
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcreinforcingbarsurfaceenum import IfcReinforcingBarSurfaceEnum
+    from .ifcreinforcingbartypeenum import IfcReinforcingBarTypeEnum
+
+class IfcReinforcingBarType(IfcReinforcingElementType):
+    """Wrapper class for IfcReinforcingBarType."""
+
+    @property
+    def PredefinedType(self)-> "IfcReinforcingBarTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcReinforcingBarTypeEnum: (ANCHORING, EDGE, LIGATURE, MAIN, PUNCHING, RING, SHEAR, STUD, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcReinforcingBarTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def NominalDiameter(self)-> float:
+        """<attribute NominalDiameter?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("NominalDiameter")
+
+    @NominalDiameter.setter
+    def NominalDiameter(self, value: float):
+        return self._set_attribute("NominalDiameter", value)
+
+    @property
+    def CrossSectionArea(self)-> float:
+        """<attribute CrossSectionArea?: <type IfcAreaMeasure: <real>>>"""
+        return self._get_attribute("CrossSectionArea")
+
+    @CrossSectionArea.setter
+    def CrossSectionArea(self, value: float):
+        return self._set_attribute("CrossSectionArea", value)
+
+    @property
+    def BarLength(self)-> float:
+        """<attribute BarLength?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("BarLength")
+
+    @BarLength.setter
+    def BarLength(self, value: float):
+        return self._set_attribute("BarLength", value)
+
+    @property
+    def BarSurface(self)-> "IfcReinforcingBarSurfaceEnum":
+        """<attribute BarSurface?: <enumeration IfcReinforcingBarSurfaceEnum: (PLAIN, TEXTURED)>>"""
+        return self._get_attribute("BarSurface")
+
+    @BarSurface.setter
+    def BarSurface(self, value: "IfcReinforcingBarSurfaceEnum"):
+        return self._set_attribute("BarSurface", value)
+
+    @property
+    def BendingShapeCode(self)-> str:
+        """<attribute BendingShapeCode?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("BendingShapeCode")
+
+    @BendingShapeCode.setter
+    def BendingShapeCode(self, value: str):
+        return self._set_attribute("BendingShapeCode", value)
+
+    @property
+    def BendingParameters(self)-> list[Union[float]]:
+        """<attribute BendingParameters?: <list [1:?] of <select IfcBendingParameterSelect: (<type IfcLengthMeasure: <real>> | <type IfcPlaneAngleMeasure: <real>>)>>>"""
+        return self._get_attribute("BendingParameters")
+
+    @BendingParameters.setter
+    def BendingParameters(self, value: list[Union[float]]):
+        return self._set_attribute("BendingParameters", value)
@@ -0,0 +1,2 @@
+class IfcReinforcingBarTypeEnum(str):
+    items = ['ANCHORING', 'EDGE', 'LIGATURE', 'MAIN', 'PUNCHING', 'RING', 'SHEAR', 'STUD', 'USERDEFINED', 'NOTDEFINED']
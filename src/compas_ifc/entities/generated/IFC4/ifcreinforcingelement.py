@@ -0,0 +1,14 @@
+from .ifcelementcomponent import IfcElementComponent
+
+
+class IfcReinforcingElement(IfcElementComponent):
+    """Wrapper class for IfcReinforcingElement."""
+
+    @property
+    def SteelGrade(self)-> str:
+        """<attribute SteelGrade?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("SteelGrade")
+
+    @SteelGrade.setter
+    def SteelGrade(self, value: str):
+        return self._set_attribute("SteelGrade", value)
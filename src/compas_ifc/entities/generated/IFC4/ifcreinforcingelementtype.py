@@ -0,0 +1,5 @@
+from .ifcelementcomponenttype import IfcElementComponentType
+
+
+class IfcReinforcingElementType(IfcElementComponentType):
+    """Wrapper class for IfcReinforcingElementType."""
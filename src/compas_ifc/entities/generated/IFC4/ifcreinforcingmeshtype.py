@@ -0,0 +1,108 @@
+from .ifcreinforcingelementtype import IfcReinforcingElementType
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcreinforcingmeshtypeenum import IfcReinforcingMeshTypeEnum
+
+class IfcReinforcingMeshType(IfcReinforcingElementType):
+    """Wrapper class for IfcReinforcingMeshType."""
+
+    @property
+    def PredefinedType(self)-> "IfcReinforcingMeshTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcReinforcingMeshTypeEnum: (USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcReinforcingMeshTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def MeshLength(self)-> float:
+        """<attribute MeshLength?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("MeshLength")
+
+    @MeshLength.setter
+    def MeshLength(self, value: float):
+        return self._set_attribute("MeshLength", value)
+
+    @property
+    def MeshWidth(self)-> float:
+        """<attribute MeshWidth?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("MeshWidth")
+
+    @MeshWidth.setter
+    def MeshWidth(self, value: float):
+        return self._set_attribute("MeshWidth", value)
+
+    @property
+    def LongitudinalBarNominalDiameter(self)-> float:
+        """<attribute LongitudinalBarNominalDiameter?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("LongitudinalBarNominalDiameter")
+
+    @LongitudinalBarNominalDiameter.setter
+    def LongitudinalBarNominalDiameter(self, value: float):
+        return self._set_attribute("LongitudinalBarNominalDiameter", value)
+
+    @property
+    def TransverseBarNominalDiameter(self)-> float:
+        """<attribute TransverseBarNominalDiameter?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("TransverseBarNominalDiameter")
+
+    @TransverseBarNominalDiameter.setter
+    def TransverseBarNominalDiameter(self, value: float):
+        return self._set_attribute("TransverseBarNominalDiameter", value)
+
+    @property
+    def LongitudinalBarCrossSectionArea(self)-> float:
+        """<attribute LongitudinalBarCrossSectionArea?: <type IfcAreaMeasure: <real>>>"""
+        return self._get_attribute("LongitudinalBarCrossSectionArea")
+
+    @LongitudinalBarCrossSectionArea.setter
+    def LongitudinalBarCrossSectionArea(self, value: float):
+        return self._set_attribute("LongitudinalBarCrossSectionArea", value)
+
+    @property
+    def TransverseBarCrossSectionArea(self)-> float:
+        """<attribute TransverseBarCrossSectionArea?: <type IfcAreaMeasure: <real>>>"""
+        return self._get_attribute("TransverseBarCrossSectionArea")
+
+    @TransverseBarCrossSectionArea.setter
+    def TransverseBarCrossSectionArea(self, value: float):
+        return self._set_attribute("TransverseBarCrossSectionArea", value)
+
+    @property
+    def LongitudinalBarSpacing(self)-> float:
+        """<attribute LongitudinalBarSpacing?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("LongitudinalBarSpacing")
+
+    @LongitudinalBarSpacing.setter
+    def LongitudinalBarSpacing(self, value: float):
+        return self._set_attribute("LongitudinalBarSpacing", value)
+
+    @property
+    def TransverseBarSpacing(self)-> float:
+        """<attribute TransverseBarSpacing?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("TransverseBarSpacing")
+
+    @TransverseBarSpacing.setter
+    def TransverseBarSpacing(self, value: float):
+        return self._set_attribute("TransverseBarSpacing", value)
+
+    @property
+    def BendingShapeCode(self)-> str:
+        """<attribute BendingShapeCode?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("BendingShapeCode")
+
+    @BendingShapeCode.setter
+    def BendingShapeCode(self, value: str):
+        return self._set_attribute("BendingShapeCode", value)
+
+    @property
+    def BendingParameters(self)-> list[Union[float]]:
+        """<attribute BendingParameters?: <list [1:?] of <select IfcBendingParameterSelect: (<type IfcLengthMeasure: <real>> | <type IfcPlaneAngleMeasure: <real>>)>>>"""
+        return self._get_attribute("BendingParameters")
+
+    @BendingParameters.setter
+    def BendingParameters(self, value: list[Union[float]]):
+        return self._set_attribute("BendingParameters", value)
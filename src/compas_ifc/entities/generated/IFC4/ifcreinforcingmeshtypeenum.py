@@ -0,0 +1,2 @@
+class IfcReinforcingMeshTypeEnum(str):
+    items = ['USERDEFINED', 'NOTDEFINED']
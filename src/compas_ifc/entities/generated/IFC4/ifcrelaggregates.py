@@ -0,0 +1,26 @@
+from .ifcreldecomposes import IfcRelDecomposes
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcobjectdefinition import IfcObjectDefinition
+
+class IfcRelAggregates(IfcRelDecomposes):
+    """Wrapper class for IfcRelAggregates."""
+
+    @property
+    def RelatingObject(self)-> "IfcObjectDefinition":
+        """<attribute RelatingObject: <entity IfcObjectDefinition>>"""
+        return self._get_attribute("RelatingObject")
+
+    @RelatingObject.setter
+    def RelatingObject(self, value: "IfcObjectDefinition"):
+        return self._set_attribute("RelatingObject", value)
+
+    @property
+    def RelatedObjects(self)-> list["IfcObjectDefinition"]:
+        """<attribute RelatedObjects: <set [1:?] of <entity IfcObjectDefinition>>>"""
+        return self._get_attribute("RelatedObjects")
+
+    @RelatedObjects.setter
+    def RelatedObjects(self, value: list["IfcObjectDefinition"]):
+        return self._set_attribute("RelatedObjects", value)
@@ -0,0 +1,17 @@
+from .ifcrelassigns import IfcRelAssigns
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccontrol import IfcControl
+
+class IfcRelAssignsToControl(IfcRelAssigns):
+    """Wrapper class for IfcRelAssignsToControl."""
+
+    @property
+    def RelatingControl(self)-> "IfcControl":
+        """<attribute RelatingControl: <entity IfcControl>>"""
+        return self._get_attribute("RelatingControl")
+
+    @RelatingControl.setter
+    def RelatingControl(self, value: "IfcControl"):
+        return self._set_attribute("RelatingControl", value)
@@ -0,0 +1,14 @@
+from .ifcrelassignstogroup import IfcRelAssignsToGroup
+
+
+class IfcRelAssignsToGroupByFactor(IfcRelAssignsToGroup):
+    """Wrapper class for IfcRelAssignsToGroupByFactor."""
+
+    @property
+    def Factor(self)-> float:
+        """<attribute Factor: <type IfcRatioMeasure: <real>>>"""
+        return self._get_attribute("Factor")
+
+    @Factor.setter
+    def Factor(self, value: float):
+        return self._set_attribute("Factor", value)
@@ -0,0 +1,29 @@
+from .ifcrelassigns import IfcRelAssigns
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmeasurewithunit import IfcMeasureWithUnit
+    from .ifcprocess import IfcProcess
+    from .ifctypeprocess import IfcTypeProcess
+
+class IfcRelAssignsToProcess(IfcRelAssigns):
+    """Wrapper class for IfcRelAssignsToProcess."""
+
+    @property
+    def RelatingProcess(self)-> Union["IfcTypeProcess", "IfcProcess"]:
+        """<attribute RelatingProcess: <select IfcProcessSelect: (<entity IfcProcess> | <entity IfcTypeProcess>)>>"""
+        return self._get_attribute("RelatingProcess")
+
+    @RelatingProcess.setter
+    def RelatingProcess(self, value: Union["IfcTypeProcess", "IfcProcess"]):
+        return self._set_attribute("RelatingProcess", value)
+
+    @property
+    def QuantityInProcess(self)-> "IfcMeasureWithUnit":
+        """<attribute QuantityInProcess?: <entity IfcMeasureWithUnit>>"""
+        return self._get_attribute("QuantityInProcess")
+
+    @QuantityInProcess.setter
+    def QuantityInProcess(self, value: "IfcMeasureWithUnit"):
+        return self._set_attribute("QuantityInProcess", value)
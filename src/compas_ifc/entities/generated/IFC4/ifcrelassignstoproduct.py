@@ -0,0 +1,19 @@
+from .ifcrelassigns import IfcRelAssigns
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcproduct import IfcProduct
+    from .ifctypeproduct import IfcTypeProduct
+
+class IfcRelAssignsToProduct(IfcRelAssigns):
+    """Wrapper class for IfcRelAssignsToProduct."""
+
+    @property
+    def RelatingProduct(self)-> Union["IfcProduct", "IfcTypeProduct"]:
+        """<attribute RelatingProduct: <select IfcProductSelect: (<entity IfcProduct> | <entity IfcTypeProduct>)>>"""
+        return self._get_attribute("RelatingProduct")
+
+    @RelatingProduct.setter
+    def RelatingProduct(self, value: Union["IfcProduct", "IfcTypeProduct"]):
+        return self._set_attribute("RelatingProduct", value)
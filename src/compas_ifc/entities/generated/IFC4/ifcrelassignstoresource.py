@@ -0,0 +1,19 @@
+from .ifcrelassigns import IfcRelAssigns
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcresource import IfcResource
+    from .ifctyperesource import IfcTypeResource
+
+class IfcRelAssignsToResource(IfcRelAssigns):
+    """Wrapper class for IfcRelAssignsToResource."""
+
+    @property
+    def RelatingResource(self)-> Union["IfcTypeResource", "IfcResource"]:
+        """<attribute RelatingResource: <select IfcResourceSelect: (<entity IfcResource> | <entity IfcTypeResource>)>>"""
+        return self._get_attribute("RelatingResource")
+
+    @RelatingResource.setter
+    def RelatingResource(self, value: Union["IfcTypeResource", "IfcResource"]):
+        return self._set_attribute("RelatingResource", value)
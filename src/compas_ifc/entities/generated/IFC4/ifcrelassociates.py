@@ -0,0 +1,19 @@
+from .ifcrelationship import IfcRelationship
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcobjectdefinition import IfcObjectDefinition
+    from .ifcpropertydefinition import IfcPropertyDefinition
+
+class IfcRelAssociates(IfcRelationship):
+    """Wrapper class for IfcRelAssociates."""
+
+    @property
+    def RelatedObjects(self)-> list[Union["IfcPropertyDefinition", "IfcObjectDefinition"]]:
+        """<attribute RelatedObjects: <set [1:?] of <select IfcDefinitionSelect: (<entity IfcObjectDefinition> | <entity IfcPropertyDefinition>)>>>"""
+        return self._get_attribute("RelatedObjects")
+
+    @RelatedObjects.setter
+    def RelatedObjects(self, value: list[Union["IfcPropertyDefinition", "IfcObjectDefinition"]]):
+        return self._set_attribute("RelatedObjects", value)
@@ -0,0 +1,19 @@
+from .ifcrelassociates import IfcRelAssociates
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcclassification import IfcClassification
+    from .ifcclassificationreference import IfcClassificationReference
+
+class IfcRelAssociatesClassification(IfcRelAssociates):
+    """Wrapper class for IfcRelAssociatesClassification."""
+
+    @property
+    def RelatingClassification(self)-> Union["IfcClassificationReference", "IfcClassification"]:
+        """<attribute RelatingClassification: <select IfcClassificationSelect: (<entity IfcClassification> | <entity IfcClassificationReference>)>>"""
+        return self._get_attribute("RelatingClassification")
+
+    @RelatingClassification.setter
+    def RelatingClassification(self, value: Union["IfcClassificationReference", "IfcClassification"]):
+        return self._set_attribute("RelatingClassification", value)
@@ -0,0 +1,20 @@
+from .ifcrelassociates import IfcRelAssociates
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcmaterialdefinition import IfcMaterialDefinition
+    from .ifcmateriallist import IfcMaterialList
+    from .ifcmaterialusagedefinition import IfcMaterialUsageDefinition
+
+class IfcRelAssociatesMaterial(IfcRelAssociates):
+    """Wrapper class for IfcRelAssociatesMaterial."""
+
+    @property
+    def RelatingMaterial(self)-> Union["IfcMaterialList", "IfcMaterialDefinition", "IfcMaterialUsageDefinition"]:
+        """<attribute RelatingMaterial: <select IfcMaterialSelect: (<entity IfcMaterialDefinition> | <entity IfcMaterialList> | <entity IfcMaterialUsageDefinition>)>>"""
+        return self._get_attribute("RelatingMaterial")
+
+    @RelatingMaterial.setter
+    def RelatingMaterial(self, value: Union["IfcMaterialList", "IfcMaterialDefinition", "IfcMaterialUsageDefinition"]):
+        return self._set_attribute("RelatingMaterial", value)
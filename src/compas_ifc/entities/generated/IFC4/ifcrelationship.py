@@ -0,0 +1,5 @@
+from .ifcroot import IfcRoot
+
+
+class IfcRelationship(IfcRoot):
+    """Wrapper class for IfcRelationship."""
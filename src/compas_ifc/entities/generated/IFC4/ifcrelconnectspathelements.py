@@ -0,0 +1,44 @@
+from .ifcrelconnectselements import IfcRelConnectsElements
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcconnectiontypeenum import IfcConnectionTypeEnum
+
+class IfcRelConnectsPathElements(IfcRelConnectsElements):
+    """Wrapper class for IfcRelConnectsPathElements."""
+
+    @property
+    def RelatingPriorities(self)-> list[int]:
+        """<attribute RelatingPriorities: <list [0:?] of <type IfcInteger: <integer>>>>"""
+        return self._get_attribute("RelatingPriorities")
+
+    @RelatingPriorities.setter
+    def RelatingPriorities(self, value: list[int]):
+        return self._set_attribute("RelatingPriorities", value)
+
+    @property
+    def RelatedPriorities(self)-> list[int]:
+        """<attribute RelatedPriorities: <list [0:?] of <type IfcInteger: <integer>>>>"""
+        return self._get_attribute("RelatedPriorities")
+
+    @RelatedPriorities.setter
+    def RelatedPriorities(self, value: list[int]):
+        return self._set_attribute("RelatedPriorities", value)
+
+    @property
+    def RelatedConnectionType(self)-> "IfcConnectionTypeEnum":
+        """<attribute RelatedConnectionType: <enumeration IfcConnectionTypeEnum: (ATPATH, ATSTART, ATEND, NOTDEFINED)>>"""
+        return self._get_attribute("RelatedConnectionType")
+
+    @RelatedConnectionType.setter
+    def RelatedConnectionType(self, value: "IfcConnectionTypeEnum"):
+        return self._set_attribute("RelatedConnectionType", value)
+
+    @property
+    def RelatingConnectionType(self)-> "IfcConnectionTypeEnum":
+        """<attribute RelatingConnectionType: <enumeration IfcConnectionTypeEnum: (ATPATH, ATSTART, ATEND, NOTDEFINED)>>"""
+        return self._get_attribute("RelatingConnectionType")
+
+    @RelatingConnectionType.setter
+    def RelatingConnectionType(self, value: "IfcConnectionTypeEnum"):
+        return self._set_attribute("RelatingConnectionType", value)
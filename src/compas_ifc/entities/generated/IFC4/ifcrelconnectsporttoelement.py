@@ -0,0 +1,27 @@
+from .ifcrelconnects import IfcRelConnects
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdistributionelement import IfcDistributionElement
+    from .ifcport import IfcPort
+
+class IfcRelConnectsPortToElement(IfcRelConnects):
+    """Wrapper class for IfcRelConnectsPortToElement."""
+
+    @property
+    def RelatingPort(self)-> "IfcPort":
+        """<attribute RelatingPort: <entity IfcPort>>"""
+        return self._get_attribute("RelatingPort")
+
+    @RelatingPort.setter
+    def RelatingPort(self, value: "IfcPort"):
+        return self._set_attribute("RelatingPort", value)
+
+    @property
+    def RelatedElement(self)-> "IfcDistributionElement":
+        """<attribute RelatedElement: <entity IfcDistributionElement>>"""
+        return self._get_attribute("RelatedElement")
+
+    @RelatedElement.setter
+    def RelatedElement(self, value: "IfcDistributionElement"):
+        return self._set_attribute("RelatedElement", value)
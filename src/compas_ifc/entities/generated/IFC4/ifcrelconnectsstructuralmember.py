@@ -0,0 +1,66 @@
+from .ifcrelconnects import IfcRelConnects
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaxis2placement3d import IfcAxis2Placement3D
+    from .ifcboundarycondition import IfcBoundaryCondition
+    from .ifcstructuralconnection import IfcStructuralConnection
+    from .ifcstructuralconnectioncondition import IfcStructuralConnectionCondition
+    from .ifcstructuralmember import IfcStructuralMember
+
+class IfcRelConnectsStructuralMember(IfcRelConnects):
+    """Wrapper class for IfcRelConnectsStructuralMember."""
+
+    @property
+    def RelatingStructuralMember(self)-> "IfcStructuralMember":
+        """<attribute RelatingStructuralMember: <entity IfcStructuralMember>>"""
+        return self._get_attribute("RelatingStructuralMember")
+
+    @RelatingStructuralMember.setter
+    def RelatingStructuralMember(self, value: "IfcStructuralMember"):
+        return self._set_attribute("RelatingStructuralMember", value)
+
+    @property
+    def RelatedStructuralConnection(self)-> "IfcStructuralConnection":
+        """<attribute RelatedStructuralConnection: <entity IfcStructuralConnection>>"""
+        return self._get_attribute("RelatedStructuralConnection")
+
+    @RelatedStructuralConnection.setter
+    def RelatedStructuralConnection(self, value: "IfcStructuralConnection"):
+        return self._set_attribute("RelatedStructuralConnection", value)
+
+    @property
+    def AppliedCondition(self)-> "IfcBoundaryCondition":
+        """<attribute AppliedCondition?: <entity IfcBoundaryCondition>>"""
+        return self._get_attribute("AppliedCondition")
+
+    @AppliedCondition.setter
+    def AppliedCondition(self, value: "IfcBoundaryCondition"):
+        return self._set_attribute("AppliedCondition", value)
+
+    @property
+    def AdditionalConditions(self)-> "IfcStructuralConnectionCondition":
+        """<attribute AdditionalConditions?: <entity IfcStructuralConnectionCondition>>"""
+        return self._get_attribute("AdditionalConditions")
+
+    @AdditionalConditions.setter
+    def AdditionalConditions(self, value: "IfcStructuralConnectionCondition"):
+        return self._set_attribute("AdditionalConditions", value)
+
+    @property
+    def SupportedLength(self)-> float:
+        """<attribute SupportedLength?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("SupportedLength")
+
+    @SupportedLength.setter
+    def SupportedLength(self, value: float):
+        return self._set_attribute("SupportedLength", value)
+
+    @property
+    def ConditionCoordinateSystem(self)-> "IfcAxis2Placement3D":
+        """<attribute ConditionCoordinateSystem?: <entity IfcAxis2Placement3D>>"""
+        return self._get_attribute("ConditionCoordinateSystem")
+
+    @ConditionCoordinateSystem.setter
+    def ConditionCoordinateSystem(self, value: "IfcAxis2Placement3D"):
+        return self._set_attribute("ConditionCoordinateSystem", value)
@@ -0,0 +1,26 @@
+from .ifcrelconnectselements import IfcRelConnectsElements
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelement import IfcElement
+
+class IfcRelConnectsWithRealizingElements(IfcRelConnectsElements):
+    """Wrapper class for IfcRelConnectsWithRealizingElements."""
+
+    @property
+    def RealizingElements(self)-> list["IfcElement"]:
+        """<attribute RealizingElements: <set [1:?] of <entity IfcElement>>>"""
+        return self._get_attribute("RealizingElements")
+
+    @RealizingElements.setter
+    def RealizingElements(self, value: list["IfcElement"]):
+        return self._set_attribute("RealizingElements", value)
+
+    @property
+    def ConnectionType(self)-> str:
+        """<attribute ConnectionType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ConnectionType")
+
+    @ConnectionType.setter
+    def ConnectionType(self, value: str):
+        return self._set_attribute("ConnectionType", value)
@@ -0,0 +1,27 @@
+from .ifcrelconnects import IfcRelConnects
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcproduct import IfcProduct
+    from .ifcspatialelement import IfcSpatialElement
+
+class IfcRelContainedInSpatialStructure(IfcRelConnects):
+    """Wrapper class for IfcRelContainedInSpatialStructure."""
+
+    @property
+    def RelatedElements(self)-> list["IfcProduct"]:
+        """<attribute RelatedElements: <set [1:?] of <entity IfcProduct>>>"""
+        return self._get_attribute("RelatedElements")
+
+    @RelatedElements.setter
+    def RelatedElements(self, value: list["IfcProduct"]):
+        return self._set_attribute("RelatedElements", value)
+
+    @property
+    def RelatingStructure(self)-> "IfcSpatialElement":
+        """<attribute RelatingStructure: <entity IfcSpatialElement>>"""
+        return self._get_attribute("RelatingStructure")
+
+    @RelatingStructure.setter
+    def RelatingStructure(self, value: "IfcSpatialElement"):
+        return self._set_attribute("RelatingStructure", value)
@@ -0,0 +1,27 @@
+from .ifcrelconnects import IfcRelConnects
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccovering import IfcCovering
+    from .ifcspace import IfcSpace
+
+class IfcRelCoversSpaces(IfcRelConnects):
+    """Wrapper class for IfcRelCoversSpaces."""
+
+    @property
+    def RelatingSpace(self)-> "IfcSpace":
+        """<attribute RelatingSpace: <entity IfcSpace>>"""
+        return self._get_attribute("RelatingSpace")
+
+    @RelatingSpace.setter
+    def RelatingSpace(self, value: "IfcSpace"):
+        return self._set_attribute("RelatingSpace", value)
+
+    @property
+    def RelatedCoverings(self)-> list["IfcCovering"]:
+        """<attribute RelatedCoverings: <set [1:?] of <entity IfcCovering>>>"""
+        return self._get_attribute("RelatedCoverings")
+
+    @RelatedCoverings.setter
+    def RelatedCoverings(self, value: list["IfcCovering"]):
+        return self._set_attribute("RelatedCoverings", value)
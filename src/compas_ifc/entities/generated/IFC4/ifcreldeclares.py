@@ -0,0 +1,29 @@
+from .ifcrelationship import IfcRelationship
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccontext import IfcContext
+    from .ifcobjectdefinition import IfcObjectDefinition
+    from .ifcpropertydefinition import IfcPropertyDefinition
+
+class IfcRelDeclares(IfcRelationship):
+    """Wrapper class for IfcRelDeclares."""
+
+    @property
+    def RelatingContext(self)-> "IfcContext":
+        """<attribute RelatingContext: <entity IfcContext>>"""
+        return self._get_attribute("RelatingContext")
+
+    @RelatingContext.setter
+    def RelatingContext(self, value: "IfcContext"):
+        return self._set_attribute("RelatingContext", value)
+
+    @property
+    def RelatedDefinitions(self)-> list[Union["IfcPropertyDefinition", "IfcObjectDefinition"]]:
+        """<attribute RelatedDefinitions: <set [1:?] of <select IfcDefinitionSelect: (<entity IfcObjectDefinition> | <entity IfcPropertyDefinition>)>>>"""
+        return self._get_attribute("RelatedDefinitions")
+
+    @RelatedDefinitions.setter
+    def RelatedDefinitions(self, value: list[Union["IfcPropertyDefinition", "IfcObjectDefinition"]]):
+        return self._set_attribute("RelatedDefinitions", value)
@@ -0,0 +1,5 @@
+from .ifcrelationship import IfcRelationship
+
+
+class IfcRelDecomposes(IfcRelationship):
+    """Wrapper class for IfcRelDecomposes."""
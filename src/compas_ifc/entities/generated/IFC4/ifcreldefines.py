@@ -0,0 +1,5 @@
+from .ifcrelationship import IfcRelationship
+
+
+class IfcRelDefines(IfcRelationship):
+    """Wrapper class for IfcRelDefines."""
@@ -0,0 +1,26 @@
+from .ifcreldefines import IfcRelDefines
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcobject import IfcObject
+
+class IfcRelDefinesByObject(IfcRelDefines):
+    """Wrapper class for IfcRelDefinesByObject."""
+
+    @property
+    def RelatedObjects(self)-> list["IfcObject"]:
+        """<attribute RelatedObjects: <set [1:?] of <entity IfcObject>>>"""
+        return self._get_attribute("RelatedObjects")
+
+    @RelatedObjects.setter
+    def RelatedObjects(self, value: list["IfcObject"]):
+        return self._set_attribute("RelatedObjects", value)
+
+    @property
+    def RelatingObject(self)-> "IfcObject":
+        """<attribute RelatingObject: <entity IfcObject>>"""
+        return self._get_attribute("RelatingObject")
+
+    @RelatingObject.setter
+    def RelatingObject(self, value: "IfcObject"):
+        return self._set_attribute("RelatingObject", value)
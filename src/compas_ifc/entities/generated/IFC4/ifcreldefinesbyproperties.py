@@ -0,0 +1,28 @@
+from .ifcreldefines import IfcRelDefines
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcobjectdefinition import IfcObjectDefinition
+    from .ifcpropertysetdefinition import IfcPropertySetDefinition
+
+class IfcRelDefinesByProperties(IfcRelDefines):
+    """Wrapper class for IfcRelDefinesByProperties."""
+
+    @property
+    def RelatedObjects(self)-> list["IfcObjectDefinition"]:
+        """<attribute RelatedObjects: <set [1:?] of <entity IfcObjectDefinition>>>"""
+        return self._get_attribute("RelatedObjects")
+
+    @RelatedObjects.setter
+    def RelatedObjects(self, value: list["IfcObjectDefinition"]):
+        return self._set_attribute("RelatedObjects", value)
+
+    @property
+    def RelatingPropertyDefinition(self)-> Union[list, "IfcPropertySetDefinition"]:
+        """<attribute RelatingPropertyDefinition: <select IfcPropertySetDefinitionSelect: (<entity IfcPropertySetDefinition> | <type IfcPropertySetDefinitionSet: <set [1:?] of <entity IfcPropertySetDefinition>>>)>>"""
+        return self._get_attribute("RelatingPropertyDefinition")
+
+    @RelatingPropertyDefinition.setter
+    def RelatingPropertyDefinition(self, value: Union[list, "IfcPropertySetDefinition"]):
+        return self._set_attribute("RelatingPropertyDefinition", value)
@@ -0,0 +1,27 @@
+from .ifcreldefines import IfcRelDefines
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpropertysetdefinition import IfcPropertySetDefinition
+    from .ifcpropertysettemplate import IfcPropertySetTemplate
+
+class IfcRelDefinesByTemplate(IfcRelDefines):
+    """Wrapper class for IfcRelDefinesByTemplate."""
+
+    @property
+    def RelatedPropertySets(self)-> list["IfcPropertySetDefinition"]:
+        """<attribute RelatedPropertySets: <set [1:?] of <entity IfcPropertySetDefinition>>>"""
+        return self._get_attribute("RelatedPropertySets")
+
+    @RelatedPropertySets.setter
+    def RelatedPropertySets(self, value: list["IfcPropertySetDefinition"]):
+        return self._set_attribute("RelatedPropertySets", value)
+
+    @property
+    def RelatingTemplate(self)-> "IfcPropertySetTemplate":
+        """<attribute RelatingTemplate: <entity IfcPropertySetTemplate>>"""
+        return self._get_attribute("RelatingTemplate")
+
+    @RelatingTemplate.setter
+    def RelatingTemplate(self, value: "IfcPropertySetTemplate"):
+        return self._set_attribute("RelatingTemplate", value)
@@ -0,0 +1,27 @@
+from .ifcreldefines import IfcRelDefines
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcobject import IfcObject
+    from .ifctypeobject import IfcTypeObject
+
+class IfcRelDefinesByType(IfcRelDefines):
+    """Wrapper class for IfcRelDefinesByType."""
+
+    @property
+    def RelatedObjects(self)-> list["IfcObject"]:
+        """<attribute RelatedObjects: <set [1:?] of <entity IfcObject>>>"""
+        return self._get_attribute("RelatedObjects")
+
+    @RelatedObjects.setter
+    def RelatedObjects(self, value: list["IfcObject"]):
+        return self._set_attribute("RelatedObjects", value)
+
+    @property
+    def RelatingType(self)-> "IfcTypeObject":
+        """<attribute RelatingType: <entity IfcTypeObject>>"""
+        return self._get_attribute("RelatingType")
+
+    @RelatingType.setter
+    def RelatingType(self, value: "IfcTypeObject"):
+        return self._set_attribute("RelatingType", value)
@@ -0,0 +1,54 @@
+from .ifcrelconnects import IfcRelConnects
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcconnectiongeometry import IfcConnectionGeometry
+    from .ifcelement import IfcElement
+
+class IfcRelInterferesElements(IfcRelConnects):
+    """Wrapper class for IfcRelInterferesElements."""
+
+    @property
+    def RelatingElement(self)-> "IfcElement":
+        """<attribute RelatingElement: <entity IfcElement>>"""
+        return self._get_attribute("RelatingElement")
+
+    @RelatingElement.setter
+    def RelatingElement(self, value: "IfcElement"):
+        return self._set_attribute("RelatingElement", value)
+
+    @property
+    def RelatedElement(self)-> "IfcElement":
+        """<attribute RelatedElement: <entity IfcElement>>"""
+        return self._get_attribute("RelatedElement")
+
+    @RelatedElement.setter
+    def RelatedElement(self, value: "IfcElement"):
+        return self._set_attribute("RelatedElement", value)
+
+    @property
+    def InterferenceGeometry(self)-> "IfcConnectionGeometry":
+        """<attribute InterferenceGeometry?: <entity IfcConnectionGeometry>>"""
+        return self._get_attribute("InterferenceGeometry")
+
+    @InterferenceGeometry.setter
+    def InterferenceGeometry(self, value: "IfcConnectionGeometry"):
+        return self._set_attribute("InterferenceGeometry", value)
+
+    @property
+    def InterferenceType(self)-> str:
+        """<attribute InterferenceType?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("InterferenceType")
+
+    @InterferenceType.setter
+    def InterferenceType(self, value: str):
+        return self._set_attribute("InterferenceType", value)
+
+    @property
+    def ImpliedOrder(self)-> bool:
+        """<attribute ImpliedOrder: <logical>>"""
+        return self._get_attribute("ImpliedOrder")
+
+    @ImpliedOrder.setter
+    def ImpliedOrder(self, value: bool):
+        return self._set_attribute("ImpliedOrder", value)
@@ -0,0 +1,55 @@
+from .ifcrelconnects import IfcRelConnects
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifclagtime import IfcLagTime
+    from .ifcprocess import IfcProcess
+    from .ifcsequenceenum import IfcSequenceEnum
+
+class IfcRelSequence(IfcRelConnects):
+    """Wrapper class for IfcRelSequence."""
+
+    @property
+    def RelatingProcess(self)-> "IfcProcess":
+        """<attribute RelatingProcess: <entity IfcProcess>>"""
+        return self._get_attribute("RelatingProcess")
+
+    @RelatingProcess.setter
+    def RelatingProcess(self, value: "IfcProcess"):
+        return self._set_attribute("RelatingProcess", value)
+
+    @property
+    def RelatedProcess(self)-> "IfcProcess":
+        """<attribute RelatedProcess: <entity IfcProcess>>"""
+        return self._get_attribute("RelatedProcess")
+
+    @RelatedProcess.setter
+    def RelatedProcess(self, value: "IfcProcess"):
+        return self._set_attribute("RelatedProcess", value)
+
+    @property
+    def TimeLag(self)-> "IfcLagTime":
+        """<attribute TimeLag?: <entity IfcLagTime>>"""
+        return self._get_attribute("TimeLag")
+
+    @TimeLag.setter
+    def TimeLag(self, value: "IfcLagTime"):
+        return self._set_attribute("TimeLag", value)
+
+    @property
+    def SequenceType(self)-> "IfcSequenceEnum":
+        """<attribute SequenceType?: <enumeration IfcSequenceEnum: (START_START, START_FINISH, FINISH_START, FINISH_FINISH, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("SequenceType")
+
+    @SequenceType.setter
+    def SequenceType(self, value: "IfcSequenceEnum"):
+        return self._set_attribute("SequenceType", value)
+
+    @property
+    def UserDefinedSequenceType(self)-> str:
+        """<attribute UserDefinedSequenceType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedSequenceType")
+
+    @UserDefinedSequenceType.setter
+    def UserDefinedSequenceType(self, value: str):
+        return self._set_attribute("UserDefinedSequenceType", value)
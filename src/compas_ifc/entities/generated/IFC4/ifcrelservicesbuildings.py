@@ -0,0 +1,27 @@
+from .ifcrelconnects import IfcRelConnects
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcspatialelement import IfcSpatialElement
+    from .ifcsystem import IfcSystem
+
+class IfcRelServicesBuildings(IfcRelConnects):
+    """Wrapper class for IfcRelServicesBuildings."""
+
+    @property
+    def RelatingSystem(self)-> "IfcSystem":
+        """<attribute RelatingSystem: <entity IfcSystem>>"""
+        return self._get_attribute("RelatingSystem")
+
+    @RelatingSystem.setter
+    def RelatingSystem(self, value: "IfcSystem"):
+        return self._set_attribute("RelatingSystem", value)
+
+    @property
+    def RelatedBuildings(self)-> list["IfcSpatialElement"]:
+        """<attribute RelatedBuildings: <set [1:?] of <entity IfcSpatialElement>>>"""
+        return self._get_attribute("RelatedBuildings")
+
+    @RelatedBuildings.setter
+    def RelatedBuildings(self, value: list["IfcSpatialElement"]):
+        return self._set_attribute("RelatedBuildings", value)
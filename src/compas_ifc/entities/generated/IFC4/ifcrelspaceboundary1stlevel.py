@@ -0,0 +1,21 @@
+from .ifcrelspaceboundary import IfcRelSpaceBoundary
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelspaceboundary1stlevel import IfcRelSpaceBoundary1stLevel
+
+class IfcRelSpaceBoundary1stLevel(IfcRelSpaceBoundary):
+    """Wrapper class for IfcRelSpaceBoundary1stLevel."""
+
+    @property
+    def ParentBoundary(self)-> "IfcRelSpaceBoundary1stLevel":
+        """<attribute ParentBoundary?: <entity IfcRelSpaceBoundary1stLevel>>"""
+        return self._get_attribute("ParentBoundary")
+
+    @ParentBoundary.setter
+    def ParentBoundary(self, value: "IfcRelSpaceBoundary1stLevel"):
+        return self._set_attribute("ParentBoundary", value)
+
+    def InnerBoundaries(self)-> list["IfcRelSpaceBoundary1stLevel"]:
+        """<inverse InnerBoundaries: set [0:?] of <entity IfcRelSpaceBoundary1stLevel> for <attribute ParentBoundary?: <entity IfcRelSpaceBoundary1stLevel>>>"""
+        return self._get_inverse_attribute("InnerBoundaries")
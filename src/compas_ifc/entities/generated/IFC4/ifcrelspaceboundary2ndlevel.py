@@ -0,0 +1,21 @@
+from .ifcrelspaceboundary1stlevel import IfcRelSpaceBoundary1stLevel
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelspaceboundary2ndlevel import IfcRelSpaceBoundary2ndLevel
+
+class IfcRelSpaceBoundary2ndLevel(IfcRelSpaceBoundary1stLevel):
+    """Wrapper class for IfcRelSpaceBoundary2ndLevel."""
+
+    @property
+    def CorrespondingBoundary(self)-> "IfcRelSpaceBoundary2ndLevel":
+        """<attribute CorrespondingBoundary?: <entity IfcRelSpaceBoundary2ndLevel>>"""
+        return self._get_attribute("CorrespondingBoundary")
+
+    @CorrespondingBoundary.setter
+    def CorrespondingBoundary(self, value: "IfcRelSpaceBoundary2ndLevel"):
+        return self._set_attribute("CorrespondingBoundary", value)
+
+    def Corresponds(self)-> list["IfcRelSpaceBoundary2ndLevel"]:
+        """<inverse Corresponds: set [0:1] of <entity IfcRelSpaceBoundary2ndLevel> for <attribute CorrespondingBoundary?: <entity IfcRelSpaceBoundary2ndLevel>>>"""
+        return self._get_inverse_attribute("Corresponds")
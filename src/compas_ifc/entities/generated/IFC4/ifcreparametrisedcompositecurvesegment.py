@@ -0,0 +1,14 @@
+from .ifccompositecurvesegment import IfcCompositeCurveSegment
+
+
+class IfcReparametrisedCompositeCurveSegment(IfcCompositeCurveSegment):
+    """Wrapper class for IfcReparametrisedCompositeCurveSegment."""
+
+    @property
+    def ParamLength(self)-> float:
+        """<attribute ParamLength: <type IfcParameterValue: <real>>>"""
+        return self._get_attribute("ParamLength")
+
+    @ParamLength.setter
+    def ParamLength(self, value: float):
+        return self._set_attribute("ParamLength", value)
@@ -0,0 +1,60 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpresentationlayerassignment import IfcPresentationLayerAssignment
+    from .ifcproductrepresentation import IfcProductRepresentation
+    from .ifcrepresentationcontext import IfcRepresentationContext
+    from .ifcrepresentationitem import IfcRepresentationItem
+    from .ifcrepresentationmap import IfcRepresentationMap
+
+class IfcRepresentation(Base):
+    """Wrapper class for IfcRepresentation."""
+
+    @property
+    def ContextOfItems(self)-> "IfcRepresentationContext":
+        """<attribute ContextOfItems: <entity IfcRepresentationContext>>"""
+        return self._get_attribute("ContextOfItems")
+
+    @ContextOfItems.setter
+    def ContextOfItems(self, value: "IfcRepresentationContext"):
+        return self._set_attribute("ContextOfItems", value)
+
+    @property
+    def RepresentationIdentifier(self)-> str:
+        """<attribute RepresentationIdentifier?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("RepresentationIdentifier")
+
+    @RepresentationIdentifier.setter
+    def RepresentationIdentifier(self, value: str):
+        return self._set_attribute("RepresentationIdentifier", value)
+
+    @property
+    def RepresentationType(self)-> str:
+        """<attribute RepresentationType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("RepresentationType")
+
+    @RepresentationType.setter
+    def RepresentationType(self, value: str):
+        return self._set_attribute("RepresentationType", value)
+
+    @property
+    def Items(self)-> list["IfcRepresentationItem"]:
+        """<attribute Items: <set [1:?] of <entity IfcRepresentationItem>>>"""
+        return self._get_attribute("Items")
+
+    @Items.setter
+    def Items(self, value: list["IfcRepresentationItem"]):
+        return self._set_attribute("Items", value)
+
+    def RepresentationMap(self)-> list["IfcRepresentationMap"]:
+        """<inverse RepresentationMap: set [0:1] of <entity IfcRepresentationMap> for <attribute MappedRepresentation: <entity IfcRepresentation>>>"""
+        return self._get_inverse_attribute("RepresentationMap")
+
+    def LayerAssignments(self)-> list["IfcPresentationLayerAssignment"]:
+        """<inverse LayerAssignments: set [0:?] of <entity IfcPresentationLayerAssignment> for <attribute AssignedItems: <set [1:?] of <select IfcLayeredItem: (<entity IfcRepresentation> | <entity IfcRepresentationItem>)>>>>"""
+        return self._get_inverse_attribute("LayerAssignments")
+
+    def OfProductRepresentation(self)-> list["IfcProductRepresentation"]:
+        """<inverse OfProductRepresentation: set [0:?] of <entity IfcProductRepresentation> for <attribute Representations: <list [1:?] of <entity IfcRepresentation>>>>"""
+        return self._get_inverse_attribute("OfProductRepresentation")
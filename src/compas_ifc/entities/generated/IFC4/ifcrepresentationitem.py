@@ -0,0 +1,17 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpresentationlayerassignment import IfcPresentationLayerAssignment
+    from .ifcstyleditem import IfcStyledItem
+
+class IfcRepresentationItem(Base):
+    """Wrapper class for IfcRepresentationItem."""
+
+    def LayerAssignment(self)-> list["IfcPresentationLayerAssignment"]:
+        """<inverse LayerAssignment: set [0:1] of <entity IfcPresentationLayerAssignment> for <attribute AssignedItems: <set [1:?] of <select IfcLayeredItem: (<entity IfcRepresentation> | <entity IfcRepresentationItem>)>>>>"""
+        return self._get_inverse_attribute("LayerAssignment")
+
+    def StyledByItem(self)-> list["IfcStyledItem"]:
+        """<inverse StyledByItem: set [0:1] of <entity IfcStyledItem> for <attribute Item?: <entity IfcRepresentationItem>>>"""
+        return self._get_inverse_attribute("StyledByItem")
@@ -0,0 +1,39 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaxis2placement2d import IfcAxis2Placement2D
+    from .ifcaxis2placement3d import IfcAxis2Placement3D
+    from .ifcmappeditem import IfcMappedItem
+    from .ifcrepresentation import IfcRepresentation
+    from .ifcshapeaspect import IfcShapeAspect
+
+class IfcRepresentationMap(Base):
+    """Wrapper class for IfcRepresentationMap."""
+
+    @property
+    def MappingOrigin(self)-> Union["IfcAxis2Placement3D", "IfcAxis2Placement2D"]:
+        """<attribute MappingOrigin: <select IfcAxis2Placement: (<entity IfcAxis2Placement2D> | <entity IfcAxis2Placement3D>)>>"""
+        return self._get_attribute("MappingOrigin")
+
+    @MappingOrigin.setter
+    def MappingOrigin(self, value: Union["IfcAxis2Placement3D", "IfcAxis2Placement2D"]):
+        return self._set_attribute("MappingOrigin", value)
+
+    @property
+    def MappedRepresentation(self)-> "IfcRepresentation":
+        """<attribute MappedRepresentation: <entity IfcRepresentation>>"""
+        return self._get_attribute("MappedRepresentation")
+
+    @MappedRepresentation.setter
+    def MappedRepresentation(self, value: "IfcRepresentation"):
+        return self._set_attribute("MappedRepresentation", value)
+
+    def HasShapeAspects(self)-> list["IfcShapeAspect"]:
+        """<inverse HasShapeAspects: set [0:?] of <entity IfcShapeAspect> for <attribute PartOfProductDefinitionShape?: <select IfcProductRepresentationSelect: (<entity IfcProductDefinitionShape> | <entity IfcRepresentationMap>)>>>"""
+        return self._get_inverse_attribute("HasShapeAspects")
+
+    def MapUsage(self)-> list["IfcMappedItem"]:
+        """<inverse MapUsage: set [0:?] of <entity IfcMappedItem> for <attribute MappingSource: <entity IfcRepresentationMap>>>"""
+        return self._get_inverse_attribute("MapUsage")
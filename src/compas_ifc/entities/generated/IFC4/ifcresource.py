@@ -0,0 +1,30 @@
+from .ifcobject import IfcObject
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelassignstoresource import IfcRelAssignsToResource
+
+class IfcResource(IfcObject):
+    """Wrapper class for IfcResource."""
+
+    @property
+    def Identification(self)-> str:
+        """<attribute Identification?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Identification")
+
+    @Identification.setter
+    def Identification(self, value: str):
+        return self._set_attribute("Identification", value)
+
+    @property
+    def LongDescription(self)-> str:
+        """<attribute LongDescription?: <type IfcText: <string>>>"""
+        return self._get_attribute("LongDescription")
+
+    @LongDescription.setter
+    def LongDescription(self, value: str):
+        return self._set_attribute("LongDescription", value)
+
+    def ResourceOf(self)-> list["IfcRelAssignsToResource"]:
+        """<inverse ResourceOf: set [0:?] of <entity IfcRelAssignsToResource> for <attribute RelatingResource: <select IfcResourceSelect: (<entity IfcResource> | <entity IfcTypeResource>)>>>"""
+        return self._get_inverse_attribute("ResourceOf")
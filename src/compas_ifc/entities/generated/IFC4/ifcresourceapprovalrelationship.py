@@ -0,0 +1,42 @@
+from .ifcresourcelevelrelationship import IfcResourceLevelRelationship
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcactorrole import IfcActorRole
+    from .ifcappliedvalue import IfcAppliedValue
+    from .ifcapproval import IfcApproval
+    from .ifcconstraint import IfcConstraint
+    from .ifccontextdependentunit import IfcContextDependentUnit
+    from .ifcconversionbasedunit import IfcConversionBasedUnit
+    from .ifcexternalinformation import IfcExternalInformation
+    from .ifcexternalreference import IfcExternalReference
+    from .ifcmaterialdefinition import IfcMaterialDefinition
+    from .ifcorganization import IfcOrganization
+    from .ifcperson import IfcPerson
+    from .ifcpersonandorganization import IfcPersonAndOrganization
+    from .ifcphysicalquantity import IfcPhysicalQuantity
+    from .ifcprofiledef import IfcProfileDef
+    from .ifcpropertyabstraction import IfcPropertyAbstraction
+    from .ifctimeseries import IfcTimeSeries
+
+class IfcResourceApprovalRelationship(IfcResourceLevelRelationship):
+    """Wrapper class for IfcResourceApprovalRelationship."""
+
+    @property
+    def RelatedResourceObjects(self)-> list[Union["IfcPropertyAbstraction", "IfcApproval", "IfcConversionBasedUnit", "IfcMaterialDefinition", "IfcConstraint", "IfcContextDependentUnit", "IfcPhysicalQuantity", "IfcTimeSeries", "IfcExternalInformation", "IfcActorRole", "IfcProfileDef", "IfcExternalReference", "IfcAppliedValue", "IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]]:
+        """<attribute RelatedResourceObjects: <set [1:?] of <select IfcResourceObjectSelect: (<entity IfcActorRole> | <entity IfcAppliedValue> | <entity IfcApproval> | <entity IfcConstraint> | <entity IfcContextDependentUnit> | <entity IfcConversionBasedUnit> | <entity IfcExternalInformation> | <entity IfcExternalReference> | <entity IfcMaterialDefinition> | <entity IfcOrganization> | <entity IfcPerson> | <entity IfcPersonAndOrganization> | <entity IfcPhysicalQuantity> | <entity IfcProfileDef> | <entity IfcPropertyAbstraction> | <entity IfcTimeSeries>)>>>"""
+        return self._get_attribute("RelatedResourceObjects")
+
+    @RelatedResourceObjects.setter
+    def RelatedResourceObjects(self, value: list[Union["IfcPropertyAbstraction", "IfcApproval", "IfcConversionBasedUnit", "IfcMaterialDefinition", "IfcConstraint", "IfcContextDependentUnit", "IfcPhysicalQuantity", "IfcTimeSeries", "IfcExternalInformation", "IfcActorRole", "IfcProfileDef", "IfcExternalReference", "IfcAppliedValue", "IfcOrganization", "IfcPerson", "IfcPersonAndOrganization"]]):
+        return self._set_attribute("RelatedResourceObjects", value)
+
+    @property
+    def RelatingApproval(self)-> "IfcApproval":
+        """<attribute RelatingApproval: <entity IfcApproval>>"""
+        return self._get_attribute("RelatingApproval")
+
+    @RelatingApproval.setter
+    def RelatingApproval(self, value: "IfcApproval"):
+        return self._set_attribute("RelatingApproval", value)
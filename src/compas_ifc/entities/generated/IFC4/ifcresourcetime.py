@@ -0,0 +1,140 @@
+from .ifcschedulingtime import IfcSchedulingTime
+
+
+class IfcResourceTime(IfcSchedulingTime):
+    """Wrapper class for IfcResourceTime."""
+
+    @property
+    def ScheduleWork(self)-> str:
+        """<attribute ScheduleWork?: <type IfcDuration: <string>>>"""
+        return self._get_attribute("ScheduleWork")
+
+    @ScheduleWork.setter
+    def ScheduleWork(self, value: str):
+        return self._set_attribute("ScheduleWork", value)
+
+    @property
+    def ScheduleUsage(self)-> float:
+        """<attribute ScheduleUsage?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("ScheduleUsage")
+
+    @ScheduleUsage.setter
+    def ScheduleUsage(self, value: float):
+        return self._set_attribute("ScheduleUsage", value)
+
+    @property
+    def ScheduleStart(self)-> str:
+        """<attribute ScheduleStart?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("ScheduleStart")
+
+    @ScheduleStart.setter
+    def ScheduleStart(self, value: str):
+        return self._set_attribute("ScheduleStart", value)
+
+    @property
+    def ScheduleFinish(self)-> str:
+        """<attribute ScheduleFinish?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("ScheduleFinish")
+
+    @ScheduleFinish.setter
+    def ScheduleFinish(self, value: str):
+        return self._set_attribute("ScheduleFinish", value)
+
+    @property
+    def ScheduleContour(self)-> str:
+        """<attribute ScheduleContour?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ScheduleContour")
+
+    @ScheduleContour.setter
+    def ScheduleContour(self, value: str):
+        return self._set_attribute("ScheduleContour", value)
+
+    @property
+    def LevelingDelay(self)-> str:
+        """<attribute LevelingDelay?: <type IfcDuration: <string>>>"""
+        return self._get_attribute("LevelingDelay")
+
+    @LevelingDelay.setter
+    def LevelingDelay(self, value: str):
+        return self._set_attribute("LevelingDelay", value)
+
+    @property
+    def IsOverAllocated(self)-> bool:
+        """<attribute IsOverAllocated?: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("IsOverAllocated")
+
+    @IsOverAllocated.setter
+    def IsOverAllocated(self, value: bool):
+        return self._set_attribute("IsOverAllocated", value)
+
+    @property
+    def StatusTime(self)-> str:
+        """<attribute StatusTime?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("StatusTime")
+
+    @StatusTime.setter
+    def StatusTime(self, value: str):
+        return self._set_attribute("StatusTime", value)
+
+    @property
+    def ActualWork(self)-> str:
+        """<attribute ActualWork?: <type IfcDuration: <string>>>"""
+        return self._get_attribute("ActualWork")
+
+    @ActualWork.setter
+    def ActualWork(self, value: str):
+        return self._set_attribute("ActualWork", value)
+
+    @property
+    def ActualUsage(self)-> float:
+        """<attribute ActualUsage?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("ActualUsage")
+
+    @ActualUsage.setter
+    def ActualUsage(self, value: float):
+        return self._set_attribute("ActualUsage", value)
+
+    @property
+    def ActualStart(self)-> str:
+        """<attribute ActualStart?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("ActualStart")
+
+    @ActualStart.setter
+    def ActualStart(self, value: str):
+        return self._set_attribute("ActualStart", value)
+
+    @property
+    def ActualFinish(self)-> str:
+        """<attribute ActualFinish?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("ActualFinish")
+
+    @ActualFinish.setter
+    def ActualFinish(self, value: str):
+        return self._set_attribute("ActualFinish", value)
+
+    @property
+    def RemainingWork(self)-> str:
+        """<attribute RemainingWork?: <type IfcDuration: <string>>>"""
+        return self._get_attribute("RemainingWork")
+
+    @RemainingWork.setter
+    def RemainingWork(self, value: str):
+        return self._set_attribute("RemainingWork", value)
+
+    @property
+    def RemainingUsage(self)-> float:
+        """<attribute RemainingUsage?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("RemainingUsage")
+
+    @RemainingUsage.setter
+    def RemainingUsage(self, value: float):
+        return self._set_attribute("RemainingUsage", value)
+
+    @property
+    def Completion(self)-> float:
+        """<attribute Completion?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("Completion")
+
+    @Completion.setter
+    def Completion(self, value: float):
+        return self._set_attribute("Completion", value)
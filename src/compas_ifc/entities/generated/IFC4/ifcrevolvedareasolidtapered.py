@@ -0,0 +1,17 @@
+from .ifcrevolvedareasolid import IfcRevolvedAreaSolid
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcprofiledef import IfcProfileDef
+
+class IfcRevolvedAreaSolidTapered(IfcRevolvedAreaSolid):
+    """Wrapper class for IfcRevolvedAreaSolidTapered."""
+
+    @property
+    def EndSweptArea(self)-> "IfcProfileDef":
+        """<attribute EndSweptArea: <entity IfcProfileDef>>"""
+        return self._get_attribute("EndSweptArea")
+
+    @EndSweptArea.setter
+    def EndSweptArea(self, value: "IfcProfileDef"):
+        return self._set_attribute("EndSweptArea", value)
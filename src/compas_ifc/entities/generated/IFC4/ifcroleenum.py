@@ -0,0 +1,2 @@
+class IfcRoleEnum(str):
+    items = ['SUPPLIER', 'MANUFACTURER', 'CONTRACTOR', 'SUBCONTRACTOR', 'ARCHITECT', 'STRUCTURALENGINEER', 'COSTENGINEER', 'CLIENT', 'BUILDINGOWNER', 'BUILDINGOPERATOR', 'MECHANICALENGINEER', 'ELECTRICALENGINEER', 'PROJECTMANAGER', 'FACILITIESMANAGER', 'CIVILENGINEER', 'COMMISSIONINGENGINEER', 'ENGINEER', 'OWNER', 'CONSULTANT', 'CONSTRUCTIONMANAGER', 'FIELDCONSTRUCTIONMANAGER', 'RESELLER', 'USERDEFINED']
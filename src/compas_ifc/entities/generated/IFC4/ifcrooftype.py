@@ -0,0 +1,17 @@
+from .ifcbuildingelementtype import IfcBuildingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrooftypeenum import IfcRoofTypeEnum
+
+class IfcRoofType(IfcBuildingElementType):
+    """Wrapper class for IfcRoofType."""
+
+    @property
+    def PredefinedType(self)-> "IfcRoofTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcRoofTypeEnum: (FLAT_ROOF, SHED_ROOF, GABLE_ROOF, HIP_ROOF, HIPPED_GABLE_ROOF, GAMBREL_ROOF, MANSARD_ROOF, BARREL_ROOF, RAINBOW_ROOF, BUTTERFLY_ROOF, PAVILION_ROOF, DOME_ROOF, FREEFORM, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcRoofTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,35 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdataoriginenum import IfcDataOriginEnum
+
+class IfcSchedulingTime(Base):
+    """Wrapper class for IfcSchedulingTime."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def DataOrigin(self)-> "IfcDataOriginEnum":
+        """<attribute DataOrigin?: <enumeration IfcDataOriginEnum: (MEASURED, PREDICTED, SIMULATED, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("DataOrigin")
+
+    @DataOrigin.setter
+    def DataOrigin(self, value: "IfcDataOriginEnum"):
+        return self._set_attribute("DataOrigin", value)
+
+    @property
+    def UserDefinedDataOrigin(self)-> str:
+        """<attribute UserDefinedDataOrigin?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedDataOrigin")
+
+    @UserDefinedDataOrigin.setter
+    def UserDefinedDataOrigin(self, value: str):
+        return self._set_attribute("UserDefinedDataOrigin", value)
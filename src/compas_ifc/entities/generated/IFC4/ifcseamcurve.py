@@ -0,0 +1,5 @@
+from .ifcsurfacecurve import IfcSurfaceCurve
+
+
+class IfcSeamCurve(IfcSurfaceCurve):
+    """Wrapper class for IfcSeamCurve."""
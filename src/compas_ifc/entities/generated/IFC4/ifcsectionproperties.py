@@ -0,0 +1,36 @@
+from .ifcpredefinedproperties import IfcPreDefinedProperties
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcprofiledef import IfcProfileDef
+    from .ifcsectiontypeenum import IfcSectionTypeEnum
+
+class IfcSectionProperties(IfcPreDefinedProperties):
+    """Wrapper class for IfcSectionProperties."""
+
+    @property
+    def SectionType(self)-> "IfcSectionTypeEnum":
+        """<attribute SectionType: <enumeration IfcSectionTypeEnum: (UNIFORM, TAPERED)>>"""
+        return self._get_attribute("SectionType")
+
+    @SectionType.setter
+    def SectionType(self, value: "IfcSectionTypeEnum"):
+        return self._set_attribute("SectionType", value)
+
+    @property
+    def StartProfile(self)-> "IfcProfileDef":
+        """<attribute StartProfile: <entity IfcProfileDef>>"""
+        return self._get_attribute("StartProfile")
+
+    @StartProfile.setter
+    def StartProfile(self, value: "IfcProfileDef"):
+        return self._set_attribute("StartProfile", value)
+
+    @property
+    def EndProfile(self)-> "IfcProfileDef":
+        """<attribute EndProfile?: <entity IfcProfileDef>>"""
+        return self._get_attribute("EndProfile")
+
+    @EndProfile.setter
+    def EndProfile(self, value: "IfcProfileDef"):
+        return self._set_attribute("EndProfile", value)
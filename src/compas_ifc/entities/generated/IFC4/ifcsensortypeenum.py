@@ -0,0 +1,2 @@
+class IfcSensorTypeEnum(str):
+    items = ['COSENSOR', 'CO2SENSOR', 'CONDUCTANCESENSOR', 'CONTACTSENSOR', 'FIRESENSOR', 'FLOWSENSOR', 'FROSTSENSOR', 'GASSENSOR', 'HEATSENSOR', 'HUMIDITYSENSOR', 'IDENTIFIERSENSOR', 'IONCONCENTRATIONSENSOR', 'LEVELSENSOR', 'LIGHTSENSOR', 'MOISTURESENSOR', 'MOVEMENTSENSOR', 'PHSENSOR', 'PRESSURESENSOR', 'RADIATIONSENSOR', 'RADIOACTIVITYSENSOR', 'SMOKESENSOR', 'SOUNDSENSOR', 'TEMPERATURESENSOR', 'WINDSENSOR', 'USERDEFINED', 'NOTDEFINED']
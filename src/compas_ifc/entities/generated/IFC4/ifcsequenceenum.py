@@ -0,0 +1,2 @@
+class IfcSequenceEnum(str):
+    items = ['START_START', 'START_FINISH', 'FINISH_START', 'FINISH_FINISH', 'USERDEFINED', 'NOTDEFINED']
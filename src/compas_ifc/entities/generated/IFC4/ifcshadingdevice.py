@@ -0,0 +1,17 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcshadingdevicetypeenum import IfcShadingDeviceTypeEnum
+
+class IfcShadingDevice(IfcBuildingElement):
+    """Wrapper class for IfcShadingDevice."""
+
+    @property
+    def PredefinedType(self)-> "IfcShadingDeviceTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcShadingDeviceTypeEnum: (JALOUSIE, SHUTTER, AWNING, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcShadingDeviceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
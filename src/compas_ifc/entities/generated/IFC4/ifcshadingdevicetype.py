@@ -0,0 +1,17 @@
+from .ifcbuildingelementtype import IfcBuildingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcshadingdevicetypeenum import IfcShadingDeviceTypeEnum
+
+class IfcShadingDeviceType(IfcBuildingElementType):
+    """Wrapper class for IfcShadingDeviceType."""
+
+    @property
+    def PredefinedType(self)-> "IfcShadingDeviceTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcShadingDeviceTypeEnum: (JALOUSIE, SHUTTER, AWNING, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcShadingDeviceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
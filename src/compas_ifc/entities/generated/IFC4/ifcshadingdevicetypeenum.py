@@ -0,0 +1,2 @@
+class IfcShadingDeviceTypeEnum(str):
+    items = ['JALOUSIE', 'SHUTTER', 'AWNING', 'USERDEFINED', 'NOTDEFINED']
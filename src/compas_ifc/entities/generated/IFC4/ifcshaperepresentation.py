@@ -0,0 +1,5 @@
+from .ifcshapemodel import IfcShapeModel
+
+
+class IfcShapeRepresentation(IfcShapeModel):
+    """Wrapper class for IfcShapeRepresentation."""
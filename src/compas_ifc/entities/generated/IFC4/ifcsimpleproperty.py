@@ -0,0 +1,5 @@
+from .ifcproperty import IfcProperty
+
+
+class IfcSimpleProperty(IfcProperty):
+    """Wrapper class for IfcSimpleProperty."""
@@ -0,0 +1,86 @@
+from .ifcpropertytemplate import IfcPropertyTemplate
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcderivedunit import IfcDerivedUnit
+    from .ifcmonetaryunit import IfcMonetaryUnit
+    from .ifcnamedunit import IfcNamedUnit
+    from .ifcpropertyenumeration import IfcPropertyEnumeration
+    from .ifcsimplepropertytemplatetypeenum import IfcSimplePropertyTemplateTypeEnum
+    from .ifcstateenum import IfcStateEnum
+
+class IfcSimplePropertyTemplate(IfcPropertyTemplate):
+    """Wrapper class for IfcSimplePropertyTemplate."""
+
+    @property
+    def TemplateType(self)-> "IfcSimplePropertyTemplateTypeEnum":
+        """<attribute TemplateType?: <enumeration IfcSimplePropertyTemplateTypeEnum: (P_SINGLEVALUE, P_ENUMERATEDVALUE, P_BOUNDEDVALUE, P_LISTVALUE, P_TABLEVALUE, P_REFERENCEVALUE, Q_LENGTH, Q_AREA, Q_VOLUME, Q_COUNT, Q_WEIGHT, Q_TIME)>>"""
+        return self._get_attribute("TemplateType")
+
+    @TemplateType.setter
+    def TemplateType(self, value: "IfcSimplePropertyTemplateTypeEnum"):
+        return self._set_attribute("TemplateType", value)
+
+    @property
+    def PrimaryMeasureType(self)-> str:
+        """<attribute PrimaryMeasureType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("PrimaryMeasureType")
+
+    @PrimaryMeasureType.setter
+    def PrimaryMeasureType(self, value: str):
+        return self._set_attribute("PrimaryMeasureType", value)
+
+    @property
+    def SecondaryMeasureType(self)-> str:
+        """<attribute SecondaryMeasureType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("SecondaryMeasureType")
+
+    @SecondaryMeasureType.setter
+    def SecondaryMeasureType(self, value: str):
+        return self._set_attribute("SecondaryMeasureType", value)
+
+    @property
+    def Enumerators(self)-> "IfcPropertyEnumeration":
+        """<attribute Enumerators?: <entity IfcPropertyEnumeration>>"""
+        return self._get_attribute("Enumerators")
+
+    @Enumerators.setter
+    def Enumerators(self, value: "IfcPropertyEnumeration"):
+        return self._set_attribute("Enumerators", value)
+
+    @property
+    def PrimaryUnit(self)-> Union["IfcDerivedUnit", "IfcNamedUnit", "IfcMonetaryUnit"]:
+        """<attribute PrimaryUnit?: <select IfcUnit: (<entity IfcDerivedUnit> | <entity IfcMonetaryUnit> | <entity IfcNamedUnit>)>>"""
+        return self._get_attribute("PrimaryUnit")
+
+    @PrimaryUnit.setter
+    def PrimaryUnit(self, value: Union["IfcDerivedUnit", "IfcNamedUnit", "IfcMonetaryUnit"]):
+        return self._set_attribute("PrimaryUnit", value)
+
+    @property
+    def SecondaryUnit(self)-> Union["IfcDerivedUnit", "IfcNamedUnit", "IfcMonetaryUnit"]:
+        """<attribute SecondaryUnit?: <select IfcUnit: (<entity IfcDerivedUnit> | <entity IfcMonetaryUnit> | <entity IfcNamedUnit>)>>"""
+        return self._get_attribute("SecondaryUnit")
+
+    @SecondaryUnit.setter
+    def SecondaryUnit(self, value: Union["IfcDerivedUnit", "IfcNamedUnit", "IfcMonetaryUnit"]):
+        return self._set_attribute("SecondaryUnit", value)
+
+    @property
+    def Expression(self)-> str:
+        """<attribute Expression?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Expression")
+
+    @Expression.setter
+    def Expression(self, value: str):
+        return self._set_attribute("Expression", value)
+
+    @property
+    def AccessState(self)-> "IfcStateEnum":
+        """<attribute AccessState?: <enumeration IfcStateEnum: (READWRITE, READONLY, LOCKED, READWRITELOCKED, READONLYLOCKED)>>"""
+        return self._get_attribute("AccessState")
+
+    @AccessState.setter
+    def AccessState(self, value: "IfcStateEnum"):
+        return self._set_attribute("AccessState", value)
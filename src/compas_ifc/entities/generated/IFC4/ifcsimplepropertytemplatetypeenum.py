@@ -0,0 +1,2 @@
+class IfcSimplePropertyTemplateTypeEnum(str):
+    items = ['P_SINGLEVALUE', 'P_ENUMERATEDVALUE', 'P_BOUNDEDVALUE', 'P_LISTVALUE', 'P_TABLEVALUE', 'P_REFERENCEVALUE', 'Q_LENGTH', 'Q_AREA', 'Q_VOLUME', 'Q_COUNT', 'Q_WEIGHT', 'Q_TIME']
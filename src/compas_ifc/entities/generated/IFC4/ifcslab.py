@@ -0,0 +1,17 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcslabtypeenum import IfcSlabTypeEnum
+
+class IfcSlab(IfcBuildingElement):
+    """Wrapper class for IfcSlab."""
+
+    @property
+    def PredefinedType(self)-> "IfcSlabTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcSlabTypeEnum: (FLOOR, ROOF, LANDING, BASESLAB, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcSlabTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,5 @@
+from .ifcslab import IfcSlab
+
+
+class IfcSlabElementedCase(IfcSlab):
+    """Wrapper class for IfcSlabElementedCase."""
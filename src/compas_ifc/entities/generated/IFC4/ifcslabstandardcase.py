@@ -0,0 +1,5 @@
+from .ifcslab import IfcSlab
+
+
+class IfcSlabStandardCase(IfcSlab):
+    """Wrapper class for IfcSlabStandardCase."""
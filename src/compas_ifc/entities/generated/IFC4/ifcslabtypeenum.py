@@ -0,0 +1,2 @@
+class IfcSlabTypeEnum(str):
+    items = ['FLOOR', 'ROOF', 'LANDING', 'BASESLAB', 'USERDEFINED', 'NOTDEFINED']
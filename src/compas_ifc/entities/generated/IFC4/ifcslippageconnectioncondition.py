@@ -0,0 +1,32 @@
+from .ifcstructuralconnectioncondition import IfcStructuralConnectionCondition
+
+
+class IfcSlippageConnectionCondition(IfcStructuralConnectionCondition):
+    """Wrapper class for IfcSlippageConnectionCondition."""
+
+    @property
+    def SlippageX(self)-> float:
+        """<attribute SlippageX?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("SlippageX")
+
+    @SlippageX.setter
+    def SlippageX(self, value: float):
+        return self._set_attribute("SlippageX", value)
+
+    @property
+    def SlippageY(self)-> float:
+        """<attribute SlippageY?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("SlippageY")
+
+    @SlippageY.setter
+    def SlippageY(self, value: float):
+        return self._set_attribute("SlippageY", value)
+
+    @property
+    def SlippageZ(self)-> float:
+        """<attribute SlippageZ?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("SlippageZ")
+
+    @SlippageZ.setter
+    def SlippageZ(self, value: float):
+        return self._set_attribute("SlippageZ", value)
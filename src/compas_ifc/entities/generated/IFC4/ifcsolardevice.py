@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevice import IfcEnergyConversionDevice
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcsolardevicetypeenum import IfcSolarDeviceTypeEnum
+
+class IfcSolarDevice(IfcEnergyConversionDevice):
+    """Wrapper class for IfcSolarDevice."""
+
+    @property
+    def PredefinedType(self)-> "IfcSolarDeviceTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcSolarDeviceTypeEnum: (SOLARCOLLECTOR, SOLARPANEL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcSolarDeviceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
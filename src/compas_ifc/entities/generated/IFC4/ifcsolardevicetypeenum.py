@@ -0,0 +1,2 @@
+class IfcSolarDeviceTypeEnum(str):
+    items = ['SOLARCOLLECTOR', 'SOLARPANEL', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,5 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+
+class IfcSolidModel(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcSolidModel."""
@@ -0,0 +1,36 @@
+from .ifcspatialstructureelement import IfcSpatialStructureElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelcoversspaces import IfcRelCoversSpaces
+    from .ifcrelspaceboundary import IfcRelSpaceBoundary
+    from .ifcspacetypeenum import IfcSpaceTypeEnum
+
+class IfcSpace(IfcSpatialStructureElement):
+    """Wrapper class for IfcSpace."""
+
+    @property
+    def PredefinedType(self)-> "IfcSpaceTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcSpaceTypeEnum: (SPACE, PARKING, GFA, INTERNAL, EXTERNAL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcSpaceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def ElevationWithFlooring(self)-> float:
+        """<attribute ElevationWithFlooring?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("ElevationWithFlooring")
+
+    @ElevationWithFlooring.setter
+    def ElevationWithFlooring(self, value: float):
+        return self._set_attribute("ElevationWithFlooring", value)
+
+    def HasCoverings(self)-> list["IfcRelCoversSpaces"]:
+        """<inverse HasCoverings: set [0:?] of <entity IfcRelCoversSpaces> for <attribute RelatingSpace: <entity IfcSpace>>>"""
+        return self._get_inverse_attribute("HasCoverings")
+
+    def BoundedBy(self)-> list["IfcRelSpaceBoundary"]:
+        """<inverse BoundedBy: set [0:?] of <entity IfcRelSpaceBoundary> for <attribute RelatingSpace: <select IfcSpaceBoundarySelect: (<entity IfcExternalSpatialElement> | <entity IfcSpace>)>>>"""
+        return self._get_inverse_attribute("BoundedBy")
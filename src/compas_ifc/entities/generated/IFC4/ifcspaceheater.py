@@ -0,0 +1,17 @@
+from .ifcflowterminal import IfcFlowTerminal
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcspaceheatertypeenum import IfcSpaceHeaterTypeEnum
+
+class IfcSpaceHeater(IfcFlowTerminal):
+    """Wrapper class for IfcSpaceHeater."""
+
+    @property
+    def PredefinedType(self)-> "IfcSpaceHeaterTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcSpaceHeaterTypeEnum: (CONVECTOR, RADIATOR, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcSpaceHeaterTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,17 @@
+from .ifcflowterminaltype import IfcFlowTerminalType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcspaceheatertypeenum import IfcSpaceHeaterTypeEnum
+
+class IfcSpaceHeaterType(IfcFlowTerminalType):
+    """Wrapper class for IfcSpaceHeaterType."""
+
+    @property
+    def PredefinedType(self)-> "IfcSpaceHeaterTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcSpaceHeaterTypeEnum: (CONVECTOR, RADIATOR, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcSpaceHeaterTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
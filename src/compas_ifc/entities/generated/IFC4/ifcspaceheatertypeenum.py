@@ -0,0 +1,2 @@
+class IfcSpaceHeaterTypeEnum(str):
+    items = ['CONVECTOR', 'RADIATOR', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,26 @@
+from .ifcspatialstructureelementtype import IfcSpatialStructureElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcspacetypeenum import IfcSpaceTypeEnum
+
+class IfcSpaceType(IfcSpatialStructureElementType):
+    """Wrapper class for IfcSpaceType."""
+
+    @property
+    def PredefinedType(self)-> "IfcSpaceTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcSpaceTypeEnum: (SPACE, PARKING, GFA, INTERNAL, EXTERNAL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcSpaceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def LongName(self)-> str:
+        """<attribute LongName?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("LongName")
+
+    @LongName.setter
+    def LongName(self, value: str):
+        return self._set_attribute("LongName", value)
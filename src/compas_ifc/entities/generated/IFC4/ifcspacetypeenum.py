@@ -0,0 +1,2 @@
+class IfcSpaceTypeEnum(str):
+    items = ['SPACE', 'PARKING', 'GFA', 'INTERNAL', 'EXTERNAL', 'USERDEFINED', 'NOTDEFINED']
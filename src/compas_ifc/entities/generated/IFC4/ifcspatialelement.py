@@ -0,0 +1,32 @@
+from .ifcproduct import IfcProduct
+from compas_ifc.entities.extensions import IfcSpatialElement as IfcSpatialElement_Ext   # type: ignore
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelcontainedinspatialstructure import IfcRelContainedInSpatialStructure
+    from .ifcrelreferencedinspatialstructure import IfcRelReferencedInSpatialStructure
+    from .ifcrelservicesbuildings import IfcRelServicesBuildings
+
+class IfcSpatialElement(IfcSpatialElement_Ext, IfcProduct):
+    """Wrapper class for IfcSpatialElement."""
+
+    @property
+    def LongName(self)-> str:
+        """<attribute LongName?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("LongName")
+
+    @LongName.setter
+    def LongName(self, value: str):
+        return self._set_attribute("LongName", value)
+
+    def ContainsElements(self)-> list["IfcRelContainedInSpatialStructure"]:
+        """<inverse ContainsElements: set [0:?] of <entity IfcRelContainedInSpatialStructure> for <attribute RelatingStructure: <entity IfcSpatialElement>>>"""
+        return self._get_inverse_attribute("ContainsElements")
+
+    def ServicedBySystems(self)-> list["IfcRelServicesBuildings"]:
+        """<inverse ServicedBySystems: set [0:?] of <entity IfcRelServicesBuildings> for <attribute RelatedBuildings: <set [1:?] of <entity IfcSpatialElement>>>>"""
+        return self._get_inverse_attribute("ServicedBySystems")
+
+    def ReferencesElements(self)-> list["IfcRelReferencedInSpatialStructure"]:
+        """<inverse ReferencesElements: set [0:?] of <entity IfcRelReferencedInSpatialStructure> for <attribute RelatingStructure: <entity IfcSpatialElement>>>"""
+        return self._get_inverse_attribute("ReferencesElements")
@@ -0,0 +1,14 @@
+from .ifctypeproduct import IfcTypeProduct
+
+
+class IfcSpatialElementType(IfcTypeProduct):
+    """Wrapper class for IfcSpatialElementType."""
+
+    @property
+    def ElementType(self)-> str:
+        """<attribute ElementType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ElementType")
+
+    @ElementType.setter
+    def ElementType(self, value: str):
+        return self._set_attribute("ElementType", value)
@@ -0,0 +1,18 @@
+from .ifcspatialelement import IfcSpatialElement
+from compas_ifc.entities.extensions import IfcSpatialStructureElement as IfcSpatialStructureElement_Ext   # type: ignore
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcelementcompositionenum import IfcElementCompositionEnum
+
+class IfcSpatialStructureElement(IfcSpatialStructureElement_Ext, IfcSpatialElement):
+    """Wrapper class for IfcSpatialStructureElement."""
+
+    @property
+    def CompositionType(self)-> "IfcElementCompositionEnum":
+        """<attribute CompositionType?: <enumeration IfcElementCompositionEnum: (COMPLEX, ELEMENT, PARTIAL)>>"""
+        return self._get_attribute("CompositionType")
+
+    @CompositionType.setter
+    def CompositionType(self, value: "IfcElementCompositionEnum"):
+        return self._set_attribute("CompositionType", value)
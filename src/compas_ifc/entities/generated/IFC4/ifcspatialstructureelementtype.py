@@ -0,0 +1,5 @@
+from .ifcspatialelementtype import IfcSpatialElementType
+
+
+class IfcSpatialStructureElementType(IfcSpatialElementType):
+    """Wrapper class for IfcSpatialStructureElementType."""
@@ -0,0 +1,17 @@
+from .ifcspatialelement import IfcSpatialElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcspatialzonetypeenum import IfcSpatialZoneTypeEnum
+
+class IfcSpatialZone(IfcSpatialElement):
+    """Wrapper class for IfcSpatialZone."""
+
+    @property
+    def PredefinedType(self)-> "IfcSpatialZoneTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcSpatialZoneTypeEnum: (CONSTRUCTION, FIRESAFETY, LIGHTING, OCCUPANCY, SECURITY, THERMAL, TRANSPORT, VENTILATION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcSpatialZoneTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
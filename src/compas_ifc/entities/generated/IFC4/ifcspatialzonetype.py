@@ -0,0 +1,26 @@
+from .ifcspatialelementtype import IfcSpatialElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcspatialzonetypeenum import IfcSpatialZoneTypeEnum
+
+class IfcSpatialZoneType(IfcSpatialElementType):
+    """Wrapper class for IfcSpatialZoneType."""
+
+    @property
+    def PredefinedType(self)-> "IfcSpatialZoneTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcSpatialZoneTypeEnum: (CONSTRUCTION, FIRESAFETY, LIGHTING, OCCUPANCY, SECURITY, THERMAL, TRANSPORT, VENTILATION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcSpatialZoneTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def LongName(self)-> str:
+        """<attribute LongName?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("LongName")
+
+    @LongName.setter
+    def LongName(self, value: str):
+        return self._set_attribute("LongName", value)
@@ -0,0 +1,2 @@
+class IfcSpatialZoneTypeEnum(str):
+    items = ['CONSTRUCTION', 'FIRESAFETY', 'LIGHTING', 'OCCUPANCY', 'SECURITY', 'THERMAL', 'TRANSPORT', 'VENTILATION', 'USERDEFINED', 'NOTDEFINED']
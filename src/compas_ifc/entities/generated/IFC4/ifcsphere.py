@@ -0,0 +1,14 @@
+from .ifccsgprimitive3d import IfcCsgPrimitive3D
+
+
+class IfcSphere(IfcCsgPrimitive3D):
+    """Wrapper class for IfcSphere."""
+
+    @property
+    def Radius(self)-> float:
+        """<attribute Radius: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Radius")
+
+    @Radius.setter
+    def Radius(self, value: float):
+        return self._set_attribute("Radius", value)
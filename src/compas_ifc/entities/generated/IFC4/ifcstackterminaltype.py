@@ -0,0 +1,17 @@
+from .ifcflowterminaltype import IfcFlowTerminalType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcstackterminaltypeenum import IfcStackTerminalTypeEnum
+
+class IfcStackTerminalType(IfcFlowTerminalType):
+    """Wrapper class for IfcStackTerminalType."""
+
+    @property
+    def PredefinedType(self)-> "IfcStackTerminalTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcStackTerminalTypeEnum: (BIRDCAGE, COWL, RAINWATERHOPPER, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcStackTerminalTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
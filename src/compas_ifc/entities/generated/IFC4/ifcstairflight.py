@@ -0,0 +1,53 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcstairflighttypeenum import IfcStairFlightTypeEnum
+
+class IfcStairFlight(IfcBuildingElement):
+    """Wrapper class for IfcStairFlight."""
+
+    @property
+    def NumberOfRisers(self)-> int:
+        """<attribute NumberOfRisers?: <type IfcInteger: <integer>>>"""
+        return self._get_attribute("NumberOfRisers")
+
+    @NumberOfRisers.setter
+    def NumberOfRisers(self, value: int):
+        return self._set_attribute("NumberOfRisers", value)
+
+    @property
+    def NumberOfTreads(self)-> int:
+        """<attribute NumberOfTreads?: <type IfcInteger: <integer>>>"""
+        return self._get_attribute("NumberOfTreads")
+
+    @NumberOfTreads.setter
+    def NumberOfTreads(self, value: int):
+        return self._set_attribute("NumberOfTreads", value)
+
+    @property
+    def RiserHeight(self)-> float:
+        """<attribute RiserHeight?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("RiserHeight")
+
+    @RiserHeight.setter
+    def RiserHeight(self, value: float):
+        return self._set_attribute("RiserHeight", value)
+
+    @property
+    def TreadLength(self)-> float:
+        """<attribute TreadLength?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("TreadLength")
+
+    @TreadLength.setter
+    def TreadLength(self, value: float):
+        return self._set_attribute("TreadLength", value)
+
+    @property
+    def PredefinedType(self)-> "IfcStairFlightTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcStairFlightTypeEnum: (STRAIGHT, WINDER, SPIRAL, CURVED, FREEFORM, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcStairFlightTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,17 @@
+from .ifcbuildingelementtype import IfcBuildingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcstairflighttypeenum import IfcStairFlightTypeEnum
+
+class IfcStairFlightType(IfcBuildingElementType):
+    """Wrapper class for IfcStairFlightType."""
+
+    @property
+    def PredefinedType(self)-> "IfcStairFlightTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcStairFlightTypeEnum: (STRAIGHT, WINDER, SPIRAL, CURVED, FREEFORM, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcStairFlightTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
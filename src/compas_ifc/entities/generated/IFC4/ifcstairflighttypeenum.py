@@ -0,0 +1,2 @@
+class IfcStairFlightTypeEnum(str):
+    items = ['STRAIGHT', 'WINDER', 'SPIRAL', 'CURVED', 'FREEFORM', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,2 @@
+class IfcStateEnum(str):
+    items = ['READWRITE', 'READONLY', 'LOCKED', 'READWRITELOCKED', 'READONLYLOCKED']
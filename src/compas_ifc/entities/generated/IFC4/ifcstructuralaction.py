@@ -0,0 +1,14 @@
+from .ifcstructuralactivity import IfcStructuralActivity
+
+
+class IfcStructuralAction(IfcStructuralActivity):
+    """Wrapper class for IfcStructuralAction."""
+
+    @property
+    def DestabilizingLoad(self)-> bool:
+        """<attribute DestabilizingLoad?: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("DestabilizingLoad")
+
+    @DestabilizingLoad.setter
+    def DestabilizingLoad(self, value: bool):
+        return self._set_attribute("DestabilizingLoad", value)
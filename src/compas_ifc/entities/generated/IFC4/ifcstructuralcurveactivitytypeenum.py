@@ -0,0 +1,2 @@
+class IfcStructuralCurveActivityTypeEnum(str):
+    items = ['CONST', 'LINEAR', 'POLYGONAL', 'EQUIDISTANT', 'SINUS', 'PARABOLA', 'DISCRETE', 'USERDEFINED', 'NOTDEFINED']
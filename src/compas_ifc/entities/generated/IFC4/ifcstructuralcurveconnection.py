@@ -0,0 +1,17 @@
+from .ifcstructuralconnection import IfcStructuralConnection
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdirection import IfcDirection
+
+class IfcStructuralCurveConnection(IfcStructuralConnection):
+    """Wrapper class for IfcStructuralCurveConnection."""
+
+    @property
+    def Axis(self)-> "IfcDirection":
+        """<attribute Axis: <entity IfcDirection>>"""
+        return self._get_attribute("Axis")
+
+    @Axis.setter
+    def Axis(self, value: "IfcDirection"):
+        return self._set_attribute("Axis", value)
@@ -0,0 +1,27 @@
+from .ifcstructuralmember import IfcStructuralMember
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdirection import IfcDirection
+    from .ifcstructuralcurvemembertypeenum import IfcStructuralCurveMemberTypeEnum
+
+class IfcStructuralCurveMember(IfcStructuralMember):
+    """Wrapper class for IfcStructuralCurveMember."""
+
+    @property
+    def PredefinedType(self)-> "IfcStructuralCurveMemberTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcStructuralCurveMemberTypeEnum: (RIGID_JOINED_MEMBER, PIN_JOINED_MEMBER, CABLE, TENSION_MEMBER, COMPRESSION_MEMBER, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcStructuralCurveMemberTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def Axis(self)-> "IfcDirection":
+        """<attribute Axis: <entity IfcDirection>>"""
+        return self._get_attribute("Axis")
+
+    @Axis.setter
+    def Axis(self, value: "IfcDirection"):
+        return self._set_attribute("Axis", value)
@@ -0,0 +1,5 @@
+from .ifcstructuralcurvemember import IfcStructuralCurveMember
+
+
+class IfcStructuralCurveMemberVarying(IfcStructuralCurveMember):
+    """Wrapper class for IfcStructuralCurveMemberVarying."""
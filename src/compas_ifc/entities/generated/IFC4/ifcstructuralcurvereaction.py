@@ -0,0 +1,17 @@
+from .ifcstructuralreaction import IfcStructuralReaction
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcstructuralcurveactivitytypeenum import IfcStructuralCurveActivityTypeEnum
+
+class IfcStructuralCurveReaction(IfcStructuralReaction):
+    """Wrapper class for IfcStructuralCurveReaction."""
+
+    @property
+    def PredefinedType(self)-> "IfcStructuralCurveActivityTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcStructuralCurveActivityTypeEnum: (CONST, LINEAR, POLYGONAL, EQUIDISTANT, SINUS, PARABOLA, DISCRETE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcStructuralCurveActivityTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
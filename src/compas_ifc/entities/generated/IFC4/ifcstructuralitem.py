@@ -0,0 +1,12 @@
+from .ifcproduct import IfcProduct
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelconnectsstructuralactivity import IfcRelConnectsStructuralActivity
+
+class IfcStructuralItem(IfcProduct):
+    """Wrapper class for IfcStructuralItem."""
+
+    def AssignedStructuralActivity(self)-> list["IfcRelConnectsStructuralActivity"]:
+        """<inverse AssignedStructuralActivity: set [0:?] of <entity IfcRelConnectsStructuralActivity> for <attribute RelatingElement: <select IfcStructuralActivityAssignmentSelect: (<entity IfcElement> | <entity IfcStructuralItem>)>>>"""
+        return self._get_inverse_attribute("AssignedStructuralActivity")
@@ -0,0 +1,5 @@
+from .ifcstructuralcurveaction import IfcStructuralCurveAction
+
+
+class IfcStructuralLinearAction(IfcStructuralCurveAction):
+    """Wrapper class for IfcStructuralLinearAction."""
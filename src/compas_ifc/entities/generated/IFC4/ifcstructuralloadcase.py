@@ -0,0 +1,14 @@
+from .ifcstructuralloadgroup import IfcStructuralLoadGroup
+
+
+class IfcStructuralLoadCase(IfcStructuralLoadGroup):
+    """Wrapper class for IfcStructuralLoadCase."""
+
+    @property
+    def SelfWeightCoefficients(self)-> list[float]:
+        """<attribute SelfWeightCoefficients?: <list [3:3] of <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("SelfWeightCoefficients")
+
+    @SelfWeightCoefficients.setter
+    def SelfWeightCoefficients(self, value: list[float]):
+        return self._set_attribute("SelfWeightCoefficients", value)
@@ -0,0 +1,26 @@
+from .ifcstructuralload import IfcStructuralLoad
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcstructuralloadorresult import IfcStructuralLoadOrResult
+
+class IfcStructuralLoadConfiguration(IfcStructuralLoad):
+    """Wrapper class for IfcStructuralLoadConfiguration."""
+
+    @property
+    def Values(self)-> list["IfcStructuralLoadOrResult"]:
+        """<attribute Values: <list [1:?] of <entity IfcStructuralLoadOrResult>>>"""
+        return self._get_attribute("Values")
+
+    @Values.setter
+    def Values(self, value: list["IfcStructuralLoadOrResult"]):
+        return self._set_attribute("Values", value)
+
+    @property
+    def Locations(self)-> list[list[float]]:
+        """<attribute Locations?: <list [1:?] of <list [1:2] of <type IfcLengthMeasure: <real>>>>>"""
+        return self._get_attribute("Locations")
+
+    @Locations.setter
+    def Locations(self, value: list[list[float]]):
+        return self._set_attribute("Locations", value)
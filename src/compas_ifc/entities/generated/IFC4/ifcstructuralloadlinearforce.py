@@ -0,0 +1,59 @@
+from .ifcstructuralloadstatic import IfcStructuralLoadStatic
+
+
+class IfcStructuralLoadLinearForce(IfcStructuralLoadStatic):
+    """Wrapper class for IfcStructuralLoadLinearForce."""
+
+    @property
+    def LinearForceX(self)-> float:
+        """<attribute LinearForceX?: <type IfcLinearForceMeasure: <real>>>"""
+        return self._get_attribute("LinearForceX")
+
+    @LinearForceX.setter
+    def LinearForceX(self, value: float):
+        return self._set_attribute("LinearForceX", value)
+
+    @property
+    def LinearForceY(self)-> float:
+        """<attribute LinearForceY?: <type IfcLinearForceMeasure: <real>>>"""
+        return self._get_attribute("LinearForceY")
+
+    @LinearForceY.setter
+    def LinearForceY(self, value: float):
+        return self._set_attribute("LinearForceY", value)
+
+    @property
+    def LinearForceZ(self)-> float:
+        """<attribute LinearForceZ?: <type IfcLinearForceMeasure: <real>>>"""
+        return self._get_attribute("LinearForceZ")
+
+    @LinearForceZ.setter
+    def LinearForceZ(self, value: float):
+        return self._set_attribute("LinearForceZ", value)
+
+    @property
+    def LinearMomentX(self)-> float:
+        """<attribute LinearMomentX?: <type IfcLinearMomentMeasure: <real>>>"""
+        return self._get_attribute("LinearMomentX")
+
+    @LinearMomentX.setter
+    def LinearMomentX(self, value: float):
+        return self._set_attribute("LinearMomentX", value)
+
+    @property
+    def LinearMomentY(self)-> float:
+        """<attribute LinearMomentY?: <type IfcLinearMomentMeasure: <real>>>"""
+        return self._get_attribute("LinearMomentY")
+
+    @LinearMomentY.setter
+    def LinearMomentY(self, value: float):
+        return self._set_attribute("LinearMomentY", value)
+
+    @property
+    def LinearMomentZ(self)-> float:
+        """<attribute LinearMomentZ?: <type IfcLinearMomentMeasure: <real>>>"""
+        return self._get_attribute("LinearMomentZ")
+
+    @LinearMomentZ.setter
+    def LinearMomentZ(self, value: float):
+        return self._set_attribute("LinearMomentZ", value)
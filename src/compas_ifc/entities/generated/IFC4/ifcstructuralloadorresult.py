@@ -0,0 +1,5 @@
+from .ifcstructuralload import IfcStructuralLoad
+
+
+class IfcStructuralLoadOrResult(IfcStructuralLoad):
+    """Wrapper class for IfcStructuralLoadOrResult."""
@@ -0,0 +1,32 @@
+from .ifcstructuralloadstatic import IfcStructuralLoadStatic
+
+
+class IfcStructuralLoadPlanarForce(IfcStructuralLoadStatic):
+    """Wrapper class for IfcStructuralLoadPlanarForce."""
+
+    @property
+    def PlanarForceX(self)-> float:
+        """<attribute PlanarForceX?: <type IfcPlanarForceMeasure: <real>>>"""
+        return self._get_attribute("PlanarForceX")
+
+    @PlanarForceX.setter
+    def PlanarForceX(self, value: float):
+        return self._set_attribute("PlanarForceX", value)
+
+    @property
+    def PlanarForceY(self)-> float:
+        """<attribute PlanarForceY?: <type IfcPlanarForceMeasure: <real>>>"""
+        return self._get_attribute("PlanarForceY")
+
+    @PlanarForceY.setter
+    def PlanarForceY(self, value: float):
+        return self._set_attribute("PlanarForceY", value)
+
+    @property
+    def PlanarForceZ(self)-> float:
+        """<attribute PlanarForceZ?: <type IfcPlanarForceMeasure: <real>>>"""
+        return self._get_attribute("PlanarForceZ")
+
+    @PlanarForceZ.setter
+    def PlanarForceZ(self, value: float):
+        return self._set_attribute("PlanarForceZ", value)
@@ -0,0 +1,59 @@
+from .ifcstructuralloadstatic import IfcStructuralLoadStatic
+
+
+class IfcStructuralLoadSingleDisplacement(IfcStructuralLoadStatic):
+    """Wrapper class for IfcStructuralLoadSingleDisplacement."""
+
+    @property
+    def DisplacementX(self)-> float:
+        """<attribute DisplacementX?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("DisplacementX")
+
+    @DisplacementX.setter
+    def DisplacementX(self, value: float):
+        return self._set_attribute("DisplacementX", value)
+
+    @property
+    def DisplacementY(self)-> float:
+        """<attribute DisplacementY?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("DisplacementY")
+
+    @DisplacementY.setter
+    def DisplacementY(self, value: float):
+        return self._set_attribute("DisplacementY", value)
+
+    @property
+    def DisplacementZ(self)-> float:
+        """<attribute DisplacementZ?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("DisplacementZ")
+
+    @DisplacementZ.setter
+    def DisplacementZ(self, value: float):
+        return self._set_attribute("DisplacementZ", value)
+
+    @property
+    def RotationalDisplacementRX(self)-> float:
+        """<attribute RotationalDisplacementRX?: <type IfcPlaneAngleMeasure: <real>>>"""
+        return self._get_attribute("RotationalDisplacementRX")
+
+    @RotationalDisplacementRX.setter
+    def RotationalDisplacementRX(self, value: float):
+        return self._set_attribute("RotationalDisplacementRX", value)
+
+    @property
+    def RotationalDisplacementRY(self)-> float:
+        """<attribute RotationalDisplacementRY?: <type IfcPlaneAngleMeasure: <real>>>"""
+        return self._get_attribute("RotationalDisplacementRY")
+
+    @RotationalDisplacementRY.setter
+    def RotationalDisplacementRY(self, value: float):
+        return self._set_attribute("RotationalDisplacementRY", value)
+
+    @property
+    def RotationalDisplacementRZ(self)-> float:
+        """<attribute RotationalDisplacementRZ?: <type IfcPlaneAngleMeasure: <real>>>"""
+        return self._get_attribute("RotationalDisplacementRZ")
+
+    @RotationalDisplacementRZ.setter
+    def RotationalDisplacementRZ(self, value: float):
+        return self._set_attribute("RotationalDisplacementRZ", value)
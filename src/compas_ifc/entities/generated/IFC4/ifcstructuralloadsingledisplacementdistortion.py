@@ -0,0 +1,14 @@
+from .ifcstructuralloadsingledisplacement import IfcStructuralLoadSingleDisplacement
+
+
+class IfcStructuralLoadSingleDisplacementDistortion(IfcStructuralLoadSingleDisplacement):
+    """Wrapper class for IfcStructuralLoadSingleDisplacementDistortion."""
+
+    @property
+    def Distortion(self)-> float:
+        """<attribute Distortion?: <type IfcCurvatureMeasure: <real>>>"""
+        return self._get_attribute("Distortion")
+
+    @Distortion.setter
+    def Distortion(self, value: float):
+        return self._set_attribute("Distortion", value)
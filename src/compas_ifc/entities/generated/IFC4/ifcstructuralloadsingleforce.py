@@ -0,0 +1,59 @@
+from .ifcstructuralloadstatic import IfcStructuralLoadStatic
+
+
+class IfcStructuralLoadSingleForce(IfcStructuralLoadStatic):
+    """Wrapper class for IfcStructuralLoadSingleForce."""
+
+    @property
+    def ForceX(self)-> float:
+        """<attribute ForceX?: <type IfcForceMeasure: <real>>>"""
+        return self._get_attribute("ForceX")
+
+    @ForceX.setter
+    def ForceX(self, value: float):
+        return self._set_attribute("ForceX", value)
+
+    @property
+    def ForceY(self)-> float:
+        """<attribute ForceY?: <type IfcForceMeasure: <real>>>"""
+        return self._get_attribute("ForceY")
+
+    @ForceY.setter
+    def ForceY(self, value: float):
+        return self._set_attribute("ForceY", value)
+
+    @property
+    def ForceZ(self)-> float:
+        """<attribute ForceZ?: <type IfcForceMeasure: <real>>>"""
+        return self._get_attribute("ForceZ")
+
+    @ForceZ.setter
+    def ForceZ(self, value: float):
+        return self._set_attribute("ForceZ", value)
+
+    @property
+    def MomentX(self)-> float:
+        """<attribute MomentX?: <type IfcTorqueMeasure: <real>>>"""
+        return self._get_attribute("MomentX")
+
+    @MomentX.setter
+    def MomentX(self, value: float):
+        return self._set_attribute("MomentX", value)
+
+    @property
+    def MomentY(self)-> float:
+        """<attribute MomentY?: <type IfcTorqueMeasure: <real>>>"""
+        return self._get_attribute("MomentY")
+
+    @MomentY.setter
+    def MomentY(self, value: float):
+        return self._set_attribute("MomentY", value)
+
+    @property
+    def MomentZ(self)-> float:
+        """<attribute MomentZ?: <type IfcTorqueMeasure: <real>>>"""
+        return self._get_attribute("MomentZ")
+
+    @MomentZ.setter
+    def MomentZ(self, value: float):
+        return self._set_attribute("MomentZ", value)
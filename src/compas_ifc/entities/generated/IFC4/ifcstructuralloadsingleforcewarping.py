@@ -0,0 +1,14 @@
+from .ifcstructuralloadsingleforce import IfcStructuralLoadSingleForce
+
+
+class IfcStructuralLoadSingleForceWarping(IfcStructuralLoadSingleForce):
+    """Wrapper class for IfcStructuralLoadSingleForceWarping."""
+
+    @property
+    def WarpingMoment(self)-> float:
+        """<attribute WarpingMoment?: <type IfcWarpingMomentMeasure: <real>>>"""
+        return self._get_attribute("WarpingMoment")
+
+    @WarpingMoment.setter
+    def WarpingMoment(self, value: float):
+        return self._set_attribute("WarpingMoment", value)
@@ -0,0 +1,5 @@
+from .ifcstructuralloadorresult import IfcStructuralLoadOrResult
+
+
+class IfcStructuralLoadStatic(IfcStructuralLoadOrResult):
+    """Wrapper class for IfcStructuralLoadStatic."""
@@ -0,0 +1,32 @@
+from .ifcstructuralloadstatic import IfcStructuralLoadStatic
+
+
+class IfcStructuralLoadTemperature(IfcStructuralLoadStatic):
+    """Wrapper class for IfcStructuralLoadTemperature."""
+
+    @property
+    def DeltaTConstant(self)-> float:
+        """<attribute DeltaTConstant?: <type IfcThermodynamicTemperatureMeasure: <real>>>"""
+        return self._get_attribute("DeltaTConstant")
+
+    @DeltaTConstant.setter
+    def DeltaTConstant(self, value: float):
+        return self._set_attribute("DeltaTConstant", value)
+
+    @property
+    def DeltaTY(self)-> float:
+        """<attribute DeltaTY?: <type IfcThermodynamicTemperatureMeasure: <real>>>"""
+        return self._get_attribute("DeltaTY")
+
+    @DeltaTY.setter
+    def DeltaTY(self, value: float):
+        return self._set_attribute("DeltaTY", value)
+
+    @property
+    def DeltaTZ(self)-> float:
+        """<attribute DeltaTZ?: <type IfcThermodynamicTemperatureMeasure: <real>>>"""
+        return self._get_attribute("DeltaTZ")
+
+    @DeltaTZ.setter
+    def DeltaTZ(self, value: float):
+        return self._set_attribute("DeltaTZ", value)
@@ -0,0 +1,12 @@
+from .ifcstructuralitem import IfcStructuralItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelconnectsstructuralmember import IfcRelConnectsStructuralMember
+
+class IfcStructuralMember(IfcStructuralItem):
+    """Wrapper class for IfcStructuralMember."""
+
+    def ConnectedBy(self)-> list["IfcRelConnectsStructuralMember"]:
+        """<inverse ConnectedBy: set [0:?] of <entity IfcRelConnectsStructuralMember> for <attribute RelatingStructuralMember: <entity IfcStructuralMember>>>"""
+        return self._get_inverse_attribute("ConnectedBy")
@@ -0,0 +1,5 @@
+from .ifcstructuralsurfaceaction import IfcStructuralSurfaceAction
+
+
+class IfcStructuralPlanarAction(IfcStructuralSurfaceAction):
+    """Wrapper class for IfcStructuralPlanarAction."""
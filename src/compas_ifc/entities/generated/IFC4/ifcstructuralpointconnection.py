@@ -0,0 +1,17 @@
+from .ifcstructuralconnection import IfcStructuralConnection
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaxis2placement3d import IfcAxis2Placement3D
+
+class IfcStructuralPointConnection(IfcStructuralConnection):
+    """Wrapper class for IfcStructuralPointConnection."""
+
+    @property
+    def ConditionCoordinateSystem(self)-> "IfcAxis2Placement3D":
+        """<attribute ConditionCoordinateSystem?: <entity IfcAxis2Placement3D>>"""
+        return self._get_attribute("ConditionCoordinateSystem")
+
+    @ConditionCoordinateSystem.setter
+    def ConditionCoordinateSystem(self, value: "IfcAxis2Placement3D"):
+        return self._set_attribute("ConditionCoordinateSystem", value)
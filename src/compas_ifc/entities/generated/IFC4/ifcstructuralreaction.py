@@ -0,0 +1,5 @@
+from .ifcstructuralactivity import IfcStructuralActivity
+
+
+class IfcStructuralReaction(IfcStructuralActivity):
+    """Wrapper class for IfcStructuralReaction."""
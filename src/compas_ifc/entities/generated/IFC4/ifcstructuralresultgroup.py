@@ -0,0 +1,41 @@
+from .ifcgroup import IfcGroup
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcanalysistheorytypeenum import IfcAnalysisTheoryTypeEnum
+    from .ifcstructuralanalysismodel import IfcStructuralAnalysisModel
+    from .ifcstructuralloadgroup import IfcStructuralLoadGroup
+
+class IfcStructuralResultGroup(IfcGroup):
+    """Wrapper class for IfcStructuralResultGroup."""
+
+    @property
+    def TheoryType(self)-> "IfcAnalysisTheoryTypeEnum":
+        """<attribute TheoryType: <enumeration IfcAnalysisTheoryTypeEnum: (FIRST_ORDER_THEORY, SECOND_ORDER_THEORY, THIRD_ORDER_THEORY, FULL_NONLINEAR_THEORY, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("TheoryType")
+
+    @TheoryType.setter
+    def TheoryType(self, value: "IfcAnalysisTheoryTypeEnum"):
+        return self._set_attribute("TheoryType", value)
+
+    @property
+    def ResultForLoadGroup(self)-> "IfcStructuralLoadGroup":
+        """<attribute ResultForLoadGroup?: <entity IfcStructuralLoadGroup>>"""
+        return self._get_attribute("ResultForLoadGroup")
+
+    @ResultForLoadGroup.setter
+    def ResultForLoadGroup(self, value: "IfcStructuralLoadGroup"):
+        return self._set_attribute("ResultForLoadGroup", value)
+
+    @property
+    def IsLinear(self)-> bool:
+        """<attribute IsLinear: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("IsLinear")
+
+    @IsLinear.setter
+    def IsLinear(self, value: bool):
+        return self._set_attribute("IsLinear", value)
+
+    def ResultGroupFor(self)-> list["IfcStructuralAnalysisModel"]:
+        """<inverse ResultGroupFor: set [0:1] of <entity IfcStructuralAnalysisModel> for <attribute HasResults?: <set [1:?] of <entity IfcStructuralResultGroup>>>>"""
+        return self._get_inverse_attribute("ResultGroupFor")
@@ -0,0 +1,27 @@
+from .ifcstructuralaction import IfcStructuralAction
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcprojectedortruelengthenum import IfcProjectedOrTrueLengthEnum
+    from .ifcstructuralsurfaceactivitytypeenum import IfcStructuralSurfaceActivityTypeEnum
+
+class IfcStructuralSurfaceAction(IfcStructuralAction):
+    """Wrapper class for IfcStructuralSurfaceAction."""
+
+    @property
+    def ProjectedOrTrue(self)-> "IfcProjectedOrTrueLengthEnum":
+        """<attribute ProjectedOrTrue?: <enumeration IfcProjectedOrTrueLengthEnum: (PROJECTED_LENGTH, TRUE_LENGTH)>>"""
+        return self._get_attribute("ProjectedOrTrue")
+
+    @ProjectedOrTrue.setter
+    def ProjectedOrTrue(self, value: "IfcProjectedOrTrueLengthEnum"):
+        return self._set_attribute("ProjectedOrTrue", value)
+
+    @property
+    def PredefinedType(self)-> "IfcStructuralSurfaceActivityTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcStructuralSurfaceActivityTypeEnum: (CONST, BILINEAR, DISCRETE, ISOCONTOUR, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcStructuralSurfaceActivityTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
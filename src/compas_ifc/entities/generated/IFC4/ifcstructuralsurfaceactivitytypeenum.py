@@ -0,0 +1,2 @@
+class IfcStructuralSurfaceActivityTypeEnum(str):
+    items = ['CONST', 'BILINEAR', 'DISCRETE', 'ISOCONTOUR', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,2 @@
+class IfcStructuralSurfaceMemberTypeEnum(str):
+    items = ['BENDING_ELEMENT', 'MEMBRANE_ELEMENT', 'SHELL', 'USERDEFINED', 'NOTDEFINED']
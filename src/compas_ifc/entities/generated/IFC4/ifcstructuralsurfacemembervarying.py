@@ -0,0 +1,5 @@
+from .ifcstructuralsurfacemember import IfcStructuralSurfaceMember
+
+
+class IfcStructuralSurfaceMemberVarying(IfcStructuralSurfaceMember):
+    """Wrapper class for IfcStructuralSurfaceMemberVarying."""
@@ -0,0 +1,17 @@
+from .ifcstructuralreaction import IfcStructuralReaction
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcstructuralsurfaceactivitytypeenum import IfcStructuralSurfaceActivityTypeEnum
+
+class IfcStructuralSurfaceReaction(IfcStructuralReaction):
+    """Wrapper class for IfcStructuralSurfaceReaction."""
+
+    @property
+    def PredefinedType(self)-> "IfcStructuralSurfaceActivityTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcStructuralSurfaceActivityTypeEnum: (CONST, BILINEAR, DISCRETE, ISOCONTOUR, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcStructuralSurfaceActivityTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
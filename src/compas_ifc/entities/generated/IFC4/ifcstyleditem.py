@@ -0,0 +1,38 @@
+from .ifcrepresentationitem import IfcRepresentationItem
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpresentationstyle import IfcPresentationStyle
+    from .ifcpresentationstyleassignment import IfcPresentationStyleAssignment
+    from .ifcrepresentationitem import IfcRepresentationItem
+
+class IfcStyledItem(IfcRepresentationItem):
+    """Wrapper class for IfcStyledItem."""
+
+    @property
+    def Item(self)-> "IfcRepresentationItem":
+        """<attribute Item?: <entity IfcRepresentationItem>>"""
+        return self._get_attribute("Item")
+
+    @Item.setter
+    def Item(self, value: "IfcRepresentationItem"):
+        return self._set_attribute("Item", value)
+
+    @property
+    def Styles(self)-> list[Union["IfcPresentationStyle", "IfcPresentationStyleAssignment"]]:
+        """<attribute Styles: <set [1:?] of <select IfcStyleAssignmentSelect: (<entity IfcPresentationStyle> | <entity IfcPresentationStyleAssignment>)>>>"""
+        return self._get_attribute("Styles")
+
+    @Styles.setter
+    def Styles(self, value: list[Union["IfcPresentationStyle", "IfcPresentationStyleAssignment"]]):
+        return self._set_attribute("Styles", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
@@ -0,0 +1,5 @@
+from .ifcstylemodel import IfcStyleModel
+
+
+class IfcStyledRepresentation(IfcStyleModel):
+    """Wrapper class for IfcStyledRepresentation."""
@@ -0,0 +1,5 @@
+from .ifcrepresentation import IfcRepresentation
+
+
+class IfcStyleModel(IfcRepresentation):
+    """Wrapper class for IfcStyleModel."""
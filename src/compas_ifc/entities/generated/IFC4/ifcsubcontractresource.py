@@ -0,0 +1,17 @@
+from .ifcconstructionresource import IfcConstructionResource
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcsubcontractresourcetypeenum import IfcSubContractResourceTypeEnum
+
+class IfcSubContractResource(IfcConstructionResource):
+    """Wrapper class for IfcSubContractResource."""
+
+    @property
+    def PredefinedType(self)-> "IfcSubContractResourceTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcSubContractResourceTypeEnum: (PURCHASE, WORK, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcSubContractResourceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
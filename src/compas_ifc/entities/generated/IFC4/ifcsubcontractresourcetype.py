@@ -0,0 +1,17 @@
+from .ifcconstructionresourcetype import IfcConstructionResourceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcsubcontractresourcetypeenum import IfcSubContractResourceTypeEnum
+
+class IfcSubContractResourceType(IfcConstructionResourceType):
+    """Wrapper class for IfcSubContractResourceType."""
+
+    @property
+    def PredefinedType(self)-> "IfcSubContractResourceTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcSubContractResourceTypeEnum: (PURCHASE, WORK, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcSubContractResourceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcSubContractResourceTypeEnum(str):
+    items = ['PURCHASE', 'WORK', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcedge import IfcEdge
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcedge import IfcEdge
+
+class IfcSubedge(IfcEdge):
+    """Wrapper class for IfcSubedge."""
+
+    @property
+    def ParentEdge(self)-> "IfcEdge":
+        """<attribute ParentEdge: <entity IfcEdge>>"""
+        return self._get_attribute("ParentEdge")
+
+    @ParentEdge.setter
+    def ParentEdge(self, value: "IfcEdge"):
+        return self._set_attribute("ParentEdge", value)
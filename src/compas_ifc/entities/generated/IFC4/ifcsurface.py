@@ -0,0 +1,5 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+
+class IfcSurface(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcSurface."""
@@ -0,0 +1,37 @@
+from .ifccurve import IfcCurve
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccurve import IfcCurve
+    from .ifcpcurve import IfcPcurve
+    from .ifcpreferredsurfacecurverepresentation import IfcPreferredSurfaceCurveRepresentation
+
+class IfcSurfaceCurve(IfcCurve):
+    """Wrapper class for IfcSurfaceCurve."""
+
+    @property
+    def Curve3D(self)-> "IfcCurve":
+        """<attribute Curve3D: <entity IfcCurve>>"""
+        return self._get_attribute("Curve3D")
+
+    @Curve3D.setter
+    def Curve3D(self, value: "IfcCurve"):
+        return self._set_attribute("Curve3D", value)
+
+    @property
+    def AssociatedGeometry(self)-> list["IfcPcurve"]:
+        """<attribute AssociatedGeometry: <list [1:2] of <entity IfcPcurve>>>"""
+        return self._get_attribute("AssociatedGeometry")
+
+    @AssociatedGeometry.setter
+    def AssociatedGeometry(self, value: list["IfcPcurve"]):
+        return self._set_attribute("AssociatedGeometry", value)
+
+    @property
+    def MasterRepresentation(self)-> "IfcPreferredSurfaceCurveRepresentation":
+        """<attribute MasterRepresentation: <enumeration IfcPreferredSurfaceCurveRepresentation: (CURVE3D, PCURVE_S1, PCURVE_S2)>>"""
+        return self._get_attribute("MasterRepresentation")
+
+    @MasterRepresentation.setter
+    def MasterRepresentation(self, value: "IfcPreferredSurfaceCurveRepresentation"):
+        return self._set_attribute("MasterRepresentation", value)
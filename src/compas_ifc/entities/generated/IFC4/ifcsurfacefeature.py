@@ -0,0 +1,17 @@
+from .ifcfeatureelement import IfcFeatureElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcsurfacefeaturetypeenum import IfcSurfaceFeatureTypeEnum
+
+class IfcSurfaceFeature(IfcFeatureElement):
+    """Wrapper class for IfcSurfaceFeature."""
+
+    @property
+    def PredefinedType(self)-> "IfcSurfaceFeatureTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcSurfaceFeatureTypeEnum: (MARK, TAG, TREATMENT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcSurfaceFeatureTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcSurfaceFeatureTypeEnum(str):
+    items = ['MARK', 'TAG', 'TREATMENT', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,32 @@
+from .ifcstructuralloadorresult import IfcStructuralLoadOrResult
+
+
+class IfcSurfaceReinforcementArea(IfcStructuralLoadOrResult):
+    """Wrapper class for IfcSurfaceReinforcementArea."""
+
+    @property
+    def SurfaceReinforcement1(self)-> list[float]:
+        """<attribute SurfaceReinforcement1?: <list [2:3] of <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("SurfaceReinforcement1")
+
+    @SurfaceReinforcement1.setter
+    def SurfaceReinforcement1(self, value: list[float]):
+        return self._set_attribute("SurfaceReinforcement1", value)
+
+    @property
+    def SurfaceReinforcement2(self)-> list[float]:
+        """<attribute SurfaceReinforcement2?: <list [2:3] of <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("SurfaceReinforcement2")
+
+    @SurfaceReinforcement2.setter
+    def SurfaceReinforcement2(self, value: list[float]):
+        return self._set_attribute("SurfaceReinforcement2", value)
+
+    @property
+    def ShearReinforcement(self)-> float:
+        """<attribute ShearReinforcement?: <type IfcRatioMeasure: <real>>>"""
+        return self._get_attribute("ShearReinforcement")
+
+    @ShearReinforcement.setter
+    def ShearReinforcement(self, value: float):
+        return self._set_attribute("ShearReinforcement", value)
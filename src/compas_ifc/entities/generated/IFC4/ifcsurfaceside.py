@@ -0,0 +1,2 @@
+class IfcSurfaceSide(str):
+    items = ['POSITIVE', 'NEGATIVE', 'BOTH']
@@ -0,0 +1,44 @@
+from .ifcpresentationitem import IfcPresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccolourrgb import IfcColourRgb
+
+class IfcSurfaceStyleLighting(IfcPresentationItem):
+    """Wrapper class for IfcSurfaceStyleLighting."""
+
+    @property
+    def DiffuseTransmissionColour(self)-> "IfcColourRgb":
+        """<attribute DiffuseTransmissionColour: <entity IfcColourRgb>>"""
+        return self._get_attribute("DiffuseTransmissionColour")
+
+    @DiffuseTransmissionColour.setter
+    def DiffuseTransmissionColour(self, value: "IfcColourRgb"):
+        return self._set_attribute("DiffuseTransmissionColour", value)
+
+    @property
+    def DiffuseReflectionColour(self)-> "IfcColourRgb":
+        """<attribute DiffuseReflectionColour: <entity IfcColourRgb>>"""
+        return self._get_attribute("DiffuseReflectionColour")
+
+    @DiffuseReflectionColour.setter
+    def DiffuseReflectionColour(self, value: "IfcColourRgb"):
+        return self._set_attribute("DiffuseReflectionColour", value)
+
+    @property
+    def TransmissionColour(self)-> "IfcColourRgb":
+        """<attribute TransmissionColour: <entity IfcColourRgb>>"""
+        return self._get_attribute("TransmissionColour")
+
+    @TransmissionColour.setter
+    def TransmissionColour(self, value: "IfcColourRgb"):
+        return self._set_attribute("TransmissionColour", value)
+
+    @property
+    def ReflectanceColour(self)-> "IfcColourRgb":
+        """<attribute ReflectanceColour: <entity IfcColourRgb>>"""
+        return self._get_attribute("ReflectanceColour")
+
+    @ReflectanceColour.setter
+    def ReflectanceColour(self, value: "IfcColourRgb"):
+        return self._set_attribute("ReflectanceColour", value)
@@ -0,0 +1,23 @@
+from .ifcpresentationitem import IfcPresentationItem
+
+
+class IfcSurfaceStyleRefraction(IfcPresentationItem):
+    """Wrapper class for IfcSurfaceStyleRefraction."""
+
+    @property
+    def RefractionIndex(self)-> float:
+        """<attribute RefractionIndex?: <type IfcReal: <real>>>"""
+        return self._get_attribute("RefractionIndex")
+
+    @RefractionIndex.setter
+    def RefractionIndex(self, value: float):
+        return self._set_attribute("RefractionIndex", value)
+
+    @property
+    def DispersionFactor(self)-> float:
+        """<attribute DispersionFactor?: <type IfcReal: <real>>>"""
+        return self._get_attribute("DispersionFactor")
+
+    @DispersionFactor.setter
+    def DispersionFactor(self, value: float):
+        return self._set_attribute("DispersionFactor", value)
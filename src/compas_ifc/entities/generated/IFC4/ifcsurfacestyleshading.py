@@ -0,0 +1,26 @@
+from .ifcpresentationitem import IfcPresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccolourrgb import IfcColourRgb
+
+class IfcSurfaceStyleShading(IfcPresentationItem):
+    """Wrapper class for IfcSurfaceStyleShading."""
+
+    @property
+    def SurfaceColour(self)-> "IfcColourRgb":
+        """<attribute SurfaceColour: <entity IfcColourRgb>>"""
+        return self._get_attribute("SurfaceColour")
+
+    @SurfaceColour.setter
+    def SurfaceColour(self, value: "IfcColourRgb"):
+        return self._set_attribute("SurfaceColour", value)
+
+    @property
+    def Transparency(self)-> float:
+        """<attribute Transparency?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("Transparency")
+
+    @Transparency.setter
+    def Transparency(self, value: float):
+        return self._set_attribute("Transparency", value)
@@ -0,0 +1,63 @@
+from .ifcpresentationitem import IfcPresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccartesiantransformationoperator2d import IfcCartesianTransformationOperator2D
+    from .ifcsurfacestylewithtextures import IfcSurfaceStyleWithTextures
+    from .ifctexturecoordinate import IfcTextureCoordinate
+
+class IfcSurfaceTexture(IfcPresentationItem):
+    """Wrapper class for IfcSurfaceTexture."""
+
+    @property
+    def RepeatS(self)-> bool:
+        """<attribute RepeatS: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("RepeatS")
+
+    @RepeatS.setter
+    def RepeatS(self, value: bool):
+        return self._set_attribute("RepeatS", value)
+
+    @property
+    def RepeatT(self)-> bool:
+        """<attribute RepeatT: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("RepeatT")
+
+    @RepeatT.setter
+    def RepeatT(self, value: bool):
+        return self._set_attribute("RepeatT", value)
+
+    @property
+    def Mode(self)-> str:
+        """<attribute Mode?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Mode")
+
+    @Mode.setter
+    def Mode(self, value: str):
+        return self._set_attribute("Mode", value)
+
+    @property
+    def TextureTransform(self)-> "IfcCartesianTransformationOperator2D":
+        """<attribute TextureTransform?: <entity IfcCartesianTransformationOperator2D>>"""
+        return self._get_attribute("TextureTransform")
+
+    @TextureTransform.setter
+    def TextureTransform(self, value: "IfcCartesianTransformationOperator2D"):
+        return self._set_attribute("TextureTransform", value)
+
+    @property
+    def Parameter(self)-> list[str]:
+        """<attribute Parameter?: <list [1:?] of <type IfcIdentifier: <string>>>>"""
+        return self._get_attribute("Parameter")
+
+    @Parameter.setter
+    def Parameter(self, value: list[str]):
+        return self._set_attribute("Parameter", value)
+
+    def IsMappedBy(self)-> list["IfcTextureCoordinate"]:
+        """<inverse IsMappedBy: set [0:?] of <entity IfcTextureCoordinate> for <attribute Maps: <list [1:?] of <entity IfcSurfaceTexture>>>>"""
+        return self._get_inverse_attribute("IsMappedBy")
+
+    def UsedInStyles(self)-> list["IfcSurfaceStyleWithTextures"]:
+        """<inverse UsedInStyles: set [0:?] of <entity IfcSurfaceStyleWithTextures> for <attribute Textures: <list [1:?] of <entity IfcSurfaceTexture>>>>"""
+        return self._get_inverse_attribute("UsedInStyles")
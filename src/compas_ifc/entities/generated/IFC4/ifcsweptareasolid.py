@@ -0,0 +1,27 @@
+from .ifcsolidmodel import IfcSolidModel
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaxis2placement3d import IfcAxis2Placement3D
+    from .ifcprofiledef import IfcProfileDef
+
+class IfcSweptAreaSolid(IfcSolidModel):
+    """Wrapper class for IfcSweptAreaSolid."""
+
+    @property
+    def SweptArea(self)-> "IfcProfileDef":
+        """<attribute SweptArea: <entity IfcProfileDef>>"""
+        return self._get_attribute("SweptArea")
+
+    @SweptArea.setter
+    def SweptArea(self, value: "IfcProfileDef"):
+        return self._set_attribute("SweptArea", value)
+
+    @property
+    def Position(self)-> "IfcAxis2Placement3D":
+        """<attribute Position?: <entity IfcAxis2Placement3D>>"""
+        return self._get_attribute("Position")
+
+    @Position.setter
+    def Position(self, value: "IfcAxis2Placement3D"):
+        return self._set_attribute("Position", value)
@@ -0,0 +1,53 @@
+from .ifcsolidmodel import IfcSolidModel
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccurve import IfcCurve
+
+class IfcSweptDiskSolid(IfcSolidModel):
+    """Wrapper class for IfcSweptDiskSolid."""
+
+    @property
+    def Directrix(self)-> "IfcCurve":
+        """<attribute Directrix: <entity IfcCurve>>"""
+        return self._get_attribute("Directrix")
+
+    @Directrix.setter
+    def Directrix(self, value: "IfcCurve"):
+        return self._set_attribute("Directrix", value)
+
+    @property
+    def Radius(self)-> float:
+        """<attribute Radius: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Radius")
+
+    @Radius.setter
+    def Radius(self, value: float):
+        return self._set_attribute("Radius", value)
+
+    @property
+    def InnerRadius(self)-> float:
+        """<attribute InnerRadius?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("InnerRadius")
+
+    @InnerRadius.setter
+    def InnerRadius(self, value: float):
+        return self._set_attribute("InnerRadius", value)
+
+    @property
+    def StartParam(self)-> float:
+        """<attribute StartParam?: <type IfcParameterValue: <real>>>"""
+        return self._get_attribute("StartParam")
+
+    @StartParam.setter
+    def StartParam(self, value: float):
+        return self._set_attribute("StartParam", value)
+
+    @property
+    def EndParam(self)-> float:
+        """<attribute EndParam?: <type IfcParameterValue: <real>>>"""
+        return self._get_attribute("EndParam")
+
+    @EndParam.setter
+    def EndParam(self, value: float):
+        return self._set_attribute("EndParam", value)
@@ -0,0 +1,14 @@
+from .ifcsweptdisksolid import IfcSweptDiskSolid
+
+
+class IfcSweptDiskSolidPolygonal(IfcSweptDiskSolid):
+    """Wrapper class for IfcSweptDiskSolidPolygonal."""
+
+    @property
+    def FilletRadius(self)-> float:
+        """<attribute FilletRadius?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("FilletRadius")
+
+    @FilletRadius.setter
+    def FilletRadius(self, value: float):
+        return self._set_attribute("FilletRadius", value)
@@ -0,0 +1,17 @@
+from .ifcflowcontroller import IfcFlowController
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcswitchingdevicetypeenum import IfcSwitchingDeviceTypeEnum
+
+class IfcSwitchingDevice(IfcFlowController):
+    """Wrapper class for IfcSwitchingDevice."""
+
+    @property
+    def PredefinedType(self)-> "IfcSwitchingDeviceTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcSwitchingDeviceTypeEnum: (CONTACTOR, DIMMERSWITCH, EMERGENCYSTOP, KEYPAD, MOMENTARYSWITCH, SELECTORSWITCH, STARTER, SWITCHDISCONNECTOR, TOGGLESWITCH, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcSwitchingDeviceTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcSwitchingDeviceTypeEnum(str):
+    items = ['CONTACTOR', 'DIMMERSWITCH', 'EMERGENCYSTOP', 'KEYPAD', 'MOMENTARYSWITCH', 'SELECTORSWITCH', 'STARTER', 'SWITCHDISCONNECTOR', 'TOGGLESWITCH', 'USERDEFINED', 'NOTDEFINED']
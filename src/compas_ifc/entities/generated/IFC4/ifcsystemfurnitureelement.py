@@ -0,0 +1,17 @@
+from .ifcfurnishingelement import IfcFurnishingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcsystemfurnitureelementtypeenum import IfcSystemFurnitureElementTypeEnum
+
+class IfcSystemFurnitureElement(IfcFurnishingElement):
+    """Wrapper class for IfcSystemFurnitureElement."""
+
+    @property
+    def PredefinedType(self)-> "IfcSystemFurnitureElementTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcSystemFurnitureElementTypeEnum: (PANEL, WORKSURFACE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcSystemFurnitureElementTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,17 @@
+from .ifcfurnishingelementtype import IfcFurnishingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcsystemfurnitureelementtypeenum import IfcSystemFurnitureElementTypeEnum
+
+class IfcSystemFurnitureElementType(IfcFurnishingElementType):
+    """Wrapper class for IfcSystemFurnitureElementType."""
+
+    @property
+    def PredefinedType(self)-> "IfcSystemFurnitureElementTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcSystemFurnitureElementTypeEnum: (PANEL, WORKSURFACE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcSystemFurnitureElementTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
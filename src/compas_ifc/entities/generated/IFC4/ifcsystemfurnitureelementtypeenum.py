@@ -0,0 +1,2 @@
+class IfcSystemFurnitureElementTypeEnum(str):
+    items = ['PANEL', 'WORKSURFACE', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,36 @@
+from compas_ifc.entities.base import Base
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctablecolumn import IfcTableColumn
+    from .ifctablerow import IfcTableRow
+
+class IfcTable(Base):
+    """Wrapper class for IfcTable."""
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Rows(self)-> list["IfcTableRow"]:
+        """<attribute Rows?: <list [1:?] of <entity IfcTableRow>>>"""
+        return self._get_attribute("Rows")
+
+    @Rows.setter
+    def Rows(self, value: list["IfcTableRow"]):
+        return self._set_attribute("Rows", value)
+
+    @property
+    def Columns(self)-> list["IfcTableColumn"]:
+        """<attribute Columns?: <list [1:?] of <entity IfcTableColumn>>>"""
+        return self._get_attribute("Columns")
+
+    @Columns.setter
+    def Columns(self, value: list["IfcTableColumn"]):
+        return self._set_attribute("Columns", value)
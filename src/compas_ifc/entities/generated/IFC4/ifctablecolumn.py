@@ -0,0 +1,57 @@
+from compas_ifc.entities.base import Base
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcderivedunit import IfcDerivedUnit
+    from .ifcmonetaryunit import IfcMonetaryUnit
+    from .ifcnamedunit import IfcNamedUnit
+    from .ifcreference import IfcReference
+
+class IfcTableColumn(Base):
+    """Wrapper class for IfcTableColumn."""
+
+    @property
+    def Identifier(self)-> str:
+        """<attribute Identifier?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Identifier")
+
+    @Identifier.setter
+    def Identifier(self, value: str):
+        return self._set_attribute("Identifier", value)
+
+    @property
+    def Name(self)-> str:
+        """<attribute Name?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Name")
+
+    @Name.setter
+    def Name(self, value: str):
+        return self._set_attribute("Name", value)
+
+    @property
+    def Description(self)-> str:
+        """<attribute Description?: <type IfcText: <string>>>"""
+        return self._get_attribute("Description")
+
+    @Description.setter
+    def Description(self, value: str):
+        return self._set_attribute("Description", value)
+
+    @property
+    def Unit(self)-> Union["IfcDerivedUnit", "IfcNamedUnit", "IfcMonetaryUnit"]:
+        """<attribute Unit?: <select IfcUnit: (<entity IfcDerivedUnit> | <entity IfcMonetaryUnit> | <entity IfcNamedUnit>)>>"""
+        return self._get_attribute("Unit")
+
+    @Unit.setter
+    def Unit(self, value: Union["IfcDerivedUnit", "IfcNamedUnit", "IfcMonetaryUnit"]):
+        return self._set_attribute("Unit", value)
+
+    @property
+    def ReferencePath(self)-> "IfcReference":
+        """<attribute ReferencePath?: <entity IfcReference>>"""
+        return self._get_attribute("ReferencePath")
+
+    @ReferencePath.setter
+    def ReferencePath(self, value: "IfcReference"):
+        return self._set_attribute("ReferencePath", value)
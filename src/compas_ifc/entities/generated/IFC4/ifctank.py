@@ -0,0 +1,17 @@
+from .ifcflowstoragedevice import IfcFlowStorageDevice
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctanktypeenum import IfcTankTypeEnum
+
+class IfcTank(IfcFlowStorageDevice):
+    """Wrapper class for IfcTank."""
+
+    @property
+    def PredefinedType(self)-> "IfcTankTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcTankTypeEnum: (BASIN, BREAKPRESSURE, EXPANSION, FEEDANDEXPANSION, PRESSUREVESSEL, STORAGE, VESSEL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcTankTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,17 @@
+from .ifcflowstoragedevicetype import IfcFlowStorageDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctanktypeenum import IfcTankTypeEnum
+
+class IfcTankType(IfcFlowStorageDeviceType):
+    """Wrapper class for IfcTankType."""
+
+    @property
+    def PredefinedType(self)-> "IfcTankTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcTankTypeEnum: (BASIN, BREAKPRESSURE, EXPANSION, FEEDANDEXPANSION, PRESSUREVESSEL, STORAGE, VESSEL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcTankTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcTankTypeEnum(str):
+    items = ['BASIN', 'BREAKPRESSURE', 'EXPANSION', 'FEEDANDEXPANSION', 'PRESSUREVESSEL', 'STORAGE', 'VESSEL', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,63 @@
+from .ifcprocess import IfcProcess
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctasktime import IfcTaskTime
+    from .ifctasktypeenum import IfcTaskTypeEnum
+
+class IfcTask(IfcProcess):
+    """Wrapper class for IfcTask."""
+
+    @property
+    def Status(self)-> str:
+        """<attribute Status?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Status")
+
+    @Status.setter
+    def Status(self, value: str):
+        return self._set_attribute("Status", value)
+
+    @property
+    def WorkMethod(self)-> str:
+        """<attribute WorkMethod?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("WorkMethod")
+
+    @WorkMethod.setter
+    def WorkMethod(self, value: str):
+        return self._set_attribute("WorkMethod", value)
+
+    @property
+    def IsMilestone(self)-> bool:
+        """<attribute IsMilestone: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("IsMilestone")
+
+    @IsMilestone.setter
+    def IsMilestone(self, value: bool):
+        return self._set_attribute("IsMilestone", value)
+
+    @property
+    def Priority(self)-> int:
+        """<attribute Priority?: <type IfcInteger: <integer>>>"""
+        return self._get_attribute("Priority")
+
+    @Priority.setter
+    def Priority(self, value: int):
+        return self._set_attribute("Priority", value)
+
+    @property
+    def TaskTime(self)-> "IfcTaskTime":
+        """<attribute TaskTime?: <entity IfcTaskTime>>"""
+        return self._get_attribute("TaskTime")
+
+    @TaskTime.setter
+    def TaskTime(self, value: "IfcTaskTime"):
+        return self._set_attribute("TaskTime", value)
+
+    @property
+    def PredefinedType(self)-> "IfcTaskTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcTaskTypeEnum: (ATTENDANCE, CONSTRUCTION, DEMOLITION, DISMANTLE, DISPOSAL, INSTALLATION, LOGISTIC, MAINTENANCE, MOVE, OPERATION, REMOVAL, RENOVATION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcTaskTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcTaskDurationEnum(str):
+    items = ['ELAPSEDTIME', 'WORKTIME', 'NOTDEFINED']
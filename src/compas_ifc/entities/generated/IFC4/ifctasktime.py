@@ -0,0 +1,161 @@
+from .ifcschedulingtime import IfcSchedulingTime
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctaskdurationenum import IfcTaskDurationEnum
+
+class IfcTaskTime(IfcSchedulingTime):
+    """Wrapper class for IfcTaskTime."""
+
+    @property
+    def DurationType(self)-> "IfcTaskDurationEnum":
+        """<attribute DurationType?: <enumeration IfcTaskDurationEnum: (ELAPSEDTIME, WORKTIME, NOTDEFINED)>>"""
+        return self._get_attribute("DurationType")
+
+    @DurationType.setter
+    def DurationType(self, value: "IfcTaskDurationEnum"):
+        return self._set_attribute("DurationType", value)
+
+    @property
+    def ScheduleDuration(self)-> str:
+        """<attribute ScheduleDuration?: <type IfcDuration: <string>>>"""
+        return self._get_attribute("ScheduleDuration")
+
+    @ScheduleDuration.setter
+    def ScheduleDuration(self, value: str):
+        return self._set_attribute("ScheduleDuration", value)
+
+    @property
+    def ScheduleStart(self)-> str:
+        """<attribute ScheduleStart?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("ScheduleStart")
+
+    @ScheduleStart.setter
+    def ScheduleStart(self, value: str):
+        return self._set_attribute("ScheduleStart", value)
+
+    @property
+    def ScheduleFinish(self)-> str:
+        """<attribute ScheduleFinish?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("ScheduleFinish")
+
+    @ScheduleFinish.setter
+    def ScheduleFinish(self, value: str):
+        return self._set_attribute("ScheduleFinish", value)
+
+    @property
+    def EarlyStart(self)-> str:
+        """<attribute EarlyStart?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("EarlyStart")
+
+    @EarlyStart.setter
+    def EarlyStart(self, value: str):
+        return self._set_attribute("EarlyStart", value)
+
+    @property
+    def EarlyFinish(self)-> str:
+        """<attribute EarlyFinish?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("EarlyFinish")
+
+    @EarlyFinish.setter
+    def EarlyFinish(self, value: str):
+        return self._set_attribute("EarlyFinish", value)
+
+    @property
+    def LateStart(self)-> str:
+        """<attribute LateStart?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("LateStart")
+
+    @LateStart.setter
+    def LateStart(self, value: str):
+        return self._set_attribute("LateStart", value)
+
+    @property
+    def LateFinish(self)-> str:
+        """<attribute LateFinish?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("LateFinish")
+
+    @LateFinish.setter
+    def LateFinish(self, value: str):
+        return self._set_attribute("LateFinish", value)
+
+    @property
+    def FreeFloat(self)-> str:
+        """<attribute FreeFloat?: <type IfcDuration: <string>>>"""
+        return self._get_attribute("FreeFloat")
+
+    @FreeFloat.setter
+    def FreeFloat(self, value: str):
+        return self._set_attribute("FreeFloat", value)
+
+    @property
+    def TotalFloat(self)-> str:
+        """<attribute TotalFloat?: <type IfcDuration: <string>>>"""
+        return self._get_attribute("TotalFloat")
+
+    @TotalFloat.setter
+    def TotalFloat(self, value: str):
+        return self._set_attribute("TotalFloat", value)
+
+    @property
+    def IsCritical(self)-> bool:
+        """<attribute IsCritical?: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("IsCritical")
+
+    @IsCritical.setter
+    def IsCritical(self, value: bool):
+        return self._set_attribute("IsCritical", value)
+
+    @property
+    def StatusTime(self)-> str:
+        """<attribute StatusTime?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("StatusTime")
+
+    @StatusTime.setter
+    def StatusTime(self, value: str):
+        return self._set_attribute("StatusTime", value)
+
+    @property
+    def ActualDuration(self)-> str:
+        """<attribute ActualDuration?: <type IfcDuration: <string>>>"""
+        return self._get_attribute("ActualDuration")
+
+    @ActualDuration.setter
+    def ActualDuration(self, value: str):
+        return self._set_attribute("ActualDuration", value)
+
+    @property
+    def ActualStart(self)-> str:
+        """<attribute ActualStart?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("ActualStart")
+
+    @ActualStart.setter
+    def ActualStart(self, value: str):
+        return self._set_attribute("ActualStart", value)
+
+    @property
+    def ActualFinish(self)-> str:
+        """<attribute ActualFinish?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("ActualFinish")
+
+    @ActualFinish.setter
+    def ActualFinish(self, value: str):
+        return self._set_attribute("ActualFinish", value)
+
+    @property
+    def RemainingTime(self)-> str:
+        """<attribute RemainingTime?: <type IfcDuration: <string>>>"""
+        return self._get_attribute("RemainingTime")
+
+    @RemainingTime.setter
+    def RemainingTime(self, value: str):
+        return self._set_attribute("RemainingTime", value)
+
+    @property
+    def Completion(self)-> float:
+        """<attribute Completion?: <type IfcPositiveRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("Completion")
+
+    @Completion.setter
+    def Completion(self, value: float):
+        return self._set_attribute("Completion", value)
@@ -0,0 +1,17 @@
+from .ifctasktime import IfcTaskTime
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrecurrencepattern import IfcRecurrencePattern
+
+class IfcTaskTimeRecurring(IfcTaskTime):
+    """Wrapper class for IfcTaskTimeRecurring."""
+
+    @property
+    def Recurrence(self)-> "IfcRecurrencePattern":
+        """<attribute Recurrence: <entity IfcRecurrencePattern>>"""
+        return self._get_attribute("Recurrence")
+
+    @Recurrence.setter
+    def Recurrence(self, value: "IfcRecurrencePattern"):
+        return self._set_attribute("Recurrence", value)
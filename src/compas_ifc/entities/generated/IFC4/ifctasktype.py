@@ -0,0 +1,26 @@
+from .ifctypeprocess import IfcTypeProcess
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctasktypeenum import IfcTaskTypeEnum
+
+class IfcTaskType(IfcTypeProcess):
+    """Wrapper class for IfcTaskType."""
+
+    @property
+    def PredefinedType(self)-> "IfcTaskTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcTaskTypeEnum: (ATTENDANCE, CONSTRUCTION, DEMOLITION, DISMANTLE, DISPOSAL, INSTALLATION, LOGISTIC, MAINTENANCE, MOVE, OPERATION, REMOVAL, RENOVATION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcTaskTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def WorkMethod(self)-> str:
+        """<attribute WorkMethod?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("WorkMethod")
+
+    @WorkMethod.setter
+    def WorkMethod(self, value: str):
+        return self._set_attribute("WorkMethod", value)
@@ -0,0 +1,59 @@
+from .ifcaddress import IfcAddress
+
+
+class IfcTelecomAddress(IfcAddress):
+    """Wrapper class for IfcTelecomAddress."""
+
+    @property
+    def TelephoneNumbers(self)-> list[str]:
+        """<attribute TelephoneNumbers?: <list [1:?] of <type IfcLabel: <string>>>>"""
+        return self._get_attribute("TelephoneNumbers")
+
+    @TelephoneNumbers.setter
+    def TelephoneNumbers(self, value: list[str]):
+        return self._set_attribute("TelephoneNumbers", value)
+
+    @property
+    def FacsimileNumbers(self)-> list[str]:
+        """<attribute FacsimileNumbers?: <list [1:?] of <type IfcLabel: <string>>>>"""
+        return self._get_attribute("FacsimileNumbers")
+
+    @FacsimileNumbers.setter
+    def FacsimileNumbers(self, value: list[str]):
+        return self._set_attribute("FacsimileNumbers", value)
+
+    @property
+    def PagerNumber(self)-> str:
+        """<attribute PagerNumber?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("PagerNumber")
+
+    @PagerNumber.setter
+    def PagerNumber(self, value: str):
+        return self._set_attribute("PagerNumber", value)
+
+    @property
+    def ElectronicMailAddresses(self)-> list[str]:
+        """<attribute ElectronicMailAddresses?: <list [1:?] of <type IfcLabel: <string>>>>"""
+        return self._get_attribute("ElectronicMailAddresses")
+
+    @ElectronicMailAddresses.setter
+    def ElectronicMailAddresses(self, value: list[str]):
+        return self._set_attribute("ElectronicMailAddresses", value)
+
+    @property
+    def WWWHomePageURL(self)-> str:
+        """<attribute WWWHomePageURL?: <type IfcURIReference: <string>>>"""
+        return self._get_attribute("WWWHomePageURL")
+
+    @WWWHomePageURL.setter
+    def WWWHomePageURL(self, value: str):
+        return self._set_attribute("WWWHomePageURL", value)
+
+    @property
+    def MessagingIDs(self)-> list[str]:
+        """<attribute MessagingIDs?: <list [1:?] of <type IfcURIReference: <string>>>>"""
+        return self._get_attribute("MessagingIDs")
+
+    @MessagingIDs.setter
+    def MessagingIDs(self, value: list[str]):
+        return self._set_attribute("MessagingIDs", value)
@@ -0,0 +1,80 @@
+from .ifcreinforcingelement import IfcReinforcingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctendontypeenum import IfcTendonTypeEnum
+
+class IfcTendon(IfcReinforcingElement):
+    """Wrapper class for IfcTendon."""
+
+    @property
+    def PredefinedType(self)-> "IfcTendonTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcTendonTypeEnum: (BAR, COATED, STRAND, WIRE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcTendonTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def NominalDiameter(self)-> float:
+        """<attribute NominalDiameter?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("NominalDiameter")
+
+    @NominalDiameter.setter
+    def NominalDiameter(self, value: float):
+        return self._set_attribute("NominalDiameter", value)
+
+    @property
+    def CrossSectionArea(self)-> float:
+        """<attribute CrossSectionArea?: <type IfcAreaMeasure: <real>>>"""
+        return self._get_attribute("CrossSectionArea")
+
+    @CrossSectionArea.setter
+    def CrossSectionArea(self, value: float):
+        return self._set_attribute("CrossSectionArea", value)
+
+    @property
+    def TensionForce(self)-> float:
+        """<attribute TensionForce?: <type IfcForceMeasure: <real>>>"""
+        return self._get_attribute("TensionForce")
+
+    @TensionForce.setter
+    def TensionForce(self, value: float):
+        return self._set_attribute("TensionForce", value)
+
+    @property
+    def PreStress(self)-> float:
+        """<attribute PreStress?: <type IfcPressureMeasure: <real>>>"""
+        return self._get_attribute("PreStress")
+
+    @PreStress.setter
+    def PreStress(self, value: float):
+        return self._set_attribute("PreStress", value)
+
+    @property
+    def FrictionCoefficient(self)-> float:
+        """<attribute FrictionCoefficient?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("FrictionCoefficient")
+
+    @FrictionCoefficient.setter
+    def FrictionCoefficient(self, value: float):
+        return self._set_attribute("FrictionCoefficient", value)
+
+    @property
+    def AnchorageSlip(self)-> float:
+        """<attribute AnchorageSlip?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("AnchorageSlip")
+
+    @AnchorageSlip.setter
+    def AnchorageSlip(self, value: float):
+        return self._set_attribute("AnchorageSlip", value)
+
+    @property
+    def MinCurvatureRadius(self)-> float:
+        """<attribute MinCurvatureRadius?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("MinCurvatureRadius")
+
+    @MinCurvatureRadius.setter
+    def MinCurvatureRadius(self, value: float):
+        return self._set_attribute("MinCurvatureRadius", value)
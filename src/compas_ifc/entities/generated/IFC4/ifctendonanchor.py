@@ -0,0 +1,17 @@
+from .ifcreinforcingelement import IfcReinforcingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctendonanchortypeenum import IfcTendonAnchorTypeEnum
+
+class IfcTendonAnchor(IfcReinforcingElement):
+    """Wrapper class for IfcTendonAnchor."""
+
+    @property
+    def PredefinedType(self)-> "IfcTendonAnchorTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcTendonAnchorTypeEnum: (COUPLER, FIXED_END, TENSIONING_END, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcTendonAnchorTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,17 @@
+from .ifcreinforcingelementtype import IfcReinforcingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctendonanchortypeenum import IfcTendonAnchorTypeEnum
+
+class IfcTendonAnchorType(IfcReinforcingElementType):
+    """Wrapper class for IfcTendonAnchorType."""
+
+    @property
+    def PredefinedType(self)-> "IfcTendonAnchorTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcTendonAnchorTypeEnum: (COUPLER, FIXED_END, TENSIONING_END, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcTendonAnchorTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcTendonAnchorTypeEnum(str):
+    items = ['COUPLER', 'FIXED_END', 'TENSIONING_END', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,44 @@
+from .ifcreinforcingelementtype import IfcReinforcingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctendontypeenum import IfcTendonTypeEnum
+
+class IfcTendonType(IfcReinforcingElementType):
+    """Wrapper class for IfcTendonType."""
+
+    @property
+    def PredefinedType(self)-> "IfcTendonTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcTendonTypeEnum: (BAR, COATED, STRAND, WIRE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcTendonTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def NominalDiameter(self)-> float:
+        """<attribute NominalDiameter?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("NominalDiameter")
+
+    @NominalDiameter.setter
+    def NominalDiameter(self, value: float):
+        return self._set_attribute("NominalDiameter", value)
+
+    @property
+    def CrossSectionArea(self)-> float:
+        """<attribute CrossSectionArea?: <type IfcAreaMeasure: <real>>>"""
+        return self._get_attribute("CrossSectionArea")
+
+    @CrossSectionArea.setter
+    def CrossSectionArea(self, value: float):
+        return self._set_attribute("CrossSectionArea", value)
+
+    @property
+    def SheathDiameter(self)-> float:
+        """<attribute SheathDiameter?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("SheathDiameter")
+
+    @SheathDiameter.setter
+    def SheathDiameter(self, value: float):
+        return self._set_attribute("SheathDiameter", value)
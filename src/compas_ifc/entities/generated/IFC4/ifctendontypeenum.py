@@ -0,0 +1,2 @@
+class IfcTendonTypeEnum(str):
+    items = ['BAR', 'COATED', 'STRAND', 'WIRE', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,27 @@
+from .ifctessellateditem import IfcTessellatedItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifccartesianpointlist3d import IfcCartesianPointList3D
+    from .ifcindexedcolourmap import IfcIndexedColourMap
+    from .ifcindexedtexturemap import IfcIndexedTextureMap
+
+class IfcTessellatedFaceSet(IfcTessellatedItem):
+    """Wrapper class for IfcTessellatedFaceSet."""
+
+    @property
+    def Coordinates(self)-> "IfcCartesianPointList3D":
+        """<attribute Coordinates: <entity IfcCartesianPointList3D>>"""
+        return self._get_attribute("Coordinates")
+
+    @Coordinates.setter
+    def Coordinates(self, value: "IfcCartesianPointList3D"):
+        return self._set_attribute("Coordinates", value)
+
+    def HasColours(self)-> list["IfcIndexedColourMap"]:
+        """<inverse HasColours: set [0:1] of <entity IfcIndexedColourMap> for <attribute MappedTo: <entity IfcTessellatedFaceSet>>>"""
+        return self._get_inverse_attribute("HasColours")
+
+    def HasTextures(self)-> list["IfcIndexedTextureMap"]:
+        """<inverse HasTextures: set [0:?] of <entity IfcIndexedTextureMap> for <attribute MappedTo: <entity IfcTessellatedFaceSet>>>"""
+        return self._get_inverse_attribute("HasTextures")
@@ -0,0 +1,5 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+
+class IfcTessellatedItem(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcTessellatedItem."""
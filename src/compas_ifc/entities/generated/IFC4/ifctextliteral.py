@@ -0,0 +1,38 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcaxis2placement2d import IfcAxis2Placement2D
+    from .ifcaxis2placement3d import IfcAxis2Placement3D
+    from .ifctextpath import IfcTextPath
+
+class IfcTextLiteral(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcTextLiteral."""
+
+    @property
+    def Literal(self)-> str:
+        """<attribute Literal: <type IfcPresentableText: <string>>>"""
+        return self._get_attribute("Literal")
+
+    @Literal.setter
+    def Literal(self, value: str):
+        return self._set_attribute("Literal", value)
+
+    @property
+    def Placement(self)-> Union["IfcAxis2Placement3D", "IfcAxis2Placement2D"]:
+        """<attribute Placement: <select IfcAxis2Placement: (<entity IfcAxis2Placement2D> | <entity IfcAxis2Placement3D>)>>"""
+        return self._get_attribute("Placement")
+
+    @Placement.setter
+    def Placement(self, value: Union["IfcAxis2Placement3D", "IfcAxis2Placement2D"]):
+        return self._set_attribute("Placement", value)
+
+    @property
+    def Path(self)-> "IfcTextPath":
+        """<attribute Path: <enumeration IfcTextPath: (LEFT, RIGHT, UP, DOWN)>>"""
+        return self._get_attribute("Path")
+
+    @Path.setter
+    def Path(self, value: "IfcTextPath"):
+        return self._set_attribute("Path", value)
@@ -0,0 +1,48 @@
+from .ifcpresentationstyle import IfcPresentationStyle
+from typing import Union
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcexternallydefinedtextfont import IfcExternallyDefinedTextFont
+    from .ifcpredefinedtextfont import IfcPreDefinedTextFont
+    from .ifctextstylefordefinedfont import IfcTextStyleForDefinedFont
+    from .ifctextstyletextmodel import IfcTextStyleTextModel
+
+class IfcTextStyle(IfcPresentationStyle):
+    """Wrapper class for IfcTextStyle."""
+
+    @property
+    def TextCharacterAppearance(self)-> "IfcTextStyleForDefinedFont":
+        """<attribute TextCharacterAppearance?: <entity IfcTextStyleForDefinedFont>>"""
+        return self._get_attribute("TextCharacterAppearance")
+
+    @TextCharacterAppearance.setter
+    def TextCharacterAppearance(self, value: "IfcTextStyleForDefinedFont"):
+        return self._set_attribute("TextCharacterAppearance", value)
+
+    @property
+    def TextStyle(self)-> "IfcTextStyleTextModel":
+        """<attribute TextStyle?: <entity IfcTextStyleTextModel>>"""
+        return self._get_attribute("TextStyle")
+
+    @TextStyle.setter
+    def TextStyle(self, value: "IfcTextStyleTextModel"):
+        return self._set_attribute("TextStyle", value)
+
+    @property
+    def TextFontStyle(self)-> Union["IfcPreDefinedTextFont", "IfcExternallyDefinedTextFont"]:
+        """<attribute TextFontStyle: <select IfcTextFontSelect: (<entity IfcExternallyDefinedTextFont> | <entity IfcPreDefinedTextFont>)>>"""
+        return self._get_attribute("TextFontStyle")
+
+    @TextFontStyle.setter
+    def TextFontStyle(self, value: Union["IfcPreDefinedTextFont", "IfcExternallyDefinedTextFont"]):
+        return self._set_attribute("TextFontStyle", value)
+
+    @property
+    def ModelOrDraughting(self)-> bool:
+        """<attribute ModelOrDraughting?: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("ModelOrDraughting")
+
+    @ModelOrDraughting.setter
+    def ModelOrDraughting(self, value: bool):
+        return self._set_attribute("ModelOrDraughting", value)
@@ -0,0 +1,17 @@
+from .ifcpresentationitem import IfcPresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcsurfacetexture import IfcSurfaceTexture
+
+class IfcTextureCoordinate(IfcPresentationItem):
+    """Wrapper class for IfcTextureCoordinate."""
+
+    @property
+    def Maps(self)-> list["IfcSurfaceTexture"]:
+        """<attribute Maps: <list [1:?] of <entity IfcSurfaceTexture>>>"""
+        return self._get_attribute("Maps")
+
+    @Maps.setter
+    def Maps(self, value: list["IfcSurfaceTexture"]):
+        return self._set_attribute("Maps", value)
@@ -0,0 +1,23 @@
+from .ifctexturecoordinate import IfcTextureCoordinate
+
+
+class IfcTextureCoordinateGenerator(IfcTextureCoordinate):
+    """Wrapper class for IfcTextureCoordinateGenerator."""
+
+    @property
+    def Mode(self)-> str:
+        """<attribute Mode: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Mode")
+
+    @Mode.setter
+    def Mode(self, value: str):
+        return self._set_attribute("Mode", value)
+
+    @property
+    def Parameter(self)-> list[float]:
+        """<attribute Parameter?: <list [1:?] of <type IfcReal: <real>>>>"""
+        return self._get_attribute("Parameter")
+
+    @Parameter.setter
+    def Parameter(self, value: list[float]):
+        return self._set_attribute("Parameter", value)
@@ -0,0 +1,27 @@
+from .ifctexturecoordinate import IfcTextureCoordinate
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcface import IfcFace
+    from .ifctexturevertex import IfcTextureVertex
+
+class IfcTextureMap(IfcTextureCoordinate):
+    """Wrapper class for IfcTextureMap."""
+
+    @property
+    def Vertices(self)-> list["IfcTextureVertex"]:
+        """<attribute Vertices: <list [3:?] of <entity IfcTextureVertex>>>"""
+        return self._get_attribute("Vertices")
+
+    @Vertices.setter
+    def Vertices(self, value: list["IfcTextureVertex"]):
+        return self._set_attribute("Vertices", value)
+
+    @property
+    def MappedTo(self)-> "IfcFace":
+        """<attribute MappedTo: <entity IfcFace>>"""
+        return self._get_attribute("MappedTo")
+
+    @MappedTo.setter
+    def MappedTo(self, value: "IfcFace"):
+        return self._set_attribute("MappedTo", value)
@@ -0,0 +1,14 @@
+from .ifcpresentationitem import IfcPresentationItem
+
+
+class IfcTextureVertex(IfcPresentationItem):
+    """Wrapper class for IfcTextureVertex."""
+
+    @property
+    def Coordinates(self)-> list[float]:
+        """<attribute Coordinates: <list [2:2] of <type IfcParameterValue: <real>>>>"""
+        return self._get_attribute("Coordinates")
+
+    @Coordinates.setter
+    def Coordinates(self, value: list[float]):
+        return self._set_attribute("Coordinates", value)
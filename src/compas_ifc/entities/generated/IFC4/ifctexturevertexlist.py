@@ -0,0 +1,14 @@
+from .ifcpresentationitem import IfcPresentationItem
+
+
+class IfcTextureVertexList(IfcPresentationItem):
+    """Wrapper class for IfcTextureVertexList."""
+
+    @property
+    def TexCoordsList(self)-> list[list[float]]:
+        """<attribute TexCoordsList: <list [1:?] of <list [2:2] of <type IfcParameterValue: <real>>>>>"""
+        return self._get_attribute("TexCoordsList")
+
+    @TexCoordsList.setter
+    def TexCoordsList(self, value: list[list[float]]):
+        return self._set_attribute("TexCoordsList", value)
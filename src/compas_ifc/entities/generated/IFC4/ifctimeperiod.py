@@ -0,0 +1,23 @@
+from compas_ifc.entities.base import Base
+
+
+class IfcTimePeriod(Base):
+    """Wrapper class for IfcTimePeriod."""
+
+    @property
+    def StartTime(self)-> str:
+        """<attribute StartTime: <type IfcTime: <string>>>"""
+        return self._get_attribute("StartTime")
+
+    @StartTime.setter
+    def StartTime(self, value: str):
+        return self._set_attribute("StartTime", value)
+
+    @property
+    def EndTime(self)-> str:
+        """<attribute EndTime: <type IfcTime: <string>>>"""
+        return self._get_attribute("EndTime")
+
+    @EndTime.setter
+    def EndTime(self, value: str):
+        return self._set_attribute("EndTime", value)
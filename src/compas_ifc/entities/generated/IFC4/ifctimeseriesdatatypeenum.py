@@ -0,0 +1,2 @@
+class IfcTimeSeriesDataTypeEnum(str):
+    items = ['CONTINUOUS', 'DISCRETE', 'DISCRETEBINARY', 'PIECEWISEBINARY', 'PIECEWISECONSTANT', 'PIECEWISECONTINUOUS', 'NOTDEFINED']
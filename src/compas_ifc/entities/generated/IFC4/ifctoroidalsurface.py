@@ -0,0 +1,23 @@
+from .ifcelementarysurface import IfcElementarySurface
+
+
+class IfcToroidalSurface(IfcElementarySurface):
+    """Wrapper class for IfcToroidalSurface."""
+
+    @property
+    def MajorRadius(self)-> float:
+        """<attribute MajorRadius: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("MajorRadius")
+
+    @MajorRadius.setter
+    def MajorRadius(self, value: float):
+        return self._set_attribute("MajorRadius", value)
+
+    @property
+    def MinorRadius(self)-> float:
+        """<attribute MinorRadius: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("MinorRadius")
+
+    @MinorRadius.setter
+    def MinorRadius(self, value: float):
+        return self._set_attribute("MinorRadius", value)
@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevice import IfcEnergyConversionDevice
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctransformertypeenum import IfcTransformerTypeEnum
+
+class IfcTransformer(IfcEnergyConversionDevice):
+    """Wrapper class for IfcTransformer."""
+
+    @property
+    def PredefinedType(self)-> "IfcTransformerTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcTransformerTypeEnum: (CURRENT, FREQUENCY, INVERTER, RECTIFIER, VOLTAGE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcTransformerTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevicetype import IfcEnergyConversionDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctransformertypeenum import IfcTransformerTypeEnum
+
+class IfcTransformerType(IfcEnergyConversionDeviceType):
+    """Wrapper class for IfcTransformerType."""
+
+    @property
+    def PredefinedType(self)-> "IfcTransformerTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcTransformerTypeEnum: (CURRENT, FREQUENCY, INVERTER, RECTIFIER, VOLTAGE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcTransformerTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcTransformerTypeEnum(str):
+    items = ['CURRENT', 'FREQUENCY', 'INVERTER', 'RECTIFIER', 'VOLTAGE', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcelement import IfcElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctransportelementtypeenum import IfcTransportElementTypeEnum
+
+class IfcTransportElement(IfcElement):
+    """Wrapper class for IfcTransportElement."""
+
+    @property
+    def PredefinedType(self)-> "IfcTransportElementTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcTransportElementTypeEnum: (ELEVATOR, ESCALATOR, MOVINGWALKWAY, CRANEWAY, LIFTINGGEAR, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcTransportElementTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
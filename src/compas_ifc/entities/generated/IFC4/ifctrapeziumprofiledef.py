@@ -0,0 +1,41 @@
+from .ifcparameterizedprofiledef import IfcParameterizedProfileDef
+
+
+class IfcTrapeziumProfileDef(IfcParameterizedProfileDef):
+    """Wrapper class for IfcTrapeziumProfileDef."""
+
+    @property
+    def BottomXDim(self)-> float:
+        """<attribute BottomXDim: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("BottomXDim")
+
+    @BottomXDim.setter
+    def BottomXDim(self, value: float):
+        return self._set_attribute("BottomXDim", value)
+
+    @property
+    def TopXDim(self)-> float:
+        """<attribute TopXDim: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("TopXDim")
+
+    @TopXDim.setter
+    def TopXDim(self, value: float):
+        return self._set_attribute("TopXDim", value)
+
+    @property
+    def YDim(self)-> float:
+        """<attribute YDim: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("YDim")
+
+    @YDim.setter
+    def YDim(self, value: float):
+        return self._set_attribute("YDim", value)
+
+    @property
+    def TopXOffset(self)-> float:
+        """<attribute TopXOffset: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("TopXOffset")
+
+    @TopXOffset.setter
+    def TopXOffset(self, value: float):
+        return self._set_attribute("TopXOffset", value)
@@ -0,0 +1,41 @@
+from .ifctessellatedfaceset import IfcTessellatedFaceSet
+
+
+class IfcTriangulatedFaceSet(IfcTessellatedFaceSet):
+    """Wrapper class for IfcTriangulatedFaceSet."""
+
+    @property
+    def Normals(self)-> list[list[float]]:
+        """<attribute Normals?: <list [1:?] of <list [3:3] of <type IfcParameterValue: <real>>>>>"""
+        return self._get_attribute("Normals")
+
+    @Normals.setter
+    def Normals(self, value: list[list[float]]):
+        return self._set_attribute("Normals", value)
+
+    @property
+    def Closed(self)-> bool:
+        """<attribute Closed?: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("Closed")
+
+    @Closed.setter
+    def Closed(self, value: bool):
+        return self._set_attribute("Closed", value)
+
+    @property
+    def CoordIndex(self)-> list[list[int]]:
+        """<attribute CoordIndex: <list [1:?] of <list [3:3] of <type IfcPositiveInteger: <type IfcInteger: <integer>>>>>>"""
+        return self._get_attribute("CoordIndex")
+
+    @CoordIndex.setter
+    def CoordIndex(self, value: list[list[int]]):
+        return self._set_attribute("CoordIndex", value)
+
+    @property
+    def PnIndex(self)-> list[int]:
+        """<attribute PnIndex?: <list [1:?] of <type IfcPositiveInteger: <type IfcInteger: <integer>>>>>"""
+        return self._get_attribute("PnIndex")
+
+    @PnIndex.setter
+    def PnIndex(self, value: list[int]):
+        return self._set_attribute("PnIndex", value)
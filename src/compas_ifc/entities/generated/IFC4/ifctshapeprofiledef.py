@@ -0,0 +1,86 @@
+from .ifcparameterizedprofiledef import IfcParameterizedProfileDef
+
+
+class IfcTShapeProfileDef(IfcParameterizedProfileDef):
+    """Wrapper class for IfcTShapeProfileDef."""
+
+    @property
+    def Depth(self)-> float:
+        """<attribute Depth: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("Depth")
+
+    @Depth.setter
+    def Depth(self, value: float):
+        return self._set_attribute("Depth", value)
+
+    @property
+    def FlangeWidth(self)-> float:
+        """<attribute FlangeWidth: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("FlangeWidth")
+
+    @FlangeWidth.setter
+    def FlangeWidth(self, value: float):
+        return self._set_attribute("FlangeWidth", value)
+
+    @property
+    def WebThickness(self)-> float:
+        """<attribute WebThickness: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("WebThickness")
+
+    @WebThickness.setter
+    def WebThickness(self, value: float):
+        return self._set_attribute("WebThickness", value)
+
+    @property
+    def FlangeThickness(self)-> float:
+        """<attribute FlangeThickness: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("FlangeThickness")
+
+    @FlangeThickness.setter
+    def FlangeThickness(self, value: float):
+        return self._set_attribute("FlangeThickness", value)
+
+    @property
+    def FilletRadius(self)-> float:
+        """<attribute FilletRadius?: <type IfcNonNegativeLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("FilletRadius")
+
+    @FilletRadius.setter
+    def FilletRadius(self, value: float):
+        return self._set_attribute("FilletRadius", value)
+
+    @property
+    def FlangeEdgeRadius(self)-> float:
+        """<attribute FlangeEdgeRadius?: <type IfcNonNegativeLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("FlangeEdgeRadius")
+
+    @FlangeEdgeRadius.setter
+    def FlangeEdgeRadius(self, value: float):
+        return self._set_attribute("FlangeEdgeRadius", value)
+
+    @property
+    def WebEdgeRadius(self)-> float:
+        """<attribute WebEdgeRadius?: <type IfcNonNegativeLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("WebEdgeRadius")
+
+    @WebEdgeRadius.setter
+    def WebEdgeRadius(self, value: float):
+        return self._set_attribute("WebEdgeRadius", value)
+
+    @property
+    def WebSlope(self)-> float:
+        """<attribute WebSlope?: <type IfcPlaneAngleMeasure: <real>>>"""
+        return self._get_attribute("WebSlope")
+
+    @WebSlope.setter
+    def WebSlope(self, value: float):
+        return self._set_attribute("WebSlope", value)
+
+    @property
+    def FlangeSlope(self)-> float:
+        """<attribute FlangeSlope?: <type IfcPlaneAngleMeasure: <real>>>"""
+        return self._get_attribute("FlangeSlope")
+
+    @FlangeSlope.setter
+    def FlangeSlope(self, value: float):
+        return self._set_attribute("FlangeSlope", value)
@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevice import IfcEnergyConversionDevice
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifctubebundletypeenum import IfcTubeBundleTypeEnum
+
+class IfcTubeBundle(IfcEnergyConversionDevice):
+    """Wrapper class for IfcTubeBundle."""
+
+    @property
+    def PredefinedType(self)-> "IfcTubeBundleTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcTubeBundleTypeEnum: (FINNED, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcTubeBundleTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcTubeBundleTypeEnum(str):
+    items = ['FINNED', 'USERDEFINED', 'NOTDEFINED']
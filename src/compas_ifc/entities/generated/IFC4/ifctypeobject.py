@@ -0,0 +1,31 @@
+from .ifcobjectdefinition import IfcObjectDefinition
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcpropertysetdefinition import IfcPropertySetDefinition
+    from .ifcreldefinesbytype import IfcRelDefinesByType
+
+class IfcTypeObject(IfcObjectDefinition):
+    """Wrapper class for IfcTypeObject."""
+
+    @property
+    def ApplicableOccurrence(self)-> str:
+        """<attribute ApplicableOccurrence?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("ApplicableOccurrence")
+
+    @ApplicableOccurrence.setter
+    def ApplicableOccurrence(self, value: str):
+        return self._set_attribute("ApplicableOccurrence", value)
+
+    @property
+    def HasPropertySets(self)-> list["IfcPropertySetDefinition"]:
+        """<attribute HasPropertySets?: <set [1:?] of <entity IfcPropertySetDefinition>>>"""
+        return self._get_attribute("HasPropertySets")
+
+    @HasPropertySets.setter
+    def HasPropertySets(self, value: list["IfcPropertySetDefinition"]):
+        return self._set_attribute("HasPropertySets", value)
+
+    def Types(self)-> list["IfcRelDefinesByType"]:
+        """<inverse Types: set [0:1] of <entity IfcRelDefinesByType> for <attribute RelatingType: <entity IfcTypeObject>>>"""
+        return self._get_inverse_attribute("Types")
@@ -0,0 +1,39 @@
+from .ifctypeobject import IfcTypeObject
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelassignstoprocess import IfcRelAssignsToProcess
+
+class IfcTypeProcess(IfcTypeObject):
+    """Wrapper class for IfcTypeProcess."""
+
+    @property
+    def Identification(self)-> str:
+        """<attribute Identification?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Identification")
+
+    @Identification.setter
+    def Identification(self, value: str):
+        return self._set_attribute("Identification", value)
+
+    @property
+    def LongDescription(self)-> str:
+        """<attribute LongDescription?: <type IfcText: <string>>>"""
+        return self._get_attribute("LongDescription")
+
+    @LongDescription.setter
+    def LongDescription(self, value: str):
+        return self._set_attribute("LongDescription", value)
+
+    @property
+    def ProcessType(self)-> str:
+        """<attribute ProcessType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ProcessType")
+
+    @ProcessType.setter
+    def ProcessType(self, value: str):
+        return self._set_attribute("ProcessType", value)
+
+    def OperatesOn(self)-> list["IfcRelAssignsToProcess"]:
+        """<inverse OperatesOn: set [0:?] of <entity IfcRelAssignsToProcess> for <attribute RelatingProcess: <select IfcProcessSelect: (<entity IfcProcess> | <entity IfcTypeProcess>)>>>"""
+        return self._get_inverse_attribute("OperatesOn")
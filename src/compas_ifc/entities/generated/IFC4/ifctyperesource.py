@@ -0,0 +1,39 @@
+from .ifctypeobject import IfcTypeObject
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrelassignstoresource import IfcRelAssignsToResource
+
+class IfcTypeResource(IfcTypeObject):
+    """Wrapper class for IfcTypeResource."""
+
+    @property
+    def Identification(self)-> str:
+        """<attribute Identification?: <type IfcIdentifier: <string>>>"""
+        return self._get_attribute("Identification")
+
+    @Identification.setter
+    def Identification(self, value: str):
+        return self._set_attribute("Identification", value)
+
+    @property
+    def LongDescription(self)-> str:
+        """<attribute LongDescription?: <type IfcText: <string>>>"""
+        return self._get_attribute("LongDescription")
+
+    @LongDescription.setter
+    def LongDescription(self, value: str):
+        return self._set_attribute("LongDescription", value)
+
+    @property
+    def ResourceType(self)-> str:
+        """<attribute ResourceType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("ResourceType")
+
+    @ResourceType.setter
+    def ResourceType(self, value: str):
+        return self._set_attribute("ResourceType", value)
+
+    def ResourceOf(self)-> list["IfcRelAssignsToResource"]:
+        """<inverse ResourceOf: set [0:?] of <entity IfcRelAssignsToResource> for <attribute RelatingResource: <select IfcResourceSelect: (<entity IfcResource> | <entity IfcTypeResource>)>>>"""
+        return self._get_inverse_attribute("ResourceOf")
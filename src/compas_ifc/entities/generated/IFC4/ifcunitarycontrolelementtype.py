@@ -0,0 +1,17 @@
+from .ifcdistributioncontrolelementtype import IfcDistributionControlElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcunitarycontrolelementtypeenum import IfcUnitaryControlElementTypeEnum
+
+class IfcUnitaryControlElementType(IfcDistributionControlElementType):
+    """Wrapper class for IfcUnitaryControlElementType."""
+
+    @property
+    def PredefinedType(self)-> "IfcUnitaryControlElementTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcUnitaryControlElementTypeEnum: (ALARMPANEL, CONTROLPANEL, GASDETECTIONPANEL, INDICATORPANEL, MIMICPANEL, HUMIDISTAT, THERMOSTAT, WEATHERSTATION, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcUnitaryControlElementTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
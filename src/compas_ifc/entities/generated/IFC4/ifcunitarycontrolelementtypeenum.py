@@ -0,0 +1,2 @@
+class IfcUnitaryControlElementTypeEnum(str):
+    items = ['ALARMPANEL', 'CONTROLPANEL', 'GASDETECTIONPANEL', 'INDICATORPANEL', 'MIMICPANEL', 'HUMIDISTAT', 'THERMOSTAT', 'WEATHERSTATION', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevice import IfcEnergyConversionDevice
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcunitaryequipmenttypeenum import IfcUnitaryEquipmentTypeEnum
+
+class IfcUnitaryEquipment(IfcEnergyConversionDevice):
+    """Wrapper class for IfcUnitaryEquipment."""
+
+    @property
+    def PredefinedType(self)-> "IfcUnitaryEquipmentTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcUnitaryEquipmentTypeEnum: (AIRHANDLER, AIRCONDITIONINGUNIT, DEHUMIDIFIER, SPLITSYSTEM, ROOFTOPUNIT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcUnitaryEquipmentTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
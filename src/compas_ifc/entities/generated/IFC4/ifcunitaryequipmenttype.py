@@ -0,0 +1,17 @@
+from .ifcenergyconversiondevicetype import IfcEnergyConversionDeviceType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcunitaryequipmenttypeenum import IfcUnitaryEquipmentTypeEnum
+
+class IfcUnitaryEquipmentType(IfcEnergyConversionDeviceType):
+    """Wrapper class for IfcUnitaryEquipmentType."""
+
+    @property
+    def PredefinedType(self)-> "IfcUnitaryEquipmentTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcUnitaryEquipmentTypeEnum: (AIRHANDLER, AIRCONDITIONINGUNIT, DEHUMIDIFIER, SPLITSYSTEM, ROOFTOPUNIT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcUnitaryEquipmentTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
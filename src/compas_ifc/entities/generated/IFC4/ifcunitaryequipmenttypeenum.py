@@ -0,0 +1,2 @@
+class IfcUnitaryEquipmentTypeEnum(str):
+    items = ['AIRHANDLER', 'AIRCONDITIONINGUNIT', 'DEHUMIDIFIER', 'SPLITSYSTEM', 'ROOFTOPUNIT', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcflowcontrollertype import IfcFlowControllerType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcvalvetypeenum import IfcValveTypeEnum
+
+class IfcValveType(IfcFlowControllerType):
+    """Wrapper class for IfcValveType."""
+
+    @property
+    def PredefinedType(self)-> "IfcValveTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcValveTypeEnum: (AIRRELEASE, ANTIVACUUM, CHANGEOVER, CHECK, COMMISSIONING, DIVERTING, DRAWOFFCOCK, DOUBLECHECK, DOUBLEREGULATING, FAUCET, FLUSHING, GASCOCK, GASTAP, ISOLATING, MIXING, PRESSUREREDUCING, PRESSURERELIEF, REGULATING, SAFETYCUTOFF, STEAMTRAP, STOPCOCK, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcValveTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,26 @@
+from .ifcgeometricrepresentationitem import IfcGeometricRepresentationItem
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcdirection import IfcDirection
+
+class IfcVector(IfcGeometricRepresentationItem):
+    """Wrapper class for IfcVector."""
+
+    @property
+    def Orientation(self)-> "IfcDirection":
+        """<attribute Orientation: <entity IfcDirection>>"""
+        return self._get_attribute("Orientation")
+
+    @Orientation.setter
+    def Orientation(self, value: "IfcDirection"):
+        return self._set_attribute("Orientation", value)
+
+    @property
+    def Magnitude(self)-> float:
+        """<attribute Magnitude: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("Magnitude")
+
+    @Magnitude.setter
+    def Magnitude(self, value: float):
+        return self._set_attribute("Magnitude", value)
@@ -0,0 +1,5 @@
+from .ifcelement import IfcElement
+
+
+class IfcVirtualElement(IfcElement):
+    """Wrapper class for IfcVirtualElement."""
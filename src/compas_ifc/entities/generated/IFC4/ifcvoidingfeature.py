@@ -0,0 +1,17 @@
+from .ifcfeatureelementsubtraction import IfcFeatureElementSubtraction
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcvoidingfeaturetypeenum import IfcVoidingFeatureTypeEnum
+
+class IfcVoidingFeature(IfcFeatureElementSubtraction):
+    """Wrapper class for IfcVoidingFeature."""
+
+    @property
+    def PredefinedType(self)-> "IfcVoidingFeatureTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcVoidingFeatureTypeEnum: (CUTOUT, NOTCH, HOLE, MITER, CHAMFER, EDGE, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcVoidingFeatureTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcVoidingFeatureTypeEnum(str):
+    items = ['CUTOUT', 'NOTCH', 'HOLE', 'MITER', 'CHAMFER', 'EDGE', 'USERDEFINED', 'NOTDEFINED']
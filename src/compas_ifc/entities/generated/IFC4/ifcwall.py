@@ -0,0 +1,17 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcwalltypeenum import IfcWallTypeEnum
+
+class IfcWall(IfcBuildingElement):
+    """Wrapper class for IfcWall."""
+
+    @property
+    def PredefinedType(self)-> "IfcWallTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcWallTypeEnum: (MOVABLE, PARAPET, PARTITIONING, PLUMBINGWALL, SHEAR, SOLIDWALL, STANDARD, POLYGONAL, ELEMENTEDWALL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcWallTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,5 @@
+from .ifcwall import IfcWall
+
+
+class IfcWallElementedCase(IfcWall):
+    """Wrapper class for IfcWallElementedCase."""
@@ -0,0 +1,2 @@
+class IfcWallTypeEnum(str):
+    items = ['MOVABLE', 'PARAPET', 'PARTITIONING', 'PLUMBINGWALL', 'SHEAR', 'SOLIDWALL', 'STANDARD', 'POLYGONAL', 'ELEMENTEDWALL', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,17 @@
+from .ifcflowterminal import IfcFlowTerminal
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcwasteterminaltypeenum import IfcWasteTerminalTypeEnum
+
+class IfcWasteTerminal(IfcFlowTerminal):
+    """Wrapper class for IfcWasteTerminal."""
+
+    @property
+    def PredefinedType(self)-> "IfcWasteTerminalTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcWasteTerminalTypeEnum: (FLOORTRAP, FLOORWASTE, GULLYSUMP, GULLYTRAP, ROOFDRAIN, WASTEDISPOSALUNIT, WASTETRAP, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcWasteTerminalTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,17 @@
+from .ifcflowterminaltype import IfcFlowTerminalType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcwasteterminaltypeenum import IfcWasteTerminalTypeEnum
+
+class IfcWasteTerminalType(IfcFlowTerminalType):
+    """Wrapper class for IfcWasteTerminalType."""
+
+    @property
+    def PredefinedType(self)-> "IfcWasteTerminalTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcWasteTerminalTypeEnum: (FLOORTRAP, FLOORWASTE, GULLYSUMP, GULLYTRAP, ROOFDRAIN, WASTEDISPOSALUNIT, WASTETRAP, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcWasteTerminalTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
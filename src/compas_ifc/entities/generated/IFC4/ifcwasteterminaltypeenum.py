@@ -0,0 +1,2 @@
+class IfcWasteTerminalTypeEnum(str):
+    items = ['FLOORTRAP', 'FLOORWASTE', 'GULLYSUMP', 'GULLYTRAP', 'ROOFDRAIN', 'WASTEDISPOSALUNIT', 'WASTETRAP', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,54 @@
+from .ifcbuildingelement import IfcBuildingElement
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcwindowtypeenum import IfcWindowTypeEnum
+    from .ifcwindowtypepartitioningenum import IfcWindowTypePartitioningEnum
+
+class IfcWindow(IfcBuildingElement):
+    """Wrapper class for IfcWindow."""
+
+    @property
+    def OverallHeight(self)-> float:
+        """<attribute OverallHeight?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("OverallHeight")
+
+    @OverallHeight.setter
+    def OverallHeight(self, value: float):
+        return self._set_attribute("OverallHeight", value)
+
+    @property
+    def OverallWidth(self)-> float:
+        """<attribute OverallWidth?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("OverallWidth")
+
+    @OverallWidth.setter
+    def OverallWidth(self, value: float):
+        return self._set_attribute("OverallWidth", value)
+
+    @property
+    def PredefinedType(self)-> "IfcWindowTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcWindowTypeEnum: (WINDOW, SKYLIGHT, LIGHTDOME, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcWindowTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def PartitioningType(self)-> "IfcWindowTypePartitioningEnum":
+        """<attribute PartitioningType?: <enumeration IfcWindowTypePartitioningEnum: (SINGLE_PANEL, DOUBLE_PANEL_VERTICAL, DOUBLE_PANEL_HORIZONTAL, TRIPLE_PANEL_VERTICAL, TRIPLE_PANEL_BOTTOM, TRIPLE_PANEL_TOP, TRIPLE_PANEL_LEFT, TRIPLE_PANEL_RIGHT, TRIPLE_PANEL_HORIZONTAL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PartitioningType")
+
+    @PartitioningType.setter
+    def PartitioningType(self, value: "IfcWindowTypePartitioningEnum"):
+        return self._set_attribute("PartitioningType", value)
+
+    @property
+    def UserDefinedPartitioningType(self)-> str:
+        """<attribute UserDefinedPartitioningType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedPartitioningType")
+
+    @UserDefinedPartitioningType.setter
+    def UserDefinedPartitioningType(self, value: str):
+        return self._set_attribute("UserDefinedPartitioningType", value)
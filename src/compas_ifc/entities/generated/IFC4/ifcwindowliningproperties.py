@@ -0,0 +1,116 @@
+from .ifcpredefinedpropertyset import IfcPreDefinedPropertySet
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcshapeaspect import IfcShapeAspect
+
+class IfcWindowLiningProperties(IfcPreDefinedPropertySet):
+    """Wrapper class for IfcWindowLiningProperties."""
+
+    @property
+    def LiningDepth(self)-> float:
+        """<attribute LiningDepth?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("LiningDepth")
+
+    @LiningDepth.setter
+    def LiningDepth(self, value: float):
+        return self._set_attribute("LiningDepth", value)
+
+    @property
+    def LiningThickness(self)-> float:
+        """<attribute LiningThickness?: <type IfcNonNegativeLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("LiningThickness")
+
+    @LiningThickness.setter
+    def LiningThickness(self, value: float):
+        return self._set_attribute("LiningThickness", value)
+
+    @property
+    def TransomThickness(self)-> float:
+        """<attribute TransomThickness?: <type IfcNonNegativeLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("TransomThickness")
+
+    @TransomThickness.setter
+    def TransomThickness(self, value: float):
+        return self._set_attribute("TransomThickness", value)
+
+    @property
+    def MullionThickness(self)-> float:
+        """<attribute MullionThickness?: <type IfcNonNegativeLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("MullionThickness")
+
+    @MullionThickness.setter
+    def MullionThickness(self, value: float):
+        return self._set_attribute("MullionThickness", value)
+
+    @property
+    def FirstTransomOffset(self)-> float:
+        """<attribute FirstTransomOffset?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("FirstTransomOffset")
+
+    @FirstTransomOffset.setter
+    def FirstTransomOffset(self, value: float):
+        return self._set_attribute("FirstTransomOffset", value)
+
+    @property
+    def SecondTransomOffset(self)-> float:
+        """<attribute SecondTransomOffset?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("SecondTransomOffset")
+
+    @SecondTransomOffset.setter
+    def SecondTransomOffset(self, value: float):
+        return self._set_attribute("SecondTransomOffset", value)
+
+    @property
+    def FirstMullionOffset(self)-> float:
+        """<attribute FirstMullionOffset?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("FirstMullionOffset")
+
+    @FirstMullionOffset.setter
+    def FirstMullionOffset(self, value: float):
+        return self._set_attribute("FirstMullionOffset", value)
+
+    @property
+    def SecondMullionOffset(self)-> float:
+        """<attribute SecondMullionOffset?: <type IfcNormalisedRatioMeasure: <type IfcRatioMeasure: <real>>>>"""
+        return self._get_attribute("SecondMullionOffset")
+
+    @SecondMullionOffset.setter
+    def SecondMullionOffset(self, value: float):
+        return self._set_attribute("SecondMullionOffset", value)
+
+    @property
+    def ShapeAspectStyle(self)-> "IfcShapeAspect":
+        """<attribute ShapeAspectStyle?: <entity IfcShapeAspect>>"""
+        return self._get_attribute("ShapeAspectStyle")
+
+    @ShapeAspectStyle.setter
+    def ShapeAspectStyle(self, value: "IfcShapeAspect"):
+        return self._set_attribute("ShapeAspectStyle", value)
+
+    @property
+    def LiningOffset(self)-> float:
+        """<attribute LiningOffset?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("LiningOffset")
+
+    @LiningOffset.setter
+    def LiningOffset(self, value: float):
+        return self._set_attribute("LiningOffset", value)
+
+    @property
+    def LiningToPanelOffsetX(self)-> float:
+        """<attribute LiningToPanelOffsetX?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("LiningToPanelOffsetX")
+
+    @LiningToPanelOffsetX.setter
+    def LiningToPanelOffsetX(self, value: float):
+        return self._set_attribute("LiningToPanelOffsetX", value)
+
+    @property
+    def LiningToPanelOffsetY(self)-> float:
+        """<attribute LiningToPanelOffsetY?: <type IfcLengthMeasure: <real>>>"""
+        return self._get_attribute("LiningToPanelOffsetY")
+
+    @LiningToPanelOffsetY.setter
+    def LiningToPanelOffsetY(self, value: float):
+        return self._set_attribute("LiningToPanelOffsetY", value)
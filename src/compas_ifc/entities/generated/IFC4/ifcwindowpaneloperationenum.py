@@ -0,0 +1,2 @@
+class IfcWindowPanelOperationEnum(str):
+    items = ['SIDEHUNGRIGHTHAND', 'SIDEHUNGLEFTHAND', 'TILTANDTURNRIGHTHAND', 'TILTANDTURNLEFTHAND', 'TOPHUNG', 'BOTTOMHUNG', 'PIVOTHORIZONTAL', 'PIVOTVERTICAL', 'SLIDINGHORIZONTAL', 'SLIDINGVERTICAL', 'REMOVABLECASEMENT', 'FIXEDCASEMENT', 'OTHEROPERATION', 'NOTDEFINED']
@@ -0,0 +1,2 @@
+class IfcWindowPanelPositionEnum(str):
+    items = ['LEFT', 'MIDDLE', 'RIGHT', 'BOTTOM', 'TOP', 'NOTDEFINED']
@@ -0,0 +1,55 @@
+from .ifcpredefinedpropertyset import IfcPreDefinedPropertySet
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcshapeaspect import IfcShapeAspect
+    from .ifcwindowpaneloperationenum import IfcWindowPanelOperationEnum
+    from .ifcwindowpanelpositionenum import IfcWindowPanelPositionEnum
+
+class IfcWindowPanelProperties(IfcPreDefinedPropertySet):
+    """Wrapper class for IfcWindowPanelProperties."""
+
+    @property
+    def OperationType(self)-> "IfcWindowPanelOperationEnum":
+        """<attribute OperationType: <enumeration IfcWindowPanelOperationEnum: (SIDEHUNGRIGHTHAND, SIDEHUNGLEFTHAND, TILTANDTURNRIGHTHAND, TILTANDTURNLEFTHAND, TOPHUNG, BOTTOMHUNG, PIVOTHORIZONTAL, PIVOTVERTICAL, SLIDINGHORIZONTAL, SLIDINGVERTICAL, REMOVABLECASEMENT, FIXEDCASEMENT, OTHEROPERATION, NOTDEFINED)>>"""
+        return self._get_attribute("OperationType")
+
+    @OperationType.setter
+    def OperationType(self, value: "IfcWindowPanelOperationEnum"):
+        return self._set_attribute("OperationType", value)
+
+    @property
+    def PanelPosition(self)-> "IfcWindowPanelPositionEnum":
+        """<attribute PanelPosition: <enumeration IfcWindowPanelPositionEnum: (LEFT, MIDDLE, RIGHT, BOTTOM, TOP, NOTDEFINED)>>"""
+        return self._get_attribute("PanelPosition")
+
+    @PanelPosition.setter
+    def PanelPosition(self, value: "IfcWindowPanelPositionEnum"):
+        return self._set_attribute("PanelPosition", value)
+
+    @property
+    def FrameDepth(self)-> float:
+        """<attribute FrameDepth?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("FrameDepth")
+
+    @FrameDepth.setter
+    def FrameDepth(self, value: float):
+        return self._set_attribute("FrameDepth", value)
+
+    @property
+    def FrameThickness(self)-> float:
+        """<attribute FrameThickness?: <type IfcPositiveLengthMeasure: <type IfcLengthMeasure: <real>>>>"""
+        return self._get_attribute("FrameThickness")
+
+    @FrameThickness.setter
+    def FrameThickness(self, value: float):
+        return self._set_attribute("FrameThickness", value)
+
+    @property
+    def ShapeAspectStyle(self)-> "IfcShapeAspect":
+        """<attribute ShapeAspectStyle?: <entity IfcShapeAspect>>"""
+        return self._get_attribute("ShapeAspectStyle")
+
+    @ShapeAspectStyle.setter
+    def ShapeAspectStyle(self, value: "IfcShapeAspect"):
+        return self._set_attribute("ShapeAspectStyle", value)
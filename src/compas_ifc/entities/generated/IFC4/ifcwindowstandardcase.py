@@ -0,0 +1,5 @@
+from .ifcwindow import IfcWindow
+
+
+class IfcWindowStandardCase(IfcWindow):
+    """Wrapper class for IfcWindowStandardCase."""
@@ -0,0 +1,45 @@
+from .ifcbuildingelementtype import IfcBuildingElementType
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcwindowtypeenum import IfcWindowTypeEnum
+    from .ifcwindowtypepartitioningenum import IfcWindowTypePartitioningEnum
+
+class IfcWindowType(IfcBuildingElementType):
+    """Wrapper class for IfcWindowType."""
+
+    @property
+    def PredefinedType(self)-> "IfcWindowTypeEnum":
+        """<attribute PredefinedType: <enumeration IfcWindowTypeEnum: (WINDOW, SKYLIGHT, LIGHTDOME, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcWindowTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
+
+    @property
+    def PartitioningType(self)-> "IfcWindowTypePartitioningEnum":
+        """<attribute PartitioningType: <enumeration IfcWindowTypePartitioningEnum: (SINGLE_PANEL, DOUBLE_PANEL_VERTICAL, DOUBLE_PANEL_HORIZONTAL, TRIPLE_PANEL_VERTICAL, TRIPLE_PANEL_BOTTOM, TRIPLE_PANEL_TOP, TRIPLE_PANEL_LEFT, TRIPLE_PANEL_RIGHT, TRIPLE_PANEL_HORIZONTAL, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PartitioningType")
+
+    @PartitioningType.setter
+    def PartitioningType(self, value: "IfcWindowTypePartitioningEnum"):
+        return self._set_attribute("PartitioningType", value)
+
+    @property
+    def ParameterTakesPrecedence(self)-> bool:
+        """<attribute ParameterTakesPrecedence?: <type IfcBoolean: <boolean>>>"""
+        return self._get_attribute("ParameterTakesPrecedence")
+
+    @ParameterTakesPrecedence.setter
+    def ParameterTakesPrecedence(self, value: bool):
+        return self._set_attribute("ParameterTakesPrecedence", value)
+
+    @property
+    def UserDefinedPartitioningType(self)-> str:
+        """<attribute UserDefinedPartitioningType?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("UserDefinedPartitioningType")
+
+    @UserDefinedPartitioningType.setter
+    def UserDefinedPartitioningType(self, value: str):
+        return self._set_attribute("UserDefinedPartitioningType", value)
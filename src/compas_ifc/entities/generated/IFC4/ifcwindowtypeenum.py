@@ -0,0 +1,2 @@
+class IfcWindowTypeEnum(str):
+    items = ['WINDOW', 'SKYLIGHT', 'LIGHTDOME', 'USERDEFINED', 'NOTDEFINED']
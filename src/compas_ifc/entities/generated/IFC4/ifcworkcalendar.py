@@ -0,0 +1,36 @@
+from .ifccontrol import IfcControl
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcworkcalendartypeenum import IfcWorkCalendarTypeEnum
+    from .ifcworktime import IfcWorkTime
+
+class IfcWorkCalendar(IfcControl):
+    """Wrapper class for IfcWorkCalendar."""
+
+    @property
+    def WorkingTimes(self)-> list["IfcWorkTime"]:
+        """<attribute WorkingTimes?: <set [1:?] of <entity IfcWorkTime>>>"""
+        return self._get_attribute("WorkingTimes")
+
+    @WorkingTimes.setter
+    def WorkingTimes(self, value: list["IfcWorkTime"]):
+        return self._set_attribute("WorkingTimes", value)
+
+    @property
+    def ExceptionTimes(self)-> list["IfcWorkTime"]:
+        """<attribute ExceptionTimes?: <set [1:?] of <entity IfcWorkTime>>>"""
+        return self._get_attribute("ExceptionTimes")
+
+    @ExceptionTimes.setter
+    def ExceptionTimes(self, value: list["IfcWorkTime"]):
+        return self._set_attribute("ExceptionTimes", value)
+
+    @property
+    def PredefinedType(self)-> "IfcWorkCalendarTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcWorkCalendarTypeEnum: (FIRSTSHIFT, SECONDSHIFT, THIRDSHIFT, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcWorkCalendarTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
@@ -0,0 +1,2 @@
+class IfcWorkCalendarTypeEnum(str):
+    items = ['FIRSTSHIFT', 'SECONDSHIFT', 'THIRDSHIFT', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,71 @@
+from .ifccontrol import IfcControl
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcperson import IfcPerson
+
+class IfcWorkControl(IfcControl):
+    """Wrapper class for IfcWorkControl."""
+
+    @property
+    def CreationDate(self)-> str:
+        """<attribute CreationDate: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("CreationDate")
+
+    @CreationDate.setter
+    def CreationDate(self, value: str):
+        return self._set_attribute("CreationDate", value)
+
+    @property
+    def Creators(self)-> list["IfcPerson"]:
+        """<attribute Creators?: <set [1:?] of <entity IfcPerson>>>"""
+        return self._get_attribute("Creators")
+
+    @Creators.setter
+    def Creators(self, value: list["IfcPerson"]):
+        return self._set_attribute("Creators", value)
+
+    @property
+    def Purpose(self)-> str:
+        """<attribute Purpose?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("Purpose")
+
+    @Purpose.setter
+    def Purpose(self, value: str):
+        return self._set_attribute("Purpose", value)
+
+    @property
+    def Duration(self)-> str:
+        """<attribute Duration?: <type IfcDuration: <string>>>"""
+        return self._get_attribute("Duration")
+
+    @Duration.setter
+    def Duration(self, value: str):
+        return self._set_attribute("Duration", value)
+
+    @property
+    def TotalFloat(self)-> str:
+        """<attribute TotalFloat?: <type IfcDuration: <string>>>"""
+        return self._get_attribute("TotalFloat")
+
+    @TotalFloat.setter
+    def TotalFloat(self, value: str):
+        return self._set_attribute("TotalFloat", value)
+
+    @property
+    def StartTime(self)-> str:
+        """<attribute StartTime: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("StartTime")
+
+    @StartTime.setter
+    def StartTime(self, value: str):
+        return self._set_attribute("StartTime", value)
+
+    @property
+    def FinishTime(self)-> str:
+        """<attribute FinishTime?: <type IfcDateTime: <string>>>"""
+        return self._get_attribute("FinishTime")
+
+    @FinishTime.setter
+    def FinishTime(self, value: str):
+        return self._set_attribute("FinishTime", value)
@@ -0,0 +1,17 @@
+from .ifcworkcontrol import IfcWorkControl
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcworkplantypeenum import IfcWorkPlanTypeEnum
+
+class IfcWorkPlan(IfcWorkControl):
+    """Wrapper class for IfcWorkPlan."""
+
+    @property
+    def PredefinedType(self)-> "IfcWorkPlanTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcWorkPlanTypeEnum: (ACTUAL, BASELINE, PLANNED, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcWorkPlanTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
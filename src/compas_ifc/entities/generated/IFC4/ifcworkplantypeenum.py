@@ -0,0 +1,2 @@
+class IfcWorkPlanTypeEnum(str):
+    items = ['ACTUAL', 'BASELINE', 'PLANNED', 'USERDEFINED', 'NOTDEFINED']
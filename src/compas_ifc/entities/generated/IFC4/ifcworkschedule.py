@@ -0,0 +1,17 @@
+from .ifcworkcontrol import IfcWorkControl
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcworkscheduletypeenum import IfcWorkScheduleTypeEnum
+
+class IfcWorkSchedule(IfcWorkControl):
+    """Wrapper class for IfcWorkSchedule."""
+
+    @property
+    def PredefinedType(self)-> "IfcWorkScheduleTypeEnum":
+        """<attribute PredefinedType?: <enumeration IfcWorkScheduleTypeEnum: (ACTUAL, BASELINE, PLANNED, USERDEFINED, NOTDEFINED)>>"""
+        return self._get_attribute("PredefinedType")
+
+    @PredefinedType.setter
+    def PredefinedType(self, value: "IfcWorkScheduleTypeEnum"):
+        return self._set_attribute("PredefinedType", value)
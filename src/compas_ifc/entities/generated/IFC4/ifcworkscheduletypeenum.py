@@ -0,0 +1,2 @@
+class IfcWorkScheduleTypeEnum(str):
+    items = ['ACTUAL', 'BASELINE', 'PLANNED', 'USERDEFINED', 'NOTDEFINED']
@@ -0,0 +1,35 @@
+from .ifcschedulingtime import IfcSchedulingTime
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from .ifcrecurrencepattern import IfcRecurrencePattern
+
+class IfcWorkTime(IfcSchedulingTime):
+    """Wrapper class for IfcWorkTime."""
+
+    @property
+    def RecurrencePattern(self)-> "IfcRecurrencePattern":
+        """<attribute RecurrencePattern?: <entity IfcRecurrencePattern>>"""
+        return self._get_attribute("RecurrencePattern")
+
+    @RecurrencePattern.setter
+    def RecurrencePattern(self, value: "IfcRecurrencePattern"):
+        return self._set_attribute("RecurrencePattern", value)
+
+    @property
+    def Start(self)-> str:
+        """<attribute Start?: <type IfcDate: <string>>>"""
+        return self._get_attribute("Start")
+
+    @Start.setter
+    def Start(self, value: str):
+        return self._set_attribute("Start", value)
+
+    @property
+    def Finish(self)-> str:
+        """<attribute Finish?: <type IfcDate: <string>>>"""
+        return self._get_attribute("Finish")
+
+    @Finish.setter
+    def Finish(self, value: str):
+        return self._set_attribute("Finish", value)
@@ -0,0 +1,14 @@
+from .ifcsystem import IfcSystem
+
+
+class IfcZone(IfcSystem):
+    """Wrapper class for IfcZone."""
+
+    @property
+    def LongName(self)-> str:
+        """<attribute LongName?: <type IfcLabel: <string>>>"""
+        return self._get_attribute("LongName")
+
+    @LongName.setter
+    def LongName(self, value: str):
+        return self._set_attribute("LongName", value)
@@ -1,5 +1,6 @@
 import inspect
 import os
+import shutil
 import types
 
 import ifcopenshell
@@ -16,18 +17,63 @@ class Generator:
     ----------
     schema : :class:`ifcopenshell.ifcopenshell_wrapper.schema`
         The IfcOpenShell schema to generate classes for.
+    lazy : bool
+        Whether the generated package imports its classes on first access instead of all at once.
+    backend : str
+        Either "package", to generate one module per class, or "module", to generate a single module for the schema
+        in which attributes are read by their precomputed positional index.
+    LAZY_TEMPLATE : str
+        The template python code for the body of a lazy package.
 
     """
 
-    def __init__(self, schema="IFC4"):
+    LAZY_TEMPLATE = """import importlib
+
+__all__ = CLASS_NAMES
+
+_NAMES = set(__all__)
+
+
+def __getattr__(name):
+    if name not in _NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cls = getattr(importlib.import_module(f".{name.lower()}", __name__), name)
+    globals()[name] = cls
+    return cls
+
+
+def __dir__():
+    return list(__all__)
+"""
+
+    def __init__(self, schema="IFC4", lazy=True, backend="package"):
+        if backend not in ("package", "module"):
+            raise ValueError(f"Invalid backend: {backend}. Use 'package' or 'module'.")
         self.schema = ifcopenshell.ifcopenshell_wrapper.schema_by_name(schema)
+        self.lazy = lazy
+        self.backend = backend
 
-    def generate(self):
-        """Generate all classes and type definitions for the given schema."""
-        HERE = os.path.dirname(__file__)
-        FOLDER = os.path.join(HERE, "generated", self.schema.name())
+    def generate(self, folder=None):
+        """Generate all classes and type definitions for the given schema.
+
+        Parameters
+        ----------
+        folder : str, optional
+            The folder in which the schema is generated. Default is the `compas_ifc.entities.generated` folder.
+
+        """
+        if folder is None:
+            folder = os.path.join(os.path.dirname(__file__), "generated")
+
+        if self.backend == "module":
+            return self.generate_module(folder)
+
+        FOLDER = os.path.join(folder, self.schema.name())
         if not os.path.exists(FOLDER):
             os.makedirs(FOLDER)
+        # A single module of the same schema would shadow the package.
+        if os.path.exists(FOLDER + ".py"):
+            os.remove(FOLDER + ".py")
 
         doc_string = """
 .. autosummary::
@@ -37,6 +83,7 @@ class Generator:
 
 """
         init_string = ""
+        names = []
 
         count = 0
 
@@ -59,12 +106,17 @@ class Generator:
 
             if class_string:
                 init_string += f"from .{name.lower()} import {name}\n"
+                names.append(name)
                 doc_string += f"    {name}\n"
 
                 with open(os.path.join(FOLDER, f"{name.lower()}.py"), "w") as f:
                     f.write(class_string)
                     count += 1
 
+        if self.lazy:
+            # NOTE: a schema has over a thousand classes, only import the ones that are used.
+            init_string = self.LAZY_TEMPLATE.replace("CLASS_NAMES", "[\n" + "".join(f'    "{name}",\n' for name in names) + "]")
+
         init_string = f'"""{doc_string}"""\n\n{init_string}'
 
         with open(os.path.join(FOLDER, "__init__.py"), "w") as f:
@@ -72,6 +124,66 @@ class Generator:
 
         print(f"Generated {count} classes for at {FOLDER}.")
 
+    def generate_module(self, folder):
+        """Generate all classes and type definitions for the given schema in a single module, with precomputed attribute tables."""
+        PATH = os.path.join(folder, f"{self.schema.name()}.py")
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+        # The package of the same schema would shadow the module.
+        if os.path.isdir(PATH[:-3]):
+            shutil.rmtree(PATH[:-3])
+
+        doc_string = """
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+    :template: class.rst
+
+"""
+        imports = {"from compas_ifc.entities.base import Attribute", "from compas_ifc.entities.base import InverseAttribute"}
+        enum_strings = []
+        class_strings = []
+        attribute_index = {}
+        inverse_attributes = {}
+
+        def depth(declaration):
+            count = 0
+            while declaration.supertype():
+                declaration = declaration.supertype()
+                count += 1
+            return count
+
+        # Supertypes have to be defined before their subtypes.
+        entities = sorted([d for d in self.schema.declarations() if d.as_entity()], key=lambda d: (depth(d), d.name()))
+        enumerations = [d for d in self.schema.declarations() if d.as_enumeration_type()]
+
+        for declaration in enumerations:
+            enum_generator = EnumGenerator(declaration)
+            enum_strings.append(enum_generator.generate())
+
+        for declaration in entities:
+            entity_generator = ModuleEntityGenerator(declaration)
+            class_strings.append(entity_generator.generate())
+            imports.update(entity_generator.imports)
+            attribute_index[entity_generator.name] = entity_generator.attribute_index
+            inverse_attributes[entity_generator.name] = entity_generator.inverse_attribute_specs
+
+        names = sorted([d.name() for d in enumerations] + [d.name() for d in entities])
+        doc_string += "".join(f"    {name}\n" for name in names)
+
+        module_string = f'"""{doc_string}"""\n\n'
+        module_string += "\n".join(sorted(imports)) + "\n\n"
+        module_string += "# Positional index of every attribute, by IFC class and attribute name.\n"
+        module_string += "ATTRIBUTE_INDEX = {\n" + "".join(f"    {name!r}: {table!r},\n" for name, table in attribute_index.items()) + "}\n\n"
+        module_string += "# Referencing IFC class and attribute of every inverse attribute, by IFC class and inverse attribute name.\n"
+        module_string += "INVERSE_ATTRIBUTES = {\n" + "".join(f"    {name!r}: {table!r},\n" for name, table in inverse_attributes.items()) + "}\n\n"
+        module_string += "\n\n".join(enum_strings + class_strings)
+
+        with open(PATH, "w") as f:
+            f.write(module_string)
+
+        print(f"Generated {len(names)} classes at {PATH}.")
+
 
 class EntityGenerator:
     """
@@ -220,6 +332,79 @@ class CLASS_NAME(PARENT_NAME):
         return class_string
 
 
+class ModuleEntityGenerator(EntityGenerator):
+    """
+    Generator class for generating a single IFC entity class in a single schema module.
+    Attributes are generated as :class:`compas_ifc.entities.base.Attribute` descriptors, which read them by positional index.
+
+    Attributes
+    ----------
+    See :class:`EntityGenerator`
+
+    attribute_index : dict[str, int]
+        The positional index of all the attributes of the entity, including inherited ones.
+    inverse_attribute_specs : dict[str, tuple[str, str]]
+        The referencing class and attribute of all the inverse attributes of the entity, including inherited ones.
+
+    """
+
+    TEMPLATE = """
+class CLASS_NAME(PARENT_NAME):
+    \"\"\"DESCRIPTION\"\"\"
+"""
+
+    def __init__(self, declaration):
+        super().__init__(declaration)
+        self.attribute_index = {}
+        self.inverse_attribute_specs = {}
+
+    def get_parent(self):
+        super().get_parent()
+        # All the classes are defined in the same module.
+        self.imports = {import_string for import_string in self.imports if not import_string.startswith("from .")}
+
+    def get_attributes(self):
+        derived = self.declaration.derived()
+        attribute_names = [attr.name() for attr in self.declaration.attributes()]
+
+        for i, attribute in enumerate(self.declaration.all_attributes()):
+            self.attribute_index[attribute.name()] = i
+            if attribute.name() in attribute_names or derived[i]:
+                self.attributes.append((attribute, i, bool(derived[i])))
+
+        inverse_attributes_from_supertype = []
+        if self.declaration.supertype():
+            for ia in self.declaration.supertype().all_inverse_attributes():
+                inverse_attributes_from_supertype.append(ia.name())
+
+        for inverse_attribute in self.declaration.all_inverse_attributes():
+            spec = (inverse_attribute.entity_reference().name(), inverse_attribute.attribute_reference().name())
+            self.inverse_attribute_specs[inverse_attribute.name()] = spec
+            if inverse_attribute.name() not in inverse_attributes_from_supertype:
+                self.inverse_attributes.append((inverse_attribute, spec))
+
+    def generate(self):
+        self.get_parent()
+        self.get_description()
+        self.get_attributes()
+
+        class_string = self.TEMPLATE.replace("CLASS_NAME", self.name)
+        if self.extension:
+            class_string = class_string.replace("PARENT_NAME", f"{self.extension}, {self.parent}")
+        else:
+            class_string = class_string.replace("PARENT_NAME", self.parent)
+        class_string = class_string.replace("DESCRIPTION", self.description)
+
+        for attribute, index, derived in self.attributes:
+            class_string += f"    {attribute.name()} = Attribute({attribute.name()!r}, {index}, {derived}, {str(attribute)!r})\n"
+
+        for inverse_attribute, (entity_reference, attribute_reference) in self.inverse_attributes:
+            name = inverse_attribute.name()
+            class_string += f"    {name} = InverseAttribute({name!r}, {entity_reference!r}, {attribute_reference!r}, {str(inverse_attribute)!r})\n"
+
+        return class_string
+
+
 class AttributeGenerator:
     """
     Generator class for generating a single IFC attribute.
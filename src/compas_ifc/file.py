@@ -2,9 +2,16 @@ import difflib
 import importlib
 import multiprocessing
 import os
+import re
 import time
+import weakref
+from bisect import bisect_left
+from contextlib import contextmanager
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Generator
+from typing import Iterable
 from typing import Type
 from typing import Union
 
@@ -14,8 +21,90 @@ from compas.geometry import Transformation
 from ifcopenshell.api import run
 
 import compas_ifc
+from compas_ifc.brep import GeometryBuffer
 from compas_ifc.brep import TessellatedBrep
+from compas_ifc.brep import TessellatedBrepInstance
+from compas_ifc.cache import GeometryCache
+from compas_ifc.cache import LRUDict
+from compas_ifc.cache import PrimitivePool
+from compas_ifc.cache import RepresentationCache
 from compas_ifc.entities.base import Base
+from compas_ifc.hierarchy import SpatialHierarchy
+from compas_ifc.profiler import LoadProfiler
+from compas_ifc.properties import PropertyIndex
+from compas_ifc.properties import property_table
+from compas_ifc.query import Query
+
+DEFAULT_FACECOLOR = (0.5, 0.5, 0.5, 1.0)
+
+# Classes left out by all the geometry loaders when neither include nor exclude is given.
+DEFAULT_EXCLUDE = ["IfcOpeningElement", "IfcSpace"]
+
+# Inverse attributes of the relating object through which its relationships with a list of related objects are found.
+RELATING_INVERSES = {
+    "IfcRelContainedInSpatialStructure": ["ContainsElements"],
+    "IfcRelAggregates": ["IsDecomposedBy"],
+    "IfcRelAssignsToGroup": ["IsGroupedBy"],
+}
+
+# Tessellation quality presets. Deflections are in metres, angular tolerances in radians.
+TESSELLATION_PROFILES = {
+    "preview": {"deflection": 0.05, "angular_tolerance": 1.0, "disable_openings": True},
+    "coarse": {"deflection": 0.01, "angular_tolerance": 0.8},
+    "default": {},
+    "fine": {"deflection": 0.0005, "angular_tolerance": 0.2},
+}
+
+
+def shape_matrix(shape) -> np.ndarray:
+    """Get the 4x4 placement matrix of a shape coming from the ifcopenshell geometry iterator."""
+    matrix = np.array(shape.transformation.matrix.data).reshape((4, 3))
+    matrix = np.hstack([matrix, np.array([[0], [0], [0], [1]])])
+    return matrix.transpose()
+
+
+def shape_facecolors(shape) -> np.ndarray:
+    """Get the ``(n_faces, 4)`` face colours of a shape coming from the ifcopenshell geometry iterator."""
+    # One colour per material, with the default colour appended at the end,
+    # so that faces without material (material id -1) pick up the default colour.
+    palette = [(*material.diffuse, 1 - material.transparency) for material in shape.geometry.materials]
+    palette.append(DEFAULT_FACECOLOR)
+    palette = np.array(palette, dtype=np.float32)
+    material_ids = np.asarray(shape.geometry.material_ids, dtype=np.int64)
+    return palette[material_ids]
+
+
+def _freeze(value: Any) -> Any:
+    """Get a hashable version of nested property sets, so that equal ones can be grouped."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return ("[]",) + tuple(_freeze(item) for item in value)
+    return (type(value).__name__, value)
+
+
+def tessellation_profile(profile: Union[str, dict, None]) -> dict:
+    """Get the tessellation settings of a profile, given either by the name of a preset or as a dict of settings."""
+    if profile is None:
+        return {}
+    if isinstance(profile, str):
+        if profile not in TESSELLATION_PROFILES:
+            raise ValueError(f"Unknown tessellation profile: {profile}. Use one of {list(TESSELLATION_PROFILES)}.")
+        return TESSELLATION_PROFILES[profile]
+    unknown = set(profile) - {"deflection", "angular_tolerance", "disable_openings"}
+    if unknown:
+        raise ValueError(f"Unknown tessellation settings: {sorted(unknown)}.")
+    return profile
+
+
+def apply_tessellation_profile(settings: "ifcopenshell.geom.settings", profile: dict):
+    """Apply the settings of a tessellation profile to ifcopenshell geometry settings."""
+    if profile.get("deflection") is not None:
+        settings.set_deflection_tolerance(profile["deflection"])
+    if profile.get("angular_tolerance") is not None:
+        settings.set_angular_tolerance(profile["angular_tolerance"])
+    if profile.get("disable_openings"):
+        settings.set(settings.DISABLE_OPENING_SUBTRACTIONS, True)
 
 
 class IFCFile(object):
@@ -29,12 +118,32 @@ class IFCFile(object):
         The model object.
     use_occ : bool
         Whether to use OCC for geometry processing.
-    load_geometries : bool
-        Whether to load the geometries of the IFC file.
+    load_geometries : bool or str
+        Whether to load the geometries of the IFC file. If "lazy", geometries are tessellated per entity on first access.
     verbose : bool
         Whether to print verbose output.
     extensions : dict, optional
         A dictionary of custom extensions to be used with the IFC file.
+    geometry_cache : :class:`compas_ifc.cache.GeometryCache`, optional
+        The on-disk cache for tessellated geometries.
+    instancing : bool
+        Whether geometries of shared representations are loaded once and instanced per product.
+    packed_geometries : bool
+        Whether the loaded geometries are stored in packed float32 buffers.
+    processes : int
+        The number of worker processes used to load the geometries. If not set, geometries are loaded in this process.
+    lod : str or dict
+        The tessellation profile used for all the geometries, see :attr:`TESSELLATION_PROFILES`.
+    tessellation_profiles : dict
+        The tessellation profiles per IFC class name or per predicate, overriding ``lod``.
+    profiler : :class:`compas_ifc.profiler.LoadProfiler`
+        The timings of the loading stages and the statistics of the loaded shapes.
+    entity_map : str or int
+        How the wrappers of the accessed entities are kept, see the ``entity_map`` parameter.
+    representation_cache : :class:`compas_ifc.cache.RepresentationCache`
+        The representations written in this file by geometry fingerprint, used to write identical geometries once.
+    primitive_pool : :class:`compas_ifc.cache.PrimitivePool`
+        The points, directions and axis placements written in this file, shared between all the conversions.
     schema : :class:`ifcopenshell.schema.Schema`
         The IFC schema object.
     schema_name : str
@@ -51,11 +160,29 @@ class IFCFile(object):
         The default context in this file. Will be created if it does not exist.
     default_body_context : :class:`compas_ifc.entities.generated.IFC4.IfcContext`
         The default body context in this file. Will be created if it does not exist.
+    default_mapping_target : :class:`compas_ifc.entities.generated.IFC4.IfcCartesianTransformationOperator3D`
+        The identity transformation with which representation maps are placed. Will be created if it does not exist.
 
     """
 
     def __init__(
-        self, model, filepath: str = None, schema: str = "IFC4", use_occ: bool = False, load_geometries: bool = True, verbose: bool = True, extensions: Dict[str, Type] = None
+        self,
+        model,
+        filepath: str = None,
+        schema: str = "IFC4",
+        use_occ: bool = False,
+        load_geometries: Union[bool, str] = True,
+        verbose: bool = True,
+        extensions: Dict[str, Type] = None,
+        geometry_cache: Union[str, GeometryCache] = None,
+        instancing: bool = False,
+        packed_geometries: bool = False,
+        processes: int = None,
+        lod: Union[str, dict] = None,
+        tessellation_profiles: Dict[Union[str, Callable], Union[str, dict]] = None,
+        instrument: bool = False,
+        entity_map: Union[str, int] = None,
+        representation_cache: int = None,
     ):
         """
         Construct the IFCFile object.
@@ -70,23 +197,72 @@ class IFCFile(object):
             The IFC schema to use. Default is "IFC4".
         use_occ : bool, optional
             Whether to use OCC for geometry processing. Default is False.
-        load_geometries : bool, optional
+        load_geometries : bool or str, optional
             Whether to load the geometries of the IFC file. Default is True.
+            If "lazy", the geometry of each entity is only tessellated when it is first accessed.
         verbose : bool, optional
             Whether to print verbose output. Default is True.
         extensions : Dict[str, Type]
             A dictionary of extensions to use, with the key being the IFC class name and the value being the extension class.
+        geometry_cache : str or :class:`compas_ifc.cache.GeometryCache`, optional
+            A folder or cache object in which tessellated geometries are stored, so that later loads of the same file are read from disk.
+        instancing : bool, optional
+            Whether to keep a single tessellation per shared representation, placed per product as a :class:`compas_ifc.brep.TessellatedBrepInstance`.
+            Default is False.
+        packed_geometries : bool, optional
+            Whether to pack all loaded geometries into one contiguous float32 vertex buffer and uint32 index buffers.
+            The preloaded geometries are then zero-copy views into these buffers, and cached geometries are memory-mapped from disk.
+            Not used together with ``instancing`` or ``use_occ``. Default is False.
+        processes : int, optional
+            The number of worker processes in which the geometries are tessellated and post-processed.
+            The results are handed back through shared memory as packed buffers. Not used together with ``instancing`` or ``use_occ``.
+            Default is None, which loads the geometries with the multithreaded iterator in this process.
+        lod : str or dict, optional
+            The tessellation profile used for all the geometries. Either the name of a preset ("preview", "coarse", "default", "fine"),
+            or a dict with ``deflection`` (metres), ``angular_tolerance`` (radians) and ``disable_openings``. Default is None.
+        tessellation_profiles : dict, optional
+            Tessellation profiles by IFC class name, or by predicate taking an entity and returning a bool.
+            The first matching profile is applied on top of ``lod``, each profile is tessellated in a separate pass. Default is None.
+        instrument : bool, optional
+            Whether to record the time of each loading stage and the shape statistics in :attr:`profiler`. Default is False.
+        entity_map : str or int, optional
+            How the wrappers of the accessed entities are kept. By default, every wrapper is kept for the lifetime of the file.
+            If "weak", wrappers are only kept while they are referenced elsewhere.
+            If an int, at most that many wrappers are kept, evicting the least recently used ones.
+            With a bounded map, an entity may get a new wrapper when it is accessed again, losing its cached state.
+        representation_cache : int, optional
+            The maximum number of representations kept for deduplicating written geometries, evicting the least recently used ones.
+            Default is None, which keeps all of them.
 
         """
 
         self.extensions = extensions
         self.verbose = verbose
+        self.profiler = LoadProfiler(enabled=instrument)
         self.ensure_classes_generated()
-        self._entitymap = {}
+        self.entity_map = entity_map
+        if entity_map is None:
+            self._entitymap = {}
+        elif entity_map == "weak":
+            self._entitymap = weakref.WeakValueDictionary()
+        elif isinstance(entity_map, int):
+            self._entitymap = LRUDict(max_size=entity_map)
+        else:
+            raise ValueError(f"Invalid entity map: {entity_map}. Use None, 'weak' or a maximum number of entities.")
         self._geometrymap = {}
         self._stylemap = {}
-        self._relationmap_aggregates = {}  # map of IfcRelAggregates
-        self._relationmap_contains = {}  # map of IfcRelContainedInSpatialStructure
+        self._shapemap = {}  # map of shared local geometries by geometry id, used for instancing
+        self._geometrybuffers = []  # packed geometry buffers backing the preloaded geometries
+        self._sharedmemory = []  # shared memory blocks backing the geometry buffers loaded in worker processes
+        self._nogeometry = set()  # ids of entities for which tessellation failed
+        self._nameindex = None  # map of names to ids of IfcRoot entities, built on first lookup
+        self._sortednames = None  # sorted names of the name index, for prefix lookups
+        self._hierarchy = None  # index of IfcRelAggregates and IfcRelContainedInSpatialStructure, built on first use
+        self._propertyindex = None  # inverted index of the single value properties, built on first use
+        self._pendingrelations = None  # children to add to existing relationships by (parent id, class), while deferred
+        self.representation_cache = RepresentationCache(max_size=representation_cache)
+        self.primitive_pool = PrimitivePool(self)
+        self._default_mapping_target = None
         self._default_context = None
         self._default_body_context = None
         self._default_units = None
@@ -97,6 +273,15 @@ class IFCFile(object):
         self.filepath = filepath
         self.model = model
         self.use_occ = use_occ
+        self.lazy_geometries = load_geometries == "lazy"
+        self.instancing = instancing
+        self.packed_geometries = packed_geometries
+        self.processes = processes
+        self.lod = lod
+        self.tessellation_profiles = tessellation_profiles or {}
+        if isinstance(geometry_cache, str):
+            geometry_cache = GeometryCache(geometry_cache)
+        self.geometry_cache = geometry_cache
         if filepath is None:
             self._file = ifcopenshell.file(schema=schema)
             self._file.wrapped_data.header.file_name.author = ["Unknown Author"]
@@ -104,13 +289,14 @@ class IFCFile(object):
             if self.verbose:
                 print("IFC file created in schema: {}".format(schema))
         else:
-            self._file = ifcopenshell.open(filepath)
+            with self.profiler.stage("parse"):
+                self._file = ifcopenshell.open(filepath)
             if self.verbose:
                 print("IFC file loaded: {}".format(filepath))
 
         self._schema = ifcopenshell.ifcopenshell_wrapper.schema_by_name(self._file.schema)
 
-        if load_geometries and filepath is not None:
+        if load_geometries and not self.lazy_geometries and filepath is not None:
             self.load_geometries()
 
     @property
@@ -132,9 +318,16 @@ class IFCFile(object):
     def ensure_classes_generated(self):
         """Check if the IFC classes are generated and generate them if not."""
         try:
-            from compas_ifc.entities.generated import IFC2X3  # noqa: F401
-            from compas_ifc.entities.generated import IFC4  # noqa: F401
+            from compas_ifc.entities.generated import IFC2X3
+            from compas_ifc.entities.generated import IFC4
+
+            # NOTE: classes generated by earlier versions are imported all at once, regenerate them as lazy packages.
+            # Single schema modules have their attribute tables precomputed and are kept as they are.
+            generated = all(hasattr(module, "__getattr__") or hasattr(module, "ATTRIBUTE_INDEX") for module in (IFC2X3, IFC4))
         except ImportError:
+            generated = False
+
+        if not generated:
             if self.verbose:
                 print("IFC classes not found. Generating classes...")
             from compas_ifc.entities.generator import Generator
@@ -174,10 +367,16 @@ class IFCFile(object):
 
         _id = entity.id()
 
-        if _id in self._entitymap and _id != 0:
-            return self._entitymap[_id]
+        # NOTE: a single lookup, since items of a weak or bounded map can disappear between two lookups.
+        wrapper = self._entitymap.get(_id) if _id != 0 else None
+        if wrapper is not None:
+            return wrapper
         else:
-            entity = Base(entity, file=self, extensions=self.extensions)
+            if self.profiler.enabled:
+                with self.profiler.stage("wrap", trace=False):
+                    entity = Base(entity, file=self, extensions=self.extensions)
+            else:
+                entity = Base(entity, file=self, extensions=self.extensions)
             if _id != 0:
                 self._entitymap[_id] = entity
             return entity
@@ -200,21 +399,183 @@ class IFCFile(object):
         entities = self._file.by_type(type_name)
         return [self.from_entity(entity) for entity in entities]
 
-    def get_entities_by_name(self, name: str) -> list[Base]:
+    def get_entities_by_name(self, name: str, match: str = "exact") -> list[Base]:
         """
         Get all entities with a given name.
+        The lookup goes through an index of the names of all IfcRoot entities, which is built on the first lookup.
 
         Parameters
         ----------
         name : str
             The name to search for.
+        match : str, optional
+            How the name is matched. Either "exact", "prefix" for names starting with ``name``,
+            or "regex" for names entirely matched by ``name`` as a regular expression, see :func:`re.fullmatch`. Default is "exact".
 
         Returns
         -------
         list[:class:`compas_ifc.entities.base.Base`]
             A list of all entities with the given name.
         """
-        return [entity for entity in self.get_entities_by_type("IfcRoot") if entity.Name == name]
+        index = self.name_index
+        if match == "exact":
+            names = [name] if name in index else []
+        elif match == "prefix":
+            if self._sortednames is None:
+                self._sortednames = sorted(index)
+            names = []
+            for i in range(bisect_left(self._sortednames, name), len(self._sortednames)):
+                if not self._sortednames[i].startswith(name):
+                    break
+                names.append(self._sortednames[i])
+        elif match == "regex":
+            pattern = re.compile(name)
+            names = [n for n in index if pattern.fullmatch(n)]
+        else:
+            raise ValueError(f"Invalid match: {match}. Use 'exact', 'prefix' or 'regex'.")
+
+        ids = sorted(_id for n in names for _id in index[n])
+        return [self.from_entity(self._file.by_id(_id)) for _id in ids]
+
+    def query(self, *type_names: str) -> Query:
+        """
+        Start a lazy query over the entities of the file.
+
+        Parameters
+        ----------
+        *type_names : str
+            The IFC classes of the queried entities, subclasses included. If none is given, all the entities are queried.
+
+        Returns
+        -------
+        :class:`compas_ifc.query.Query`
+
+        """
+        return Query(self, *type_names)
+
+    def property_table(self, types: list[str] = None, psets: list[str] = None, properties: list[str] = None, quantities: bool = True, format: str = "dict"):
+        """
+        Extract properties of many entities at once, as a columnar table.
+        Each property relationship of the file is walked once, and each shared property set is decoded once.
+
+        Parameters
+        ----------
+        types : list[str], optional
+            The IFC classes of the rows, subclasses included. Default is all ``IfcObject``.
+        psets : list[str], optional
+            The property and quantity sets to extract. Default is all of them.
+        properties : list[str], optional
+            The properties to extract, by name. Default is all of them.
+        quantities : bool, optional
+            Whether to extract the element quantities as well as the property sets. Default is True.
+        format : str, optional
+            The format of the table. Either "dict" for a dict of numpy arrays, "pandas" for a DataFrame indexed by GlobalId,
+            or "arrow" for a pyarrow Table. Default is "dict".
+
+        Returns
+        -------
+        dict[str, :class:`numpy.ndarray`] or :class:`pandas.DataFrame` or :class:`pyarrow.Table`
+            The ``GlobalId`` column, followed by one column per property named ``"<pset>.<property>"``.
+
+        """
+        table = property_table(self, types=types, psets=psets, properties=properties, quantities=quantities)
+        if format == "dict":
+            return table
+        elif format == "pandas":
+            try:
+                import pandas as pd
+            except ImportError:
+                raise ImportError("The pandas format requires pandas to be installed.")
+            return pd.DataFrame(table).set_index("GlobalId")
+        elif format == "arrow":
+            try:
+                import pyarrow as pa
+            except ImportError:
+                raise ImportError("The arrow format requires pyarrow to be installed.")
+            return pa.table(table)
+        else:
+            raise ValueError(f"Invalid format: {format}. Use 'dict', 'pandas' or 'arrow'.")
+
+    @property
+    def name_index(self) -> dict[str, set[int]]:
+        """The ids of the IfcRoot entities by name, built from the raw instances without wrapping them."""
+        if self._nameindex is None:
+            index = {}
+            for entity in self._file.by_type("IfcRoot"):
+                if entity.Name is not None:
+                    index.setdefault(entity.Name, set()).add(entity.id())
+            self._nameindex = index
+            self._sortednames = None
+        return self._nameindex
+
+    @property
+    def spatial_hierarchy(self) -> SpatialHierarchy:
+        """
+        The index of the spatial and decomposition hierarchy, built on first use.
+
+        The index follows the entities created, related and removed through this file, and is rebuilt after a relationship
+        is modified through its wrapper. Relationships modified on the raw ifcopenshell file, for example with ``ifcopenshell.api``,
+        are not detected: call :meth:`compas_ifc.hierarchy.SpatialHierarchy.build` after such modifications.
+        """
+        if self._hierarchy is None:
+            self._hierarchy = SpatialHierarchy(self)
+        return self._hierarchy
+
+    def _invalidate_spatial_hierarchy(self):
+        """Drop the spatial hierarchy index after a relationship has been modified, it is rebuilt on next use."""
+        self._hierarchy = None
+
+    @property
+    def property_index(self) -> PropertyIndex:
+        """The inverted index of the single value properties, built on first use."""
+        if self._propertyindex is None:
+            with self.profiler.stage("property_index"):
+                self._propertyindex = PropertyIndex(self)
+        return self._propertyindex
+
+    def get_entities_by_property(self, pset: str, name: str, value: Any = None, minimum: float = None, maximum: float = None) -> list[Base]:
+        """
+        Get all entities with a property of a given value, or with a numeric property in a range.
+        The lookup goes through :attr:`property_index`, which only covers the properties assigned to the entities themselves.
+
+        Parameters
+        ----------
+        pset : str
+            The name of the property set.
+        name : str
+            The name of the property.
+        value : Any, optional
+            The value of the property.
+        minimum : float, optional
+            The lower bound of the range, if ``value`` is not given.
+        maximum : float, optional
+            The upper bound of the range, if ``value`` is not given.
+
+        Returns
+        -------
+        list[:class:`compas_ifc.entities.base.Base`]
+            A list of all entities with the property.
+
+        """
+        if value is not None:
+            ids = self.property_index.get_ids(pset, name, value)
+        elif minimum is not None or maximum is not None:
+            ids = self.property_index.get_ids_between(pset, name, minimum=minimum, maximum=maximum)
+        else:
+            raise ValueError("Either a value or a range must be given.")
+        return [self.from_entity(self._file.by_id(_id)) for _id in sorted(ids)]
+
+    def _update_name_index(self, entity: ifcopenshell.entity_instance, old_name: str = None, new_name: str = None):
+        """Move an entity in the name index after its name has changed."""
+        if self._nameindex is None:
+            return
+        if old_name is not None and old_name in self._nameindex:
+            self._nameindex[old_name].discard(entity.id())
+            if not self._nameindex[old_name]:
+                del self._nameindex[old_name]
+        if new_name is not None:
+            self._nameindex.setdefault(new_name, set()).add(entity.id())
+        self._sortednames = None
 
     def get_entity_by_global_id(self, global_id: str) -> Base:
         """
@@ -262,93 +623,350 @@ class IFCFile(object):
         :class:`compas_ifc.brep.TessellatedBrep`
             The preloaded geometry of the entity. (OCCBrep if use_occ is True)
         """
+        if self.lazy_geometries:
+            self._load_geometry(entity)
         return self._geometrymap.get(entity.entity.id())
 
     def get_preloaded_style(self, entity: Base) -> dict:
         """
         Get the preloaded style of an entity.
         """
+        if self.lazy_geometries:
+            self._load_geometry(entity)
         return self._stylemap.get(entity.entity.id(), {})
 
-    def load_geometries(self, include=None, exclude=None):
+    def _load_geometry(self, entity: Base):
+        """Tessellate the geometry of a single entity, unless it has been loaded already."""
+        _id = entity.entity.id()
+        if _id in self._geometrymap or _id in self._nogeometry:
+            return
+
+        if not getattr(entity.entity, "Representation", None):
+            self._nogeometry.add(_id)
+            return
+
+        import ifcopenshell.geom
+
+        try:
+            profile = self._tessellation_profile(entity.entity, self.lod, self.tessellation_profiles)
+            shape = ifcopenshell.geom.create_shape(self._geometry_settings(profile), entity.entity)
+        except RuntimeError:
+            self._nogeometry.add(_id)
+            return
+
+        shape_id, brep, style = self._shape_to_brep(shape)
+        self._geometrymap[shape_id] = brep
+        self._stylemap[shape_id] = style
+
+    def prefetch_geometries(self, entities: list[Base]):
         """
-        Load all the geometries of the IFC file using a fast multithreaded iterator.
+        Tessellate the geometries of a subset of entities at once using the multithreaded iterator.
+        Entities whose geometry has already been loaded are skipped.
 
         Parameters
         ----------
-        include : list[str], optional
-            A list of entity types to include.
-        exclude : list[str], optional
-            A list of entity types to exclude.
+        entities : list[:class:`compas_ifc.entities.base.Base`]
+            The entities to load the geometries of.
 
         """
+        include = []
+        for entity in entities:
+            _id = entity.entity.id()
+            if _id in self._geometrymap or _id in self._nogeometry:
+                continue
+            if getattr(entity.entity, "Representation", None):
+                include.append(entity.entity)
+            else:
+                self._nogeometry.add(_id)
+
+        if not include:
+            return
+
+        start = time.time()
+        for products, profile in self._group_by_tessellation_profile(include, self.lod, self.tessellation_profiles):
+            for shape_id, brep, style in self._tessellate(include=products, profile=profile):
+                self._geometrymap[shape_id] = brep
+                self._stylemap[shape_id] = style
+
         if self.verbose:
-            print("Loading geometries...")
+            print(f"Time to prefetch {len(include)} geometries {(time.time() - start):.3f}s")
+
+    def _geometry_settings(self, profile: dict = None) -> "ifcopenshell.geom.settings":
         import ifcopenshell.geom
 
         settings = ifcopenshell.geom.settings()
         settings.set(settings.CONVERT_BACK_UNITS, True)
         if self.use_occ:
             settings.set(settings.USE_PYTHON_OPENCASCADE, True)
+        if profile:
+            apply_tessellation_profile(settings, profile)
+        return settings
+
+    def _tessellation_profile(self, product: ifcopenshell.entity_instance, lod=None, profiles=None) -> dict:
+        """Get the tessellation settings of a product, from the first matching profile applied on top of the LOD."""
+        profile = dict(tessellation_profile(lod))
+        for selector, settings in (profiles or {}).items():
+            if isinstance(selector, str):
+                matched = product.is_a(selector)
+            else:
+                matched = selector(self.from_entity(product))
+            if matched:
+                profile.update(tessellation_profile(settings))
+                break
+        return profile
+
+    def _group_by_tessellation_profile(self, products: list[ifcopenshell.entity_instance], lod=None, profiles=None) -> list[tuple[list, dict]]:
+        """Group products by their tessellation settings, so that every group can be tessellated in a single iterator pass."""
+        groups = {}
+        for product in products:
+            profile = self._tessellation_profile(product, lod, profiles)
+            key = tuple(sorted(profile.items()))
+            groups.setdefault(key, (profile, []))[1].append(product)
+        return [(group, profile) for profile, group in groups.values()]
+
+    def _tessellation_passes(self, include=None, exclude=None, lod=None, profiles=None, split: bool = False) -> list[tuple[list, dict]]:
+        """Get the products and tessellation settings of each iterator pass. Without profiles, a single pass over the filtered products is made."""
+        if profiles or split:
+            products = [self._file.by_id(_id) for _id in self._product_ids(include=include, exclude=exclude)]
+            return self._group_by_tessellation_profile(products, lod, profiles)
+        return [(None, tessellation_profile(lod))]
+
+    def _tessellate_pass(self, products: list, profile: dict, include=None, exclude=None):
+        """Tessellate the products of a pass, or all the products matching include and exclude if the pass has no products."""
+        if products is None:
+            return self._tessellate(include=include, exclude=exclude, profile=profile)
+        return self._tessellate(include=products, profile=profile)
+
+    def _geometry_cache_key(self, include=None, exclude=None, lod=None, profiles=None) -> str:
+        def serialize(types):
+            if types is None:
+                return None
+            return sorted(t if isinstance(t, str) else t.id() for t in types)
+
+        settings = {
+            "CONVERT_BACK_UNITS": True,
+            "use_occ": self.use_occ,
+            "packed": self.packed_geometries,
+            "include": serialize(include),
+            "exclude": serialize(exclude),
+            "lod": tessellation_profile(lod),
+            "profiles": [[selector, tessellation_profile(profile)] for selector, profile in (profiles or {}).items()],
+        }
+        return self.geometry_cache.key(self.filepath, settings)
+
+    def _shape_to_brep(self, shape) -> tuple:
+        """Convert a shape coming from the ifcopenshell geometry iterator to a brep and its style."""
+        if self.use_occ:
+            from compas_occ.brep import OCCBrep
+
+            brep = OCCBrep.from_shape(shape.geometry)
+
+            shellcolors = []
+            for style_id, style in zip(shape.style_ids, shape.styles):
+                if style_id == -1:
+                    shellcolors.append((0.5, 0.5, 0.5, 1.0))
+                else:
+                    shellcolors.append(style)
 
+            return shape.data.id, brep, {"shellcolors": shellcolors}
+
+        transformation = self._shape_transformation(shape)
+
+        if self.instancing:
+            # Products sharing a representation (e.g. through IfcRepresentationMap) have the same geometry id.
+            geometry_id = shape.geometry.id
+            if geometry_id not in self._shapemap:
+                self._shapemap[geometry_id] = self._shape_to_local_brep(shape)
+            brep, style = self._shapemap[geometry_id]
+        else:
+            brep, style = self._shape_to_local_brep(shape)
+
+        # NOTE: the brep is kept in the local coordinates of the shape, with its placement.
+        # The vertices are only transformed to world coordinates when they are first accessed.
+        return shape.id, TessellatedBrepInstance(brep, transformation), style
+
+    def _shape_transformation(self, shape) -> Transformation:
+        return Transformation.from_matrix(shape_matrix(shape).tolist())
+
+    def _shape_to_local_brep(self, shape) -> tuple:
+        brep = TessellatedBrep(vertices=shape.geometry.verts, edges=shape.geometry.edges, faces=shape.geometry.faces)
+        return brep, {"facecolors": shape_facecolors(shape)}
+
+    def _tessellate(self, include=None, exclude=None, profile: dict = None):
+        """Run the multithreaded geometry iterator and yield the converted shapes one by one."""
+        import ifcopenshell.geom
+
+        if include is None and exclude is None:
+            exclude = DEFAULT_EXCLUDE
+
+        profiler = self.profiler
+        settings = self._geometry_settings(profile)
         iterator = ifcopenshell.geom.iterator(settings, self._file, multiprocessing.cpu_count(), include=include, exclude=exclude)
-        start = time.time()
-        if iterator.initialize():
+        with profiler.stage("iterator_initialize"):
+            initialized = iterator.initialize()
+        if initialized:
             while True:
-                shape = iterator.get()
-                if self.use_occ:
-                    from compas_occ.brep import OCCBrep
+                with profiler.stage("tessellation", trace=False):
+                    shape = iterator.get()
+                with profiler.stage("postprocess", trace=False):
+                    result = self._shape_to_brep(shape)
+                if profiler.enabled and not self.use_occ:
+                    profiler.count_shape(shape.type, len(shape.geometry.faces) // 3)
+                yield result
+
+                with profiler.stage("tessellation", trace=False):
+                    done = not iterator.next()
+                if done:
+                    break
 
-                    brep = OCCBrep.from_shape(shape.geometry)
+    def iter_geometries(
+        self, include=None, exclude=None, retain: bool = False, lod: Union[str, dict] = None, profiles: Dict[Union[str, Callable], Union[str, dict]] = None
+    ) -> Generator[tuple[Base, "TessellatedBrep", dict], None, None]:
+        """
+        Iterate over the geometries of the IFC file as they are tessellated by the multithreaded iterator.
+        Unlike :meth:`load_geometries`, the geometries are not kept in memory unless ``retain`` is True,
+        so large files can be processed with a constant memory footprint.
 
-                    shellcolors = []
-                    for style_id, style in zip(shape.style_ids, shape.styles):
-                        if style_id == -1:
-                            shellcolors.append((0.5, 0.5, 0.5, 1.0))
-                        else:
-                            shellcolors.append(style)
+        Parameters
+        ----------
+        include : list[str], optional
+            A list of entity types to include.
+        exclude : list[str], optional
+            A list of entity types to exclude. If neither include nor exclude is given, :data:`DEFAULT_EXCLUDE` is excluded.
+        retain : bool, optional
+            Whether to also store the geometries as preloaded geometries of the entities. Default is False.
+        lod : str or dict, optional
+            The tessellation profile used for all the geometries. Defaults to :attr:`lod`.
+        profiles : dict, optional
+            Tessellation profiles by IFC class name or by predicate, tessellated in separate passes. Defaults to :attr:`tessellation_profiles`.
+
+        Yields
+        ------
+        tuple[:class:`compas_ifc.entities.base.Base`, :class:`compas_ifc.brep.TessellatedBrep`, dict]
+            The entity, its geometry (OCCBrep if use_occ is True) and its style.
 
-                    self._geometrymap[shape.data.id] = brep
-                    self._stylemap[shape.data.id] = {"shellcolors": shellcolors}
+        """
+        lod = self.lod if lod is None else lod
+        profiles = self.tessellation_profiles if profiles is None else profiles
+        passes = self._tessellation_passes(include=include, exclude=exclude, lod=lod, profiles=profiles)
+        for products, profile in passes:
+            for shape_id, brep, style in self._tessellate_pass(products, profile, include=include, exclude=exclude):
+                if retain:
+                    self._geometrymap[shape_id] = brep
+                    self._stylemap[shape_id] = style
+                yield self.get_entity_by_id(shape_id), brep, style
+
+    def load_geometries(self, include=None, exclude=None, lod: Union[str, dict] = None, profiles: Dict[Union[str, Callable], Union[str, dict]] = None):
+        """
+        Load all the geometries of the IFC file using a fast multithreaded iterator.
+        If a geometry cache is set, the geometries are read from the cache when the file has been loaded before.
 
-                else:
-                    from .brep import TessellatedBrep
-
-                    matrix = shape.transformation.matrix.data
-                    faces = shape.geometry.faces
-                    edges = shape.geometry.edges
-                    verts = shape.geometry.verts
-
-                    matrix = np.array(matrix).reshape((4, 3))
-                    matrix = np.hstack([matrix, np.array([[0], [0], [0], [1]])])
-                    matrix = matrix.transpose()
-                    transformation = Transformation.from_matrix(matrix.tolist())
-
-                    facecolors = []
-                    for m_id in shape.geometry.material_ids:
-                        if m_id == -1:
-                            facecolors.append([0.5, 0.5, 0.5, 1])
-                            facecolors.append([0.5, 0.5, 0.5, 1])
-                            facecolors.append([0.5, 0.5, 0.5, 1])
-                            continue
-                        material = shape.geometry.materials[m_id]
-                        color = (*material.diffuse, 1 - material.transparency)
-                        facecolors.append(color)
-                        facecolors.append(color)
-                        facecolors.append(color)
-
-                    brep = TessellatedBrep(vertices=verts, edges=edges, faces=faces)
-
-                    brep.transform(transformation)
-                    self._geometrymap[shape.id] = brep
-                    self._stylemap[shape.id] = {"facecolors": facecolors}
-
-                if not iterator.next():
-                    break
+        Parameters
+        ----------
+        include : list[str], optional
+            A list of entity types to include.
+        exclude : list[str], optional
+            A list of entity types to exclude. If neither include nor exclude is given, :data:`DEFAULT_EXCLUDE` is excluded.
+        lod : str or dict, optional
+            The tessellation profile used for all the geometries. Defaults to :attr:`lod`.
+        profiles : dict, optional
+            Tessellation profiles by IFC class name or by predicate, tessellated in separate passes. Defaults to :attr:`tessellation_profiles`.
+
+        """
+        lod = self.lod if lod is None else lod
+        profiles = self.tessellation_profiles if profiles is None else profiles
+
+        if self.verbose:
+            print("Loading geometries...")
+
+        with self.profiler.stage("load_geometries"):
+            self._load_geometries(include=include, exclude=exclude, lod=lod, profiles=profiles)
+
+    def _load_geometries(self, include=None, exclude=None, lod=None, profiles=None):
+        start = time.time()
+
+        # NOTE: OCC shapes can not be serialized to the cache, and instances are stored by reference to their shared geometry.
+        use_cache = self.geometry_cache is not None and self.filepath is not None and not self.use_occ and not self.instancing
+        # NOTE: predicates can not be hashed reliably into a cache key.
+        use_cache = use_cache and all(isinstance(selector, str) for selector in profiles)
+        if use_cache:
+            key = self._geometry_cache_key(include=include, exclude=exclude, lod=lod, profiles=profiles)
+            with self.profiler.stage("cache_load"):
+                buffer = self.geometry_cache.load(key, mmap=self.packed_geometries)
+            if buffer is not None:
+                self._add_geometry_buffer(buffer)
+                if self.verbose:
+                    print(f"Time to load all {len(buffer)} geometries from cache {(time.time() - start):.3f}s")
+                return
+
+        loaded = {}
+        use_processes = self.processes and self.processes > 1 and self.filepath is not None and not self.use_occ and not self.instancing
+
+        passes = self._tessellation_passes(include=include, exclude=exclude, lod=lod, profiles=profiles, split=use_processes)
+
+        for products, profile in passes:
+            if use_processes:
+                from compas_ifc.parallel import tessellate_in_processes
+
+                ids = [product.id() for product in products]
+                dtype = np.float32 if self.packed_geometries else np.float64
+                with self.profiler.stage("process_pool"):
+                    buffers, blocks = tessellate_in_processes(self.filepath, ids, self.processes, dtype=dtype, profile=profile)
+                self._sharedmemory.extend(blocks)
+                for buffer in buffers:
+                    self._add_geometry_buffer(buffer)
+                    if self.profiler.enabled:
+                        for shape_id in buffer:
+                            self.profiler.count_shape(self._file.by_id(shape_id).is_a(), len(buffer.get_faces(shape_id)))
+                    loaded.update({shape_id: self._geometrymap[shape_id] for shape_id in buffer})
+            else:
+                for shape_id, brep, style in self._tessellate_pass(products, profile, include=include, exclude=exclude):
+                    self._geometrymap[shape_id] = brep
+                    self._stylemap[shape_id] = style
+                    loaded[shape_id] = brep
+
+        if (use_cache or (self.packed_geometries and not use_processes)) and not self.use_occ and not self.instancing:
+            facecolors = {shape_id: self._stylemap[shape_id]["facecolors"] for shape_id in loaded}
+            placements = {shape_id: np.asarray(brep.transformation.matrix) for shape_id, brep in loaded.items()}
+            local = {shape_id: brep.brep for shape_id, brep in loaded.items()}
+            buffer = GeometryBuffer.from_breps(local, facecolors, dtype=np.float32 if self.packed_geometries else np.float64, placements=placements)
+            if use_cache:
+                with self.profiler.stage("cache_save"):
+                    self.geometry_cache.save(key, buffer)
+            if self.packed_geometries and not use_processes:
+                self._add_geometry_buffer(buffer)
 
         if self.verbose:
             print(f"Time to load all {len(self._geometrymap)} geometries {(time.time() - start):.3f}s")
 
+    def _product_ids(self, include=None, exclude=None) -> list[int]:
+        """Get the ids of the products with a representation, filtered the same way as by the geometry iterator."""
+
+        def matches(product, types):
+            return any(product.is_a(t) if isinstance(t, str) else product == t for t in types)
+
+        if include is None and exclude is None:
+            exclude = DEFAULT_EXCLUDE
+
+        ids = []
+        for product in self._file.by_type("IfcProduct"):
+            if not product.Representation:
+                continue
+            if include is not None and not matches(product, include):
+                continue
+            if exclude is not None and matches(product, exclude):
+                continue
+            ids.append(product.id())
+        return ids
+
+    def _add_geometry_buffer(self, buffer: GeometryBuffer):
+        """Use the geometries of a packed buffer as preloaded geometries, placed over zero-copy views of the local geometries."""
+        self._geometrybuffers.append(buffer)
+        for shape_id in buffer:
+            transformation = Transformation.from_matrix(buffer.get_placement(shape_id).tolist())
+            self._geometrymap[shape_id] = TessellatedBrepInstance(buffer.get_brep(shape_id), transformation)
+            self._stylemap[shape_id] = {"facecolors": buffer.get_facecolors(shape_id)}
+
     def save(self, path: str):
         """
         Save the IFC file to a given path.
@@ -462,6 +1080,27 @@ class IFCFile(object):
             The newly created entity.
 
         """
+        cls_name = self._resolve_class_name(cls)
+        entity = self._create_entity(cls_name, **kwargs)
+
+        if parent:
+            self.create_relationship(parent, entity)
+
+        if geometry:
+            entity.geometry = geometry
+
+        if frame:
+            entity.frame = frame
+
+        if properties:
+            entity.property_sets = properties
+
+        if entity.is_a("IfcRoot"):
+            entity.GlobalId = ifcopenshell.guid.new()
+
+        return entity
+
+    def _resolve_class_name(self, cls) -> str:
         if isinstance(cls, type):
             cls_name = cls.__name__
         else:
@@ -476,30 +1115,184 @@ class IFCFile(object):
                 raise ValueError(f"Class {cls_name} not found.")
             else:
                 cls_name = matched_classes[0]
+        return cls_name
 
-        entity = self._create_entity(cls_name, **kwargs)
+    def create_many(self, cls=None, records: Iterable[dict] = (), parent=None) -> list[Base]:
+        """
+        Create many entities of the same class in this model.
 
-        if parent:
-            self.create_relationship(parent, entity)
+        The class is validated once, and the keyword arguments are converted once per distinct set of keys.
+        Entities and placements are written directly as raw instances. Children of the same parent share one relationship,
+        and equal property sets are written once, with one ``IfcRelDefinesByProperties`` for all the entities using them.
+        Geometries go through the same representation cache as :meth:`create`, so identical geometries are converted once,
+        and all the entities of the batch with the same geometry place one ``IfcRepresentationMap``.
 
-        if geometry:
-            # TODO: Deal with instancing
-            entity.geometry = geometry
+        Parameters
+        ----------
+        cls : str
+            The class of the entities to create. Defaults to an `IfcBuildingElementProxy`.
+        records : Iterable[dict]
+            The keyword arguments of each entity, as for :meth:`create`. The ``parent``, ``geometry``, ``frame`` and ``properties``
+            keys are handled like the parameters of :meth:`create`. A ``frame`` or ``geometry`` raises a ValueError if the class is not an ``IfcProduct``.
+        parent : :class:`compas_ifc.entities.base.Base`, optional
+            The parent of the records that do not have one.
 
-        if frame:
-            entity.frame = frame
+        Returns
+        -------
+        list[:class:`compas_ifc.entities.base.Base`]
+            The newly created entities, in the order of the records.
 
-        if properties:
-            entity.property_sets = properties
+        """
+        cls_name = self._resolve_class_name(cls)
+        is_root = self._is_subclass(cls_name, "IfcRoot")
+        is_product = self._is_subclass(cls_name, "IfcProduct")
+
+        keys = {}  # camelCase attribute names by key
+        entities = []
+        children = {}  # ids of the children by parent id, in order
+        parents = {}
+        geometries = []
+        psets = {}  # created property set and related objects by frozen property sets
+        create_entity = self._file.create_entity
+
+        with self.profiler.stage("create_many"):
+            for record in records:
+                record = dict(record)
+                record_parent = record.pop("parent", None) or parent
+                geometry = record.pop("geometry", None)
+                frame = record.pop("frame", None)
+                properties = record.pop("properties", None)
+
+                attributes = {}
+                for key, value in record.items():
+                    if key not in keys:
+                        keys[key] = key if key[0].isupper() else "".join([word.capitalize() for word in key.split("_")])
+                    if isinstance(value, Base):
+                        value = value.entity
+                    elif isinstance(value, (list, tuple)):
+                        value = [v.entity if isinstance(v, Base) else v for v in value]
+                    attributes[keys[key]] = value
+
+                if not is_product and (frame is not None or geometry is not None):
+                    raise ValueError(f"Class {cls_name} is not an IfcProduct, it can not have a frame or a geometry.")
+                if is_root and "GlobalId" not in attributes:
+                    attributes["GlobalId"] = ifcopenshell.guid.new()
+                if frame is not None:
+                    attributes["ObjectPlacement"] = self._create_local_placement(frame)
+
+                entity = create_entity(cls_name, **attributes)
+                entities.append(entity)
+                if is_root and entity.Name is not None:
+                    self._update_name_index(entity, new_name=entity.Name)
+
+                if record_parent is not None:
+                    parents[record_parent.id()] = record_parent
+                    children.setdefault(record_parent.id(), []).append(entity)
+                if geometry is not None:
+                    geometries.append((len(entities) - 1, geometry))
+                if properties:
+                    key = _freeze(properties)
+                    if key not in psets:
+                        psets[key] = (properties, [])
+                    psets[key][1].append(entity)
+
+            wrappers = [self.from_entity(entity) for entity in entities]
+            if not wrappers:
+                return wrappers
+
+            for parent_id, related in children.items():
+                self._relate(parents[parent_id], related)
+
+            if geometries:
+                self._assign_body_representations([(wrappers[index], geometry) for index, geometry in geometries])
+
+            if psets:
+                from compas_ifc.conversions.pset import from_dict_to_pset
+
+                for properties, related in psets.values():
+                    for name, pset in properties.items():
+                        self._create_entity(
+                            "IfcRelDefinesByProperties",
+                            GlobalId=ifcopenshell.guid.new(),
+                            OwnerHistory=self.default_owner_history,
+                            RelatingPropertyDefinition=from_dict_to_pset(self, pset, name),
+                            RelatedObjects=related,
+                        )
+
+        return wrappers
+
+    def _assign_body_representations(self, geometries: list[tuple[Base, Any]]):
+        """Assign the geometries of many products at once, writing each distinct geometry used more than once as one representation map."""
+        from compas_ifc.conversions.representation import assign_mapped_representation
+        from compas_ifc.conversions.representation import geometry_fingerprint
+        from compas_ifc.conversions.representation import shared_representation_map
+
+        # Products by fingerprint, each distinct geometry object being fingerprinted once.
+        fingerprints = {}
+        groups = {}
+        for entity, geometry in geometries:
+            if isinstance(geometry, Base):
+                entity.geometry = geometry
+                continue
+            if id(geometry) not in fingerprints:
+                fingerprints[id(geometry)] = geometry_fingerprint(geometry)
+            key = fingerprints[id(geometry)]
+            if key is None:
+                entity.geometry = geometry
+                continue
+            groups.setdefault(key, (geometry, []))[1].append(entity)
+
+        for key, (geometry, entities) in groups.items():
+            if len(entities) == 1 and key not in self.representation_cache:
+                entities[0].geometry = geometry
+                continue
+            # NOTE: the map is shared, but each product has its own product definition shape,
+            # since IFC2X3 allows a product definition shape to belong to one product only.
+            representation_map = shared_representation_map(self.model, geometry)
+            for entity in entities:
+                entity._geometry_local = geometry
+                entity._geometry_world = None
+                entity._geometry_assigned = True
+                assign_mapped_representation(entity, representation_map)
+
+    def _is_subclass(self, cls_name: str, base_name: str) -> bool:
+        declaration = self.schema.declaration_by_name(cls_name)
+        while declaration is not None:
+            if declaration.name() == base_name:
+                return True
+            declaration = declaration.supertype()
+        return False
+
+    def _create_local_placement(self, frame) -> ifcopenshell.entity_instance:
+        """Create an IfcLocalPlacement from a frame, as a raw instance, with a pooled relative placement."""
+        placement = self.primitive_pool.axis2placement3d(frame.point, frame.zaxis, frame.xaxis)
+        return self._file.create_entity("IfcLocalPlacement", RelativePlacement=placement.entity)
+
+    def create_representation_map(self, geometry) -> Base:
+        """
+        Write a geometry once as an ``IfcRepresentationMap``, to be placed by many products.
+        The map can be given as the ``geometry`` of :meth:`create`, or of :meth:`create_many` records.
 
-        if entity.is_a("IfcRoot"):
-            entity.GlobalId = ifcopenshell.guid.new()
+        Parameters
+        ----------
+        geometry : :class:`compas.geometry.Geometry` or :class:`compas.datastructures.Datastructure`
+            The geometry.
 
-        return entity
+        Returns
+        -------
+        :class:`compas_ifc.entities.base.Base`
+            The representation map, shared with any identical geometry assigned to a product of this file.
+
+        """
+        from compas_ifc.conversions.representation import shared_representation_map
+
+        return shared_representation_map(self.model, geometry)
 
     def create_relationship(self, parent: Base, child: Base) -> Base:
         """
         Create the correct relationship between two entities based on their types.
+        If the parent already has a relationship of that type with a list of related objects,
+        such as an ``IfcRelContainedInSpatialStructure``, the child is added to it instead.
 
         Parameters
         ----------
@@ -511,32 +1304,111 @@ class IFCFile(object):
         Returns
         -------
         :class:`compas_ifc.entities.base.Base`
-            The created relationship.
+            The created or extended relationship.
 
         """
+        return self._relate(parent, [child.entity])
+
+    def _relate(self, parent: Base, children: list[ifcopenshell.entity_instance]) -> Base:
+        """Relate children of the same class to a parent, extending the existing relationship of the parent if there is one."""
+        cls_name, relating, related, many = self._relationship_type(parent, self.from_entity(children[0]))
+        if not many:
+            for child in children:
+                relation = self._create_entity(cls_name, GlobalId=ifcopenshell.guid.new(), **{relating: parent, related: child})
+            return relation
+
+        key = (parent.id(), cls_name)
+        if self._pendingrelations is not None and key in self._pendingrelations:
+            relation, _, pending = self._pendingrelations[key]
+            pending.extend(children)
+        else:
+            relation = self._find_relationship(parent, cls_name)
+            if relation is None:
+                relation = self._create_entity(cls_name, GlobalId=ifcopenshell.guid.new(), **{relating: parent, related: children})
+                if self._pendingrelations is not None:
+                    self._pendingrelations[key] = (relation.entity, related, [])
+                return relation
+            if self._pendingrelations is not None:
+                self._pendingrelations[key] = (relation, related, list(children))
+            else:
+                setattr(relation, related, list(getattr(relation, related)) + list(children))
+
+        if self._hierarchy is not None:
+            self._hierarchy.add_relationship(relation, related=children)
+        return self.from_entity(relation)
+
+    def _find_relationship(self, parent: Base, cls_name: str) -> ifcopenshell.entity_instance:
+        """Find the relationship of a class in which the parent is the relating object, through the inverse attributes of the parent."""
+        for inverse in RELATING_INVERSES[cls_name]:
+            relations = getattr(parent.entity, inverse, None) or ()
+            # NOTE: IfcGroup.IsGroupedBy is a single relationship in IFC2X3.
+            if not isinstance(relations, tuple):
+                relations = (relations,)
+            for relation in relations:
+                if relation.is_a() == cls_name:
+                    return relation
+        return None
+
+    @contextmanager
+    def deferred_relationships(self):
+        """
+        Defer the extension of existing relationships until the end of the context, to author many children of the same parents.
 
-        guid = ifcopenshell.guid.new()
+        Without deferring, adding a child to an existing relationship rewrites its list of related objects,
+        which is quadratic in the number of children. Within the context, the new children are collected
+        per relationship and written once, when the context exits or :meth:`flush_relationships` is called.
+
+        Examples
+        --------
+        >>> with file.deferred_relationships():
+        ...     for i in range(20000):
+        ...         file.create("IfcWall", parent=storey, Name=f"Wall {i}")
+
+        """
+        if self._pendingrelations is not None:
+            yield
+            return
+
+        self._pendingrelations = {}
+        try:
+            yield
+        finally:
+            self.flush_relationships()
+            self._pendingrelations = None
+
+    def flush_relationships(self):
+        """Write the children collected in :meth:`deferred_relationships` to their relationships."""
+        if not self._pendingrelations:
+            return
+
+        for relation, related, pending in self._pendingrelations.values():
+            if pending:
+                setattr(relation, related, list(getattr(relation, related)) + pending)
+        self._pendingrelations = {}
+
+    def _relationship_type(self, parent: Base, child: Base) -> tuple[str, str, str, bool]:
+        """Get the relationship class between two entities, the names of its relating and related attributes, and whether the related attribute is a list."""
         if parent.is_a("IfcSpatialStructureElement"):
             if child.is_a("IfcSpatialStructureElement"):
-                return self._create_entity("IfcRelAggregates", GlobalId=guid, RelatingObject=parent, RelatedObjects=[child])
-            return self._create_entity("IfcRelContainedInSpatialStructure", GlobalId=guid, RelatingStructure=parent, RelatedElements=[child])
+                return "IfcRelAggregates", "RelatingObject", "RelatedObjects", True
+            return "IfcRelContainedInSpatialStructure", "RelatingStructure", "RelatedElements", True
 
         if parent.is_a("IfcElementAssembly") or child.is_a("IfcBuildingElementPart"):
-            return self._create_entity("IfcRelAggregates", GlobalId=guid, RelatingObject=parent, RelatedObjects=[child])
+            return "IfcRelAggregates", "RelatingObject", "RelatedObjects", True
 
         if parent.is_a("IfcPort"):
             if not child.is_a("IfcPort"):
-                return self._create_entity("IfcRelConnectsPortToElement", GlobalId=guid, RelatingPort=parent, RelatedElement=child)
-            return self._create_entity("IfcRelConnectsPorts", GlobalId=guid, RelatingPort=parent, RelatedPort=child)
+                return "IfcRelConnectsPortToElement", "RelatingPort", "RelatedElement", False
+            return "IfcRelConnectsPorts", "RelatingPort", "RelatedPort", False
 
         if parent.is_a("IfcElement") and child.is_a("IfcElement"):
-            return self._create_entity("IfcRelConnectsElements", GlobalId=guid, RelatingElement=parent, RelatedElement=child)
+            return "IfcRelConnectsElements", "RelatingElement", "RelatedElement", False
 
         if parent.is_a("IfcGroup"):
-            return self._create_entity("IfcRelAssignsToGroup", GlobalId=guid, RelatingGroup=parent, RelatedObjects=[child])
+            return "IfcRelAssignsToGroup", "RelatingGroup", "RelatedObjects", True
 
         # Default case
-        return self._create_entity("IfcRelAggregates", GlobalId=guid, RelatingObject=parent, RelatedObjects=[child])
+        return "IfcRelAggregates", "RelatingObject", "RelatedObjects", True
 
     def search_ifc_classes(self, name: str, n: int = 5) -> list[Type["Base"]]:
         """
@@ -575,10 +1447,22 @@ class IFCFile(object):
             entity = [entity]
 
         print(f"Removing {len(entity)} entities...")
+        if self._hierarchy is not None:
+            if any(e.is_a("IfcRelAggregates") or e.is_a("IfcRelContainedInSpatialStructure") for e in entity):
+                self._hierarchy = None
+            else:
+                for e in entity:
+                    self._hierarchy.remove_entity(e)
         ifcopenshell.util.element.batch_remove_deep2(self._file)
         for e in entity:
             ifcopenshell.util.element.remove_deep2(self._file, e.entity)
         self._file = ifcopenshell.util.element.unbatch_remove_deep2(self._file)
+        # NOTE: related entities may have been removed as well, the name and property indices are rebuilt on the next lookup,
+        # and the pools are cleared so that they never hand out a removed entity.
+        self._nameindex = None
+        self._propertyindex = None
+        self.primitive_pool.clear()
+        self.representation_cache.clear()
         print("Removal done.")
 
     def _create_entity(self, cls_name, **kwargs) -> Base:
@@ -598,6 +1482,12 @@ class IFCFile(object):
                 camel_case_kwargs[camel_case_key] = kwargs[key]
 
         entity = self._file.create_entity(cls_name, **camel_case_kwargs)
+        if entity.is_a("IfcRoot") and entity.Name is not None:
+            self._update_name_index(entity, new_name=entity.Name)
+        if self._hierarchy is not None:
+            self._hierarchy.add_relationship(entity)
+        if self._propertyindex is not None:
+            self._propertyindex.add_relationship(entity)
         return self.from_entity(entity)
 
     def create_value(self, value):
@@ -679,6 +1569,13 @@ class IFCFile(object):
 
         return self._default_body_context
 
+    @property
+    def default_mapping_target(self) -> Base:
+        if not self._default_mapping_target:
+            origin = self.primitive_pool.point([0.0, 0.0, 0.0])
+            self._default_mapping_target = self._create_entity("IfcCartesianTransformationOperator3D", LocalOrigin=origin)
+        return self._default_mapping_target
+
     @property
     def default_owner_history(self) -> Base:
         # We will create a new owner history since we are updating the file
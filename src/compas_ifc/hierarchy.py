@@ -0,0 +1,165 @@
+from typing import TYPE_CHECKING
+from typing import Union
+
+import ifcopenshell
+
+if TYPE_CHECKING:
+    from compas_ifc.entities.base import Base
+    from compas_ifc.file import IFCFile
+
+
+class SpatialHierarchy(object):
+    """An index of the spatial and decomposition hierarchy of an IFC file, with constant time parent and children lookups.
+
+    The index is built in a single pass over all the ``IfcRelAggregates`` and ``IfcRelContainedInSpatialStructure``
+    of the file, using the raw ifcopenshell instances. Elements contained in a spatial structure have that structure as parent,
+    other object definitions have the object they decompose. Descendant queries are cached until the hierarchy changes.
+
+    Attributes
+    ----------
+    file : :class:`compas_ifc.file.IFCFile`
+        The IFC file.
+
+    """
+
+    def __init__(self, file: "IFCFile"):
+        self.file = file
+        self._parents = {}  # id of the parent, by id
+        self._children = {}  # ids of the children as an ordered set, by id
+        self._contained = set()  # ids of the elements whose parent is a spatial structure that contains them
+        self._descendants = {}  # ids of the descendants, by id and type name
+        self.build()
+
+    def __repr__(self):
+        return "<SpatialHierarchy {} nodes>".format(len(set(self._parents) | set(self._children)))
+
+    def build(self):
+        """Build the index from the relationships of the file."""
+        self._parents = {}
+        self._children = {}
+        self._contained = set()
+        self._descendants = {}
+        for relation in self.file._file.by_type("IfcRelContainedInSpatialStructure"):
+            self.add_relationship(relation)
+        for relation in self.file._file.by_type("IfcRelAggregates"):
+            self.add_relationship(relation)
+
+    def add_relationship(self, relation: ifcopenshell.entity_instance, related: list[ifcopenshell.entity_instance] = None):
+        """
+        Add an ``IfcRelAggregates`` or ``IfcRelContainedInSpatialStructure`` to the index. Other relationships are ignored.
+
+        Parameters
+        ----------
+        relation : :class:`ifcopenshell.entity_instance`
+            The relationship.
+        related : list[:class:`ifcopenshell.entity_instance`], optional
+            Only add these related objects, for a relationship that was extended. Default is all the related objects.
+
+        """
+        if relation.is_a("IfcRelContainedInSpatialStructure"):
+            relating, contained = relation.RelatingStructure, True
+            related = relation.RelatedElements if related is None else related
+        elif relation.is_a("IfcRelAggregates"):
+            relating, contained = relation.RelatingObject, False
+            related = relation.RelatedObjects if related is None else related
+        else:
+            return
+
+        if relating is None:
+            return
+
+        self._descendants = {}
+        children = self._children.setdefault(relating.id(), {})
+        for child in related or []:
+            _id = child.id()
+            children[_id] = None
+            if contained:
+                # NOTE: only elements have ContainedInStructure, which takes precedence over Decomposes.
+                if child.is_a("IfcElement") and _id not in self._contained:
+                    self._parents[_id] = relating.id()
+                    self._contained.add(_id)
+            elif _id not in self._parents:
+                self._parents[_id] = relating.id()
+
+    def remove_entity(self, entity: Union["Base", ifcopenshell.entity_instance]):
+        """
+        Remove an entity from the index. Its children are left without parent.
+
+        Parameters
+        ----------
+        entity : :class:`compas_ifc.entities.base.Base` or :class:`ifcopenshell.entity_instance`
+            The removed entity.
+
+        """
+        _id = entity.id()
+        self._descendants = {}
+        parent = self._parents.pop(_id, None)
+        self._contained.discard(_id)
+        if parent is not None and parent in self._children:
+            self._children[parent].pop(_id, None)
+        for child in self._children.pop(_id, {}):
+            if self._parents.get(child) == _id:
+                del self._parents[child]
+                self._contained.discard(child)
+
+    def _wrap(self, _id: int) -> "Base":
+        return self.file.from_entity(self.file._file.by_id(_id))
+
+    def get_parent(self, entity: "Base") -> "Base":
+        """Get the parent of an entity, or None."""
+        parent = self._parents.get(entity.id())
+        return self._wrap(parent) if parent is not None else None
+
+    def get_children(self, entity: "Base") -> list["Base"]:
+        """Get the children of an entity, both decomposing and contained ones."""
+        return [self._wrap(_id) for _id in self._children.get(entity.id(), ())]
+
+    def get_descendants(self, entity: "Base", type_name: str = None) -> list["Base"]:
+        """
+        Get all the descendants of an entity, depth first.
+
+        Parameters
+        ----------
+        entity : :class:`compas_ifc.entities.base.Base`
+            The entity.
+        type_name : str, optional
+            Only return the descendants of this IFC class.
+
+        Returns
+        -------
+        list[:class:`compas_ifc.entities.base.Base`]
+
+        """
+        return [self._wrap(_id) for _id in self.descendant_ids(entity.id(), type_name)]
+
+    def descendant_ids(self, id: int, type_name: str = None) -> list[int]:
+        """
+        Get the ids of all the descendants of an entity, depth first, without wrapping them.
+        The returned list is cached until the hierarchy changes, and should not be modified.
+
+        Parameters
+        ----------
+        id : int
+            The id of the entity.
+        type_name : str, optional
+            Only return the descendants of this IFC class.
+
+        Returns
+        -------
+        list[int]
+
+        """
+        key = (id, type_name)
+        if key not in self._descendants:
+            if type_name is None:
+                ids = []
+                stack = list(reversed(self._children.get(id, ())))
+                while stack:
+                    child = stack.pop()
+                    ids.append(child)
+                    stack.extend(reversed(self._children.get(child, ())))
+            else:
+                by_id = self.file._file.by_id
+                ids = [child for child in self.descendant_ids(id) if by_id(child).is_a(type_name)]
+            self._descendants[key] = ids
+        return self._descendants[key]
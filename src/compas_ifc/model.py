@@ -1,6 +1,9 @@
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import Generator
+from typing import Iterable
 from typing import Type
 from typing import Union
 
@@ -15,12 +18,16 @@ from compas_ifc.file import IFCFile
 if TYPE_CHECKING:
     import ifcopenshell.ifcopenshell_wrapper
 
+    from compas_ifc.brep import TessellatedBrep
+    from compas_ifc.cache import GeometryCache
     from compas_ifc.entities.base import Base
     from compas_ifc.entities.generated.IFC4 import IfcBuilding
     from compas_ifc.entities.generated.IFC4 import IfcBuildingElement
     from compas_ifc.entities.generated.IFC4 import IfcBuildingStorey
     from compas_ifc.entities.generated.IFC4 import IfcProject
     from compas_ifc.entities.generated.IFC4 import IfcSite
+    from compas_ifc.profiler import LoadProfiler
+    from compas_ifc.query import Query
 
 
 class Model(Data):
@@ -49,10 +56,29 @@ class Model(Data):
         A list of all building element entities.
     unit : str
         The unit of the IFC file. Can be "mm", "cm", or "m".
+    profiler : :class:`compas_ifc.profiler.LoadProfiler`
+        The timings of the loading stages and the statistics of the loaded shapes, recorded if ``instrument`` is True.
 
     """
 
-    def __init__(self, filepath: str = None, schema: str = "IFC4", use_occ: bool = False, load_geometries: bool = True, verbose: bool = True, extensions: Dict[str, Type] = None):
+    def __init__(
+        self,
+        filepath: str = None,
+        schema: str = "IFC4",
+        use_occ: bool = False,
+        load_geometries: Union[bool, str] = True,
+        verbose: bool = True,
+        extensions: Dict[str, Type] = None,
+        geometry_cache: Union[str, "GeometryCache"] = None,
+        instancing: bool = False,
+        packed_geometries: bool = False,
+        processes: int = None,
+        lod: Union[str, dict] = None,
+        tessellation_profiles: Dict[Union[str, Callable], Union[str, dict]] = None,
+        instrument: bool = False,
+        entity_map: Union[str, int] = None,
+        representation_cache: int = None,
+    ):
         """
         Construct the Model object.
 
@@ -64,15 +90,59 @@ class Model(Data):
             The IFC schema to use. Default is "IFC4".
         use_occ : bool
             Whether to use OCC for geometry processing. Default is False.
-        load_geometries : bool
+        load_geometries : bool or str
             Whether to pre-load geometries from the IFC file using multi-threading. Default is True.
+            If "lazy", the geometry of each product is only tessellated when it is first accessed.
         verbose : bool
             Whether to print verbose output. Default is True.
         extensions : Dict[str, Type]
             A dictionary of extensions to use, with the key being the IFC class name and the value being the extension class.
+        geometry_cache : str or :class:`compas_ifc.cache.GeometryCache`
+            A folder or cache object in which tessellated geometries are stored.
+            Opening the same unchanged file again will then read the geometries from disk instead of re-tessellating them.
+        instancing : bool
+            Whether to keep a single tessellation per shared representation, e.g. identical windows placed through an IfcRepresentationMap.
+            The geometry of each product is then a lightweight :class:`compas_ifc.brep.TessellatedBrepInstance`. Default is False.
+        packed_geometries : bool
+            Whether to store all loaded geometries in one contiguous float32 vertex buffer and uint32 index buffers,
+            with the geometry of each product as a zero-copy view. Default is False.
+        processes : int
+            The number of worker processes in which the geometries are tessellated and post-processed, for large files on many cores.
+            Default is None, which loads the geometries with the multithreaded iterator in this process.
+        lod : str or dict
+            The tessellation quality of all geometries. Either a preset ("preview", "coarse", "default", "fine"),
+            or a dict with ``deflection``, ``angular_tolerance`` and ``disable_openings``. Default is None.
+        tessellation_profiles : dict
+            Tessellation qualities by IFC class name or by predicate, e.g. ``{"IfcFurnishingElement": "preview", "IfcBeam": "fine"}``.
+            Default is None.
+        instrument : bool
+            Whether to record the time of each loading stage and the shape statistics, see :attr:`profiler`. Default is False.
+        entity_map : str or int
+            How entity wrappers are kept. By default, all of them are kept for the lifetime of the model.
+            Use "weak" to only keep the ones still referenced, or a maximum number of wrappers to keep, for bounded memory on full-file scans.
+        representation_cache : int
+            The maximum number of distinct geometries remembered for writing identical ones only once, for bounded memory in long authoring sessions.
+            Default is None, which remembers all of them.
 
         """
-        self.file = IFCFile(self, filepath=filepath, schema=schema, use_occ=use_occ, load_geometries=load_geometries, verbose=verbose, extensions=extensions)
+        self.file = IFCFile(
+            self,
+            filepath=filepath,
+            schema=schema,
+            use_occ=use_occ,
+            load_geometries=load_geometries,
+            verbose=verbose,
+            extensions=extensions,
+            geometry_cache=geometry_cache,
+            instancing=instancing,
+            packed_geometries=packed_geometries,
+            processes=processes,
+            lod=lod,
+            tessellation_profiles=tessellation_profiles,
+            instrument=instrument,
+            entity_map=entity_map,
+            representation_cache=representation_cache,
+        )
 
     @property
     def schema(self) -> "ifcopenshell.ifcopenshell_wrapper.schema_definition":
@@ -82,6 +152,10 @@ class Model(Data):
     def schema_name(self) -> str:
         return self.file.schema_name
 
+    @property
+    def profiler(self) -> "LoadProfiler":
+        return self.file.profiler
+
     @property
     def entities(self) -> Generator["Base", None, None]:
         for entity in self.file._file:
@@ -144,20 +218,97 @@ class Model(Data):
         """
         return self.file.get_entities_by_type(type_name)
 
-    def get_entities_by_name(self, name: str) -> list["Base"]:
+    def get_entities_by_name(self, name: str, match: str = "exact") -> list["Base"]:
         """Get entities by name
 
         Parameters
         ----------
         name : str
             The name of the entity to get.
+        match : str
+            How the name is matched: "exact", "prefix" or "regex", where the regular expression must match the whole name. Default is "exact".
 
         Returns
         -------
         list[:class:`compas_ifc.entities.base.Base`]
             A list of entities with the given name.
         """
-        return self.file.get_entities_by_name(name)
+        return self.file.get_entities_by_name(name, match=match)
+
+    def query(self, *type_names: str) -> "Query":
+        """Start a lazy query over the entities of the model.
+        Predicates are evaluated on the raw IFC instances, and only the results are wrapped.
+
+        Parameters
+        ----------
+        *type_names : str
+            The IFC classes of the queried entities, subclasses included.
+
+        Returns
+        -------
+        :class:`compas_ifc.query.Query`
+
+        Examples
+        --------
+        >>> model.query("IfcWall").where("PredefinedType", "PARTITIONING").has_geometry().count()
+        """
+        return self.file.query(*type_names)
+
+    def property_table(self, types: list[str] = None, psets: list[str] = None, properties: list[str] = None, quantities: bool = True, format: str = "dict"):
+        """Extract properties of many entities at once, as a columnar table keyed by GlobalId.
+
+        Parameters
+        ----------
+        types : list[str], optional
+            The IFC classes of the rows, subclasses included. Default is all ``IfcObject``.
+        psets : list[str], optional
+            The property and quantity sets to extract. Default is all of them.
+        properties : list[str], optional
+            The properties to extract, by name. Default is all of them.
+        quantities : bool, optional
+            Whether to extract the element quantities as well as the property sets. Default is True.
+        format : str, optional
+            "dict" for a dict of numpy arrays, "pandas" for a DataFrame or "arrow" for a pyarrow Table. Default is "dict".
+
+        Returns
+        -------
+        dict[str, :class:`numpy.ndarray`] or :class:`pandas.DataFrame` or :class:`pyarrow.Table`
+            The ``GlobalId`` column, followed by one column per property named ``"<pset>.<property>"``.
+
+        Examples
+        --------
+        >>> table = model.property_table(types=["IfcWall"], psets=["Pset_WallCommon"], properties=["IsExternal"])
+        >>> table["Pset_WallCommon.IsExternal"]
+        """
+        return self.file.property_table(types=types, psets=psets, properties=properties, quantities=quantities, format=format)
+
+    def get_entities_by_property(self, pset: str, name: str, value: Any = None, minimum: float = None, maximum: float = None) -> list["Base"]:
+        """Get entities by property value, or by numeric property range
+
+        Parameters
+        ----------
+        pset : str
+            The name of the property set.
+        name : str
+            The name of the property.
+        value : Any, optional
+            The value of the property.
+        minimum : float, optional
+            The lower bound of the range, if ``value`` is not given.
+        maximum : float, optional
+            The upper bound of the range, if ``value`` is not given.
+
+        Returns
+        -------
+        list[:class:`compas_ifc.entities.base.Base`]
+            A list of entities with the property.
+
+        Examples
+        --------
+        >>> model.get_entities_by_property("Pset_WallCommon", "FireRating", "F90")
+        >>> model.get_entities_by_property("Pset_SlabCommon", "PitchAngle", minimum=0, maximum=5)
+        """
+        return self.file.get_entities_by_property(pset, name, value=value, minimum=minimum, maximum=maximum)
 
     def get_entity_by_global_id(self, global_id: str) -> "Base":
         """Get an entity by global ID
@@ -189,6 +340,46 @@ class Model(Data):
         """
         return self.file.get_entity_by_id(id)
 
+    def prefetch_geometries(self, entities: list["Base"]):
+        """Tessellate the geometries of a subset of entities at once, typically used with ``load_geometries="lazy"``.
+
+        Parameters
+        ----------
+        entities : list[:class:`compas_ifc.entities.base.Base`]
+            The entities to load the geometries of.
+        """
+        self.file.prefetch_geometries(entities)
+
+    def iter_geometries(
+        self,
+        include: list[str] = None,
+        exclude: list[str] = None,
+        retain: bool = False,
+        lod: Union[str, dict] = None,
+        profiles: Dict[Union[str, Callable], Union[str, dict]] = None,
+    ) -> Generator[tuple["Base", "TessellatedBrep", dict], None, None]:
+        """Iterate over the geometries of the IFC file as they are tessellated, without keeping them in memory.
+
+        Parameters
+        ----------
+        include : list[str], optional
+            A list of entity types to include.
+        exclude : list[str], optional
+            A list of entity types to exclude. If neither include nor exclude is given, openings and spaces are excluded.
+        retain : bool, optional
+            Whether to also store the geometries as preloaded geometries of the entities. Default is False.
+        lod : str or dict, optional
+            The tessellation profile used for all the geometries. Defaults to the ``lod`` of the model.
+        profiles : dict, optional
+            Tessellation profiles by IFC class name or by predicate, tessellated in separate passes. Defaults to the ``tessellation_profiles`` of the model.
+
+        Yields
+        ------
+        tuple[:class:`compas_ifc.entities.base.Base`, :class:`compas_ifc.brep.TessellatedBrep`, dict]
+            The entity, its geometry and its style.
+        """
+        return self.file.iter_geometries(include=include, exclude=exclude, retain=retain, lod=lod, profiles=profiles)
+
     def search_ifc_classes(self, name: str, n: int = 5) -> list[Type["Base"]]:
         """
         Search for IFC classes by name
@@ -340,6 +531,68 @@ class Model(Data):
         """
         return self.file.create(cls=cls, parent=parent, geometry=geometry, frame=frame, properties=properties, **kwargs)
 
+    def create_many(self, cls: str = "IfcBuildingElementProxy", records: Iterable[dict] = (), parent: "Base" = None) -> list["Base"]:
+        """
+        Create many entities of the same class in this model, much faster than calling :meth:`create` in a loop.
+
+        Parameters
+        ----------
+        cls : str
+            The class of the entities to create. Defaults to an `IfcBuildingElementProxy`.
+        records : Iterable[dict]
+            The keyword arguments of each entity, as for :meth:`create`, including ``parent``, ``geometry``, ``frame`` and ``properties``.
+            A ``geometry`` or ``frame`` raises a ValueError if the class is not an ``IfcProduct``.
+        parent : :class:`compas_ifc.entities.base.Base`, optional
+            The parent of the records that do not have one.
+
+        Returns
+        -------
+        list[:class:`compas_ifc.entities.base.Base`]
+            The newly created entities, in the order of the records.
+
+        Examples
+        --------
+        >>> records = [{"name": f"Wall {i}", "geometry": box, "frame": Frame([i, 0, 0])} for i in range(1000)]
+        >>> walls = model.create_many("IfcWall", records, parent=storey)
+        """
+        return self.file.create_many(cls=cls, records=records, parent=parent)
+
+    def create_representation_map(self, geometry: Union[Geometry, Datastructure]) -> "Base":
+        """Write a geometry once as an IfcRepresentationMap, to be placed by many products.
+
+        Parameters
+        ----------
+        geometry : :class:`compas.geometry.Geometry` or :class:`compas.datastructures.Datastructure`
+            The geometry.
+
+        Returns
+        -------
+        :class:`compas_ifc.entities.base.Base`
+            The representation map, which can be given as the ``geometry`` of :meth:`create`.
+
+        Examples
+        --------
+        >>> panel = model.create_representation_map(mesh)
+        >>> for frame in frames:
+        ...     model.create("IfcPlate", parent=storey, geometry=panel, frame=frame)
+        """
+        return self.file.create_representation_map(geometry)
+
+    def deferred_relationships(self):
+        """Defer the extension of existing relationships, such as the containment of a storey, until the end of the context.
+
+        Returns
+        -------
+        contextmanager
+
+        Examples
+        --------
+        >>> with model.deferred_relationships():
+        ...     for i in range(20000):
+        ...         model.create_wall(parent=storey, Name=f"Wall {i}")
+        """
+        return self.file.deferred_relationships()
+
     def create_value(self, value):
         return self.file.create_value(value)
 
@@ -0,0 +1,146 @@
+"""
+This module contains the process pool geometry loader.
+
+Every worker process opens the IFC file once, tessellates a chunk of products with a single threaded iterator and
+does all the per-shape post-processing on its own interpreter. The packed results are handed back to the parent
+process through shared memory, so that the parent only has to map them.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import ifcopenshell
+import numpy as np
+
+from compas_ifc.brep import GeometryBuffer
+from compas_ifc.brep import TessellatedBrep
+
+_worker_file = None
+
+
+def _init_worker(filepath: str):
+    global _worker_file
+    _worker_file = ifcopenshell.open(filepath)
+
+
+def _to_shared_memory(array: np.ndarray) -> tuple:
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+    name = shm.name
+    shm.close()
+    try:
+        # The parent process takes ownership of the block and unlinks it once it is mapped.
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
+    return name, array.shape, array.dtype.str
+
+
+def _from_shared_memory(name: str, shape: tuple, dtype: str) -> tuple:
+    shm = shared_memory.SharedMemory(name=name)
+    array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    return shm, array
+
+
+def _unlink_shared_memory(name: str):
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    shm.close()
+    shm.unlink()
+
+
+def _tessellate_chunk(ids: list[int], settings: dict) -> list[tuple]:
+    import ifcopenshell.geom
+
+    from compas_ifc.file import apply_tessellation_profile
+    from compas_ifc.file import shape_facecolors
+    from compas_ifc.file import shape_matrix
+
+    geometry_settings = ifcopenshell.geom.settings()
+    geometry_settings.set(geometry_settings.CONVERT_BACK_UNITS, True)
+    apply_tessellation_profile(geometry_settings, settings["profile"])
+
+    products = [_worker_file.by_id(_id) for _id in ids]
+    iterator = ifcopenshell.geom.iterator(geometry_settings, _worker_file, 1, include=products)
+
+    breps = {}
+    facecolors = {}
+    placements = {}
+    if iterator.initialize():
+        while True:
+            shape = iterator.get()
+            breps[shape.id] = TessellatedBrep(vertices=shape.geometry.verts, edges=shape.geometry.edges, faces=shape.geometry.faces)
+            facecolors[shape.id] = shape_facecolors(shape)
+            placements[shape.id] = shape_matrix(shape)
+
+            if not iterator.next():
+                break
+
+    buffer = GeometryBuffer.from_breps(breps, facecolors, dtype=np.dtype(settings["dtype"]), placements=placements)
+    return [_to_shared_memory(getattr(buffer, name)) for name in GeometryBuffer.ARRAYS]
+
+
+def tessellate_in_processes(filepath: str, ids: list[int], processes: int, chunk_size: int = None, dtype=np.float64, profile: dict = None) -> tuple[list[GeometryBuffer], list]:
+    """
+    Tessellate products of an IFC file in a pool of worker processes.
+
+    Parameters
+    ----------
+    filepath : str
+        The path to the IFC file. Every worker opens the file itself.
+    ids : list[int]
+        The ids of the products to tessellate.
+    processes : int
+        The number of worker processes.
+    chunk_size : int, optional
+        The number of products per task. Defaults to splitting the products in four tasks per process.
+    dtype : :class:`numpy.dtype`, optional
+        The data type of the vertex buffers. Default is float64.
+    profile : dict, optional
+        The tessellation settings, see :func:`compas_ifc.file.tessellation_profile`.
+
+    Returns
+    -------
+    tuple[list[:class:`compas_ifc.brep.GeometryBuffer`], list[:class:`multiprocessing.shared_memory.SharedMemory`]]
+        The geometry buffers of all chunks, and the shared memory blocks backing them.
+        The blocks are already unlinked, but must be kept alive for as long as the buffers are used.
+
+    """
+    if not chunk_size:
+        chunk_size = max(1, -(-len(ids) // (processes * 4)))
+    chunks = [ids[i : i + chunk_size] for i in range(0, len(ids), chunk_size)]
+    settings = {"dtype": np.dtype(dtype).str, "profile": profile or {}}
+
+    buffers = []
+    blocks = []
+    mapped = set()
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(filepath,)) as executor:
+        futures = [executor.submit(_tessellate_chunk, chunk, settings) for chunk in chunks]
+        try:
+            for future in futures:
+                arrays = []
+                for name, shape, array_dtype in future.result():
+                    shm, array = _from_shared_memory(name, shape, array_dtype)
+                    shm.unlink()
+                    mapped.add(name)
+                    blocks.append(shm)
+                    arrays.append(array)
+                buffers.append(GeometryBuffer(*arrays))
+        finally:
+            # If a chunk failed, the blocks of the chunks that were not mapped yet would otherwise stay in shared memory.
+            for future in futures:
+                if future.cancel():
+                    continue
+                try:
+                    result = future.result()
+                except Exception:
+                    continue
+                for name, _, _ in result:
+                    if name not in mapped:
+                        _unlink_shared_memory(name)
+
+    return buffers, blocks
@@ -0,0 +1,166 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from contextlib import nullcontext
+
+# Shared by all the stages of disabled profilers, so that hot paths do not create a context per call.
+_NULL_STAGE = nullcontext()
+
+
+class LoadProfiler(object):
+    """Records how long each stage of loading an IFC file takes, and statistics of the loaded shapes.
+
+    Stages are accumulated by name, so hot stages such as entity wrapping can be timed on every call.
+    Stages that are traced are also recorded as events, which can be written as a Chrome trace
+    and inspected in ``chrome://tracing`` or Perfetto.
+    When the profiler is disabled, all the recording methods return immediately,
+    and :meth:`stage` returns a shared no-op context.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether the profiler records anything.
+    stages : dict[str, dict]
+        The total ``time`` in seconds and number of ``calls`` per stage.
+    shapes : dict[str, dict]
+        The number of shapes (``count``) and ``triangles`` per IFC class.
+    events : list[dict]
+        The traced stages, with their ``name``, ``start`` and ``duration`` in seconds.
+
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.reset()
+
+    def __repr__(self):
+        return "<LoadProfiler {} stages, {} shapes>".format(len(self.stages), sum(stats["count"] for stats in self.shapes.values()))
+
+    def reset(self):
+        """Clear all the recorded timings and statistics."""
+        self.stages = {}
+        self.shapes = {}
+        self.events = []
+        self._origin = time.perf_counter()
+
+    def stage(self, name: str, trace: bool = True):
+        """
+        Time a stage as a context manager.
+
+        Parameters
+        ----------
+        name : str
+            The name of the stage.
+        trace : bool, optional
+            Whether to record the stage as an event of the Chrome trace.
+            Should be False for stages that run once per entity or per shape. Default is True.
+
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return self._timed(name, trace)
+
+    @contextmanager
+    def _timed(self, name: str, trace: bool):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start, start=start if trace else None)
+
+    def add(self, name: str, duration: float, start: float = None):
+        """
+        Add a duration to a stage.
+
+        Parameters
+        ----------
+        name : str
+            The name of the stage.
+        duration : float
+            The duration in seconds.
+        start : float, optional
+            The :func:`time.perf_counter` at which the stage started. If given, the stage is also recorded as a traced event.
+
+        """
+        if not self.enabled:
+            return
+
+        stats = self.stages.setdefault(name, {"time": 0.0, "calls": 0})
+        stats["time"] += duration
+        stats["calls"] += 1
+        if start is not None:
+            self.events.append({"name": name, "start": start - self._origin, "duration": duration})
+
+    def count_shape(self, ifc_class: str, triangles: int):
+        """Record a loaded shape of an IFC class with a number of triangles."""
+        if not self.enabled:
+            return
+
+        stats = self.shapes.setdefault(ifc_class, {"count": 0, "triangles": 0})
+        stats["count"] += 1
+        stats["triangles"] += int(triangles)
+
+    def to_dict(self) -> dict:
+        """
+        Get the recorded timings and statistics.
+
+        Returns
+        -------
+        dict
+            The ``stages``, ``shapes`` and ``totals`` of the profile.
+
+        """
+        return {
+            "stages": {name: dict(stats) for name, stats in self.stages.items()},
+            "shapes": {name: dict(stats) for name, stats in self.shapes.items()},
+            "totals": {
+                "shapes": sum(stats["count"] for stats in self.shapes.values()),
+                "triangles": sum(stats["triangles"] for stats in self.shapes.values()),
+            },
+        }
+
+    def to_chrome_trace(self, path: str = None) -> dict:
+        """
+        Get the traced stages in the Chrome trace event format, and optionally write them to a JSON file.
+
+        Parameters
+        ----------
+        path : str, optional
+            The path of the JSON file to write.
+
+        Returns
+        -------
+        dict
+            The trace, with the accumulated stages and shape statistics as metadata.
+
+        """
+        pid = os.getpid()
+        events = []
+        for event in self.events:
+            events.append(
+                {
+                    "name": event["name"],
+                    "ph": "X",
+                    "ts": event["start"] * 1e6,
+                    "dur": event["duration"] * 1e6,
+                    "pid": pid,
+                    "tid": 0,
+                }
+            )
+
+        trace = {"traceEvents": events, "displayTimeUnit": "ms", "metadata": self.to_dict()}
+        if path:
+            with open(path, "w") as f:
+                json.dump(trace, f)
+        return trace
+
+    def print_summary(self):
+        """Print the time per stage and the shape statistics per IFC class."""
+        print("Stage                     Time (s)     Calls")
+        for name, stats in sorted(self.stages.items(), key=lambda item: -item[1]["time"]):
+            print(f"{name:<24}{stats['time']:>10.3f}{stats['calls']:>10}")
+        print()
+        print("Class                        Shapes   Triangles")
+        for name, stats in sorted(self.shapes.items(), key=lambda item: -item[1]["triangles"]):
+            print(f"{name:<27}{stats['count']:>8}{stats['triangles']:>12}")
@@ -0,0 +1,277 @@
+from bisect import bisect_left
+from bisect import bisect_right
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Union
+
+import ifcopenshell
+import numpy as np
+
+if TYPE_CHECKING:
+    from compas_ifc.file import IFCFile
+
+
+def _nominal_value(value: Union[ifcopenshell.entity_instance, None]) -> Any:
+    return value.wrappedValue if value is not None else None
+
+
+def decode_property_definition(definition: ifcopenshell.entity_instance) -> dict:
+    """
+    Decode the properties of a property set or the quantities of an element quantity, from the raw instance.
+
+    Parameters
+    ----------
+    definition : :class:`ifcopenshell.entity_instance`
+        An ``IfcPropertySet`` or ``IfcElementQuantity``.
+
+    Returns
+    -------
+    dict
+        The values by property name. Enumerated and list values are tuples, complex properties are dicts.
+
+    """
+    if definition.is_a("IfcPropertySet"):
+        return _decode_properties(definition.HasProperties or ())
+    if definition.is_a("IfcElementQuantity"):
+        values = {}
+        for quantity in definition.Quantities or ():
+            if quantity.is_a("IfcPhysicalSimpleQuantity"):
+                # The value is the fourth attribute of all simple quantities (LengthValue, AreaValue, ...).
+                values[quantity.Name] = quantity[3]
+        return values
+    return {}
+
+
+def _decode_properties(properties) -> dict:
+    values = {}
+    for prop in properties:
+        if prop.is_a("IfcPropertySingleValue"):
+            values[prop.Name] = _nominal_value(prop.NominalValue)
+        elif prop.is_a("IfcPropertyEnumeratedValue"):
+            values[prop.Name] = tuple(_nominal_value(value) for value in prop.EnumerationValues or ())
+        elif prop.is_a("IfcPropertyListValue"):
+            values[prop.Name] = tuple(_nominal_value(value) for value in prop.ListValues or ())
+        elif prop.is_a("IfcComplexProperty"):
+            values[prop.Name] = _decode_properties(prop.HasProperties or ())
+    return values
+
+
+def _column(values: list) -> np.ndarray:
+    """Pack a column as float64 if all the set values are numbers, with NaN for the unset ones, or as objects otherwise."""
+    if any(value is not None for value in values) and all(value is None or (isinstance(value, (int, float)) and not isinstance(value, bool)) for value in values):
+        return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def property_table(file: "IFCFile", types: list[str] = None, psets: list[str] = None, properties: list[str] = None, quantities: bool = True) -> dict[str, np.ndarray]:
+    """
+    Extract properties of many entities at once, as columns.
+
+    Every ``IfcRelDefinesByType`` and ``IfcRelDefinesByProperties`` of the file is walked exactly once,
+    and each property definition is decoded once, however many entities share it.
+    Properties of the type of an entity are overridden by the properties of the entity itself.
+
+    Parameters
+    ----------
+    file : :class:`compas_ifc.file.IFCFile`
+        The IFC file.
+    types : list[str], optional
+        The IFC classes of the rows, subclasses included. Default is all ``IfcObject``.
+    psets : list[str], optional
+        The property and quantity sets to extract. Default is all of them.
+    properties : list[str], optional
+        The properties to extract, by name. Default is all of them.
+    quantities : bool, optional
+        Whether to extract the element quantities as well as the property sets. Default is True.
+
+    Returns
+    -------
+    dict[str, :class:`numpy.ndarray`]
+        The ``GlobalId`` column, followed by one column per property named ``"<pset>.<property>"``.
+        Numeric columns are float64 with NaN for missing values, other columns are object arrays with None.
+
+    """
+    _file = file._file
+    rows = {}
+    for type_name in types or ["IfcObject"]:
+        for entity in _file.by_type(type_name):
+            rows.setdefault(entity.id(), (len(rows), entity))
+
+    psets = set(psets) if psets is not None else None
+    properties = set(properties) if properties is not None else None
+    columns = {}
+    decoded = {}
+
+    def decode(definition):
+        _id = definition.id()
+        if _id not in decoded:
+            values = {}
+            if (psets is None or definition.Name in psets) and (quantities or not definition.is_a("IfcElementQuantity")):
+                for name, value in decode_property_definition(definition).items():
+                    if properties is None or name in properties:
+                        values[f"{definition.Name}.{name}"] = value
+            decoded[_id] = values
+        return decoded[_id]
+
+    def assign(objects, values):
+        if not values:
+            return
+        for obj in objects or ():
+            row = rows.get(obj.id())
+            if row is None:
+                continue
+            for key, value in values.items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = [None] * len(rows)
+                column[row[0]] = value
+
+    with file.profiler.stage("property_table"):
+        # Type properties first, so that occurrence properties override them.
+        for relation in _file.by_type("IfcRelDefinesByType"):
+            values = {}
+            for definition in relation.RelatingType.HasPropertySets or ():
+                values.update(decode(definition))
+            assign(relation.RelatedObjects, values)
+
+        for relation in _file.by_type("IfcRelDefinesByProperties"):
+            definitions = relation.RelatingPropertyDefinition
+            # In IFC4, the relating definition can be an IfcPropertySetDefinitionSet, i.e. a tuple.
+            if not isinstance(definitions, tuple):
+                definitions = (definitions,)
+            values = {}
+            for definition in definitions:
+                values.update(decode(definition))
+            assign(relation.RelatedObjects, values)
+
+        table = {"GlobalId": _column([entity.GlobalId for _, entity in rows.values()])}
+        for key in sorted(columns):
+            table[key] = _column(columns[key])
+    return table
+
+
+def _value_key(value: Any) -> tuple[bool, Any]:
+    """Get the key of a value in the property index. Booleans are kept apart from the numbers they are equal to, such as ``True`` and ``1``."""
+    return isinstance(value, bool), value
+
+
+class PropertyIndex(object):
+    """An inverted index of the single value properties of a file, from property set, property name and value to entity ids.
+
+    The index is built in a single scan of the ``IfcRelDefinesByProperties`` of the file, using the raw instances,
+    and each property set is decoded once however many entities share it.
+    Only the properties assigned to the entities themselves are indexed, not the ones inherited from their type.
+
+    Attributes
+    ----------
+    file : :class:`compas_ifc.file.IFCFile`
+        The IFC file.
+
+    """
+
+    def __init__(self, file: "IFCFile"):
+        self.file = file
+        self._values = {}  # ids of the entities by value key, by (pset name, property name)
+        self._sorted = {}  # sorted numeric values by (pset name, property name), built on the first range query
+        self.build()
+
+    def __repr__(self):
+        return "<PropertyIndex {} properties>".format(len(self._values))
+
+    def build(self):
+        """Build the index from the property relationships of the file."""
+        self._values = {}
+        self._sorted = {}
+        decoded = {}
+        for relation in self.file._file.by_type("IfcRelDefinesByProperties"):
+            self.add_relationship(relation, decoded=decoded)
+
+    def add_relationship(self, relation: ifcopenshell.entity_instance, decoded: dict = None):
+        """
+        Add an ``IfcRelDefinesByProperties`` to the index. Other relationships are ignored.
+
+        Parameters
+        ----------
+        relation : :class:`ifcopenshell.entity_instance`
+            The relationship.
+        decoded : dict, optional
+            The already decoded single values by property set id, shared between the relationships of a scan.
+
+        """
+        if not relation.is_a("IfcRelDefinesByProperties"):
+            return
+
+        definitions = relation.RelatingPropertyDefinition
+        if not isinstance(definitions, tuple):
+            definitions = (definitions,)
+        decoded = decoded if decoded is not None else {}
+        ids = [obj.id() for obj in relation.RelatedObjects or ()]
+        for definition in definitions:
+            if not definition.is_a("IfcPropertySet"):
+                continue
+            if definition.id() not in decoded:
+                decoded[definition.id()] = [(prop.Name, _nominal_value(prop.NominalValue)) for prop in definition.HasProperties or () if prop.is_a("IfcPropertySingleValue")]
+            for name, value in decoded[definition.id()]:
+                if value is None:
+                    continue
+                key = (definition.Name, name)
+                self._values.setdefault(key, {}).setdefault(_value_key(value), set()).update(ids)
+                self._sorted.pop(key, None)
+
+    def get_ids(self, pset: str, name: str, value: Any) -> set[int]:
+        """
+        Get the ids of the entities with a property of a given value.
+
+        Parameters
+        ----------
+        pset : str
+            The name of the property set.
+        name : str
+            The name of the property.
+        value : Any
+            The value of the property.
+
+        Returns
+        -------
+        set[int]
+
+        """
+        return set(self._values.get((pset, name), {}).get(_value_key(value), ()))
+
+    def get_ids_between(self, pset: str, name: str, minimum: float = None, maximum: float = None) -> set[int]:
+        """
+        Get the ids of the entities with a numeric property in a closed range.
+
+        Parameters
+        ----------
+        pset : str
+            The name of the property set.
+        name : str
+            The name of the property.
+        minimum : float, optional
+            The lower bound. If not set, the range has no lower bound.
+        maximum : float, optional
+            The upper bound. If not set, the range has no upper bound.
+
+        Returns
+        -------
+        set[int]
+
+        """
+        key = (pset, name)
+        if key not in self._sorted:
+            values = self._values.get(key, {})
+            self._sorted[key] = sorted(value for is_bool, value in values if not is_bool and isinstance(value, (int, float)))
+        numbers = self._sorted[key]
+        start = bisect_left(numbers, minimum) if minimum is not None else 0
+        stop = bisect_right(numbers, maximum) if maximum is not None else len(numbers)
+        ids = set()
+        for value in numbers[start:stop]:
+            ids.update(self._values[key][(False, value)])
+        return ids
+
+    def get_values(self, pset: str, name: str) -> list[Any]:
+        """Get the distinct values of a property."""
+        return [value for _, value in self._values.get((pset, name), {})]
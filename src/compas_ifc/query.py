@@ -0,0 +1,362 @@
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generator
+from typing import Iterable
+
+import ifcopenshell
+from ifcopenshell.util.element import get_pset
+
+if TYPE_CHECKING:
+    from compas_ifc.entities.base import Base
+    from compas_ifc.file import IFCFile
+
+_ANY = object()
+
+# Relative cost of evaluating each kind of predicate on a raw instance, used to order the filters.
+_COSTS = {"type": 0, "equals": 1, "in": 1, "between": 1, "within": 1, "geometry": 2, "property": 10}
+
+
+def _raw(value: Any) -> Any:
+    """Unwrap entity wrappers, so that they can be compared with the values of raw instances."""
+    entity = getattr(value, "entity", None)
+    if isinstance(entity, ifcopenshell.entity_instance):
+        return entity
+    return value
+
+
+class Query(object):
+    """A lazy query over the entities of an IFC file.
+
+    Queries are built by chaining predicates, each call returning a new query, so a partial query can be reused.
+    When run, the query picks the most selective source of candidates among the type extents,
+    the name index, the GlobalId lookup and the spatial hierarchy, and filters the candidates
+    on the raw ifcopenshell instances, cheapest predicates first.
+    Only the matching instances are wrapped, and only as they are iterated.
+
+    Parameters
+    ----------
+    file : :class:`compas_ifc.file.IFCFile`
+        The IFC file to query.
+    *type_names : str
+        The IFC classes of the entities, subclasses included. If none is given, all the entities are queried.
+
+    Examples
+    --------
+    >>> walls = model.query("IfcWall").where_property("Pset_WallCommon", "IsExternal", True).within(storey)
+    >>> walls.count()
+    >>> for wall in walls:
+    ...     print(wall.Name)
+
+    """
+
+    def __init__(self, file: "IFCFile", *type_names: str):
+        self.file = file
+        self._types = tuple(type_names)
+        self._predicates = []
+
+    def __repr__(self):
+        return "<Query {} {}>".format(" | ".join(self._types) or "*", self._predicates)
+
+    def __iter__(self) -> Generator["Base", None, None]:
+        for entity in self._run():
+            yield self.file.from_entity(entity)
+
+    def _extend(self, *predicates: tuple) -> "Query":
+        query = Query(self.file, *self._types)
+        query._predicates = self._predicates + list(predicates)
+        return query
+
+    # =============================================================================
+    # Predicates
+    # =============================================================================
+
+    def of_type(self, *type_names: str) -> "Query":
+        """
+        Restrict the query to entities of any of the given IFC classes, subclasses included.
+
+        Parameters
+        ----------
+        *type_names : str
+            The names of the IFC classes.
+
+        Returns
+        -------
+        :class:`Query`
+
+        """
+        return self._extend(("type", tuple(type_names)))
+
+    def where(self, attribute: str, value: Any) -> "Query":
+        """
+        Restrict the query to entities with an attribute equal to a value.
+        Entity values can be given as wrappers or as raw instances.
+
+        Parameters
+        ----------
+        attribute : str
+            The name of the attribute.
+        value : Any
+            The value of the attribute.
+
+        Returns
+        -------
+        :class:`Query`
+
+        """
+        return self._extend(("equals", attribute, _raw(value)))
+
+    def where_in(self, attribute: str, values: Iterable[Any]) -> "Query":
+        """
+        Restrict the query to entities with an attribute equal to one of the given values.
+
+        Parameters
+        ----------
+        attribute : str
+            The name of the attribute.
+        values : Iterable[Any]
+            The accepted values of the attribute.
+
+        Returns
+        -------
+        :class:`Query`
+
+        """
+        return self._extend(("in", attribute, frozenset(_raw(value) for value in values)))
+
+    def where_between(self, attribute: str, minimum: Any = None, maximum: Any = None) -> "Query":
+        """
+        Restrict the query to entities with an attribute in a closed range.
+        Entities with the attribute unset are excluded.
+
+        Parameters
+        ----------
+        attribute : str
+            The name of the attribute.
+        minimum : Any, optional
+            The lower bound. If not set, the range has no lower bound.
+        maximum : Any, optional
+            The upper bound. If not set, the range has no upper bound.
+
+        Returns
+        -------
+        :class:`Query`
+
+        """
+        return self._extend(("between", attribute, minimum, maximum))
+
+    def where_property(self, pset: str, name: str, value: Any = _ANY) -> "Query":
+        """
+        Restrict the query to entities with a property, or a quantity, of a given value.
+        Properties inherited from the type of the entity are taken into account.
+
+        Parameters
+        ----------
+        pset : str
+            The name of the property or quantity set.
+        name : str
+            The name of the property.
+        value : Any, optional
+            The value of the property. If not given, the property only has to be set.
+
+        Returns
+        -------
+        :class:`Query`
+
+        """
+        return self._extend(("property", pset, name, value))
+
+    def within(self, entity: "Base") -> "Query":
+        """
+        Restrict the query to the descendants of an entity in the spatial hierarchy, for example the elements of a storey.
+
+        Parameters
+        ----------
+        entity : :class:`compas_ifc.entities.base.Base`
+            The parent entity.
+
+        Returns
+        -------
+        :class:`Query`
+
+        """
+        return self._extend(("within", entity.id()))
+
+    def has_geometry(self, value: bool = True) -> "Query":
+        """
+        Restrict the query to products with, or without, a representation.
+
+        Parameters
+        ----------
+        value : bool, optional
+            Whether the entities have a representation. Default is True.
+
+        Returns
+        -------
+        :class:`Query`
+
+        """
+        return self._extend(("geometry", value))
+
+    # =============================================================================
+    # Results
+    # =============================================================================
+
+    def ids(self) -> Generator[int, None, None]:
+        """Stream the ids of the matching entities, without wrapping them."""
+        for entity in self._run():
+            yield entity.id()
+
+    def count(self) -> int:
+        """Count the matching entities, without wrapping them."""
+        return sum(1 for _ in self._run())
+
+    def first(self) -> "Base":
+        """Get the first matching entity, or None."""
+        for entity in self:
+            return entity
+        return None
+
+    def exists(self) -> bool:
+        """Whether any entity matches the query."""
+        for _ in self._run():
+            return True
+        return False
+
+    def to_list(self) -> list["Base"]:
+        """Get all the matching entities."""
+        return list(self)
+
+    # =============================================================================
+    # Planning
+    # =============================================================================
+
+    def _run(self) -> Generator[ifcopenshell.entity_instance, None, None]:
+        source, filters = self._plan()
+        for entity in source:
+            if all(match(entity) for match in filters):
+                yield entity
+
+    def _plan(self) -> tuple[Iterable[ifcopenshell.entity_instance], list]:
+        """Pick the source with the fewest candidates and turn the other predicates into filters on raw instances."""
+        _file = self.file._file
+        types = [self._types] if self._types else []
+        predicates = []
+        for predicate in self._predicates:
+            if predicate[0] == "type":
+                types.append(predicate[1])
+            else:
+                predicates.append(predicate)
+
+        # Candidate sources, as (size, ids or instances, predicate covered by the source).
+        sources = []
+        if types:
+            # Keyed by id, as the extents of overlapping classes, such as IfcWall and IfcWallStandardCase, share entities.
+            extent = list({entity.id(): entity for name in types[0] for entity in _file.by_type(name)}.values())
+            sources.append((len(extent), extent, None))
+        for predicate in predicates:
+            kind = predicate[0]
+            if kind in ("equals", "in") and predicate[1] == "GlobalId":
+                values = [predicate[2]] if kind == "equals" else predicate[2]
+                sources.append((len(values), self._by_global_ids(values), predicate))
+            elif kind in ("equals", "in") and predicate[1] == "Name" and types and all(self.file._is_subclass(name, "IfcRoot") for name in types[0]):
+                values = [predicate[2]] if kind == "equals" else predicate[2]
+                if None in values:
+                    # Unnamed entities are not in the name index, they are found by filtering.
+                    continue
+                index = self.file.name_index
+                ids = sorted(_id for value in values for _id in index.get(value, ()))
+                sources.append((len(ids), ids, predicate))
+            elif kind == "within":
+                ids = self.file.spatial_hierarchy.descendant_ids(predicate[1])
+                sources.append((len(ids), ids, predicate))
+
+        if sources:
+            size, source, covered = min(sources, key=lambda item: item[0])
+            if covered is None:
+                types = types[1:]
+            if source and isinstance(source[0], int):
+                source = (_file.by_id(_id) for _id in source)
+        else:
+            covered = None
+            source = iter(_file)
+
+        filters = [self._type_filter(names) for names in types]
+        for predicate in sorted(predicates, key=lambda predicate: _COSTS[predicate[0]]):
+            if predicate is not covered:
+                filters.append(self._filter(predicate))
+        return source, filters
+
+    def _by_global_ids(self, global_ids: Iterable[str]) -> list[ifcopenshell.entity_instance]:
+        entities = []
+        for global_id in global_ids:
+            try:
+                entities.append(self.file._file.by_guid(global_id))
+            except RuntimeError:
+                pass
+        return entities
+
+    def _type_filter(self, type_names: tuple[str]):
+        def match(entity):
+            return any(entity.is_a(name) for name in type_names)
+
+        return match
+
+    def _filter(self, predicate: tuple):
+        kind = predicate[0]
+
+        if kind == "equals":
+            _, attribute, value = predicate
+
+            def match(entity):
+                return getattr(entity, attribute, _ANY) == value
+
+        elif kind == "in":
+            _, attribute, values = predicate
+
+            def match(entity):
+                try:
+                    return getattr(entity, attribute, _ANY) in values
+                except TypeError:
+                    # Unhashable values, such as aggregates, are never in the set.
+                    return False
+
+        elif kind == "between":
+            _, attribute, minimum, maximum = predicate
+
+            def match(entity):
+                value = getattr(entity, attribute, None)
+                if value is None:
+                    return False
+                if minimum is not None and value < minimum:
+                    return False
+                if maximum is not None and value > maximum:
+                    return False
+                return True
+
+        elif kind == "within":
+            ids = set(self.file.spatial_hierarchy.descendant_ids(predicate[1]))
+
+            def match(entity):
+                return entity.id() in ids
+
+        elif kind == "geometry":
+            value = predicate[1]
+
+            def match(entity):
+                return (getattr(entity, "Representation", None) is not None) == value
+
+        elif kind == "property":
+            _, pset, name, value = predicate
+
+            def match(entity):
+                if not entity.is_a("IfcObjectDefinition"):
+                    return False
+                prop = get_pset(entity, pset, prop=name)
+                if value is _ANY:
+                    return prop is not None
+                return prop == value
+
+        else:
+            raise ValueError(f"Invalid predicate: {kind}")
+
+        return match
@@ -0,0 +1,110 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from compas_ifc.model import Model
+
+HERE = os.path.dirname(__file__)
+
+
+@pytest.fixture
+def filepath():
+    return os.path.join(HERE, "..", "data", "wall-with-opening-and-window.ifc")
+
+
+@pytest.fixture
+def model(filepath):
+    return Model(filepath, load_geometries=False)
+
+
+class FakeSettings(object):
+    """Stand-in for ``ifcopenshell.geom.settings``, recording the applied settings."""
+
+    CONVERT_BACK_UNITS = "CONVERT_BACK_UNITS"
+    USE_PYTHON_OPENCASCADE = "USE_PYTHON_OPENCASCADE"
+    DISABLE_OPENING_SUBTRACTIONS = "DISABLE_OPENING_SUBTRACTIONS"
+
+    def __init__(self):
+        self.values = {}
+
+    def set(self, name, value):
+        self.values[name] = value
+
+    def set_deflection_tolerance(self, value):
+        self.values["deflection"] = value
+
+    def set_angular_tolerance(self, value):
+        self.values["angular_tolerance"] = value
+
+
+class FakeShape(object):
+    """Stand-in for a shape of the geometry iterator: one triangle, translated along x."""
+
+    def __init__(self, product, translation=(1.0, 0.0, 0.0), materials=(), material_ids=(-1,)):
+        self.id = product.id()
+        self.type = product.is_a()
+        self.geometry = SimpleNamespace(
+            id="geometry-{}".format(product.id()),
+            verts=(0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0),
+            edges=(0, 1, 1, 2, 2, 0),
+            faces=(0, 1, 2),
+            materials=list(materials),
+            material_ids=list(material_ids),
+        )
+        # The rows of the 4x3 matrix are the axes and the translation.
+        self.transformation = SimpleNamespace(matrix=SimpleNamespace(data=(1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, *translation)))
+
+
+class FakeIterator(object):
+    """Stand-in for ``ifcopenshell.geom.iterator``, yielding a :class:`FakeShape` per product with a representation, filtered like the real iterator."""
+
+    def __init__(self, settings, file, threads=1, include=None, exclude=None):
+        def matches(product, types):
+            return any(product.is_a(t) if isinstance(t, str) else product == t for t in types)
+
+        self.settings = settings
+        self.include = include
+        self.exclude = exclude
+        self.shapes = []
+        for product in file.by_type("IfcProduct"):
+            if not product.Representation:
+                continue
+            if include is not None and not matches(product, include):
+                continue
+            if exclude is not None and matches(product, exclude):
+                continue
+            self.shapes.append(FakeShape(product))
+        self.index = 0
+        self.gets = 0
+        FakeIterator.instances.append(self)
+
+    def initialize(self):
+        return bool(self.shapes)
+
+    def get(self):
+        self.gets += 1
+        return self.shapes[self.index]
+
+    def next(self):
+        self.index += 1
+        return self.index < len(self.shapes)
+
+
+def create_shape(settings, product):
+    """Stand-in for ``ifcopenshell.geom.create_shape``, recording the id of the tessellated product."""
+    FakeIterator.created.append(product.id())
+    return FakeShape(product)
+
+
+@pytest.fixture
+def geometry_iterator(monkeypatch):
+    """Replace the geometry iterator and ``create_shape`` of ifcopenshell by fakes, so that the geometry code runs with any ifcopenshell version."""
+    import ifcopenshell.geom
+
+    FakeIterator.instances = []
+    FakeIterator.created = []
+    monkeypatch.setattr(ifcopenshell.geom, "settings", FakeSettings)
+    monkeypatch.setattr(ifcopenshell.geom, "iterator", FakeIterator)
+    monkeypatch.setattr(ifcopenshell.geom, "create_shape", create_shape)
+    return FakeIterator
@@ -0,0 +1,101 @@
+import os
+
+import numpy as np
+
+from compas_ifc.brep import GeometryBuffer
+from compas_ifc.brep import TessellatedBrep
+from compas_ifc.cache import GeometryCache
+from compas_ifc.cache import LRUDict
+from compas_ifc.cache import RepresentationCache
+
+
+def buffer(count=1):
+    brep = TessellatedBrep(vertices=np.zeros((3, 3)), edges=np.zeros((0, 2), dtype=int), faces=np.array([[0, 1, 2]]))
+    return GeometryBuffer.from_breps({i: brep for i in range(count)})
+
+
+def test_geometry_cache_key(tmp_path, filepath):
+    cache = GeometryCache(str(tmp_path))
+
+    assert cache.key(filepath, {"lod": "preview"}) == cache.key(filepath, {"lod": "preview"})
+    assert cache.key(filepath, {"lod": "preview"}) != cache.key(filepath, {"lod": "fine"})
+
+
+def test_geometry_cache_save_load(tmp_path):
+    cache = GeometryCache(str(tmp_path))
+    cache.save("a", buffer(2))
+
+    assert cache.entries() == ["a"]
+    assert list(cache.load("a")) == [0, 1]
+    assert cache.load("b") is None
+
+
+def test_geometry_cache_corrupted_entry(tmp_path):
+    cache = GeometryCache(str(tmp_path))
+    cache.save("a", buffer())
+    os.remove(os.path.join(str(tmp_path), "a", "vertices.npy"))
+
+    assert cache.load("a") is None
+    assert cache.entries() == []
+
+
+def test_geometry_cache_eviction(tmp_path):
+    cache = GeometryCache(str(tmp_path))
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.save(key, buffer())
+        os.utime(os.path.join(str(tmp_path), key), (i, i))
+    size = cache.entry_size("a")
+
+    # Loading an entry marks it as recently used, "b" is now the least recently used.
+    cache.load("a")
+    cache.max_size = 3 * size
+    cache.save("d", buffer())
+
+    assert sorted(cache.entries()) == ["a", "c", "d"]
+
+    # The entry just written is never evicted.
+    cache.max_size = 0
+    cache.save("e", buffer())
+    assert cache.entries() == ["e"]
+
+
+def test_lru_dict():
+    items = LRUDict(max_size=2)
+    items["a"] = 1
+    items["b"] = 2
+
+    # Reading an item marks it as recently used, "b" is evicted first.
+    assert items.get("a") == 1
+    items["c"] = 3
+    assert list(items) == ["a", "c"]
+
+    assert items.get("b") is None
+    assert items.get("b", 0) == 0
+
+
+def test_representation_cache():
+    cache = RepresentationCache()
+    cache.add("a", 1)
+    cache.add(None, 2)
+
+    assert len(cache) == 1
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    # A None fingerprint is never cached, and always a miss.
+    assert cache.get(None) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_representation_cache_eviction():
+    cache = RepresentationCache(max_size=2)
+    cache.add("a", 1)
+    cache.add("b", 2)
+    cache.get("a")
+    cache.add("c", 3)
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
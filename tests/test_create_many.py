@@ -0,0 +1,58 @@
+import pytest
+from compas.geometry import Box
+from compas.geometry import Frame
+
+
+def test_create_many(model):
+    storey = model.building_storeys[0]
+    records = [{"name": f"Wall {i}", "frame": Frame([i, 0, 0]), "properties": {"Pset_Custom": {"Index": i % 2}}} for i in range(4)]
+    walls = model.create_many("IfcWall", records, parent=storey)
+
+    assert [wall.Name for wall in walls] == ["Wall 0", "Wall 1", "Wall 2", "Wall 3"]
+    assert all(wall.parent == storey for wall in walls)
+    assert [wall.frame.point.x for wall in walls] == [0, 1, 2, 3]
+    assert [wall.property_sets["Pset_Custom"]["Index"] for wall in walls] == [0, 1, 0, 1]
+
+
+def test_create_many_shares_geometries(model):
+    storey = model.building_storeys[0]
+    box = Box(1)
+    records = [{"name": "a", "geometry": box}, {"name": "b", "geometry": Box(1)}, {"name": "c", "geometry": Box(2)}]
+    a, b, c = model.create_many("IfcWall", records, parent=storey)
+
+    # Each product has its own product definition shape, placing the same map.
+    assert a.Representation != b.Representation
+    assert a.Representation.Representations[0].RepresentationType == "MappedRepresentation"
+    assert a.Representation.Representations[0].Items[0].MappingSource == b.Representation.Representations[0].Items[0].MappingSource
+    assert c.Representation.Representations[0].RepresentationType == "CSG"
+    assert len(model.file._file.by_type("IfcRepresentationMap")) == 1
+
+    # A geometry of the batch used again later is placed on the same map.
+    d = model.create("IfcWall", geometry=Box(2), parent=storey, name="d")
+    assert d.Representation.Representations[0].Items[0].MappingSource == c.Representation.Representations[0].Items[0].MappingSource
+
+
+def test_create_many_product_shapes_are_not_shared(model):
+    storey = model.building_storeys[0]
+    walls = model.create_many("IfcWall", [{"name": str(i), "geometry": Box(1)} for i in range(3)], parent=storey)
+
+    shapes = model.file._file.by_type("IfcProductDefinitionShape")
+    assert len({wall.Representation.id() for wall in walls}) == 3
+    assert all(len(shape.ShapeOfProduct) <= 1 for shape in shapes)
+
+
+def test_create_many_geometry(model):
+    storey = model.building_storeys[0]
+    box = Box(1)
+    a, b, c = model.create_many("IfcWall", [{"name": "a", "geometry": box}, {"name": "b", "geometry": box}, {"name": "c", "geometry": Box(2)}], parent=storey)
+
+    # Same as for create.
+    assert model.create("IfcWall", geometry=box, parent=storey, name="d").geometry is box
+    assert a.geometry is box
+    assert b.geometry is box
+    assert c.geometry.xsize == 2
+
+
+def test_create_many_frame_of_non_product(model):
+    with pytest.raises(ValueError):
+        model.create_many("IfcPropertySingleValue", [{"name": "a", "frame": Frame.worldXY()}])
@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from compas_ifc.file import DEFAULT_FACECOLOR
+from compas_ifc.file import shape_facecolors
+
+
+def shape():
+    materials = [SimpleNamespace(diffuse=(1.0, 0.0, 0.0), transparency=0.0), SimpleNamespace(diffuse=(0.0, 0.0, 1.0), transparency=0.25)]
+    geometry = SimpleNamespace(
+        verts=(0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0),
+        edges=(),
+        faces=(0, 1, 2, 1, 3, 2, 0, 1, 3),
+        materials=materials,
+        material_ids=[1, -1, 0],
+    )
+    return SimpleNamespace(geometry=geometry)
+
+
+def test_shape_facecolors():
+    facecolors = shape_facecolors(shape())
+
+    assert facecolors.shape == (3, 4)
+    assert facecolors.dtype == np.float32
+    assert np.allclose(facecolors, [[0.0, 0.0, 1.0, 0.75], DEFAULT_FACECOLOR, [1.0, 0.0, 0.0, 1.0]])
+
+
+def test_shape_facecolors_without_materials():
+    geometry = SimpleNamespace(materials=[], material_ids=[-1, -1])
+
+    assert np.allclose(shape_facecolors(SimpleNamespace(geometry=geometry)), [DEFAULT_FACECOLOR, DEFAULT_FACECOLOR])
+
+
+def test_brep_facecolors(model):
+    brep, style = model.file._shape_to_local_brep(shape())
+
+    assert len(style["facecolors"]) == len(brep.faces) == 3
+    assert np.allclose(style["facecolors"][0], [0.0, 0.0, 1.0, 0.75])
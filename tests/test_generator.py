@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+import pytest
+
+from compas_ifc.entities.generator import Generator
+
+# Run in a new interpreter, so that the modules imported by the other tests do not count.
+IMPORTS = """
+import sys
+import IFC4
+before = {name for name in sys.modules if name.startswith("IFC4.")}
+IFC4.IfcWall
+after = {name for name in sys.modules if name.startswith("IFC4.")}
+print(len(before), "ifcwall" in " ".join(after), "ifcbeam" in " ".join(after), len(after))
+"""
+
+
+@pytest.fixture(scope="module")
+def folder(tmp_path_factory):
+    folder = tmp_path_factory.mktemp("generated")
+    Generator("IFC4").generate(folder=str(folder))
+    return folder
+
+
+def test_lazy_package_imports_classes_on_access(folder):
+    output = subprocess.check_output([sys.executable, "-c", IMPORTS], cwd=str(folder), text=True)
+    before, wall, beam, after = output.split()
+
+    assert before == "0"
+    assert wall == "True"
+    assert beam == "False"
+    # Only the class and its ancestors are imported.
+    assert 0 < int(after) < 20
+
+
+def test_lazy_package_dir(folder):
+    output = subprocess.check_output([sys.executable, "-c", "import IFC4; print(len(dir(IFC4)), 'IfcWall' in dir(IFC4))"], cwd=str(folder), text=True)
+    count, wall = output.split()
+
+    assert int(count) > 900
+    assert wall == "True"
@@ -0,0 +1,67 @@
+import importlib.util
+
+import ifcopenshell
+import pytest
+
+from compas_ifc.entities.base import Attribute
+from compas_ifc.entities.base import Base
+from compas_ifc.entities.generator import Generator
+
+
+@pytest.fixture(scope="module")
+def module(tmp_path_factory):
+    folder = tmp_path_factory.mktemp("generated")
+    Generator("IFC4", backend="module").generate(folder=str(folder))
+    spec = importlib.util.spec_from_file_location("generated_IFC4", str(folder / "IFC4.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def unwrap(value):
+    if isinstance(value, Base):
+        return value.entity
+    if isinstance(value, list):
+        return tuple(unwrap(item) for item in value)
+    return value
+
+
+def test_attribute_index(module):
+    schema = ifcopenshell.ifcopenshell_wrapper.schema_by_name("IFC4")
+    for name in ("IfcRoot", "IfcWall", "IfcWindow", "IfcCartesianPoint"):
+        attributes = schema.declaration_by_name(name).all_attributes()
+        assert module.ATTRIBUTE_INDEX[name] == {attribute.name(): i for i, attribute in enumerate(attributes)}
+
+
+def test_attribute_descriptors(module):
+    name = module.IfcRoot.__dict__["Name"]
+    assert isinstance(name, Attribute)
+    assert name.index == module.ATTRIBUTE_INDEX["IfcRoot"]["Name"]
+    assert not name.derived
+    # Inherited attributes are only declared on the class that introduces them.
+    assert "Name" not in module.IfcWall.__dict__
+    # An attribute redeclared as derived by a subtype is declared again on the subtype.
+    assert not module.IfcNamedUnit.__dict__["Dimensions"].derived
+    assert module.IfcSIUnit.__dict__["Dimensions"].derived
+
+
+def test_attribute_reads_match_ifcopenshell(module, model):
+    for raw in [model.file._file.by_type("IfcWallStandardCase")[0], model.file._file.by_type("IfcWindow")[0]]:
+        wrapper = object.__new__(getattr(module, raw.is_a()))
+        wrapper.__init__(raw, file=model.file)
+
+        for name, index in module.ATTRIBUTE_INDEX[raw.is_a()].items():
+            assert unwrap(getattr(wrapper, name)) == getattr(raw, name) == raw[index]
+
+
+def test_attribute_writes(module, model):
+    raw = model.file._file.by_type("IfcWindow")[0]
+    wrapper = object.__new__(module.IfcWindow)
+    wrapper.__init__(raw, file=model.file)
+
+    wrapper.Name = "Renamed"
+    wrapper.OverallHeight = 2.5
+
+    assert raw.Name == "Renamed"
+    assert raw.OverallHeight == 2.5
+    assert model.get_entities_by_name("Renamed")[0].entity == raw
@@ -0,0 +1,57 @@
+import numpy as np
+
+from compas_ifc.brep import GeometryBuffer
+from compas_ifc.brep import TessellatedBrep
+
+
+def breps():
+    triangle = TessellatedBrep(
+        vertices=np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=np.float64),
+        edges=np.array([[0, 1], [1, 2], [2, 0]]),
+        faces=np.array([[0, 1, 2]]),
+    )
+    square = TessellatedBrep(
+        vertices=np.array([[0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]], dtype=np.float64),
+        edges=np.array([[0, 1], [1, 2], [2, 3], [3, 0]]),
+        faces=np.array([[0, 1, 2], [0, 2, 3]]),
+    )
+    return {10: triangle, 20: square}
+
+
+def test_pack():
+    placement = np.eye(4)
+    placement[0, 3] = 5.0
+    buffer = GeometryBuffer.from_breps(breps(), facecolors={20: np.ones((2, 4))}, placements={20: placement})
+
+    assert len(buffer) == 2
+    assert list(buffer) == [10, 20]
+    assert 20 in buffer and 30 not in buffer
+    assert buffer.vertices.dtype == np.float32
+    assert np.allclose(buffer.get_vertices(20), breps()[20].vertices)
+    assert np.array_equal(buffer.get_faces(20), [[0, 1, 2], [0, 2, 3]])
+    assert np.array_equal(buffer.get_edges(10), [[0, 1], [1, 2], [2, 0]])
+    # Breps without facecolors or placement get the defaults.
+    assert np.allclose(buffer.get_facecolors(10), [[0.5, 0.5, 0.5, 1.0]])
+    assert np.allclose(buffer.get_facecolors(20), np.ones((2, 4)))
+    assert np.allclose(buffer.get_placement(10), np.eye(4))
+    assert np.allclose(buffer.get_placement(20), placement)
+
+
+def test_brep_views():
+    buffer = GeometryBuffer.from_breps(breps(), dtype=np.float64)
+    brep = buffer.get_brep(20)
+
+    assert np.shares_memory(brep.vertices, buffer.vertices)
+    assert np.allclose(brep.vertices, breps()[20].vertices)
+
+
+def test_save_load(tmp_path):
+    buffer = GeometryBuffer.from_breps(breps())
+    buffer.save(str(tmp_path / "buffer"))
+
+    for mmap in (False, True):
+        loaded = GeometryBuffer.load(str(tmp_path / "buffer"), mmap=mmap)
+        assert list(loaded) == [10, 20]
+        for name in GeometryBuffer.ARRAYS:
+            assert np.array_equal(getattr(loaded, name), getattr(buffer, name))
+    assert isinstance(loaded.vertices, np.memmap)
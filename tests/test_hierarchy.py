@@ -0,0 +1,73 @@
+def test_parent_and_children(model):
+    project = model.project
+    site = model.sites[0]
+    building = model.buildings[0]
+    storey = model.building_storeys[0]
+    wall = model.get_entities_by_type("IfcWall")[0]
+    window = model.get_entities_by_type("IfcWindow")[0]
+
+    assert project.children == [site]
+    assert site.parent == project
+    assert building.children == [storey]
+    assert storey.children == [wall, window]
+    assert wall.parent == storey
+    assert project.parent is None
+
+
+def test_descendants(model):
+    project = model.project
+    storey = model.building_storeys[0]
+    wall = model.get_entities_by_type("IfcWall")[0]
+    window = model.get_entities_by_type("IfcWindow")[0]
+
+    assert project.descendants == [model.sites[0], model.buildings[0], storey, wall, window]
+    assert project.children_by_type("IfcWindow", recursive=True) == [window]
+    assert project.children_by_type("IfcWindow") == []
+
+
+def test_contained_elements_take_precedence(model):
+    storey = model.building_storeys[0]
+    wall = model.get_entities_by_type("IfcWall")[0]
+    part = model.create("IfcBuildingElementPart", parent=wall, name="part")
+    assert part.parent == wall
+
+    # An element contained in a spatial structure has that structure as parent, even if it decomposes another object.
+    model.file.create_relationship(storey, part)
+    assert part.parent == storey
+    assert wall.children == [part]
+
+
+def test_relationship_modified_through_wrapper(model):
+    storey = model.building_storeys[0]
+    wall = model.get_entities_by_type("IfcWall")[0]
+    window = model.get_entities_by_type("IfcWindow")[0]
+    assert storey.children == [wall, window]
+
+    relation = model.file.from_entity(wall.entity.ContainedInStructure[0])
+    relation.RelatedElements = [wall]
+
+    assert storey.children == [wall]
+    assert window.parent is None
+
+
+def test_relationship_modified_on_raw_file(model):
+    storey = model.building_storeys[0]
+    wall = model.get_entities_by_type("IfcWall")[0]
+    window = model.get_entities_by_type("IfcWindow")[0]
+    assert storey.children == [wall, window]
+
+    wall.entity.ContainedInStructure[0].RelatedElements = [window.entity]
+    # Raw modifications are not detected until the index is built again.
+    assert storey.children == [wall, window]
+    model.file.spatial_hierarchy.build()
+    assert storey.children == [window]
+    assert wall.parent is None
+
+
+def test_descendant_ids(model):
+    project = model.project
+    hierarchy = model.file.spatial_hierarchy
+
+    assert hierarchy.descendant_ids(project.id()) == [entity.id() for entity in project.descendants]
+    assert hierarchy.descendant_ids(project.id(), "IfcWindow") == [model.get_entities_by_type("IfcWindow")[0].id()]
+    assert hierarchy.descendant_ids(model.get_entities_by_type("IfcWindow")[0].id()) == []
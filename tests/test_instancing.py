@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+import numpy as np
+from compas.geometry import Translation
+
+from compas_ifc.brep import TessellatedBrep
+from compas_ifc.brep import TessellatedBrepInstance
+
+
+def brep():
+    return TessellatedBrep(vertices=[[0, 0, 0], [1, 0, 0], [0, 1, 0]], edges=[[0, 1], [1, 2], [2, 0]], faces=[[0, 1, 2]])
+
+
+def shape(id, geometry, x):
+    # The rows of the 4x3 matrix are the axes and the translation.
+    matrix = SimpleNamespace(data=(1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, x, 0.0, 0.0))
+    return SimpleNamespace(id=id, geometry=geometry, transformation=SimpleNamespace(matrix=matrix))
+
+
+def test_instance_shares_arrays():
+    base = brep()
+    instance = TessellatedBrepInstance(base, Translation.from_vector([1, 0, 0]))
+
+    assert instance.faces is base.faces
+    assert instance.edges is base.edges
+
+
+def test_instance_transforms_lazily():
+    base = brep()
+    instance = TessellatedBrepInstance(base, Translation.from_vector([1, 0, 0]))
+
+    assert instance._vertices is None
+    assert np.allclose(instance.vertices, base.vertices + [1, 0, 0])
+    assert instance.vertices is instance.vertices
+
+    # Transforming an instance only updates its transformation.
+    instance.transform(Translation.from_vector([0, 0, 2]))
+    assert instance._vertices is None
+    assert np.allclose(instance.vertices, base.vertices + [1, 0, 2])
+    assert np.allclose(base.vertices, brep().vertices)
+
+
+def test_shared_representations(model):
+    model.file.instancing = True
+    geometry = SimpleNamespace(
+        id="shared",
+        verts=(0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0),
+        edges=(0, 1, 1, 2, 2, 0),
+        faces=(0, 1, 2),
+        materials=[],
+        material_ids=[-1],
+    )
+
+    _, a, _ = model.file._shape_to_brep(shape(1, geometry, 0.0))
+    _, b, _ = model.file._shape_to_brep(shape(2, geometry, 5.0))
+
+    # One tessellation, placed twice.
+    assert a.brep is b.brep
+    assert np.allclose(b.vertices, a.vertices + [5, 0, 0])
@@ -0,0 +1,70 @@
+import pytest
+
+from compas_ifc.brep import TessellatedBrep
+from compas_ifc.file import DEFAULT_EXCLUDE
+from compas_ifc.file import tessellation_profile
+
+pytestmark = pytest.mark.usefixtures("geometry_iterator")
+
+
+def test_iter_geometries(model):
+    shapes = list(model.iter_geometries())
+
+    assert sorted(entity.is_a() for entity, _, _ in shapes) == ["IfcWallStandardCase", "IfcWindow"]
+    for entity, brep, style in shapes:
+        assert isinstance(brep, TessellatedBrep)
+        assert len(style["facecolors"]) == len(brep.faces)
+    assert not model.file._geometrymap
+
+
+def test_iter_geometries_matches_loaded_products(model):
+    ids = sorted(entity.id() for entity, _, _ in model.iter_geometries())
+    assert ids == sorted(model.file._product_ids())
+
+
+def test_iter_geometries_retain(model):
+    for entity, brep, _ in model.iter_geometries(include=["IfcWindow"], retain=True):
+        assert model.file.get_preloaded_geometry(entity) is brep
+    assert len(model.file._geometrymap) == 1
+
+
+def test_iter_geometries_include_exclude(model, geometry_iterator):
+    assert [entity.is_a() for entity, _, _ in model.iter_geometries(include=["IfcWindow"])] == ["IfcWindow"]
+    assert geometry_iterator.instances[-1].exclude is None
+
+    # An explicit exclude replaces the default one.
+    types = sorted(entity.is_a() for entity, _, _ in model.iter_geometries(exclude=["IfcWindow"]))
+    assert types == ["IfcOpeningElement", "IfcWallStandardCase"]
+
+    list(model.iter_geometries())
+    assert geometry_iterator.instances[-1].exclude == DEFAULT_EXCLUDE
+
+
+def test_iter_geometries_lod(model, geometry_iterator):
+    list(model.iter_geometries(lod="preview"))
+
+    assert len(geometry_iterator.instances) == 1
+    settings = geometry_iterator.instances[0].settings.values
+    assert settings["deflection"] == tessellation_profile("preview")["deflection"]
+    assert settings["DISABLE_OPENING_SUBTRACTIONS"] is True
+
+
+def test_iter_geometries_profiles(model, geometry_iterator):
+    shapes = list(model.iter_geometries(lod="coarse", profiles={"IfcWindow": "fine"}))
+
+    assert sorted(entity.is_a() for entity, _, _ in shapes) == ["IfcWallStandardCase", "IfcWindow"]
+    # One pass per profile, over the products of that profile.
+    deflections = {}
+    for iterator in geometry_iterator.instances:
+        for product in iterator.include:
+            deflections[product.is_a()] = iterator.settings.values["deflection"]
+    assert deflections == {"IfcWallStandardCase": tessellation_profile("coarse")["deflection"], "IfcWindow": tessellation_profile("fine")["deflection"]}
+
+
+def test_iter_geometries_stops_early(model, geometry_iterator):
+    entity, _, _ = next(model.iter_geometries(profiles={"IfcWindow": "fine"}))
+
+    # Only the first shape of the first pass is tessellated.
+    assert len(geometry_iterator.instances) == 1
+    assert geometry_iterator.instances[0].gets == 1
+    assert geometry_iterator.instances[0].index == 0
@@ -0,0 +1,51 @@
+import pytest
+
+from compas_ifc.model import Model
+
+
+@pytest.fixture
+def lazy_model(filepath, geometry_iterator):
+    return Model(filepath, load_geometries="lazy")
+
+
+def test_lazy_geometries(lazy_model, geometry_iterator):
+    wall = lazy_model.get_entities_by_type("IfcWall")[0]
+
+    # Nothing is tessellated when the file is opened.
+    assert not geometry_iterator.instances
+    assert not lazy_model.file._geometrymap
+
+    assert wall.geometry is not None
+    assert geometry_iterator.created == [wall.id()]
+    assert list(lazy_model.file._geometrymap) == [wall.id()]
+
+    # The geometry is tessellated once.
+    assert lazy_model.file.get_preloaded_geometry(wall) is lazy_model.file.get_preloaded_geometry(wall)
+    assert geometry_iterator.created == [wall.id()]
+
+
+def test_lazy_geometries_without_representation(lazy_model, geometry_iterator):
+    storey = lazy_model.building_storeys[0]
+
+    assert lazy_model.file.get_preloaded_geometry(storey) is None
+    assert storey.id() in lazy_model.file._nogeometry
+    assert not geometry_iterator.created
+
+
+def test_prefetch_geometries(lazy_model, geometry_iterator):
+    wall = lazy_model.get_entities_by_type("IfcWall")[0]
+    window = lazy_model.get_entities_by_type("IfcWindow")[0]
+    storey = lazy_model.building_storeys[0]
+
+    lazy_model.file.prefetch_geometries([wall, window, storey])
+
+    assert len(geometry_iterator.instances) == 1
+    assert geometry_iterator.instances[0].include == [wall.entity, window.entity]
+    assert sorted(lazy_model.file._geometrymap) == sorted([wall.id(), window.id()])
+    assert storey.id() in lazy_model.file._nogeometry
+
+    # Prefetched geometries are not tessellated again.
+    assert wall.geometry is not None
+    lazy_model.file.prefetch_geometries([wall, window])
+    assert not geometry_iterator.created
+    assert len(geometry_iterator.instances) == 1
@@ -0,0 +1,46 @@
+import numpy as np
+from compas.datastructures import Mesh
+
+from compas_ifc.conversions.mesh import mesh_to_IfcTriangulatedFaceSet
+from compas_ifc.conversions.mesh import triangulate_faces
+
+VERTICES = np.array([[0, 0, 0], [2, 0, 0], [2, 2, 0], [0, 2, 0], [0.5, 0.5, 0], [3, 0, 0], [3, 2, 0]], dtype=np.float64)
+
+
+def areas(triangles):
+    a, b, c = (VERTICES[triangles[:, i]] for i in range(3))
+    # Signed areas, positive for triangles oriented like the faces.
+    return np.cross(b - a, c - a)[:, 2] / 2
+
+
+def test_triangulate_faces_keeps_face_order():
+    faces = [[0, 1, 2, 3], [1, 5, 6], [0, 1], [0, 1, 5, 6, 2, 3], [2, 3, 4]]
+    triangles = triangulate_faces(VERTICES, faces)
+
+    assert len(triangles) == 2 + 1 + 4 + 1
+    assert triangles[:2].tolist() == [[0, 1, 2], [0, 2, 3]]
+    assert triangles[2].tolist() == [1, 5, 6]
+    assert set(triangles[3:7].ravel()) == {0, 1, 5, 6, 2, 3}
+    assert triangles[7].tolist() == [2, 3, 4]
+
+
+def test_triangulate_concave_quad():
+    # Whichever corner is reflex, the quad is split along the diagonal from it.
+    face = [4, 3, 0, 1]
+    for i in range(4):
+        triangles = triangulate_faces(VERTICES, [face[i:] + face[:i]])
+
+        assert len(triangles) == 2
+        assert np.all(areas(triangles) > 0)
+        assert np.isclose(areas(triangles).sum(), 1.0)
+        edges = [sorted(triangle[[j, (j + 1) % 3]].tolist()) for triangle in triangles for j in range(3)]
+        assert [0, 4] in edges
+        assert [1, 3] not in edges
+
+
+def test_mesh_to_IfcTriangulatedFaceSet(model):
+    mesh = Mesh.from_vertices_and_faces(VERTICES.tolist(), [[0, 1, 2, 3], [1, 5, 6, 2]])
+    face_set = mesh_to_IfcTriangulatedFaceSet(model, mesh)
+
+    assert len(face_set.Coordinates.CoordList) == len(VERTICES)
+    assert [list(triangle) for triangle in face_set.CoordIndex] == [[1, 2, 3], [1, 3, 4], [2, 6, 7], [2, 7, 3]]
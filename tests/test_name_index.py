@@ -0,0 +1,38 @@
+import pytest
+
+
+def names(entities):
+    return sorted({entity.Name for entity in entities})
+
+
+def test_regex_matches_whole_names(model):
+    assert names(model.get_entities_by_name(r"Default \w+", match="regex")) == ["Default Building", "Default Project", "Default Site"]
+    assert names(model.get_entities_by_name("Default", match="regex")) == []
+    assert names(model.get_entities_by_name(r".*Example", match="regex")) == ["Opening Element for Test Example", "Wall for Test Example", "Window for Test Example"]
+
+
+def test_exact(model):
+    assert [entity.is_a() for entity in model.get_entities_by_name("Default Site")] == ["IfcSite"]
+    assert model.get_entities_by_name("Default") == []
+
+
+def test_prefix(model):
+    assert names(model.get_entities_by_name("Default B", match="prefix")) == ["Default Building", "Default Building Storey"]
+    assert names(model.get_entities_by_name("Zzz", match="prefix")) == []
+
+
+def test_invalid_match(model):
+    with pytest.raises(ValueError):
+        model.get_entities_by_name("Default Site", match="fuzzy")
+
+
+def test_index_follows_changes(model):
+    site = model.get_entities_by_name("Default Site")[0]
+
+    site.Name = "Renamed Site"
+    assert model.get_entities_by_name("Default Site") == []
+    assert model.get_entities_by_name("Renamed Site") == [site]
+    assert names(model.get_entities_by_name("Renamed", match="prefix")) == ["Renamed Site"]
+
+    wall = model.create("IfcWall", parent=model.building_storeys[0], name="New Wall")
+    assert model.get_entities_by_name("New Wall") == [wall]
@@ -0,0 +1,96 @@
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from compas_ifc import parallel
+from compas_ifc.brep import GeometryBuffer
+from compas_ifc.brep import TessellatedBrep
+
+# The file in which the forked workers log the names of the blocks they write.
+LOG = None
+
+forked = pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="The patched tessellation is only inherited by forked workers.")
+
+
+def exists(name):
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return False
+    shm.close()
+    return True
+
+
+def fake_tessellate_chunk(ids, settings):
+    if ids == [0]:
+        time.sleep(0.5)
+        raise RuntimeError("Tessellation failed.")
+    breps = {_id: TessellatedBrep(vertices=np.full((3, 3), _id, dtype=np.float64), faces=[[0, 1, 2]]) for _id in ids}
+    buffer = GeometryBuffer.from_breps(breps, dtype=np.dtype(settings["dtype"]))
+    result = [parallel._to_shared_memory(getattr(buffer, name)) for name in GeometryBuffer.ARRAYS]
+    with open(LOG, "a") as f:
+        f.writelines(name + "\n" for name, _, _ in result)
+    return result
+
+
+@pytest.fixture
+def log(tmp_path, monkeypatch):
+    global LOG
+    LOG = str(tmp_path / "blocks.txt")
+    open(LOG, "w").close()
+    monkeypatch.setattr(parallel, "_tessellate_chunk", fake_tessellate_chunk)
+    yield LOG
+    LOG = None
+
+
+def test_shared_memory_round_trip():
+    array = np.arange(12, dtype=np.float32).reshape(4, 3)
+    name, shape, dtype = parallel._to_shared_memory(array)
+
+    shm, mapped = parallel._from_shared_memory(name, shape, dtype)
+    assert mapped.dtype == np.float32
+    assert np.array_equal(mapped, array)
+
+    # Unlinked blocks stay readable while they are mapped.
+    shm.unlink()
+    assert not exists(name)
+    assert np.array_equal(mapped, array)
+    del mapped
+    shm.close()
+
+
+def test_unlink_shared_memory():
+    name, _, _ = parallel._to_shared_memory(np.zeros(3))
+
+    parallel._unlink_shared_memory(name)
+    assert not exists(name)
+    # Unlinking a missing block does nothing.
+    parallel._unlink_shared_memory(name)
+
+
+@forked
+def test_tessellate_in_processes(filepath, log):
+    buffers, blocks = parallel.tessellate_in_processes(filepath, [1, 2, 3], processes=2, chunk_size=2)
+
+    assert [list(buffer) for buffer in buffers] == [[1, 2], [3]]
+    assert np.allclose(buffers[1].get_vertices(3), 3)
+    # The blocks are unlinked as soon as they are mapped.
+    with open(log) as f:
+        names = f.read().split()
+    assert len(names) == len(blocks) == 2 * len(GeometryBuffer.ARRAYS)
+    assert not any(exists(name) for name in names)
+
+
+@forked
+def test_tessellate_in_processes_failure(filepath, log):
+    with pytest.raises(RuntimeError):
+        parallel.tessellate_in_processes(filepath, [0, 1, 2, 3], processes=2, chunk_size=1)
+
+    # The blocks written by the chunks that succeeded are unlinked as well.
+    with open(log) as f:
+        names = f.read().split()
+    assert names
+    assert not any(exists(name) for name in names)
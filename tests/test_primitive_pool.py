@@ -0,0 +1,44 @@
+from compas.datastructures import Mesh
+
+from compas_ifc.cache import PrimitivePool
+from compas_ifc.conversions.mesh import mesh_to_IfcFaceBasedSurfaceModel
+
+
+def test_points_are_keyed_on_quantized_coordinates(model):
+    pool = PrimitivePool(model.file, precision=1e-6)
+    point = pool.point([1.0, 2.0, 3.0])
+
+    assert pool.point([1.0, 2.0, 3.0 + 1e-9]) == point
+    assert pool.point([1.0, 2.0, 3.001]) != point
+    assert pool.point([1.0, 2.0]) != point
+    assert pool.direction([1.0, 2.0, 3.0]) != point
+
+
+def test_placements_share_points_and_directions(model):
+    pool = PrimitivePool(model.file)
+    placement = pool.axis2placement3d([0, 0, 0], [0, 0, 1], [1, 0, 0])
+
+    assert pool.axis2placement3d([0, 0, 0], [0, 0, 1], [1, 0, 0]) == placement
+    assert pool.axis2placement3d([0, 0, 0], [0, 0, 1]) != placement
+    assert placement.Location == pool.point([0, 0, 0])
+    assert placement.Axis == pool.direction([0, 0, 1])
+
+
+def test_pool_is_bounded(model):
+    pool = PrimitivePool(model.file, max_size=2)
+    first = pool.point([0, 0, 0])
+    pool.point([1, 0, 0])
+    pool.point([2, 0, 0])
+
+    assert len(pool._points) == 2
+    assert pool.point([0, 0, 0]) != first
+
+
+def test_mesh_vertices_are_not_pooled(model):
+    mesh = Mesh.from_vertices_and_faces([[0, 0, 0], [1, 0, 0], [1, 1, 0]], [[0, 1, 2]])
+    points = len(model.file._file.by_type("IfcCartesianPoint"))
+    mesh_to_IfcFaceBasedSurfaceModel(model, mesh)
+    mesh_to_IfcFaceBasedSurfaceModel(model, mesh)
+
+    assert len(model.file._file.by_type("IfcCartesianPoint")) == points + 6
+    assert len(model.file.primitive_pool._points) == 0
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Translation
+from compas.geometry import transform_points_numpy
+
+from compas_ifc.brep import TessellatedBrep
+from compas_ifc.brep import TessellatedBrepInstance
+from compas_ifc.entities.extensions.IfcProduct import placed
+from compas_ifc.model import Model
+
+
+@pytest.fixture
+def loaded_model(filepath, geometry_iterator):
+    return Model(filepath)
+
+
+def brep():
+    return TessellatedBrep(vertices=[[0, 0, 0], [1, 0, 0], [0, 1, 0]], faces=[[0, 1, 2]])
+
+
+def test_placed():
+    base = brep()
+    translation = Translation.from_vector([1, 0, 0])
+
+    instance = placed(base, translation)
+    assert isinstance(instance, TessellatedBrepInstance)
+    assert instance.brep is base
+
+    # Placing an instance composes the transformations, on the same shared brep.
+    moved = placed(instance, Translation.from_vector([0, 2, 0]))
+    assert moved.brep is base
+    assert np.allclose(moved.vertices, base.vertices + [1, 2, 0])
+
+    box = Box(1)
+    assert placed(box, translation).frame.point == [1, 0, 0]
+    assert box.frame.point == [0, 0, 0]
+
+
+def test_placed_never_aliases_the_shared_brep():
+    base = brep()
+    instance = TessellatedBrepInstance(base, Translation.from_vector([1, 0, 0]))
+
+    back = placed(instance, Translation.from_vector([-1, 0, 0]))
+    assert back is not base
+    assert np.allclose(back.transformation.matrix, np.eye(4))
+
+    back.name = "back"
+    back.transform(Translation.from_vector([0, 0, 1]))
+    assert base.name != "back"
+    assert np.allclose(base.vertices, brep().vertices)
+
+
+def test_geometry_world_and_local(loaded_model):
+    wall = loaded_model.get_entities_by_type("IfcWall")[0]
+    world = wall.geometry_world
+    local = wall.geometry_local
+
+    assert world is loaded_model.file.get_preloaded_geometry(wall)
+    assert wall.geometry is local
+    assert local.brep is world.brep
+    assert np.allclose(local.vertices, transform_points_numpy(world.vertices, wall.frame.to_transformation().inverse()))
+    assert local.name == world.name == wall.Name
+
+
+def test_frame_resets_derived_geometries(loaded_model):
+    wall = loaded_model.get_entities_by_type("IfcWall")[0]
+    world = wall.geometry_world
+    local = wall.geometry_local
+
+    wall.frame = Frame([1, 2, 3])
+
+    # The preloaded geometry stays in world coordinates, the local geometry is derived from the new frame.
+    assert wall.geometry_world is world
+    assert wall.geometry_local is not local
+    assert np.allclose(wall.geometry_local.vertices, world.vertices - [1, 2, 3])
+
+
+def test_frame_keeps_assigned_geometry(model):
+    storey = model.building_storeys[0]
+    box = Box(1)
+    wall = model.create("IfcWall", parent=storey, geometry=box, frame=Frame([1, 0, 0]), name="wall")
+
+    assert wall.geometry is box
+    assert wall.geometry_world.frame.point == [1, 0, 0]
+
+    # An assigned geometry stays in the coordinates of the product, its world geometry follows the frame.
+    wall.frame = Frame([0, 5, 0])
+    assert wall.geometry is box
+    assert wall.geometry_world.frame.point == [0, 5, 0]
@@ -0,0 +1,72 @@
+import json
+import time
+
+from compas_ifc.model import Model
+from compas_ifc.profiler import LoadProfiler
+
+
+def test_stage_timings():
+    profiler = LoadProfiler()
+    with profiler.stage("parse"):
+        time.sleep(0.01)
+    for _ in range(3):
+        with profiler.stage("wrap", trace=False):
+            pass
+
+    assert profiler.stages["parse"]["calls"] == 1
+    assert profiler.stages["parse"]["time"] >= 0.01
+    assert profiler.stages["wrap"]["calls"] == 3
+    # Only traced stages are events.
+    assert [event["name"] for event in profiler.events] == ["parse"]
+    assert profiler.events[0]["duration"] == profiler.stages["parse"]["time"]
+
+
+def test_shape_statistics():
+    profiler = LoadProfiler()
+    profiler.count_shape("IfcWall", 12)
+    profiler.count_shape("IfcWall", 8)
+    profiler.count_shape("IfcWindow", 4)
+
+    data = profiler.to_dict()
+    assert data["shapes"]["IfcWall"] == {"count": 2, "triangles": 20}
+    assert data["totals"] == {"shapes": 3, "triangles": 24}
+
+
+def test_disabled():
+    profiler = LoadProfiler(enabled=False)
+    with profiler.stage("parse"):
+        pass
+    profiler.count_shape("IfcWall", 12)
+
+    assert profiler.stage("a") is profiler.stage("b")
+    assert profiler.to_dict() == {"stages": {}, "shapes": {}, "totals": {"shapes": 0, "triangles": 0}}
+
+
+def test_chrome_trace(tmp_path):
+    profiler = LoadProfiler()
+    with profiler.stage("parse"):
+        pass
+    with profiler.stage("wrap", trace=False):
+        pass
+    profiler.count_shape("IfcWall", 12)
+
+    path = str(tmp_path / "trace.json")
+    trace = profiler.to_chrome_trace(path)
+    with open(path) as f:
+        assert json.load(f) == trace
+
+    assert trace["displayTimeUnit"] == "ms"
+    assert trace["metadata"] == profiler.to_dict()
+    (event,) = trace["traceEvents"]
+    assert set(event) == {"name", "ph", "ts", "dur", "pid", "tid"}
+    assert event["name"] == "parse"
+    assert event["ph"] == "X"
+    assert event["dur"] == profiler.stages["parse"]["time"] * 1e6
+
+
+def test_instrumented_load(filepath, geometry_iterator):
+    model = Model(filepath, instrument=True)
+    profiler = model.file.profiler
+
+    assert {"parse", "iterator_initialize", "tessellation", "postprocess"} <= set(profiler.stages)
+    assert profiler.to_dict()["totals"] == {"shapes": 2, "triangles": 2}
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from compas_ifc.properties import _column
+
+
+def test_property_table_rows(model):
+    table = model.property_table(types=["IfcWall", "IfcWindow"])
+    wall = model.query("IfcWall").first()
+    window = model.query("IfcWindow").first()
+
+    assert list(table["GlobalId"]) == [wall.GlobalId, window.GlobalId]
+    assert all(len(column) == 2 for column in table.values())
+
+
+def test_property_table_column_types(model):
+    table = model.property_table(types=["IfcWall", "IfcWindow"])
+
+    # Numbers are float64, with NaN for the entities without the property.
+    column = table["Pset_WallCommon.ThermalTransmittance"]
+    assert column.dtype == np.float64
+    assert column[0] == pytest.approx(0.24)
+    assert np.isnan(column[1])
+
+    # Booleans and strings are objects, with None for the entities without the property.
+    column = table["Pset_WallCommon.IsExternal"]
+    assert column.dtype == object
+    assert list(column) == [True, None]
+    assert table["Pset_WindowCommon.Reference"].dtype == object
+
+
+def test_property_table_filters(model):
+    table = model.property_table(types=["IfcWindow"], psets=["Pset_WindowCommon"], properties=["Infiltration", "SmokeStop"])
+
+    assert sorted(table) == ["GlobalId", "Pset_WindowCommon.Infiltration", "Pset_WindowCommon.SmokeStop"]
+
+
+def test_column():
+    assert _column([1, 2.5, None]).dtype == np.float64
+    assert _column([True, None]).dtype == object
+    assert _column([1, "a"]).dtype == object
+    assert _column([None, None]).dtype == object
+
+
+def test_property_index(model):
+    index = model.file.property_index
+    wall = model.query("IfcWall").first()
+    window = model.query("IfcWindow").first()
+
+    assert index.get_ids("Pset_WallCommon", "IsExternal", True) == {wall.id()}
+    assert index.get_ids("Pset_WindowCommon", "IsExternal", True) == {window.id()}
+    assert index.get_ids("Pset_WallCommon", "IsExternal", False) == set()
+    assert index.get_ids("Pset_Missing", "IsExternal", True) == set()
+    assert sorted(index.get_values("Pset_WindowCommon", "Infiltration")) == [0.3]
+
+
+def test_property_index_ranges(model):
+    index = model.file.property_index
+    window = model.query("IfcWindow").first()
+
+    assert index.get_ids_between("Pset_WindowCommon", "GlazingAreaFraction", 0.5, 0.8) == {window.id()}
+    assert index.get_ids_between("Pset_WindowCommon", "GlazingAreaFraction", minimum=0.7) == {window.id()}
+    assert index.get_ids_between("Pset_WindowCommon", "GlazingAreaFraction", maximum=0.69) == set()
+    # Non-numeric values are not in ranges.
+    assert index.get_ids_between("Pset_WindowCommon", "Reference") == set()
+
+
+def test_property_index_follows_created_properties(model):
+    index = model.file.property_index
+    storey = model.building_storeys[0]
+    wall = model.create("IfcWall", parent=storey, name="a", properties={"Pset_Custom": {"Height": 3.0}})
+
+    assert index.get_ids("Pset_Custom", "Height", 3.0) == {wall.id()}
+    assert model.get_entities_by_property("Pset_Custom", "Height", minimum=2.0, maximum=4.0) == [wall]
+
+
+def test_property_index_keeps_booleans_apart(model):
+    index = model.file.property_index
+    storey = model.building_storeys[0]
+    flag = model.create("IfcWall", parent=storey, name="flag", properties={"Pset_Custom": {"Value": True}})
+    count = model.create("IfcWall", parent=storey, name="count", properties={"Pset_Custom": {"Value": 1}})
+
+    assert index.get_ids("Pset_Custom", "Value", True) == {flag.id()}
+    assert index.get_ids("Pset_Custom", "Value", 1) == {count.id()}
+    assert index.get_ids("Pset_Custom", "Value", 1.0) == {count.id()}
+    assert sorted((type(value).__name__, value) for value in index.get_values("Pset_Custom", "Value")) == [("bool", True), ("int", 1)]
+    assert index.get_ids_between("Pset_Custom", "Value", 0, 2) == {count.id()}
@@ -0,0 +1,41 @@
+def test_query_types(model):
+    assert model.query("IfcWall").count() == 1
+    assert model.query("IfcProduct").of_type("IfcElement").count() == 3
+    assert [wall.Name for wall in model.query("IfcWall")] == ["Wall for Test Example"]
+
+
+def test_query_overlapping_types(model):
+    # IfcWallStandardCase is a subclass of IfcWall, its entities must not be counted twice.
+    assert model.query("IfcWall", "IfcWallStandardCase").count() == 1
+    assert len(set(model.query("IfcWall", "IfcWallStandardCase").ids())) == 1
+
+
+def test_query_name_index_source(model):
+    query = model.query("IfcProduct").where("Name", "Default Site")
+    source, filters = query._plan()
+    assert not isinstance(source, list)
+    assert len(filters) == 1
+    assert [entity.is_a() for entity in query] == ["IfcSite"]
+
+
+def test_query_name_none(model):
+    unnamed = [entity for entity in model.file._file.by_type("IfcRoot") if entity.Name is None]
+    assert unnamed
+
+    query = model.query("IfcRoot").where("Name", None)
+    source, _ = query._plan()
+    assert isinstance(source, list)
+    assert sorted(query.ids()) == sorted(entity.id() for entity in unnamed)
+    assert model.query("IfcRoot").where_in("Name", [None, "Default Site"]).count() == len(unnamed) + 1
+
+
+def test_query_global_id(model):
+    wall = model.query("IfcWall").first()
+    assert model.query("IfcProduct").where("GlobalId", wall.GlobalId).first() == wall
+    assert not model.query("IfcProduct").where("GlobalId", "0000000000000000000000").exists()
+
+
+def test_query_within(model):
+    storey = model.query("IfcBuildingStorey").first()
+    names = {entity.Name for entity in model.query("IfcElement").within(storey)}
+    assert "Wall for Test Example" in names
@@ -0,0 +1,78 @@
+from compas_ifc.hierarchy import SpatialHierarchy
+
+
+def test_children_are_added_to_the_existing_relationship(model):
+    storey = model.building_storeys[0]
+    building = model.buildings[0]
+    contained = len(model.file._file.by_type("IfcRelContainedInSpatialStructure"))
+    aggregates = len(model.file._file.by_type("IfcRelAggregates"))
+
+    a = model.create("IfcWall", parent=storey, name="a")
+    b = model.create("IfcWall", parent=storey, name="b")
+    c = model.create("IfcBuildingStorey", parent=building, name="c")
+
+    assert len(model.file._file.by_type("IfcRelContainedInSpatialStructure")) == contained
+    assert len(model.file._file.by_type("IfcRelAggregates")) == aggregates
+    relation = a.entity.ContainedInStructure[0]
+    assert relation == b.entity.ContainedInStructure[0]
+    assert list(relation.RelatedElements)[-2:] == [a.entity, b.entity]
+    assert c.entity.Decomposes[0].RelatingObject == building.entity
+
+
+def test_children_of_a_new_relationship(model):
+    storey = model.building_storeys[0]
+    assembly = model.create("IfcElementAssembly", parent=storey, name="assembly")
+    a = model.create("IfcBeam", parent=assembly, name="a")
+    b = model.create("IfcBeam", parent=assembly, name="b")
+
+    relation = a.entity.Decomposes[0]
+    assert relation.is_a("IfcRelAggregates")
+    assert list(relation.RelatedObjects) == [a.entity, b.entity]
+
+
+def test_deferred_relationships(model):
+    storey = model.building_storeys[0]
+    relation = model.file._file.by_type("IfcRelContainedInSpatialStructure")[0]
+    count = len(relation.RelatedElements)
+
+    with model.deferred_relationships():
+        walls = [model.create("IfcWall", parent=storey, name=str(i)) for i in range(3)]
+        # Nothing is written until the context exits.
+        assert len(relation.RelatedElements) == count
+        assert not walls[0].entity.ContainedInStructure
+
+    assert list(relation.RelatedElements)[count:] == [wall.entity for wall in walls]
+
+
+def test_flush_relationships(model):
+    storey = model.building_storeys[0]
+    relation = model.file._file.by_type("IfcRelContainedInSpatialStructure")[0]
+    count = len(relation.RelatedElements)
+
+    with model.deferred_relationships():
+        a = model.create("IfcWall", parent=storey, name="a")
+        model.file.flush_relationships()
+        assert list(relation.RelatedElements)[count:] == [a.entity]
+        b = model.create("IfcWall", parent=storey, name="b")
+        assert list(relation.RelatedElements)[count:] == [a.entity]
+
+    assert list(relation.RelatedElements)[count:] == [a.entity, b.entity]
+
+
+def test_spatial_hierarchy_follows_flushed_relationships(model):
+    storey = model.building_storeys[0]
+    children = storey.children
+
+    with model.deferred_relationships():
+        assembly = model.create("IfcElementAssembly", parent=storey, name="assembly")
+        beams = [model.create("IfcBeam", parent=assembly, name=str(i)) for i in range(2)]
+
+    assert storey.children == children + [assembly]
+    assert assembly.children == beams
+    assert beams[0].parent == assembly
+    assert storey.descendants == children + [assembly] + beams
+
+    # The index matches one built from the written relationships.
+    hierarchy = SpatialHierarchy(model.file)
+    assert hierarchy.get_children(storey) == storey.children
+    assert hierarchy.get_children(assembly) == beams
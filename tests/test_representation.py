@@ -0,0 +1,38 @@
+from compas.geometry import Box
+
+
+def body(product):
+    return product.Representation.Representations[0]
+
+
+def test_single_use_geometry_is_not_mapped(model):
+    storey = model.building_storeys[0]
+    wall = model.create("IfcWall", geometry=Box(1), parent=storey, name="a")
+
+    assert body(wall).RepresentationType == "CSG"
+    assert not model.file._file.by_type("IfcRepresentationMap")
+
+
+def test_repeated_geometry_is_mapped(model):
+    storey = model.building_storeys[0]
+    first = model.create("IfcWall", geometry=Box(1), parent=storey, name="a")
+    second = model.create("IfcWall", geometry=Box(1), parent=storey, name="b")
+    third = model.create("IfcWall", geometry=Box(2), parent=storey, name="c")
+
+    maps = model.file._file.by_type("IfcRepresentationMap")
+    assert len(maps) == 1
+    assert len(model.file._file.by_type("IfcCsgSolid")) == 2
+    for wall in (first, second):
+        assert body(wall).RepresentationType == "MappedRepresentation"
+        assert body(wall).Items[0].MappingSource.id() == maps[0].id()
+    assert body(third).RepresentationType == "CSG"
+
+
+def test_create_representation_map_reuses_written_geometry(model):
+    storey = model.building_storeys[0]
+    wall = model.create("IfcWall", geometry=Box(1), parent=storey, name="a")
+    representation_map = model.create_representation_map(Box(1))
+
+    assert model.create_representation_map(Box(1)) == representation_map
+    assert body(wall).Items[0].MappingSource == representation_map
+    assert len(model.file._file.by_type("IfcCsgSolid")) == 1
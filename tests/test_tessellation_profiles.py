@@ -0,0 +1,15 @@
+from compas_ifc.file import tessellation_profile
+
+
+def test_single_pass_without_profiles(model):
+    assert model.file._tessellation_passes(lod="preview") == [(None, tessellation_profile("preview"))]
+
+
+def test_passes_by_profile(model):
+    passes = model.file._tessellation_passes(lod="preview", profiles={"IfcWindow": "fine"})
+
+    assert len(passes) == 2
+    by_class = {product.is_a(): profile for products, profile in passes for product in products}
+    assert set(by_class) == {"IfcWallStandardCase", "IfcWindow"}
+    assert by_class["IfcWindow"] == dict(tessellation_profile("preview"), **tessellation_profile("fine"))
+    assert by_class["IfcWallStandardCase"] == tessellation_profile("preview")
@@ -0,0 +1,41 @@
+from compas_ifc.entities.base import WRAPPER_CLASSES
+from compas_ifc.entities.base import Base
+from compas_ifc.model import Model
+
+
+class Tagged(object):
+    @property
+    def tag(self):
+        return "tagged"
+
+
+def test_same_class_for_same_schema_and_name(filepath):
+    a = Model(filepath, load_geometries=False).get_entities_by_type("IfcWall")[0]
+    b = Model(filepath, load_geometries=False).get_entities_by_type("IfcWall")[0]
+
+    assert type(a) is type(b)
+    assert WRAPPER_CLASSES[("IFC4", "IfcWallStandardCase", None)] is type(a)
+    assert type(Model(filepath, load_geometries=False).get_entities_by_type("IfcWindow")[0]) is not type(a)
+
+
+def test_same_class_for_same_extensions(filepath, monkeypatch):
+    resolved = []
+    resolve_class = Base.resolve_class
+
+    def counted(entity, schema="IFC4", extensions=None):
+        resolved.append((entity.is_a(), extensions))
+        return resolve_class(entity, schema, extensions)
+
+    monkeypatch.setattr(Base, "resolve_class", staticmethod(counted))
+
+    extensions = {"IfcWall": Tagged}
+    a = Model(filepath, load_geometries=False, extensions=extensions).get_entities_by_type("IfcWall")[0]
+    b = Model(filepath, load_geometries=False, extensions=dict(extensions)).get_entities_by_type("IfcWall")[0]
+    plain = Model(filepath, load_geometries=False).get_entities_by_type("IfcWall")[0]
+
+    assert type(a) is type(b)
+    assert isinstance(a, Tagged) and a.tag == "tagged"
+    assert type(plain) is not type(a)
+    assert not isinstance(plain, Tagged)
+    # The extended class is resolved once.
+    assert resolved.count(("IfcWallStandardCase", extensions)) == 1